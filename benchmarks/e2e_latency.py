@@ -0,0 +1,256 @@
+"""
+End-to-end keystroke-to-launch latency harness.
+
+Builds a real MainWindow offscreen, replaces its launcher with a recording
+stub and replays a synthetic stream of shows, keystrokes and Enter presses
+from inside the Qt event loop at the requested rates. Reports p50/p95/p99 for
+each stage (first_paint is the window's own show-to-first-paint record) plus
+event-loop stalls, and exits non-zero when a budget is blown.
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/e2e_latency.py \\
+        --queries 200 --key-rate 30 --budget first_paint=16 --budget launch=10
+
+The window runs with the default settings apart from browser scanning and
+history import. --idle-release SECONDS turns idle mode on, so every show
+after a long enough pause includes the rebuild of the released UI.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+STAGES = ("show", "first_paint", "type", "classify", "launch", "stall")
+
+WORDS = [
+    "python", "weather", "news", "recipe", "pasta", "qt", "layout", "tutorial",
+    "flights", "cheap", "to", "paris", "how", "install", "rust", "docs",
+]
+DOMAINS = ["example.com", "github.com", "python.org", "news.ycombinator.com", "wikipedia.org"]
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    k = (len(values) - 1) * pct / 100.0
+    lo = int(k)
+    hi = min(lo + 1, len(values) - 1)
+    return values[lo] + (values[hi] - values[lo]) * (k - lo)
+
+
+def make_queries(count, url_ratio, seed):
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(count):
+        if rng.random() < url_ratio:
+            prefix = rng.choice(["", "www.", "https://"])
+            queries.append(prefix + rng.choice(DOMAINS))
+        else:
+            queries.append(" ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 4))))
+    return queries
+
+
+def parse_budgets(items):
+    budgets = {}
+    for item in items:
+        stage, _, value = item.partition("=")
+        if stage not in STAGES or not value:
+            raise argparse.ArgumentTypeError(f"bad budget {item!r}; use STAGE=MS with STAGE in {STAGES}")
+        budgets[stage] = float(value)
+    return budgets
+
+
+def isolate_home(idle_release=None):
+    """Point the app's settings/cache files at a throwaway home directory"""
+    home = tempfile.mkdtemp(prefix="searchbar-e2e-")
+    os.environ["HOME"] = os.environ["USERPROFILE"] = home
+    # Keep background scanning and history import out of the measurement
+    settings = {"watch_browsers": False, "import_history": False}
+    if idle_release is not None:
+        settings["idle_release_seconds"] = idle_release
+    with open(os.path.join(home, ".desktop_search_settings.json"), "w") as f:
+        json.dump(settings, f)
+    return home
+
+
+class Harness:
+    def __init__(self, app, win, queries, key_interval_ms, query_interval_ms):
+        from PyQt5.QtCore import QTimer
+
+        self.app = app
+        self.win = win
+        self.queries = queries
+        self.key_interval_ms = key_interval_ms
+        self.query_interval_ms = query_interval_ms
+        self.samples = {stage: [] for stage in STAGES}
+        self.launched = []
+        self._enter_at = None
+        self._classify_ms = 0.0
+
+        win.launcher = self.record_launch
+        # Time the classification perform_search really does (plugins, then is_url)
+        win.plugin_registry.dispatch = self._classifying(win.plugin_registry.dispatch)
+        win.is_url = self._classifying(win.is_url)
+
+        # Event-loop stall monitor: a 1 ms timer whose late ticks are stalls
+        self._last_tick = None
+        self.monitor = QTimer()
+        self.monitor.setInterval(1)
+        self.monitor.timeout.connect(self._tick)
+
+        self._steps = self._workload()
+
+    def record_launch(self, url, browser=""):
+        self.launched.append(url)
+        if self._enter_at is not None:
+            self.samples["launch"].append((time.perf_counter() - self._enter_at) * 1000)
+            self._enter_at = None
+
+    def _classifying(self, fn):
+        def timed(*args):
+            start = time.perf_counter()
+            try:
+                return fn(*args)
+            finally:
+                self._classify_ms += (time.perf_counter() - start) * 1000
+        return timed
+
+    def _tick(self):
+        now = time.perf_counter()
+        if self._last_tick is not None:
+            gap = (now - self._last_tick) * 1000
+            if gap > 2:
+                self.samples["stall"].append(gap)
+        self._last_tick = now
+
+    def _timed(self, stage, fn):
+        start = time.perf_counter()
+        result = fn()
+        self.samples[stage].append((time.perf_counter() - start) * 1000)
+        return result
+
+    def _workload(self):
+        """Yields the delay in ms before the next step"""
+        from PyQt5.QtCore import Qt
+        from PyQt5.QtTest import QTest
+
+        for query in self.queries:
+            def show():
+                self.win.show_search()
+                self.win.repaint()
+            self._timed("show", show)
+            yield self.key_interval_ms
+
+            field = self.win.search_bar.search_input
+            for ch in query:
+                self._timed("type", lambda: QTest.keyClicks(field, ch))
+                yield self.key_interval_ms
+
+            self._classify_ms = 0.0
+            self._enter_at = time.perf_counter()
+            QTest.keyClick(field, Qt.Key_Return)
+            self.samples["classify"].append(self._classify_ms)
+            self.win.hide_search()
+            yield self.query_interval_ms
+
+    def _step(self):
+        from PyQt5.QtCore import QTimer
+
+        try:
+            delay = next(self._steps)
+        except StopIteration:
+            self.monitor.stop()
+            self.app.quit()
+            return
+        QTimer.singleShot(int(delay), self._step)
+
+    def run(self):
+        from PyQt5.QtCore import QTimer
+
+        self.monitor.start()
+        QTimer.singleShot(0, self._step)
+        self.app.exec_()
+        return self.samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--queries", type=int, default=100, help="number of queries to replay")
+    parser.add_argument("--key-rate", type=float, default=20.0, help="keystrokes per second")
+    parser.add_argument("--query-rate", type=float, default=4.0, help="queries per second (upper bound)")
+    parser.add_argument("--url-ratio", type=float, default=0.3, help="fraction of queries that are URLs")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--budget", action="append", default=[], metavar="STAGE=MS",
+                        help=f"fail if the stage's percentile exceeds MS; stages: {', '.join(STAGES)}")
+    parser.add_argument("--budget-percentile", type=float, default=95.0)
+    parser.add_argument("--idle-release", type=float, metavar="SECONDS",
+                        help="enable idle mode with this idle_release_seconds (keep it below 1/query-rate)")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+    budgets = parse_budgets(args.budget)
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    isolate_home(args.idle_release)
+    sys.path.insert(0, SRC_DIR)
+
+    from PyQt5.QtWidgets import QApplication
+    app = QApplication(sys.argv)
+    app.setQuitOnLastWindowClosed(False)
+    from Search_Bar import MainWindow
+
+    # Stub the browser scan before the window starts its startup scan
+    MainWindow.get_available_browsers = lambda self, cancel=None: {}
+    win = MainWindow()
+    win.hide_search()
+
+    harness = Harness(
+        app, win, make_queries(args.queries, args.url_ratio, args.seed),
+        key_interval_ms=1000.0 / args.key_rate,
+        query_interval_ms=1000.0 / args.query_rate,
+    )
+    samples = harness.run()
+    samples["first_paint"] = list(win.show_latencies)
+    win.quit_app()
+
+    report = {
+        stage: {
+            "count": len(values),
+            "p50": percentile(values, 50),
+            "p95": percentile(values, 95),
+            "p99": percentile(values, 99),
+            "max": max(values) if values else 0.0,
+        }
+        for stage, values in samples.items()
+    }
+    report["launched"] = len(harness.launched)
+    report["plugin_load_ms"] = win.plugin_registry.load_times()
+
+    failures = []
+    for stage, limit in budgets.items():
+        observed = percentile(samples[stage], args.budget_percentile)
+        if observed > limit:
+            failures.append(f"{stage} p{args.budget_percentile:g} {observed:.2f} ms > {limit:g} ms")
+
+    if args.json:
+        print(json.dumps(dict(report, failures=failures), indent=2))
+    else:
+        print(f"{'stage':<12}{'count':>7}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}  (ms)")
+        for stage in STAGES:
+            r = report[stage]
+            print(f"{stage:<12}{r['count']:>7}{r['p50']:>9.2f}{r['p95']:>9.2f}{r['p99']:>9.2f}{r['max']:>9.2f}")
+        print(f"\n{report['launched']} launches recorded")
+        for line in win.plugin_registry.profile_lines():
+            print(line)
+        for failure in failures:
+            print(f"BUDGET EXCEEDED: {failure}")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
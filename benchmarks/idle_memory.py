@@ -0,0 +1,157 @@
+"""
+Idle-mode memory harness.
+
+Compares resident memory while hidden and the latency of the next show with
+idle mode on and off. Each mode runs in its own child process so the RSS
+numbers do not bleed into each other.
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/idle_memory.py
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+
+def current_rss():
+    """Resident set size of this process in bytes"""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+
+    if os.path.exists("/proc/self/statm"):
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE")
+
+    if sys.platform == "win32":
+        import ctypes
+        from ctypes import wintypes
+
+        class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [
+                ("cb", wintypes.DWORD),
+                ("PageFaultCount", wintypes.DWORD),
+                ("PeakWorkingSetSize", ctypes.c_size_t),
+                ("WorkingSetSize", ctypes.c_size_t),
+                ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                ("PagefileUsage", ctypes.c_size_t),
+                ("PeakPagefileUsage", ctypes.c_size_t),
+            ]
+
+        counters = PROCESS_MEMORY_COUNTERS()
+        counters.cb = ctypes.sizeof(counters)
+        handle = ctypes.windll.kernel32.GetCurrentProcess()
+        ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb)
+        return counters.WorkingSetSize
+
+    return 0
+
+
+def run_mode(idle_on, idle_seconds, cycles):
+    """Measure one mode inside this process and print a JSON result line"""
+    import gc
+
+    sys.path.insert(0, SRC_DIR)
+    from PyQt5.QtWidgets import QApplication
+    from Search_Bar import MainWindow
+
+    app = QApplication(sys.argv)
+    app.setQuitOnLastWindowClosed(False)
+
+    # Stub the browser scan before the window starts its startup scan
+    MainWindow.get_available_browsers = lambda self, cancel=None: {}
+    win = MainWindow()
+    win.settings['idle_release_seconds'] = idle_seconds if idle_on else 0
+
+    def pump(seconds):
+        deadline = time.perf_counter() + seconds
+        while time.perf_counter() < deadline:
+            app.processEvents()
+            time.sleep(0.005)
+
+    # Warm up once so both modes start from a fully built, painted window
+    win.show_search()
+    pump(0.2)
+
+    idle_rss = []
+    show_ms = []
+    for _ in range(cycles):
+        win.hide_search()
+        pump(idle_seconds + 0.5)
+        gc.collect()
+        idle_rss.append(current_rss())
+
+        start = time.perf_counter()
+        win.show_search()
+        win.repaint()
+        app.processEvents()
+        show_ms.append((time.perf_counter() - start) * 1000)
+        pump(0.1)
+
+    win.quit_app()
+    print(json.dumps({
+        "mode": "on" if idle_on else "off",
+        "idle_rss": idle_rss,
+        "show_ms": show_ms,
+    }))
+
+
+def spawn(mode, args):
+    """Run one mode in a child process with an isolated home directory"""
+    with tempfile.TemporaryDirectory() as home:
+        # Keep background scanning and history import out of the measurement
+        with open(os.path.join(home, ".desktop_search_settings.json"), "w") as f:
+            json.dump({"watch_browsers": False, "import_history": False}, f)
+        env = dict(os.environ, HOME=home, USERPROFILE=home)
+        env.setdefault("QT_QPA_PLATFORM", "offscreen")
+        cmd = [
+            sys.executable, os.path.abspath(__file__), "--child", mode,
+            "--idle-seconds", str(args.idle_seconds), "--cycles", str(args.cycles),
+        ]
+        out = subprocess.run(cmd, env=env, capture_output=True, text=True, check=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def summarize(result):
+    rss = sorted(result["idle_rss"])
+    show = sorted(result["show_ms"])
+    return {
+        "idle_rss_mb": rss[len(rss) // 2] / (1024 * 1024),
+        "show_ms_median": show[len(show) // 2],
+        "show_ms_max": show[-1],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--idle-seconds", type=float, default=1.0,
+                        help="idle_release_seconds used for the 'on' mode")
+    parser.add_argument("--cycles", type=int, default=5, help="hide/show cycles per mode")
+    parser.add_argument("--child", choices=("on", "off"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_mode(args.child == "on", args.idle_seconds, args.cycles)
+        return
+
+    results = {mode: summarize(spawn(mode, args)) for mode in ("off", "on")}
+    print(f"{'mode':<6}{'idle RSS (MB)':>16}{'show median (ms)':>20}{'show max (ms)':>16}")
+    for mode, r in results.items():
+        print(f"{mode:<6}{r['idle_rss_mb']:>16.1f}{r['show_ms_median']:>20.2f}{r['show_ms_max']:>16.2f}")
+    saved = results["off"]["idle_rss_mb"] - results["on"]["idle_rss_mb"]
+    print(f"\nIdle mode saves {saved:.1f} MB while hidden")
+
+
+if __name__ == "__main__":
+    main()
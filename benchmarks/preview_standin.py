@@ -0,0 +1,70 @@
+"""
+Local stand-in for a search results endpoint.
+
+Serves canned JSON (or HTML with --html) results for any query over HTTP/1.1
+keep-alive, with optional artificial latency, so the preview panel can be
+exercised without touching a real search engine:
+
+    python benchmarks/preview_standin.py --port 8765 --delay 0.2
+
+then set "preview_endpoint" in ~/.desktop_search_settings.json to
+"http://127.0.0.1:8765/search?q={query}".
+"""
+import argparse
+import html
+import json
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+
+def make_handler(delay, as_html, count):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            query = parse_qs(urlsplit(self.path).query).get("q", [""])[0]
+            if delay:
+                time.sleep(delay)
+
+            results = [
+                {"title": f"{query} result {i}", "url": f"https://example.com/{i}?q={query}"}
+                for i in range(1, count + 1)
+            ]
+            if as_html:
+                links = "".join(
+                    f'<a class="result__a" href="{html.escape(r["url"])}">{html.escape(r["title"])}</a>'
+                    for r in results
+                )
+                body, content_type = f"<html><body>{links}</body></html>", "text/html; charset=utf-8"
+            else:
+                body, content_type = json.dumps({"results": results}), "application/json"
+
+            data = body.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--delay", type=float, default=0.0, help="seconds to wait before answering")
+    parser.add_argument("--html", action="store_true", help="serve DuckDuckGo-style HTML instead of JSON")
+    parser.add_argument("--count", type=int, default=8, help="results per query")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), make_handler(args.delay, args.html, args.count))
+    print(f"Serving stand-in results on http://127.0.0.1:{args.port}/search?q={{query}}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
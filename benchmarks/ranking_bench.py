@@ -0,0 +1,122 @@
+"""
+Ranking benchmark: NumPy columnar scorer vs the pure Python scorer.
+
+Builds a synthetic candidate set (history, bookmarks, files) and times top-k
+queries on both implementations, checking that they agree on the scores.
+
+    python benchmarks/ranking_bench.py --rows 200000 --queries 50
+    python benchmarks/ranking_bench.py --rows 6000000 --shards 8 --skip-python
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import ranking
+
+WORDS = [
+    "python", "docs", "github", "issue", "pull", "request", "weather", "news", "qt",
+    "layout", "widget", "recipe", "pasta", "flights", "paris", "invoice", "report",
+    "budget", "music", "video", "maps", "mail", "calendar", "search", "bar", "rust",
+]
+HOSTS = ["github.com", "python.org", "docs.qt.io", "news.example.com", "mail.example.org", "maps.example.net"]
+
+
+def make_rows(count, seed):
+    rng = random.Random(seed)
+    now = time.time()
+    rows = []
+    for _ in range(count):
+        words = [rng.choice(WORDS) for _ in range(rng.randint(2, 6))]
+        source = rng.choices(ranking.SOURCES, weights=(80, 15, 5))[0]
+        if source == "file":
+            url = "file:///C:/Users/me/" + "/".join(words) + ".txt"
+        else:
+            url = f"https://{rng.choice(HOSTS)}/{'/'.join(words)}"
+        rows.append((" ".join(words).title(), url, source,
+                     now - rng.expovariate(1 / (30 * 86400)), int(rng.paretovariate(1.5))))
+    return rows
+
+
+def make_queries(count, seed):
+    rng = random.Random(seed + 1)
+    queries = []
+    for _ in range(count):
+        word = rng.choice(WORDS)
+        # Mix complete words with the partial prefixes seen while typing
+        queries.append(word[:rng.randint(2, len(word))] if rng.random() < 0.5
+                       else f"{word} {rng.choice(WORDS)[:3]}")
+    return queries
+
+
+def timed(index, queries, k, now):
+    times = []
+    results = []
+    for query in queries:
+        start = time.perf_counter()
+        results.append(index.top_k(query, k, now))
+        times.append((time.perf_counter() - start) * 1000)
+    times.sort()
+    return times, results
+
+
+def report(name, build_s, times):
+    p50 = times[len(times) // 2]
+    p95 = times[min(len(times) - 1, int(len(times) * 0.95))]
+    print(f"{name:<10}{build_s * 1000:>12.1f}{p50:>10.2f}{p95:>10.2f}{times[-1]:>10.2f}")
+    return p50
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--queries", type=int, default=30)
+    parser.add_argument("--k", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--shards", type=int, default=0, help="also time a process-sharded index")
+    parser.add_argument("--skip-python", action="store_true", help="skip the (slow) pure Python baseline")
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows, args.seed)
+    queries = make_queries(args.queries, args.seed)
+    now = time.time()
+    print(f"{args.rows} candidates, {args.queries} queries, top {args.k}\n")
+    print(f"{'scorer':<10}{'build (ms)':>12}{'p50 (ms)':>10}{'p95 (ms)':>10}{'max (ms)':>10}")
+
+    start = time.perf_counter()
+    np_index = ranking.RankingIndex()
+    np_index.extend(rows)
+    np_index._materialize()
+    np_build = time.perf_counter() - start
+    np_times, np_results = timed(np_index, queries, args.k, now)
+    np_p50 = report("numpy", np_build, np_times)
+
+    if not args.skip_python:
+        start = time.perf_counter()
+        py_index = ranking.PyRankingIndex()
+        py_index.extend(rows)
+        py_build = time.perf_counter() - start
+        py_times, py_results = timed(py_index, queries, args.k, now)
+        py_p50 = report("python", py_build, py_times)
+
+        mismatches = sum(
+            1 for a, b in zip(np_results, py_results)
+            if [round(c.score, 6) for c in a] != [round(c.score, 6) for c in b]
+        )
+        print(f"\nspeed-up (p50): {py_p50 / np_p50:.1f}x; score mismatches: {mismatches}/{len(queries)}")
+
+    if args.shards:
+        start = time.perf_counter()
+        sharded = ranking.ShardedRankingIndex(rows, args.shards)
+        sharded.top_k("warm", args.k, now)
+        sh_build = time.perf_counter() - start
+        sh_times, _ = timed(sharded, queries, args.k, now)
+        report(f"{args.shards} shards", sh_build, sh_times)
+        sharded.close()
+
+
+if __name__ == "__main__":
+    main()
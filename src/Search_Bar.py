@@ -1,86 +1,69 @@
 import sys
 import os
-import subprocess
-import webbrowser
-import urllib.parse
-import winreg
-import json
-import threading
+import logging
 import re
 import time
 from pathlib import Path
-from datetime import datetime
+from collections import deque
 import base64
 
-from PyQt5.QtCore import Qt, QSize, pyqtSignal, QObject, QTimer
+from PyQt5.QtCore import Qt, QSize, pyqtSignal, QObject, QTimer, QCoreApplication, QEvent, QFile
 from PyQt5.QtGui import (
     QIcon, QPainter, QLinearGradient, QColor, QPen, QBrush,
-    QKeySequence, QPixmap, QFont
+    QKeySequence, QPixmap, QFont, QPixmapCache, QTextCursor
 )
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QLineEdit, QHBoxLayout, QVBoxLayout, QWidget,
     QSystemTrayIcon, QMenu, QAction, QShortcut, QMessageBox, QLabel,
     QDialog, QPushButton, QListWidget, QFileDialog, QDialogButtonBox,
-    QSizePolicy, QSpacerItem, QProgressBar
+    QSizePolicy, QSpacerItem, QProgressBar, QPlainTextEdit
 )
 
-# ---------- Browser Database ----------
-BROWSER_DATABASE = {
-    "chrome.exe": "Google Chrome",
-    "msedge.exe": "Microsoft Edge",
-    "firefox.exe": "Mozilla Firefox",
-    "opera.exe": "Opera",
-    "opera_gx.exe": "Opera GX",
-    "brave.exe": "Brave",
-    "vivaldi.exe": "Vivaldi",
-    "safari.exe": "Safari (Windows legacy)",
-    "iexplore.exe": "Internet Explorer",
-    "chromium.exe": "Chromium",
-    "maxthon.exe": "Maxthon",
-    "torch.exe": "Torch Browser",
-    "slimjet.exe": "SlimJet",
-    "avant.exe": "Avant Browser",
-    "epic.exe": "Epic Privacy Browser",
-    "srwareiron.exe": "SRWare Iron",
-    "comodo_dragon.exe": "Comodo Dragon",
-    "kinza.exe": "Kinza Browser",
-    "orbitum.exe": "Orbitum",
-    "falkon.exe": "Falkon",
-    "midori.exe": "Midori",
-    "waterfox.exe": "Waterfox",
-    "palemoon.exe": "Pale Moon",
-    "seamonkey.exe": "SeaMonkey",
-    "netsurf.exe": "NetSurf",
-    "yandex.exe": "Yandex Browser",
-    "qqbrowser.exe": "QQ Browser",
-    "ucbrowser.exe": "UC Browser",
-    "baidubrowser.exe": "Baidu Browser",
-    "sogoubrowser.exe": "Sogou Browser",
-    "colibri.exe": "Colibri",
-    "otterbrowser.exe": "Otter Browser",
-    "dillo.exe": "Dillo",
-    "dooble.exe": "Dooble Browser",
-    "kmeleon.exe": "K-Meleon",
-    "lunascape.exe": "Lunascape",
-    "avast_secure_browser.exe": "Avast Secure Browser",
-    "avg_secure_browser.exe": "AVG Secure Browser",
-    "torchlightbrowser.exe": "Torchlight Browser",
-    "duckduckgo.exe": "DuckDuckGo"
-}
-
-
-# ---------- Browser Loader Thread ----------
+import search_core
+from search_core import BROWSER_DATABASE
+from dns_prefetch import DnsPrefetcher
+from browser_watch import BrowserWatcher
+from browser_scan import ScanCoordinator
+from browser_history import HistoryIndex
+from usage_stats import UsageStats, format_report
+from plugins import PluginRegistry
+import log_setup
+import resources_rc  # noqa: F401 - registers the embedded icons (pyrcc5 resources.qrc -o resources_rc.py)
+
+log = logging.getLogger(__name__)
+
+# Hotkey-to-first-paint target: one frame at 60 Hz
+SHOW_BUDGET_MS = 16
+
+# Usage stats are saved this often while resident (only when something changed)
+STATS_SAVE_INTERVAL_MS = 5 * 60 * 1000
+
+
+def resource_path(name):
+    """Qt path of a bundled asset; icons are compiled into resources_rc, not read from disk"""
+    return ":/" + name
+
+# ---------- Browser Loader ----------
 class BrowserLoader(QObject):
+    """Relays the shared scan's result to the GUI thread via browsers_loaded"""
     browsers_loaded = pyqtSignal(dict)
     progress_update = pyqtSignal(int)
 
     def __init__(self, parent):
         super().__init__()
         self.parent = parent
+        self.closed = False
 
     def load_browsers(self):
-        browsers = self.parent.get_available_browsers()
-        self.browsers_loaded.emit(browsers)
+        """Join the in-flight scan (or start one); returns immediately"""
+        future = self.parent.scan_coordinator.request_scan()
+        future.add_done_callback(self._on_scan_done)
+
+    def _on_scan_done(self, future):
+        # Runs on the scan thread; the signal is queued to the GUI thread
+        if self.closed or future.cancelled() or future.exception() is not None:
+            return
+        self.browsers_loaded.emit(future.result())
 
 
 # ---------- Settings Dialog for Browser Selection ----------
@@ -202,14 +185,17 @@ class SettingsDialog(QDialog):
         # Load browsers from cache first
         self.load_cached_browsers()
 
-        # Then load browsers in a separate thread to update the cache
         self.browser_loader = BrowserLoader(self.parent)
         self.browser_loader.browsers_loaded.connect(self.update_browser_list)
         self.browser_loader.progress_update.connect(self.update_progress)
 
-        self.load_thread = threading.Thread(target=self.load_browsers_threaded)
-        self.load_thread.daemon = True
-        self.load_thread.start()
+        # A live browser watcher keeps the cached list current; otherwise
+        # load browsers in a separate thread to update the cache
+        watched = getattr(self.parent, 'browser_watcher', None) is not None
+        if watched and self.parent.available_browsers:
+            self.refresh_btn.setVisible(True)
+        else:
+            self.browser_loader.load_browsers()
 
     def load_cached_browsers(self):
         """Load browsers from cache for immediate display"""
@@ -218,9 +204,10 @@ class SettingsDialog(QDialog):
             self.loading_label.hide()
             self.browser_list.show()
 
-    def load_browsers_threaded(self):
-        """Load browsers in a separate thread to prevent UI freeze"""
-        self.browser_loader.load_browsers()
+    def done(self, result):
+        # Stop relaying scan results into a dialog that is going away
+        self.browser_loader.closed = True
+        super().done(result)
 
     def update_progress(self, value):
         """Update progress bar value"""
@@ -270,17 +257,12 @@ class SettingsDialog(QDialog):
         self.progress_bar.setVisible(True)
         self.refresh_btn.setVisible(False)
 
-        # Reload browsers in a separate thread
-        self.load_thread = threading.Thread(target=self.load_browsers_threaded)
-        self.load_thread.daemon = True
-        self.load_thread.start()
+        # Reload browsers through the shared scan (joins one already running)
+        self.browser_loader.load_browsers()
 
     def is_browser_accessible(self, path):
         """Check if a browser executable is accessible"""
-        try:
-            return os.path.exists(path) and os.access(path, os.X_OK)
-        except:
-            return False
+        return search_core.is_browser_accessible(path)
 
     def add_custom_browser(self):
         folder_path = QFileDialog.getExistingDirectory(
@@ -322,6 +304,77 @@ class SettingsDialog(QDialog):
         return None
 
 
+# ---------- Recent log records ----------
+class LogViewerDialog(QDialog):
+    def __init__(self, records, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Recent Logs")
+        self.resize(700, 400)
+        self.setStyleSheet("""
+            QDialog {
+                background-color: #333;
+                color: white;
+            }
+            QPlainTextEdit {
+                background-color: #444;
+                color: white;
+                border: 1px solid #555;
+                border-radius: 5px;
+                font-family: Consolas, monospace;
+                font-size: 12px;
+            }
+            QPushButton {
+                background-color: #555;
+                color: white;
+                border: none;
+                padding: 8px 16px;
+                border-radius: 5px;
+            }
+            QPushButton:hover {
+                background-color: #666;
+            }
+        """)
+
+        layout = QVBoxLayout()
+
+        text = QPlainTextEdit()
+        text.setReadOnly(True)
+        text.setLineWrapMode(QPlainTextEdit.NoWrap)
+        text.setPlainText(log_setup.format_records(records) or "No log records yet.")
+        text.moveCursor(QTextCursor.End)
+        layout.addWidget(text)
+
+        button_box = QDialogButtonBox(QDialogButtonBox.Close)
+        button_box.rejected.connect(self.reject)
+        layout.addWidget(button_box)
+        self.setLayout(layout)
+
+
+class UsageStatsDialog(LogViewerDialog):
+    """Read-only usage report, with a button to start counting afresh"""
+
+    def __init__(self, stats, parent=None):
+        super().__init__([], parent)
+        self.setWindowTitle("Usage Stats")
+        self.resize(520, 480)
+        self.stats = stats
+        self.text = self.findChild(QPlainTextEdit)
+
+        reset_button = QPushButton("Reset")
+        reset_button.clicked.connect(self.reset_stats)
+        self.findChild(QDialogButtonBox).addButton(reset_button, QDialogButtonBox.ResetRole)
+        self.refresh()
+
+    def refresh(self):
+        self.text.setPlainText(format_report(self.stats.report()))
+
+    def reset_stats(self):
+        if QMessageBox.question(self, "Reset Usage Stats",
+                                "Forget all counted queries, domains and engines?") == QMessageBox.Yes:
+            self.stats.reset()
+            self.refresh()
+
+
 # ---------- Small helper: clickable icon ----------
 class ClickableLabel(QLabel):
     clicked = pyqtSignal()
@@ -336,9 +389,17 @@ class GradientWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setAttribute(Qt.WA_TranslucentBackground)
+        self._background = None  # Pre-rendered gradient for the current size
+        self._background_key = None
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
+    def render_background(self):
+        """Paint the gradient once into a pixmap; paintEvent just blits it"""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(int(self.width() * ratio), int(self.height() * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.Antialiasing)
 
         # Horizontal gradient
@@ -349,6 +410,28 @@ class GradientWidget(QWidget):
         painter.setBrush(QBrush(gradient))
         painter.setPen(QPen(QColor(213, 207, 207), 2))  # #D5CFCF, 2pt
         painter.drawRoundedRect(1, 1, self.width() - 2, self.height() - 2, 25, 25)
+        painter.end()
+
+        self._background = pixmap
+        self._background_key = (self.size(), ratio)
+        return pixmap
+
+    def resizeEvent(self, event):
+        self._background = None
+        super().resizeEvent(event)
+
+    def paintEvent(self, event):
+        background = self._background
+        if background is None or self._background_key != (self.size(), self.devicePixelRatioF()):
+            background = self.render_background()
+
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, background)
+        painter.end()
+
+        win = self.window()
+        if hasattr(win, "on_first_paint"):
+            win.on_first_paint()
 
 
 # ---------- Options Button with icon ----------
@@ -373,8 +456,8 @@ class OptionsButton(ClickableLabel):
     def create_option_icon(self):
         """Create option icon programmatically if file is missing"""
         # Try to load from file first
-        icon_path = self.resource_path("option.png")
-        if os.path.exists(icon_path):
+        icon_path = resource_path("option.png")
+        if QFile.exists(icon_path):
             pm = QPixmap(icon_path).scaled(
                 20, 20, Qt.KeepAspectRatio, Qt.SmoothTransformation
             )
@@ -397,16 +480,6 @@ class OptionsButton(ClickableLabel):
             painter.end()
             self.setPixmap(pixmap)
 
-    def resource_path(self, relative_path):
-        """Get absolute path to resource, works for dev and for PyInstaller"""
-        try:
-            # PyInstaller creates a temp folder and stores path in _MEIPASS
-            base_path = sys._MEIPASS
-        except Exception:
-            base_path = os.path.abspath(".")
-
-        return os.path.join(base_path, relative_path)
-
 
 # ---------- Search field with left icon and options button ----------
 class SearchBar(QWidget):
@@ -452,8 +525,8 @@ class SearchBar(QWidget):
     def create_search_icon(self):
         """Create search icon programmatically if file is missing"""
         # Try to load from file first
-        icon_path = self.resource_path("search.png")
-        if os.path.exists(icon_path):
+        icon_path = resource_path("search.png")
+        if QFile.exists(icon_path):
             pm = QPixmap(icon_path).scaled(
                 self.icon_size, self.icon_size, Qt.KeepAspectRatio, Qt.SmoothTransformation
             )
@@ -475,16 +548,6 @@ class SearchBar(QWidget):
             painter.end()
             self.icon_label.setPixmap(pixmap)
 
-    def resource_path(self, relative_path):
-        """Get absolute path to resource, works for dev and for PyInstaller"""
-        try:
-            # PyInstander creates a temp folder and stores path in _MEIPASS
-            base_path = sys._MEIPASS
-        except Exception:
-            base_path = os.path.abspath(".")
-
-        return os.path.join(base_path, relative_path)
-
     def resizeEvent(self, event):
         """Keep icon vertically centered."""
         y = (self.search_input.height() - self.icon_label.height()) // 2
@@ -508,117 +571,210 @@ class SearchBar(QWidget):
         self.search_input.clear()
 
 
+# ---------- Result preview dropdown ----------
+class PreviewPanel(QListWidget):
+    """Frameless list of result previews shown just below (or above) the bar"""
+    ROW_HEIGHT = 28
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowFlags(Qt.Tool | Qt.FramelessWindowHint | Qt.WindowDoesNotAcceptFocus)
+        self.setAttribute(Qt.WA_ShowWithoutActivating)
+        self.setFocusPolicy(Qt.NoFocus)
+        self.setStyleSheet("""
+            QListWidget {
+                background-color: #333;
+                color: white;
+                border: 1px solid #555;
+                border-radius: 5px;
+                font-size: 13px;
+            }
+            QListWidget::item {
+                padding: 4px 10px;
+            }
+            QListWidget::item:selected {
+                background-color: #555;
+            }
+        """)
+
+    def set_results(self, results):
+        self.clear()
+        for result in results:
+            self.addItem(result.title)
+            item = self.item(self.count() - 1)
+            item.setData(Qt.UserRole, result.url)
+            item.setToolTip(result.url)
+
+    def move_selection(self, step):
+        if self.count():
+            self.setCurrentRow(max(-1, min(self.count() - 1, self.currentRow() + step)))
+
+    def selected_url(self):
+        item = self.currentItem()
+        if self.isVisible() and item is not None and item.isSelected():
+            return item.data(Qt.UserRole)
+        return None
+
+    def place_under(self, bar):
+        """Size to the results and sit below bar, or above it near the screen edge"""
+        height = min(self.count(), 8) * self.ROW_HEIGHT + 6
+        self.setFixedSize(bar.width(), height)
+
+        screen = QApplication.primaryScreen().availableGeometry()
+        top = bar.frameGeometry()
+        y = top.bottom() + 4
+        if y + height > screen.bottom():
+            y = top.top() - height - 4
+        self.move(top.left(), y)
+
+
 # ---------- Main window ----------
 class MainWindow(QMainWindow):
+    # Emitted from the preview worker thread with (query, results)
+    preview_ready = pyqtSignal(str, list)
+
     def __init__(self):
         super().__init__()
         self.is_visible = False
-        self.settings_file = os.path.join(os.path.expanduser("~"), ".desktop_search_settings.json")
-        self.browser_cache_file = os.path.join(os.path.expanduser("~"), ".desktop_search_browser_cache.json")
+        self.settings_file = search_core.SETTINGS_FILE
+        self.browser_cache_file = search_core.BROWSER_CACHE_FILE
         self.settings = self.load_settings()
         self.available_browsers = self.load_browser_cache()  # Load from cache
+        self.search_bar = None
+        self.launcher = search_core.open_target  # Swapped for a recording stub by the benchmarks
+        self.plugin_registry = PluginRegistry(self.settings.get('plugin_dirs'))
+        self.plugin_registry.discover_in_background()
+
+        # Idle mode: release the heavy UI objects after being hidden for a while
+        self.idle_timer = QTimer(self)
+        self.idle_timer.setSingleShot(True)
+        self.idle_timer.timeout.connect(self.release_idle_resources)
+
+        # Debounced DNS pre-resolution of typed domains (optional)
+        self.dns_prefetcher = None
+        self.prefetch_timer = QTimer(self)
+        self.prefetch_timer.setSingleShot(True)
+        self.prefetch_timer.setInterval(150)
+        self.prefetch_timer.timeout.connect(self.prefetch_typed_host)
+
+        # Result previews from preview_endpoint (optional)
+        self.preview_client = None
+        self.preview_request = None
+        self.preview_panel = None
+        self.remote_results = []  # latest endpoint/plugin results for the current text
+        self.preview_timer = QTimer(self)
+        self.preview_timer.setSingleShot(True)
+        self.preview_timer.setInterval(250)
+        self.preview_timer.timeout.connect(self.fetch_preview)
+        self.preview_ready.connect(self.show_preview)
+
+        # Constant-size counts of queries, domains and engines (optional)
+        self.usage_stats = UsageStats().load() if self.settings.get('usage_stats') else None
+        self.stats_timer = QTimer(self)
+        self.stats_timer.setInterval(STATS_SAVE_INTERVAL_MS)
+        self.stats_timer.timeout.connect(self.save_usage_stats)
+        if self.usage_stats is not None:
+            self.stats_timer.start()
+            # Also covers logoff/shutdown and quits that bypass the tray's Exit
+            QApplication.instance().aboutToQuit.connect(self.save_usage_stats)
+
+        # Browser bookmarks/history, matched on every keystroke
+        self.history_index = HistoryIndex() if self.settings.get('import_history') else None
+        self.local_results = []
+
+        # Hotkey-to-first-paint instrumentation
+        self.show_requested_at = None
+        self.show_rebuilt = False
+        self.show_latencies = deque(maxlen=200)
 
         self.initUI()
         self.setupTrayIcon()
         self.setupShortcuts()
 
+        # Pre-render once the event loop is idle after startup
+        QTimer.singleShot(0, self.warm_up)
+
         # Auto-detect browser on first run if not set
         if not self.settings.get('preferred_browser') and self.available_browsers:
             self.auto_select_browser()
 
+        # One scan at a time, shared by startup and the settings dialog
+        self.browser_watcher = None
+        self.scan_coordinator = ScanCoordinator(
+            self.browser_cache_file, scan=self.get_available_browsers, on_publish=self.on_browsers_published
+        )
+
         # Pre-load browsers in background thread to update cache
         self.preload_browsers()
 
+        # Keep the browser list current while resident
+        if self.settings.get('watch_browsers'):
+            self.start_browser_watch()
+
     def auto_select_browser(self):
         """Automatically select a browser on first run"""
-        # Priority order for browser selection
-        browser_priority = [
-            "Microsoft Edge",
-            "Google Chrome",
-            "Mozilla Firefox",
-            "Opera",
-            "Brave",
-            "Vivaldi"
-        ]
-
-        # Try to find browsers in priority order
-        for browser_name in browser_priority:
-            for available_name, path in self.available_browsers.items():
-                if browser_name.lower() in available_name.lower():
-                    self.settings['preferred_browser'] = path
-                    self.save_settings()
-                    print(f"Auto-selected browser: {available_name}")
-                    return
-
-        # If no priority browser found, just use the first available
-        if self.available_browsers:
-            first_browser = next(iter(self.available_browsers.items()))
-            self.settings['preferred_browser'] = first_browser[1]
+        selected = search_core.select_browser(self.available_browsers)
+        if selected:
+            name, path = selected
+            self.settings['preferred_browser'] = path
             self.save_settings()
-            print(f"Auto-selected browser: {first_browser[0]}")
+            log.info("Auto-selected browser: %s", name, extra={"browser": path})
 
     # Pre-load browsers to improve performance
     def preload_browsers(self):
-        def load_browsers():
-            browsers = self.get_available_browsers()
-            self.available_browsers = browsers
-            self.save_browser_cache(browsers)
-
-        thread = threading.Thread(target=load_browsers)
-        thread.daemon = True
-        thread.start()
+        future = self.scan_coordinator.request_scan()
+        future.add_done_callback(self._on_preload_done)
+        return future
+
+    def _on_preload_done(self, future):
+        if self.browser_watcher is not None and not future.cancelled() and future.exception() is None:
+            self.browser_watcher.reset(future.result())
+        self.refresh_history(force=True)
+
+    def refresh_history(self, force=False):
+        """Pick up new bookmarks and visits in the background.
+
+        Unchanged files are skipped, and unless forced, runs are at least
+        HistoryIndex.min_refresh_seconds apart.
+        """
+        if self.history_index is not None:
+            self.history_index.refresh_in_background(dict(self.available_browsers), force=force)
+
+    def on_browsers_published(self, browsers):
+        """Called under the coordinator's publish lock from any thread"""
+        self.available_browsers = browsers
+
+    # ----- Browser watching -----
+    def start_browser_watch(self):
+        """Apply browser installs/uninstalls incrementally instead of rescanning"""
+        self.browser_watcher = BrowserWatcher(
+            self.available_browsers,
+            lambda browsers, added, removed: self.scan_coordinator.publish(browsers)
+        )
+        self.browser_watcher.start()
 
     # ----- Settings management -----
     def load_settings(self):
-        default_settings = {
-            'preferred_browser': '',  # Empty means use system default
-            'custom_browser': ''  # Path to custom browser if added
-        }
+        return search_core.load_settings(self.settings_file)
 
+    def idle_release_ms(self):
+        """Milliseconds hidden before UI objects are released (0 disables idle mode)"""
         try:
-            if os.path.exists(self.settings_file):
-                with open(self.settings_file, 'r') as f:
-                    return {**default_settings, **json.load(f)}
-        except Exception as e:
-            print(f"Error loading settings: {e}")
-
-        return default_settings
+            return max(0, int(float(self.settings.get('idle_release_seconds', 0)) * 1000))
+        except (TypeError, ValueError):
+            return 0
 
     def save_settings(self):
-        try:
-            with open(self.settings_file, 'w') as f:
-                json.dump(self.settings, f, indent=4)
-        except Exception as e:
-            print(f"Error saving settings: {e}")
+        search_core.save_settings(self.settings, self.settings_file)
 
     # ----- Browser cache management -----
     def load_browser_cache(self):
         """Load browser cache from file"""
-        try:
-            if os.path.exists(self.browser_cache_file):
-                with open(self.browser_cache_file, 'r') as f:
-                    cache_data = json.load(f)
-
-                    # Check if cache is recent (less than 7 days old)
-                    cache_time = datetime.fromisoformat(cache_data.get('timestamp', '2000-01-01'))
-                    if (datetime.now() - cache_time).days < 7:
-                        return cache_data.get('browsers', {})
-        except Exception as e:
-            print(f"Error loading browser cache: {e}")
-
-        return {}
+        return search_core.load_browser_cache(self.browser_cache_file)
 
     def save_browser_cache(self, browsers):
         """Save browser cache to file"""
-        try:
-            cache_data = {
-                'timestamp': datetime.now().isoformat(),
-                'browsers': browsers
-            }
-            with open(self.browser_cache_file, 'w') as f:
-                json.dump(cache_data, f, indent=4)
-        except Exception as e:
-            print(f"Error saving browser cache: {e}")
+        search_core.save_browser_cache(browsers, self.browser_cache_file)
 
     # ----- UI setup -----
     def initUI(self):
@@ -631,6 +787,11 @@ class MainWindow(QMainWindow):
         )
         self.setAttribute(Qt.WA_TranslucentBackground)
 
+        self.build_ui()
+        self.centerWindow()
+
+    def build_ui(self):
+        """Create the central widget tree (also used to rebuild after idle release)"""
         # Central layout
         central = QWidget()
         self.setCentralWidget(central)
@@ -645,12 +806,12 @@ class MainWindow(QMainWindow):
         # Search bar with options button
         self.search_bar = SearchBar()
         self.search_bar.options_btn.clicked.connect(self.show_options_menu)
+        self.search_bar.search_input.textChanged.connect(self.on_text_changed)
+        self.search_bar.search_input.installEventFilter(self)
 
         h.addWidget(self.search_bar)
         root.addWidget(container)
 
-        self.centerWindow()
-
     def centerWindow(self):
         screen = QApplication.primaryScreen().geometry()
         x = (screen.width() - self.width()) // 2
@@ -701,13 +862,13 @@ class MainWindow(QMainWindow):
     # ----- Tray icon -----
     def setupTrayIcon(self):
         if not QSystemTrayIcon.isSystemTrayAvailable():
-            print("System tray not available")
+            log.warning("System tray not available")
             return
 
         self.tray_icon = QSystemTrayIcon(self)
 
-        icon_path = self.resource_path("search.png")
-        if os.path.exists(icon_path):
+        icon_path = resource_path("search.png")
+        if QFile.exists(icon_path):
             self.tray_icon.setIcon(QIcon(icon_path))
         else:
             # Create a simple tray icon programmatically
@@ -726,30 +887,49 @@ class MainWindow(QMainWindow):
 
         show_action = QAction("Show Search", self)
         settings_action = QAction("Browser Settings", self)
+        logs_action = QAction("Recent Logs", self)
+        stats_action = QAction("Usage Stats", self)
         quit_action = QAction("Exit", self)
 
         show_action.triggered.connect(self.toggle_search)
         settings_action.triggered.connect(self.show_settings)
+        logs_action.triggered.connect(self.show_recent_logs)
+        stats_action.triggered.connect(self.show_usage_stats)
         quit_action.triggered.connect(self.quit_app)
 
         menu = QMenu()
         menu.addAction(show_action)
         menu.addAction(settings_action)
+        menu.addAction(logs_action)
+        if self.usage_stats is not None:
+            menu.addAction(stats_action)
         menu.addSeparator()
         menu.addAction(quit_action)
         self.tray_icon.setContextMenu(menu)
         self.tray_icon.activated.connect(self.trayIconActivated)
         self.tray_icon.show()
 
-    def resource_path(self, relative_path):
-        """Get absolute path to resource, works for dev and for PyInstaller"""
-        try:
-            # PyInstaller creates a temp folder and stores path in _MEIPASS
-            base_path = sys._MEIPASS
-        except Exception:
-            base_path = os.path.abspath(".")
+    def show_recent_logs(self):
+        dialog = LogViewerDialog(log_setup.recent_records(), self)
+        dialog.exec_()
+
+    def show_usage_stats(self):
+        dialog = UsageStatsDialog(self.usage_stats, self)
+        dialog.exec_()
+        self.save_usage_stats()
 
-        return os.path.join(base_path, relative_path)
+    def record_usage(self, query, bucket, target=None):
+        """O(1) update of the usage sketches; saved later, off the search path"""
+        if self.usage_stats is not None:
+            self.usage_stats.record(query, bucket, target)
+
+    def save_usage_stats(self):
+        if self.usage_stats is None:
+            return
+        try:
+            self.usage_stats.save()
+        except Exception as e:
+            log.error("Error saving usage stats: %s", e, extra={"path": self.usage_stats.path})
 
     # ----- Shortcuts -----
     def setupShortcuts(self):
@@ -767,95 +947,219 @@ class MainWindow(QMainWindow):
         self.hide_search() if self.is_visible else self.show_search()
 
     def show_search(self):
+        self.show_requested_at = time.perf_counter()
+        self.idle_timer.stop()
+        self.show_rebuilt = self.search_bar is None
+        if self.show_rebuilt:
+            self.restore_idle_resources()
+
         self.show()
         self.activateWindow()
         self.search_bar.search_input.setFocus()
         self.is_visible = True
 
+    def on_first_paint(self):
+        """Record how long the bar took to paint after show_search"""
+        if self.show_requested_at is None:
+            return
+        latency = (time.perf_counter() - self.show_requested_at) * 1000
+        self.show_requested_at = None
+        self.show_latencies.append(latency)
+        if latency > SHOW_BUDGET_MS:
+            log.warning("Slow show: %.1f ms to first paint", latency,
+                        extra={"budget_ms": SHOW_BUDGET_MS, "rebuilt": self.show_rebuilt})
+        else:
+            log.debug("Show: %.1f ms to first paint", latency)
+        # Now that the bar is on screen, catch up with recent browsing (throttled)
+        self.refresh_history()
+
+    def warm_up(self):
+        """Polish, lay out and pre-render the hidden window so the next show is cheap"""
+        if self.is_visible or self.search_bar is None:
+            return
+        start = time.perf_counter()
+
+        self.winId()  # Create the native (layered) window now, not on first show
+        for widget in [self] + self.findChildren(QWidget):
+            widget.ensurePolished()
+        self.layout().activate()
+        self.centralWidget().layout().activate()
+        for container in self.findChildren(GradientWidget):
+            container.render_background()
+        # Render the whole tree once offscreen to warm font/glyph and style caches
+        self.grab()
+
+        log.debug("Warm-up took %.1f ms", (time.perf_counter() - start) * 1000)
+
     def hide_search(self):
-        self.search_bar.clear()
+        if self.search_bar is not None:
+            self.search_bar.clear()
+        self.hide_preview()
         self.hide()
         self.is_visible = False
 
+        delay = self.idle_release_ms()
+        if delay:
+            self.idle_timer.start(delay)
+
+    # ----- Idle mode -----
+    def release_idle_resources(self):
+        """Tear down widgets and pixmaps while hidden.
+
+        The browser dict is kept: it is tiny, and the cache file it would be
+        reloaded from expires after a week in the tray.
+        """
+        if self.is_visible or self.search_bar is None:
+            return
+
+        central = self.takeCentralWidget()
+        self.search_bar = None
+        if central is not None:
+            central.deleteLater()
+            # Flush the deferred delete now instead of on the next wake-up
+            QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+
+        if self.preview_panel is not None:
+            self.preview_panel.deleteLater()
+            self.preview_panel = None
+
+        QPixmapCache.clear()
+        self.save_usage_stats()
+
+    def restore_idle_resources(self):
+        """Rebuild whatever release_idle_resources tore down"""
+        self.build_ui()
+
     def quit_app(self):
         if hasattr(self, "tray_icon"):
             self.tray_icon.hide()
+        if self.browser_watcher is not None:
+            self.browser_watcher.stop()
+        self.scan_coordinator.cancel()
+        if self.dns_prefetcher is not None:
+            self.dns_prefetcher.shutdown()
+        if self.preview_client is not None:
+            self.preview_client.close()
+        self.save_usage_stats()
         QApplication.quit()
 
+    def on_text_changed(self, text):
+        if self.settings.get('dns_prefetch'):
+            self.prefetch_timer.start()
+        if self.history_index is not None:
+            self.show_local_results(text)
+        if self.settings.get('preview_endpoint') or self.plugin_registry.specs("suggestions", wait=False):
+            self.cancel_preview()
+            if self.preview_panel is not None:
+                # A selection made for the previous text must not survive an edit
+                self.preview_panel.setCurrentRow(-1)
+            self.preview_timer.start()
+
+    # ----- Result preview -----
+    def show_local_results(self, text):
+        """Match bookmarks and history synchronously, so they show on this keystroke"""
+        from preview import PreviewResult
+
+        if self.search_bar is None or not self.is_visible:
+            return
+        candidates = self.history_index.search(text)
+        self.local_results = [PreviewResult(c.title, c.url) for c in candidates]
+        self.render_preview()
+
+    def fetch_preview(self):
+        if self.search_bar is None:
+            return
+        query = self.search_bar.text()
+        if not query:
+            self.hide_preview()
+            return
+
+        if self.preview_client is None:
+            from preview import PreviewClient
+            self.preview_client = PreviewClient(
+                self.settings.get('preview_endpoint', ''), suggesters=[self.plugin_registry.suggest]
+            )
+        self.preview_request = self.preview_client.fetch(
+            query, lambda q, results: self.preview_ready.emit(q, results)
+        )
+
+    def show_preview(self, query, results):
+        from preview import normalize_query
+
+        # Drop answers for text that has since changed
+        if self.search_bar is None or not self.is_visible:
+            return
+        if normalize_query(query) != normalize_query(self.search_bar.text()):
+            return
+        self.remote_results = results
+        self.render_preview()
+
+    def render_preview(self):
+        """Show local matches for the current text on top of the latest remote results.
+
+        Remote results stay listed until the debounced fetch for the new text
+        replaces them, so the panel does not flicker between keystrokes.
+        """
+        if not self.search_bar.text().strip():
+            self.hide_preview()
+            return
+        urls = {result.url for result in self.local_results}
+        results = (self.local_results + [r for r in self.remote_results if r.url not in urls])[:8]
+        if not results:
+            if self.preview_panel is not None:
+                self.preview_panel.hide()
+            return
+
+        if self.preview_panel is None:
+            self.preview_panel = PreviewPanel(self)
+            self.preview_panel.itemClicked.connect(self.open_preview_item)
+        self.preview_panel.set_results(results)
+        self.preview_panel.place_under(self)
+        self.preview_panel.show()
+
+    def cancel_preview(self):
+        self.preview_timer.stop()
+        if self.preview_request is not None:
+            self.preview_request.cancel()
+            self.preview_request = None
+
+    def hide_preview(self):
+        self.cancel_preview()
+        self.local_results = []
+        self.remote_results = []
+        if self.preview_panel is not None:
+            self.preview_panel.hide()
+
+    def open_preview_item(self, item):
+        self.open_url(item.data(Qt.UserRole))
+        self.search_bar.clear()
+        self.hide_preview()
+
+    def eventFilter(self, obj, event):
+        # Up/Down in the search field walk the preview list
+        if (event.type() == QEvent.KeyPress and self.preview_panel is not None
+                and self.preview_panel.isVisible() and event.key() in (Qt.Key_Down, Qt.Key_Up)):
+            self.preview_panel.move_selection(1 if event.key() == Qt.Key_Down else -1)
+            return True
+        return super().eventFilter(obj, event)
+
+    # ----- DNS prefetch -----
+
+    def prefetch_typed_host(self):
+        """Warm the resolver cache for the domain currently typed"""
+        if self.search_bar is None:
+            return
+        host = search_core.extract_host(self.search_bar.text())
+        if not host:
+            return
+        if self.dns_prefetcher is None:
+            self.dns_prefetcher = DnsPrefetcher()
+        self.dns_prefetcher.prefetch(host)
+
     # ----- Browser detection -----
-    def get_available_browsers(self):
+    def get_available_browsers(self, cancel=None):
         """Find all installed browsers on Windows"""
-        browsers = {}
-
-        # Check for Microsoft Edge first (common default browser)
-        edge_paths = [
-            r"C:\Program Files (x86)\Microsoft\Edge\Application\msedge.exe",
-            r"C:\Program Files\Microsoft\Edge\Application\msedge.exe"
-        ]
-
-        for edge_path in edge_paths:
-            if os.path.exists(edge_path) and os.access(edge_path, os.X_OK):
-                browsers["Microsoft Edge"] = edge_path
-                break
-
-        # Common browser registry paths
-        registry_paths = [
-            (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Clients\StartMenuInternet"),
-            (winreg.HKEY_CURRENT_USER, r"SOFTWARE\Clients\StartMenuInternet"),
-            (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Microsoft\Windows\CurrentVersion\App Paths"),
-            (winreg.HKEY_CURRENT_USER, r"SOFTWARE\Microsoft\Windows\CurrentVersion\App Paths"),
-        ]
-
-        # Check registry for browsers
-        for root_key, path in registry_paths:
-            try:
-                with winreg.OpenKey(root_key, path) as key:
-                    i = 0
-                    while True:
-                        try:
-                            browser_name = winreg.EnumKey(key, i)
-                            browser_key_path = f"{path}\\{browser_name}\\shell\\open\\command"
-
-                            try:
-                                with winreg.OpenKey(root_key, browser_key_path) as browser_key:
-                                    browser_cmd, _ = winreg.QueryValueEx(browser_key, "")
-                                    # Extract the executable path from the command
-                                    exe_path = browser_cmd.split('"')[1] if '"' in browser_cmd else browser_cmd.split()[
-                                        0]
-                                    if os.path.exists(exe_path) and os.access(exe_path, os.X_OK):
-                                        browsers[browser_name] = exe_path
-                            except:
-                                pass
-
-                            i += 1
-                        except WindowsError:
-                            break
-            except:
-                pass
-
-        # Check common browser locations
-        program_dirs = [
-            os.environ.get("ProgramFiles", "C:\\Program Files"),
-            os.environ.get("ProgramFiles(x86)", "C:\\Program Files (x86)"),
-            os.path.expanduser("~\\AppData\\Local"),
-            os.path.expanduser("~\\AppData\\Roaming"),
-        ]
-
-        for program_dir in program_dirs:
-            if not os.path.exists(program_dir):
-                continue
-
-            for root, dirs, files in os.walk(program_dir):
-                for file in files:
-                    if file.lower() in BROWSER_DATABASE:
-                        exe_path = os.path.join(root, file)
-                        if os.path.exists(exe_path) and os.access(exe_path, os.X_OK):
-                            browser_name = BROWSER_DATABASE[file.lower()]
-                            # Don't override Edge if already found
-                            if browser_name not in browsers or browser_name != "Microsoft Edge":
-                                browsers[browser_name] = exe_path
-
-        return browsers
+        return search_core.get_available_browsers(cancel)
 
     # ----- Settings dialog -----
     def show_settings(self):
@@ -874,85 +1178,47 @@ class MainWindow(QMainWindow):
         if not query:
             return
 
-        if self.is_url(query):
+        # A highlighted preview opens that result directly
+        preview_url = self.preview_panel.selected_url() if self.preview_panel is not None else None
+        routed = None if preview_url else self.plugin_registry.dispatch(query)
+        if preview_url:
+            self.open_url(preview_url)
+            self.record_usage(query, "suggestion", preview_url)
+        elif routed is not None:
+            kind, target = routed
+            if kind != "handled":
+                self.launch(target, "Could not open URL" if kind == "url" else "Could not perform search")
+            self.record_usage(query, "action" if kind == "handled" else kind, target)
+        elif self.is_url(query):
             self.open_url(query)
+            self.record_usage(query, "url", search_core.normalize_url(query))
         else:
             self.web_search(query)
+            self.record_usage(query, "search", search_core.build_search_url(query))
 
         # Always clear after action
         self.search_bar.clear()
+        self.hide_preview()
 
     def is_url(self, text: str) -> bool:
         """Heuristic URL/domain detection with minimal false positives."""
-        t = text.strip().lower()
-
-        # Has a scheme?
-        if t.startswith(("http://", "https://", "ftp://", "file://")):
-            return True
-
-        # Spaces => not a URL
-        if " " in t:
-            return False
-
-        # www. prefix like www.example.com
-        if t.startswith("www.") and "." in t[4:]:
-            return True
-
-        # Bare domain with common TLDs
-        domain_exts = (
-            ".com", ".org", ".net", ".io", ".co", ".edu", ".gov",
-            ".info", ".biz", ".in", ".uk", ".us", ".xyz", ".app", ".dev", ".shop"
-        )
-        if "." in t:
-            # quick check for something like example.com or sub.example.in
-            parts = t.split(".")
-            if all(parts) and any(t.endswith(ext) for ext in domain_exts):
-                return True
-
-        return False
+        return search_core.is_url(text)
 
     def open_url(self, url: str):
         """Open URL; add http:// for bare domains."""
-        if not url.startswith(("http://", "https://", "ftp://", "file://")):
-            url = "http://" + url
-
-        # Use preferred browser if set and accessible
-        if (self.settings.get('preferred_browser') and
-                os.path.exists(self.settings['preferred_browser']) and
-                os.access(self.settings['preferred_browser'], os.X_OK)):
-            try:
-                subprocess.Popen([self.settings['preferred_browser'], url])
-                return
-            except Exception as e:
-                print(f"Error opening URL with preferred browser: {e}")
-
-        # Fallback to system default
-        try:
-            webbrowser.open(url)
-        except Exception as e:
-            print(f"Error opening URL: {e}")
-            QMessageBox.warning(self, "Error", f"Could not open URL: {e}")
+        self.launch(search_core.normalize_url(url), "Could not open URL")
 
     def web_search(self, query: str):
         """Open DuckDuckGo search using preferred browser or system default"""
-        search_url = f"https://duckduckgo.com/?q={urllib.parse.quote_plus(query)}"
-
-        # Use preferred browser if set and accessible
-        if (self.settings.get('preferred_browser') and
-                os.path.exists(self.settings['preferred_browser']) and
-                os.access(self.settings['preferred_browser'], os.X_OK)):
-            try:
-                subprocess.Popen([self.settings['preferred_browser'], search_url])
-                return
-            except Exception as e:
-                print(f"Error opening search with preferred browser: {e}")
-
-        # Fallback to system browser
+        self.launch(search_core.build_search_url(query), "Could not perform search")
+
+    def launch(self, url: str, error_text: str):
+        """Open url with the preferred browser, falling back to the system default"""
         try:
-            webbrowser.open(search_url)
+            self.launcher(url, self.settings.get('preferred_browser', ''))
         except Exception as e:
-            print(f"Error opening search: {e}")
-            QMessageBox.warning(self, "Error", f"Could not perform search: {e}")
+            log.error("Error opening URL: %s", e, extra={"url": url})
+            QMessageBox.warning(self, "Error", f"{error_text}: {e}")
 
     # ----- Drag to move -----
     def mousePressEvent(self, event):
@@ -974,12 +1240,15 @@ if __name__ == "__main__":
     if hasattr(Qt, "AA_UseHighDpiPixmaps"):
         QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
 
+    log_setup.setup_logging(search_core.load_settings().get('log_level', 'INFO'))
+
     app = QApplication(sys.argv)
     app.setQuitOnLastWindowClosed(False)
+    app.setWindowIcon(QIcon(resource_path("search.ico")))
 
     win = MainWindow()
     # Start hidden; toggle with Ctrl+Shift+H
     win.hide_search()
 
-    print("Desktop Search started. Press Ctrl+Shift+H to toggle.")
+    log.info("Desktop Search started. Press Ctrl+Shift+H to toggle.")
     sys.exit(app.exec_())
\ No newline at end of file
@@ -0,0 +1,504 @@
+"""
+Bookmarks and history imported from installed browsers.
+
+For every detected browser with a known profile location, HistoryIndex reads
+Chromium ``Bookmarks`` (JSON) and ``History`` (SQLite) files and Firefox
+``places.sqlite``. Databases are never opened in place: the file (and its
+``-wal`` journal) is copied to a temporary snapshot first, so a running
+browser's lock is never held or disturbed.
+
+Re-imports are incremental. A file whose mtime, size and ``-wal`` journal
+have not changed is skipped without being copied; for history tables only
+rows past the last imported row id, or visited since the last imported visit
+time, are read. A history table that has lost rows (history cleared, visits
+deleted) is re-read from scratch instead. Bookmarks are small and are re-read
+whole whenever their file changes, so renames and deletions are picked up.
+
+Rows from every browser are merged by URL (a bookmark keeps its own title
+but inherits the visit count and recency of its history entry). Bookmarks and
+history go into two ranking.make_index indexes, so search() can always list
+matching bookmarks first, however busy the history is. Re-imports append new
+URLs to the history index and update revisited ones in place; only the small
+bookmark index is rebuilt when bookmarks change.
+"""
+import logging
+import os
+import threading
+import time
+
+import ranking
+
+log = logging.getLogger(__name__)
+
+# Microseconds between 1601-01-01 (Chromium/WebKit epoch) and 1970-01-01
+WEBKIT_EPOCH_OFFSET_US = 11644473600 * 1000000
+
+# Browser name (as in search_core.BROWSER_DATABASE) -> (profile format, env var, user data path)
+PROFILE_ROOTS = {
+    "Google Chrome": ("chromium", "LOCALAPPDATA", ("Google", "Chrome", "User Data")),
+    "Microsoft Edge": ("chromium", "LOCALAPPDATA", ("Microsoft", "Edge", "User Data")),
+    "Brave": ("chromium", "LOCALAPPDATA", ("BraveSoftware", "Brave-Browser", "User Data")),
+    "Vivaldi": ("chromium", "LOCALAPPDATA", ("Vivaldi", "User Data")),
+    "Chromium": ("chromium", "LOCALAPPDATA", ("Chromium", "User Data")),
+    "Yandex Browser": ("chromium", "LOCALAPPDATA", ("Yandex", "YandexBrowser", "User Data")),
+    "Opera": ("chromium", "APPDATA", ("Opera Software", "Opera Stable")),
+    "Opera GX": ("chromium", "APPDATA", ("Opera Software", "Opera GX Stable")),
+    "Mozilla Firefox": ("firefox", "APPDATA", ("Mozilla", "Firefox", "Profiles")),
+    "Waterfox": ("firefox", "APPDATA", ("Waterfox", "Profiles")),
+}
+
+# Sources that are imported from one profile file
+CHROMIUM_BOOKMARKS = "chromium_bookmarks"
+CHROMIUM_HISTORY = "chromium_history"
+FIREFOX_PLACES = "firefox_places"
+
+# Highest id and number of the history rows the readers import, per source
+HISTORY_EXTENT_SQL = {
+    CHROMIUM_HISTORY: "SELECT COALESCE(MAX(id), 0), COUNT(*) FROM urls WHERE hidden = 0",
+    FIREFOX_PLACES: "SELECT COALESCE(MAX(id), 0), COUNT(*) FROM moz_places "
+                    "WHERE hidden = 0 AND visit_count > 0",
+}
+
+SKIP_SCHEMES = ("place:", "javascript:", "data:", "about:", "chrome:", "edge:")
+
+
+def webkit_to_unix(value):
+    """Chromium timestamp (microseconds since 1601) to Unix seconds"""
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        return 0.0
+    return max(0.0, (value - WEBKIT_EPOCH_OFFSET_US) / 1e6) if value else 0.0
+
+
+def _wanted(url):
+    return bool(url) and not url.startswith(SKIP_SCHEMES)
+
+
+# ---------- Profile discovery ----------
+def profile_sources(browsers, environ=None):
+    """[(source kind, file path)] for every profile file of the given browsers"""
+    environ = os.environ if environ is None else environ
+    sources = []
+    for name in browsers:
+        entry = PROFILE_ROOTS.get(name)
+        if entry is None:
+            continue
+        fmt, env_var, parts = entry
+        base = environ.get(env_var)
+        if not base:
+            continue
+        root = os.path.join(base, *parts)
+        if not os.path.isdir(root):
+            continue
+
+        if fmt == "chromium":
+            for profile in _chromium_profiles(root):
+                sources.append((CHROMIUM_BOOKMARKS, os.path.join(profile, "Bookmarks")))
+                sources.append((CHROMIUM_HISTORY, os.path.join(profile, "History")))
+        else:
+            for entry_name in sorted(os.listdir(root)):
+                sources.append((FIREFOX_PLACES, os.path.join(root, entry_name, "places.sqlite")))
+    return [(kind, path) for kind, path in sources if os.path.isfile(path)]
+
+
+def _chromium_profiles(root):
+    """User data folder -> profile folders ("Default", "Profile 1", ...)"""
+    # Opera keeps a single profile directly in its user data folder
+    if os.path.isfile(os.path.join(root, "History")) or os.path.isfile(os.path.join(root, "Bookmarks")):
+        return [root]
+    return [
+        os.path.join(root, entry) for entry in sorted(os.listdir(root))
+        if entry == "Default" or entry.startswith("Profile ")
+    ]
+
+
+# ---------- Snapshots ----------
+class Snapshot:
+    """Context manager yielding a private copy of a (possibly locked) profile file"""
+
+    def __init__(self, path):
+        self.path = path
+        self.folder = None
+
+    def __enter__(self):
+        import shutil
+        import tempfile
+
+        self.folder = tempfile.mkdtemp(prefix="desktop_search_import_")
+        copy = os.path.join(self.folder, os.path.basename(self.path))
+        try:
+            shutil.copyfile(self.path, copy)
+            # Recent Firefox writes may still be in the write-ahead log
+            if os.path.isfile(self.path + "-wal"):
+                shutil.copyfile(self.path + "-wal", copy + "-wal")
+        except BaseException:
+            self.__exit__(None, None, None)
+            raise
+        return copy
+
+    def __exit__(self, *exc):
+        import shutil
+
+        if self.folder is not None:
+            shutil.rmtree(self.folder, ignore_errors=True)
+            self.folder = None
+        return False
+
+
+def _file_stamp(path):
+    """Changes whenever path or its -wal journal is written"""
+    stat = os.stat(path)
+    try:
+        wal = os.stat(path + "-wal")
+    except OSError:
+        wal_stamp = None
+    else:
+        wal_stamp = (wal.st_mtime, wal.st_size)
+    # Browsers keep their databases in WAL mode: new rows land in the journal
+    # and the main file only changes when it is checkpointed
+    return stat.st_mtime, stat.st_size, wal_stamp
+
+
+def _connect(path):
+    import sqlite3
+
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA query_only = ON")
+    return conn
+
+
+# ---------- Readers ----------
+def read_chromium_bookmarks(path):
+    """[(title, url, last_used)] from a Chromium Bookmarks JSON file"""
+    import json
+
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    rows = []
+    stack = list(data.get("roots", {}).values())
+    while stack:
+        node = stack.pop()
+        if not isinstance(node, dict):
+            continue
+        if node.get("type") == "url":
+            url = node.get("url", "")
+            if _wanted(url):
+                used = node.get("date_last_used") or node.get("date_added")
+                rows.append((node.get("name") or url, url, webkit_to_unix(used)))
+        stack.extend(node.get("children", ()))
+    return rows
+
+
+def read_chromium_history(path, last_id=0, last_visit=0):
+    """New or revisited rows of a Chromium History database.
+
+    Returns ([(title, url, last_visit, visits)], max row id, max raw visit time).
+    """
+    conn = _connect(path)
+    try:
+        cursor = conn.execute(
+            "SELECT id, url, title, last_visit_time, visit_count FROM urls "
+            "WHERE (id > ? OR last_visit_time > ?) AND hidden = 0",
+            (last_id, last_visit),
+        )
+        rows = []
+        for row_id, url, title, visit_time, visits in cursor:
+            last_id = max(last_id, row_id)
+            last_visit = max(last_visit, visit_time or 0)
+            if _wanted(url):
+                rows.append((title or url, url, webkit_to_unix(visit_time), visits or 0))
+        return rows, last_id, last_visit
+    finally:
+        conn.close()
+
+
+def read_firefox_places(path, last_id=0, last_visit=0):
+    """All bookmarks plus new or revisited history of a Firefox places.sqlite.
+
+    Returns ([(title, url, last_used)], [(title, url, last_visit, visits)],
+    max place id, max raw visit time).
+    """
+    conn = _connect(path)
+    try:
+        bookmarks = [
+            (title or url, url, (visit_time or 0) / 1e6)
+            for title, url, visit_time in conn.execute(
+                "SELECT COALESCE(b.title, p.title), p.url, p.last_visit_date "
+                "FROM moz_bookmarks b JOIN moz_places p ON p.id = b.fk WHERE b.type = 1"
+            )
+            if _wanted(url)
+        ]
+
+        history = []
+        cursor = conn.execute(
+            "SELECT id, url, title, last_visit_date, visit_count FROM moz_places "
+            "WHERE (id > ? OR last_visit_date > ?) AND hidden = 0 AND visit_count > 0",
+            (last_id, last_visit),
+        )
+        for row_id, url, title, visit_time, visits in cursor:
+            last_id = max(last_id, row_id)
+            last_visit = max(last_visit, visit_time or 0)
+            if _wanted(url):
+                history.append((title or url, url, (visit_time or 0) / 1e6, visits or 0))
+        return bookmarks, history, last_id, last_visit
+    finally:
+        conn.close()
+
+
+def read_history_extent(path, kind):
+    """(max row id, row count) of the history a reader imports from path"""
+    conn = _connect(path)
+    try:
+        return conn.execute(HISTORY_EXTENT_SQL[kind]).fetchone()
+    finally:
+        conn.close()
+
+
+# ---------- Index ----------
+class HistoryIndex:
+    """Merged, ranked bookmarks and history of every detected browser"""
+
+    def __init__(self, half_life_days=14.0, environ=None, min_refresh_seconds=60.0):
+        self.half_life_days = half_life_days
+        self.environ = environ
+        # refresh_in_background() skips runs closer together than this unless forced
+        self.min_refresh_seconds = min_refresh_seconds
+        self.indexes = {}  # "bookmark" / "history" -> ranking index
+        self.import_ms = None
+
+        # Per source file: {"stamp", "last_id", "last_visit", "rows"}
+        self._state = {}
+        # Per source file: bookmarks {url: (title, last_used)} and history {url: (title, last_visit, visits)}
+        self._bookmarks = {}
+        self._history = {}
+        # Per index: {url: row number}, for in-place updates
+        self._positions = {"bookmark": {}, "history": {}}
+
+        self._lock = threading.Lock()  # serializes refresh()
+        self._index_lock = threading.Lock()  # index updates vs search()
+        self._thread = None
+        self._last_refresh = None
+
+    def __len__(self):
+        return sum(len(index) for index in self.indexes.values())
+
+    # ----- Importing -----
+    def refresh_in_background(self, browsers, on_done=None, force=False):
+        """Re-import on a daemon thread, unless one is running or one started
+        less than min_refresh_seconds ago (and force is not set)"""
+        if self._thread is not None and self._thread.is_alive():
+            return False
+        now = time.monotonic()
+        if not force and self._last_refresh is not None and now - self._last_refresh < self.min_refresh_seconds:
+            return False
+        self._last_refresh = now
+
+        def run():
+            changed = self.refresh(browsers)
+            if on_done is not None:
+                on_done(changed)
+
+        self._thread = threading.Thread(target=run, name="history-import")
+        self._thread.daemon = True
+        self._thread.start()
+        return True
+
+    def refresh(self, browsers):
+        """Import whatever changed since the last call; True if the indexes changed.
+
+        New URLs are appended to the history index and revisits update it in
+        place. Only the (small) bookmark index is rebuilt when a bookmark file
+        changes; both are rebuilt when a profile disappears or loses history.
+        """
+        with self._lock:
+            start = time.perf_counter()
+            sources = profile_sources(browsers, self.environ)
+            bookmarks_changed = False
+            reread = False
+            touched = set()
+
+            for kind, path in sources:
+                try:
+                    file_bookmarks_changed, file_reread, urls = self._import(kind, path)
+                except Exception as e:
+                    log.warning("Error importing browser data: %s", e, extra={"path": path})
+                    continue
+                bookmarks_changed |= file_bookmarks_changed
+                reread |= file_reread
+                touched |= urls
+
+            # Forget profiles (or browsers) that have gone away
+            live = {path for _, path in sources}
+            removed = [path for path in self._state if path not in live]
+            for path in removed:
+                self._drop(path)
+
+            # Rows cannot be taken out of an index, so deletions mean a rebuild
+            if removed or reread or not self.indexes:
+                self._rebuild("bookmark", "history")
+            else:
+                if bookmarks_changed:
+                    self._rebuild("bookmark")
+                if touched:
+                    self._apply_history(touched, update_bookmarks=not bookmarks_changed)
+
+            changed = bool(removed or reread or bookmarks_changed or touched)
+            self.import_ms = (time.perf_counter() - start) * 1000
+            log.info("Imported browser history", extra={
+                "sources": len(sources), "rows": len(self), "changed_urls": len(touched),
+                "import_ms": round(self.import_ms, 1),
+            })
+            return changed
+
+    def _import(self, kind, path):
+        """(bookmarks changed?, history re-read from scratch?, URLs with new history)
+        for one profile file"""
+        stamp = _file_stamp(path)
+        state = self._state.get(path)
+        if state is not None and state["stamp"] == stamp:
+            return False, False, set()
+        state = dict(state or {"last_id": 0, "last_visit": 0, "rows": 0}, stamp=stamp)
+
+        reread = False
+        with Snapshot(path) as copy:
+            if kind in HISTORY_EXTENT_SQL:
+                max_id, rows = read_history_extent(copy, kind)
+                if max_id < state["last_id"] or rows < state["rows"]:
+                    # History was cleared or visits deleted; start over
+                    reread = True
+                    state.update(last_id=0, last_visit=0)
+                state["rows"] = rows
+            if kind == CHROMIUM_BOOKMARKS:
+                bookmarks, history = read_chromium_bookmarks(copy), []
+            elif kind == CHROMIUM_HISTORY:
+                bookmarks = None
+                history, state["last_id"], state["last_visit"] = read_chromium_history(
+                    copy, state["last_id"], state["last_visit"]
+                )
+            else:
+                bookmarks, history, state["last_id"], state["last_visit"] = read_firefox_places(
+                    copy, state["last_id"], state["last_visit"]
+                )
+
+        bookmarks_changed = False
+        if bookmarks is not None:
+            bookmarks = {url: (title, used) for title, url, used in bookmarks}
+            bookmarks_changed = bookmarks != self._bookmarks.get(path, {})
+            self._bookmarks[path] = bookmarks
+        known = {} if reread else self._history.get(path, {})
+        for title, url, last_visit, visits in history:
+            known[url] = (title, last_visit, visits)
+        self._history[path] = known
+        self._state[path] = state
+        return bookmarks_changed, reread, {url for _, url, _, _ in history}
+
+    def _drop(self, path):
+        self._state.pop(path, None)
+        self._bookmarks.pop(path, None)
+        self._history.pop(path, None)
+
+    # ----- Rows -----
+    def _merged(self, url):
+        """(title, last_visit, visits) of url summed across browsers, or None"""
+        merged = None
+        for entries in self._history.values():
+            entry = entries.get(url)
+            if entry is None:
+                continue
+            merged = entry if merged is None else (merged[0], max(merged[1], entry[1]), merged[2] + entry[2])
+        return merged
+
+    def _bookmark_map(self):
+        merged = {}
+        for entries in self._bookmarks.values():
+            merged.update(entries)
+        return merged
+
+    def _rows(self, source):
+        """One (title, url, source, last_visit, visits) row per URL across browsers.
+
+        Bookmarks keep their own title but take the activity of their history
+        entry; the history rows include bookmarked URLs (search() dedupes).
+        """
+        if source == "bookmark":
+            rows = []
+            for url, (title, used) in self._bookmark_map().items():
+                _, last_visit, visits = self._merged(url) or (None, 0.0, 0)
+                rows.append((title, url, "bookmark", max(used, last_visit), visits))
+            return rows
+
+        urls = {}
+        for entries in self._history.values():
+            urls.update(dict.fromkeys(entries))
+        return [(title, url, "history", last_visit, visits)
+                for url in urls for title, last_visit, visits in [self._merged(url)]]
+
+    # ----- Index maintenance -----
+    def _rebuild(self, *sources):
+        """Build fresh indexes for sources, then swap them in together"""
+        built = {}
+        for source in sources:
+            rows = self._rows(source)
+            index = ranking.make_index(rows, self.half_life_days)
+            index.top_k("", 1)  # Materialize here rather than on the first keystroke
+            built[source] = (index, {row[1]: i for i, row in enumerate(rows)})
+
+        with self._index_lock:
+            old = [self.indexes.get(source) for source in sources]
+            self.indexes = dict(self.indexes, **{source: index for source, (index, _) in built.items()})
+            for source, (_, positions) in built.items():
+                self._positions[source] = positions
+        # No search can still be using them: searches hold the index lock
+        for index in old:
+            if index is not None and hasattr(index, "close"):
+                index.close()
+
+    def _apply_history(self, urls, update_bookmarks=True):
+        """Append new URLs to the history index and update revisited ones in place"""
+        history_index = self.indexes["history"]
+        if not hasattr(history_index, "set_activity"):
+            # Process-sharded indexes are built once; rebuild instead
+            self._rebuild(*(("history", "bookmark") if update_bookmarks else ("history",)))
+            return
+
+        bookmarks = self._bookmark_map() if update_bookmarks else {}
+        new_rows = []
+        updates = {"bookmark": [], "history": []}
+        for url in urls:
+            merged = self._merged(url)
+            if merged is None:
+                continue
+            title, last_visit, visits = merged
+            row = self._positions["history"].get(url)
+            if row is None:
+                new_rows.append((title, url, "history", last_visit, visits))
+            else:
+                updates["history"].append((row, last_visit, visits))
+            row = self._positions["bookmark"].get(url)
+            if row is not None and url in bookmarks:
+                updates["bookmark"].append((row, max(bookmarks[url][1], last_visit), visits))
+
+        with self._index_lock:
+            positions = self._positions["history"]
+            for row in new_rows:
+                positions[row[1]] = len(positions)
+            history_index.extend(new_rows)
+            for source, source_updates in updates.items():
+                self.indexes[source].set_activity(source_updates)
+            history_index.top_k("", 1)  # Fold new rows in now, not on the next keystroke
+
+    # ----- Lookup -----
+    def search(self, query, k=8):
+        """Best matches as ranking.Candidate, bookmarks first"""
+        if not query.strip():
+            return []
+        with self._index_lock:
+            indexes = self.indexes
+            if not indexes:
+                return []
+            bookmarks = indexes["bookmark"].top_k(query, k)
+            history = indexes["history"].top_k(query, k)
+        shown = {c.url for c in bookmarks}
+        return (bookmarks + [c for c in history if c.url not in shown])[:k]
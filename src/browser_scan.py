@@ -0,0 +1,71 @@
+"""
+Single-flight coordination of full browser scans.
+
+Startup, the settings dialog and its Refresh button all want a fresh browser
+list. Rather than each starting its own walk of the install roots, they ask
+the coordinator, which runs at most one scan at a time and hands every caller
+the same future. Results (from scans and from the live watcher) are published
+under one lock so the in-memory dict and the cache file are updated together.
+"""
+import threading
+from concurrent.futures import Future
+
+import search_core
+
+
+class ScanCoordinator:
+    def __init__(self, cache_file=search_core.BROWSER_CACHE_FILE,
+                 scan=search_core.get_available_browsers, on_publish=None):
+        self.cache_file = cache_file
+        self.scan = scan
+        self.on_publish = on_publish
+
+        self._lock = threading.Lock()  # guards _future/_cancel
+        self._publish_lock = threading.Lock()  # serializes publish()
+        self._future = None
+        self._cancel = None
+
+    def request_scan(self):
+        """Future for the in-flight scan, starting one if none is running"""
+        with self._lock:
+            if self._future is not None and not self._future.done():
+                return self._future
+
+            future = Future()
+            future.set_running_or_notify_cancel()
+            cancel = threading.Event()
+            self._future, self._cancel = future, cancel
+
+        thread = threading.Thread(target=self._run, args=(future, cancel), name="browser-scan")
+        thread.daemon = True
+        thread.start()
+        return future
+
+    def in_flight(self):
+        with self._lock:
+            return self._future is not None and not self._future.done()
+
+    def cancel(self):
+        """Ask the in-flight scan to stop; its future fails with ScanCancelled"""
+        with self._lock:
+            if self._cancel is not None:
+                self._cancel.set()
+
+    def publish(self, browsers):
+        """Atomically replace the published browser dict and the cache file"""
+        browsers = dict(browsers)
+        with self._publish_lock:
+            search_core.save_browser_cache(browsers, self.cache_file)
+            if self.on_publish is not None:
+                self.on_publish(browsers)
+
+    def _run(self, future, cancel):
+        try:
+            browsers = self.scan(cancel)
+            if cancel.is_set():
+                raise search_core.ScanCancelled()
+            self.publish(browsers)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(browsers)
@@ -0,0 +1,248 @@
+"""
+Live watching of the browser install roots.
+
+Instead of walking every install root again, the watcher keeps an index of
+which top-level folder under each root (e.g. "C:\\Program Files\\Google")
+holds which browsers, and when something changes under a folder it rescans
+only that folder, a few levels deep. Folders that churn constantly (Temp,
+Packages, ...) are ignored unless they already hold a browser. Changes are
+picked up with native notifications when the optional ``watchdog`` package is
+installed, otherwise by polling a cheap listing of the roots' top-level
+folders.
+"""
+import logging
+import os
+import threading
+
+import search_core
+
+log = logging.getLogger(__name__)
+
+# Folder levels below a top-level folder that an incremental rescan enters;
+# executables sit at most this deep (Google\Chrome\Application\chrome.exe)
+RESCAN_DEPTH = 3
+
+# Top-level folders that change all the time and never hold a browser install
+NOISY_FOLDERS = frozenset({"temp", "packages", "crashdumps", "d3dscache"})
+
+
+class BrowserWatcher:
+    """Keep a {name: path} browser dict current without full rescans.
+
+    on_change(browsers, added, removed) is called from the watcher thread
+    with a fresh dict whenever a rescan changes the result.
+    """
+
+    def __init__(self, browsers, on_change, roots=None, poll_interval=30.0, settle=2.0):
+        self.on_change = on_change
+        self.roots = [os.path.normcase(os.path.abspath(r))
+                      for r in (roots if roots is not None else search_core.browser_install_roots())]
+        self.poll_interval = poll_interval
+        self.settle = settle
+
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._dirty = set()
+        self._observer = None
+        self._thread = None
+        self._listing = {}
+
+        self.reset(browsers)
+
+    # ----- Index -----
+    def reset(self, browsers):
+        """Rebuild the index from a full scan result"""
+        static = {}
+        entries = {}
+        for name, path in browsers.items():
+            top = self.top_dir(path)
+            if top is None:
+                static[name] = path
+            else:
+                entries.setdefault(top, {})[name] = path
+
+        with self._lock:
+            self._static = static
+            self._entries = entries
+            self._browsers = dict(browsers)
+
+    def browsers(self):
+        with self._lock:
+            return dict(self._browsers)
+
+    def top_dir(self, path):
+        """Top-level folder under a watched root that contains path, or None"""
+        path = os.path.normcase(os.path.abspath(path))
+        for root in self.roots:
+            prefix = root.rstrip(os.sep) + os.sep
+            if path.startswith(prefix):
+                first = path[len(prefix):].split(os.sep, 1)[0]
+                return os.path.join(root, first) if first else None
+        return None
+
+    # ----- Lifecycle -----
+    def start(self):
+        if self._thread is not None:
+            return
+        self._listing = {root: self._list_root(root) for root in self.roots}
+        self._observer = self._start_native()
+
+        self._thread = threading.Thread(target=self._run, name="browser-watch")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        self._wake.set()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer = None
+
+    @property
+    def native(self):
+        return self._observer is not None
+
+    def mark_dirty(self, path):
+        """Schedule a rescan of the top-level folder containing path"""
+        top = self.top_dir(path)
+        if top is None:
+            return
+        with self._lock:
+            if self._is_noisy(top):
+                return
+            self._dirty.add(top)
+        self._wake.set()
+
+    def _is_noisy(self, top):
+        """Known churn folder without a browser in it; call with the lock held"""
+        return os.path.basename(top).lower() in NOISY_FOLDERS and top not in self._entries
+
+    def _rescan_depth(self, top):
+        """RESCAN_DEPTH, or deeper if the full scan found a browser further down"""
+        with self._lock:
+            paths = list(self._entries.get(top, {}).values())
+        return max([RESCAN_DEPTH] + [_depth_below(top, path) for path in paths])
+
+    # ----- Change detection -----
+    def _start_native(self):
+        try:
+            from watchdog.observers import Observer
+            from watchdog.events import FileSystemEventHandler
+        except ImportError:
+            return None
+
+        watcher = self
+
+        class Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                for path in (event.src_path, getattr(event, "dest_path", "")):
+                    if path and watcher._is_relevant(path, event.is_directory):
+                        watcher.mark_dirty(path)
+
+        try:
+            observer = Observer()
+            for root in self.roots:
+                if os.path.isdir(root):
+                    observer.schedule(Handler(), root, recursive=True)
+            observer.daemon = True
+            observer.start()
+            return observer
+        except Exception as e:
+            log.warning("Native browser watching unavailable, polling instead: %s", e)
+            return None
+
+    def _is_relevant(self, path, is_directory):
+        """Browser executables a rescan would find, and the top-level folders themselves"""
+        top = self.top_dir(path)
+        if top is None:
+            return False
+        if is_directory:
+            return os.path.normcase(os.path.abspath(path)) == top
+        if os.path.basename(path).lower() not in search_core.BROWSER_DATABASE:
+            return False
+        return _depth_below(top, path) <= self._rescan_depth(top)
+
+    def _list_root(self, root):
+        """{top-level folder: mtime} for root; cheap, no recursion"""
+        listing = {}
+        try:
+            with os.scandir(root) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            listing[os.path.normcase(entry.path)] = entry.stat(follow_symlinks=False).st_mtime
+                    except OSError:
+                        pass
+        except OSError:
+            pass
+        return listing
+
+    def _poll(self):
+        for root in self.roots:
+            listing = self._list_root(root)
+            previous = self._listing.get(root, {})
+            for top in set(listing) | set(previous):
+                if listing.get(top) != previous.get(top):
+                    self.mark_dirty(top)
+            self._listing[root] = listing
+
+        # Executables removed deep inside a folder do not touch its mtime
+        with self._lock:
+            known = [(top, path) for top, found in self._entries.items() for path in found.values()]
+        for top, path in known:
+            if not search_core.is_browser_accessible(path):
+                self.mark_dirty(top)
+
+    def _run(self):
+        while not self._stopped.is_set():
+            with self._lock:
+                pending = bool(self._dirty)
+            timeout = self.settle if pending else (None if self.native else self.poll_interval)
+
+            woke = self._wake.wait(timeout)
+            self._wake.clear()
+            if self._stopped.is_set():
+                break
+            if woke:
+                # Something changed; wait until installers go quiet for `settle`
+                continue
+
+            if pending:
+                self._rescan_dirty()
+            elif not self.native:
+                self._poll()
+
+    def _rescan_dirty(self):
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+        if not dirty:
+            return
+
+        results = {top: search_core.scan_browser_dir(top, max_depth=self._rescan_depth(top))
+                   for top in dirty}
+
+        with self._lock:
+            for top, found in results.items():
+                if found:
+                    self._entries[top] = found
+                else:
+                    self._entries.pop(top, None)
+
+            browsers = dict(self._static)
+            for top in sorted(self._entries):
+                search_core.merge_browsers(browsers, self._entries[top])
+
+            added = {n: p for n, p in browsers.items() if self._browsers.get(n) != p}
+            removed = {n: p for n, p in self._browsers.items() if n not in browsers}
+            self._browsers = browsers
+
+        if added or removed:
+            log.info("Browsers changed", extra={"added": ", ".join(added), "removed": ", ".join(removed)})
+            self.on_change(dict(browsers), added, removed)
+
+
+def _depth_below(top, path):
+    """Folder levels between top and the file at path (0 when directly inside)"""
+    rel = os.path.relpath(os.path.dirname(os.path.normcase(os.path.abspath(path))), top)
+    return 0 if rel == os.curdir else rel.count(os.sep) + 1
@@ -0,0 +1,98 @@
+"""
+Speculative DNS pre-resolution for hostnames typed into the search bar.
+
+Lookups run on a small fixed thread pool so the caller (the GUI thread) never
+blocks, and results are remembered in an LRU cache with a TTL so the same
+host is not resolved again on every keystroke. The only point is to warm the
+OS resolver cache before the browser is launched; results are not used.
+"""
+import socket
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+
+def system_resolver(host):
+    """Resolve host through the OS resolver"""
+    return socket.getaddrinfo(host, 443, type=socket.SOCK_STREAM)
+
+
+class DnsPrefetcher:
+    """Bounded background resolver with an LRU/TTL cache.
+
+    resolver is any callable taking a hostname; it is swapped for a stub in
+    tests and benchmarks. At most max_workers threads exist and at most
+    max_pending lookups are queued; extra requests are dropped, not queued.
+    """
+
+    def __init__(self, resolver=system_resolver, max_workers=2, max_pending=8,
+                 cache_size=256, ttl=60.0, negative_ttl=10.0, clock=time.monotonic):
+        self.resolver = resolver
+        self.max_pending = max_pending
+        self.cache_size = cache_size
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.clock = clock
+
+        self._cache = OrderedDict()  # host -> expiry time
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="dns-prefetch")
+
+    def prefetch(self, host):
+        """Queue a lookup for host unless it is cached or already pending.
+
+        Returns True if a lookup was queued. Never blocks on the resolver.
+        """
+        if not host:
+            return False
+        host = host.lower()
+
+        with self._lock:
+            if self._is_fresh(host) or host in self._pending:
+                return False
+            if len(self._pending) >= self.max_pending:
+                return False
+            self._pending.add(host)
+
+        try:
+            self._executor.submit(self._resolve, host)
+        except RuntimeError:
+            # Executor already shut down
+            with self._lock:
+                self._pending.discard(host)
+            return False
+        return True
+
+    def is_cached(self, host):
+        """True if host was resolved (or failed) within its TTL"""
+        with self._lock:
+            return self._is_fresh(host.lower())
+
+    def shutdown(self, wait=False):
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _is_fresh(self, host):
+        expiry = self._cache.get(host)
+        if expiry is None:
+            return False
+        if expiry <= self.clock():
+            del self._cache[host]
+            return False
+        self._cache.move_to_end(host)
+        return True
+
+    def _resolve(self, host):
+        try:
+            self.resolver(host)
+            ttl = self.ttl
+        except Exception:
+            ttl = self.negative_ttl
+
+        with self._lock:
+            self._pending.discard(host)
+            self._cache[host] = self.clock() + ttl
+            self._cache.move_to_end(host)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
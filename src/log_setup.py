@@ -0,0 +1,164 @@
+"""
+Structured, non-blocking logging.
+
+Every record is kept in a bounded in-memory ring buffer (for the tray's
+"Recent Logs" view) and handed to a background QueueListener that writes
+JSON lines to a rotating file, and to stderr when a console is attached. The
+calling thread only ever appends to a deque and does a non-blocking queue
+put; if the writer falls behind, records are dropped from the file (never
+from the ring buffer) instead of stalling the GUI thread.
+"""
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+import time
+from collections import deque
+
+LOG_FILE = os.path.join(os.path.expanduser("~"), ".desktop_search.log")
+
+# LogRecord attributes that are not user-supplied `extra` fields
+_RESERVED = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+_ring = None
+_listener = None
+
+
+def record_fields(record):
+    """Structured view of a record: standard fields plus any `extra` values"""
+    fields = {
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(record.created))
+                + f".{int(record.msecs):03d}",
+        "level": record.levelname,
+        "logger": record.name,
+        "thread": record.threadName,
+        "message": record.getMessage(),
+    }
+    for key, value in vars(record).items():
+        if key not in _RESERVED and not key.startswith("_"):
+            fields[key] = value if isinstance(value, (str, int, float, bool, type(None))) else repr(value)
+    if record.exc_info:
+        fields["exception"] = logging.Formatter().formatException(record.exc_info)
+    return fields
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        return json.dumps(record_fields(record), ensure_ascii=False)
+
+
+class RingBufferHandler(logging.Handler):
+    """Keeps the last `capacity` records as structured dicts"""
+
+    def __init__(self, capacity=500):
+        super().__init__()
+        self.records = deque(maxlen=capacity)
+
+    def emit(self, record):
+        try:
+            self.records.append(record_fields(record))
+        except Exception:
+            self.handleError(record)
+
+    def recent(self, count=None):
+        records = list(self.records)
+        return records if count is None else records[-count:]
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that drops records instead of blocking when the queue is full"""
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+        self._lock_dropped = threading.Lock()
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._lock_dropped:
+                self.dropped += 1
+
+
+def setup_logging(level="INFO", log_file=LOG_FILE, max_bytes=1024 * 1024, backups=3,
+                  ring_size=500, queue_size=10000):
+    """Install the ring buffer and background file writer on the root logger.
+
+    Safe to call again (e.g. after the level setting changes); handlers are
+    only installed once.
+    """
+    global _ring, _listener
+
+    root = logging.getLogger()
+    set_level(level)
+    if _ring is not None:
+        return _ring
+
+    _ring = RingBufferHandler(ring_size)
+    root.addHandler(_ring)
+
+    targets = []
+    try:
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_file, maxBytes=max_bytes, backupCount=backups, encoding="utf-8", delay=True
+        )
+        file_handler.setFormatter(JsonFormatter())
+        targets.append(file_handler)
+    except Exception as e:
+        root.warning("Log file unavailable: %s", e, extra={"path": log_file})
+
+    # Windowed (frozen) builds have no console; sys.stderr is None there
+    if sys.stderr is not None:
+        console = logging.StreamHandler(sys.stderr)
+        console.setFormatter(logging.Formatter("%(levelname)s %(name)s: %(message)s"))
+        targets.append(console)
+
+    if targets:
+        log_queue = queue.Queue(queue_size)
+        root.addHandler(DroppingQueueHandler(log_queue))
+        _listener = logging.handlers.QueueListener(log_queue, *targets, respect_handler_level=True)
+        _listener.start()
+        atexit.register(shutdown_logging)
+
+    return _ring
+
+
+def set_level(level):
+    """Apply a level name ('DEBUG', 'INFO', ...) or number to the root logger"""
+    if isinstance(level, str):
+        level = logging.getLevelName(level.upper())
+    if not isinstance(level, int):
+        level = logging.INFO
+    logging.getLogger().setLevel(level)
+
+
+def recent_records(count=None):
+    """Most recent structured records from the ring buffer (oldest first)"""
+    return _ring.recent(count) if _ring is not None else []
+
+
+def format_records(records):
+    lines = []
+    for fields in records:
+        extra = {k: v for k, v in fields.items()
+                 if k not in ("time", "level", "logger", "thread", "message", "exception")}
+        line = f"{fields['time']} {fields['level']:<7} {fields['logger']}: {fields['message']}"
+        if extra:
+            line += "  " + " ".join(f"{k}={v}" for k, v in extra.items())
+        lines.append(line)
+        if "exception" in fields:
+            lines.append(fields["exception"])
+    return "\n".join(lines)
+
+
+def shutdown_logging():
+    """Flush and stop the background writer"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
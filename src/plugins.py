@@ -0,0 +1,279 @@
+"""
+Lazy-loaded plugins for query classifiers, search engines, suggestion
+providers and actions.
+
+Plugins are discovered from two places, reading metadata only:
+
+* entry points in the ``desktop_search.classifiers``, ``desktop_search.engines``,
+  ``desktop_search.suggestions`` and ``desktop_search.actions`` groups; the
+  entry point name is the plugin's keyword;
+* plugin folders (``~/.desktop_search_plugins`` plus the ``plugin_dirs``
+  setting), one sub-folder per plugin with a ``plugin.json`` manifest::
+
+      {"name": "wiki", "kind": "engine", "module": "wiki.py", "attr": "search",
+       "keywords": ["w"], "pattern": "optional regex a query must match"}
+
+Nothing is imported until a query needs it: ``!kw terms`` loads the engine
+with that keyword, ``>kw args`` the action, and classifiers and suggestion
+providers load on the first query matching their ``pattern`` (or the first
+query at all when they have none). Plugin contracts:
+
+* classifier(query) -> ("url" | "search", target URL) or None to pass
+* engine(query) -> search URL; a plain string attr is used as a {query} template
+* suggestions(query) -> iterable of (title, url)
+* action(args) -> URL to open, or None when the action handled the query
+"""
+import logging
+import os
+import sys
+import threading
+import time
+
+KINDS = ("classifier", "engine", "suggestions", "action")
+
+ENTRY_POINT_GROUPS = {
+    "desktop_search.classifiers": "classifier",
+    "desktop_search.engines": "engine",
+    "desktop_search.suggestions": "suggestions",
+    "desktop_search.actions": "action",
+}
+
+PLUGINS_DIR = os.path.join(os.path.expanduser("~"), ".desktop_search_plugins")
+
+log = logging.getLogger(__name__)
+
+ENGINE_SIGIL = "!"
+ACTION_SIGIL = ">"
+
+
+class PluginSpec:
+    """Metadata for one plugin; load() imports it on first use"""
+
+    def __init__(self, name, kind, target, keywords=(), pattern=None, path=None):
+        self.name = name
+        self.kind = kind
+        self.target = target  # "module:attr" (entry points) or "file.py:attr" (folders)
+        self.keywords = [k.lower() for k in keywords]
+        self.pattern = pattern
+        self.path = path
+        self.load_ms = None
+        self.error = None
+        self._obj = None
+        self._regex = None
+        self._lock = threading.Lock()
+
+    def matches(self, query):
+        if not self.pattern:
+            return True
+        if self._regex is None:
+            import re
+            self._regex = re.compile(self.pattern, re.I)
+        return self._regex.search(query) is not None
+
+    def load(self):
+        """Import the plugin object, timing it; returns None if loading fails"""
+        with self._lock:
+            if self._obj is not None or self.error is not None:
+                return self._obj
+
+            start = time.perf_counter()
+            try:
+                self._obj = self._import()
+            except Exception as e:
+                self.error = e
+                log.exception("Error loading plugin %s", self.name, extra={"plugin_kind": self.kind})
+            self.load_ms = (time.perf_counter() - start) * 1000
+            if self.error is None:
+                log.info("Loaded plugin %s", self.name,
+                         extra={"plugin_kind": self.kind, "load_ms": round(self.load_ms, 2)})
+            return self._obj
+
+    def _import(self):
+        import importlib
+
+        module_name, _, attr = self.target.partition(":")
+        if self.path is None:
+            module = importlib.import_module(module_name)
+        else:
+            import importlib.util
+
+            file_path = os.path.join(self.path, module_name)
+            unique = f"desktop_search_plugin_{self.name}"
+            spec = importlib.util.spec_from_file_location(unique, file_path)
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[unique] = module
+            spec.loader.exec_module(module)
+
+        obj = module
+        for part in filter(None, attr.split(".")):
+            obj = getattr(obj, part)
+        return obj
+
+
+class PluginRegistry:
+    def __init__(self, plugin_dirs=None, use_entry_points=True):
+        self.plugin_dirs = [PLUGINS_DIR] + list(plugin_dirs or [])
+        self.use_entry_points = use_entry_points
+        self.discover_ms = None
+        self._specs = None
+        self._lock = threading.Lock()
+
+    # ----- Discovery -----
+    def discover_in_background(self):
+        """Read plugin metadata on a daemon thread so the first query does not wait"""
+        thread = threading.Thread(target=self.specs, name="plugin-discovery")
+        thread.daemon = True
+        thread.start()
+
+    def specs(self, kind=None, wait=True):
+        """Discovered plugins (discovering on first call), optionally of one kind.
+
+        With wait=False nothing is returned until discovery has finished,
+        instead of blocking on it; for per-keystroke checks on the GUI thread.
+        """
+        if self._specs is None:
+            if not wait:
+                return []
+            with self._lock:
+                if self._specs is None:
+                    start = time.perf_counter()
+                    self._specs = self._discover()
+                    self.discover_ms = (time.perf_counter() - start) * 1000
+        if kind is None:
+            return list(self._specs)
+        return [spec for spec in self._specs if spec.kind == kind]
+
+    def _discover(self):
+        specs = []
+        if self.use_entry_points:
+            specs.extend(self._entry_point_specs())
+        for folder in self.plugin_dirs:
+            specs.extend(self._folder_specs(folder))
+        return specs
+
+    def _entry_point_specs(self):
+        try:
+            from importlib.metadata import entry_points
+            eps = entry_points()
+        except Exception as e:
+            log.error("Error reading plugin entry points: %s", e)
+            return []
+
+        specs = []
+        for group, kind in ENTRY_POINT_GROUPS.items():
+            selected = eps.select(group=group) if hasattr(eps, "select") else eps.get(group, [])
+            for ep in selected:
+                specs.append(PluginSpec(ep.name, kind, ep.value, keywords=[ep.name]))
+        return specs
+
+    def _folder_specs(self, folder):
+        import json
+
+        specs = []
+        if not os.path.isdir(folder):
+            return specs
+
+        for entry in sorted(os.listdir(folder)):
+            manifest = os.path.join(folder, entry, "plugin.json")
+            if not os.path.isfile(manifest):
+                continue
+            try:
+                with open(manifest, 'r') as f:
+                    meta = json.load(f)
+                kind = meta["kind"]
+                if kind not in KINDS:
+                    raise ValueError(f"unknown kind {kind!r}")
+                specs.append(PluginSpec(
+                    meta.get("name", entry), kind,
+                    f"{meta.get('module', 'plugin.py')}:{meta.get('attr', '')}",
+                    keywords=meta.get("keywords", []),
+                    pattern=meta.get("pattern"),
+                    path=os.path.dirname(manifest),
+                ))
+            except Exception as e:
+                log.error("Error reading plugin manifest: %s", e, extra={"path": manifest})
+        return specs
+
+    # ----- Dispatch -----
+    def dispatch(self, query):
+        """Route query through plugins.
+
+        Returns ("url" | "search", target), ("handled", None) when an action
+        dealt with it, or None to fall back to the built-in classification.
+        """
+        query = query.strip()
+
+        for sigil, kind in ((ENGINE_SIGIL, "engine"), (ACTION_SIGIL, "action")):
+            if query.startswith(sigil):
+                keyword, _, rest = query[len(sigil):].partition(" ")
+                spec = self._by_keyword(kind, keyword.lower())
+                if spec is not None:
+                    return self._run_keyword(spec, rest.strip())
+
+        for spec in self.specs("classifier"):
+            if not spec.matches(query):
+                continue
+            classifier = spec.load()
+            if classifier is None:
+                continue
+            try:
+                result = classifier(query)
+            except Exception:
+                log.exception("Error in classifier plugin %s", spec.name)
+                continue
+            if result:
+                return result
+        return None
+
+    def suggest(self, query):
+        """(title, url) suggestions from every provider matching query"""
+        results = []
+        for spec in self.specs("suggestions"):
+            if not spec.matches(query):
+                continue
+            provider = spec.load()
+            if provider is None:
+                continue
+            try:
+                results.extend((str(title), str(url)) for title, url in provider(query))
+            except Exception:
+                log.exception("Error in suggestion plugin %s", spec.name)
+        return results
+
+    def _by_keyword(self, kind, keyword):
+        for spec in self.specs(kind):
+            if keyword in spec.keywords:
+                return spec
+        return None
+
+    def _run_keyword(self, spec, rest):
+        obj = spec.load()
+        if obj is None:
+            return None
+        try:
+            if spec.kind == "engine":
+                if isinstance(obj, str):
+                    from urllib.parse import quote_plus
+                    return "search", obj.format(query=quote_plus(rest))
+                return "search", obj(rest)
+
+            target = obj(rest)
+            return ("url", target) if target else ("handled", None)
+        except Exception:
+            log.exception("Error in %s plugin %s", spec.kind, spec.name)
+            return None
+
+    # ----- Profiling -----
+    def load_times(self):
+        """{plugin name: milliseconds spent importing it} for loaded plugins"""
+        return {spec.name: spec.load_ms for spec in self.specs() if spec.load_ms is not None}
+
+    def profile_lines(self):
+        specs = self.specs()
+        lines = [f"plugin discovery: {self.discover_ms:.2f} ms ({len(specs)} found)"]
+        for spec in specs:
+            status = "not loaded" if spec.load_ms is None else f"{spec.load_ms:.2f} ms"
+            if spec.error is not None:
+                status += f" (failed: {spec.error})"
+            lines.append(f"{spec.kind:<12}{spec.name:<24}{status}")
+        return lines
@@ -0,0 +1,312 @@
+"""
+Inline search-result previews.
+
+PreviewClient fetches results for a query from a configurable endpoint (a
+URL template with a ``{query}`` placeholder returning JSON or HTML), reusing
+keep-alive connections from a small pool (idle ones are dropped after a few
+seconds, and a request that finds its reused connection closed by the server
+is retried once on a fresh one) and caching parsed results by the
+normalized query with a TTL. Background fetches return a handle whose
+cancel() drops the result and closes the connection, so a stale query never
+reaches the UI. Qt-free; the GUI wires callbacks to signals.
+"""
+import html
+import json
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote_plus, urlsplit, parse_qs
+
+log = logging.getLogger(__name__)
+
+# Raised when a pooled connection was closed by the server while it sat idle
+STALE_CONNECTION_ERRORS = (ConnectionResetError, ConnectionAbortedError, BrokenPipeError)
+
+PreviewResult = namedtuple("PreviewResult", "title url")
+
+DEFAULT_ENDPOINT = "https://html.duckduckgo.com/html/?q={query}"
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) DesktopSearch"
+
+_RESULT_LINK = re.compile(
+    r'<a[^>]+class="[^"]*result__a[^"]*"[^>]*href="([^"]+)"[^>]*>(.*?)</a>', re.S | re.I
+)
+_ANY_LINK = re.compile(r'<a[^>]+href="(https?://[^"]+)"[^>]*>(.*?)</a>', re.S | re.I)
+_TAG = re.compile(r"<[^>]+>")
+
+
+def normalize_query(query):
+    """Cache key for a query: trimmed, lowercased, whitespace collapsed"""
+    return " ".join(query.lower().split())
+
+
+# ---------- Parsing ----------
+def parse_json(body, limit):
+    """Results from a JSON list, or a dict with results/items/RelatedTopics"""
+    data = json.loads(body)
+    if isinstance(data, dict):
+        for key in ("results", "items", "RelatedTopics"):
+            if isinstance(data.get(key), list):
+                data = data[key]
+                break
+        else:
+            data = []
+
+    results = []
+    for item in data:
+        if not isinstance(item, dict):
+            continue
+        url = item.get("url") or item.get("FirstURL") or item.get("link")
+        title = item.get("title") or item.get("Text") or item.get("name") or url
+        if url:
+            results.append(PreviewResult(str(title), str(url)))
+        if len(results) >= limit:
+            break
+    return results
+
+
+def parse_html(body, limit):
+    """Result links from a DuckDuckGo HTML page, or any absolute links"""
+    matches = _RESULT_LINK.findall(body) or _ANY_LINK.findall(body)
+
+    results = []
+    seen = set()
+    for href, label in matches:
+        url = _unwrap_redirect(html.unescape(href))
+        if not url or url in seen:
+            continue
+        seen.add(url)
+        title = html.unescape(_TAG.sub("", label)).strip() or url
+        results.append(PreviewResult(title, url))
+        if len(results) >= limit:
+            break
+    return results
+
+
+def _unwrap_redirect(href):
+    """DuckDuckGo wraps result links as //duckduckgo.com/l/?uddg=<target>"""
+    if href.startswith("//"):
+        href = "https:" + href
+    parts = urlsplit(href)
+    if parts.path == "/l/" and "uddg" in parse_qs(parts.query):
+        return parse_qs(parts.query)["uddg"][0]
+    return href if parts.scheme in ("http", "https") else None
+
+
+# ---------- Connection pool ----------
+class ConnectionPool:
+    """Idle keep-alive connections per (scheme, host, port)"""
+
+    def __init__(self, max_idle_per_host=2, timeout=3.0, max_idle_seconds=4.0, clock=time.monotonic):
+        self.max_idle_per_host = max_idle_per_host
+        self.timeout = timeout
+        # Servers close idle keep-alive connections after 5-60 s; drop ours first
+        self.max_idle_seconds = max_idle_seconds
+        self.clock = clock
+        self._idle = {}  # (scheme, netloc) -> [(conn, released at)]
+        self._lock = threading.Lock()
+
+    def acquire(self, scheme, netloc, fresh=False):
+        """(connection, reused) for scheme://netloc; fresh skips the idle pool"""
+        expired = []
+        conn = None
+        with self._lock:
+            idle = self._idle.get((scheme, netloc), [])
+            deadline = self.clock() - self.max_idle_seconds
+            while idle and conn is None:
+                candidate, released_at = idle.pop()
+                if fresh or released_at < deadline:
+                    expired.append(candidate)
+                else:
+                    conn = candidate
+        for candidate in expired:
+            candidate.close()
+        if conn is not None:
+            return conn, True
+
+        import http.client
+        cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return cls(netloc, timeout=self.timeout), False
+
+    def release(self, scheme, netloc, conn):
+        with self._lock:
+            idle = self._idle.setdefault((scheme, netloc), [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append((conn, self.clock()))
+                return
+        conn.close()
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn, _ in conns:
+                conn.close()
+
+
+# ---------- Client ----------
+class PreviewRequest:
+    """Handle for a background fetch"""
+
+    def __init__(self, query):
+        self.query = query
+        self.cancelled = False
+        self.conn = None
+
+    def cancel(self):
+        self.cancelled = True
+        conn = self.conn
+        if conn is not None:
+            # Unblocks a read in progress on the worker thread
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+
+class PreviewClient:
+    def __init__(self, endpoint=DEFAULT_ENDPOINT, kind="auto", max_results=8,
+                 cache_size=128, ttl=300.0, timeout=3.0, max_workers=2, clock=time.monotonic,
+                 suggesters=()):
+        self.endpoint = endpoint
+        self.suggesters = list(suggesters)  # callables: query -> [(title, url)], listed first
+        self.kind = kind
+        self.max_results = max_results
+        self.cache_size = cache_size
+        self.ttl = ttl
+        self.clock = clock
+
+        self.pool = ConnectionPool(timeout=timeout)
+        self._cache = OrderedDict()  # normalized query -> (expiry, results)
+        self._cache_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="preview")
+
+    # ----- Cache -----
+    def cached(self, query):
+        key = normalize_query(query)
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= self.clock():
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return entry[1]
+
+    def _store(self, query, results):
+        key = normalize_query(query)
+        with self._cache_lock:
+            self._cache[key] = (self.clock() + self.ttl, results)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    # ----- Fetching -----
+    def fetch(self, query, callback):
+        """Fetch results in the background and call callback(query, results).
+
+        The callback runs on a worker thread (or inline on a cache hit) and is
+        skipped if the returned handle is cancelled first. Errors are reported
+        as an empty result list.
+        """
+        request = PreviewRequest(query)
+        cached = self.cached(query)
+        if cached is not None:
+            callback(query, cached)
+            return request
+
+        def run():
+            if request.cancelled:
+                return
+            try:
+                results = self.search(query, request)
+            except Exception as e:
+                if not request.cancelled:
+                    log.warning("Error fetching preview: %s", e, extra={"query": query})
+                results = []
+            if not request.cancelled:
+                callback(query, results)
+
+        self._executor.submit(run)
+        return request
+
+    def search(self, query, request=None):
+        """Blocking fetch; results are cached by normalized query"""
+        cached = self.cached(query)
+        if cached is not None:
+            return cached
+
+        results = []
+        for suggester in self.suggesters:
+            results.extend(PreviewResult(title, url) for title, url in suggester(query))
+
+        if self.endpoint:
+            url = self.endpoint.format(query=quote_plus(query.strip()))
+            body, content_type = self._get(url, request)
+
+            kind = self.kind
+            if kind == "auto":
+                kind = "json" if "json" in content_type or body.lstrip()[:1] in ("{", "[") else "html"
+            parse = parse_json if kind == "json" else parse_html
+            results.extend(parse(body, self.max_results))
+        results = results[:self.max_results]
+
+        if request is None or not request.cancelled:
+            self._store(query, results)
+        return results
+
+    def _get(self, url, request, redirects=3):
+        parts = urlsplit(url)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+
+        fresh = False
+        while True:
+            conn, reused = self.pool.acquire(parts.scheme, parts.netloc, fresh)
+            if request is not None:
+                request.conn = conn
+            try:
+                conn.request("GET", path, headers={"User-Agent": USER_AGENT, "Accept": "*/*"})
+                response = conn.getresponse()
+                raw = response.read()
+                break
+            except STALE_CONNECTION_ERRORS:
+                conn.close()
+                # The server dropped the idle connection; retry once on a new one
+                if not reused or (request is not None and request.cancelled):
+                    raise
+                fresh = True
+            except Exception:
+                conn.close()
+                raise
+            finally:
+                if request is not None:
+                    request.conn = None
+
+        if response.will_close:
+            conn.close()
+        else:
+            self.pool.release(parts.scheme, parts.netloc, conn)
+
+        if response.status in (301, 302, 303, 307, 308) and redirects:
+            location = response.getheader("Location", "")
+            if location.startswith("/"):
+                location = f"{parts.scheme}://{parts.netloc}{location}"
+            return self._get(location, request, redirects - 1)
+        if response.status != 200:
+            raise OSError(f"HTTP {response.status} from {parts.netloc}")
+
+        content_type = response.getheader("Content-Type", "")
+        charset = "utf-8"
+        if "charset=" in content_type:
+            charset = content_type.split("charset=", 1)[1].split(";")[0].strip() or charset
+        return raw.decode(charset, errors="replace"), content_type.lower()
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.pool.close()
@@ -0,0 +1,367 @@
+"""
+Candidate ranking for history, bookmarks and local files.
+
+Titles and URLs are split into lowercase word tokens once, when candidates
+are added. RankingIndex keeps everything in columnar NumPy arrays: a sorted
+token vocabulary, the flattened token ids of every row, last visit time,
+visit count and source type. Scoring a query is then integer range tests
+and gathers over those arrays (no per-row Python, no per-row string
+search), and the top k come from argpartition instead of a full sort.
+PyRankingIndex is the same model in plain Python; it is the fallback when
+NumPy is not installed and the baseline in benchmarks/ranking_bench.py. Use
+make_index() to get whichever is available.
+
+For a candidate where every query term occurs inside one of its tokens:
+
+    mean over terms of (contains + prefix? + word-start?)
+    + recency * exp(-age / half_life) + frequency * log1p(visits) + source boost
+
+where word-start means some token starts with the term and prefix means the
+first token (the title's first word) does.
+"""
+import bisect
+import heapq
+import math
+import re
+import time
+from collections import namedtuple, OrderedDict
+
+Candidate = namedtuple("Candidate", "title url source score")
+
+SOURCES = ("history", "bookmark", "file")
+
+WEIGHTS = {
+    "contains": 0.5,
+    "prefix": 3.0,
+    "word": 1.5,
+    "recency": 2.0,
+    "frequency": 1.0,
+}
+
+SOURCE_BOOST = {"history": 0.0, "bookmark": 1.0, "file": 0.25}
+
+MAX_TOKENS = 32
+
+# Above this many candidates, ShardedRankingIndex is worth its process overhead
+SHARD_THRESHOLD = 5_000_000
+
+_TOKEN = re.compile(r"[^\W_]+")
+
+
+def tokenize(text):
+    return _TOKEN.findall(text.lower())
+
+
+def row_tokens(title, url):
+    return tokenize(f"{title} {url}")[:MAX_TOKENS]
+
+
+def _prefix_end(term):
+    """Smallest string greater than every string starting with term"""
+    return term[:-1] + chr(ord(term[-1]) + 1)
+
+
+# ---------- Pure Python ----------
+class PyRankingIndex:
+    """Row-oriented reference implementation"""
+
+    def __init__(self, half_life_days=14.0, weights=None, source_boost=None):
+        self.half_life = half_life_days * 86400.0
+        self.weights = dict(WEIGHTS, **(weights or {}))
+        self.source_boost = dict(SOURCE_BOOST, **(source_boost or {}))
+        self.rows = []  # (tokens, title, url, source, last_visit, visits)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def add(self, title, url, source="history", last_visit=0.0, visits=1):
+        self.rows.append((row_tokens(title, url), title, url, source, float(last_visit), int(visits)))
+
+    def extend(self, rows):
+        """rows of (title, url, source, last_visit, visits)"""
+        for row in rows:
+            self.add(*row)
+
+    def set_activity(self, updates):
+        """Overwrite last visit and visit count in place; updates of (row, last_visit, visits)"""
+        for i, last_visit, visits in updates:
+            tokens, title, url, source, _, _ = self.rows[i]
+            self.rows[i] = (tokens, title, url, source, float(last_visit), int(visits))
+
+    def top_k(self, query, k=8, now=None):
+        terms = tokenize(query)
+        if not terms or not self.rows:
+            return []
+        now = time.time() if now is None else now
+        w = self.weights
+
+        scored = []
+        for tokens, title, url, source, last_visit, visits in self.rows:
+            text = 0.0
+            for term in terms:
+                if not any(term in tok for tok in tokens):
+                    break
+                text += w["contains"]
+                if tokens[0].startswith(term):
+                    text += w["prefix"]
+                if any(tok.startswith(term) for tok in tokens):
+                    text += w["word"]
+            else:
+                age = max(0.0, now - last_visit)
+                score = (text / len(terms)
+                         + w["recency"] * math.exp(-age / self.half_life)
+                         + w["frequency"] * math.log1p(visits)
+                         + self.source_boost.get(source, 0.0))
+                scored.append((score, title, url, source))
+
+        best = heapq.nlargest(k, scored, key=lambda row: row[0])
+        return [Candidate(title, url, source, score) for score, title, url, source in best]
+
+
+# ---------- NumPy ----------
+class RankingIndex:
+    """Columnar, vectorized ranking; needs NumPy"""
+
+    def __init__(self, half_life_days=14.0, weights=None, source_boost=None, term_cache_size=64):
+        import numpy as np
+
+        self.np = np
+        self.half_life = half_life_days * 86400.0
+        self.weights = dict(WEIGHTS, **(weights or {}))
+        boost = dict(SOURCE_BOOST, **(source_boost or {}))
+        self.boost_table = np.array([boost.get(s, 0.0) for s in SOURCES], dtype=np.float64)
+
+        self._pending = []
+        self.titles = []
+        self.urls = []
+        self.last_visit = np.zeros(0, dtype=np.float64)
+        self.visits = np.zeros(0, dtype=np.int32)
+        self.source = np.zeros(0, dtype=np.int8)
+
+        # Token columns. Ids are handed out in arrival order (_token_ids) and
+        # remapped to their rank in the sorted vocabulary on materialize, so
+        # every token starting with a term is one contiguous id range.
+        self._token_ids = {}
+        self._raw_flat = np.zeros(0, dtype=np.int32)  # arrival-order id of every token
+        self._lengths = np.zeros(0, dtype=np.int64)  # tokens per row
+        self.vocab = []  # sorted
+        self.tok_flat = np.zeros(0, dtype=np.int32)  # sorted-vocab id of every token
+        self.tok_row = np.zeros(0, dtype=np.int32)  # row of every token
+        self.first_tok = np.zeros(0, dtype=np.int32)  # first token of every row (-1 if none)
+
+        # term -> vocab ids containing it; typing "pyt" then "pyth" refines the
+        # previous answer instead of rescanning the vocabulary
+        self._contains_cache = OrderedDict()
+        self._term_cache_size = term_cache_size
+
+    def __len__(self):
+        return len(self.titles) + len(self._pending)
+
+    def add(self, title, url, source="history", last_visit=0.0, visits=1):
+        self._pending.append((title, url, source, last_visit, visits))
+
+    def extend(self, rows):
+        """rows of (title, url, source, last_visit, visits)"""
+        self._pending.extend(rows)
+
+    def set_activity(self, updates):
+        """Overwrite last visit and visit count in place; updates of (row, last_visit, visits).
+
+        Rows are numbered in the order they were added.
+        """
+        if not updates:
+            return
+        self._materialize()
+        np = self.np
+        rows, last_visit, visits = zip(*updates)
+        rows = np.array(rows, dtype=np.int64)
+        self.last_visit[rows] = np.array(last_visit, dtype=np.float64)
+        self.visits[rows] = np.array(visits, dtype=np.int32)
+
+    def _materialize(self):
+        """Fold buffered rows into the columns"""
+        if not self._pending:
+            return
+        np = self.np
+        rows, self._pending = self._pending, []
+        source_codes = {name: i for i, name in enumerate(SOURCES)}
+        token_ids = self._token_ids
+
+        new_ids = []
+        new_lengths = []
+        for title, url, *_ in rows:
+            self.titles.append(title)
+            self.urls.append(url)
+            tokens = row_tokens(title, url)
+            new_ids.extend(token_ids.setdefault(tok, len(token_ids)) for tok in tokens)
+            new_lengths.append(len(tokens))
+        self._raw_flat = np.concatenate([self._raw_flat, np.array(new_ids, dtype=np.int32)])
+        self._lengths = np.concatenate([self._lengths, np.array(new_lengths, dtype=np.int64)])
+
+        self.last_visit = np.concatenate([self.last_visit, np.array([r[3] for r in rows], dtype=np.float64)])
+        self.visits = np.concatenate([self.visits, np.array([r[4] for r in rows], dtype=np.int32)])
+        self.source = np.concatenate([self.source, np.array([source_codes.get(r[2], 0) for r in rows], dtype=np.int8)])
+
+        # Re-rank the vocabulary so ids follow sorted token order
+        vocab = list(token_ids)
+        order = sorted(range(len(vocab)), key=vocab.__getitem__)
+        rank = np.empty(len(vocab), dtype=np.int32)
+        rank[np.array(order, dtype=np.int64)] = np.arange(len(vocab), dtype=np.int32)
+        self.vocab = [vocab[i] for i in order]
+
+        lengths, raw = self._lengths, self._raw_flat
+        self.tok_flat = rank[raw]
+        self.tok_row = np.repeat(np.arange(len(lengths), dtype=np.int32), lengths)
+        starts = np.concatenate([[0], np.cumsum(lengths)[:-1]]).astype(np.int64)
+        if len(raw):
+            self.first_tok = np.where(lengths > 0, self.tok_flat[np.minimum(starts, len(raw) - 1)], -1)
+        else:
+            self.first_tok = np.full(len(lengths), -1, dtype=np.int32)
+        self._contains_cache.clear()
+
+    def _contains_ids(self, term):
+        """Sorted-vocab ids of tokens containing term"""
+        cached = self._contains_cache.get(term)
+        if cached is not None:
+            self._contains_cache.move_to_end(term)
+            return cached
+
+        base = None
+        for n in range(len(term) - 1, 0, -1):
+            # Tokens containing "pyth" are a subset of those containing "pyt"
+            base = self._contains_cache.get(term[:n])
+            if base is not None:
+                break
+        vocab = self.vocab
+        candidates = base.tolist() if base is not None else range(len(vocab))
+        ids = self.np.array([i for i in candidates if term in vocab[i]], dtype=self.np.int64)
+
+        self._contains_cache[term] = ids
+        while len(self._contains_cache) > self._term_cache_size:
+            self._contains_cache.popitem(last=False)
+        return ids
+
+    def scores(self, query, now=None):
+        """Score every candidate; non-matching rows get -inf"""
+        self._materialize()
+        np = self.np
+        n = len(self.titles)
+        terms = tokenize(query)
+        if not terms or not n:
+            return np.full(n, -np.inf)
+        now = time.time() if now is None else now
+        w = self.weights
+
+        matched = np.ones(n, dtype=bool)
+        text = np.zeros(n, dtype=np.float64)
+        token_hit = np.zeros(len(self.vocab), dtype=bool)
+        for term in terms:
+            lo = bisect.bisect_left(self.vocab, term)
+            hi = bisect.bisect_left(self.vocab, _prefix_end(term), lo)
+
+            token_hit[:] = False
+            token_hit[self._contains_ids(term)] = True
+            contains = np.zeros(n, dtype=bool)
+            contains[self.tok_row[token_hit[self.tok_flat]]] = True
+
+            word = np.zeros(n, dtype=bool)
+            word[self.tok_row[(self.tok_flat >= lo) & (self.tok_flat < hi)]] = True
+            prefix = (self.first_tok >= lo) & (self.first_tok < hi)
+
+            matched &= contains
+            text += w["contains"] + w["prefix"] * prefix + w["word"] * word
+
+        age = np.maximum(0.0, now - self.last_visit)
+        score = (text / len(terms)
+                 + w["recency"] * np.exp(-age / self.half_life)
+                 + w["frequency"] * np.log1p(self.visits)
+                 + self.boost_table[self.source])
+        return np.where(matched, score, -np.inf)
+
+    def top_k(self, query, k=8, now=None):
+        return self._select(self.scores(query, now), k)
+
+    def _select(self, score, k):
+        np = self.np
+        if not len(score) or k <= 0:
+            return []
+        k = min(k, len(score))
+        idx = np.argpartition(-score, k - 1)[:k]
+        idx = idx[np.isfinite(score[idx])]
+        idx = idx[np.argsort(-score[idx], kind="stable")]
+        return [
+            Candidate(self.titles[i], self.urls[i], SOURCES[self.source[i]], float(score[i]))
+            for i in idx.tolist()
+        ]
+
+
+# ---------- Sharding across processes ----------
+_shard = None
+
+
+def _init_shard(rows, half_life_days, weights, source_boost):
+    global _shard
+    _shard = RankingIndex(half_life_days, weights, source_boost)
+    _shard.extend(rows)
+    _shard._materialize()
+
+
+def _score_shard(query, k, now):
+    return _shard.top_k(query, k, now)
+
+
+class ShardedRankingIndex:
+    """Splits a very large candidate set across worker processes.
+
+    Each worker builds its shard once at start-up; a query then sends only
+    the query text to every worker and merges their top-k lists.
+    """
+
+    def __init__(self, rows, shards=None, half_life_days=14.0, weights=None, source_boost=None):
+        import os
+        from concurrent.futures import ProcessPoolExecutor
+
+        rows = list(rows)
+        shards = shards or os.cpu_count() or 2
+        size = max(1, (len(rows) + shards - 1) // shards)
+        self._executors = [
+            ProcessPoolExecutor(max_workers=1, initializer=_init_shard,
+                                initargs=(rows[i:i + size], half_life_days, weights, source_boost))
+            for i in range(0, len(rows), size)
+        ]
+        self._len = len(rows)
+
+    def __len__(self):
+        return self._len
+
+    def top_k(self, query, k=8, now=None):
+        now = time.time() if now is None else now
+        futures = [ex.submit(_score_shard, query, k, now) for ex in self._executors]
+        merged = [c for f in futures for c in f.result()]
+        return heapq.nlargest(k, merged, key=lambda c: c.score)
+
+    def close(self):
+        for ex in self._executors:
+            ex.shutdown(wait=False, cancel_futures=True)
+
+
+def make_index(rows=(), half_life_days=14.0, processes=None, **kwargs):
+    """Best available index for rows of (title, url, source, last_visit, visits).
+
+    Uses NumPy when installed, shards across processes above SHARD_THRESHOLD
+    (or when processes is given), and falls back to pure Python otherwise.
+    """
+    rows = list(rows)
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        index = PyRankingIndex(half_life_days, **kwargs)
+        index.extend(rows)
+        return index
+
+    if processes or len(rows) > SHARD_THRESHOLD:
+        return ShardedRankingIndex(rows, processes, half_life_days, **kwargs)
+
+    index = RankingIndex(half_life_days, **kwargs)
+    index.extend(rows)
+    return index
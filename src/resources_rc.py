@@ -0,0 +1,7000 @@
+# -*- coding: utf-8 -*-
+
+# Resource object code
+#
+# Created by: The Resource Compiler for PyQt5 (Qt v5.15.14)
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt5 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x01\xff\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
+\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x00\xa6\x00\x00\x00\xa6\
+\x01\xdd\x7d\xff\x38\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x01\x7c\x49\x44\
+\x41\x54\x48\x89\xbd\x96\xc1\x6a\xc2\x40\x10\x86\xbf\x09\xa4\x87\
+\x80\x27\xc1\xa7\x10\x34\xd4\x3e\x81\xc7\x3c\x84\x27\x2f\xbe\x44\
+\xbc\x7b\x17\x7c\x89\x1e\xfa\x1a\xa6\x20\xe8\x03\x78\xf2\xd0\x17\
+\x28\x8d\xe0\xf6\xe0\x1f\x58\xb6\x49\xab\x6d\xd2\x85\x25\x30\xce\
+\x7c\xff\xcc\xb0\x3b\xab\x39\xe7\x68\x5a\x66\x36\x00\x9e\x80\x09\
+\xf0\xa8\x2f\x40\x01\xbc\xea\xbb\x75\xce\xbd\x35\x42\x9c\x73\x5f\
+\x36\x10\x03\x4b\xa0\x04\x1c\xf0\x21\xd8\x46\xbb\x90\xcd\xc9\x27\
+\x07\xe2\x5a\x56\x0d\x7c\x0c\xec\x80\x0b\xb0\x06\xd2\xba\x60\x25\
+\x91\xca\xe7\xa2\x98\xf1\xb7\x02\xc0\x42\x19\x1d\x81\x69\x5d\x46\
+\x0d\x15\x4f\x15\x53\x02\x8b\x5a\x01\x65\x5e\x02\xcf\x40\xef\x56\
+\xb8\x17\xdf\x53\x6c\xe9\x57\xe2\x97\xbb\x53\x16\x77\xc3\x03\x91\
+\xa3\x58\xb1\x2f\xb0\x54\x1f\x6f\x6e\xcb\x0f\xed\xba\x00\x79\x75\
+\x42\x07\x2a\x6b\xfd\x57\xb8\x27\xb2\x16\x73\x00\x90\xe9\xb8\xa5\
+\x2d\x0a\xa4\x62\x66\x91\x2e\x4f\x09\x1c\x1a\x2f\xcb\xfd\xeb\x20\
+\xe6\x24\xe2\x7a\x43\xf7\xce\xb9\x73\xf5\xab\x99\x25\x66\x36\x33\
+\xb3\x91\x67\x33\x33\xcb\xb4\xcd\xb3\x8f\xe5\x9b\x54\x36\xb1\xf6\
+\x62\x73\x02\x36\x41\x89\x2b\x95\xf8\x0e\xf4\x65\xab\x5a\xe9\x80\
+\x4c\xb6\xbe\x7c\x1c\xb0\x0a\x18\x1b\xe0\x14\xb5\xd8\x96\xc6\xf5\
+\x02\x14\x81\x7a\x02\xcc\x80\x91\x67\x33\x55\x91\x01\x16\x5c\xd0\
+\x19\x90\x04\x8c\x42\x6c\x72\xae\x83\xab\x76\x58\xfd\xf2\x14\xc5\
+\x62\xe6\x91\x94\x1e\x80\x61\x8b\x5d\x19\x8a\x59\x44\xc0\x16\x38\
+\x03\xf3\x16\x05\xe6\x62\x6e\xbb\x1f\x15\xff\x32\xec\xbc\xd3\xd0\
+\xcd\xb8\xf6\x9c\xba\x7b\x70\x82\x4a\xba\x79\x32\x83\xe0\x25\x2d\
+\x3c\xfa\x26\x60\xed\x6a\xe3\x6f\xcb\x27\xcb\x87\x68\x90\x3a\xf7\
+\xff\x7b\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x01\x4f\xf0\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x04\x00\x00\x00\x04\x00\x08\x06\x00\x00\x00\x7f\x1d\x2b\x83\
+\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
+\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\
+\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\
+\x00\x00\x3a\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x00\x06\
+\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\x00\
+\x00\x07\x74\x49\x4d\x45\x07\xe8\x07\x09\x00\x02\x34\xea\x69\x36\
+\xe2\x00\x00\x80\x00\x49\x44\x41\x54\x78\xda\xec\x9d\x75\xb8\x25\
+\xc5\xb5\xb7\xdf\x73\xc6\x9d\x11\x66\x60\x06\x98\x01\x06\x18\xdc\
+\xdd\x3d\x40\x12\x62\xc4\x6e\xdc\x93\x9b\x1b\xbf\x71\xb9\xb9\x71\
+\x77\xff\x22\xc4\xdd\x81\x24\xb8\x26\x10\xdc\x1d\x66\xb0\x19\x60\
+\x8c\x71\xdd\xdf\x1f\xab\xcf\x9d\xc3\x70\x64\xef\xee\xaa\xea\xaa\
+\xea\xdf\xfb\x3c\xfb\x39\xb2\xbb\x7b\x77\xd7\x2e\xfb\xad\x5a\xb5\
+\x56\x17\x42\x08\x21\x84\xa8\x83\x6e\x60\x8b\xe2\x35\xb1\xd7\xef\
+\x63\x80\x91\xc0\x78\x60\x68\xf1\xbf\xe1\xc5\xff\x47\x03\x23\x8a\
+\xf7\x86\x01\x13\x7a\xbd\xd7\x9b\xa1\xc0\xb8\x3e\x3e\x73\x5c\xf1\
+\x5e\x6f\xd6\x03\xcb\xfa\x38\x76\x59\xf1\x5e\x6f\x56\x00\x6b\x81\
+\xa5\xc5\x7b\x4b\x8b\xbf\x57\xf4\xf3\xde\x9a\xe2\xff\x4b\x80\xc5\
+\xc5\xcf\x9e\xdf\x37\xaa\x0a\x08\x21\x84\x10\x61\xe9\x52\x11\x08\
+\x21\x84\x10\x95\x19\x0f\x6c\x0d\x6c\x09\x4c\xed\xf5\x7b\x6f\x61\
+\xbf\xf9\x6b\x7c\xc3\xcb\xec\x89\x5e\x06\x81\xcd\x5f\x8b\x81\x47\
+\x81\x47\x80\xc7\x7a\xfd\xbe\x4c\x55\x4d\x08\x21\x84\x90\x01\x40\
+\x08\x21\x84\x70\xcd\xd0\x42\xc8\x6f\x07\x6c\x0b\x4c\xdb\x4c\xdc\
+\xf7\xfe\x7d\xa4\x8a\x2b\x08\xab\x0b\x83\xc0\xc3\xc5\xcf\xc7\x0a\
+\xc3\xc0\xa3\xc0\x02\xe0\x01\x60\x2e\x30\x9f\xa7\x7a\x2f\x08\x21\
+\x84\x10\x32\x00\xa8\x08\x84\x10\x42\x34\x94\x89\xc0\xf4\x42\xc4\
+\xef\x50\xbc\x7a\xff\xbd\x1d\x4f\x75\x97\x17\xe9\xb0\x18\xb8\xb7\
+\x30\x10\x3c\x5c\xfc\xde\xfb\xef\xfb\xd1\x36\x04\x21\x84\x10\x32\
+\x00\x08\x21\x84\x10\x59\x30\x1c\x98\x05\xcc\xde\xec\xb5\x63\x21\
+\xee\xb5\x6a\xdf\x6c\x56\x63\xde\x02\xf7\x00\x77\x17\xaf\x9e\xdf\
+\xef\xc7\xe2\x19\x08\x21\x84\x10\x32\x00\x08\x21\x84\x10\x91\x30\
+\x02\xd8\x69\x33\x71\xdf\x5b\xe4\x0f\x51\x11\x89\x12\x6c\x00\xe6\
+\x6d\x66\x14\xe8\xf9\x79\x17\x16\xdc\x50\x08\x21\x84\x90\x01\x40\
+\x08\x21\x84\xf0\xc0\xf0\x42\xe8\xef\x06\xec\xde\xeb\xe7\x2e\x12\
+\xf9\xa2\x06\x1e\x01\x6e\x01\x6e\xed\xf5\xf3\x3a\x2c\xe3\x81\x10\
+\x42\x08\x21\x03\x80\x10\x42\x08\x21\xa1\x2f\x64\x18\x10\x42\x08\
+\x21\x64\x00\x10\x42\x08\xd1\x3c\x26\x00\x7b\x02\xfb\xf7\x7a\x49\
+\xe8\x8b\x5c\x0d\x03\xd7\xf4\x7a\x5d\x89\x65\x2e\x10\x42\x08\x21\
+\x64\x00\x10\x42\x08\x91\x1d\xd3\x0b\x81\xdf\xb3\xa2\xbf\x3f\xb0\
+\xab\xc6\x21\x21\xa3\xc0\xff\x79\x0a\x5c\x53\xfc\x6c\xa9\x68\x84\
+\x10\x42\xc8\x00\x20\x84\x10\x22\x15\xb6\x02\x0e\x01\x0e\x06\x0e\
+\x00\xf6\x01\xa6\xa8\x58\x84\x18\x94\xc7\xb1\x2d\x03\x57\x63\x5e\
+\x02\x57\x02\xf3\x55\x2c\x42\x08\x21\x64\x00\x10\x42\x08\x11\x03\
+\xc3\x80\xbd\x80\x23\xd8\xe4\xc6\xbf\x9b\x8a\x45\x08\x67\xf4\x78\
+\x0a\x5c\x06\x5c\x5e\xfc\xbe\x4a\xc5\x22\x84\x10\x42\x06\x00\x21\
+\x84\x10\xbe\xe9\x71\xe5\x3f\xbc\x97\xe8\x1f\xa9\x62\x11\x22\x18\
+\xeb\x81\x3b\x37\x33\x08\x68\xeb\x80\x10\x42\x08\x19\x00\x84\x10\
+\x42\x54\x62\x08\xb6\xba\x7f\x14\x70\x74\x21\xf8\xb7\x54\xb1\x08\
+\x11\x1d\x8f\x16\x06\x81\x8b\x81\x4b\x80\x1b\x81\x8d\x2a\x16\x21\
+\x84\x10\x32\x00\x08\x21\x84\x18\x48\xf0\xef\x53\x08\xfd\xc3\x81\
+\xe3\x81\x49\x2a\x16\x21\x92\x63\x39\xf0\x2f\xcc\x43\xe0\xb2\xc2\
+\x28\xb0\x56\xc5\x22\x84\x10\x42\x06\x00\x21\x84\x68\x2e\x43\x81\
+\xbd\x81\x13\x0a\xd1\x7f\x24\x96\x9a\x4f\x08\x91\x17\x2b\x80\xeb\
+\x0b\x63\xc0\x79\xc5\xcf\xd5\x2a\x16\x21\x84\x90\x01\x40\x08\x21\
+\x44\xbe\x74\x03\xfb\x02\x27\x16\xaf\xc3\xd0\xfe\x7d\x21\x9a\xc8\
+\x6a\xcc\x3b\xe0\xdc\xe2\x75\x3d\xda\x32\x20\x84\x10\x32\x00\x08\
+\x21\x84\x48\x9e\xed\x7a\x09\xfe\xe3\x51\x3a\x3e\x21\xc4\x53\x79\
+\x0c\x38\xbf\x97\x41\xe0\x01\x15\x89\x10\x42\xc8\x00\x20\x84\x10\
+\x22\x7e\xc6\x00\x87\x62\x6e\xfd\x27\x00\xfb\xa9\xaf\x17\x42\x74\
+\xc8\xbd\xd8\x56\x81\xf3\x0a\x83\xc0\x12\x15\x89\x10\x42\xc8\x00\
+\x20\x84\x10\x22\x0e\xf6\x06\x9e\x0e\x9c\x5c\x88\xff\xa1\x2a\x12\
+\x21\x84\x23\xd6\x01\xff\x04\xfe\x0e\x9c\x05\xdc\xa0\x22\x11\x42\
+\x08\x19\x00\x84\x10\x42\x84\x63\x24\x16\xb4\xef\x19\xc0\xb3\x30\
+\x37\x7f\x21\x84\x08\xc1\x02\xe0\x1f\xc0\x5f\x80\x73\xb0\x8c\x03\
+\x42\x08\x21\x64\x00\x10\x42\x08\xe1\x90\x2d\x81\x53\xb0\x95\xfe\
+\xa7\x01\xe3\x54\x24\x42\x88\x9a\x59\x85\x05\x13\xfc\x2b\xf0\x3b\
+\xe0\x41\x15\x89\x10\x42\xc8\x00\x20\x84\x10\xa2\x1c\xbb\x17\x82\
+\xff\x19\x58\xc4\x7e\xf5\xd9\x42\x88\x98\xb9\x15\xf3\x0c\xf8\x2b\
+\x70\x05\xca\x2c\x20\x84\x10\x32\x00\x08\x21\x84\xe8\x97\xee\x42\
+\xe8\x9f\x01\x3c\x17\x98\xa1\x22\x11\x42\x24\xca\x63\xc0\xdf\x80\
+\xdf\x14\x3f\xd7\xa9\x48\x84\x10\x42\x06\x00\x21\x84\x68\x3a\x43\
+\xb0\xc0\x7d\x67\x00\xcf\x07\xb6\x52\x91\x08\x21\x32\x63\x21\x70\
+\x76\x61\x0c\xf8\x3b\xb0\x56\x45\x22\x84\x10\x32\x00\x08\x21\x44\
+\x53\x18\x09\x9c\x88\xb9\xf7\x3f\x1b\xdb\xdf\x2f\x84\x10\x4d\x60\
+\x31\xb6\x45\xe0\x2f\x85\x51\x60\x85\x8a\x44\x08\x21\x64\x00\x10\
+\x42\x88\xdc\x18\x03\x9c\x86\xb9\xf6\x9f\x0a\x8c\x55\x91\x08\x21\
+\x1a\xce\x32\x2c\xb5\xe0\xef\x0a\x63\xc0\x4a\x15\x89\x10\x42\xc8\
+\x00\x20\x84\x10\xa9\x32\x04\x38\x16\x78\x19\xb6\xd2\x2f\xd1\x2f\
+\x84\x10\x7d\xb3\x0a\x38\x1f\xf8\x31\xf0\x27\xb4\x4d\x40\x08\x21\
+\x64\x00\x10\x42\x88\x04\xe8\x1d\xc8\xef\x85\xc0\x54\x15\x89\x10\
+\x42\x74\x44\xcf\x36\x81\x1f\x17\x46\x81\x96\x8a\x44\x08\x21\x64\
+\x00\x10\x42\x88\x98\xd8\xbd\x10\xfd\x2f\x05\x76\x50\x71\x08\x21\
+\x84\x13\x1e\x04\x7e\x8f\x05\x10\xbc\x4c\xc5\x21\x84\x10\x32\x00\
+\x08\x21\x44\x5d\x6c\x87\xb9\xf6\xbf\x1c\xd8\x57\xc5\x21\x84\x10\
+\x5e\xb9\xb5\x30\x04\xfc\x14\xb8\x5b\xc5\x21\x84\x10\x32\x00\x08\
+\x21\x84\x6f\xc6\x61\x2b\xfd\xaf\xc2\x5c\xfd\xd5\x8f\x0a\x21\x44\
+\x58\x5a\x98\x37\xc0\x0f\x80\xdf\x02\xcb\x55\x24\x42\x08\x21\x03\
+\x80\x10\x42\xb8\x64\x7f\xe0\x75\xc0\x8b\x51\x30\x3f\x21\x84\x88\
+\x85\x55\x58\xbc\x80\xef\xa2\x78\x01\x42\x08\x21\x03\x80\x10\x42\
+\x54\x60\x06\xf0\x12\xe0\x35\xc0\x6c\x15\x87\x10\x42\x44\xcd\x3c\
+\xe0\x17\xc0\xb7\x81\xfb\x55\x1c\x42\x08\x21\x03\x80\x10\x42\x0c\
+\xc6\x48\xe0\x59\xc0\x2b\x81\x13\xb0\xa8\xfe\x42\x78\x1f\x8c\x47\
+\x03\x63\x8a\x9f\xa3\x81\x61\xc0\x08\x60\x78\xf1\xfb\xa8\xa2\x32\
+\x8e\x29\x7e\x8e\xea\xf5\xde\x48\x2c\xe7\x64\xef\xeb\x8d\xea\xe3\
+\x73\x46\xf5\x51\xa1\x37\x62\x4b\xa8\x9b\xb3\x8a\x27\x2f\xa5\xae\
+\x07\xd6\x60\xb9\xd9\xd6\x15\xef\x6f\xc0\x12\xb7\x6f\x00\x56\xf7\
+\xf1\xde\x8a\xe2\xfd\x95\xc5\xef\x42\x04\x62\x03\x70\x2e\xf0\x43\
+\x2c\xa5\xe0\x1a\x15\x89\x10\x42\xc8\x00\x20\x84\x10\xbd\xd9\x1b\
+\x73\xf1\x7f\x11\x30\x51\xc5\x21\xca\x32\x1a\x98\x00\x8c\x2f\x5e\
+\x13\xb0\xc0\x11\x9b\x0b\xfc\xcd\xff\x6e\x02\xbd\x8d\x01\x2b\xfb\
+\xf8\x7b\x19\xb0\x04\x78\xa2\xd7\xef\xab\x54\xa5\x44\x35\x16\x01\
+\x3f\xc7\xb6\x08\xdc\xa4\xe2\x10\x42\xc8\x00\x20\x84\x10\xcd\x65\
+\x24\x16\xd0\xef\x8d\xc0\xa1\x2a\x0e\x31\xd0\x60\xb9\x05\x30\x19\
+\x98\x84\x59\x88\xc6\x17\xff\x1b\xd7\xeb\xf7\xf1\xd8\x8a\xbc\x70\
+\xc7\xba\xc2\x20\xb0\xb9\x61\xe0\x09\x2c\x59\xfc\x22\x60\x61\xf1\
+\x3f\x6d\xfe\x16\x83\x70\x19\xb6\x3d\xe0\xb7\xc8\x2b\x40\x08\x21\
+\x03\x80\x10\x42\x34\x86\xd9\xc0\xeb\x31\x37\xff\xc9\x2a\x0e\x31\
+\xae\x10\xf6\x93\x81\x29\xbd\x44\x7e\xef\xdf\x87\xa8\x98\xa2\x66\
+\x43\x2f\x83\xc0\xe3\xc5\xcf\xcd\x7f\x5f\xa6\x62\x12\xc6\xe3\x58\
+\x06\x81\xef\x02\xf7\xa8\x38\x84\x10\x32\x00\x08\x21\x44\x7e\x74\
+\x03\xc7\x61\x6e\xfe\xcf\x91\x9e\x6b\x1e\x63\x80\xa9\xc0\x96\x58\
+\x74\xc7\x6d\x8a\xdf\xb7\xa2\xef\xfd\xf2\x22\x3f\xd6\x17\x86\x80\
+\x87\x8a\xd7\xa3\xc5\xeb\xb1\xe2\x25\x0f\x82\xc6\xb1\x11\xb8\xa0\
+\x30\x04\xfc\x11\x73\x38\x11\x42\x08\x19\x00\x84\x10\x22\x61\x66\
+\x60\x51\xfc\x5f\x5b\xfc\x2e\x32\x66\x1c\xb0\x6d\x21\xea\xa7\x6d\
+\xf6\x92\x6b\xbe\x18\x88\xb5\x85\x31\x60\x41\xaf\xd7\x7c\xe0\x01\
+\xe4\x39\xd0\x10\x1e\x04\xbe\x07\xfc\x3f\xe0\x61\x15\x87\x10\x42\
+\x06\x00\x21\x84\x48\x8b\x23\x81\xb7\x02\xa7\x03\x43\x55\x1c\x79\
+\x31\x01\xb3\xe6\x4c\x2f\x04\xff\xf4\xe2\xef\x71\x1a\xcc\xbd\xd2\
+\xd4\x15\xf2\x65\x85\x3a\x7c\x78\xb3\x9f\x4f\xa8\x29\xe6\xc8\x7a\
+\xcc\x1b\xe0\x2b\x58\xcc\x00\x21\x84\xd0\x9c\x41\x08\x21\x22\x65\
+\x38\xf0\x82\x42\xf8\xef\xaf\xe2\x48\x9f\x51\xc0\x76\xc0\xcc\x42\
+\xe0\xf7\xbc\xc6\x6a\xf0\xcd\x82\xd4\x0d\x0a\xcb\x37\x33\x08\xcc\
+\x03\xe6\x62\x29\x11\x45\x16\x5c\x5d\x18\x02\x7e\x8d\x39\x89\x08\
+\x21\x84\x0c\x00\x42\x08\x11\x01\x5b\x02\xaf\x02\xde\x8c\x6d\xed\
+\x16\x09\x32\xa6\x10\xf7\xb3\x80\xed\x8b\xd7\xf4\x44\x06\x2a\x0d\
+\xa6\x32\x18\xf4\x66\x31\x70\x3f\x70\x5f\xf1\xf3\x5e\x60\xa9\xbe\
+\xbe\x94\x59\x00\xfc\x08\xf8\x2a\xda\x1e\x20\x84\x90\x01\x40\x08\
+\x21\x6a\x63\x6f\xe0\x2d\xc0\x8b\xb1\x94\x7e\x22\x11\xa6\x14\x02\
+\x7f\x66\xaf\xd7\x44\x0d\x92\x22\x63\x43\xc1\x62\xcc\x3b\x60\x6e\
+\x61\x14\xb8\x1f\x0b\x45\x2f\x92\x62\x35\xf0\x33\xcc\x2b\xe0\x26\
+\x15\x87\x10\x42\x06\x00\x21\x84\xf0\x4f\x4f\x34\xff\xb7\x02\xa7\
+\xa9\x1f\x8b\x9f\x91\x98\x1b\xff\x2c\x60\x97\xe2\x35\x41\x83\xa0\
+\x90\x81\x80\xa5\x98\x77\x40\x8f\xa7\xc0\x9d\xc0\x0a\x7d\x3d\xa9\
+\x70\x79\x61\x08\xf8\x3d\x96\x85\x52\x08\x21\x64\x00\x10\x42\x08\
+\xc7\x3a\xf2\x95\xc0\x3b\x81\x1d\x55\x1c\xf1\x0e\x2a\xd3\x81\xd9\
+\xc5\x97\x34\x1b\x73\xeb\xef\xd6\x40\x27\x64\x1c\x18\x94\x8d\x58\
+\x7a\xc2\xbb\x8b\xd7\x3d\x98\xbf\xb9\xd2\x13\x46\xcd\x5d\xc0\x17\
+\x80\x33\x51\xf8\x07\x21\x84\x0c\x00\x42\x08\x51\x99\x2d\x80\x37\
+\x61\xae\xfe\xd3\x54\x1c\x71\x31\xbc\x10\xf9\x73\x80\x9d\x81\x1d\
+\xb0\xc0\x7d\x1a\xd0\x84\x0c\x03\x6e\x58\x89\x79\x09\xdc\x09\xdc\
+\x5e\x18\x05\x14\x8d\x2e\x4a\xe6\x63\x1e\x01\xdf\x42\x21\x1f\x84\
+\x10\x32\x00\x08\x21\x44\xc7\x4c\x03\xde\x88\xb9\xfa\x6f\xa1\xe2\
+\x88\x83\x11\x85\xe0\xdf\x19\x73\xe5\xdf\x19\x18\xa6\x81\x2b\xcb\
+\x01\x5e\xab\xce\x71\x96\xd3\x06\x2c\xdb\xc0\x2d\x85\x51\xe0\x8e\
+\xc2\x48\x20\xa2\x61\x19\xf0\x43\xe0\xb3\x98\x43\x87\x10\x42\xc8\
+\x00\x20\x84\x10\x03\xb0\x43\x21\xfa\x5f\x4b\x7d\x8b\xc9\xa2\x60\
+\x24\xe6\xca\xbf\x07\x9b\x56\xf8\x87\x6a\x90\xd2\xf3\x25\x26\x9a\
+\x73\x7e\xbe\x8d\xc0\x23\x85\x31\xe0\x66\xe0\x56\x2c\x3d\xa1\xa8\
+\x9d\xb5\xc0\xaf\x80\x4f\x62\xce\x1b\x42\x08\xa1\xb9\x87\x10\x42\
+\xf4\xe2\x40\xe0\x3d\xc0\xb3\xa9\x77\xcb\x78\xa3\x19\x8e\xad\xec\
+\xef\x01\xec\x8e\x05\xef\x0b\x31\x50\xe4\x30\x18\x69\x40\x95\xd1\
+\x20\x86\x67\x68\x61\x1e\x02\x37\x17\xaf\x3b\xd1\x96\x81\x9a\xd9\
+\x08\xfc\x0e\xf8\x0c\x70\x8d\x8a\x43\x08\xa1\xf9\x8a\x10\xa2\xe9\
+\x1c\x07\x7c\xa0\xf8\x29\x6a\x18\x04\x66\x16\x82\xbf\x67\x95\x7f\
+\x58\xa0\xcf\xd5\x60\x29\x9a\x6e\x24\x08\x71\xbf\x6b\xd9\xe4\x1d\
+\x70\x73\x61\x1c\xd0\xf6\x8e\xda\x38\x0f\xf8\x38\x70\xb1\x8a\x42\
+\x08\xa1\x39\x8d\x10\xa2\x69\x1c\x01\x7c\x54\xc2\x3f\x3c\x13\xd8\
+\xb4\xca\xbf\x0f\x30\x51\x03\x8d\x06\x43\x19\x08\x1a\x73\x8f\xcb\
+\x80\xdb\x0a\x63\xc0\x4d\xc0\xe3\xaa\x16\x75\x70\x39\xe6\x11\xf0\
+\x17\x15\x85\x10\x42\x73\x1e\x21\x44\xee\x9c\x04\x7c\x18\x38\x5c\
+\x45\x11\x86\x21\x85\xe0\xdf\x07\xd8\x1b\x4b\xd3\xd7\xc4\x81\x45\
+\x03\x9e\x48\xd1\x38\xe0\xfb\xbe\x1e\x06\xae\x07\x6e\xc0\x02\x0a\
+\x2a\xa1\x7d\x50\x2e\xc5\x0c\xe1\xe7\xab\x28\x84\x10\x9a\x0f\x09\
+\x21\x72\xe3\x08\xe0\x63\xc0\x31\x2a\x0a\xff\x8c\x05\x76\x03\xf6\
+\x05\xf6\x03\x46\x37\x64\x10\xd1\xa0\x26\x9a\x60\x1c\xf0\x75\x3f\
+\x6b\xb0\x20\x82\xd7\x01\xd7\xa2\x5c\x76\x01\xb9\x02\xf8\x34\xf2\
+\x08\x10\x42\x68\xae\x24\x84\xc8\x80\x13\x0a\xe1\x7f\x88\x8a\xc2\
+\x2f\x53\xb1\x55\xfe\xfd\x80\x39\xd8\xca\x7f\xae\x83\x86\x06\x2f\
+\x21\xc3\x80\xdf\xfb\xd8\x08\xcc\x2d\x8c\x01\xd7\x03\xf7\xe9\xeb\
+\x0e\xc1\x3f\x81\x4f\xc9\x10\x20\x84\xd0\x1c\x4a\x08\x91\x22\xa7\
+\x61\xae\xfe\x07\xa9\x28\xfc\x30\xa4\x10\xfa\xfb\x63\x2b\xfd\x53\
+\x32\x1d\x24\x94\x0a\x50\xa2\x59\xcf\x57\xff\x3d\x3c\xc6\x26\xcf\
+\x80\xdb\xd1\x56\x81\x00\x86\x80\xff\x05\xfe\xa6\xa2\x10\x42\x68\
+\xde\x21\x84\x88\x9d\xc3\xb1\x15\x8c\x23\x55\x14\xee\xe9\x06\x66\
+\x63\x56\x95\x43\xb0\x80\x7e\x39\x0d\x0c\x4a\x07\x28\x72\x34\x18\
+\xb4\x32\xfb\xec\xe5\x98\x57\xc0\x55\x58\x20\xc1\xf5\xaa\xa6\xbe\
+\xf8\x17\xf0\x7e\xe0\x42\x15\x85\x10\x42\xf3\x14\x21\x44\x6c\xec\
+\x09\x7c\x08\x38\x43\x45\xe1\x96\x61\x58\xc4\xfe\x83\xf0\xb3\x9f\
+\xbf\xae\x81\x40\xa9\x00\x45\x93\x0d\x05\xad\x4c\x3e\x77\x2d\x70\
+\x0b\x70\x25\x96\xe4\x7e\xb5\xaa\xa2\x0f\xce\x03\xde\x5b\x14\xb1\
+\x10\x42\x68\x3e\x23\x84\xa8\x95\x39\x98\xab\xe2\xf3\xd4\xa7\xb8\
+\x63\x38\xb0\x7b\x21\xfa\x0f\x00\x46\x26\xde\xf1\x2b\x15\xa0\x90\
+\x81\x20\xce\x7b\x74\xf9\x99\xbd\x8d\x01\xd7\x02\xab\x54\xed\x5c\
+\x7f\x55\xbf\x05\x3e\x08\xdc\xa9\xe2\x10\x42\x68\xbe\x23\x84\x08\
+\xcd\x76\xc0\x47\x80\x97\xe3\x27\xde\x5c\x23\x45\xff\x7e\xc0\xa1\
+\x98\x3b\xc5\xb0\x84\x3b\x7b\xa5\x02\x14\x32\x0e\xa4\x77\x5f\x2e\
+\x3f\x6f\x1d\x70\x23\x16\xde\xfe\xfa\xc2\x38\x20\x9c\xb0\x1e\xf8\
+\x11\x96\x3e\xf0\x41\x15\x87\x10\x42\x73\x21\x21\x84\x6f\x26\x03\
+\xff\x0d\xbc\x15\xb7\x0b\xd3\x8d\xa4\x67\x4f\xff\x11\x85\xf0\x4f\
+\x75\xa5\x3f\xa6\xc1\x44\x03\x9b\xc8\xd5\x38\xd0\x4a\xf4\xb3\xd6\
+\x16\x46\x80\xcb\x0a\xa3\x80\x02\x08\x3a\x2b\xd6\x1f\x61\xc1\x76\
+\x17\xa8\x38\x84\x10\x9a\x27\x09\x21\x5c\x33\x0e\x78\x17\xf0\xf6\
+\xe2\x77\x51\xa1\xe3\x9d\x0d\x1c\x06\x1c\xec\xb0\x30\x9b\x26\xf8\
+\x35\x80\x89\xa6\x1b\x06\x52\x34\x08\x2c\xc5\xb6\x08\xfc\x13\xb8\
+\x87\xfc\xb3\x42\x04\xe0\x09\xe0\x8b\xc0\x17\xb0\xf8\x8c\x42\x08\
+\xa1\xf9\x93\x10\xa2\x12\xdd\xc0\x4b\x80\xcf\x00\x5b\xa9\x38\xca\
+\x33\x03\xdb\xd3\x7f\x38\x30\x2d\xb1\x4e\xbc\xee\xc1\xa2\x09\x83\
+\x55\xee\xcf\xd8\x04\xa1\xd7\x6a\xc8\xe7\xbb\xfa\x9c\x85\xc0\xd5\
+\xc0\xa5\xc0\x5c\x0d\x11\x55\x79\x1c\xf8\x38\xf0\x75\xe4\x64\x21\
+\x84\x90\x01\x40\x08\x51\x92\x53\x80\xcf\x03\xbb\xa9\x28\xca\x31\
+\x0e\x73\xed\x3f\x0a\x98\x99\x50\xc7\xad\x54\x80\x7a\x06\x09\xea\
+\xf4\x9f\xa1\x95\xd0\x67\xdc\x5f\x18\x02\xae\x40\xcb\xd8\x15\xb9\
+\x09\xf3\xd6\xfb\x87\x8a\x42\x08\xa1\x39\x8a\x10\xa2\x5d\x76\x05\
+\x3e\x07\x9c\xa6\xa2\x28\xd7\xb1\xee\x86\xed\xeb\x3f\x08\x0b\xee\
+\x17\x7b\x67\xad\x54\x80\x1a\x34\x25\xb2\xf3\xbf\xdf\x56\x02\xd7\
+\x5f\x5f\x28\xd8\xcb\xb0\x9c\x77\x5a\xca\x2e\xcd\x79\xc0\x3b\xb1\
+\xb0\x0b\x42\x08\xa1\xb9\x8c\x10\xa2\x4f\xa6\x63\x91\xfd\x5f\x8d\
+\x22\xfb\x77\xcc\x56\x6c\x5a\xed\x9f\x22\xd1\x9f\xe4\x80\xa3\x41\
+\x51\x06\x82\xa6\xdc\x63\x0a\xc6\x80\xc5\xc0\x55\xc0\xc5\xc0\x03\
+\xaa\xc6\x65\xd8\x08\xfc\x0c\x78\x37\x30\x5f\xc5\x21\x84\xd0\x5c\
+\x47\x08\xd1\xc3\x68\xe0\xbf\x80\xf7\x03\xe3\x55\x1c\xed\x33\x0a\
+\x4b\xdd\x77\x24\xb6\xea\x5f\xb5\x53\xf5\xd9\x29\x4b\xf0\x6b\xe0\
+\x13\xe9\x18\x07\x72\x32\x08\xb8\xb8\xf6\x7d\xc0\x85\x58\xf0\xc0\
+\xd5\xaa\xb6\x9d\xb2\x02\x8b\x0d\xf0\x71\xb4\xc3\x42\x08\x19\x00\
+\x54\x04\x42\x34\x9a\x6e\xe0\xe5\xc5\xa4\x60\xba\x8a\xa3\x7d\x76\
+\x04\x8e\xc7\xa2\xf8\x57\x75\xf1\xcf\x45\xf4\x2b\x15\xa0\x90\x71\
+\x20\x8f\x7b\x89\xd9\x18\xb0\x06\xf8\x17\x70\x01\x70\xaf\xaa\x68\
+\xa7\x3c\x80\x19\xfa\x7f\x86\x12\x30\x08\x21\x03\x80\x10\xa2\x71\
+\xec\x0f\x7c\x0d\xf3\x5a\x17\x6d\x30\x0c\xdb\xd3\xff\x34\x60\x96\
+\x44\x7f\x34\x03\x88\x06\x32\xd1\x44\xa3\x40\x2b\x83\xcf\xa9\x7a\
+\x6d\x79\x05\x94\xe6\x6a\xcc\xeb\xef\x5f\x2a\x0a\x21\x64\x00\x10\
+\x42\xe4\xcf\x64\xe0\xc3\xc0\x9b\x31\x0f\x00\x31\x08\x5b\x63\xfb\
+\xfa\x8f\x01\xc6\x46\xda\xe9\xe6\x9e\x19\xa0\x29\x03\x56\xae\xcf\
+\xa8\x14\x80\x79\x7c\x7e\x2b\xd2\xeb\xae\x2a\x94\xec\xb9\x28\x56\
+\x40\x07\xf4\xc4\x07\x78\x17\xf0\xa8\x8a\x43\x08\x19\x00\x84\x10\
+\xf9\x31\x14\x78\x15\xf0\xc9\xc2\x08\x20\x06\x29\xac\xfd\x80\xe3\
+\xa8\xbe\xb7\xdf\x47\x47\xab\x54\x80\x1a\x60\x25\xa8\xf5\x0c\x39\
+\x1a\x04\x5c\x79\x05\x5c\x0e\xac\x55\x33\x6a\x87\x25\xc0\xff\x00\
+\xdf\xc0\x92\x30\x08\x21\x64\x00\x10\x42\x64\xc0\xb1\xc0\x57\x81\
+\x3d\x54\x14\x03\x33\xa5\x10\xfd\x47\x53\x2d\x1a\xa2\x44\x7f\xbe\
+\x03\x91\x06\x4e\x89\xec\xd4\xee\xb7\x89\xc6\x80\xa5\xc0\x25\xc0\
+\xf9\xc0\x42\x35\x93\x76\xb8\x01\xdb\x16\x70\xa9\x8a\x42\x08\x19\
+\x00\x84\x10\xe9\x32\x1d\xf8\x34\xf0\x12\xb5\xf7\x81\xd9\x1e\x38\
+\x09\x0b\x88\x50\x25\xff\xa1\xeb\x42\xce\x2d\x15\x60\x0a\x03\x8f\
+\x1a\x8a\x0c\x04\x32\x08\xc4\x75\xfd\x56\xc5\x73\xaf\x07\xfe\x0e\
+\xdc\xa2\xe6\xd0\x0e\x7f\x05\xfe\x13\x98\xa7\xa2\x10\x42\x06\x00\
+\x21\x44\x3a\x0c\x03\xde\x04\x7c\x0c\x18\xa7\xe2\xe8\x9b\x1e\x37\
+\xff\x53\x80\xd9\x91\x75\xa4\xca\x0c\xa0\xc1\x4f\x34\xd7\x38\xa0\
+\x88\xff\x7e\xae\x79\x3f\x96\x3d\xe0\x32\x60\x9d\xaa\xff\x40\xac\
+\x04\x3e\x07\x7c\x0a\x4b\xbc\x20\x84\x90\x01\x40\x08\x11\x31\xc7\
+\x03\xdf\x02\x76\x52\x51\xf4\xcd\x38\xcc\xcd\xff\x04\x60\x8b\x88\
+\x3a\xd0\x94\x03\x04\xc6\x3a\xa8\x68\x90\x13\x39\x18\x06\x72\x30\
+\x08\xc4\xe4\x15\xb0\x18\x38\x0f\x8b\x15\xb0\x4c\xd5\x7d\x20\x6e\
+\x07\xde\x08\x5c\xa4\xa2\x10\x42\x06\x00\x21\x44\x7c\x4c\xc2\xac\
+\xf5\xaf\x55\xdb\xee\x9b\xad\x31\xeb\xc8\xb1\xc0\x70\x89\xfe\xac\
+\x06\x11\x55\x78\xd1\x24\xc3\x40\xea\x29\x00\x63\x31\x06\xac\xc7\
+\xb2\x07\x9c\x8d\xb2\x07\x0c\xc2\x6f\xb0\x6d\x01\x8f\xa9\x28\x84\
+\x90\x01\x40\x08\x11\x47\x3b\x7e\x35\xf0\x99\xc2\x08\x20\x36\x63\
+\x4f\xe0\x34\x60\xf7\x48\x3a\x4b\xa5\x02\xd4\xa0\x15\xea\x39\xd7\
+\x14\x22\x67\x03\x96\x2a\x0d\xcc\xf5\xb9\x27\x3a\xfa\x70\x6c\xbf\
+\x10\xc0\x68\x2c\x2f\xe8\x50\x60\x44\x66\x82\x39\x77\xc3\x40\x93\
+\x53\x00\xba\xb8\x56\x0b\x8b\x0f\x70\x16\x70\xb3\x86\xcc\xfe\x78\
+\x1c\xf8\x6f\xe0\xcc\x06\x35\x6d\x21\x34\xc7\x10\x42\x44\xc7\x4e\
+\xc0\xb7\x31\x8f\x76\xb1\x59\xe7\xb6\x0f\x70\x3a\xb0\x63\x24\x1d\
+\x64\x8a\x99\x01\x94\x0a\x30\xbe\x67\x68\x01\x8b\xb0\xa5\xb8\x47\
+\x8b\xd7\x52\xe0\x09\xcc\x9d\x79\x19\xb0\xbc\xf8\x59\x76\x9f\xf3\
+\x30\x6c\xab\xcc\xd8\xe2\xe7\x38\x2c\x2b\xc6\x04\x60\x6a\xf1\xda\
+\x12\xb3\x38\xfa\x7a\x46\x19\x05\xe2\xfd\xec\x56\x02\xd7\x2c\x7b\
+\xbd\x79\x98\x47\xc0\xbf\x30\xc3\x99\x78\x0a\x97\x02\x6f\x00\x6e\
+\x55\x51\x08\xa1\xb9\x89\x10\x22\x1c\xa3\x80\xf7\x00\xef\xc5\xdd\
+\x62\x5d\x16\x0c\x05\x0e\x2e\x84\xff\xd6\x11\x74\x8c\x12\xfd\xf9\
+\x0e\x46\xbe\xef\x79\x3d\xf0\x60\x21\x48\xe6\x16\x3f\x1f\xc5\x96\
+\xe1\xd6\x47\xd4\xde\xb6\x2c\x5e\xdb\x01\x33\x8b\x9f\xdb\x14\xef\
+\xe5\x2a\xb0\x53\xba\xe7\xa6\x1b\x03\xca\x5e\xeb\x31\xe0\x6f\xd8\
+\xe6\xf7\xb5\x1a\x5a\x37\x67\x1d\xf0\x45\xe0\x7f\x80\xd5\x2a\x0e\
+\x21\x34\x7f\x11\x42\xf8\xe5\x18\x6c\xd5\x7f\x17\x15\xc5\x26\x46\
+\x02\x47\x01\x4f\x07\x26\xd6\xdc\x21\x2a\x2b\x40\xfa\x83\x4f\xe8\
+\xfb\xdb\x00\xdc\x07\xdc\x09\xdc\x5d\x08\xfe\x47\x48\x77\x05\x72\
+\x08\x66\x80\x9b\x89\x65\xd8\x98\x53\xfc\x3e\x24\xf0\x7d\x28\x05\
+\x60\xd8\xcf\x8c\xd9\x18\x50\xf6\x3a\x4f\x60\x01\x03\xff\x01\xac\
+\xd0\x50\xbb\x39\xf7\x60\x19\x87\xfe\xa1\xa2\x10\x42\x06\x00\x21\
+\x84\x7b\xa6\x02\x5f\x02\x5e\xac\xa2\xd8\xc4\x44\xe0\x64\x2c\xb8\
+\xdf\xc8\xcc\x84\xbf\x52\x01\xe6\x7b\x5f\xab\xb0\xf0\xda\x77\x16\
+\x3f\xef\x21\xff\x5c\x5b\x23\x0a\x63\xc0\x2e\xc5\x6b\x4e\x85\x36\
+\x9b\xb3\x71\x40\x29\x00\xe3\x34\x04\xac\xc4\x52\x08\xfe\x0d\xdb\
+\x72\x23\x9e\x54\xa4\x3f\x05\xde\x81\x39\x28\x09\x21\x64\x00\x10\
+\x42\x38\xe0\x45\xc0\x57\x81\x29\x2a\x0a\x63\x0a\xf0\x4c\xe0\x48\
+\xca\xb9\x1a\x4b\xf4\x37\x67\x60\x89\xe5\x7e\x16\x00\xd7\x00\xd7\
+\x16\xa2\xbf\xe9\x79\xc8\xbb\xb1\x20\x26\xfb\x63\x81\x3a\xb7\x8f\
+\xe4\xbb\x6a\x6a\x0a\x40\x19\x03\xda\x63\x3d\x70\x31\xf0\x17\x60\
+\xa1\x86\xe2\xde\x3c\x0a\xbc\x19\xcb\x18\x20\x84\x90\x01\x40\x08\
+\x51\x92\x69\xc0\x37\x81\xe7\xa8\x28\x36\x09\xff\xa7\x61\x2b\xfe\
+\xb9\x08\x7f\xa5\x02\xcc\x73\x40\x5b\x07\xdc\x08\x5c\x0d\xdc\x20\
+\xb1\x30\x28\x93\xb1\xc0\x9d\x07\x00\x7b\xe1\x3f\x86\x40\xaa\x86\
+\x01\xa5\x00\x8c\xc3\x10\xb0\x01\xf8\x27\xf0\x47\xcc\xb8\x27\xfe\
+\x8f\xbf\x62\x41\x02\x1f\x52\x51\x08\x21\x03\x80\x10\xa2\x33\xce\
+\x00\xbe\x55\xcc\x8b\x25\xfc\x25\xfc\xa3\xe9\xd4\x95\x0a\xb0\x7f\
+\x36\x62\x6e\xfd\xff\x02\x2e\xc7\xf6\x0f\x8b\xce\x19\x83\x79\x06\
+\x1c\x02\xec\x1d\xa1\x31\x20\x26\xc3\x40\xaa\x29\x00\x65\x08\xc8\
+\x9a\x25\x58\xa0\xe2\xef\xaa\x28\x84\x90\x01\x40\x08\x31\x38\x5b\
+\x17\xc2\xff\x74\x15\xc5\x26\x57\xff\xa3\x28\x17\x40\xcc\x45\x27\
+\x27\xd1\x5f\xdf\x60\x91\xc2\x20\xd5\x02\x6e\x03\x2e\x01\xfe\x8d\
+\xa5\xe0\x13\xee\x18\x07\x1c\x58\xf4\x01\xbb\x26\x72\xcf\xad\x8c\
+\x3f\xb7\x09\xc6\x80\x2a\x86\x80\x3f\x01\xf3\xd5\x6c\x7b\x38\x07\
+\x78\x1d\x96\xd0\x44\x08\x21\x03\x80\x10\xa2\x0f\xce\xc0\x22\xfc\
+\x4f\x92\xf0\x97\xf0\xaf\xb3\xf3\x96\xe0\x1f\x9c\x15\xd8\x4a\xff\
+\x39\xc0\x03\xea\xbb\x82\xb0\x35\x70\x1c\x70\x34\x30\x21\xa1\xfb\
+\xce\xd5\x20\xd0\x8a\xf8\x7a\x32\x04\x44\xc3\x52\xe0\xdd\xc0\xf7\
+\x48\x33\x7b\xa7\x10\x32\x00\x08\x21\xbc\x30\xb3\x18\x1c\x4f\x6c\
+\x7a\x41\x6c\x89\x05\x3c\x38\xb4\x84\xf0\x8f\xcd\xcd\x5f\xa2\x3f\
+\xed\x01\xa8\xab\x1f\x41\x70\x13\x70\x3e\xb6\xda\xbf\x5e\x7d\x57\
+\x2d\x0c\x05\x0e\xc2\xb6\x04\xed\x31\xc0\x77\x25\xa3\x80\x8c\x01\
+\x75\x5d\x67\x03\xb6\x0d\xe8\x0f\x28\x34\x7e\xc1\xdf\x80\xd7\x03\
+\xf3\x54\x14\x42\xc8\x00\x20\x44\xd3\xdb\xe0\xeb\x80\xcf\x61\x9e\
+\xae\x8d\x65\x02\xb6\xe7\xe1\x58\x3a\xdf\xef\x1b\xd3\x6a\x7f\x4a\
+\x2e\xfe\x12\xfc\xed\xdf\xd3\xfa\x62\x32\xff\x67\xb4\xda\x1f\x1b\
+\x5b\x63\xa9\x40\x4f\x00\x86\x47\x2a\xbe\x9b\x64\x10\x88\x79\x8b\
+\x40\x1d\x5e\x01\xeb\xb1\xf4\x81\x7f\x42\x31\x41\x8a\x22\x78\x27\
+\xf0\xff\x54\x14\x42\xc8\x00\x20\x44\x13\x99\x86\xad\xfa\x3f\xa3\
+\xc9\x85\x30\xb2\x98\xb8\x3f\x13\x18\x25\xe1\x9f\x8d\xe8\xcf\x25\
+\x15\xe0\x4a\xe0\xa2\x42\xf8\x2f\x52\x9f\x15\x35\x13\x80\x93\xb0\
+\x60\xa1\x65\xad\xa9\x4a\x01\x18\xf7\x75\x53\x36\x04\xac\x01\xce\
+\xc5\xd2\x07\xae\x54\x73\xfd\x3b\xf0\x2a\xe0\x61\x15\x85\x10\x32\
+\x00\x08\xd1\x14\x9e\x8b\xed\xf5\x9f\xd2\xd4\x02\x18\x0e\x1c\x83\
+\xad\xfa\x8f\x97\xf0\x97\xe8\x8f\xec\x1e\x16\x63\x51\xbd\x2f\x28\
+\x26\xee\x22\x1d\x46\x62\x71\x02\x4e\x07\x26\x26\x26\xc4\x65\x0c\
+\xc8\xdf\x10\xb0\x1c\x38\x0b\xf8\x07\xb0\xb6\xd9\x4d\xf5\x31\x6c\
+\x4b\xc0\x1f\xd4\x6b\x09\x21\x03\x80\x10\x39\x33\x1e\x73\xf7\x7f\
+\x5d\x53\x0b\x60\x08\x16\xd8\xef\xd9\x25\x26\xe7\xb1\x08\x7f\x89\
+\xfe\x38\x06\x10\x1f\x9f\xbf\x0c\x5b\xed\x3f\x47\x93\xf3\xe4\x19\
+\x86\x05\x0b\x7c\x3e\xb0\x45\xc2\x82\xbc\xce\xcf\x6f\x8a\x31\xa0\
+\x8e\x6b\x2c\x06\xfe\x8a\x19\x19\x1b\x1e\x4b\xe4\x37\x85\x21\x60\
+\xb1\x7a\x2d\x21\x64\x00\x10\x22\x37\x8e\x03\x7e\x08\x6c\xd7\xd4\
+\xce\xe6\x50\xcc\xf5\x61\xaa\x84\x7f\x92\xe9\x00\x73\xce\x0c\xb0\
+\xbc\x10\xfd\x7f\x05\x56\xa9\xaf\xca\x8a\x11\x45\xe7\xfb\x1c\xc2\
+\x64\x0e\x50\xc4\x7f\x19\x02\x3a\x61\x3e\xf0\x3b\xe0\x4a\x1a\x1d\
+\x22\xff\x7e\xe0\x15\xc0\xc5\xea\xb1\x84\x90\x01\x40\x88\x1c\x18\
+\x09\xfc\x0f\xf0\xdf\x40\x77\x13\x0b\x60\x36\xf0\x62\x60\xa7\xc0\
+\x1d\x54\xee\x59\x01\x7c\x77\xe2\x4d\x48\x05\xb8\xae\x10\xfd\x7f\
+\x94\xf0\xcf\x9e\x51\xc0\xb3\x80\xa7\x63\xde\x01\xb9\x08\xf3\x3a\
+\x3e\x37\xf7\x40\x7f\x2e\xae\xd3\xe9\xf9\xf7\x01\x3f\x07\x6e\x6f\
+\x6e\x13\x6d\x01\x5f\xc3\x52\x06\x6a\xe7\x95\x10\x32\x00\x08\x91\
+\x2c\x7b\x02\x3f\x01\xf6\x6e\xe2\xc3\x6f\x05\x9c\x81\xa5\xeb\x4a\
+\x4d\xf8\xc7\xbc\xda\x9f\x93\xe8\xaf\x73\x10\xba\x06\xf8\x11\xb0\
+\x40\xfd\x54\xa3\x98\x0c\xbc\x10\xdb\x1e\x50\xa7\xd2\x91\x31\xc0\
+\xff\xf5\x62\xf0\x0a\xe8\xf4\xfc\xeb\x80\x9f\x35\xbb\x5f\xba\x05\
+\x78\x69\x51\x14\x42\x08\x19\x00\x84\x48\x86\x6e\xe0\x3d\xc0\x47\
+\x09\xbb\xd8\x14\x05\xe3\xb0\x95\xb6\xe3\xb1\x3d\xff\xa1\x3a\x25\
+\x65\x05\x88\x7f\x20\x88\x61\xd0\xb9\x0f\x38\x13\xb8\x55\xfd\x54\
+\xa3\xd9\x1d\xf3\x39\x9e\x19\xc1\xbd\xb4\x32\xf9\x2c\x45\xfd\x77\
+\x73\xee\x7a\xe0\x3c\x2c\x75\xe0\xf2\x66\x36\xcf\xb5\xc0\x07\x81\
+\x2f\x00\x1b\xd5\x5b\x09\x21\x03\x80\x10\xb1\x33\xad\xd0\x17\x27\
+\x37\xed\xc1\x87\x14\xa2\xff\xb9\xc0\x68\x09\xff\x68\x3b\xe8\xa6\
+\x09\xfe\x1e\x56\x61\x2b\x6b\xe7\xd2\xe8\xbd\xb6\xa2\x17\xdd\xc0\
+\x89\xc0\x7f\x60\x7b\xb5\x62\x21\x07\x83\x80\xa2\xfe\x57\x3f\x77\
+\x05\xb6\x45\xe9\x6f\x34\x36\x50\xe0\x05\x98\x37\x80\xd2\x05\x0a\
+\x21\x03\x80\x10\xd1\x72\x22\xf0\x63\xcc\xfb\xbd\x51\xec\x0b\xbc\
+\x84\xb0\x01\xfe\x14\x1c\x30\xbe\xce\x3e\xd6\x54\x80\xd7\x00\xdf\
+\x03\x16\xaa\x8f\x12\x7d\x30\xba\x50\x19\x27\xd4\x2c\xc6\xeb\x36\
+\x08\x28\xea\x7f\x9c\x86\x80\x85\x58\xa8\xfc\x2b\x68\xa4\xf1\xf2\
+\x31\xcc\x59\xe7\x6c\xf5\x54\x42\xc8\x00\x20\x44\x4c\x8c\x00\x3e\
+\x0d\xbc\xb5\x69\xed\x6a\xc7\x42\xf8\xcf\x4e\x48\xf8\x37\x65\xb5\
+\x5f\xa9\x00\x61\x29\x66\x91\xbb\x44\x7d\x94\x68\x83\x91\x58\x6c\
+\x80\x83\x80\xdd\x80\xa1\x35\x0b\xf2\x3a\x0d\x02\x4d\x88\xfa\xef\
+\xe2\x3a\x21\x0d\x01\x77\x62\x41\x85\xee\x6f\x5e\xd3\x6c\x61\xdb\
+\x01\x3e\x80\x32\xb4\x0a\x21\x03\x80\x10\x11\xb0\x33\xf0\x4b\x6c\
+\x11\xbc\x31\x8c\xc5\xf6\xf9\x9f\x48\x67\xa9\x0d\x52\x17\xfe\x4a\
+\x05\x98\xce\x80\x75\x21\xb6\x17\x67\x85\xfa\x28\x51\x82\x51\x58\
+\xf4\xd6\x03\x80\xfd\xb0\xd8\x26\x75\x8b\xf2\xba\x3e\x5b\x29\x00\
+\xe3\x31\x04\xb4\x80\xcb\x81\x5f\x00\x4f\x34\xaf\x59\x5e\x03\xbc\
+\x08\xb8\x4b\x3d\x94\x10\x32\x00\x08\x51\x17\x2f\x03\xbe\x51\xe8\
+\xe1\x46\x30\x04\x38\x0a\x8b\xee\x3f\xae\x83\xf3\x24\xfc\xfd\x75\
+\xbc\x39\x8a\xfe\x2a\x9f\xb9\x02\x73\xf7\xbf\x5c\xfd\x93\x70\x44\
+\x37\x66\xe9\xdd\x1f\x38\x10\x98\x11\x89\x30\xcf\xc1\x18\x20\x43\
+\x40\xb9\x73\x57\x00\xbf\xc7\x82\x05\x36\x2c\x4a\xde\x32\xe0\x4d\
+\xc0\x4f\xd5\x33\x09\x21\x03\x80\x10\x21\x19\x07\x7c\x13\xf3\x7e\
+\x6f\x0c\x73\x30\x8b\xc7\xb6\x12\xfe\x59\x8b\xfe\x94\x53\x01\xde\
+\x04\x7c\x1d\x58\xa4\x3e\x4a\x78\x64\x5a\x61\x0c\x38\x14\xd8\xa5\
+\xc3\x3a\xac\x14\x80\xfe\xaf\xd7\x24\x43\xc0\x5c\x6c\x5b\xc0\x1d\
+\xcd\x6b\x86\x3f\x29\x0c\x01\x0d\x4d\x94\x20\x84\x0c\x00\x42\x84\
+\xe4\x00\xcc\xfb\x6e\x76\x53\x1e\x78\x12\xe6\x73\x77\x48\xa0\x0e\
+\x46\xc2\x3f\x6f\xd1\xef\xe3\xb3\xd6\x01\xbf\xc6\xd2\x66\x29\xc2\
+\xbf\x08\xc9\xc4\x62\x50\x38\x18\xd8\x83\xce\x53\x9f\x2a\x05\xa0\
+\x0c\x01\x55\xcf\x6b\x61\x01\x02\x7f\x05\x2c\x6e\x56\xf3\xbb\x13\
+\x78\x21\x70\x9d\x7a\x22\x21\x64\x00\x10\xc2\x17\x2f\x03\xbe\x8d\
+\x6d\x0f\xcd\x9e\x9e\xb4\x7e\x67\xd0\x59\x8a\xac\xba\x56\xfd\x73\
+\x0c\x0e\xe8\xb3\xa3\xce\x25\x33\xc0\x02\xe0\xf3\x34\x32\x30\x96\
+\x88\x8c\xb1\x58\xbc\x80\x43\xb1\xa0\x30\x43\x4a\x5c\x43\x11\xff\
+\xe3\x34\x06\xb4\x12\x38\x77\x0d\x70\x16\xf0\x17\x1a\x95\x36\x70\
+\x0d\xf0\x1e\xe0\x2b\xea\x81\x84\x90\x01\x40\x08\x97\x8c\x01\xbe\
+\x83\xa5\x8b\x6e\x04\xbb\x63\x79\x77\x3a\xc9\x67\x28\xe1\x2f\xd1\
+\x1f\x7a\x60\xb9\x0e\xf8\x2a\xf2\x01\x15\xf1\x31\xae\x30\x02\x54\
+\x31\x06\x84\x32\x08\x34\x25\xfd\x5f\x53\x0c\x01\x0f\x63\x01\x50\
+\x6f\x6d\x56\x93\x3b\x13\xdb\x12\xb0\x52\xbd\x8f\x10\x32\x00\x08\
+\x51\x95\x9d\x81\xdf\x02\x7b\x36\xe1\x61\xc7\x02\xcf\x07\x8e\xe9\
+\xa0\x83\x68\xb2\xf0\x97\xe8\xaf\x67\x20\x69\x61\xee\xfe\x3f\x47\
+\x2e\xff\x22\x0d\x63\xc0\xc1\x58\x8a\xc1\x5d\x2a\xb6\x99\x14\x23\
+\xfe\xc7\x68\x0c\x68\x82\x21\xe0\x2a\xe0\x47\x58\xd4\xbc\x86\x70\
+\x1b\xf0\x3c\x1a\x67\xfb\x10\x42\x06\x00\x21\x5c\xf2\x6c\xe0\x87\
+\xc0\x84\x26\x74\x06\x87\x61\x2e\x0e\x21\xa2\xfb\x4b\xf8\xfb\xed\
+\x88\x73\x4d\x07\xd8\x05\xac\xc2\x02\xfd\x5d\xa9\xfe\x49\x24\xc8\
+\x14\xe0\x08\xcc\xc8\x3a\xa3\xe2\xb5\x94\xfe\xaf\x99\x86\x80\x32\
+\xd9\x02\xce\xa5\x31\xc6\xd2\x65\xc0\x6b\xb1\x90\x08\x42\x08\x19\
+\x00\x84\x68\x9b\xa1\xc0\xc7\xb1\x7d\x65\xd9\xb3\x15\xf0\x4a\x60\
+\x37\x09\xff\x60\x9d\x66\x6a\xa2\x3f\x96\x54\x80\x8f\x02\x9f\x00\
+\x1e\x52\x1f\x25\x32\x60\x1b\xcc\x2b\xe0\x58\xdc\x58\x99\x53\x8a\
+\xf8\xef\xf2\x9a\x32\x04\x0c\xce\x1d\xd8\x6a\x46\x83\xfa\xce\xef\
+\x02\xff\x05\xac\x55\x4f\x23\x84\x0c\x00\x42\xb4\x33\x27\xfb\x35\
+\xb6\x75\x33\x6b\x86\x03\xa7\x01\xcf\xc4\x2c\x1e\xb1\x0a\x78\x09\
+\xff\x66\x88\xfe\xc1\x3e\xef\x6e\xe0\xd3\xc0\x12\xf5\x51\x22\x33\
+\xba\xb1\x0c\x02\x27\x00\x07\x76\xd0\x1f\xe7\x62\x0c\x90\x21\x20\
+\x8c\x01\x61\x03\x70\x0e\xe6\x11\xb0\xae\x19\x4d\xeb\xdf\xd8\xae\
+\xc6\xfb\xd5\xcb\x08\x21\x03\x80\x10\xfd\x71\x1c\xb6\xad\x78\x5a\
+\xee\x0f\xba\x2b\xb6\xea\xbf\x75\xc4\x02\xbe\x6e\xe1\xaf\xac\x00\
+\xf1\x0c\x3e\x57\x62\xc1\xfe\xd6\xa8\x8f\x12\x99\x33\x06\xb3\x3e\
+\x1f\x0d\xcc\x89\x58\xb4\xe7\x6e\x0c\x48\xcd\x10\xd0\xc9\x79\x8f\
+\x62\xb1\x01\x6e\x6a\x46\x93\x7a\x1c\x78\x09\xf0\x77\xf5\x2e\x42\
+\x18\x43\x54\x04\x42\xfc\x9f\x1e\xf9\x30\xf0\x7d\x3a\xdb\x02\x9f\
+\x1c\xe3\x80\x57\x03\x2f\xee\xe0\x41\xbb\x4a\x8a\xc3\xb2\xe7\x55\
+\x15\xa3\x5d\x35\x9f\xef\xfa\x3a\xbd\xaf\xe5\xc3\x98\xe0\xe3\xba\
+\x03\x7d\x4e\xa7\x9f\x75\x16\xf0\x4d\x1a\x95\xd6\x4a\x34\x98\x75\
+\xc0\xbd\xc0\x85\xc0\xbf\xb0\x55\xdb\xe9\x98\xc7\x56\x13\xfa\x90\
+\x58\xfa\x5f\x17\xe7\x87\xfc\xdc\x4e\xce\x1b\x83\xc5\xfc\x99\x8a\
+\x6d\x0d\xc8\xdc\x47\x7e\x34\xf0\xa2\x62\x08\xb9\x4c\x3d\x8c\x10\
+\xf2\x00\x10\x02\x2c\xf0\xfd\x8f\x80\xe7\xe6\xfe\xa0\xfb\x62\xab\
+\xfe\x13\x03\x4c\x60\x48\xec\x5c\x57\x1d\x62\x0a\xab\xfd\xa9\xa4\
+\x02\x6c\x01\x3f\x01\xfe\xac\x3e\x4a\x34\x9c\x61\xc0\x01\xd8\x16\
+\x81\xbd\x1c\x5f\x3b\xf6\x40\x7f\xae\xae\xd7\x84\xa8\xff\x65\xce\
+\x5b\x0a\xfc\x18\xcb\x18\xd0\x00\xfe\x82\x79\x03\x3c\xa1\x5e\x45\
+\xc8\x00\x20\x44\x73\x99\x0d\xfc\x01\xdb\x7e\x99\x2d\xe3\x81\x97\
+\x03\x07\x05\xe8\x1c\x14\x1c\x50\xa2\xdf\xd5\x84\xff\x87\xc0\xd9\
+\xea\xa3\x84\x78\x12\x33\xb0\x0c\x02\xc7\xe3\xde\x5d\x4d\x51\xff\
+\xd3\x16\xf3\x55\xce\x6b\x50\xca\xc0\x9b\x80\x67\x61\x8e\x36\x42\
+\xc8\x00\x20\x44\xc3\x38\x19\xf8\x05\xed\x2f\x88\x27\xc9\x41\xc0\
+\x2b\xe8\xcc\xdd\x5f\xc2\x3f\x7c\x27\xaa\x54\x80\x9b\xd8\x08\x7c\
+\x1b\xb8\x40\x7d\x94\x10\xfd\xe2\xd3\x2b\x20\x76\x63\x80\x0c\x01\
+\x7e\xce\x5b\x81\xe5\xce\xbb\x30\xff\xe6\xb3\x08\x78\x21\x96\x1d\
+\x51\x88\xc6\xa1\x18\x00\xa2\xa9\xbc\x15\x38\x13\xdb\x1b\x96\x25\
+\x13\x80\x37\x00\xcf\x06\x46\x78\x14\x74\x75\xc5\x07\xa8\x7b\x8f\
+\x7f\x8c\x71\x02\x7a\x5f\xcf\x97\x41\xc1\x77\xcc\x80\x0d\xc0\x97\
+\x81\x4b\xd5\x47\x09\x31\x20\x1b\x81\x07\x81\x4b\xb0\x50\xe7\x43\
+\xb1\x14\x36\x43\x3c\xb4\x77\xd7\x7d\x48\x0c\xd7\xa9\x73\x1c\x09\
+\x3d\x6e\xb6\x7b\xce\x70\x6c\xab\xe0\x0e\xc0\xed\xc0\xea\x7c\x9b\
+\xcf\x28\x2c\x14\xd2\x1a\xe0\x72\xf5\x26\xa2\x69\xc8\x03\x40\x34\
+\x8d\x91\xc0\x77\x80\x97\xe5\xfc\x90\x07\x61\x7b\xfd\xc7\x7a\xee\
+\x08\x94\x15\x20\x8e\x8e\x37\x97\x54\x80\x1b\x80\x2f\xd0\x98\xbd\
+\xa8\x42\x38\x67\x0c\x96\x3d\xe0\x99\xc0\x64\x4f\x9f\xa1\xa8\xff\
+\x6e\xcf\x8f\xf5\xbc\x95\xc0\x2f\x69\x84\x37\xc0\x2f\xb1\xd8\xc8\
+\x2b\xd5\x83\x08\x19\x00\x84\xc8\x8f\x59\xd8\x7e\xff\x7d\x72\x7d\
+\xc0\xc9\xc0\xab\xe8\xcc\x1d\xd4\xe7\x6a\x82\x84\xbf\xbf\x0e\x37\
+\x17\xd1\xdf\xf3\x59\x1b\x81\xaf\xa0\x10\xcd\x42\xb8\x60\x08\x66\
+\x08\x3e\x0d\xd8\xc5\xe3\xe7\xb4\x22\xbc\x96\x0c\x01\x6e\xcf\xb9\
+\x1e\xf8\x01\xb0\x38\xef\x26\x73\x2d\xe6\x30\x39\x4f\xbd\x87\x90\
+\x01\x40\x88\x7c\x38\x0e\xdb\xda\x36\x25\xd7\x07\x3c\x0c\x0b\xf4\
+\x37\xda\x63\xe3\x57\x56\x80\x7c\x85\x7f\x9d\x41\x02\x5b\x98\x5b\
+\x8e\x36\x63\x0a\xe1\x9e\x1d\x0a\x43\xc0\x11\x40\xb7\x0c\x01\x41\
+\xce\x4f\x25\x3e\x40\x27\xb1\x01\x7e\x84\xa5\xa5\xcc\x98\x47\x81\
+\xe7\x03\x17\xab\xd7\x10\xb9\xa3\x18\x00\xa2\x09\xbc\x06\x0b\xf6\
+\x37\x2e\xc7\x87\x1b\x8d\xf9\xae\x3d\x07\x0b\x0a\xd5\x8e\x08\x0b\
+\x25\xfe\xeb\xda\xe7\x1f\x53\x8c\x00\x97\xfb\x5d\x7d\xc5\x0a\xf0\
+\xed\x4d\x30\xd8\x67\x9c\x09\x9c\xa3\x7e\x4a\x08\x2f\x2c\xc6\xb6\
+\xd5\x5c\x80\x25\x42\xdf\x0e\x8b\x0b\x13\x6b\xec\x11\x57\xd7\x4a\
+\x71\x8f\x7f\xac\x63\xf4\x70\xcc\xa3\x64\x1b\xe0\x56\x60\x6d\x9e\
+\x4d\x65\x0c\x96\x22\x70\x21\x16\x56\x43\x08\x19\x00\x84\x48\xb4\
+\x7e\x7f\x0a\xf8\x4c\xae\x75\x7d\x0f\xe0\x3d\xc0\xce\x11\x8a\xf8\
+\xa6\x0b\x7f\x97\x93\xea\x18\x27\xe9\xae\x0c\x0b\x3f\x05\xfe\xa4\
+\xbe\x4a\x08\xef\xac\xc2\xf2\x9f\xfd\x0d\x58\x02\x6c\x5b\x28\x9e\
+\x58\x03\xfd\xc5\xd2\x27\xd7\x69\x08\x88\x6d\xbc\x9e\x01\x1c\x09\
+\x3c\x0c\xcc\xcf\xb3\x99\x74\x63\x0e\x33\x93\x80\x7f\xe0\x27\x19\
+\x86\x10\xb5\xa3\x2d\x00\x22\x57\xc6\x02\x3f\xc3\x62\x21\x65\xc7\
+\x70\x6c\xb3\xda\x69\x6d\x36\xe2\xdc\xf7\xf9\x2b\x1d\x60\x7d\x9d\
+\x7c\x95\xeb\x9f\x8b\xa5\xfb\x13\x42\x84\x67\x08\xb6\x2d\xe0\xd9\
+\xd8\xca\x6e\x6f\x72\x0d\xf4\xe7\xe2\x1a\x39\xa6\xff\xeb\xf4\x9c\
+\x16\x70\x51\x31\xc9\x5a\x93\x6f\x13\x39\x07\x4b\x15\xf8\x84\x7a\
+\x0b\x21\x03\x80\x10\xf1\x33\x03\xf8\x33\xb0\x5f\x8e\x0f\xb7\x23\
+\xf0\x7a\x60\x6b\x8f\x8d\xbc\x09\xf1\x01\x62\x31\x1c\xf8\xea\x88\
+\x63\x0f\x12\x78\x2d\xf0\x69\x2c\xf2\xbf\x10\xa2\xde\x89\xe0\x7e\
+\xc0\x73\x79\xaa\x37\x99\x8f\xe5\xcf\xa6\x07\xfb\x8b\x51\xd0\x97\
+\x3d\xe7\x61\xcc\x88\x7b\x5f\xbe\xcd\xe3\x46\xe0\x19\x28\x38\xa0\
+\x90\x01\x40\x88\xa8\x39\x18\xf8\x23\xb0\x55\x6e\x0f\x36\x04\x38\
+\x05\x78\x1e\xed\xed\x67\xc8\x79\xd5\x5f\xc2\x3f\x6c\x87\xee\xfa\
+\xba\xf7\x02\x1f\x22\xeb\x1c\xd3\x42\x24\xc9\x1c\xe0\x59\xc0\xfe\
+\x7d\xb4\x7b\xa5\xff\xab\x5f\xcc\xc7\x68\x3c\xd8\x80\x2d\x95\xff\
+\x96\x6c\x0d\xba\x8f\x00\xa7\xa3\xb8\x00\x42\x06\x00\x21\xa2\xe4\
+\xf9\x58\xa0\xda\x51\xb9\x3d\xd8\x34\xe0\x3f\x81\xed\x3d\x36\x6c\
+\xa5\x03\x4c\x53\xf8\xa7\x96\x15\x60\x11\xf0\x4e\xe4\x53\x29\x44\
+\xcc\xcc\x02\xce\xc0\x02\xbf\x75\x79\x14\xef\x32\x04\xe4\xe3\x0d\
+\x70\x37\xf0\x4d\xe0\xb1\x3c\x9b\xc4\x4a\xe0\x65\xc0\xef\xd4\x3b\
+\x88\x1c\x50\x10\x40\x91\x03\x5d\x58\x2c\xbc\x6f\x61\xdb\xe3\xb3\
+\xe2\xa0\x42\x30\x4d\xf5\x24\xdc\xba\x02\x9d\x53\xe5\xbc\xaa\x82\
+\x54\x59\x01\xea\xbd\x6e\x0f\xab\x81\xf7\x61\x21\x96\x85\x10\xf1\
+\xb2\x04\xb8\x02\xb8\x12\x18\x09\xcc\xdc\xac\x5f\x50\xd4\x7f\x77\
+\x63\x54\xc8\xf1\xb4\xec\x39\xed\x30\x09\x38\xaa\xe8\xdf\x1f\xc8\
+\xaf\x49\x0c\xc3\x6c\x62\x5d\x58\xf8\x03\x21\x64\x00\x10\xa2\x46\
+\x46\x60\xab\xfe\xef\x20\x33\x8f\x96\x91\x58\x7a\xbf\x33\xf0\x97\
+\xde\x4f\xe9\x00\xc3\x09\x7f\x97\x02\x3d\x25\xd1\xdf\xbb\xce\x7c\
+\x19\xb8\x4d\x7d\x96\x10\xc9\xb0\x14\x4b\x21\xd8\x9f\x21\x20\xc6\
+\x3e\x4e\xe9\xff\xdc\x9f\xd3\xee\xbd\x0d\x03\x0e\x04\x26\x03\xb7\
+\x90\xdd\x96\x80\x2e\xe0\x18\xcc\x19\xf3\x6c\x14\xc2\x46\x24\x5e\
+\x99\x85\x48\x95\x2d\xb0\xfd\xfe\x47\xe7\xf6\x60\xb3\x30\x97\xff\
+\xad\x3c\x35\x64\x65\x05\xf0\xdf\x31\x36\x35\x40\x60\x7f\xd7\xff\
+\x13\x70\xa6\xfa\x2c\x21\x92\x66\x3b\xcc\x28\x7d\xc8\x20\xfd\x88\
+\xa2\xfe\x57\x3b\x37\xe6\x6d\x01\xed\x1e\xff\x08\xf0\x0d\x60\x6e\
+\x9e\x4d\xe1\x42\x2c\x81\xc6\x52\xf5\x0a\x42\x06\x00\x21\xc2\x31\
+\x1d\xb3\xc0\xee\x9d\x5b\x83\x3c\x11\x78\x11\x30\x34\x22\x21\xaf\
+\xac\x00\xe1\x3b\xd4\x9c\xd2\x01\xde\x0c\xfc\x0f\xb0\x51\xfd\x96\
+\x10\x32\x04\x24\x28\xe4\x53\x32\x04\xc4\x74\xce\x7a\xe0\x17\x58\
+\xca\xd7\x56\x7e\xcd\xe0\x66\xe0\x54\xb2\xdc\xf1\x20\x64\x00\x10\
+\x22\x3e\x76\xc7\x82\xce\x6e\x9b\xd3\x43\x8d\x03\x5e\x0b\xec\xeb\
+\xa9\xf1\x4a\xf8\xfb\xeb\x04\x9b\x96\x15\xa0\x93\x6b\x3f\x0e\xbc\
+\x0b\x05\xfd\x13\x22\x47\x76\x00\xfe\x83\xf6\x2c\xf1\xb9\x78\x05\
+\xc8\x10\xd0\xf9\xf1\xd7\x02\xdf\x03\x96\xe7\xd7\x04\x1e\x2e\x8c\
+\x00\x37\xa8\x37\x10\x32\x00\x08\xe1\x8f\x63\x81\x3f\x00\x13\x72\
+\x7a\xa8\xdd\x80\x37\x00\x13\x13\x17\xf2\x4d\xda\x26\x10\xab\xf0\
+\x8f\x41\xf4\xf7\xb0\x01\x4b\xf7\x77\xbb\xfa\x2d\xef\x0c\xc1\xb2\
+\x85\x4c\xc3\x02\x86\x4e\xc5\xf6\xe1\x8e\xc7\x8c\x8b\xe3\x81\x31\
+\xc5\xb1\x43\xb1\xfd\xdc\x60\x81\x19\xd7\x17\xbf\x2f\xc7\x0c\x35\
+\xcb\x8a\xd7\x42\xe0\xd1\xe2\xb5\xa0\x78\x69\xd3\xab\xe8\x8b\x39\
+\xc0\x4b\x8a\x9f\x32\x04\x34\xcb\x08\xd0\xee\x39\x4b\x81\xef\x00\
+\x37\xe5\x57\xfd\x97\x60\xd9\x33\x2f\x56\x4f\x20\x64\x00\x10\xc2\
+\x3d\x2f\xc4\x02\xfe\x8d\xc8\xa9\x01\x3e\xbb\x18\x39\xba\x3c\x34\
+\x58\x09\xff\x38\xcf\xf7\xd1\xf9\xc6\x18\x2b\xe0\xd7\xc0\x2f\xd5\
+\x6f\x79\x11\xfb\x3b\x02\xbb\x60\xd1\xa8\x66\x62\x2e\xd9\xc3\x3c\
+\x7f\xee\x5a\xcc\xd7\x75\x2e\x70\x1f\x70\x07\x70\x8f\x8c\x02\xa2\
+\x17\xfb\x03\x2f\xc7\xf6\xe8\xa5\x20\xe2\xeb\x3c\xbf\x89\xde\x00\
+\x1b\x81\xdf\x03\x7f\x26\xbb\x2d\x01\xab\xb1\x34\x81\xbf\x51\x2f\
+\x20\x64\x00\x10\xc2\x1d\x6f\x05\xbe\x08\x74\xe7\xf2\x40\xe3\xb0\
+\x55\xff\xbd\x3c\x35\xd6\x1c\x3d\x05\xea\x3c\x37\x46\xe1\x1f\x73\
+\x80\xc0\x3b\x81\xf7\xa3\x7d\xff\x2e\xe8\x06\x76\x06\xf6\xc3\xf6\
+\x3f\xed\x44\x3c\xf9\x4e\xd7\x02\x77\x61\x11\xbf\xaf\x29\x7e\xd7\
+\x77\xde\x6c\x86\x00\xc7\x61\x31\x02\x26\x35\xc4\x10\x10\xfa\xdc\
+\xd4\xb7\x04\xdc\x8a\x05\x08\xcc\x6c\x6b\x58\x0b\x78\x2f\xf0\x59\
+\xf5\x02\x42\x06\x00\x21\xaa\xd7\xd1\x4f\x03\xef\xce\xe9\xa1\xb6\
+\x07\xde\x02\x4c\x69\x98\xf0\xaf\xe3\xbc\xba\x8d\x06\xb1\x5e\xc7\
+\xe7\x35\x57\x01\x6f\xc7\x5c\xc7\x45\x39\x46\x02\x07\x60\x41\xd6\
+\xf6\x01\xc6\x26\x72\xdf\xcb\x81\xeb\x81\x7f\x16\x06\x81\xd5\xfa\
+\x2a\x1b\xcb\x08\xe0\x14\xcc\xcb\x6d\x4c\x40\x43\x40\x6a\x62\x3e\
+\xf4\x79\xb1\x18\x02\x16\x02\x5f\x07\xee\xce\xaf\xea\x7f\xb5\x18\
+\x02\x65\x0b\x15\x32\x00\x08\x51\x72\xfe\xf0\x23\xcc\xf5\x3f\x1b\
+\x8e\xc5\xfc\xc4\x7c\x44\xf9\x0f\x95\x0f\x58\xc2\x3f\x7c\x07\x9b\
+\x52\x80\xc0\xaf\x61\x39\x92\x44\x67\x0c\xc1\x72\x68\x1f\x59\x88\
+\xff\xd4\xf7\x3a\xad\x01\xae\x06\x2e\x29\x7e\x6a\xab\x40\x33\x19\
+\x87\x79\x03\x9c\x5c\xd4\xf1\x10\x42\x5c\x86\x80\x34\x8c\x00\x1b\
+\x80\xdf\x02\x7f\xcd\xaf\xda\xff\x0e\x0b\x8b\x21\x1b\xa8\x90\x01\
+\x40\x88\x0e\x18\x83\x05\xfb\x3b\x31\x97\x07\x1a\x09\xbc\x1a\x5b\
+\xd1\x8b\x41\x98\x2b\x2b\x40\xfc\xc2\x3f\xc5\x54\x80\x57\x62\x2e\
+\x3b\xa2\x7d\xb6\x2e\x3a\xba\xe3\x68\x2f\x10\x68\x8a\x2c\x02\x2e\
+\xc0\xd2\x81\xcd\xd7\x57\xde\x48\xa6\x63\xf1\x01\xf6\x0f\x28\xc4\
+\x9b\x64\x08\x88\xc9\xc5\xbf\xd3\xe3\xaf\xc6\xb2\x04\xac\xcc\xab\
+\xca\x5f\x04\x3c\x13\x8b\xa9\x2a\x84\x0c\x00\x42\x0c\xc2\x24\xe0\
+\xac\x0e\xb4\x72\x12\x13\x9f\xb7\x00\x33\x12\x15\xf2\x21\x45\xbc\
+\x84\x7f\x3a\xc2\x7f\xf3\xeb\xae\xc0\x8c\x5c\x6b\xd4\x87\xb5\xc5\
+\x9e\x58\x00\xd0\xfd\x1b\x34\x18\xb7\xb0\xad\x01\x7f\x24\xcb\x68\
+\xe0\xa2\x0d\xf6\x02\x5e\x81\x05\xae\x94\x21\xa0\x7e\xe3\x41\x2c\
+\x86\x83\x47\x30\xef\xb1\x07\xf2\xaa\xee\x57\x63\x3b\x61\x1e\x57\
+\xcb\x17\x32\x00\x08\xd1\x3f\x5b\x03\x7f\x2f\xe6\xc6\x59\x70\x38\
+\xf0\x4a\xda\x73\xe7\xd5\xaa\x7f\x73\x85\x7f\xaa\xa2\xbf\x37\xef\
+\xc0\xa2\xc3\x8b\x81\xcb\xef\x70\xe0\x39\x58\x24\xff\x26\x73\x0f\
+\xe6\x27\x7b\x05\xd9\x45\x04\x17\x83\xd0\x13\x28\xf0\x45\x58\x8a\
+\xca\x26\x18\x02\xe4\x0d\x30\x38\x6b\x81\x1f\x93\x5d\x3e\xbd\xdb\
+\x80\x93\x80\x07\xd5\xf2\x85\x0c\x00\x42\x3c\x95\x9d\x30\x0f\xd1\
+\x99\xb9\x4c\x70\x5e\x0a\x1c\xef\xa1\x31\xc6\xba\xea\xdf\x24\xe1\
+\x1f\xe3\x6a\x7f\x1d\xa2\xbf\x67\x62\xf7\x25\xe0\x52\xf5\x61\x03\
+\xb2\x37\xb6\xf2\xb9\x83\x8a\xe2\x49\xcc\xc3\xd2\x45\xca\x10\xd0\
+\x3c\xc6\x62\x5e\x30\x4f\xa7\xbd\xb8\x38\xae\x8d\x01\x32\x04\x84\
+\xfd\x8c\x76\x8f\xfd\x07\xf0\x73\xb2\x8a\x1b\x72\x1f\xb6\xd3\xeb\
+\x1e\xb5\x7a\x21\x03\x80\x10\x9b\xd8\xbd\xe8\xf3\xa7\xe7\xf0\x30\
+\xe3\x80\x37\x03\xbb\x45\x20\xcc\x95\x0e\x30\x6f\xe1\x5f\x97\xe8\
+\xef\x61\x1d\x16\xf2\xf8\x32\xf5\x61\xfd\xb2\x1b\xb6\x35\x62\xb6\
+\x8a\x62\x40\xee\x02\xbe\x8f\x2d\x97\x89\x66\xb1\x2d\xe6\x29\xb7\
+\x57\xc9\xf3\xeb\x32\x04\x28\xfd\x9f\xbf\xe3\xef\x2c\xc6\x96\xa5\
+\xf9\x54\xf3\x05\x58\x2c\xcc\x1b\xd4\xe2\x85\x0c\x00\x42\xc0\x41\
+\xc0\xd9\xc0\xe4\x1c\x1e\x66\x26\xf0\x36\xe2\x48\xf1\xa7\x55\xff\
+\x38\xce\xf5\xd1\xe1\xc6\x90\x0e\x70\x39\x16\xf0\xef\x16\xf5\x61\
+\x7d\x32\x15\x0b\x7a\x76\xb8\x06\xdb\x8e\x84\xc1\x65\x58\xfa\x17\
+\x6d\x9a\x6d\x1e\xfb\x03\xaf\x6d\x73\xfc\x8c\x41\x90\xd7\x65\x40\
+\x48\x39\xe0\x5f\x27\xc7\x2f\x02\xbe\x02\xdc\x9b\x4f\x15\x5f\x82\
+\x39\xbc\x5c\xae\xd6\x2e\x64\x00\x10\x4d\xe6\x78\x2c\x1e\xd4\xd8\
+\x1c\x1e\xe6\x50\xe0\x35\xc0\x70\xc7\x8d\x4f\xab\xfe\x12\xfe\xb1\
+\x88\xfe\x1e\x6e\xc7\xdc\xfe\x1f\x55\x1f\xf6\x14\x86\x60\x6e\xcd\
+\x2f\x6c\xb3\x2f\x10\x4f\x65\x0d\xf0\x0b\xe0\xcf\x28\x7d\x60\xd3\
+\x18\x01\x9c\x8e\xc5\xc9\x18\x5a\xf2\x1a\x8a\xfa\x9f\x86\xe1\xa0\
+\x9d\x63\xd7\x01\x3f\x24\xab\x2d\x66\x2b\x81\xe7\x02\x7f\x53\x6b\
+\x17\x32\x00\x88\x26\xf2\x2c\x6c\xeb\x67\xea\xe9\xae\xe9\xc6\xf2\
+\x1c\x3f\x3d\x02\x31\xaf\xc0\x80\x12\xfe\x3e\xaf\xb7\x11\xb3\xd8\
+\x65\xb6\x3f\xd3\x19\xdb\x63\xdb\x7f\x66\x47\xf6\x9d\xd7\x45\x55\
+\xd7\xec\xfb\x80\xaf\x03\x77\xab\x6a\x35\x8e\x99\x98\x37\xc0\x9c\
+\xc4\xc4\x7c\x8e\x86\x80\x18\x8e\xbf\x10\x38\x33\x9f\x71\x67\x2d\
+\x16\x26\xea\xd7\x6a\xe9\xa2\x0e\x86\xa8\x08\x44\x4d\xbc\x16\xf8\
+\x09\x30\x2c\xf5\x07\x19\x0b\xbc\x1d\x38\x42\xe2\x3f\x1a\xf1\xdf\
+\x55\xd3\xb9\x3e\xae\xe1\xd2\x88\x50\xf5\x7a\x0f\x61\x2e\xff\x17\
+\xa0\x60\x6d\x7d\x0d\xa6\x2f\xc0\x32\x21\x4c\x19\xa4\xfc\xdb\x79\
+\xe5\x42\xd5\xe7\x9e\x08\x9c\x50\xfc\x7e\x9b\xea\x5d\xa3\x58\x5a\
+\x88\xbe\x05\xc0\xae\x94\x5b\x29\xa8\x6b\x2c\x88\x3d\x75\x6e\x8a\
+\x73\x91\xed\xb1\xcc\x29\x37\x14\xea\x39\x83\x21\xe3\x39\x58\xd6\
+\xc3\xeb\xd5\xda\x85\x0c\x00\xa2\x09\xbc\x0e\xf8\x36\xb6\x70\x9e\
+\x34\xdb\x02\xef\x2b\x06\x26\x97\x03\x62\x57\x64\xc7\x87\x3c\xa7\
+\x8e\xf3\x5c\x88\x76\x57\xe2\x2d\x36\xd1\x0f\xb6\xe2\xf2\x47\xe0\
+\x0b\xc8\xe5\xbf\x2f\xa6\x02\x1f\xc0\xf6\x33\x75\x67\x2e\xe8\xeb\
+\x30\x18\x74\x63\xc1\xe1\xf6\x03\x6e\xc4\x62\x4f\x88\xe6\x30\x17\
+\x38\x1f\xdb\x4e\x33\x3b\xa1\xb1\x21\xe4\x79\x21\xce\x09\x71\xfc\
+\x60\x4c\xc3\x82\x46\xdd\x06\x3c\x91\x7e\xd5\xee\x06\x9e\x09\x2c\
+\x04\xae\x52\x4b\x17\x32\x00\x88\x9c\x79\x1b\xf0\xb5\x1c\xc4\xff\
+\x01\xc0\xbb\x80\x09\x1e\xc4\x3f\x11\x1d\x1f\xfa\x9c\x54\x85\xbf\
+\x2b\xe1\x43\x64\xd7\xba\x01\xf8\x38\x16\xb1\x68\xa3\xfa\xaf\xa7\
+\x70\x38\xf0\x3f\xc0\x0c\x15\x85\x77\x26\x63\x46\x96\x87\x50\x42\
+\xed\xa6\xb1\x16\xb8\x0e\x33\x00\xcd\x01\xc6\xd7\xd0\x37\xd6\x61\
+\x08\x88\xf1\x1c\x9f\xc7\xb7\x73\xec\x98\xa2\xdf\x7d\x08\x78\x24\
+\xfd\xaa\xdd\x05\x9c\x22\x23\x80\x90\x01\x40\xe4\xcc\xbb\xb0\x45\
+\xc4\xe4\x17\xc4\x4e\xc2\xf6\x30\x0c\x16\xa0\xc8\x87\x05\x3c\xf4\
+\xf1\x31\x7b\x0a\x40\xda\xc2\xdf\xe5\x0a\xb1\xeb\xd5\xe6\x47\x80\
+\xef\x60\xfb\x74\x96\xa9\xef\x7a\x0a\xdd\xc0\xcb\x68\x3f\xe8\xa7\
+\x70\xc3\x30\x6c\xbb\xd5\x38\xcc\x38\xa5\x2d\x01\xcd\x62\x21\x70\
+\x6e\x61\x10\xd8\x9d\xf2\x2b\x09\xa9\x8c\x39\x21\xcf\x89\xc9\x08\
+\x30\xd8\xf1\x43\x81\x43\x8a\xdf\x6f\xcf\xc3\x08\x70\x2a\x16\xef\
+\xf0\x52\xb5\x72\x21\x03\x80\xc8\x89\xf7\x00\x9f\xcd\xa1\xc1\xbc\
+\x1c\x8b\x5e\x38\xd8\x00\x55\xf7\x00\x59\xc7\x84\x20\x74\x7c\x80\
+\xd0\xde\x02\xae\x85\x7f\x6c\xa2\x1f\x60\x15\x16\x7d\xfd\xab\xc0\
+\xfd\xea\xb7\xfa\x64\x1c\xf0\x41\xe0\x58\xe4\xde\x5f\xd7\x6c\x79\
+\x97\xe2\xf5\xef\x62\xd6\x2c\x9a\x43\xab\x10\x7d\x57\x61\x7b\xc2\
+\x27\x57\xac\x4b\x75\x78\x9d\x85\x32\x1e\xf8\xfc\x8c\xba\x17\x38\
+\xba\xb0\xd8\x10\x93\xc9\xc6\x18\x78\x3c\xe6\x68\x77\x89\x5a\xb9\
+\x90\x01\x40\xe4\x22\xfe\x3f\x9d\xfa\x43\x8c\xc5\x02\x7c\x1d\x1c\
+\x81\x98\x8f\x4d\xc8\xa7\xe4\xee\x9f\x93\xf0\x77\x29\xa8\x00\x2e\
+\x02\x3e\x85\xb9\xda\xca\xdd\xbf\x6f\xa6\x01\x1f\x03\x76\x56\x51\
+\xd4\xce\xd6\xc0\x61\xc0\xb5\xc8\x4b\xa5\x89\x2c\xc5\x62\x03\x2c\
+\x02\xf6\xa4\x5a\x44\xe1\x5c\xb7\x05\xc4\xe6\x0d\xe0\x63\xbe\x33\
+\x0b\xd8\xad\x18\xb7\x32\x08\x0e\x78\x2c\x30\x0a\x38\x4f\x2d\x5c\
+\xc8\x00\x20\x52\xe6\x7f\x8b\xf9\x72\xf2\x93\xfe\xf7\x02\x3b\x78\
+\x18\x0c\x63\x19\x68\x43\x4d\x2e\x42\x1b\x0c\xea\x3c\xb7\xf7\xf9\
+\x31\x67\x05\xb8\x13\xf8\x1c\x70\x16\xb0\x5a\x7d\x56\xbf\xec\x82\
+\xc5\x43\x98\x1a\xe8\xf3\xba\x12\x7f\x85\x60\x1c\xb6\x25\xe0\xe6\
+\x42\x08\x8a\xe6\x71\x2f\x70\x05\x96\x36\x70\x5a\x62\xe3\x44\x4e\
+\xde\x00\x3e\xe7\x32\x83\x31\x19\x8b\xcb\x74\x33\x59\x18\x03\x8f\
+\x90\x11\x40\xc8\x00\x20\x52\xe6\x13\x98\xa7\x6c\xd2\xec\x5c\x88\
+\xff\x29\x35\x0e\x98\x21\x06\xe3\xd8\x57\xfd\x53\x15\xfe\xae\x44\
+\xa0\x6b\x51\x09\xb6\xcf\xff\xdb\xc0\x0f\xb0\xbd\xb5\xa2\x7f\xf6\
+\xc4\x82\xfd\x8d\x0d\x28\xe8\x53\x27\xd4\xf3\x8e\x04\x8e\x06\xee\
+\x02\xe6\xab\xaa\x36\x92\xe5\xc0\xc5\xc5\xf7\xbf\x3b\x96\x32\x30\
+\x95\xf4\x7f\xb9\x78\x03\xd4\x3d\x07\x1a\x0b\x1c\x0a\xdc\x07\x3c\
+\x96\x87\x11\x60\x2c\x16\xf2\x42\x08\x19\x00\x44\x32\xf3\xbe\xaf\
+\x60\x41\xff\x92\xe6\x58\xe0\xbf\x8a\x09\x66\x4a\x62\x3e\xc6\x49\
+\x84\xb2\x02\xd4\x27\xfc\x37\x17\x59\x8f\x01\x67\x02\xdf\xc0\x52\
+\x6c\x89\x81\x39\x08\x4b\xf3\x37\xa2\xa2\xd8\x15\xd5\x0d\x06\xfd\
+\x31\x14\x8b\x0c\x7e\x2f\xf0\xb0\x8a\xb2\xb1\xcc\xc5\xb6\x32\xcd\
+\x00\xa6\xa3\xf4\x7f\xb1\xcf\x29\x5c\xcf\x87\x86\x17\x46\x80\xc5\
+\x79\x8c\x6d\x87\x01\x5b\x00\xff\x50\xcb\x16\x32\x00\x88\x14\xf8\
+\x0a\xf0\x96\xd4\x27\xa2\x2f\x02\x9e\xcf\xe0\x51\x86\x53\x75\xf9\
+\x0f\xb9\xea\x2f\xe1\x5f\x4e\xa8\xbb\xbe\xd6\x42\xe0\xe7\x58\x80\
+\xbf\xbb\x50\x04\xf5\x76\x67\x60\xef\xc1\xf6\x17\x4b\xdc\xc7\x6d\
+\x24\x18\x82\x2d\x9b\xcd\x43\x69\x02\x9b\xcc\x6a\x2c\x6d\xe9\x22\
+\x60\x0f\xcc\x38\xa4\xf4\x7f\x61\xe7\x0b\x75\x6e\x09\xe8\x06\xf6\
+\x2f\x8c\x01\xb7\xa6\x5f\x9d\x0f\xc1\xb2\x4d\xff\x5d\x2d\x5b\xc8\
+\x00\x20\x62\xe6\x53\xc0\x3b\x53\x7e\x80\xa1\xc0\x1b\xb1\xd5\xff\
+\x90\x83\x56\xac\x83\x6d\x15\x63\x41\x68\x77\xff\xd4\x85\xbf\x0f\
+\xd1\x0f\xf0\x04\xf0\x2b\xe0\x4b\xc0\x6d\x28\xc0\x5f\xbb\xec\x0b\
+\xbc\xaf\x97\xf8\x17\xf1\x1b\x07\xba\xb1\x15\x40\x79\x02\x88\x7b\
+\x81\xcb\xb0\x4c\x01\x5b\x3a\xe8\x6b\x53\x88\xfa\x9f\x7b\xc0\xbf\
+\x4e\x8e\xdd\x19\xd8\x06\x0b\x12\x9a\xf8\x98\x27\x23\x80\x90\x01\
+\x40\x44\xcd\xc7\x81\xf7\xa7\xfc\x00\xa3\xb1\x7d\x0b\xfb\xd4\x2c\
+\xfe\x49\xf8\xf8\x90\x13\x9e\x3a\xce\x8b\x59\xf8\x6f\xce\x52\x2c\
+\xa5\xdf\x17\xb1\xe0\x48\x1b\xd4\x47\xb5\xcd\x5e\xc0\x87\xb1\x55\
+\x24\x91\x16\x3d\x46\x80\xdb\x81\x05\x2a\x8e\x46\xb3\x02\xdb\x12\
+\xb0\x16\x4b\x19\x37\x24\xb1\xf1\x26\x94\x37\x40\x4c\x46\x03\x97\
+\xc7\xce\x00\x76\x2a\x8c\x00\x89\xa7\x0b\x3d\x14\xc5\x04\x10\x32\
+\x00\x88\x08\xf9\x28\xf0\xa1\x94\x1f\x60\x22\x16\xec\x6f\x47\xc7\
+\x03\x79\x4c\x5e\x02\x8a\x0f\x50\x7e\x52\xe5\xda\x70\xe0\x73\xbb\
+\xc0\x72\x6c\xc5\xff\x8b\xc0\x2d\x12\xfe\x1d\x33\x1b\x4b\x5f\x32\
+\x42\x45\x91\xf4\xe4\xe6\x30\xe0\x1a\x6c\x3f\xb0\x68\x2e\x2d\xcc\
+\x18\x74\x15\x96\xc9\x63\xa2\x83\xb1\x20\xc7\x7d\xfe\x29\xad\xee\
+\x77\x72\x1f\x5b\x02\xfb\x61\x69\x02\x57\xa5\x5d\x95\x0f\x2b\xaa\
+\xf3\xc5\x6a\xd5\x42\x06\x00\x11\x03\xef\xc2\x22\xfe\x27\xcb\x36\
+\x98\xeb\xc2\xd6\x35\x0b\x74\x9f\x83\x7b\x6c\x13\x8e\x2a\xe7\x28\
+\x2b\x40\xdf\xac\xc7\xf2\x06\x7d\x0a\xb8\xbe\xf8\x5b\x74\xc6\x64\
+\xcc\x95\x69\x7c\x44\xf7\xa4\xf4\x7f\xe5\x18\x06\x1c\x8c\xed\x07\
+\x5f\xa9\xaa\xdd\x78\x96\x02\xe7\x63\xee\xe0\xbb\xf5\xaa\xab\x29\
+\xa5\xff\x8b\xd1\x70\x50\x97\xb0\xef\xe4\xda\xe3\x8b\xbe\xe0\xd6\
+\xa2\x1e\x24\xcc\xb1\x98\x33\xc3\xa5\x6a\xd1\x42\x06\x00\x51\x27\
+\x6f\x07\xbe\x90\xf2\x03\xec\x06\xbc\x1b\xdb\x60\x95\xc3\x40\x97\
+\x8a\xb1\x40\xe9\x00\xdd\x5d\xa7\x85\xe5\xc1\xfe\x24\xe6\xee\xba\
+\x46\xfd\x52\x29\xc6\x60\x96\xcc\xe9\x91\x89\xf9\xd4\x88\xe9\x19\
+\x47\x01\x7b\x63\x4b\x66\xeb\x54\xc5\x1b\x4f\x0b\xf3\x8a\xba\x15\
+\xdb\xe6\x33\xda\xe1\x38\x11\x62\x6c\x50\xd4\xff\xf2\xc7\x8e\xc2\
+\x36\xd3\xdf\x0d\x3c\x9e\x76\x35\x3e\x9e\x4d\xb1\x2e\x85\x90\x01\
+\x40\x04\xe7\x2d\xc0\x97\x53\x7e\x80\x83\x8a\x87\x70\x9d\xe6\x2f\
+\x96\x81\x53\x59\x01\xf2\xcf\x0a\x70\x03\xf0\x69\xe0\x6c\x6c\xbf\
+\xab\x28\x5f\xd6\xef\xc2\xa2\x86\xfb\x14\xbe\x22\x7c\xd9\x6d\x01\
+\xcc\x44\x4b\x66\x62\x13\x8f\x61\xde\x00\xd3\x80\xed\x6a\x1e\x6f\
+\x72\x89\xfa\x1f\xcb\x3c\x69\x20\x86\x61\x7e\xf4\x8f\x92\x7c\xa6\
+\x90\xe3\xb1\xc4\x3e\x57\xa9\x35\x0b\x19\x00\x44\x48\x5e\x83\xa5\
+\x11\x4f\x76\x4e\x7b\x52\xf1\x10\x83\x35\x82\x14\x06\xb5\x3a\x8e\
+\xcf\x39\x3e\x40\x0a\xc1\x01\xef\xc0\xf6\xf8\xff\x06\x58\xa2\xfe\
+\xa8\x32\x2f\x02\x4e\xad\x28\x54\x45\x7d\x46\x82\xc1\x98\x81\x6d\
+\x89\xb9\x45\xc5\x28\x0a\xd6\x01\xff\xc4\x02\x45\xee\x83\x65\x00\
+\xaa\x6b\xfc\x69\xaa\x37\x40\x1d\xc7\x76\x03\x07\x14\xbf\xdf\x9e\
+\x76\x77\x78\x0a\x66\xcb\xfa\xb7\x5a\xb3\x90\x01\x40\x84\xe0\xb5\
+\xc0\x77\x53\x9d\xf3\x76\x01\xff\x01\x3c\xb7\x8d\x07\xc8\x5d\xfc\
+\xc7\x1a\x18\x10\x94\x0e\xb0\x3f\xe6\x02\x5f\x03\x7e\x5c\x8c\xfc\
+\xa2\x3a\x07\x00\x6f\xe6\xa9\x7b\x82\x25\xf2\xf3\x32\x0e\xec\x85\
+\x19\xce\x1e\x51\x71\x89\xcd\xfa\xd4\x2b\xb1\xed\x80\x5b\xd4\x3c\
+\x16\xc5\x1a\xf0\x2f\x37\x23\x40\x17\x96\x15\x62\x24\x49\x1b\x05\
+\x7b\x8c\x00\x0f\x60\x61\x7f\x84\x90\x01\x40\x78\xe3\x39\xc0\x99\
+\x98\x11\x35\x39\xba\x81\x57\x03\x27\x38\x1c\x6c\xba\x3c\x1d\xeb\
+\x5b\xcc\xc7\x1c\x18\xb0\x49\xe9\x00\xdb\x15\x97\x4f\x00\x3f\x01\
+\xbe\x8e\xf2\x9b\xbb\x64\x12\xf0\xb1\x62\x22\x28\x91\x9f\xbf\x71\
+\x60\x3f\xe0\x42\x6c\x03\xad\x10\xbd\xfb\xd7\x0b\xb0\x7d\xe2\x3b\
+\x47\x32\x2e\xc5\x34\x3e\xc7\x32\x77\xe9\xf4\xd8\xc1\xd8\x09\x98\
+\x8a\x65\x08\x68\xa5\xdb\xbd\x3d\x1d\xb3\x6d\xca\xc1\x49\xc8\x00\
+\x20\xbc\x70\x22\xf0\x3b\x6c\x1b\x55\x72\x0c\x05\xde\x04\x1c\x1e\
+\x78\x80\x89\x55\xcc\xc7\x36\x19\x09\x6d\x30\x80\x38\x84\xff\x60\
+\xac\x05\x7e\x0f\x7c\x16\x0b\x5c\xd5\x42\xb8\x9c\x39\xbd\x1f\x98\
+\xa5\xa2\x68\x0c\x23\xb1\x3d\xdf\xca\xa3\x25\x36\x67\x63\x21\x04\
+\xe7\x62\x81\x23\x87\x27\x38\xb6\x29\xe0\x5f\xe7\xf7\xb0\x1d\xb0\
+\x2d\x96\x32\x74\x63\x9a\x55\xb7\x1b\x38\x1d\xb8\x1a\x8b\x71\x28\
+\x84\x0c\x00\xc2\x19\x87\x60\x71\xc6\x46\xa5\x78\xf3\x23\xb0\x74\
+\x05\xfb\xd5\x28\xe8\x53\x1d\x90\x63\x5d\xf5\xcf\x3d\x1d\x60\x4f\
+\x64\xff\x4f\x01\xff\x42\x29\xfd\x7c\xf0\x2c\xe0\xb4\xc4\x0c\x16\
+\x4a\xff\x57\x9d\xe9\xc0\x32\xe0\x4e\x35\x01\xd1\x07\x0f\x61\xe1\
+\xd5\x77\xc1\xd2\x82\xd6\x3d\x66\xc5\x18\xf0\xcf\xe7\x1c\xa5\x8e\
+\x63\xa7\x63\xde\x00\x57\xa7\x3b\xd6\x0e\x01\x9e\x0d\x5c\x02\xcc\
+\x53\x2b\x16\x3e\xe6\xea\xa2\x79\xec\x89\x2d\x98\x4c\x4c\xf1\xe6\
+\xc7\x60\xd1\xbd\x67\x67\x26\xfe\x53\x5e\x19\xa8\xda\x01\xd5\xb5\
+\xe2\x1f\xaa\xb3\xbd\x03\xf8\x21\x49\x07\x28\x4a\x42\x04\x7e\x9d\
+\xbe\x57\xf9\x34\xf8\x86\xa3\x2e\x8f\x96\x35\x58\xdc\x07\xc5\x03\
+\x10\x03\x29\xaa\x17\x15\xaa\xca\x47\x1d\x6e\x05\x38\x27\xa6\xe3\
+\x53\x38\xf6\x5e\xe0\xf3\x98\x81\x30\x51\x96\x02\xc7\x62\xce\x2c\
+\x42\x0c\xd8\xbf\x09\x31\x10\xb3\xb1\x2d\x93\x5b\xa6\x78\xf3\x13\
+\x80\xf7\x01\xdb\x4b\xfc\x67\x21\xfe\x73\xcf\x0a\xf0\x30\x96\x5a\
+\xe3\x47\x24\x9f\xa7\x38\x6a\xba\x80\xf7\x62\x91\xe1\x7d\x5c\x5b\
+\xe9\x00\xe3\x2f\xaf\xa1\xd8\xd6\x8f\x0b\xf4\x15\x88\x01\xc4\xe2\
+\x8d\xd8\x96\x80\x7d\xe9\x7f\xef\x63\xec\xe9\xff\x62\x39\x3e\x85\
+\x63\x27\x62\x19\x21\xae\x21\xd9\x38\x21\x23\x31\x9b\xd5\x5f\xb0\
+\x34\x81\x42\xc8\x00\x20\x3a\x66\x06\x70\x11\xb0\x4d\x8a\x37\xbf\
+\x25\xb6\xbf\x77\x7a\x0d\x03\x4d\xca\x81\x01\x15\x1f\x20\xbc\xf0\
+\x5f\x0d\xfc\x16\x4b\xeb\x27\xdf\x3d\xff\x9c\x0c\x3c\xd3\x93\x68\
+\x15\xe1\x0d\x05\x65\x99\x86\xe5\x03\xbf\x57\xc5\x2b\x06\xe0\x21\
+\x2c\x4b\xc0\x1e\xd8\xa2\x42\xdd\x63\x54\xca\x5b\x02\xea\x0c\xf8\
+\xd7\xee\xb1\xe3\x81\x03\xb1\xb0\xfa\x2b\xd2\xac\xb2\x63\x8a\x21\
+\xee\xf7\x98\x47\x80\x10\x4e\xfa\x2b\xd1\x0c\xa6\x60\x6e\xff\xbb\
+\xa5\x6a\xb9\x78\x0f\x83\xef\x59\xf0\x25\xfe\x7d\x0e\xe4\x31\x5c\
+\xbb\xca\x64\x27\x54\x27\x55\xc7\x36\x81\x4e\xcf\xef\xd9\xe7\xff\
+\x23\x94\xd2\x2f\x14\xe3\xb0\x1c\xa6\xe3\x34\x38\x36\x82\xc1\x5c\
+\x7e\x97\x01\xaf\x23\x69\x97\x5f\x11\x88\x91\xc0\x1b\x81\x23\x1c\
+\xd4\xbb\xba\xce\x89\xc5\xc5\xdf\xd7\xb5\x5d\x5e\x73\x29\xf0\x19\
+\x2c\xc7\x5e\xa2\xdc\x02\x1c\x8d\x3c\x01\x44\x1f\xc8\x03\x40\xf4\
+\x37\x47\x3e\x17\x0b\x84\x9b\x1c\x3b\x60\x2b\xff\xe3\x1d\x0a\x7a\
+\x65\x05\xa8\x7e\x7c\x48\x4f\x81\x14\xd2\x01\xde\x0b\x7c\x0e\xf8\
+\x13\xb0\x52\x7d\x4e\x30\x5e\x85\x05\x35\xe9\xeb\xbb\xd3\x4a\x7e\
+\x7e\x0c\xf6\xdd\x8e\xc0\xb6\x03\x5c\xab\xa2\x12\x83\xb0\x1e\x0b\
+\xc8\xba\x18\x73\x13\xef\x8e\x60\xcc\x53\xd4\x7f\x7f\xf3\xb5\x91\
+\xc0\xc1\x85\x8a\x5e\x92\x66\x95\x9d\x5a\x18\x00\x7e\x89\x25\x14\
+\x12\x42\x06\x00\x31\x60\x9f\xf7\x57\x06\xcf\x96\x17\x25\xb3\x81\
+\x77\x63\xfe\x4f\xae\x06\x13\x12\x3b\x36\x97\xac\x00\x21\x05\x7c\
+\x48\xe1\xbf\x1c\xf8\x31\xb6\xd7\x5f\xab\xfe\x61\xd9\x0e\x78\x6b\
+\x31\x71\x97\xd8\x97\x51\xa0\xe7\xb5\x13\x70\x19\x96\x0b\x5e\x88\
+\xc1\xb8\x17\xb8\xa1\x30\x02\x8c\x8e\x60\xfc\x8b\x6d\xdc\x4f\xe9\
+\xd8\xc1\x8e\x1b\x8e\xa5\xc0\xba\x0d\x33\xfc\x24\xc8\x36\xc0\x41\
+\xc0\xaf\x81\x0d\x6a\xbd\x42\x06\x00\xd1\x17\xdd\xc0\xcf\x48\x2b\
+\x33\xd6\xff\xb1\x33\xf0\xdf\x0e\x07\x64\x05\x06\x0c\x3b\x29\xa9\
+\x22\xe2\x53\x48\x07\xd8\xc2\x02\x6a\x7c\x02\xb8\x89\xfa\xa2\x9f\
+\x37\x99\xb7\x93\x68\x40\x93\x01\xc4\xab\x52\x00\xba\x19\xf8\xa6\
+\x60\xf9\xb3\x84\x68\x87\x45\x45\x7d\x99\x8d\x2d\xb3\xc6\x30\x16\
+\x2a\xe0\x9f\x9f\xb9\xde\xb0\xc2\x08\x70\x37\xc9\x06\xe7\xdd\x01\
+\xb3\x73\xfe\x5e\x53\x0f\x21\x03\x80\xe8\x8b\x2f\x02\xaf\x4e\xf1\
+\xc6\x77\x29\xc4\xff\x28\x89\x7f\xe7\x13\x8b\x1c\x57\xfd\x43\x07\
+\x07\xbc\xad\x10\xfe\x7f\xc7\xd2\x8f\x89\xf0\xec\x0c\xbc\x32\x32\
+\xb1\x9a\x93\xd0\x4e\xfd\x59\xb6\xc5\x72\x80\x6b\xb3\xac\x68\x97\
+\x35\xc0\xa5\xd8\xa2\xc3\xce\x91\x8c\x8b\x5a\xdd\xf7\x33\xe7\x1b\
+\x8a\x2d\xa3\xdf\x4d\xb2\x9e\x7b\x7b\x00\x63\x81\x7f\xa8\xe5\x0a\
+\x19\x00\x44\x6f\xde\x05\x7c\x38\xc5\x1b\x9f\x53\xdc\xfc\xc8\x88\
+\xc5\x7f\x4c\x59\x01\x62\x9a\x7c\x84\x3c\xa7\x0e\xe1\xdf\xe3\xee\
+\xff\x6d\x92\xdd\x43\x98\x0d\xef\x00\xb6\x8e\x4c\x10\x37\x9d\xd8\
+\xca\x68\x32\xe6\xa5\x23\x44\xbb\xb4\xb0\x84\xeb\xed\xc4\x05\x08\
+\x3d\x46\xfa\x3a\x3e\xb7\xa8\xff\x9d\x18\x01\x0e\xc6\xb6\x80\x3c\
+\x9a\x66\x75\x3d\x0c\x8b\x6d\xf8\x2f\xb5\x5c\x21\x03\x80\x00\x78\
+\x41\xa1\x51\x92\x9b\x93\xee\x55\x4c\xec\x47\x04\x16\xff\x0a\x0c\
+\x58\xfd\xf8\xd0\xe7\x84\x14\xfe\x9b\xbb\xfb\x8b\x7a\xd9\x1d\x78\
+\x69\x60\xf1\x2a\xd2\x2b\xe7\x19\x58\x30\xc0\xc7\x55\xec\xa2\x43\
+\xee\x05\x6e\x06\xf6\x67\xf0\xc5\x88\x50\x63\x9f\x02\xfe\xb9\x9f\
+\x03\x0e\xc1\xb6\x03\xcc\x03\xe6\xa7\x59\x55\x4f\xc2\x9c\x12\x6f\
+\x55\xab\x95\x01\x40\x34\x9b\xa3\x81\xdf\x61\xdb\x9c\x92\x62\x6f\
+\xe0\x6d\x58\x90\x96\xd0\xe2\x9f\x84\x8e\x0d\x31\xb0\x2b\x3e\xc0\
+\x26\xee\xc7\x52\x07\x9d\x85\xdc\xfd\x63\xe1\x8d\x94\xdf\xfb\x2f\
+\x81\x9f\xa6\x81\xa0\x2c\xe3\x30\xb7\x6e\x21\x3a\xe5\x71\xe0\x72\
+\x60\x57\x60\x52\x24\xe3\x60\x4c\x0b\x05\xb1\xbb\xf9\xb7\x7b\x5c\
+\x37\x70\x20\xf0\x20\xf0\x48\x9a\x5d\xe6\xe9\xc0\x3f\x81\xfb\xd4\
+\x6a\x65\x00\x10\xcd\x64\x77\x6c\x5b\xf2\xd8\xd4\x6e\x7c\x5f\x2c\
+\x9a\xf7\x60\x56\x8b\xa6\x8b\xff\xd8\xbc\x04\x42\x9f\x13\xf2\xbc\
+\xd5\xc0\x6f\x81\x2f\x93\xac\x7b\x60\x96\xcc\x00\xde\xd0\xc6\x77\
+\x2a\xa1\x2f\xc3\x00\x98\xa1\xe8\x22\x60\x99\x8a\x50\x94\x60\x15\
+\x70\x31\x16\x54\x72\x56\x44\x63\xa2\xe2\x02\xb8\x37\x02\x1c\x00\
+\x3c\x04\x3c\x9c\xa6\xf6\x3b\x1d\x38\x1b\x58\xa0\x56\x2b\x03\x80\
+\x68\x16\xdb\x02\x17\x02\xd3\x52\xbb\xf1\x03\x80\xb7\x60\xfb\xb1\
+\x24\xfe\xeb\x13\xf3\xb9\xc5\x07\xa0\xc2\x79\xff\x06\x3e\x0e\x5c\
+\x05\x6c\x54\xdf\x12\x15\x2f\xc7\xc2\x1f\x4b\xe8\x8b\x76\xbe\xff\
+\xae\x62\x62\xf4\x6f\x15\x95\x28\xc9\xc6\xa2\xfe\xac\xc7\x22\xaf\
+\x75\x75\x50\x2f\x63\x1b\xb3\x65\x04\x18\xd8\x08\xd0\xe3\x09\x90\
+\xa0\x11\x60\x24\x96\xf1\xeb\xd7\xc8\xde\xd9\xd8\xb1\x50\x34\x8f\
+\xf1\x98\x97\xe3\x5e\xa9\xdd\xf8\x5e\x58\x2a\xaf\xa1\x91\x0e\x18\
+\x31\x18\x14\x62\x33\x14\x84\xfa\x8c\x3a\xce\x5b\x04\x7c\x17\x45\
+\xd4\x89\x95\x51\xc0\x4f\x19\x3c\x3b\x88\x06\xf0\x72\xe4\x9a\x4f\
+\x6a\x15\xf0\x92\xe2\xa7\x10\x55\x38\x14\x5b\xb0\x18\xee\xb9\x5d\
+\xb5\x3c\x1e\x1f\xc3\xb5\x63\xbe\xe6\x06\xe0\xab\x58\xfc\x90\x04\
+\xb9\x19\x38\x12\xc5\x29\x6e\x1c\xf2\x00\x68\x1e\x23\x30\xb7\x9f\
+\x83\x25\xfe\xf3\x13\xff\x31\x06\x06\x0c\x65\x60\x08\x79\x5e\x0b\
+\x38\x17\x0b\xf2\x77\xbf\xfa\x94\x68\x39\x19\x0b\x7b\x1c\xbb\x88\
+\x2f\xfb\xd2\xbd\xfb\x61\x18\x16\xe0\xeb\x1e\x35\x21\x51\x91\x07\
+\xb1\x40\xb0\x07\xd0\x5e\x70\xc0\x50\xe3\x66\x8a\x01\xff\x62\xbd\
+\x66\x8f\x27\x40\xa2\xd9\x01\xa6\x16\xb7\xff\xcb\xc2\x96\x21\x1a\
+\x42\xb7\x8a\xa0\x51\x74\x01\xdf\xc3\x02\xff\x25\x77\xe3\x53\x81\
+\x75\x91\x0e\x10\xb1\x64\x05\x88\x65\x02\x10\xd2\x58\x10\x3a\x2b\
+\xc0\x03\xc0\x7b\x81\x6f\xa2\x15\xc2\x14\x0c\x00\xb1\x0b\xe4\x26\
+\x0f\x46\x31\x97\xcd\xd3\xd4\x7c\x84\x23\xee\x04\xde\x8f\xed\x17\
+\x8f\x69\x0c\x4d\x6d\x4b\x40\x1d\x51\xff\xdb\x3d\x76\x03\xb0\x7d\
+\xba\x7d\xfa\xf1\x98\x33\xa3\x68\x10\xf2\x00\x68\x16\x1f\xc2\x02\
+\xe7\x27\xc9\xbd\x58\x70\xa6\xa1\xc0\x0e\x3c\x75\xdf\x66\x9d\xe2\
+\x9f\xc4\x8e\xf5\x3d\x49\x88\x35\x98\x60\x95\xf3\x36\x02\x7f\x00\
+\xbe\x80\x82\xfc\xa5\xc0\x8e\x98\x1b\x77\x9d\x22\x56\xa4\x5b\xbe\
+\x53\x80\xcb\xb0\xa4\xd9\x42\x54\x65\x05\xb6\xef\x72\x27\x6c\x31\
+\x23\x96\xf1\x54\x01\xff\xaa\x7d\x76\x0b\xcb\xfc\xf0\x45\xe0\xc6\
+\xb4\xab\xe8\x3e\x58\xe2\xa2\xcb\xd4\x5a\x65\x00\x10\x79\xf1\x3c\
+\x6c\xd1\x32\xe9\x79\xe9\xda\xa2\x93\xbd\x1e\x8b\xee\x3d\x45\xe2\
+\x5f\x81\x01\x03\x9c\x77\x3b\xf0\xd1\x62\x02\xa7\x20\x7f\x69\xf0\
+\x2c\x2c\xcd\x89\x4f\x21\x2a\xe2\x34\x10\xb8\x62\x59\xfa\x93\x7a\
+\x11\xd9\xfc\xe5\x52\x60\x02\x30\x3b\xc2\xb1\x58\x46\x80\xce\x8e\
+\xbd\x17\xf8\x1a\xb6\x1d\x30\x93\x94\xbf\xc7\x03\x77\x60\x71\x01\
+\x44\x03\xc6\x4f\x91\x3f\xfb\x03\x97\x00\xa3\x73\x7b\xb0\x7d\x81\
+\x97\x01\x5b\x66\x22\xfe\x53\x1c\xb4\xcb\x76\x24\x31\x9f\xd3\x73\
+\xde\x4a\xe0\x27\xc0\x39\xe4\x1b\xf0\x2c\x57\xbe\x0f\x6c\xad\x01\
+\x51\xf4\xa2\xd3\x36\xfc\x10\xf0\x5a\x15\x9b\xf0\xc0\x69\xc0\xab\
+\x02\xd5\xe3\x56\x04\xc7\x76\x72\x7c\x9d\x01\xff\xda\x39\x6e\x31\
+\xf0\x2b\x6c\xe5\x3f\xc3\x79\xc1\x2a\xe0\x18\x2c\xa9\x91\x90\x01\
+\x40\x24\xcc\x0c\xe0\xca\xe2\x67\x96\x0c\xc7\xf6\xfa\x9e\x4e\xff\
+\x41\x76\x72\x13\xff\x29\x67\x05\x48\xc1\xdd\xbf\x0b\xf3\x32\xf9\
+\x3a\xf0\x98\xfa\x90\xe4\xd8\x19\xf8\xb2\x06\x3f\xe1\x60\xc2\xff\
+\x66\x6c\xa5\x4f\x08\xd7\x1c\x09\xfc\x17\xb6\xad\xd1\xa7\xa8\x8f\
+\x45\xd8\xa7\x6e\x04\x58\x0b\xfc\x1d\xf8\x13\xb0\x3a\xef\xaa\xf9\
+\x08\x16\x28\xfc\x01\xb5\xd2\x7c\xd1\x16\x80\xbc\x19\x07\x9c\xcf\
+\x93\xd3\x60\x67\xc7\x06\x2c\xc8\xce\xa5\x58\x7e\xc3\x6d\x29\x17\
+\x1f\x20\xd7\xc0\x80\x4d\x14\xff\x55\xdc\xfd\x57\x61\x91\x32\xbf\
+\x8f\xed\xdb\x14\xe9\x71\x2a\xb0\x67\x1f\xf5\x21\x57\xf7\xfd\xae\
+\xc0\xaf\xdc\xcb\xae\x37\x8b\xb0\x28\xee\x42\xb8\x66\x1e\xb6\xbd\
+\xec\x60\x3a\x4b\x13\xe8\x7b\xec\x8d\x25\xea\x7f\x9d\x73\xb7\xcd\
+\xb9\x16\x8b\xff\x73\x15\xb0\xbe\x19\xda\xe1\x18\x2c\x8b\xee\x3a\
+\xb5\x54\x19\x00\x44\x5a\x74\x03\xbf\x06\x8e\x6a\xca\x03\xaf\x06\
+\xae\xc6\xf6\x6c\x6e\x0b\x4c\x8a\x6c\x00\x89\xf9\xd8\x10\x13\x84\
+\x14\xe2\x03\xdc\x0a\xfc\x2f\xb6\xfa\x2f\xd2\xe5\x35\xc0\xe4\xc4\
+\x04\x6b\x4a\x82\x3c\x77\xe3\x41\xef\xfb\x1d\x81\xad\xfa\x09\xe1\
+\x83\x47\x81\x1b\x0a\x23\xc0\x48\xd2\x35\xf0\xe7\xb6\xd7\xbf\xe7\
+\xb8\xfb\x31\x4f\xc0\xbf\x60\x5b\x02\x1b\xc4\xd6\x58\x60\xc0\x5f\
+\xa1\x1d\x90\x32\x00\x88\xa4\xf8\x02\xf0\x8a\x26\x3e\xf8\x62\xe0\
+\xe2\x62\x60\xdd\x99\xc1\x73\xef\x2a\x30\x60\xb3\xe3\x03\x74\x61\
+\x01\x7c\x7e\x5e\x0c\xf4\xcb\xd4\x77\x24\xcd\x04\xe0\x75\x11\x89\
+\xcd\x26\xae\xaa\xe7\x54\x1e\x93\x80\xbf\x92\x4d\x90\x2f\x11\xe9\
+\x9c\xe5\x5f\x58\xb0\xa6\x71\x28\xea\x7f\x0c\x73\xb4\xe5\x85\xf2\
+\xfd\x3e\x8d\xde\x06\xb8\x13\x30\x0a\x8b\x73\x28\x64\x00\x10\x09\
+\xf0\x6a\xe0\x53\x4d\x2f\x84\x79\xc0\x79\x98\xbb\xd6\x4e\xfd\x54\
+\x76\x89\x7f\xbf\x22\x3b\xf6\x55\x7f\xb0\x55\xff\x8f\xa2\x88\x37\
+\xb9\x70\x04\x70\x78\x44\x82\x56\xa4\x5d\xae\x5d\xc0\x3d\xc0\x5c\
+\x7d\x25\xc2\x23\x2b\x80\x2b\xb0\xad\x4b\x13\x51\xd4\xff\xba\xe6\
+\x6a\x1b\x80\x7f\x00\x5f\xc2\xb6\x67\x68\xe9\x9b\xc3\x81\x05\x98\
+\x83\xad\x90\x01\x40\x44\xcc\xb1\xc0\x2f\xf5\xdd\x6e\xea\xcc\x6f\
+\x03\xfe\x09\x6c\x01\x6c\x93\x98\xf8\xef\xf2\x74\x6c\x99\xfb\x0d\
+\xe1\xf2\x1f\x4a\xf8\xf7\xde\xeb\xff\x5d\xb4\xea\x9f\x13\xcf\xa4\
+\xf3\x14\x5b\x55\x04\xa9\x88\xcb\x40\xe0\x83\x25\xc0\xbf\x55\xe4\
+\xc2\x33\xab\xb1\x74\x4d\x3b\x02\x5b\x05\x18\x77\x7d\x5d\xbb\xee\
+\xf8\x47\x65\x8f\xbb\x19\xf8\x22\x70\x19\xda\xf8\xbe\x19\x27\x17\
+\x55\x53\x76\xd0\xcc\xc6\x50\x91\x0f\x33\x8b\x79\xca\x96\x2a\x8a\
+\xbe\xd9\x1d\x4b\x1b\xb8\x6d\x24\x03\x4e\xec\xc7\xc6\x78\xbc\x8b\
+\x73\xee\xc0\xa2\xc4\x3f\xac\x26\x91\x1d\xdf\x01\xb6\xd3\xa0\x28\
+\x36\xa3\xca\x4a\xde\x7d\xc0\x9b\x54\x84\x22\x10\x43\x81\xb7\x60\
+\xde\x4c\x65\xeb\x6f\x8a\xa9\x02\x5b\x35\x1d\xf7\x30\xf0\x33\xe0\
+\x3a\x55\xbd\x81\x58\x08\x1c\x58\x74\x87\x42\x06\x00\x11\x11\xa3\
+\xb0\x40\xf8\xfb\xab\x28\x06\x66\x08\x70\x34\xf0\x02\x6c\xbf\x9d\
+\xc4\x7f\x3d\xd7\x0e\x65\x2c\xe8\x7d\xde\x06\x2c\x32\xe6\xaf\x81\
+\x8d\x6a\x0a\xd9\x31\x06\xf8\x8d\xa7\x36\x29\x9a\x6b\x14\x68\x01\
+\x67\xa0\xac\x20\x22\xec\xe4\xfc\x75\xd8\xd2\x6b\x08\xf1\xdd\x44\
+\x23\xc0\x4a\x2c\xa5\xdf\x39\x34\x22\xb2\xbf\x0b\xae\xc7\xb6\x04\
+\xac\x54\x51\xe4\xa1\x85\x44\x1e\x63\xc5\x8f\x81\x93\x54\x14\xed\
+\x0d\x08\xf7\x01\x17\x01\xc3\x80\xed\xb1\x94\x09\x12\xff\x4f\x3e\
+\xd6\xb7\x61\x21\x94\xa7\x40\xcf\x79\x0f\x62\x11\xfe\x2f\x45\xfb\
+\xfa\x72\x65\x4f\xe0\xf8\x41\xea\x42\xce\xee\xfb\x4a\xff\x57\xbd\
+\xbc\xfa\x3b\xee\x7a\x60\xbe\x9a\x98\x08\xc8\xb5\x58\x10\xe3\x39\
+\x11\x8e\xe3\x29\xef\xf5\x6f\x61\x6e\xfe\x9f\xc7\x52\x7c\x6a\x31\
+\xa0\x6d\xb6\x2a\xa6\xcc\xbf\x57\x51\xc8\x00\x20\xe2\xe0\x3d\xc0\
+\xdb\x54\x0c\x9d\xb1\x16\x4b\xbf\x73\x25\x30\xad\xe8\xd9\x24\xfe\
+\xf3\x0b\x0c\xd8\x02\xce\x02\x3e\x03\x3c\xae\x6a\x9f\x35\x47\x00\
+\xfb\x92\x47\xfa\xb9\x18\x05\x7a\x13\x0c\x08\xfd\xdd\xf7\xbd\x58\
+\x3c\x19\x21\x42\x72\x43\x31\x57\xd9\x3b\xd0\x98\x9b\xbb\x11\xe0\
+\x56\x2c\xc0\xdf\x79\x28\xb3\x47\x49\xf6\xc4\x92\x24\xfc\x53\x45\
+\x21\x03\x80\xa8\x97\x13\x81\x1f\xf0\xd4\x45\x6c\xd1\x26\xcb\x80\
+\xcb\x8b\x09\xde\xce\x98\x1b\x71\xcc\xe2\x5f\x81\x01\xdb\x3f\x67\
+\x31\x66\xe5\xff\x2b\xe6\xfe\x2f\xf2\xe6\x34\x60\x87\x84\x85\x7d\
+\xee\xa4\x5a\x0e\x5d\xc0\x22\xcd\x78\x45\x4d\xdc\x0e\x3c\x01\xec\
+\xd7\xab\x7d\x28\xe0\x5f\x67\xc7\x2d\x02\x7e\x04\xfc\x14\x58\xaa\
+\x2a\x55\x95\xe3\xb1\x78\x63\x77\xab\x28\xd2\x65\xa8\x8a\x20\x69\
+\xb6\x07\x7e\x81\x0c\x39\x4e\xb8\x0e\x73\x07\x3b\x01\x78\x3e\x16\
+\x54\x21\x46\xf1\xef\x4b\x3c\xa7\xec\x25\xd0\xd7\x39\x57\x00\xdf\
+\x44\x11\xfe\x9b\x44\x9d\xe2\x5f\xf1\x04\xc2\x94\x65\x5d\xdb\x77\
+\xb6\xd7\xd7\x22\x6a\xe4\x1c\xcc\x88\xfd\xfa\xcd\xda\x47\x57\x07\
+\x6d\xa2\xab\xc3\xf6\xe3\xe3\xda\xa1\xaf\xb9\x06\xf8\x0b\xf0\x67\
+\x14\xd9\xdf\x21\x43\x30\x5b\xca\x41\x58\x96\x54\x91\xd9\x38\x2b\
+\xe2\x66\x2c\xb6\x20\xb1\x87\x8a\xc2\x3d\x5b\x00\xcf\x03\x8e\xeb\
+\x63\xb0\x4d\x41\xd0\x37\x39\x2b\xc0\x2a\xe0\x87\xc0\xdf\x55\x8d\
+\x1b\x37\x98\xfd\x09\x18\xae\x01\xb3\xb1\xf8\x34\x0e\xac\x06\x9e\
+\x8d\xe2\x87\x88\x7a\x39\x12\xcb\x10\x30\xa4\x62\xdd\xcf\x3d\xe0\
+\x5f\x0b\xdb\xde\xf9\x33\xb4\xf5\xcf\x23\xb7\x01\x87\x60\x0e\x2a\
+\x22\x31\xb4\x72\x9c\xee\x5c\xf7\x67\xc0\x31\x2a\x0a\x7f\x93\xbd\
+\x6b\x8b\xd7\x36\xc0\x14\x89\xff\x28\x5d\xfe\x37\xff\x8c\x7b\x80\
+\x8f\x60\x01\xbb\x44\xb3\x98\x8c\x79\xee\xb8\xea\x60\x9b\xe8\xa2\
+\x9f\xc3\xc0\xe8\xeb\x7b\x1b\x8a\x6d\x25\x5a\xad\x62\x16\x35\x32\
+\x0f\xb8\xbf\x50\x5d\x43\x2a\x8e\xcf\xa9\x1c\xdb\xe9\x71\xf7\x02\
+\x5f\x01\xce\x46\xe1\xea\x3d\xb3\x25\x16\xa3\xf2\xd7\x2a\x0a\x19\
+\x00\x44\x18\x3e\x82\xd2\x12\x07\x61\x09\x70\x31\x16\x41\x7e\x36\
+\x30\xba\xc1\xe2\x3f\xa4\x90\xef\xf4\x33\x5a\xc5\xe4\xfc\x73\x68\
+\x7f\x5f\x53\xd9\x81\xa7\xa6\xcc\x2a\x2b\x1a\x45\xfe\x86\x81\x32\
+\x5c\x86\x56\x13\x45\xfd\x3c\x5c\x88\xdc\x43\xfb\x98\xc4\x37\xd9\
+\x08\xb0\x18\xf3\x4b\xff\x3e\x96\xb4\x5e\x04\x61\x57\x6c\xa7\xc5\
+\x65\x2a\x0a\x19\x00\x84\x5f\x4e\x00\xbe\x87\x82\xfe\x05\xe5\x41\
+\xe0\x7c\x6c\x0f\xde\xec\x7e\x1a\x8e\xc4\x7f\x3d\xc6\x82\xa5\xc0\
+\x67\xb1\x48\xff\x4a\xe7\xd3\x5c\xf6\xc0\xb2\x00\x48\xec\xf7\xff\
+\xac\x4a\xfd\x57\xad\x2e\x5c\x07\xcc\x55\x53\x13\x11\xf0\x08\x16\
+\x81\x4d\x46\x00\x58\x8f\x6d\xf9\xfb\x22\x70\xa7\xaa\x46\x1d\x1c\
+\x8b\xed\xb8\x50\x3c\x00\x19\x00\x84\x27\xb6\x05\xce\xc5\xf6\xff\
+\x8b\xc0\x6c\xc0\x52\xc8\x5c\x0c\x8c\x03\xb6\xe3\xc9\x11\x79\xeb\
+\x1c\x14\x9b\x9a\x15\xe0\x06\xcc\x1d\xe6\x5e\x55\xcf\xc6\x73\x00\
+\x16\x25\x7b\x20\x91\x27\xe1\x2e\x43\x42\x27\xcf\xba\x39\xb7\xa1\
+\x54\x80\x22\x1e\xe6\x17\x46\x80\xc3\x1c\x18\x01\x52\x8d\xfa\x7f\
+\x0d\xb6\x00\x70\x45\x61\x08\x10\xb5\x75\x9d\xa7\x02\xbf\x42\x4e\
+\x98\x32\x00\x08\xe7\x0c\xc3\xbc\x9c\x77\x51\x51\xd4\xcb\x2a\x2c\
+\xff\xc9\x6d\xc0\x4c\x60\x62\xcd\x82\x3e\x16\x31\x8f\xe7\xe3\x7b\
+\x9f\xb3\xa1\x18\x69\xbe\x5e\x7c\x1f\x42\x1c\x8c\x25\x28\x8e\x55\
+\x74\x6a\xc5\x3d\xbd\xe7\xdf\xfc\xde\xee\x42\xf1\x45\x44\x5a\x46\
+\x80\x18\x56\xed\x7d\xec\xf5\x7f\x08\xf8\x06\xf0\x7b\x60\x85\xaa\
+\x41\x0c\x8c\xc2\x1c\x52\x7e\x8c\xb2\x2e\xcb\x00\x20\x9c\xf2\x55\
+\xe0\xb9\x2a\x86\x78\x78\x0c\xdb\x16\xb0\x00\xb3\xca\x8c\x74\x34\
+\xb0\x91\xd0\xb1\xbe\x0d\x0b\x7d\x5d\x7f\x3e\xf0\x3f\xc0\xa5\xaa\
+\x82\xa2\x17\xc7\x00\x3b\x45\x2c\x72\x45\xfa\x65\x38\x0f\xf3\x73\
+\x15\x22\x15\x23\x40\x6a\xf3\x8a\xc1\x8e\x5b\x0e\xfc\x1c\xf8\x56\
+\xf1\xdc\x22\x2a\xb6\xc1\x1c\x64\x95\x84\x49\x06\x00\xe1\x88\x17\
+\x60\x5e\x4e\x22\x42\xe6\x02\x17\x14\xbf\xef\x48\x79\x57\xbc\x26\
+\x64\x05\xa0\xe2\xf5\xaf\x04\x3e\x86\x19\x5d\x84\xe8\xcd\x89\xd8\
+\xb6\x1c\x89\x7c\x19\x07\x7c\xb1\x00\xb8\x44\x5f\x83\x90\x11\x20\
+\xb8\x11\x60\x43\x31\xcf\xfa\x3c\x70\x0b\x4a\xc7\x19\x31\x87\x60\
+\xbb\x65\x6f\x55\x51\xc8\x00\x20\xaa\xb1\x33\xf0\x17\x60\x84\x8a\
+\x22\x5e\xd6\x01\x37\x01\xff\x04\xa6\x02\x5b\x37\x40\xfc\x13\xf0\
+\xf8\x0d\x58\x74\xdf\xef\x01\x6b\x55\xdd\x44\x1f\x9c\x0c\x4c\x0f\
+\x20\x36\x45\x5a\xc6\x01\xd7\x06\x80\x0b\x55\xd4\x42\x46\x80\xa0\
+\x46\x80\x9b\xb0\x0c\x3f\x17\x69\xfc\x4f\x85\x53\x80\x3f\xa2\xa4\
+\x29\x32\x00\x88\xd2\x8c\xc1\xbc\xcc\xb7\x51\x51\xa4\xc1\x72\xe0\
+\x72\xe0\x0e\x2c\x2d\xd9\x84\x1a\x07\xcf\x5c\x02\x03\x3e\x0a\x7c\
+\x14\xe5\x98\x11\x83\x1b\x00\xb6\x72\x28\x1e\x45\xbe\x86\x81\xb2\
+\x3c\x0a\x9c\xa7\x22\x15\x91\x1b\x01\xee\xa3\xef\xec\x00\x3e\xe7\
+\x06\x3e\xe6\x10\xf3\x31\xa3\xff\xcf\x81\x27\xf4\xd5\xa6\xc4\x70\
+\xe0\x68\xe0\x4c\x6c\x7d\x4c\xc8\x00\x20\x3a\xe4\xff\x61\x69\xff\
+\x44\x62\x3c\x8a\x59\x6e\x16\x61\x2e\x1c\x23\x02\x8b\xff\x58\xc4\
+\x3c\x15\x8f\xff\x77\x21\xfe\xb5\xd7\x4f\x0c\xc6\xa9\x98\xf7\x8d\
+\xc4\x7e\x67\xcf\xae\x72\x68\xff\xd9\x17\x02\xff\x50\x53\x13\x91\
+\xf3\x08\x16\xaf\xe2\x50\xfa\xcf\x17\x1d\xf3\xdc\x63\x05\xf0\x1b\
+\x2c\xc8\xdf\x3c\x7d\x9d\xa9\x32\x15\xd8\x1e\x8b\xd3\x28\x64\x00\
+\x10\x1d\xf0\x26\xe0\xfd\x2a\x86\x74\x69\x61\xe9\xe9\x2e\xc0\x52\
+\x38\xec\xb8\xd9\xa0\x97\x5a\x56\x00\x02\x1e\xdf\x13\xe5\xff\x5b\
+\xc8\xe5\x4f\xb4\xc7\x69\xc0\x94\x36\xc4\x5e\x2e\x62\xdd\x47\x2a\
+\xbe\x3a\x3e\x33\xd6\xf2\xee\x8b\xc5\xc0\x39\x6a\x6a\x22\x01\x1e\
+\xc2\xb6\xac\x1c\x3c\x40\x7d\x8e\x2d\xea\x7f\x0b\x8b\xb1\xf1\x59\
+\x2c\xc5\xef\x46\x7d\x8d\xa9\xb3\x27\xf0\x30\x70\xad\x8a\x42\x06\
+\x00\xd1\x1e\x07\x14\xfa\x67\xa8\x8a\x22\x7d\xd6\x62\xa9\xa3\xfe\
+\x89\xc5\x06\xd8\x0a\x05\x06\x1c\xe8\xf8\x85\x58\xa0\xbf\x8b\x54\
+\x75\x44\x07\x9c\x0c\x6c\x99\x80\x00\x6d\x5a\x3a\xc0\x54\x9f\xb7\
+\xaf\xfb\x7b\x0c\xf8\x9b\x9a\x9a\x48\x84\xb9\xd8\x26\xec\x03\x03\
+\x1b\x01\x3a\x35\x18\x80\x45\x8c\xfb\x3c\x70\x2e\xb0\x46\x5f\x5d\
+\x4e\x9c\x08\x9c\x8d\x1c\x39\xa3\x43\x02\x33\x3e\xc6\x02\x3f\x43\
+\x41\xff\xb2\xe3\x21\xe0\x13\xc0\xfe\xc0\xab\x18\xdc\x5d\xb9\x89\
+\x81\x01\x6f\xc1\x82\xfd\x2c\x56\x75\x11\x1d\xb2\x21\x12\x21\xa9\
+\xf8\x01\x7e\xca\xad\x15\xc1\xfd\x69\x33\xab\x48\x8d\x0b\x80\xd1\
+\xc5\x9c\x63\xa0\xba\xdd\xea\xa0\x1d\xb8\x3c\x76\x21\xb6\xc7\xff\
+\x52\x14\xd9\x3f\x53\x46\x02\xbf\x06\xf6\x03\x96\xa9\x38\xe2\x41\
+\x1e\x00\xf1\xf1\x7d\xe0\x58\x15\x43\xbe\x3c\x82\xed\x23\x5d\x06\
+\xcc\xc1\xb6\x07\x84\x10\xde\xbe\x83\xfd\x55\x9d\xec\xff\xbd\x10\
+\xff\x2b\x55\x45\x44\x09\x8e\x63\x53\xf6\x8d\x10\x62\x50\x59\x02\
+\xc2\x0b\xf0\xba\xcb\xfc\x21\x2c\xb6\x8b\x10\x29\x71\x67\xd1\x4e\
+\x76\x77\x34\x3f\x70\x31\x37\x58\x83\x6d\x0e\xff\x32\xb6\x55\x52\
+\x64\xcd\xa4\x62\x78\xfe\x93\x8a\x42\x06\x00\xd1\x37\x2f\x07\x3e\
+\xac\x62\xc8\x9f\x8d\xc0\x5d\x98\x9b\xfb\x28\x2c\x52\x4a\x97\x67\
+\xf1\xdf\xe9\x44\x9b\x40\xd7\x5e\x0d\x7c\x09\xf8\x1d\x5a\x01\x10\
+\xe5\x39\x1a\x3f\xe9\x52\x24\xf2\xd3\x34\x0e\xf8\x60\x1e\x4a\x03\
+\x28\xd2\xe4\x66\xcc\xad\x74\x4e\x4d\x73\x8a\x1e\x5a\xc0\xbf\xb0\
+\x7d\xfe\xff\xc6\x3c\xb7\x44\x23\xd8\x07\xb8\x07\xb8\x51\x45\x11\
+\x07\xda\x02\x10\x0f\xb3\x81\xaf\xa9\x18\x9a\xc5\x62\xe0\x3b\x58\
+\x6a\xa9\x57\xb6\x31\x38\x57\x1d\x7c\xeb\x3a\xb6\xbf\xe3\x1f\x06\
+\x3e\x85\x22\xfd\xba\x66\x34\xb0\x5d\x21\x88\x27\x16\xff\x5b\x57\
+\x94\xf3\x2d\xe4\xb9\xc7\x72\x85\x03\x11\x29\xf2\x32\x0a\xf4\x45\
+\x15\x23\xe3\x72\x15\xab\x48\x98\x9f\x14\x63\xc3\x49\x6d\xb4\x9d\
+\x56\x07\x6d\xac\xdd\x63\xef\x01\x7e\x08\xdc\xae\xaf\xa2\xa9\x7c\
+\x0b\xb8\x0a\x73\x4a\x11\x32\x00\x08\xcc\x30\xfb\x2b\x60\x9c\x8a\
+\xa2\x99\xdc\x03\x7c\x08\x38\x04\x73\x03\x99\xd2\x00\xf1\x7f\x25\
+\xe6\xfe\x27\x97\x7f\x37\x62\x67\x37\x2c\xe2\xf3\xde\x98\x35\xb1\
+\xbb\x9f\xf2\x5f\x5a\x4c\x04\xff\x9a\x59\x19\x3c\xe1\xa0\x4e\x8a\
+\xe6\x19\x06\x5a\x1e\xeb\x98\x10\x31\xd1\x02\xbe\x0b\x8c\x01\x0e\
+\x77\x64\x04\x68\xe7\xd8\xc5\xd8\x26\xf0\xf3\x90\x97\x5f\xc3\xe9\
+\x89\x71\x76\x38\x4a\xf0\x24\x03\x80\x00\xe0\xd3\x58\x80\x0c\xd1\
+\xf0\xc1\xf9\x9f\x58\xbe\x94\xd3\x81\x67\xf3\xd4\xf8\x00\x39\x04\
+\x06\xdc\x88\x05\xfd\xf9\xad\x26\x03\x95\xd9\x01\x0b\xb1\x7b\x24\
+\x30\xb9\xcd\xf2\x9f\x00\xbc\xb9\xa8\x5b\x7f\x68\x88\x01\x20\x55\
+\xb1\x9f\xba\x91\xa2\x95\x68\x19\xb7\x64\x00\x10\x99\xb2\x11\x33\
+\xbc\x8f\xc1\x7c\xb2\x7d\x1a\x01\x36\x60\x59\x33\x7e\x09\xac\x52\
+\xd1\x0b\xe3\x00\xe0\xe3\xc0\xbb\x55\x14\x9a\x5f\x34\x9d\x53\x80\
+\xb3\xf4\x5d\x88\xcd\x99\x02\xbc\x08\xdb\xdb\x9c\x8b\xf8\x5f\x8e\
+\xa5\xfa\xb9\x4e\x5f\x6f\x69\x86\x03\x47\x61\x79\xef\xe7\x54\xf8\
+\x9e\x56\x00\xcf\x27\x9f\x3d\x98\xcf\x00\xfe\x2b\x91\x81\x4d\x9d\
+\x7d\x5a\x86\x82\x9e\xfb\xfb\x2a\xf9\x79\xce\x88\x66\x32\x0a\x4b\
+\xb7\xbb\x83\xe3\xf6\xd9\x73\xec\xd5\xc0\x8f\x50\xee\x37\xd1\x6f\
+\x35\x79\x46\xa1\x7d\x84\xe6\x21\x8d\x64\x1a\x70\x43\xf1\x53\x88\
+\x3e\xd9\x03\x4b\xe1\x33\xd3\x71\xa3\xae\x63\xbf\xff\x27\x80\x07\
+\xf5\x95\x96\x62\x34\xb6\xda\x7f\x06\x7d\xaf\xf6\x97\xf9\x9e\xfe\
+\x03\x4b\xc3\x94\x03\x87\x14\x13\x5a\x0d\xac\x32\x10\xf8\xe2\x03\
+\xd8\x06\x56\x21\x72\x60\x3c\xf0\x49\x60\xba\xc3\x36\xf8\x10\xb6\
+\xcf\x5f\x46\x7e\x31\x08\x8f\x62\x4e\x28\x8f\xa8\x28\xea\x41\x59\
+\x00\xea\xa3\x1b\xf3\xc0\xdd\x4b\x45\x21\x06\xeb\x25\xff\x81\x59\
+\xd2\xe7\x60\x49\x55\x63\x15\xff\xfd\x45\xe0\xbe\x06\xf8\x9f\x8c\
+\xc4\x66\x48\xb6\x00\x5e\x02\xbc\x07\x38\xb4\x30\x04\xb4\x5b\xee\
+\x83\x71\x0b\xf0\x40\x26\xe5\x34\x0c\x5b\x52\x08\x29\xf2\x95\x0a\
+\xb0\x59\x65\xfd\x73\x2c\x86\x86\x10\x39\xb0\x06\xdb\x72\x78\xf8\
+\x20\xf3\x8a\x76\xe6\x01\xcb\x81\x9f\x02\xdf\xc0\x8c\xfd\x42\x0c\
+\xc2\x18\x60\xcf\xa2\x5b\xd5\x6e\x50\x19\x00\x1a\xc5\x7b\x81\xd7\
+\xaa\x18\x44\xbb\xcc\xc5\x82\xe8\x00\xec\xc4\x53\x83\xbc\xc5\x20\
+\xfe\xfb\xe2\x2f\xc0\x57\x50\xc4\x97\x4e\x19\x87\xad\xf6\xbf\x17\
+\x0b\xec\x37\xcc\xa1\xf0\xef\xe1\x3e\x2c\x3d\x54\x0e\xac\xc5\xb6\
+\xcc\x84\x12\xa0\x22\x5e\xe3\x80\x0f\x5a\xc0\xf7\x50\xda\x32\x91\
+\x17\xcb\x31\x43\xf0\x91\x0c\x1e\x14\xac\xaf\xf6\xb5\x01\x38\x1f\
+\x4b\xeb\x77\xb3\x94\x9c\xe8\x8c\x1d\x8b\x2a\x78\x85\x8a\xa2\x9e\
+\xb1\x53\x84\x67\x3f\x2c\x15\xea\x30\x15\x85\x28\xc3\x74\xe0\x15\
+\xc0\xfe\xc4\xbb\xdf\x7f\x2d\xb6\x1a\x70\x91\xbe\xae\x8e\x18\x0e\
+\x3c\x07\x78\x1e\x66\x22\xf7\xd1\x71\xf7\x9c\xff\x3b\x2c\x2a\x74\
+\x2e\xfc\x16\x0b\x72\xa8\x01\x51\xf4\x27\xe2\xcb\xb2\x08\x78\x81\
+\x8a\x50\x64\xca\x9e\xc0\x07\x3b\x98\x94\xb6\x80\x9b\x30\x77\xff\
+\xb9\x2a\x3e\x51\x9e\x35\xc0\x41\xc0\x8d\x2a\x8a\xb0\xc8\x03\x20\
+\x3c\x23\x80\xb3\x81\xad\x55\x14\xa2\x2c\xcb\x80\x4b\xb1\x7c\xba\
+\x3b\xb6\x29\x7a\x42\x8a\xff\x45\xc0\x47\x31\xd7\x7f\xd1\x3e\x07\
+\x17\xe5\x76\x44\x61\x08\xe8\xab\xac\xab\x88\xd4\xcd\xcf\x7f\x88\
+\xbc\x4c\xef\x07\x02\x5b\x95\x28\x0f\xad\xea\x37\x83\x2a\xdf\xf7\
+\xad\x6c\xf2\xc0\x12\x22\x37\x1e\x05\x16\x60\xb1\x54\x06\x6b\x1b\
+\x8f\x00\xdf\xc1\xd2\xc9\x6a\x4b\x8c\xa8\xc8\x50\x2c\xd6\xf5\x0f\
+\x80\xf5\x2a\x0e\x19\x00\x72\xe6\xf3\x58\x96\x37\x21\x2a\xb3\x00\
+\x38\xb7\x30\x08\xcc\xa1\x7f\xeb\x7d\x27\xdb\x03\xaa\x1e\x7b\x2f\
+\xf0\x61\xf2\xd9\x5b\x1e\x82\x6d\x80\xff\x06\x5e\x8c\x25\xca\xf5\
+\x2d\xfc\x7b\x78\x22\x33\x51\xb3\x13\xb0\x6b\x9b\xe2\x2f\x25\xc1\
+\xdf\x95\xd8\x2b\xe5\x72\xed\x8f\x2b\x90\x41\x53\xe4\xcd\xbc\x42\
+\x81\xf5\x17\x98\x6a\x35\xe6\x35\xf6\x25\xb4\xea\x2f\x9c\xb2\x25\
+\xb6\x38\x7a\xae\x8a\x22\x1c\x43\x55\x04\x41\x39\x12\x78\x8b\x8a\
+\x41\xb8\x64\x03\x96\x4b\xe5\x12\x6c\xcf\xf8\xa9\x3c\x35\x3e\x40\
+\xbb\x93\x61\x2a\x1e\x7b\x09\xf0\x35\xb4\xdf\xbf\x5d\xc6\x60\x01\
+\xfe\x9e\x41\xdf\xd6\x58\x57\xae\xfe\xfd\xb1\x55\x66\xe5\x79\xaf\
+\xc3\xb2\x0b\x21\x3e\x73\xa5\x93\x67\x6b\x45\x7e\xef\x3d\xf7\x77\
+\x9f\xba\x2b\xd1\x00\x7e\x5f\xa8\xb1\x93\x37\x6b\x03\x17\x03\x3f\
+\x06\x96\xa8\x88\x84\x1f\xde\x89\x79\x47\x5f\xa4\xa2\x90\x01\x20\
+\x37\x26\x60\x41\x52\xbb\x55\x14\xc2\x07\xcb\x30\x1f\xaa\x0b\x81\
+\x57\x03\xbb\x7b\x9a\xb0\x0f\x14\xec\xef\xfb\x28\x08\x50\xbb\x65\
+\x78\x5c\xf1\x3d\x4d\xac\x41\xf8\xf7\xb0\x65\xd1\x21\x6d\xcc\xa4\
+\x5c\xef\x8e\x48\x58\x6b\x4b\x81\x9b\x72\x6a\x45\x72\x7f\xf7\xe8\
+\xab\x12\x0d\xe1\xff\x61\x7b\x54\xf7\x06\xee\x2c\xc6\xf5\x3b\x55\
+\x2c\xc2\x2f\xdd\x58\x48\x89\xbd\x31\xe7\x44\xa1\x39\x4a\x36\xfc\
+\x04\x5b\xec\x13\x22\x08\x07\x00\xaf\x01\xa6\x79\x16\xff\xeb\x80\
+\xaf\x23\xb3\x6d\xbb\xcc\x02\xde\x0e\xec\xec\xb8\x43\x2e\x7b\xee\
+\x4b\x80\xc7\x32\x9a\x41\xfc\x91\xbe\x53\x25\x6a\x10\xcd\x8b\x90\
+\x86\x81\x95\xc0\xb3\xc8\xc7\x50\x26\xc4\x60\x8c\x02\xf6\x00\xae\
+\x46\x46\x7d\x11\x94\x1f\x02\xaf\x52\x31\xf8\x47\x31\x00\xc2\xf0\
+\x6c\xe0\x13\x2a\x06\x11\x92\x87\x81\x7f\x60\xfb\xf6\x76\xa6\xff\
+\x34\x72\x55\x84\xce\x72\xe0\xe3\xc0\x55\x2a\xee\xb6\x3a\xdb\xe7\
+\x61\x69\xfd\xa6\xf6\x51\xb6\x65\x85\x64\xd5\x7d\xd7\x57\x60\x01\
+\xa0\x72\x11\x85\xfb\xe2\x27\xc2\x6a\xea\xfb\xdd\x73\x23\xe4\xf7\
+\x71\x1d\x0a\x00\x28\x9a\xc5\xfa\x62\x0e\x21\x44\x60\xf6\xc5\x32\
+\x53\xde\xaa\xa2\xf0\x8b\xdc\xd1\xfd\x33\x15\xf8\xb6\x8a\x41\xd4\
+\xc1\x5a\x6c\x4f\xdf\x7f\x61\x5b\x03\x5a\x0e\xc5\xff\x23\xc0\xbb\
+\xc9\x27\x8f\xbc\x4f\x66\x61\x81\x93\x5e\xc5\x93\x0d\x31\x75\x0a\
+\xff\x9e\x6b\xe4\x16\x07\xe0\x16\x4f\xe2\x52\xa4\x6b\x18\x88\xa1\
+\x4e\x09\x21\x84\x68\x8b\x6f\x65\x38\x35\x91\x01\xa0\x81\x73\x91\
+\x1f\xf0\xd4\x05\x3f\x21\x82\xb2\x10\xf8\x6a\x21\xd8\xef\xa0\x7a\
+\xa4\xff\xdb\x8a\x6b\x3d\xa4\xa2\x1d\x90\x21\x58\x60\xc6\xaf\x62\
+\x11\xea\x63\x12\xfe\x3d\xd7\x98\x91\x59\x99\x5f\x2f\xb1\x2f\x1c\
+\x7f\xc7\xd7\xab\x08\x85\x10\x22\x14\x53\x80\x1f\x69\x38\xf6\x3f\
+\x3f\x15\xfe\x78\x3d\xf0\x0e\x15\x83\x88\x85\x45\xc0\xf9\xc0\x7c\
+\x60\x17\x6c\x9f\xdf\x40\x93\xe6\xbe\x38\x1f\xf8\x0c\xb0\x4a\xc5\
+\x39\x20\xb3\x80\x8f\x02\x27\x6c\xd6\xd1\xc6\x22\xfc\x7b\x58\x46\
+\x5e\xf1\x1b\x16\x62\x7b\xae\x86\x67\x26\xf6\x95\x02\xb0\x1e\xa3\
+\xc0\x32\xe0\x9b\x68\x1f\xb4\x10\x42\x04\x64\x36\xf0\x20\x70\xad\
+\x8a\x42\x06\x80\xd4\x98\x09\xfc\x01\xcb\x6d\x29\x44\x54\xdc\x0f\
+\xfc\x1d\xdb\xe7\xb7\x73\x1f\x1d\x41\x5f\x93\xe1\x16\xf0\x73\xcc\
+\xa5\x45\xc1\xb0\xfa\x67\x28\xf0\x1f\xc0\x7f\x63\x51\xf6\x5d\x08\
+\xf8\xaa\xc1\x01\x07\xfa\xec\x61\x45\x47\x95\x0b\x1b\x81\x39\xc0\
+\x76\x09\x88\xd3\xa6\x08\xeb\x54\x9e\xa9\xaf\xfb\xfb\x17\x0a\x70\
+\x2a\x84\x10\x35\x70\x0c\xf0\x33\x94\x15\xc0\x0b\xda\x02\xe0\x6f\
+\x1e\xf1\x1d\x60\x9c\x8a\x42\xc4\xca\x6a\xe0\x97\xc0\x5b\x81\xcb\
+\x07\x11\x9b\x1b\xb0\x55\xb0\x5f\xab\xd8\x06\x64\x1a\xf0\x39\xe0\
+\xc5\x6c\xca\xb1\x5a\x97\xbb\x7f\xbb\xe7\x4e\x23\x6c\xd4\xfc\x10\
+\x5c\x15\x89\xc0\xcc\x45\xd4\x37\xb5\x7c\xba\x50\x80\x53\x21\x84\
+\xa8\x89\xf1\x58\x56\x00\x0d\x97\x32\x00\x24\xc3\x6b\x80\x93\x55\
+\x0c\x22\x05\x1e\x29\x44\xeb\x87\x81\x79\xfd\x18\x0a\x3e\x81\x65\
+\x14\x10\xfd\x73\x24\xf0\x0d\x6c\xf5\x39\x05\xe1\xdf\xfb\xf8\xed\
+\x33\xfb\x2e\x2e\xc7\x8c\x56\x75\x0b\x59\x91\x76\xb9\xae\xc7\xb2\
+\x64\x08\x21\x84\xa8\x85\xe3\x81\x97\xab\x18\xdc\xa3\x2d\x00\xee\
+\x99\x8e\x79\xd4\x8e\x52\x51\x88\x94\x58\x50\x88\xfc\x85\xd8\xb6\
+\x80\x91\xc0\x62\xe0\x23\x28\x0a\xf6\x40\x8c\x02\xde\x56\x8c\x50\
+\xc3\x7b\x09\x97\xd8\x85\x7f\x6f\xee\x2c\x5e\xb9\xb0\x06\xd8\xb3\
+\xe8\x8c\x25\xf4\x65\x18\x28\xcb\x55\xc0\x39\x2a\x6e\x21\x84\xa8\
+\x93\x63\x81\x9f\xa2\xad\x00\x32\x00\x44\xce\x4f\x80\x7d\x54\x0c\
+\x22\x45\x5a\xc0\x3d\xc0\xb9\xd8\xca\xff\x0f\xe8\xdb\x2b\x40\x18\
+\xb3\x81\x4f\x02\x7b\x57\x14\xe1\x75\x67\x05\x78\x1c\xb8\x32\xb3\
+\xef\x66\x18\x70\x98\x63\x91\x29\xd2\x33\x0c\x54\xe1\x67\x45\x7f\
+\x28\x84\x10\xa2\x36\x46\x62\xeb\x52\xbf\x50\x51\xb8\x43\x5b\x00\
+\xdc\xf2\x72\xe0\x74\x15\x83\x48\x9d\xe5\xd8\x7e\xff\x47\x54\x14\
+\xfd\x0a\x8d\xd3\x81\x2f\xb2\x29\x8d\x5e\x8a\xc2\xbf\xe7\x1a\xbb\
+\x66\xf8\x1d\x5d\x0a\xac\x95\xd8\x57\x5b\x2d\xf9\xdd\xae\xe1\xc9\
+\xb1\x51\x84\x10\x42\xd4\xc6\xd3\xb1\xf0\x4a\x42\x06\x80\xe8\xd8\
+\xba\xd0\x03\x42\x88\x8c\x19\x8f\x6d\x8b\x78\x03\xb6\xca\x5c\x65\
+\xd5\xbf\x0e\xe1\xdf\x97\x10\xda\x1e\x18\x93\xd9\xf7\xb4\xac\x30\
+\x02\xb4\x23\x0a\x53\x17\xb4\x4a\xff\x57\xad\x0c\xfb\xe2\x22\x60\
+\x85\xba\x3b\x21\x84\x88\x85\xaf\x62\x71\x8b\x85\x0c\x00\x51\xf1\
+\x0d\x60\x92\x8a\x41\x88\x7c\xd9\x1b\xcb\x86\x70\x30\xe1\xdd\xfd\
+\x5d\x09\xff\xfe\x06\x82\x39\x19\x7e\x5f\x67\x25\x20\xf8\x73\x11\
+\xda\x29\x3f\x47\x5f\xf7\x76\xb6\xba\x3b\x21\x84\x88\x89\xc9\xc0\
+\xd7\x54\x0c\x32\x00\xc4\xc4\x8b\x81\x67\xab\x18\x84\xc8\x93\x1e\
+\x97\xff\x4f\x14\x23\x50\x1d\xee\xfe\x3e\x84\x7f\x6f\x76\xcf\xf0\
+\x7b\xbb\x11\x78\x20\x72\x61\xdc\xe4\x36\x15\x6b\xb9\xcc\x03\x6e\
+\x56\xb7\x27\x84\x10\xb1\x71\x06\xf0\x3c\x15\x83\x0c\x00\x31\x30\
+\x15\xf8\x8a\x8a\x41\x88\x3c\x19\x05\xbc\x0f\x73\xf9\x1f\x4a\x3a\
+\xee\xfe\x9d\x9e\x9b\xa3\x01\xa0\x05\xfc\xae\x66\x41\x2b\xd2\x2b\
+\xcf\xdf\xaa\xf8\x85\x10\x22\x56\xbe\x8e\xad\xc5\x08\x19\x00\x6a\
+\xe5\xcb\xc0\x14\x15\x83\x10\xf9\xd1\x13\xd8\xe3\x48\xd2\x71\xf7\
+\x2f\x7b\xee\x1c\xf2\x4c\x0b\xf3\x0f\x60\xa9\x84\xbe\x0c\x03\x6d\
+\xb2\x04\xcb\x82\x22\x84\x10\x22\x4a\xa6\x01\x9f\x57\x31\xc8\x00\
+\x50\x27\x27\x01\x2f\x52\x31\x08\x91\x1f\x07\x60\x11\x67\xb6\x2f\
+\x21\x30\x52\x4c\x07\x38\x86\x3c\xe3\x00\xac\x01\xfe\xec\x50\x6c\
+\x8a\x74\x0c\x03\x65\xf8\x03\xed\x67\x8f\x10\x42\x08\x51\x0b\x2f\
+\x07\x8e\x57\x31\xc8\x00\x50\x07\xa3\xb0\x78\x60\x42\x88\xcc\x84\
+\xc4\x19\xc0\x47\x81\x71\x25\xcf\x4f\x49\xf8\xf7\x3e\xff\xa0\x4c\
+\xbf\xd3\x3f\x00\xab\x24\xf6\x65\x14\x18\xe4\xf8\x15\xc0\x1f\x55\
+\x6c\x42\x08\x91\x42\xf7\xfe\x2d\x60\xa4\x8a\xa2\x1c\x43\x54\x04\
+\xa5\xf9\x28\x16\x17\x4c\x08\x91\x09\xa3\x80\x77\x03\xcf\xa2\x73\
+\xeb\x68\xaa\xe9\x00\x7b\x33\x92\x4d\x91\xf3\x73\x62\x35\x30\x1a\
+\xd8\x73\x00\x71\x98\xba\xb0\x55\x0a\xc0\x72\x65\xd7\x9b\x5f\x00\
+\x57\xa9\x1b\x14\x42\x88\x14\x98\x0c\xac\x07\x2e\x56\x51\x84\x9b\
+\x7b\x36\x9d\x5d\x80\x1b\x80\x11\x2a\x0a\x21\xf2\x60\x06\xf0\x21\
+\x60\x56\xa0\x8e\xb4\x8e\x8c\x00\x83\x9d\xdf\x02\x5e\x00\x2c\xca\
+\xf0\xfb\x1d\x5b\x08\xbc\xb1\x1a\x8c\x6b\xa5\x15\xe9\x7d\x2d\xc7\
+\xf6\xf3\x2d\x57\x57\x28\x84\x10\xa9\xb0\x06\xd8\x17\xb8\x4d\x45\
+\xd1\x19\xda\x02\x50\x6e\x9e\xf6\x2d\x89\x7f\x21\xf2\xe1\x40\x2c\
+\x95\xc7\xac\x12\x9d\x41\xa8\xf8\x00\x55\x45\x62\x3b\x9f\xdb\x85\
+\xc5\x3e\xc8\x91\xe5\xc0\xaf\x6b\x1e\x38\x94\x0e\x30\xde\x72\xf8\
+\x99\xc4\xbf\x10\x42\xa4\xc6\x88\x42\x93\x69\x41\x5b\x06\x00\xef\
+\xbc\x06\x38\x56\xc5\x20\x44\x1e\x9c\x02\xfc\x0f\x9d\xad\x0c\xa7\
+\xe4\xee\xdf\xe9\xb9\x07\x66\xfc\x5d\xff\x1a\x58\x50\x93\xb8\x15\
+\xf1\x96\xe1\x23\x84\x4b\x17\x29\x84\x10\xc2\x29\x47\x03\x2f\x55\
+\x31\xc8\x00\xe0\x93\x29\xc0\x27\x55\x0c\x42\xe4\x21\x34\x5e\x02\
+\xbc\x95\xce\x82\xa1\xe4\x9e\x0e\xf0\x60\xf2\x75\x6f\x5a\x03\x7c\
+\xc7\xa3\x48\x15\xf5\x18\x07\xaa\xf2\x4d\x60\x9d\x8a\x57\x08\x21\
+\x52\xe5\x8b\xc0\x96\x2a\x06\x19\x00\x7c\xf1\xa5\xc2\x08\x20\x84\
+\x48\x98\x91\xc0\x87\x0b\x03\x80\x4f\x41\x9d\x6a\x3a\xc0\x03\x32\
+\xfe\xee\x2f\x02\x6e\xac\x28\x3a\x45\xfc\x86\x81\x76\xb9\x16\xb8\
+\x4c\x45\x28\x84\x10\x29\x33\x19\xf8\x8c\x8a\x41\x06\x00\x1f\x1c\
+\x03\xfc\x87\x8a\x41\x88\xb4\x99\x08\x7c\x16\x38\xb4\x43\x81\x51\
+\x46\x94\x10\xf8\x3c\x57\x31\x02\x8e\xce\xf8\xfb\x6f\x01\x9f\xa3\
+\xef\x5c\xef\x12\xfb\xcd\x32\x0a\xac\xc3\x62\x7f\x08\x21\x84\x48\
+\x9e\x57\x00\xc7\xa9\x18\x64\x00\x70\xc9\x08\xe0\xbb\x9a\x0f\x0a\
+\x91\x36\x33\x8b\x09\xff\xce\x1e\x05\x79\xe8\x55\x7f\x1f\xe9\x00\
+\x0f\x23\xef\x28\xa7\x0f\x62\x41\xdf\x52\x17\xfb\x4a\xff\x57\xad\
+\xbc\x7e\x04\xcc\x53\xb7\x28\x84\x10\x39\xd0\x05\x7c\x1d\x18\xae\
+\xa2\x90\x01\xc0\x15\xef\x04\x76\x52\x31\x08\x91\x2e\xfb\x62\x9b\
+\xc4\xa6\x7a\x14\xd6\xa9\x0b\xff\x1e\x46\x61\xb1\x00\x72\xe6\xe7\
+\xc0\x3d\x89\x0b\x7a\xdd\x6f\x79\xee\xa6\xde\xac\x10\x42\x08\x21\
+\x9c\xb3\x2b\xf0\x16\x15\x83\x9f\xf9\x6a\xd3\xd8\x06\xcb\x2f\x39\
+\x56\x45\x21\x44\x9a\x9c\x54\x8c\x08\x43\x3d\x75\x8c\x75\xb8\xfb\
+\xfb\xee\xf4\x2f\x02\x3e\x96\x79\xbd\xd8\x01\xf8\x36\xe1\x96\x0b\
+\x34\xe0\x0e\x4c\x2b\xd0\xe7\xac\x01\x5e\x0f\xdc\xaf\x22\x17\x42\
+\x88\xdc\x58\x06\xcc\x01\x1e\x56\x51\xf4\xcf\x10\x15\xc1\xa0\x7c\
+\x0f\x5b\x3c\x14\x42\x24\x46\x4f\xa4\xff\xd7\xd3\x9e\xbb\x53\xce\
+\xab\xfe\x9d\x9e\x3b\x1d\xf8\x33\x7d\xef\x95\xcf\x85\xc5\xc0\x2a\
+\xe0\x20\xc7\x75\x4e\x59\x02\xe2\x2e\xbb\xaf\x03\xff\x52\x71\x0b\
+\x21\x44\x8e\x8c\x00\xa6\x01\x7f\x50\x51\xc8\x00\x50\x96\x23\xb1\
+\x78\x51\x9a\xbb\x09\x91\x18\x43\x81\x77\x03\xcf\xf4\x24\xe4\x73\
+\xcf\x0a\x30\x04\x58\x88\xb9\x3f\xe5\xcc\x6d\xc0\xee\xc0\x0c\x47\
+\x62\x55\x84\x35\x0e\x74\xca\x3f\xb1\xb4\x7f\x42\x08\x21\xb2\x65\
+\x4f\xe0\x42\x60\xae\x8a\xc2\xcd\x9c\xb7\x69\xfa\xe1\x1a\x60\x2f\
+\x15\x85\x10\x69\x31\x02\xf8\x20\x70\xa0\x47\xf1\x4f\xa4\xe7\xb8\
+\xea\xdc\xbb\x8a\x91\xf3\x95\x0d\xa8\x2f\xe3\x81\xef\x00\x5b\x6b\
+\xa0\xcc\x82\xfe\xb6\x12\x2c\x00\x5e\x07\x2c\x55\x11\x09\x21\x44\
+\xee\x5c\x57\x4c\x03\x37\xa8\x28\x9e\x8a\x82\x00\xf6\xcf\x9b\x25\
+\xfe\x85\x48\x8f\xb1\xc0\x27\xdb\x14\xff\x9d\xae\x22\x86\x5e\xf5\
+\x2f\x2b\xdc\x5d\x05\x07\x9c\x09\xec\xd6\x80\x3a\xf3\x04\xf0\x21\
+\x6c\x6f\x78\xef\x32\xd0\xaa\x7e\x9a\xf4\xf5\xfd\xad\x2d\xbe\x63\
+\x89\x7f\x21\x84\x68\x04\xfb\x62\x36\x5f\xd1\x07\xda\x02\xd0\x37\
+\x53\x81\xdf\x02\x23\x55\x14\x42\xa4\xc3\x44\xe0\x53\xc0\x2e\x1e\
+\x04\x76\xc8\x55\xff\x98\xb2\x02\x74\x03\x97\x37\xa0\xee\x2c\xc2\
+\xb6\x3c\x1c\x99\x81\xe0\x55\xfa\xbf\xa7\x96\xcf\x67\x81\xab\xd4\
+\x45\x0a\x21\x44\x93\x38\x0c\xf8\x3e\xb0\x52\x45\x21\x03\x40\x3b\
+\x7c\x0d\x38\x54\xc5\x20\x44\x3a\x4c\x2d\x26\xf9\x33\x1d\x0b\xe5\
+\x50\xab\xfe\x31\xa6\x03\x04\x4b\x83\xf2\x27\xf2\x0e\x06\xd8\xc3\
+\xdd\x58\x46\x80\x3a\x5d\xbf\x52\x10\xe4\xa9\x19\x0d\x7e\x02\xfc\
+\x46\x5d\xa4\x10\x42\x34\x8d\x51\xc0\x04\xe0\xaf\x2a\x0a\x19\x00\
+\x06\xe3\x00\x2c\x48\xb0\x3c\x3f\x85\x48\x84\xed\x0a\xf1\xbf\x55\
+\x1b\xc2\xa5\x53\xa1\x43\xa4\xe7\x54\x39\xaf\x13\xc3\xc1\x50\xcc\
+\x45\xfe\x96\x86\xd4\xa5\x6b\xb1\x0c\x08\x3b\xd6\x24\x9e\x73\xa5\
+\xae\xe7\xbe\x00\xf8\xb2\xba\x48\x21\x84\x68\x2a\xfb\x01\xe7\xa0\
+\xb4\x80\x4f\x42\x31\x00\x9e\x5a\x1e\xdf\x50\xb9\x08\x91\x0e\x3b\
+\x61\xa9\x3a\xa6\xd4\x2c\xfe\x73\xce\x0a\xf0\x9c\xc2\x10\xd0\x04\
+\x5a\x45\x7d\xba\xde\x93\xd8\x15\xe1\xca\xec\x3a\x2c\x1e\x48\x4b\
+\xc5\x2b\x84\x10\x4d\xd6\x76\x5f\xd1\x10\xfc\x64\xe4\x01\xf0\x64\
+\x5e\x01\xbc\x49\xc5\x20\x44\x1a\xec\x09\x7c\x02\x18\xe7\x50\xcc\
+\x97\x15\xf2\x39\x0a\xff\x1e\xc6\x00\x0f\x01\xf7\x34\xa4\x5e\x6d\
+\x00\x2e\x02\xf6\xc1\x92\x09\x77\x2a\x5c\x85\x7f\xe3\xc0\x60\xdc\
+\x0a\xbc\x87\x4d\x81\x1d\x85\x10\x42\x34\x96\x6d\x81\xbb\x80\x9b\
+\x54\x14\xe5\xe6\xad\x39\x33\x0a\xb8\xa3\xa8\x24\x42\x88\xc8\x39\
+\x18\xf8\x00\xb6\x67\xdb\xa5\x30\xf7\xdd\x81\xa6\x98\x0e\x10\xe0\
+\x5e\xe0\x35\x34\x6b\x35\x75\x0c\xe6\x3e\xbe\xb3\x06\xcb\x64\x68\
+\x15\x75\xf5\xad\xd8\xd6\x15\x21\x84\x10\x02\x78\x10\x8b\x11\xad\
+\x80\x80\xc8\x03\xa0\x37\x1f\x04\x9e\xa9\x62\x10\x22\x7e\x8e\x05\
+\xde\x0b\x0c\x4b\x48\xfc\xa7\x9c\x0e\x10\x2c\xc3\xc2\x4d\xc0\x23\
+\x0d\xaa\x67\xeb\x80\x4b\xb1\x94\x92\x93\xd5\xec\x92\xe0\x2e\xe0\
+\x9d\x28\xdd\x9f\x10\x42\x88\x27\x31\x1e\x58\x01\x5c\xa6\xa2\xd0\
+\xa2\x46\x0f\xd3\x81\x3b\xb1\x05\x1f\x21\x44\xc4\x9c\x02\xbc\x65\
+\x90\xce\xab\x53\x97\x7f\xdf\x9d\x66\x2a\x81\x01\x07\x3b\xff\x1a\
+\xe0\x5d\x0d\xac\x73\xe3\xb0\x20\x93\xbb\x37\x7c\x40\x8f\xdd\xfb\
+\xe3\x66\xe0\xdd\xc0\x72\x75\x93\x42\x08\x21\x9e\xca\x32\xcc\xa9\
+\x6f\x7e\xd3\x0b\x42\x1e\x00\xc6\x57\x80\x83\x54\x0c\x42\xc4\xcd\
+\xc9\x98\x6b\x6f\x2a\xe2\x3f\xa7\x74\x80\x60\x96\xd2\xeb\x80\x05\
+\x0d\xab\x77\x6b\xb1\x68\xf2\xbb\x03\x5b\x07\x12\xf2\x31\xa6\xda\
+\x8b\xf5\xbe\x00\xae\x2e\xc4\xbf\x7c\x3b\x85\x10\x42\xf4\xc3\x08\
+\x60\x2c\x70\x56\xd3\x0b\x42\x1e\x00\xb0\x37\xb6\xb0\x25\x63\x88\
+\x10\x91\x8b\xff\xb7\x0d\xd0\x69\xc5\xe8\xf2\x1f\xaa\x43\x0e\x19\
+\x23\xe0\x26\xcc\x03\xa3\x89\x0c\x03\xfe\x1b\x78\x9a\x06\x5e\xa7\
+\x54\xf5\x2c\x38\x07\xcb\xdc\xb0\x5e\x45\x29\x84\x10\x62\x60\x36\
+\x60\x31\x7e\x6f\x6e\x72\x21\x48\xf4\xc2\x4f\x80\xd9\x2a\x06\x21\
+\xe2\xe5\x69\x0e\xc5\x7f\x57\x64\xc7\x97\x3d\xa7\xca\x79\x55\xce\
+\x9d\x46\xf3\x62\x01\xf4\xb0\x11\x8b\x09\xb0\x0c\x73\x19\xeb\x6a\
+\xa3\x7c\x95\x25\xa0\xfd\xba\xd8\x69\x59\xb5\x80\x1f\x01\x5f\x2f\
+\xbe\x1b\x21\x84\x10\x62\x10\xba\x81\xed\x81\x9f\xc9\x00\xd0\x5c\
+\x4e\x05\x3e\xa4\xb6\x20\x44\xbc\xb8\x5c\xf9\xcf\x29\x2b\x40\x9d\
+\xc1\x01\xb7\x01\xce\x6e\x70\x9d\xbc\x15\x98\x87\x65\xa2\x18\x26\
+\x91\x1f\xdc\x38\x00\xe6\xea\xff\x71\xe0\x8f\x2a\x22\x21\x84\x10\
+\x9d\xb1\x13\x70\x05\x96\x34\x46\x06\x80\x06\x3e\xfb\xef\x80\xa9\
+\x6a\x07\x42\x48\xfc\x57\x11\xc9\xa1\x57\xfd\xeb\x12\xfe\x3d\xe7\
+\x4f\x05\x6e\xc7\x72\xea\x34\x95\xfb\x80\xcb\xb1\x0c\x01\x13\x6a\
+\xbe\x97\xd0\xc1\xf9\xea\x36\x70\xcc\x03\xde\x0e\xdc\xa0\x2e\x52\
+\x08\x21\x44\x39\xf6\x07\xbe\x4b\x43\x1d\xc8\x9a\x6c\x00\x78\x3d\
+\xf0\x2a\xd5\x7f\x21\x24\xfe\xab\x88\x9b\xd8\x57\xfd\x5d\x78\x0b\
+\xf4\x75\xfe\x8e\xc0\x5f\x89\x3f\x32\xbc\x4f\x96\x00\x7f\xc3\x82\
+\x23\x6e\x9f\xb0\xa0\x4f\xc9\x60\x70\x1e\xf0\x3e\xe0\x71\x75\x91\
+\x42\x08\x21\xca\xb3\x25\x66\x4f\xbe\xae\x89\x0f\xdf\x54\x4f\xc5\
+\x71\x58\xba\xe0\x69\xaa\xff\x42\xa4\x25\xfe\x53\x76\xf9\xcf\x2d\
+\x30\xe0\x57\x80\x3f\xa8\xba\x02\x70\x2c\x16\x85\x7e\x6c\x03\x05\
+\x7e\x88\x89\xc8\x4a\xe0\x1b\xc0\x9f\x55\x5c\x42\x08\x21\xdc\xf0\
+\x08\x96\x16\xb0\x71\xd9\x63\x9b\xea\x01\xf0\x41\x6c\xff\xbf\x10\
+\x42\xe2\xbf\xd4\xb5\x15\x1f\x00\x76\xc3\xbc\x00\xd6\xaa\xda\x72\
+\x3f\x70\x11\xb6\xb1\x70\x2b\x8f\x22\x3f\x56\xe3\x41\x97\xc7\xeb\
+\xde\x00\xbc\x0b\x4b\xf5\x27\x84\x10\x42\x38\x62\x1c\xb0\x0a\xb8\
+\xa4\x69\x0f\xde\x44\x0f\x80\x29\x58\xd0\x87\x71\xaa\xf7\x42\xc4\
+\xc5\x49\xd8\xde\xde\x90\xe2\x5f\xab\xfe\xd5\x06\x82\xdf\x01\x5f\
+\x53\xd5\x7d\x52\x59\x9e\x04\xfc\x17\x30\x3e\x03\x61\x5f\xe7\xa4\
+\x63\x05\xf0\x7d\xe0\xf7\x28\xca\xbf\x10\x42\x08\x2f\x2c\xc5\x76\
+\x35\x2e\x6c\xd2\x43\x37\xd1\x03\xe0\x93\xc0\x51\xaa\xef\x42\xc4\
+\xc5\x89\xc0\x3b\x1a\x2e\xfe\xeb\xda\xe7\x5f\x85\x5d\x80\x8b\x8b\
+\x11\x54\x18\xf7\x00\xe7\x62\x7b\xcc\x66\x45\x20\xf2\x5b\x81\xeb\
+\x44\x55\xe3\x40\x0b\xb8\x10\x78\x2f\x70\x0d\xda\x32\x21\x84\x10\
+\xc2\x1b\x23\x8b\xe1\xe7\xdc\x26\x3d\x74\xd3\x3c\x00\xb6\x03\xee\
+\x04\x46\xa8\xbe\x0b\x11\x0f\x87\x60\xf9\x38\x87\x44\x2a\xfe\x63\
+\x76\xf7\xaf\xa3\xf3\xdf\xfc\xdc\x6b\x80\x77\x4a\xa8\xf5\xc9\x3e\
+\x98\x37\xc0\xec\x40\xe2\x3d\xf5\xc9\xc5\x9d\x98\x47\xc9\x8d\xaa\
+\x3a\x42\x08\x21\xc2\xb0\x1a\xdb\xc1\xd7\x98\xe4\x46\x4d\xf3\x00\
+\xf8\x12\x70\x80\xea\xb9\x10\xf1\xb0\x37\xf0\x11\x2c\x9f\x7a\x59\
+\x11\xd1\xe5\xe9\xd8\x10\xe2\x3f\xa5\x74\x80\xfd\x9d\x3b\x1d\x98\
+\x0f\xdc\xad\xea\xfc\x14\xe6\x63\x71\x12\x16\x14\xb3\x8b\xb1\x19\
+\x88\x7b\x1f\x46\x82\xf9\xc0\xd7\x81\x2f\x17\xbf\x0b\x21\x84\x10\
+\x81\x18\x0a\x8c\x29\x86\xeb\xc6\x8d\xbf\xb9\xb3\x0b\x70\x73\xf1\
+\x25\x0b\x21\x22\x60\x07\xe0\xb3\xf4\x1d\x39\xbd\x13\x41\x1f\x83\
+\x98\x8f\x7d\xd5\xdf\xb7\xb7\xc0\x0a\xe0\x65\x28\x3d\xdb\x60\x33\
+\x8c\x53\x80\x97\x63\xc1\x68\x5c\x11\xda\x90\xe0\x72\xe2\xf0\x18\
+\xf0\x4b\x2c\xba\xff\x3a\x55\x91\x28\xeb\xec\x96\xc5\x6b\x42\xd1\
+\x57\xf7\x7e\x8d\x2b\x7e\x8e\x61\x60\xd7\xca\x21\xc5\xfb\x2b\xb0\
+\x70\xdb\xcb\x8b\xdf\x7b\xfe\x5e\x59\xfc\xbe\x08\x33\x96\xcd\x07\
+\xd6\xa8\xf8\x85\x10\xe1\x58\x0f\xec\x01\xdc\x21\x03\x40\x5e\xfc\
+\x06\x78\x9e\xea\xb7\x10\x71\x30\x03\xf8\x3c\x30\x31\x42\xf1\xaf\
+\xc0\x80\xe5\xce\xbd\x10\xf8\x1f\x55\xed\x41\x19\x86\x05\x0a\x3c\
+\x83\x27\xc7\x08\xa8\x4b\xd0\xd7\x31\xd1\xb8\x1f\xf8\x35\xb6\xe9\
+\x52\xc2\xbf\x3e\xba\x81\xad\x31\x2f\x9e\x69\xbd\x5e\x5b\x15\x3f\
+\xa7\x14\xc7\xb4\x4b\x99\xba\xdb\xdf\x39\x4b\x80\x47\x0b\x83\x40\
+\xcf\xeb\x01\x2c\xc6\xc6\x22\x7d\x75\x42\x08\xf7\xfc\x02\x78\xb1\
+\x0c\x00\xf9\x70\x00\x70\x15\xcd\xcc\x7a\x20\x44\x74\x4c\x01\xbe\
+\x08\x4c\x8d\x50\xd0\xe7\x22\xfe\xeb\x8a\x0f\xf0\x7e\xe0\x72\x55\
+\xf1\xb6\xcb\xf9\x60\xe0\x39\xc0\xfe\x1d\x0a\xad\x14\xd9\x88\xc5\
+\x8b\xf8\x3d\x70\x25\xda\x02\x11\x9a\x31\x98\xe1\x75\x16\x96\xf8\
+\x7a\x17\x2c\x36\xc5\xa8\x40\x82\xde\xe5\x39\x4f\x00\x73\xb1\x98\
+\x11\x77\x15\xbf\xdf\x87\x8c\x49\x42\x88\x4a\xb4\x8a\xe1\xf8\x3a\
+\x19\x00\xf2\xe0\x5c\xe0\x04\xd5\x6b\x21\xea\x67\x3c\xb6\xf2\xbf\
+\x5d\xe2\xe2\x3f\x84\x28\x4f\x29\x1d\x60\xcf\xf9\x8f\x01\xaf\x00\
+\x96\xa9\xaa\x77\xc4\x56\xd8\xf6\x80\x53\x30\x77\x6b\x97\xe2\xaa\
+\xee\xc9\xc4\xa3\xc0\xdf\x80\xb3\xb1\x55\x5c\xe1\x9f\x51\x98\x2f\
+\xeb\x1e\x58\x7e\xab\xd9\x45\x1d\x2b\x3b\x23\x0e\x71\x5e\x55\xc3\
+\xc1\x5a\xe0\x76\xe0\x7a\xe0\x06\xe0\xb6\xe2\x7f\x42\x08\xd1\x01\
+\x67\x01\x4f\x97\x01\x20\x7d\x8e\xc2\xb2\x54\x09\x21\x22\x98\x94\
+\x7e\x06\x5b\x7d\xf2\x2d\xbc\x63\xda\xef\x9f\x73\x7c\x80\xbe\xce\
+\xbf\x04\xf8\xa0\xaa\x7b\xe9\xb2\xdc\x1d\x38\x1a\x38\x06\x98\x9c\
+\xe8\x73\x3c\x01\xfc\xab\x18\x7c\xaf\x02\x36\xe8\xab\xf5\xca\x16\
+\xc0\x9e\x58\x50\xd5\xbd\x0a\xc1\x3f\xa4\x66\x41\x1f\xea\x9c\xfe\
+\x8e\xef\x6d\x10\xb8\xbe\xf8\x5d\x06\x01\x21\x44\x1b\x1c\x93\xbb\
+\x76\x6c\x82\x01\xe0\x5f\x98\x97\xa5\x10\xa2\x46\x86\x03\x1f\x2b\
+\x26\xa8\x31\x89\xff\xd8\x5c\xfe\x53\x4e\x07\xd8\x9b\x4f\x01\xe7\
+\xa8\xda\x57\xa2\x1b\x5b\xc1\x3d\x08\x38\xb0\x10\x75\x65\xbe\xaf\
+\x56\x80\x3a\xd1\xc2\xb2\x40\x5c\x55\xbc\x6e\xc1\x5c\xfe\x85\x1f\
+\x26\x63\x7e\xaa\x7b\x17\xc2\x7f\x66\x00\x61\x1e\x83\xa8\xaf\x72\
+\xfc\x6a\xe0\xdf\xc0\x65\xd8\x16\x94\xe5\xaa\x46\x42\x88\xbe\xb9\
+\x14\x5b\x40\x96\x01\x20\x51\x4e\xa3\x41\x29\x1d\x84\x88\x59\xc8\
+\xbc\x0f\x38\x32\x61\xf1\xaf\x55\xff\xce\xce\x5d\x09\xbc\x1a\x78\
+\x48\xd5\xdf\x19\x93\xb0\xd5\xdd\xdd\xd9\xe4\xda\x5d\x57\x2e\xdf\
+\x0d\x58\x30\xb6\x9b\x0b\xb1\x7f\x23\x0a\xcc\xe6\x9b\x59\xc0\xe1\
+\xc0\xa1\x85\xe8\xef\xaa\x49\xcc\x87\x32\x02\xf8\x34\x1c\x6c\x2c\
+\xea\xed\x25\xc5\x4c\x5f\xd9\x4b\x84\x10\x9b\x71\x22\x70\x9e\x0c\
+\x00\x69\x72\x25\xb6\x78\x22\x84\xa8\xb1\x93\x79\x1b\x70\x72\xc2\
+\x82\x5e\x59\x01\xca\x9d\x7b\x2b\xf0\x9f\xc8\xfd\xdb\x17\x23\x0b\
+\x51\xb8\x03\xb0\x7d\xf1\xfb\x56\x58\x70\x4d\x57\xf9\x6e\xd7\x63\
+\x7b\xf8\xe7\x63\x91\xfb\xef\x2d\x5e\xf7\xa3\x34\x6d\x3e\xfb\xcc\
+\x16\xb6\x65\xea\xc0\x42\xf0\x1f\x8a\x19\x80\x7c\x88\xf9\xd8\x0d\
+\x01\x3e\x8f\x6f\x15\xaf\x5b\x8b\x99\xfe\x85\x58\x3a\x42\x21\x44\
+\xe3\xb9\x02\xb3\xb9\xca\x00\x90\x18\xa7\x60\x31\x87\x84\x10\x35\
+\xf2\x1a\x9e\x9a\x7f\x53\xe2\x3f\xbc\xf8\xaf\x6b\x9b\xc0\x4f\x81\
+\xef\xaa\x19\x04\xa5\x1b\xcb\xb4\xb1\x25\x16\x74\xb3\xe7\x35\x16\
+\xf3\x18\xe8\xc6\x22\xc2\x53\x88\x9d\x8d\x98\x91\x66\x39\xb6\x77\
+\xbf\xe7\xf5\x18\xb6\x32\x2a\x57\xfe\xb0\x9c\x84\x19\x4c\xf7\xc1\
+\x52\x46\x86\x12\xf3\xa1\x04\x7d\x8c\x46\x80\x1e\xd6\x60\x1e\x01\
+\x7f\xc3\xbc\x5a\x94\xa9\x42\x88\x46\x73\x02\x70\xbe\x0c\x00\x69\
+\x71\x19\x19\x5b\x6e\x84\x48\x81\x53\x81\xb7\x34\x44\xfc\xe7\xb8\
+\xea\xef\x22\x38\x60\x0b\xf8\x10\x8a\xc4\x2a\x44\x3b\x1c\x01\x7c\
+\xb2\x57\xdb\xa9\x42\x2b\x81\xf3\x42\x09\xfb\x32\xc7\x3e\x06\x5c\
+\x00\xfc\x05\x65\xaf\x10\xa2\xa1\x64\xeb\x05\x90\xab\x01\xe0\x69\
+\x28\xfe\x94\x10\xb5\x72\x30\xf0\x11\x9e\x9c\xdb\xbc\x4e\xf1\xdf\
+\xb4\xc0\x80\x75\x0b\xff\xde\xac\x04\x5e\x87\xe5\xea\x16\x42\xf4\
+\xcd\xb6\xc0\xf7\xd8\xe4\x9d\x51\x55\x90\xa7\x62\x08\x88\xd5\x1b\
+\xa0\x87\x8d\xc0\xe5\xc0\x6f\xb0\xd4\x82\x42\x88\x46\x71\x3c\x66\
+\x0b\x94\x01\x20\x01\xae\xc0\xb6\xcc\x09\x21\x6a\x60\x67\xe0\xb3\
+\xd8\x1e\x65\x89\xff\x6a\x1d\x6e\xca\xe9\x00\x7b\x33\xaf\x30\x02\
+\x68\x7f\xad\x10\x4f\x65\x14\xf0\x1d\x2c\x96\x83\x6b\x41\x5e\x87\
+\x21\xc0\xf7\x39\x75\x79\x0e\xdc\x05\xfc\xbe\x50\x03\xda\x1a\x23\
+\x44\x23\xb8\x04\xcb\xcc\x9b\x15\x43\x32\xfc\xa2\x4e\xc2\x02\x8e\
+\x0b\x21\x6a\x60\x2b\xe0\xd3\xc0\xb8\xcc\xc5\x7f\x57\x00\xc3\x42\
+\x4a\xc1\x01\x07\x3b\x7f\x02\xb0\x1d\x16\x64\x4b\x08\xf1\xe4\xf6\
+\xf3\x21\x60\x5f\x4f\x7d\x42\x1d\x7d\x43\x99\x7b\x8d\xa5\xff\x1d\
+\xe8\xd8\xc9\xd8\x36\x8d\xe3\x8b\xe3\xee\x43\x41\x4e\x85\xc8\x9c\
+\x99\xd8\x2e\xc6\xfb\x65\x00\x88\x9b\x1f\xd2\x79\x4a\x5c\x21\x84\
+\x03\xc6\x61\x2b\xff\xd3\x3c\x0a\xf5\x2e\xf2\x4f\x09\x18\x6a\xc2\
+\x5d\x55\x54\x74\x72\x6e\xab\xe8\x98\xd7\x02\x37\xa9\xa9\x08\xf1\
+\x7f\xbc\x0c\x78\x4e\x07\x6d\x3f\x54\x9b\x75\x75\x5e\x2c\xc7\xbb\
+\x3c\x76\x1c\x96\xa1\xe1\xd4\xe2\xef\x7b\x64\x08\x10\x22\x67\x76\
+\x02\x7e\x20\x03\x40\xbc\x9c\x00\x7c\x50\xf5\x54\x88\xf0\x0c\x03\
+\x3e\x06\xcc\xf6\x2c\xfe\x49\xec\xd8\x10\x13\xe0\xd8\x85\x7f\x6f\
+\xf6\x07\x1e\xc2\x52\xc9\x09\xd1\x74\x8e\x05\xde\xd1\x47\x7b\xca\
+\xc9\x10\xe0\xbb\x4f\xab\xf3\xd8\x91\x45\x9f\x76\x52\x61\x00\xb8\
+\x07\x6d\x0d\x10\x22\x43\xb6\x03\x2e\x22\xa3\x50\x46\xb9\x19\x00\
+\xb4\xfa\x2f\x44\x4d\xbc\x05\x38\x2c\x31\xf1\x1f\xcb\x44\x33\xd4\
+\xc4\xba\x4e\xe1\xdf\xfb\x1a\x87\x62\x5e\x00\xf3\xd5\x6c\x44\x83\
+\xd9\x0b\xf8\x04\x30\xb4\x62\x1b\xaf\xcb\x10\x10\x53\xff\xe6\xcb\
+\x30\xdb\xee\x71\xa3\x81\x83\xb0\xad\x01\x6b\x0a\x43\x80\x52\x08\
+\x0a\x91\x15\x33\x81\x33\x73\x79\x98\x9c\x82\x00\x1e\x0f\x9c\xa7\
+\xfa\x29\x44\x78\x5e\x00\xbc\x32\x41\xf1\xef\x73\xb2\x1b\xd3\xf1\
+\x21\xcf\x6b\xb5\xf9\xff\x27\x80\x37\x01\x0f\xa8\xf9\x88\x06\x32\
+\x1d\xf8\x16\xb0\x45\x9b\x6d\xcd\x45\x1b\x8c\xe5\xbc\xd8\xa3\xfe\
+\xbb\xb8\xe6\xbd\xd8\x8a\xd4\x95\xaa\xea\x42\xe4\xc4\x31\x64\x92\
+\xd5\x38\x27\x0f\x80\xef\x33\x70\x00\x5d\x21\x84\x07\x0e\x04\xde\
+\xd6\x6b\x82\xda\x64\xf1\xdf\x45\x7c\x5b\x04\xca\x7e\x4e\xa7\xe7\
+\xb5\x3a\xfc\xff\x08\x6c\xc5\xec\x7c\x6c\xc5\x4c\x88\xa6\x30\x11\
+\xf8\x0a\x30\xb5\x44\x3b\xef\x8a\xa4\xbd\x57\xe9\x93\x7c\xf7\x93\
+\x31\x8c\x19\x13\x81\xe3\x80\x3d\x80\x3b\x81\xa5\xaa\xf6\x42\xe4\
+\xc0\x74\xe0\xa7\x39\x3c\x48\x2e\x1e\x00\x07\x02\x57\xa9\x5e\x0a\
+\x11\x96\xed\x80\x2f\x63\xee\x8f\x75\x8a\xff\xd4\x62\x03\x84\x38\
+\xbe\x4a\x07\xef\x63\xc5\xbf\xbf\xff\xdf\x0d\xbc\x1d\x58\xa6\xe6\
+\x24\x1a\xc0\x18\xe0\x4b\x58\xaa\xd4\x2a\x82\x3f\x56\x8f\x80\x14\
+\x57\xf7\x7d\x1d\xdb\x73\xdc\x7a\xe0\x2f\xc0\x8f\x80\x55\x6a\x02\
+\x42\xa4\xce\x01\xc0\x35\xa9\x3f\x44\x2e\x1e\x00\x5f\x03\x76\x55\
+\x9d\x14\x22\x1c\xe3\x81\xcf\x00\x93\x24\xfe\x1b\x29\xfe\x5b\x8e\
+\xfe\x3f\x09\xdb\x0b\x7d\x61\x31\x51\x16\x22\x57\x46\x60\x29\x52\
+\x77\x2f\xd1\xfe\xaa\x7a\x04\xf8\xec\x0b\x62\xed\x0b\x63\xf1\x1a\
+\xe8\x2e\x26\xa8\x27\x62\x9e\x00\x0a\x80\x2a\x44\xd2\x4c\x00\x7e\
+\x9b\xfa\x43\xe4\xe0\x01\xb0\x0b\x70\x6b\xd1\xc7\x0a\x21\x02\x30\
+\x0c\x4b\xf7\xb7\xab\xa7\x89\x68\xce\x59\x01\x24\xfc\xfb\xfe\xff\
+\xb5\xc0\xfb\xb0\x34\x81\x42\xe4\xc6\x50\xe0\x93\x98\xbb\xa2\x0f\
+\xc1\x5f\xb5\xfd\xfa\x38\x2f\xe7\xd5\xfd\x4e\x8e\xdd\xfc\xb8\x6b\
+\xb0\x55\xab\x87\xd5\x2c\x84\x48\x91\x0d\xc5\xf4\xf7\xae\x94\x1f\
+\x22\x07\x0f\x80\x4f\x63\x59\x58\x84\x10\x81\xf8\x2f\x2c\x92\x7b\
+\x6e\xe2\xbf\x8b\x38\x32\x08\x84\x14\xff\xed\x3e\x47\xcb\xf3\xff\
+\xb7\xc6\xac\xb9\x17\xa3\x34\x5a\x22\x3f\xf1\xff\x51\xe0\x90\x12\
+\x6d\xd7\xb5\x21\x20\xd4\x3e\x7f\xdf\x7d\x9e\xaf\xbe\x3a\x44\xfc\
+\x80\xe9\xc0\x29\x45\x3f\x77\xab\x9a\x87\x10\xa9\xd1\x8d\xad\x83\
+\x9d\x95\xf2\x43\xa4\xee\x01\x30\x03\xf3\xa6\x1a\xae\xfa\x28\x44\
+\x18\x9e\x0e\xbc\x39\x53\xf1\x1f\xcb\xc4\x36\xa6\xc9\x79\x2b\xf0\
+\xff\x2f\xc6\x52\xa3\x69\x3b\x80\xc8\x45\xfc\x7f\x10\x38\x2a\xb0\
+\xe0\xf7\xe9\x11\xe0\xfb\x9c\x14\xa3\xfe\x97\x3d\xee\x46\xe0\x0b\
+\xc0\x23\x6a\x2a\x42\xa4\xc4\x1a\x2c\xf0\x7c\xb2\x4d\x37\x75\x0f\
+\x80\x0f\x03\x47\xaa\x1e\x0a\x11\x86\xdd\x30\x37\xed\xee\x04\xc4\
+\x7f\xdd\xab\x3e\x9d\xde\x43\x6c\xe2\xbf\x55\xd3\xff\x67\x61\x01\
+\xd2\x2e\xc3\xfc\xec\x84\x48\x95\x61\x6d\x4c\x52\xea\x36\x04\xc4\
+\xe8\x0d\x10\x4b\xd4\xff\x10\x63\xd7\x34\xe0\x54\xe4\x0d\x20\x44\
+\x62\x0c\xc5\x76\x2c\x9e\x9f\xea\x03\xa4\xec\x01\x30\x01\x98\x5b\
+\xfc\x14\x42\x78\x66\x12\xb6\x6f\x71\x72\x22\xe2\x9f\x84\x8e\x0d\
+\x71\x7c\x27\xe7\xb4\x6a\x10\xfe\x9b\xbf\x77\x03\xb6\x72\xba\x52\
+\x4d\x4f\x24\xc8\x48\xe0\x63\xc0\x7e\x6d\xb6\x3f\x9f\x82\x3f\x26\
+\x6f\x80\x26\x44\xfd\x2f\x7b\xdc\x75\xc0\x17\x81\x05\x6a\x3e\x42\
+\xa4\xc0\x13\x58\x32\xac\x24\xb3\x7c\xa6\xec\x01\xf0\x2e\xcc\x70\
+\x2a\x84\xf0\xcc\x70\xcc\x2d\x7b\x5b\x0f\x42\x5c\x81\x01\xe3\x11\
+\xff\x75\x08\xff\xfe\xfe\xbf\x55\x21\x9e\x2e\x45\x81\x01\x45\x5a\
+\x8c\xc5\x82\x13\xed\x5d\x93\xe0\x2f\x6b\x08\x08\xb5\xcf\x3f\xd7\
+\xe0\xad\x55\x8f\xdb\x1a\x78\x1a\xe6\x53\x3c\x57\xcd\x48\x88\xd8\
+\x19\x01\x2c\x02\xae\x48\xf1\xe6\x53\xf5\x00\x18\x09\xdc\x57\xcc\
+\x11\x85\x10\x9e\x79\x3b\x70\x72\x43\xc5\x7f\x4c\xfb\xfd\x63\x70\
+\xf7\x0f\xed\x09\x70\x17\xf0\x7e\x60\xb1\x9a\xa1\x48\x80\x49\xc0\
+\xa7\x80\x1d\xdb\x6c\x83\x75\x08\xfe\x2a\x7d\x82\xcb\x73\x62\x88\
+\x0b\x10\xa3\x27\x00\xc0\xb9\xc0\x57\xb1\x8d\xc6\x42\x88\x68\x99\
+\x8f\xc5\x02\x58\x9d\xda\x8d\xa7\xea\x01\xf0\x3a\xe0\x05\xaa\x77\
+\x42\xf8\xe7\x14\xe0\x3f\x24\xfe\xdb\x3a\x36\xb6\x2d\x02\x2e\x57\
+\xfd\xeb\xf2\x04\x98\x8c\x05\x50\xbb\x9a\x44\xfd\xec\x44\x63\x98\
+\x05\x7c\x0e\xf3\x09\xad\x43\xf0\x77\x62\x08\xf0\x91\x2d\x20\x96\
+\xa8\xff\xa9\x8c\x1b\x03\x1d\xb7\x23\x70\x10\xb6\x2d\x60\x99\x9a\
+\x96\x10\xb1\x32\x16\x73\xd8\xb9\x36\xb5\x1b\x4f\xd1\x03\xa0\x1b\
+\xb8\x93\x27\x1b\xd8\x85\x10\x1e\xd8\x1e\xf8\x0a\xb6\x05\x40\xe2\
+\x3f\xfc\xb1\x65\x3b\xe9\x1c\x84\xff\xe6\xef\x2d\xc7\x52\xa9\x5d\
+\xaf\x66\x29\x22\x64\x1f\xe0\x23\xc5\x6c\xb0\x9d\x76\x98\x8a\x21\
+\x60\xb0\x36\xea\xea\x9c\x54\xf6\xef\xfb\xb8\xe6\x40\xc7\xad\x02\
+\xbe\x04\x5c\xa4\x26\x26\x44\xac\xdc\x01\xec\x5a\xb2\xab\xac\x8d\
+\x14\x3d\x00\x4e\x07\xde\xa8\xfa\x26\x84\x5f\x46\x61\xae\xac\x13\
+\x6b\x12\xf6\xb9\x66\x05\xc0\xf3\xf1\x83\x9d\x53\x55\xe4\xd7\x65\
+\x10\x18\x0e\x1c\x0b\x3c\x8a\xe5\x7e\x15\x22\x16\x4e\x02\x3e\x50\
+\xf4\x99\xb1\x0b\xfe\x32\x86\x80\x18\xbd\x01\x5c\x1f\x1b\x2a\xea\
+\x7f\xa7\x0c\xc3\xb2\x48\x8c\xc7\xbc\x01\x36\xaa\xb9\x09\x11\x1b\
+\x53\x80\x7f\x63\x3b\x16\x65\x00\xf0\xc8\xb7\x30\x4f\x3b\x21\x84\
+\x27\xba\xb0\x74\x7f\xbb\x67\x24\xfe\x49\xe8\x58\x5f\xc7\xb7\x1c\
+\xff\x2f\xc4\xff\x7b\xbf\xd7\x0d\x1c\x56\xfc\xbc\x51\xcd\x54\x44\
+\xd0\x4f\xbe\x02\xdb\x93\x38\xa4\x03\x31\x1d\x83\x21\x20\x44\x90\
+\xc0\xd4\x8c\x00\x75\x8d\x3d\xed\x1c\x33\x07\x0b\x2a\x79\x25\x09\
+\x6e\x36\x16\x22\x7f\xb6\x04\x7e\x92\xda\xf8\x95\x12\x7b\x23\x0f\
+\x50\x21\xbc\xf3\x3c\xe0\x35\x12\xff\xd1\x4f\x6c\x43\x08\xff\xba\
+\x0c\x02\x83\xbd\x77\x25\xf0\x19\x6c\x6b\x80\x10\xa1\x19\x0d\xfc\
+\x37\x70\x78\xc9\xb6\x19\xf3\xca\xbf\x8f\x6d\x01\x0a\xf8\xe7\xe6\
+\x98\x87\x81\x0f\x03\xf3\xd4\x04\x85\x88\x89\x16\xb0\x27\x70\x4b\
+\x2a\x37\x9c\x9a\x07\xc0\xa7\x80\x7d\x55\xcf\x84\xf0\xc7\x1c\xe0\
+\xdd\xd8\x2a\xab\xc4\x7f\xf5\x6b\xa6\x2c\xfe\x63\x8e\x09\x30\x03\
+\x73\x8d\xbd\x11\x58\xa2\x66\x2b\x02\xb2\x03\xf0\x59\x60\xb7\x48\
+\x04\x7f\x55\x71\x1f\x9b\x37\x40\xd3\x02\xfe\x75\x72\xcc\x38\xe0\
+\x44\x2c\xea\xd8\x83\x6a\x8a\x42\xc4\x42\x17\xb6\x63\xe7\x2f\x29\
+\xdd\x70\x2a\x6c\x89\x19\x3d\x47\xaa\x9e\x09\xe1\x87\xb1\xc0\x37\
+\x81\xa9\x12\xff\xc1\xae\xe9\xeb\xda\xb9\x0a\xff\xcd\x59\x03\x7c\
+\x1d\xf8\x87\x9a\xaf\x08\xc0\x71\xc0\x5b\x07\x99\x88\x34\xc9\x10\
+\x30\x58\xfb\xac\x72\xac\xaf\x6b\xe7\xe0\x09\xd0\xc2\xfc\x8d\x7f\
+\xaa\x26\x29\x44\x2c\xac\xc2\x92\xc0\x3c\x9e\xc2\xcd\xa6\xe4\x01\
+\xf0\x2e\xcc\xf0\x29\x84\xf0\x40\xcf\xbe\xff\x39\x11\x0b\xfb\x5c\
+\x03\x03\xfa\x16\xff\x29\x6e\x01\x68\xd7\x20\x30\x04\x38\x14\x98\
+\x00\xdc\x00\x6c\x50\x53\x16\x1e\x18\x01\xfc\x27\xb6\xe7\x7f\x68\
+\x82\x82\xbf\x8a\xe8\x77\xe9\x0d\xe0\xd3\x2b\x2a\xf5\x80\x7f\x9d\
+\x8e\x85\x7b\x01\xd3\xb0\xe8\x63\x0a\x0e\x28\x44\xed\x0c\x03\x9e\
+\x00\x2e\x4d\x65\xce\x9f\x02\xc3\x81\xfb\x81\xad\x55\xbf\x84\xf0\
+\x43\xef\xf4\x1a\xae\xc4\xb8\x02\x03\xba\xed\x80\x5d\x45\xf8\xcf\
+\xd1\x13\xa0\x05\x3c\x80\xc5\x05\xb8\x47\xcd\x59\x38\x64\x16\xf0\
+\x9e\xe2\x67\x57\xc9\xf6\x99\xc3\xca\x7f\x99\xfe\xc7\xd5\xf1\xa9\
+\xa4\x09\x6c\xd5\x70\xad\xeb\xb0\x14\xa9\xab\xd4\x54\x85\xa8\x9b\
+\x87\xb1\x0c\xda\x6b\x63\xbf\xd1\x54\x3c\x00\xfe\x03\x78\xa9\xea\
+\x95\x10\xfe\x26\xb8\x1f\x28\x3a\x04\x89\xff\x38\x8f\xed\x74\xf2\
+\x1d\x4a\xe4\xc7\x64\x10\x98\x80\xb9\x89\xad\x07\x6e\x53\xb3\x16\
+\x15\xe9\xc2\x0c\xa3\x1f\x00\x26\x27\x2a\xf8\x5d\x8b\x7e\x97\xe9\
+\x02\x15\xf5\xdf\xcd\xb5\xb6\x02\xf6\x03\xae\xc0\xb6\x44\x09\x21\
+\x6a\x63\x1c\x70\x07\x70\x53\x0a\xe3\x5b\x0a\x5c\x05\x1c\xa8\x7a\
+\x25\x84\x7b\x46\x02\x5f\x03\xb6\x95\xf8\x8f\xce\xa0\xd0\xce\xf1\
+\xad\x88\xfe\x57\x97\xf0\xef\xeb\xbd\x6b\x80\x2f\x01\x8b\xd4\xc4\
+\x45\x09\x26\x03\xef\x60\x53\xd4\x61\xad\xfc\x57\xef\x97\x5c\x1d\
+\xdf\xa4\xbd\xfe\x9d\x5c\x6b\x1e\x66\xac\x7a\x54\xcd\x57\x88\x3a\
+\xb9\x06\x38\x40\x06\x80\xea\x1c\x09\x5c\xa2\xfa\x24\x84\x1f\xde\
+\x05\x9c\x20\xf1\x9f\xad\xf8\x6f\x9a\xf0\xef\xcd\x0a\xe0\x07\xc0\
+\xdf\x4a\x08\x12\xd1\x4c\xba\x80\x63\x81\xd7\x01\xe3\x1d\x89\xfd\
+\x1c\x0c\x01\x32\x02\xa4\x61\x04\x58\x54\x18\x01\xee\x55\x53\x16\
+\xa2\x4e\x8e\x00\x2e\x8f\xf9\x06\x53\xd8\x02\xf0\x05\x9e\x9a\x6d\
+\x47\x08\xe1\x80\xe3\xb0\xbd\x35\x29\x0b\xfb\x1c\xc5\x7f\x48\x97\
+\xff\xaa\xee\xfe\xb1\x1a\x04\xc0\x22\xf2\x1c\x84\x05\xcb\xba\x1d\
+\x8b\xce\x23\x44\x7f\x6c\x85\x05\x42\x7d\x0e\x16\xf4\xaf\x4a\xf0\
+\xbb\x98\x05\x7f\x15\x81\x9f\xda\x96\x80\xba\xaf\x19\xfa\x5a\xa3\
+\x80\xa3\x31\xff\xe3\xc7\xd5\xa4\x85\xa8\x8b\x71\xc0\x6f\x62\xbe\
+\xc1\xd8\x3d\x00\xb6\xc6\xd2\x9d\x0e\x53\x5d\x12\xc2\x2d\x53\x80\
+\x6f\x63\xa9\xff\x42\xae\xfe\x2b\x36\x40\xb5\x63\x63\x59\xf5\x4f\
+\xc9\x13\x00\x2c\x22\xcf\x6f\x80\x5f\x63\x31\x02\x84\xe8\x61\x08\
+\x70\x1a\xf0\x72\xfa\x4f\xef\xa7\x2d\x00\xe5\x0c\x0d\xed\xb4\xd9\
+\xd8\x8e\x8d\x79\x85\xbf\xdd\x63\x56\x61\x9e\x00\xb7\xa8\x79\x0b\
+\x51\x07\xeb\xb1\xf0\x5a\x0f\xc5\x3c\xee\xc5\xcc\x3b\x81\xe3\x55\
+\x8f\x84\x70\x4b\x17\xf0\x61\x2c\x61\xa9\xc4\x7f\xba\xe2\xdf\xe5\
+\xaa\x7f\x4e\xc1\x00\xfb\x7a\x7f\x08\xb0\x27\x16\x4c\xe6\x01\xe0\
+\x31\x75\x03\x02\xd8\x03\xf8\x20\xb6\x0d\x6a\x68\x9b\xed\xb0\x89\
+\x69\xff\x5c\x78\x03\xc4\xde\xbf\xc6\x3e\x4e\x75\x72\xcc\x30\xcc\
+\x13\xe0\x36\x60\x81\x9a\xb9\x10\xa1\xe9\x06\x96\x10\xf1\x16\xf6\
+\x98\x3d\x00\x86\x02\xf7\x01\xdb\xa8\x1e\x09\xe1\x96\xe7\x02\xaf\
+\x95\xf8\x8f\x62\x12\xd9\xce\xf1\x31\xaf\xfa\xa7\xe6\x09\xd0\xc3\
+\x95\xc0\x77\x35\x39\x6e\x2c\x53\xb0\xed\x4f\xc7\xe1\x7e\x75\x3f\
+\x26\x43\x40\x6c\xde\x00\xbe\xe2\x02\xc8\x13\xa0\xef\x63\xd6\x60\
+\xc6\xfe\xeb\xd5\xe4\x85\x08\xcd\x03\x58\x4a\xc0\x0d\x31\xde\x5c\
+\xcc\x1e\x00\xa7\x17\x1a\x45\x08\xe1\x90\xed\x80\xf7\xb3\x69\xb5\
+\x2b\x57\x61\x9f\x52\x6c\x80\x10\xe2\x3f\x17\xe1\xdf\xce\x6a\x7f\
+\x3b\xef\xcd\x00\x4e\xc5\x02\xbd\xdd\x0e\xac\x53\xd7\xd0\x08\x46\
+\x02\x67\x00\xef\x01\x66\x3b\x12\xfb\x75\x09\xfe\x58\x04\x7e\xa7\
+\x5e\x09\xda\xeb\xef\xff\x5a\x3d\xc7\x0c\x05\x8e\x2a\xfa\xb8\xf9\
+\x6a\xfe\x42\x84\x64\x02\x96\x11\xe0\x0e\x19\x00\x3a\xe3\xab\xc0\
+\x8e\xaa\x3f\x42\xb8\x63\x18\xf0\x09\x60\x4b\x89\xff\x68\xc4\x7f\
+\x27\x62\x56\x9e\x00\x6e\x8d\x02\xdd\xc0\x2e\x58\xd4\xf7\xd5\xc0\
+\xfd\x28\x5b\x40\xae\x0c\x05\x4e\x06\xde\x0b\x1c\x3c\xc8\xe4\x27\
+\xd7\xe0\x7f\x31\x18\x06\x52\xe9\x7b\x73\x1a\x07\x87\x62\xe9\xb4\
+\x64\x04\x10\x22\x38\x5b\x00\x3f\x8b\xf1\xc6\x62\xdd\x02\xb0\x23\
+\x70\x67\x31\x3f\x13\x42\x38\xe2\xd5\xd8\xea\x57\x6c\xae\xff\x12\
+\xff\x9d\x0b\x7b\x05\x03\x74\x6f\x14\x78\x14\x0b\x14\x78\x1e\x91\
+\xfa\xec\x89\x52\x93\x9c\xc3\x80\x97\x61\x51\x85\x43\x88\xfd\x5c\
+\x0d\x01\x65\x8e\xa9\x23\x38\x60\x5d\xd7\xac\xcb\xcd\xbf\xdd\x63\
+\xd6\x60\x81\x01\x6f\x52\xb7\x20\x44\x28\x5a\xc0\xce\xc0\xdd\xb1\
+\xdd\x58\xac\x1e\x00\xef\x07\x0e\x57\xbd\x11\xc2\x1d\x73\x80\xb7\
+\xd3\x9e\x55\x4d\xe2\x7f\xd3\x71\xa1\xc5\x7f\xdd\x2e\xff\xb9\x07\
+\x03\x1c\x88\xd1\x58\x90\xc0\x63\xb0\xac\x01\xf7\x21\x8f\x80\x94\
+\x85\xff\xe1\x58\x5a\xbf\xa7\xd1\x5e\xb6\x93\x26\x05\xff\x8b\x69\
+\x4b\x80\x8b\x7e\xd3\x77\xbf\x1d\x73\xc0\xbf\x76\x8f\x19\x8a\x25\
+\x27\xbf\x06\x58\xa4\x2e\x42\x88\x50\x43\xd1\x4a\xe0\xfc\x18\x6f\
+\x2c\x36\x46\x60\x81\x13\xb6\x54\xbd\x11\xc2\x0d\xc3\x81\x6f\x60\
+\xfb\xff\x25\xfe\xc3\x0a\xfa\x2a\xe2\x3f\xa5\xfd\xff\x39\x79\x02\
+\xf4\xf0\x00\xf0\x47\xe0\x62\x14\x23\x20\xa5\xbe\xee\x18\x2c\x88\
+\xd0\x36\x81\xc5\x7e\x4c\x86\x80\x18\xe3\x00\xb8\x0a\x0e\xa8\x80\
+\x7f\xd5\x8e\x59\x8a\xa5\xd8\x7a\x40\xdd\x85\x10\x21\x78\xbc\x18\
+\x8e\xd6\xc4\x74\x53\x31\x7a\x00\xbc\x18\x78\x89\xea\x8b\x10\xee\
+\x78\x05\x70\x28\xd5\x57\xc0\x52\x17\xf6\x75\x6f\x0f\xa8\x22\xfe\
+\x63\x58\xf5\xf7\xe5\x09\x50\x46\xc0\xfb\xf4\x04\xe8\x39\x66\x3c\
+\x70\x10\xb6\x77\x7c\x24\x30\x17\xf3\x0c\x10\xf1\x31\xba\xf8\x9e\
+\xde\x85\xa5\x3f\x1b\xef\xb0\x5f\x70\x29\xf8\x3b\x11\xe2\xbe\x8e\
+\xad\xd3\x1b\xc0\x45\x70\x40\x05\xfc\xab\x76\xcc\x48\x6c\x5b\xcc\
+\x65\xc0\x0a\x75\x1d\x42\x84\x18\x9e\x6e\x01\x6e\x8e\xe9\xa6\x62\
+\xf4\x00\xb8\xa2\xd0\x2a\x42\x08\x07\xcc\x06\xbe\x8c\x05\x00\xac\
+\x63\xb2\x21\xf1\x5f\xcf\x7e\xff\x14\x82\x01\x86\x14\xfe\x2e\x56\
+\xd2\x56\x63\xf1\x01\xce\x02\x1e\x51\xd7\x12\x05\xd3\x81\xa7\x03\
+\xc7\x63\xee\x83\x3e\xfb\x89\x14\x0c\x01\xa1\xbd\x01\xea\x8c\x0b\
+\xa0\xbd\xfe\xd5\x8e\x79\x08\xf3\x04\x58\xac\x6e\x44\x08\xdf\x5c\
+\x8c\x39\xa7\xc9\x00\xd0\x0f\x7b\x01\x37\xa8\x9e\x08\xe1\x86\x61\
+\xc0\xd7\xb0\x44\xa4\x12\xff\x79\x88\xff\x9c\xd3\x02\xba\x36\x08\
+\xb8\x78\xbf\xbf\x63\xee\x01\xfe\x51\x8c\xea\x6b\xd4\xd5\x04\xef\
+\xd7\x0e\x04\x4e\x2a\x26\x0d\x5d\x1e\xfa\x04\xd7\x69\xff\x5c\x08\
+\xfe\x3a\x04\xbe\x2f\xd1\x2f\x23\x40\x1c\xc7\xdc\x09\xbc\x1b\x58\
+\xa5\x6e\x45\x08\xdf\xec\x49\x44\x5e\x00\xb1\x6d\x01\xf8\x70\x31\
+\xae\x0b\x21\x1c\xf0\x32\x2c\xfd\x8f\xc4\xbf\xdb\xe3\x5c\x5c\x33\
+\xd4\x2a\x7f\x0a\xc1\x00\x63\xdb\x02\xd0\xce\x44\x7a\x12\x70\x00\
+\x70\x2a\x30\x15\x58\x08\x2c\x51\x97\xe3\x95\x6d\xb0\xbd\xfd\x6f\
+\xc5\x52\x37\x6e\x55\xb3\xd8\xaf\xcb\x10\x90\x4a\xf0\xbf\x2a\x71\
+\x01\x14\xf0\x2f\xcc\x31\x93\xb1\xb4\x5b\x17\xa3\x80\xa7\x42\x78\
+\x66\x1d\xf0\xb7\x58\x6e\x26\x26\x0f\x80\x91\xc0\xc3\xc0\x44\xd5\
+\x11\x21\xaa\xb3\x23\xf0\x55\x2c\xf2\xaf\x84\x7d\x58\x23\x41\x55\
+\xf1\x1f\x9b\x31\xa0\xea\xff\x5c\x1c\xeb\xf3\xbd\x76\x45\xff\x60\
+\xc7\x3c\x80\xed\x61\xbb\xb4\x18\xcc\x44\x75\xb6\xc4\xe2\x30\x1c\
+\x06\xec\x1a\xa0\xad\x77\x05\x7c\x2f\xf6\x2d\x00\x31\x6c\x09\x68\
+\xca\x0a\xbf\xcb\x6b\x95\x39\xe6\x1c\x6c\xab\xa0\x10\xc2\x1b\x0b\
+\x81\x19\x44\xe2\x34\x18\x93\x01\xe0\x45\xc0\xcf\x55\x3f\x84\x70\
+\xd3\xb0\xbf\xd4\xc6\x84\xb9\xea\x84\x58\xe2\xdf\xbf\xf8\x0f\xe9\
+\xf2\xaf\x60\x80\xee\x26\xef\x3d\xc6\x80\x4b\x80\xf9\xea\x92\x3a\
+\x62\x0a\x70\x30\x16\x0c\x68\xce\x66\xed\x29\x64\xdb\x57\xf0\xbf\
+\x38\xb6\x04\xc8\x08\xe0\xfe\x98\xbe\xde\xff\x0e\xf0\x7b\x75\x3f\
+\x42\xf8\xe4\x79\xc0\xef\x64\x00\x78\x32\xff\x00\x4e\x54\xdd\x10\
+\xa2\x3a\xcf\x02\xde\x18\x50\x20\xcb\x8b\x20\x8c\xf8\xcf\x35\x2d\
+\x60\x4c\x9e\x00\xae\x27\xf4\x00\x0b\x80\x7f\x63\xf9\xb7\x6f\x05\
+\xd6\xab\x8b\x7a\x12\xdd\xc0\x2c\x6c\x4b\xc5\x01\xc0\x0e\xc4\xe5\
+\x62\xad\x95\xff\x30\xa2\x5f\x46\x80\x7a\x8f\x69\x01\x1f\x03\x2e\
+\x57\x97\x24\x84\x2f\xce\xc2\xe2\xd6\xca\x00\x50\xb0\x0d\x70\x3f\
+\x71\xa6\x25\x14\x22\x29\x26\x01\xdf\x03\xc6\x4a\xfc\x67\x2d\xfe\
+\x73\x08\x06\xe8\x52\xf8\xd7\x15\x0c\xb0\xd3\xe3\x56\x02\x37\x02\
+\xd7\x01\x37\x01\x8f\x36\xb4\x9f\xda\x0a\xd8\x03\xd8\x17\x0b\xe4\
+\x37\x2a\x92\x76\x1f\x2a\xf8\x5f\x6c\x86\x80\x58\x44\xbf\x8c\x00\
+\xf5\x1e\xb3\x06\x78\x0f\x70\x9b\xa6\x52\x42\xf8\x60\x3d\x30\x93\
+\x08\x76\x09\xc6\x62\x00\xf8\x10\xf0\xbf\xaa\x17\x42\xb8\x69\x4c\
+\x47\x48\xfc\x07\xfd\xcc\x14\xc4\xbf\xd2\x02\xfa\x31\x0a\x74\x2a\
+\x4c\x36\x3f\x67\x09\x70\x37\x70\x07\x70\x3b\x96\x5d\x60\x5d\x66\
+\x7d\x52\x37\x96\xae\x6f\x4e\xf1\xda\x0d\xdb\xdb\x5f\x76\x12\xe2\
+\xaa\x8d\xe7\xb0\x05\x20\xc5\xb4\x7f\x31\x19\x01\x5c\xb7\xf1\x1c\
+\x8c\x00\x8b\x81\xb7\xd0\x5c\xe3\xa4\x10\x9e\x79\x2f\xf0\x19\x19\
+\x00\xec\x1e\xee\xc2\x62\x96\x09\x21\x2a\x70\x20\xf0\xf1\x40\xe2\
+\x57\xb1\x01\xda\x3b\xae\x15\xf8\x6f\x9f\xc7\x84\x16\xfe\xa9\x7b\
+\x02\x94\x39\x7e\x4d\x61\x04\x98\x07\xcc\x2d\x7e\x3e\x40\x3a\x69\
+\xba\x46\x01\xdb\x02\xdb\x61\xcb\x1c\x33\x31\x97\xfe\x11\x1e\x27\
+\x26\x5a\xf9\xcf\x6f\xe5\x3f\x64\x9a\xc0\xa6\xed\xf5\x6f\xe7\x98\
+\x7b\x80\xb7\xa3\x14\xa7\x42\x78\xe0\x4e\xcc\x16\x5e\x6b\xe2\x8d\
+\x18\x0c\x00\x47\x03\x17\xa9\x3e\x08\x51\x8d\x11\xc0\x77\x31\xd7\
+\xda\x18\x84\x7b\x8c\x69\x92\xea\x14\xff\x21\x56\xf5\x95\x16\xb0\
+\x7e\xd1\x5f\x76\x44\x1f\xec\xfe\x1f\x2d\x0c\x01\x0b\x8a\xdf\x7b\
+\xbf\x42\x4f\xd2\x47\x62\xa9\x0f\xb7\x2c\x7e\x4e\x05\xa6\x15\xc2\
+\x7f\x2a\xe5\xf7\xcc\xc7\xd2\xbe\x95\xf6\xcf\x5f\x60\xbf\x4e\xce\
+\xc9\xd9\x08\xe0\xea\xf3\x7c\xde\xcf\xf9\xc0\x67\x35\xb5\x12\xc2\
+\x07\x87\x01\xff\xac\xf3\x06\x86\x46\x50\x08\xaf\x54\x3d\x10\xa2\
+\x3a\x2f\x8d\x48\xfc\xbb\x9c\xd4\xa7\x28\xfe\x63\x70\xf1\x57\x30\
+\x40\xff\x46\x81\x32\x82\xbf\x55\xb2\x9d\x4c\x2b\x5e\x7d\x5d\xeb\
+\x09\x6c\x2b\xc1\xb2\xe2\xf5\x04\xb0\xbc\xf8\x7d\x39\xb0\xb6\x38\
+\x6e\x65\x71\xce\xfa\x5e\x46\x83\x91\x58\xf0\x9d\x2e\x60\x74\xf1\
+\xbf\x11\xc0\x18\x60\x1c\x16\x4b\x64\x7c\xf1\x1a\x0b\x6c\x51\xfc\
+\x5e\xb6\x1f\x68\x95\x6c\x77\xad\x36\x8f\x6f\xe7\xb8\x56\x9b\xef\
+\x77\xf2\xde\x40\xd7\xec\xeb\x9c\x96\xa3\x63\x07\xfb\x5f\xbb\xd7\
+\x6b\x95\x3c\xc6\xe7\x35\x5a\x6d\x18\x40\x5a\x6d\xb6\x9f\x96\x83\
+\x63\x5c\x5e\xab\x0b\x37\xcb\x7f\x3e\xef\xe7\x78\x6c\x6b\xd2\x9f\
+\x34\xbd\x12\xc2\x87\xf6\xad\xd5\x00\x50\xb7\x07\xc0\x58\xe0\x11\
+\x06\x8f\x57\x26\x84\x18\x80\x19\x58\x0a\x9f\x61\x15\x1b\xbc\x02\
+\x03\xc6\x27\xfe\x7d\xed\xf7\xaf\xc3\x40\x10\x42\xf8\xc7\xe2\x09\
+\x50\x56\xec\xbb\x38\x37\x26\xba\x02\x9d\x9b\xca\xca\x7f\x7f\xff\
+\x0f\xb1\x05\x20\xd4\xca\x7f\x99\x73\x42\xc4\x05\x50\xc0\xbf\xce\
+\xdf\xdf\x80\x6d\x58\xbe\x51\xd3\x2c\x21\x5c\xf2\x04\xb0\x35\x66\
+\x97\xaf\x85\xee\x9a\x0b\xe0\x05\x12\xff\x42\x54\xe7\x8d\x0e\xc4\
+\x7f\x48\x11\x1d\x6b\x60\xc0\xd8\xc5\x7f\xcb\xe3\x39\x21\xbc\x03\
+\x5c\x1c\xdb\xea\xf0\x9c\x76\xdf\x1b\xcc\x70\x30\xd8\x31\x9b\x1f\
+\xd7\x89\x90\x68\x95\x3c\xb7\x8a\x71\xa1\xae\xcf\xaa\x52\x36\x54\
+\xfc\x8e\x5a\x0e\xea\x89\x8b\x3a\xe9\xe2\xd8\x32\xff\x6b\xd5\xdc\
+\xc7\xb8\xfc\xbb\x8e\xfe\x3d\x87\xb1\xb0\xd3\x6b\x0c\x01\xde\x0f\
+\x4c\xd1\x34\x4b\x08\x97\x8c\x07\x9e\x5b\xe7\x0d\xd4\x9d\x76\xef\
+\x6b\x58\xac\x20\x21\x44\x49\x0e\x03\x5e\x1c\xc9\x24\xa3\xc9\x81\
+\x01\x5b\x35\xff\xed\xeb\x1c\x1f\xff\x73\x71\x6c\x95\x73\x5c\xbc\
+\xdf\xee\x31\x55\x8e\xf7\x75\x0d\x1f\x74\xd5\x70\x0d\x05\xff\xab\
+\x77\x8f\x7f\x99\x73\x7c\x79\x02\xa4\x68\x30\x8e\x41\xe0\xb7\x73\
+\xcc\x28\x2c\x65\xe7\x79\xc0\x46\x4d\xb9\x84\x70\xc5\x44\xe0\xcc\
+\x94\xc7\xec\xb2\xec\x88\x45\xff\xef\x52\x1d\x10\xa2\x1c\xc3\x30\
+\xd7\xff\x19\x09\x09\xf7\x1c\xb7\x07\xb4\x22\xfb\xdb\xd5\x39\x55\
+\x8c\x06\xbe\x8c\x04\x65\x0d\x02\xa1\x45\xbf\x8f\x60\x80\x29\x93\
+\x6b\xf0\xbf\x32\xa2\xb4\x8a\x90\x2f\x2b\xcc\x73\x12\xfd\x5d\x11\
+\xb5\xe1\xa6\x6c\x05\x00\x8b\x05\xf0\x4d\x4d\xbb\x84\x70\x45\x0b\
+\x98\x85\x25\xfb\x09\x4e\x9d\x5b\x00\x5e\x24\xf1\x2f\x44\x35\xce\
+\x70\x20\xfe\x43\x4d\xae\x25\xfe\xc3\xfd\xed\xca\x60\x50\x65\xab\
+\x40\x3b\xe7\x76\x72\xfe\x40\xff\x77\xf1\x5e\x3b\xef\xb7\xeb\x5e\
+\xde\xee\x24\xdc\x87\xeb\x7f\xcb\xd3\xcb\xd7\x7d\x75\x7a\x5e\x95\
+\xe3\x5a\x9e\xeb\x10\x8e\xeb\x7c\x2b\x50\x5b\x75\xdd\x9f\xc4\xbe\
+\x1d\x20\x67\x37\x7f\x9f\xe3\xfd\xe9\xc0\xe1\x9a\x76\x09\xe1\x8a\
+\x2e\xe0\x85\x75\x7e\x78\x5d\xdc\x0c\xec\xae\xef\x5f\x88\x72\x4c\
+\x05\xfe\x1f\x03\xe7\xd7\x4e\xcd\xad\x3f\xd6\xd8\x00\xed\x46\x1c\
+\x4f\x61\xa2\x9c\x53\x30\xc0\x14\x3c\x01\x3a\x3d\xd6\xc7\xf9\xa9\
+\x4d\x2c\x52\x08\xfe\x37\xd0\x7b\x4d\x0d\xfe\x17\x8b\x27\x80\x6b\
+\x2f\x9d\x26\xad\xf2\x0f\x76\xcc\x72\xe0\x3f\x81\xf9\x9a\x82\x09\
+\xe1\x82\x1b\x80\x7d\xea\xf8\xe0\xba\x3c\x00\xf6\x91\xf8\x17\xa2\
+\x1a\xaf\x1e\x44\xfc\x87\x98\xa8\xc7\x2a\xec\x25\xfe\x9b\x11\x0c\
+\x10\x0f\xef\xc5\x16\x0c\x30\xc5\x2d\x01\x55\x9f\x25\x85\xe0\x7f\
+\x65\xea\x67\x8e\xc1\xff\x62\xfa\xdb\x55\xdf\xde\x84\x71\xb0\xec\
+\x35\xc6\x02\x1f\x20\x8e\x1c\xe2\x42\x64\xc0\xde\x58\x88\x8d\xe0\
+\xd4\x15\x04\xf0\x1d\xc8\x93\x48\x88\xd2\xec\x02\xbc\x81\xf2\x2b\
+\x57\xed\x1e\x13\x53\xf0\xc0\x3a\x26\x50\x21\xc4\xbf\xd2\x02\x56\
+\x3b\xb6\xca\x39\x2e\xde\x6f\xf7\x98\x2a\xc7\x87\xba\x56\x08\x01\
+\xe1\xe2\x5a\x0a\xfe\x97\x57\xda\x3f\x1f\x9e\x00\x75\x04\x92\x0d\
+\xdd\x6e\xea\x32\x12\x4c\x06\x86\x03\xd7\x6a\x2a\x26\x84\x0b\x16\
+\x03\x17\x84\xfe\xd0\x3a\x3c\x00\xba\x80\xe7\xeb\xfb\x16\xa2\x3c\
+\xaf\xce\x48\xfc\x87\x9c\xf4\xd7\x2d\xfe\x5b\x8e\xc5\x7f\x6e\x69\
+\x01\xcb\xac\xa8\x56\xf1\x12\xa8\xc3\x1b\xa0\xd3\xad\x03\xbe\xf7\
+\xe6\x57\x31\x3c\xb8\xba\xb7\x4e\xcf\x75\xb9\xea\x1f\x2a\xed\x5f\
+\xd5\x98\x18\x65\xfe\x97\x4a\xda\x3f\xd7\xfd\x62\x5d\x46\x80\xd4\
+\xc6\xba\x2a\xd7\x78\x1e\x70\xa8\xa6\x62\x42\xb8\xe0\x25\xd4\xb0\
+\x25\xbf\x0e\x03\xc0\x51\xc0\x4c\x7d\xdf\x42\x94\xe3\x30\xcc\x67\
+\xc8\xf7\x04\x23\xa6\x49\x53\x2e\xe2\x1f\xcf\x7f\x87\x34\x06\xb8\
+\xfc\x5f\x27\x46\x82\x76\xc5\xbd\x2f\x41\xe8\x3a\x18\x20\xe4\xe3\
+\xfa\xef\xf2\xb9\xea\x08\xfe\xe7\xba\xae\x95\xad\xe3\x3e\xfe\x17\
+\x9b\xe8\xf7\xdd\x5f\xc6\x6c\x04\xc8\x61\x2b\x40\x17\xf0\x76\x2c\
+\x8f\x99\x10\xa2\x12\x33\x81\x43\x9a\x60\x00\x78\x91\xbe\x6b\x21\
+\xca\x37\xd8\x57\x46\x3c\x29\xc8\x59\xfc\x57\x31\x06\xa4\x90\x09\
+\xa0\x4a\xd4\xf0\xaa\xc2\x3f\x17\x4f\x80\xb2\xd1\xff\x5d\x09\xeb\
+\xba\x5e\x2e\xee\xdf\x87\x41\xa0\xca\xfb\x2e\xea\x98\x8f\x76\xe0\
+\xba\x9d\xc6\x24\xfa\xab\xf6\x9b\x21\xfa\xfe\xa6\x08\xfc\x76\xae\
+\x31\x01\x78\x17\x4a\xe7\x25\x44\x8a\xda\x38\xb4\x01\x60\x18\xe6\
+\x39\x24\x84\x28\xc1\xa9\xc0\x76\x9e\x27\x15\x31\x4d\x4c\x62\xda\
+\x9f\x59\x76\x62\x9a\x7b\x5a\x40\x2a\xfc\xaf\x69\xc1\x00\x5d\x04\
+\x04\x8c\xd1\x33\xc0\xc5\xfd\xd6\xb9\x0d\xc0\xd5\x7b\x75\x06\xff\
+\xcb\x35\xed\x5f\x95\x63\xeb\x18\x27\x52\x1c\x47\xab\x5c\xe3\x00\
+\xe0\x69\x9a\x9a\x09\x51\x95\x17\x12\x38\xb6\x66\x68\x03\xc0\xd3\
+\xb0\xf8\x21\x42\x88\x0e\x19\x85\x6d\x14\xf2\x3d\x59\x88\x4d\x94\
+\xc7\x30\x61\x4b\x59\xfc\x97\x99\xdc\x87\xde\x16\xe0\xe2\xd8\xc1\
+\x04\x5f\xd9\xf7\xca\x1e\x53\xd6\x1b\xc0\x45\xca\xc0\x18\x56\xf9\
+\x5d\x3c\x67\xcb\xd3\x77\xe3\xfa\x3d\x02\xd4\xfb\x56\x0d\xed\xb9\
+\x89\x46\x80\xdc\xc6\xae\x10\x73\x83\x37\x00\x33\x34\x45\x13\xa2\
+\x0a\x5b\x02\xc7\xe7\x6c\x00\x90\xfb\xbf\x10\x25\x79\x1e\x03\xef\
+\xb7\x93\xeb\xbf\xc4\x7f\x1d\xc6\x00\x17\xff\x73\x25\xfc\x71\xf8\
+\x9e\x4b\xc3\x00\x0e\x44\x75\x08\xa1\x1e\xfa\xf3\xeb\x58\xf5\xf7\
+\x51\x5f\x9a\x14\xfc\x4f\x46\x80\x38\x8f\xa9\xf3\x1a\x23\xb1\xad\
+\x00\x75\xe5\x15\x17\x22\x13\x5e\x1c\xf2\xc3\x42\x1a\x3b\xc7\x02\
+\xf3\x81\x31\xfa\x8e\x85\xe8\x8c\xf1\xc0\x99\xc0\xe8\x0a\x8d\x39\
+\xa5\x94\x7f\x12\xff\x61\xff\xf6\x79\x4c\x27\xff\x73\x71\xec\x60\
+\x02\x20\x44\x5a\xc0\x4e\x8e\xab\x7a\x4e\x4a\x74\x79\x3c\xc7\x67\
+\xff\xd7\xe5\xe0\xff\x39\xa5\xfd\xab\xf3\xef\x2a\xc7\x76\xda\xd6\
+\x62\x3a\x26\x96\xcf\x19\xe8\xfd\xef\x03\xbf\xd6\x74\x4d\x88\xb2\
+\x2c\x03\xa6\x01\xab\x42\x7c\x58\x48\x83\xdd\x69\x12\xff\x42\x94\
+\xe3\x0c\xcf\xe2\xdf\xd5\x44\x3c\x35\xf1\x5f\x76\xa2\x53\x97\xf8\
+\x6f\x0d\xf2\x77\xd9\xeb\x87\x0c\x10\x38\xd0\xb9\x75\x7b\x02\xa4\
+\x16\x0c\xb0\xbf\xeb\xc4\x18\xf8\xaf\xec\x33\xd7\x1d\xfc\xcf\x55\
+\x3d\x74\xd1\x16\x08\xd4\x96\x3b\xbd\x46\x2b\x70\x1f\x58\xb6\x9f\
+\xae\x63\xcc\x8b\x6d\xec\xf4\x79\x1f\x2f\x07\xb6\xd7\x74\x4d\x88\
+\xb2\x8c\x23\x60\x48\x8d\x90\x06\x80\xe7\xea\xbb\x15\xa2\x73\x26\
+\x00\xcf\x88\x40\xdc\x87\xb8\x46\xc8\x49\xd9\x40\xc7\xf9\x9a\x80\
+\xfa\xce\x8d\x5d\xa7\x31\xa0\x5d\xc1\x92\x4b\x5a\xc0\x76\x8f\xa9\
+\x2a\xf6\x63\x0d\x08\xe8\xea\xbe\xea\x0c\xfe\x17\x73\xda\x3f\x97\
+\x6d\x2f\x64\xdf\xe0\xcb\x28\xe0\xba\x7f\x0e\x9d\x19\x20\xd4\xd8\
+\x57\xe7\x35\x86\x02\xef\x26\x70\x24\x33\x21\xf2\x22\x98\x56\x0e\
+\x65\x00\x18\x89\x02\x85\x0a\x51\x8a\x17\x62\x01\x00\x7d\x0d\xf8\
+\xa9\xad\xec\xfb\x9e\x4c\xf9\xda\x87\x1a\x7a\x0b\x81\x0b\x4f\x01\
+\xa5\x05\xac\x7e\x4c\xd5\xc8\xff\xa9\xe2\x32\x23\x40\x08\x63\x80\
+\x8b\x3a\x94\x5b\xda\x3f\xd7\x71\x02\xea\x8a\x01\x50\xd5\x08\x10\
+\x4a\xbc\xc7\x32\x16\x57\x29\x97\x1d\x80\xe7\x68\xda\x26\x44\x59\
+\x9e\x59\x68\xe6\x6c\x0c\x00\x4f\xc3\x5c\x1b\x84\x10\x1d\x30\x09\
+\xdb\x3b\x53\xa7\x60\x6e\x52\x60\xc0\x5c\xc4\xbf\x6b\x61\xe0\xd2\
+\x40\x00\xf9\x05\x03\x2c\xbb\x82\xed\x3b\x20\x60\x8c\xdb\x01\xca\
+\x5c\xa3\x85\x5b\x8f\x0d\x57\xef\xd5\x19\xfc\x2f\xd5\xb4\x7f\x29\
+\x1a\x01\x9a\x18\xf0\xaf\xca\x67\xbc\x0c\xd8\x56\xd3\x37\x21\xca\
+\x30\x8e\x40\xd9\x00\x42\x19\x00\xe4\xfe\x2f\x44\x09\x5e\x04\x8c\
+\xf0\x38\x11\x50\xe6\x80\x81\xc5\x42\xbb\xef\xa5\x24\xfe\xcb\x4c\
+\xfe\xeb\x4a\x0b\xe8\x4a\x88\xf9\xd8\x02\xe0\x52\xbc\x76\x2a\xf2\
+\x63\xc3\xc7\x56\x80\x76\x8f\x75\xfd\xbe\xab\x95\xff\x4e\xea\x70\
+\xd3\xd2\xfe\xc5\x16\x03\x40\x11\xfd\xdd\x7e\xc6\x30\xe0\x2d\xc4\
+\x97\x52\x51\x88\x44\x08\xa2\x99\x43\xb4\xcf\x61\xc0\x02\x06\xce\
+\x60\x26\x84\xd8\x8c\x2d\x81\x1f\x16\x0d\xc8\xd7\x00\xae\xcc\x01\
+\x9d\x4f\x32\x73\x12\xff\x78\x38\x27\xd4\xff\xca\xfc\xbf\xaa\x60\
+\x70\x15\x89\xbb\xca\xf1\x75\x5c\xd3\xc7\x44\xa1\xcb\xc3\xf1\x3e\
+\x22\xfd\x0f\xf4\x5e\x88\xc8\xfe\x55\xfe\x17\x7b\x06\x00\x5f\xe7\
+\xc6\x9e\x19\x20\x85\x88\xfe\x2e\xae\xf1\x55\xe0\x2c\x4d\xe5\x84\
+\xe8\x94\x85\xc0\x56\xc0\x7a\x9f\x1f\x12\xc2\x03\xe0\x04\x89\x7f\
+\x21\x3a\xe7\xb9\x15\xc4\xbf\x8b\x09\x75\x4c\x2b\xfb\xbe\x71\x25\
+\xf0\x53\x15\xff\xbe\xb7\x05\x84\x88\x13\xd0\xce\xff\x53\x0e\x06\
+\xd8\xdf\xf9\x21\x3c\x04\x42\x6d\x05\xa0\x62\x19\xc7\xb4\xf2\x1f\
+\xa2\x6d\x10\xa0\x9d\xc7\xe4\x09\xe0\xe2\xba\x31\x78\xd0\xa4\x10\
+\xd1\xdf\xc5\x67\xbc\x06\x98\xa2\xa9\x9c\x10\x9d\x32\x19\x38\xc6\
+\xf7\x87\x84\x30\x00\xc8\xfd\x5f\x88\x0e\x19\x4f\xb5\xa8\x99\x72\
+\xfd\x6f\xff\x18\x1f\xab\xfb\xa9\x89\xff\x32\x22\xc1\xe7\xb6\x00\
+\x3c\x0a\xb1\x4e\xde\xab\xba\xe7\xdf\x65\x30\xc0\x14\x02\x02\x56\
+\xbd\x77\x97\xe5\x5a\x77\xda\xbf\x4e\xea\x70\xce\xee\xfe\x31\xf6\
+\xab\xa9\xc4\x03\x48\xdd\x48\x30\x1a\xf8\x4f\x4d\xe7\x84\x88\x52\
+\x3b\xfb\x36\x00\x0c\xc1\x22\x1a\x0a\x21\x3a\xe0\x59\xf4\x1f\xf9\
+\x3f\x86\xc0\x7f\x31\x4d\x70\x5c\x06\xfd\x2b\xfb\x5e\x4e\xe2\xdf\
+\x87\xc0\xe8\xf4\x7f\x31\x06\x03\xf4\x21\xf8\x5d\x89\xfc\x98\x83\
+\xfe\x55\x79\x56\x57\xd9\x00\x9a\x16\xfc\xaf\x95\x48\xdf\xe2\xe3\
+\xd8\xaa\xef\xa5\x26\xf0\x43\x18\xfb\xab\xdc\xc3\x61\xc0\xc1\x9a\
+\xd2\x09\xd1\x29\xcf\x2e\x34\x74\xb2\x06\x80\xa3\xb1\xad\xcc\x42\
+\x88\x36\x19\x09\x3c\xa3\x46\xf1\x9e\xd2\xc4\xa5\x8e\x88\xff\x31\
+\x8a\xff\x56\x87\x7f\xfb\x32\x06\x74\x72\x5e\x0a\xc1\x00\x63\x70\
+\xff\xaf\xc3\xe5\x3f\xd4\x3d\x85\xde\x06\x90\x72\xf0\x3f\x57\x86\
+\x81\x4e\xae\xd1\xce\xdf\xb1\x19\x01\x52\xca\x0c\x90\xca\x56\x80\
+\xaa\xf7\xf0\x66\xaa\x05\x33\x16\xa2\x81\x4c\x03\x0e\x4f\xd9\x00\
+\xa0\x74\xa0\x42\x74\xc8\xd3\xb1\x2d\x00\x75\x89\xf7\x18\x26\x24\
+\xa1\xef\x35\x74\x0c\x00\xd7\x62\xdf\xb5\x90\x57\x5a\x40\xb7\xf9\
+\xe7\xcb\x7a\x03\xa4\xe0\xf6\xef\xfa\x79\x5c\xad\xfa\xfb\xf8\xfe\
+\x73\x49\xfb\xe7\xb2\x3f\x68\x11\x47\x84\x7f\xd7\x31\x00\x62\x1b\
+\xa3\x62\x1f\xf7\x07\x7a\x7f\x2a\xf0\x7c\x4d\xed\x84\xe8\x94\xe7\
+\xd6\xd9\xa6\xab\x1a\x17\x1e\x00\xa6\xeb\x3b\x14\xa2\x3d\x86\x01\
+\x67\x62\x11\x40\x7c\x18\x00\x9a\x94\x39\x60\xa0\x63\x7c\xaf\x26\
+\xa5\x9a\x29\xc0\xd7\x39\x3e\xfe\xe7\xf2\xff\xed\x08\x03\x97\x19\
+\x00\x5c\x08\xfb\x58\x8c\x03\x21\x05\x4c\x5d\x99\x00\x62\xcb\x02\
+\x90\x42\x06\x80\x18\x22\xfc\x57\xcd\x0c\x10\x2a\x5a\xbf\x8b\xfe\
+\x27\x86\xcf\x18\xe8\xfd\x75\xc0\xeb\x81\x87\x34\xcd\x13\xa2\x5d\
+\x1e\x04\xb6\xf3\x35\xdc\xfb\xf4\x00\x38\x50\xe2\x5f\x88\xce\x38\
+\xa1\x46\xf1\xef\x62\x02\x9e\xda\xbe\xff\x3a\xdd\x4c\x63\x13\xff\
+\x2d\xe2\xdb\x16\x30\xd0\xf5\x9a\x1c\x0c\x30\x26\xcf\x00\x1f\x5b\
+\x01\xaa\x1c\x97\x43\xf0\x3f\x6a\x6a\xab\xb9\x45\xf8\x4f\x29\x28\
+\x60\x0a\x63\x6f\x95\xf7\x87\xa1\x80\x80\x42\x74\xc8\x36\xc0\x7e\
+\xbe\x2e\xee\xd3\x00\x70\x9a\xbe\x3b\x21\x3a\xe3\xf4\x1a\x3f\xbb\
+\x09\x99\x03\xda\x9d\x74\xc6\x16\x03\x20\xb7\xb4\x80\x2e\x05\x53\
+\x95\xff\x87\x48\x0b\x18\x32\x18\x60\xbb\xa2\x3c\x44\xd0\xbf\x2a\
+\xcf\xe6\x3a\xf8\x5f\x2c\x69\xff\x7c\xb7\x9b\xd8\x82\x01\xc6\x1e\
+\x03\xa0\x9d\xb1\x41\x11\xfd\xdd\xb1\x3f\x16\x14\x50\x08\xd1\x36\
+\x4f\x4f\xd1\x00\xf0\x74\x7d\x6f\x42\x74\x36\x38\x6e\xef\x69\x60\
+\x4f\xc5\x3b\xc0\xe7\x7d\xb8\x9e\x18\x76\xfa\x5e\xca\x99\x02\x94\
+\x16\xb0\xfe\x60\x80\x9d\x08\x7b\xd7\xb8\xfe\xdc\xd0\xc1\xff\xca\
+\x7e\xf7\x4a\xfb\x17\x97\x11\xc0\xf5\x7b\x2e\x83\x02\xba\x18\xdb\
+\x52\x5f\xe5\x6f\xe7\xfd\x37\x02\xc3\x35\xdd\x13\xa2\x5d\xbc\x2d\
+\xa6\xfb\x32\x00\x4c\x07\xf6\xd1\xf7\x26\x44\xfb\x3c\xcb\xe3\xa0\
+\x1f\x83\xb8\x0f\x31\x41\xea\x44\x80\x54\x9d\x90\xa6\x96\x29\x20\
+\x26\x63\x40\xa7\xff\x6b\x52\x30\x40\x48\x37\x20\x60\xe8\x6d\x00\
+\x38\xfe\x4e\x95\xf6\x2f\x6e\x23\x40\x68\xaf\x80\x18\xc7\xaf\xd8\
+\x57\xf9\x07\xbb\x87\xa9\x04\x48\x70\x2e\x44\x3e\x1c\x80\xa7\xed\
+\xf4\xbe\x0c\x00\xcf\x88\xa4\x1f\x12\x22\x09\x66\x60\x41\x33\xea\
+\x98\x10\xe4\x94\x39\xa0\xcc\xbe\x7f\x89\x7f\x7f\xc6\x80\x4e\xce\
+\xab\xea\x1d\x10\xeb\x16\x80\x32\xa2\xd9\x95\xf0\xf6\xf5\x72\x71\
+\x7f\x9d\x9c\x53\xf6\x98\xd8\xb6\x00\xc4\x98\xf6\xaf\xa9\x46\x80\
+\x4e\x8f\x4b\x69\x2b\x40\xec\x73\x86\x17\xd0\x7f\xac\x23\x21\xc4\
+\x53\x9a\xdb\xd3\x52\x32\x00\xc8\xfd\x5f\x88\x0e\x38\x9d\xf6\x23\
+\x42\xa7\x36\x59\xa8\xdb\x40\x50\x75\xe2\xe7\xca\x68\xd0\xce\x84\
+\x3e\xd4\x44\x3c\x54\xf6\x80\x10\xd9\x01\x52\x0e\x06\x98\x6a\x40\
+\x40\x1f\x81\xff\x72\x0e\xfe\x47\xc0\xf6\x53\xd5\x90\x57\xa7\x11\
+\xa0\xec\x75\x42\xf5\xf7\xda\xeb\xef\xe6\x1e\x46\x01\xaf\xd0\xb4\
+\x4f\x88\x76\x39\xad\x8e\x36\x5c\x86\x51\xc0\xe3\xc0\x68\x7d\x67\
+\x42\xb4\xd7\x60\x7e\xde\x4f\x83\xa9\x7b\xbf\x5e\x2a\x69\x01\xbb\
+\x4a\x4c\xfa\x5a\x8e\x8f\x73\xf5\x9e\x4b\x63\x80\xd2\x02\x96\xfb\
+\xff\x60\xef\xb5\xf3\x7e\xbb\xc7\x54\x39\x3e\x35\xba\x3c\x1c\xaf\
+\xb4\x7f\xfe\xce\xe9\xaa\xe1\x5c\xdf\xef\x95\x3d\x2e\x74\xdf\x90\
+\x7a\xda\xbf\x76\xfa\xd7\xb7\x00\x77\x6a\x0a\x28\xc4\x60\x2c\x07\
+\xa6\x00\x6b\x5c\x5e\xd4\x87\x07\xc0\xf1\x12\xff\x42\xb4\xcf\xd3\
+\x6a\x12\xff\x21\x26\xf4\x75\xaf\x98\x48\xfc\x57\xfb\x5b\x69\x01\
+\xfb\x7e\xaf\xee\x60\x80\xfd\x9d\x5f\xc7\xab\xea\x3d\x53\xb1\x2c\
+\x95\xf6\xcf\xed\x39\x75\xf7\x45\xbe\xdf\x2b\x7b\x5c\xa8\x31\x2b\
+\xa7\xf1\x7d\x30\xe3\xdb\x1b\xd0\x5e\x61\x21\xda\x60\x2c\x70\xb4\
+\xeb\x8b\xfa\x30\x00\x28\xfd\x9f\x10\x1d\x70\x6a\x4d\x9f\x9b\x42\
+\xe6\x80\x2a\xd7\x70\xb9\xff\xb3\xca\x35\x52\x15\xff\x55\xc5\x84\
+\x4b\x03\x41\x19\x23\x81\xab\x98\x00\x83\x89\xc8\x32\x42\xd5\x85\
+\xeb\x7f\x2c\xb8\xde\x0a\xe0\xa2\x8c\x3b\x3d\x5f\x69\xff\xd2\x35\
+\x02\xb8\xe8\xa3\x3b\x3d\x2e\x97\xad\x00\x75\x8b\xef\xdd\x51\x5a\
+\x40\x21\xea\xd2\xd6\xae\x0d\x00\x5d\x32\x00\x08\xd1\x3e\x7b\x02\
+\xdb\xd5\x30\xb0\xa7\xe2\x1d\x50\xf6\x1a\xbe\x27\x82\x3e\x52\x08\
+\x56\x99\x2c\x87\x0e\x1e\x58\x77\x5a\x40\x9f\x42\xae\x53\xa3\x40\
+\xd5\xb8\x00\x03\x09\x69\x5f\xc2\xdc\x67\xc0\xbf\xaa\xcf\xd4\x72\
+\x5c\xf6\x78\xac\x27\xbe\x83\xff\xc5\x98\x01\xa0\x45\x5c\x69\xfe\
+\x7c\x06\xfe\xab\x62\x04\x88\x25\xed\x5f\xdd\x46\x84\xc1\xde\x7f\
+\x0d\x30\x54\x53\x41\x21\x06\xc3\x79\x6c\x3d\xd7\x06\x80\xbd\x81\
+\x6d\xf5\x3d\x09\xd1\x1e\xa7\x44\x7a\x5f\xb9\x78\x07\xf8\x9e\x10\
+\xd6\xbd\x45\x80\x0e\x8f\xcd\x25\x2d\x60\x08\xe1\xef\x43\x78\xba\
+\x10\xfb\x21\x84\xbb\xcf\xcf\x73\xbd\x0d\xa0\x89\xc1\xff\x62\xc8\
+\x00\x50\xc5\x80\xe0\xfb\x3d\x9f\xc7\x85\x1e\xc3\x52\x5f\xe5\x1f\
+\x8c\xe9\x78\x0a\x71\x2e\x44\x5e\xec\x00\xec\x16\xb3\x01\x40\xab\
+\xff\x42\xb4\xc9\x18\xe0\x88\x1a\x06\xfc\xdc\xd3\x02\x86\xdc\xf7\
+\xef\x43\xe0\xfb\x98\x58\x87\x12\x04\xa1\x57\xfd\x53\x4c\x0b\x58\
+\xd6\x1b\x20\x36\xd7\x7f\x97\xf7\xec\x6a\x1b\x40\xca\x69\xff\x42\
+\x04\xe8\xac\x73\x3b\x80\x0f\x03\x41\xd5\x6b\x54\x8d\x07\xa0\xb4\
+\x7f\x6e\xde\x7f\x29\x16\x0c\x59\x08\x11\x4e\x63\xbb\x36\x00\xc8\
+\x90\x27\x44\x9b\x1c\x0f\x8c\x48\xf0\xbe\x63\x58\xfd\x2f\xe3\xfa\
+\x1f\x52\xd4\xfb\x9e\x08\xc7\x26\xfe\x7d\xc7\x08\x50\x30\xc0\x6a\
+\x02\xbc\xae\xa0\x7f\x65\x9f\x51\xc1\xff\xdc\xb5\xb3\x58\x8c\x00\
+\x29\xba\xff\xb7\x73\x4f\x31\x8f\x87\xa9\xb0\x05\x96\x0a\x59\x08\
+\x31\x20\x27\x87\x9c\xcb\x77\xc2\x38\x60\x21\x30\x4c\xdf\x91\x10\
+\x83\xf3\x0d\x60\xb6\xe3\x81\xbe\xe9\x69\x01\x5b\x1d\xfe\x1e\xf2\
+\x38\x57\xef\xc5\x28\xfe\xab\x0a\x1b\x1f\xff\x73\xf9\xff\x76\x84\
+\x42\x55\x21\xe1\xeb\xbc\xd0\x74\x79\x3e\x4f\x69\xff\xe2\xfb\x3b\
+\x87\x34\x7f\x5d\x25\xce\xe9\xa4\x6d\x36\x3d\xed\xdf\x60\xef\x2f\
+\x07\x5e\x09\x3c\xa1\xa9\xa1\x10\xfd\xb1\x16\x98\x04\xac\x70\x71\
+\x31\x97\x1e\x00\xc7\x4a\xfc\x0b\xd1\x1e\x3b\xf7\x21\xfe\x73\xa0\
+\xce\xd5\x90\x32\xe9\x9c\x52\x8b\x0f\xe0\x53\xfc\xb7\x06\xf9\xbb\
+\xec\xf5\xe5\x09\xe0\xc6\xfd\x3f\x15\x62\xd9\x06\x80\xc7\x7a\x11\
+\x6b\xda\x3f\x3a\x68\xcf\x31\x7a\x02\xc4\xb2\xcf\x3f\xc6\xad\x00\
+\xb9\xa7\xcb\x1b\x0b\x3c\x5f\x53\x43\x21\x06\x62\x38\x70\xa4\xab\
+\x8b\xb9\x34\x00\x9c\xa8\xef\x46\x88\xf2\x8d\x25\xf5\xd5\xff\x58\
+\x5c\xff\x5d\x4c\xec\x7c\xc6\x07\xa8\xf2\x9e\xcb\x94\x5c\x9d\x5e\
+\xcb\x97\x27\x40\x53\xd3\x02\xe2\x40\xe8\xb7\x6a\x7e\x55\xbd\x57\
+\x2a\x96\xa1\xd2\xfe\x55\x6b\xa7\x2d\xc2\xa5\xf9\x73\xfd\x5e\xa8\
+\x7d\xfe\xae\x8c\x00\x29\x04\x04\xac\xfb\xfd\x67\x02\x5b\x6a\x7a\
+\x28\x44\x10\xad\x2d\x03\x80\x10\x81\x19\x02\x1c\xd5\xc0\xe7\xae\
+\x63\x85\xa3\x2e\xaf\x80\xd8\x32\x05\xb8\x5e\xf9\x0b\x99\x2d\x20\
+\x97\xb4\x80\x94\x14\xd0\x31\x07\x04\xac\x7a\x6f\x21\x82\xff\xf9\
+\xae\x1f\x75\xa4\xfd\x73\x71\x4e\xe8\xbe\x25\x35\xaf\x00\x1f\xed\
+\xab\xe9\xab\xfc\x83\x31\x02\x78\x91\xa6\x88\x42\x24\x65\x00\xd8\
+\x06\xd8\x45\xdf\x8b\x10\x83\xb3\x3f\x16\xf4\xc6\xe5\xc4\xa0\xc9\
+\x99\x03\xaa\x4e\xe0\x52\xdc\x06\x50\xa7\xf8\x0f\x21\x58\x5c\xfc\
+\x2f\xb5\x60\x80\x38\x16\xf9\x75\x06\xfd\x2b\xfb\x2c\xa9\x6f\x01\
+\x28\xf3\xbf\x18\x44\x7f\xd5\x7e\x22\xb4\x81\xc0\xe7\x71\x55\xc6\
+\x16\x45\xf4\xaf\xfe\xfe\x49\xc0\x56\x9a\x26\x0a\xd1\x1f\x7b\x00\
+\x5b\xc7\x64\x00\x38\x59\xdf\x89\x10\xed\x71\x4c\x03\x9f\xd9\x97\
+\x01\xc1\xe7\x2a\x4f\x8c\x86\x81\x50\xc7\xd6\x6d\x0c\xc8\x25\x2d\
+\x60\x27\xde\x00\x2e\x3c\x02\x7c\x78\x07\xb8\xfc\xbc\x56\x85\xf2\
+\xc1\xe1\xf7\x94\x62\xda\xbf\xd0\x19\x00\x62\x88\x01\x50\xc7\x71\
+\xae\x8d\x08\xa1\xc6\xc2\x5c\x18\x86\x62\x01\x08\x31\x48\x17\x71\
+\x42\x4c\x06\x00\xb9\xff\x0b\xd1\x06\xc3\x81\x43\x03\x4f\x18\x9a\
+\x10\x1b\xc0\xe7\xe4\x2e\xa6\xf8\x00\x29\x65\x0a\x50\x5a\xc0\x72\
+\x86\x81\xc1\x84\x77\xac\x28\xf8\x5f\x67\xf5\x3f\x46\xd1\xef\xb3\
+\x8f\x29\xf3\x5e\x0c\xfb\xfc\x3b\x6d\x73\xda\xeb\x5f\xbd\x0c\xe4\
+\x05\x20\x84\x7f\xcd\xdd\xed\xe8\x1a\xc7\xe9\xfb\x10\x62\x70\x0e\
+\x05\x46\x7b\x98\x30\xa4\x8c\xeb\xc0\x7f\xbe\xdc\x3b\x5d\x1d\xd7\
+\xc4\x34\x81\xbe\xb7\x05\x34\x3d\x18\xe0\x40\x02\xbc\xce\xc0\x7f\
+\x65\x9e\xad\xe9\xc1\xff\x5a\xc4\x95\xca\x33\xb6\x18\x00\x2e\x8f\
+\xab\x6b\x2b\x80\xc6\xfc\x81\x91\x17\x80\x10\x03\x72\x92\x8b\x6e\
+\xc4\x85\x01\x60\x5f\x14\xb8\x53\x88\xb6\x38\x36\x90\x38\xce\xe5\
+\xfd\x76\x26\x64\xae\x45\x7e\x1d\x13\xd1\x9c\xc5\xbf\x2b\x01\xa4\
+\x60\x80\x71\x04\x04\xf4\xb1\x15\x00\x4f\x65\x9d\x7b\xf0\xbf\x9c\
+\x8d\x00\x3e\x8f\xf3\x35\x46\x68\x6c\x77\x67\xe4\x90\x17\x80\x10\
+\xfd\x32\x0d\xd8\x33\x06\x03\x80\xdc\xff\x85\x68\x83\xb1\xc0\x01\
+\x8e\x07\xc9\xdc\x69\xa7\x7c\x5a\x1d\xfe\xee\x62\x02\xe8\xf3\xb8\
+\x2a\xef\xc5\x2e\xfe\x71\x70\x4c\xa7\xff\x0b\xe9\x09\x10\x63\x30\
+\xc0\xd0\xd4\x1d\xfc\xcf\x77\x3d\x70\xf5\x3f\x57\x69\xff\x62\x31\
+\x02\xb8\x7e\x2f\xb6\x7d\xfe\x9d\x1a\x07\x34\xb6\x57\x2b\x1f\x79\
+\x01\x08\xe1\x57\x7b\x67\x65\x00\x18\xa2\x0a\x21\x22\xe6\xc0\x62\
+\x50\x0b\x35\x80\xe6\xfa\x7e\x4c\xae\xff\x3e\xe2\x03\xd4\x9d\x29\
+\xa0\xaf\xcf\xe9\xe4\xef\x76\xaf\xdf\x24\x4f\x00\x1f\xc1\x00\xfb\
+\x3b\x37\xe4\xcb\x87\x51\xa0\x6a\xf0\x3f\xdf\xdf\x7f\x6c\x69\xff\
+\xda\xf9\xbb\x4a\x5f\x40\x8d\xfd\x58\x6c\xfb\xfc\x43\x6f\x05\x68\
+\x7a\xf6\x9f\x93\x80\xa9\x9a\x3a\x8a\x48\xe8\x8e\xeb\x76\x6a\x37\
+\x00\x8c\x04\x0e\x8b\xa5\x34\x5e\x0a\x1c\x8e\x2c\xaf\x22\x4e\x0e\
+\x89\x6c\x70\xcd\x99\x26\xc7\x07\xa8\x7a\x6c\x55\xf1\x10\x2a\x2d\
+\x60\x53\x82\x01\x42\xbc\x01\x01\x63\xda\x06\xe0\xdb\x10\x80\xc7\
+\x7a\xeb\x7b\x8b\x40\x8b\xf8\x22\xfc\xa7\xbe\xcf\x5f\x0c\x4e\xd5\
+\x39\xce\x50\xe0\x39\x2a\x46\x11\x01\xfb\x02\x2f\x8c\xeb\x96\x8e\
+\xc4\xe2\x8a\xd7\x66\x00\x38\xa8\x30\x02\x44\xd1\xd1\x1c\x04\xbc\
+\x01\xf8\x08\x30\x5b\xf5\x55\x44\xc4\x50\x9e\xea\xfe\x5f\xe7\xc0\
+\x9a\xf3\xea\x7f\x28\x57\xcf\xdc\xb6\x01\xa4\x96\x16\x90\x92\xe7\
+\x56\xf9\x7f\x99\xed\x01\xed\x1e\xe3\x5a\xe8\xd7\x15\xf4\xaf\xec\
+\x73\x54\x2d\xc7\x58\x82\xff\xa5\x92\xf6\x4f\xee\xff\x6e\xcf\x97\
+\x17\x80\x9f\x79\xfd\x29\xc0\x04\x4d\x21\x45\x4d\xcc\x02\x3e\x08\
+\xbc\x03\x5b\xed\x8e\x68\x61\x6e\x34\xb0\x7f\x9d\x06\x80\xa3\x63\
+\x29\x89\x99\xc0\xb8\xe2\xf7\x1d\x81\x0f\x03\xaf\x57\xc7\x21\x22\
+\x61\x6f\x2c\x06\x40\x0c\x83\x6a\xdd\xc6\x87\xb2\x54\x5d\x95\x69\
+\x5a\x40\xc0\xd8\x82\x05\x86\x4c\x0b\x18\x72\x0b\x80\x2b\x41\xeb\
+\xda\xf5\xdf\x65\xbb\xf3\xb5\x15\xc0\x45\xd9\xe1\xf1\x7b\x76\xe9\
+\xee\x1f\x83\xe8\xf7\xd5\x47\x34\x2d\xf0\x9f\xcb\x71\x29\xe6\x31\
+\x37\x86\x7b\x1f\x01\x3c\x43\x53\x48\x11\x98\xb1\xc0\x4b\x80\x8f\
+\x02\xbb\x14\xff\x9b\x00\xcc\x88\xeb\x36\x2b\x69\xf0\xaa\x06\x80\
+\xa3\x62\x29\x85\x3d\xfa\xe8\x54\x8e\x00\xbe\x80\xb9\x10\x0d\x55\
+\x7d\x16\x35\x72\x48\x44\x03\x6a\xdd\x93\x09\xd7\x9f\xef\x2a\x68\
+\x53\xd9\xf3\x5d\xec\xfb\xcf\x5d\xfc\x97\x11\x39\xae\x03\x04\xe6\
+\x12\x0c\x30\x46\x97\xe4\xb2\xf7\x99\x7b\xf0\xbf\x14\x32\x00\xc4\
+\xec\xe2\x1f\xeb\x3e\xff\x4e\xdb\x60\xea\x63\x6e\xdd\x5e\x00\xa7\
+\x03\xa3\x34\x8d\x14\x01\x18\x02\x9c\x5c\x68\xc7\x93\xfb\x10\xc9\
+\x7b\xc4\x75\xbb\x95\x34\x78\x15\x03\xc0\x50\xc7\xba\xc6\xa9\x01\
+\xa0\x87\x11\x85\x01\xe0\x33\xc0\xc1\xaa\xdb\xa2\x26\x3a\xa9\x7b\
+\x39\x5b\xf3\x5d\xa4\xfd\xab\x7b\x82\xe7\x7a\xbb\x80\xeb\x6b\xb4\
+\x23\x4a\xea\x14\xff\xae\x04\x92\x82\x01\xb6\x2f\xc4\xeb\xda\x0e\
+\xa0\xe0\x7f\x71\x8a\xfe\x50\xfd\x49\xa8\x3e\x30\x44\x54\x7f\x5f\
+\xc6\x81\x14\x44\xb8\xef\x79\xc3\x60\x8c\xc3\xb6\x02\x08\xe1\x5b\
+\x47\x7e\x12\x8b\x27\x37\xba\x43\xad\x59\x13\x87\x53\x21\xfe\x7d\
+\x15\x03\xc0\x01\x3c\xd9\xab\xb9\x36\x86\x01\x3b\x0d\x72\xcc\x34\
+\xe0\xbf\x80\xf7\x03\xdb\xaa\x9e\x8b\x80\xcc\x2e\xea\x5f\x88\x81\
+\x3a\xf5\x49\x84\xab\xcf\x8f\xd5\x2b\xc0\xf7\xa4\xd8\xd7\xc4\x3e\
+\xc4\xdf\x65\x8f\xe9\xf4\x7f\x31\x7a\x02\x54\x0d\x06\x18\xca\x33\
+\xc0\xc5\xe7\xbb\x0e\xfe\xa7\xb4\x7f\xd5\xda\x9c\xcf\x7e\x24\x87\
+\xc0\x7f\xae\xda\x55\xec\x63\x6b\xdd\xab\xfc\x83\xbd\xff\x5c\xe4\
+\xc9\x2b\xfc\xb0\x35\xf0\x2e\xe0\xbd\x0c\xee\xe2\xbf\x6b\x5c\xf5\
+\x70\x3c\xb0\x4f\x1d\x06\x80\x68\xdc\xff\xe7\xd0\x7f\x28\xc4\xcd\
+\x3b\x96\xdd\x80\x8f\x03\xaf\x2a\x4a\x4e\x08\xdf\x74\x12\xfc\x2f\
+\x66\x81\x9e\x43\xe0\xbf\xd0\x13\xc9\xd0\x86\x81\x94\xb6\x01\x0c\
+\x26\xc0\x72\xf3\x04\x68\xf7\x98\x81\xc4\x76\xec\xd4\xbd\x0d\xc0\
+\xc7\xff\x9b\xbc\xf2\xaf\x7d\xfe\x6e\xc7\xa0\xd4\xb7\xef\xd5\x79\
+\x6f\x93\x81\xe3\x35\x9d\x14\x0e\x19\x03\xbc\x00\xf8\x54\x1f\x2a\
+\xba\xbf\xfa\x3a\x1c\xd8\x39\xae\xc7\x28\xad\xc5\xb3\x30\x00\x74\
+\xea\x92\x31\x04\x38\x0e\xf8\x3c\xb6\xc7\x63\x88\xda\x81\xf0\xc8\
+\xbe\x81\x06\xe8\x1c\x5d\x08\x5b\x0e\xcf\x8f\xc9\xf5\xbf\xce\xf8\
+\x00\x3e\xc5\xbf\x2b\x81\xe3\xd3\x18\xe0\x4b\xf8\xbb\x12\xb8\x3e\
+\x02\x02\xd6\xb9\x1d\xa0\xec\x36\x00\x4a\x94\x77\x8c\xc1\xff\x7c\
+\xb4\x89\x14\x8c\x00\x55\xaf\x51\xf7\x56\x00\x97\x63\x4f\x2c\xa4\
+\xec\x05\x00\xb6\x9d\x57\xe9\x91\x85\x8b\xba\x76\x44\xa1\x01\x9f\
+\x41\xe7\x2b\xfa\xb9\xc4\x01\x28\x6b\x00\x18\x82\xed\x3d\x88\x82\
+\xdd\x2b\x58\x7f\x5e\x06\x7c\x1a\x8b\xd2\x2e\x84\x6b\x86\x63\x2e\
+\x43\xa1\x06\xc8\x54\x27\x0e\xed\x3c\x5b\xcb\xd1\xef\x2e\x8d\x07\
+\x3e\xcf\x29\x7b\x8d\xc1\xde\x73\x25\x24\xda\x11\x25\x2e\x8c\x03\
+\x39\x06\x03\xac\xb2\x4a\x1e\x8b\x57\x40\x95\x7b\x6a\x39\x2e\x43\
+\x9f\xdf\x73\x99\xff\xb9\xa8\xeb\x2d\x07\xed\xcf\x55\x3f\x40\x4d\
+\x7d\x59\xa8\xad\x00\x21\xc7\x99\x26\x7b\x01\x54\xbd\xf6\x4c\x60\
+\x3f\x4d\x2b\x45\x05\x76\xc3\xf6\xf9\xbf\x91\xf2\x5e\xe0\x91\x19\
+\x00\x8e\x2c\xab\xe5\xcb\x1a\x00\xf6\x06\xb6\x88\xe1\xc9\xc7\x00\
+\xdb\x55\xec\x8c\xa6\x03\xef\x06\xde\xc9\x93\xf7\x6a\x0b\x51\x95\
+\xdd\xb1\x40\x94\x75\x0f\xdc\xa9\xaf\xfe\xfb\x5a\x99\xc9\x31\x3e\
+\x80\x0f\x2f\x01\x97\xe7\x96\x15\x48\x9d\x5c\x27\xf6\x60\x80\x9d\
+\x0a\x6b\x1f\x22\xdd\x67\x2a\xc1\x4e\xaf\x95\x4b\xf0\x3f\x02\xb4\
+\x83\x3a\xda\x74\x8c\xee\xff\x31\xed\xf3\xf7\x1d\x3f\x20\x97\xb9\
+\x80\x8b\xcf\x7e\xb6\xa6\x95\xa2\x04\x93\x81\x37\x00\x1f\x18\x40\
+\x33\xb6\x5b\x1f\x67\xd2\x7f\x90\xc0\x9a\x1e\xad\xd4\x3a\x78\x59\
+\x03\x40\x34\xee\xff\xbb\x38\xec\xb0\xf6\x03\x3e\x87\x45\x80\x54\
+\xca\x11\xe1\x82\x7d\x1b\x20\xe0\xeb\x5c\xb1\x08\xe1\x15\xe0\x6b\
+\xeb\x40\x9d\x86\x81\x32\x42\xc5\xa5\xf8\x2f\x23\x82\x9a\x90\x16\
+\xd0\xb5\xeb\x7f\x55\x7c\x6e\x05\xf0\x61\x0c\x50\xda\xbf\x7a\x02\
+\x01\xc6\xd0\xff\x85\xe8\xdb\x5d\x89\x7b\xed\xf5\x2f\xff\xd9\xfb\
+\x77\x20\xe0\x84\xe8\xc9\x04\xf7\x05\x6c\xa9\xdc\x05\xdd\x0c\x1e\
+\x78\x3e\x30\x47\x95\x7d\x8e\xe4\x0d\x00\x2e\x3b\xb1\x21\xc0\xd3\
+\x8a\xca\x72\x1c\xd5\x82\x24\x08\xb1\x6f\xc5\xfa\x98\xba\x40\xaf\
+\x43\xd8\x87\xf8\xbc\x32\xd7\x2a\xf3\x99\x65\xaf\xe7\x6a\x62\x1f\
+\x42\xfc\xbb\x12\x50\x4d\x0a\x06\x18\xd3\xca\xa2\x8b\x6d\x00\x55\
+\x8d\x01\x3e\xfe\x9f\x72\xf0\xbf\x54\xdc\xff\xeb\x08\xfc\x17\x53\
+\x5c\x99\x26\x8e\xf9\x5d\x0e\xce\x7f\x96\xa6\x96\xa2\x8d\x7a\x72\
+\x30\xb6\xcf\xff\xb9\x58\xb6\x38\x97\xf5\x71\x97\xb8\x1e\x37\x98\
+\x01\xa0\x27\x7e\x42\x14\xcc\xf1\x54\x71\xb6\x00\x5e\x03\x7c\x2c\
+\xbe\x2f\x5a\x24\xc2\x58\x2c\x05\x60\xec\x03\x6a\x6e\x13\x8d\x58\
+\xbc\x02\x7c\x9e\x13\xe2\xbd\x3a\xc4\x3f\x8e\x8e\x89\x2d\x18\x60\
+\x99\xd5\xef\x32\x42\x3f\x96\xc0\x7f\x9d\x3e\x4b\x27\x31\x01\x62\
+\x31\x04\xe0\xa1\x3e\xa7\x1e\xe1\x3f\xe6\x7d\xfe\x75\xad\xf6\xa7\
+\x28\xd2\xeb\x9c\x73\xb4\x73\xed\x13\x50\x16\x2f\xd1\x3f\x3b\x00\
+\x1f\x01\xde\x8a\xf9\xc7\xfb\xa8\xaf\xbb\xc6\xf5\xc8\xa5\x9c\x1b\
+\xca\x18\x00\x76\x04\xb6\x8c\xe1\x89\x47\x62\x7b\x31\x7c\x76\x50\
+\xdb\x03\x1f\x2e\x2a\xd2\x14\xb5\x2b\xd1\x01\x7b\xe1\xc6\x83\xa4\
+\x69\xb1\x01\x5a\x1e\x7e\xf7\x75\x1f\xa1\x8c\x04\xa1\x0d\x03\x75\
+\x8b\xff\x10\xdb\x02\x7c\x6f\x01\xf0\xe5\xfe\x5f\x67\x40\xc0\xaa\
+\x9f\xed\x62\x1b\x40\x2c\x5b\x00\x52\x48\xfb\x97\x7a\x9a\xbf\x3a\
+\x52\xfe\xc5\x38\x16\xa5\x36\xb6\xfb\xbe\xf6\x70\xe0\x34\x4d\x31\
+\xc5\x66\x4c\x64\xd3\xc2\xed\xce\x9e\xeb\xf2\xf6\x6c\x8a\xef\x15\
+\x01\x5b\x0f\x20\x87\x9d\x1a\x00\x0e\x89\xe5\x89\x77\x26\x4c\x0a\
+\xbf\x1e\x57\x92\xcf\x01\x2f\x2a\x0c\x0f\x42\x0c\xc6\x6e\x01\x06\
+\xe2\x94\x03\xfa\x84\x34\x2e\x34\x31\x3e\x40\x95\xf7\xea\x16\xff\
+\xae\x84\x56\x15\x4f\x80\x32\x42\x73\xb0\xf7\xda\x35\x0c\x0c\x24\
+\xb8\x63\xc5\xf7\x36\x80\x4e\xde\x6b\x39\xfc\xfe\x53\x13\xfd\x9d\
+\xb6\x5f\xd7\xef\xe5\xb4\xcf\x3f\x76\x91\x9e\xea\xe2\x80\x8b\x6b\
+\x97\x49\xdf\x26\xf2\x64\x38\xf0\x4c\x36\x6d\xdd\x0e\x31\xb7\x1c\
+\xc2\x26\x0f\xdf\x48\xe8\x58\x9b\x97\x31\x00\x1c\x1c\xcb\xd3\x96\
+\x75\xff\x2f\x5b\x39\x46\xf4\xaa\x64\x47\xa2\x7c\xa4\xc2\x4f\xfd\
+\xcc\x61\x80\xaf\x43\xa8\xd7\x99\x0e\x30\xc6\xf8\x00\x75\x67\x0a\
+\xa8\xcb\x18\xd0\xe9\xff\xda\x3d\xb6\x8c\xe0\x2c\x23\x74\x5d\x7a\
+\x04\xd4\xbd\x1d\xa0\xec\x36\x80\x4e\xdf\x1f\xec\xbc\x2a\xdf\xbb\
+\xcf\xb4\x7f\x31\x18\x01\x7c\xbf\x97\xca\x3e\xff\x18\xc7\x9e\x94\
+\xc7\x78\xdf\xf3\x87\x49\x44\xb4\x1a\x29\x6a\xa3\x27\x78\x7b\x95\
+\xc5\xd9\x4c\xe2\x00\x74\xac\xcd\xcb\x18\xd0\xa2\x69\x73\x3e\x0a\
+\xbf\x9d\x8a\x30\x09\x78\x13\x70\x12\x70\x26\x70\xb7\xda\xa0\xd8\
+\x8c\x6e\xda\xb3\x0e\x2a\x36\x40\x7d\x28\x3e\x80\xbf\x4c\x01\x65\
+\x3e\x27\x54\x8c\x80\xc1\x04\x3e\x15\xca\x84\x0e\xeb\x4b\xab\x64\
+\x7d\x25\xb2\xf6\xd3\x49\xdb\x6e\xb5\x71\xec\x60\xc7\xb4\xfa\x79\
+\xaf\xbf\xf3\x06\x3b\xbe\xab\xe4\xff\xfa\xba\x5e\x57\x87\x7f\xf7\
+\xbe\x6e\x5f\x7f\x77\x55\xb8\x7e\xbb\xf7\xe6\xea\x3d\xda\x38\xce\
+\xf5\x39\x9d\x9e\x5f\xe6\xba\xbe\xc7\xca\x56\x85\xf7\xeb\xbc\xb7\
+\xba\xae\xdd\x73\xee\xd3\x81\xcb\x34\xdd\x6c\x24\xb3\x80\x97\xd1\
+\xfe\x5e\x7c\x1f\x75\x79\x4e\x5c\x45\xd2\xb1\x36\xef\xd4\x00\x30\
+\x12\xdb\xda\x5c\x3b\xc3\xb1\x40\x0f\x21\xc5\xc5\xe6\xd7\x9d\x0d\
+\xfc\x2f\x70\x29\xf0\x73\x60\xa9\xda\xa4\xe8\xd5\x39\x8d\x22\xed\
+\x7d\x76\xa1\x3f\xbb\x55\xd3\xef\x21\xee\xd5\xb7\xe0\xc7\xc1\x35\
+\x62\x89\x17\xe0\xea\x1c\x1f\xff\x2b\x63\x40\x28\x23\xe2\x5b\x1e\
+\xda\x54\xa8\x3e\xa6\xd5\xc1\x75\x5a\x6d\x1c\x37\x90\x31\xa0\xd5\
+\xa1\x91\x60\x20\x43\x40\x99\xff\xb5\x63\x18\xa8\x7a\x4e\x15\xa3\
+\x40\x95\x63\x07\x2b\x8b\x58\x0c\x02\x55\x45\x7c\x15\xa3\x41\x0c\
+\x06\x87\x3a\x0d\x08\x75\x5f\x7b\x1f\x6c\xe3\xf3\x5c\x4d\x39\x1b\
+\xc3\x58\x2c\xad\xdf\xc9\x3c\xd5\x85\xdd\x57\x7d\xec\xef\xba\xb3\
+\xb1\xec\x02\xeb\xe2\x28\x9a\xfd\x30\x47\xf5\x35\xed\x9e\xd0\xe9\
+\x16\x80\xfd\x0b\xed\x5d\x3b\xb3\x89\x63\xff\x4f\x17\x96\x7f\xe1\
+\x2b\xc0\xf3\xe8\x3f\xd5\x84\x68\x16\xbb\x3a\xaa\x5b\x29\x09\xf8\
+\x18\x3e\xbb\x4e\xc3\x43\xd5\xcf\x70\x21\xf8\x5d\xa5\x10\xac\x33\
+\x58\xa0\xab\x73\xaa\xc6\x04\xa0\x9f\x63\x7d\xa7\x05\x74\xe9\xfa\
+\xef\xa2\x6d\xf8\xd8\x0a\x40\xc9\xb2\x2a\x1b\x18\x10\xcf\x75\x26\
+\x74\x5c\x80\x10\x31\x00\x72\x08\xfc\x17\x93\x3b\x7e\x13\xc7\xeb\
+\x10\xf7\x7d\xaa\xa6\x9b\x8d\xa0\x27\x45\xfb\x57\x81\x53\x88\x23\
+\x45\xfb\x30\xfa\x5f\x88\xae\x81\x11\x98\x4d\xac\x6d\x3a\x2d\xc3\
+\xc6\xee\xff\x1f\x8c\x91\x85\x01\xe0\x73\x68\x5f\x92\x68\x6f\x7b\
+\x4a\xec\x03\x6b\xc8\xcf\x6e\x45\xf6\xbb\xaf\x67\x28\x73\x7e\x68\
+\xc3\x40\x4c\x99\x02\x5c\x79\x0f\xb8\x0e\x06\x57\xf5\xbd\x76\x0d\
+\x03\x03\x09\xf1\x58\x88\x29\xf8\x9f\xaf\xef\xbb\xac\x97\x8a\x22\
+\xfc\xe7\x1f\xd5\x3f\x87\x94\x82\x3e\x3f\xdb\xf7\x7d\x9d\x80\x02\
+\x73\xe7\xce\x9e\xc0\x67\x80\x57\x00\xa3\x23\xab\xc7\x91\x6d\x03\
+\xe8\x48\xa3\x77\x6a\x00\x38\x28\x96\xa7\xdc\x39\xa2\x0a\xd0\x9b\
+\xad\x80\xb7\x01\x1f\x04\xb6\x55\xbb\x6d\x2c\xbb\x26\x2c\xf0\x53\
+\x9d\x88\xc4\x62\x90\x70\x3d\xb1\x75\x11\x10\x30\x45\xf1\x5f\x46\
+\x4c\xb9\x4c\x0b\xe8\x23\xf5\x9f\xcf\x60\x80\x03\x9d\x1f\x2a\xe8\
+\x5f\x99\x67\x70\x11\xfc\xcf\xc5\x77\x4a\xa0\x3a\x98\x82\x11\xa0\
+\xea\x35\x62\x5d\xf9\x8f\x99\x9c\xd3\xf6\xf9\x3c\x77\x0c\x70\xac\
+\xa6\x9c\x59\xb2\x35\xf0\x6e\xe0\x03\xc0\x36\x91\xd6\xf3\x9d\xe3\
+\x2a\xb2\x8e\xd6\x9f\x3b\x35\x00\x1c\x1a\x4b\x47\xb9\x7d\x64\x9d\
+\xf3\xe6\xec\x01\x7c\x1a\x78\x2d\x30\x4e\xed\xb8\x51\x8c\x68\xa3\
+\xb3\x6a\xe2\x60\xee\x63\x42\x97\x63\xd6\x80\x90\x01\x01\x29\xf9\
+\x5e\xdd\x99\x02\x42\xa4\x05\xa4\xcd\x63\xdb\x7d\xcf\xa7\x37\x40\
+\x08\xcf\x80\xaa\x9f\xeb\x73\x0b\x80\x8b\xef\x32\xd5\xb4\x7f\x3e\
+\xd2\xfc\xb9\x36\x16\x84\x4a\xf9\x97\xf3\xb8\x92\xdb\xb8\xef\xd2\
+\x40\x70\x9a\xa6\x9d\x59\x31\x06\x78\x31\xf0\x59\x6c\x63\x7b\x2c\
+\x75\xb5\x2f\x66\x13\xd5\xc2\x96\x37\x0f\x80\xad\x81\xed\x62\x78\
+\xc2\x19\xf4\xef\x06\x52\xc7\x17\xd1\xdf\x67\x0e\x01\x8e\x07\xbe\
+\x4c\x3c\x7b\x56\x84\x7f\xb6\xf5\xfc\x5d\xe7\x1a\x1b\x20\x76\x9a\
+\x14\x1f\xa0\x8e\x4c\x01\xbe\x8c\x01\x9d\xfe\xcf\xc5\x16\x80\x4e\
+\x56\xb5\x7d\x7a\x03\x84\x6e\x1f\x65\x9f\xab\x53\x63\x80\xcb\x2d\
+\x00\x65\xfe\x17\x43\xda\x3f\x3c\xb7\xed\xd4\xf7\xf9\xa7\x88\xf6\
+\xfa\x97\x17\x61\x3b\x6a\xea\x99\x3c\x3d\x31\xd5\xbe\x84\xa5\x5c\
+\x1f\x96\x80\xce\x1b\x8d\x79\x7e\x47\xc2\x0e\xc0\x34\x1f\x06\x80\
+\x68\xb6\xb6\xcf\x76\xfc\x05\xfa\xae\x34\x63\xb1\xbd\x2b\x9f\x07\
+\xf6\x56\x1b\xcf\x9e\x59\x35\x0e\xa6\xa9\x4d\x20\x5a\x89\xff\xee\
+\xeb\x39\x7d\x08\x7e\x1f\xe2\xbf\x6e\x4f\x80\xb2\x42\x2d\xa7\x60\
+\x80\xfd\x89\x6f\x9f\xaf\xb2\xf7\x45\xc9\xb2\x89\x25\xf8\x1f\x35\
+\xd7\xf1\x98\xdc\xff\x7d\x19\x04\x72\x5e\xed\xaf\xfa\x9c\x4d\xdc\
+\xeb\xdf\xee\xb9\x4f\xd3\xd4\x33\x69\x76\xc3\xf6\xf9\xff\x27\x30\
+\x21\x32\x91\xef\x4b\x93\x7a\xa2\x6d\x2f\x80\x4e\x0c\x00\xd1\xec\
+\xff\xdf\x21\xa2\x2f\xbe\x13\x66\x00\xef\xc7\xf6\xb4\x4c\x53\x7b\
+\xcf\x96\x99\x99\x0a\xfc\xd8\xdb\x57\x1d\x84\xf6\x0a\x28\xf3\xf9\
+\x65\xaf\xd7\x89\xd8\xa9\x5b\xfc\xbb\xdc\x16\xd0\xe9\xb1\x55\xde\
+\x6b\xd7\x30\x30\x98\xd0\xaf\xa3\xde\x37\x31\xf8\x5f\x2b\x92\xba\
+\xde\xee\xb1\x54\xec\x47\xca\xf6\x65\x5a\xed\xd7\x18\x1f\xfa\xdc\
+\xe3\xb0\xed\x97\x22\x2d\x26\x17\xa2\xff\xc3\x6d\xcc\x9d\x63\x6d\
+\x03\xa9\x1a\x00\x3a\xc9\xa4\x77\x40\x2c\x4f\x17\xba\xb0\x5d\x57\
+\x98\xfd\x31\x4f\x80\x73\x81\x5f\x01\xab\xd4\x07\x64\xc5\x2c\x4d\
+\x2c\xbc\x4f\xf8\x9a\xe2\x15\xe0\xf3\x9c\x10\xef\xb9\x3e\xd7\xd5\
+\x39\x55\xff\x57\x45\x6c\xb5\x5b\x5f\x5c\x09\x9c\x56\x4d\x6d\x7a\
+\xb0\xeb\xb4\x06\x39\x66\xa0\xf7\xdb\x79\xaf\x6b\x90\xff\xf5\xfc\
+\x7f\xb0\xff\xf5\x77\xbd\xae\x0e\xce\x69\xe7\xef\x4e\xaf\xdf\x15\
+\xf0\x3d\xda\x38\xce\xf5\x39\x54\xb8\x56\x8a\xbf\x77\xd2\x2e\x7d\
+\x19\x3f\x7c\x5e\xdb\xf7\x7d\x8d\x01\x8e\x00\xce\xd7\x14\x34\x09\
+\x46\x60\x6e\xfe\xa7\xe3\x3e\x7d\x7a\xe8\x7a\x1c\xd9\xf6\x93\xfd\
+\xdb\x3d\xb0\x13\x0f\x80\x7d\x62\x78\xb2\x91\xd8\x4a\x7a\x68\x81\
+\xe3\x5a\x54\x0d\xc5\xf2\x97\x7e\x19\x4b\x63\xd2\xa5\xfe\x40\x06\
+\x00\xe2\x75\xb3\x53\xfd\xf4\x67\xd8\x08\x65\x24\x08\x6d\x18\xf0\
+\x71\x6e\x1d\x69\x01\x69\xf3\xd8\x76\xdf\xab\x1a\x17\x60\xa0\x73\
+\x5c\x7a\x07\xb8\xba\x76\xd5\xfd\xfe\x65\xcb\x3c\xb5\xb4\x7f\xbe\
+\xce\xcd\x6d\x9f\xbf\xa8\x6f\x2c\x8f\x3d\x4e\x80\xb6\x01\xa4\x51\
+\x3f\x0f\xc5\xf6\xf9\x9f\x51\x41\xfc\xc7\xa4\xf7\xb6\x25\xaa\x54\
+\x94\xfb\xba\x36\x00\x6c\x07\x4c\x89\xe1\xc9\x76\xa0\x5c\x80\xb5\
+\x58\x05\xcc\x44\xe0\x75\xc0\x27\x69\x2f\x77\xbc\x88\x9b\x51\xc0\
+\xd4\x86\x0d\xbe\x65\x26\x1c\xad\x86\xfd\xee\x73\x02\x5c\x97\x61\
+\xa0\x8c\x40\x72\x21\x76\x3a\x11\x5b\x39\xa4\x05\x1c\x48\x90\xd7\
+\x8d\x8f\x6d\x00\x4d\x4e\xfb\x17\x2a\x10\x60\xdd\x06\x81\x10\xdb\
+\x02\x52\x1e\x27\xb4\xd7\xbf\xdc\xb9\x5f\x25\x50\xf1\x00\x00\x80\
+\x00\x49\x44\x41\x54\x7b\xa2\xf4\xdb\x31\xb3\x23\xf0\xbf\xc0\xdb\
+\x63\x11\x94\x8e\xea\x61\x37\x51\x79\xfe\x4e\x05\xa6\xbb\x34\x00\
+\xec\x1b\xcb\x93\xcd\x8e\xe4\x0b\x77\x7d\xdd\x14\x1a\x86\x18\x9c\
+\xed\x2a\xd4\xa7\x58\x8d\x54\x5a\xfd\x77\x23\x94\x42\x4e\x8a\x5d\
+\x1c\x57\x45\x60\x84\x8e\x17\x90\x73\x5a\xc0\x58\x02\x02\xfa\x30\
+\x0a\x28\xed\x9f\xdf\xb6\x44\xa0\xbe\x42\xab\xfd\x1a\xb3\x63\x31\
+\x10\x9c\xa8\xaf\x3f\x3a\xca\x2e\x74\x76\x25\xd4\x3e\x22\x8b\x03\
+\xd0\x96\x66\x4f\xce\x00\x90\x4b\xaa\x8f\xae\x7e\xfe\xe7\xc2\x35\
+\x46\xd4\xc7\x56\x11\xd5\xa7\x18\x26\x0b\x9d\x5c\xbb\xe9\x9e\x00\
+\x21\x26\xda\x2e\x44\x41\x6c\xe2\xbf\x53\x71\xd6\xe9\xff\x42\x78\
+\x02\xb4\x7b\x4c\x3b\x22\xdf\x17\x55\x3e\xb3\xea\xf3\x87\x5c\xf9\
+\xaf\x43\xf4\xfb\x6a\x53\xbe\xbd\x02\xa8\xb1\xff\xcb\x7d\x2c\xc8\
+\x71\x95\x3f\x04\xc7\xa3\x94\xdb\xb1\xd0\xce\x56\xe7\x5c\x16\x98\
+\x22\xd3\xa6\x32\x00\xd4\xdd\x51\x96\x65\x24\xf0\x7c\xe0\x6b\x58\
+\x4e\x4c\x91\x0e\x72\xff\x77\x27\x4e\x73\xc4\xe5\x84\x31\xf6\xf8\
+\x00\x75\x88\xff\xb2\x42\xce\x75\xc6\x80\x76\xde\x2b\x23\x8c\x5b\
+\x91\xb6\x19\x97\xab\xfe\x65\xcb\xb4\xe5\xe1\xfb\x26\x70\x9d\x4d\
+\x2d\xcd\x5f\x2b\x50\x5f\xd7\xa4\xb1\xa0\xc9\x06\x02\x17\xe7\x4e\
+\x46\xe9\xb6\x63\x60\xff\x42\xf8\xbf\x12\x18\x5d\xc3\xe7\x87\xd6\
+\x6e\x29\x7a\x00\xb4\x9b\x05\x60\x9f\x18\x9e\x68\x0a\x96\x1f\x32\
+\x16\xa1\xee\xfb\x33\x27\x03\xff\x85\xa5\x37\xf9\x11\x70\xbf\xfa\
+\x94\xa4\x0d\x00\x4d\x11\xf8\x55\xcf\x55\x7c\x80\xb8\x04\x3f\x25\
+\xdf\x8b\x29\x4d\x60\xd9\x63\xca\x1c\x5b\xe5\xbd\x2a\x42\x28\x94\
+\x80\xea\x2a\x79\x3f\x9d\x46\xfa\xef\xfd\x7e\x27\xef\xf5\x17\xd9\
+\x7f\xf3\x63\xdb\x8d\xee\xdf\xce\x31\xbe\xfe\x1e\xec\x58\x4a\xbc\
+\xe7\xf3\x38\x45\xf5\x77\x57\x2e\x3d\xf5\xae\x4a\x16\x8f\x18\xb3\
+\x05\x84\x38\xf7\x78\xe0\x3a\x4d\x47\x6b\x61\x06\xf0\x8a\x40\xa2\
+\xb1\x8e\xac\x15\xfd\x7d\xe6\x16\x85\x66\x5b\x98\x99\x01\x60\x32\
+\xb6\xb5\xb9\x76\xb6\x4f\xc4\x12\xe4\xfa\x33\x77\x07\x3e\x0b\x5c\
+\x02\xfc\x04\x58\xaa\x3e\x26\x3b\x03\x40\x5d\x84\x16\xf8\xb1\xae\
+\xfe\xd4\x79\x5f\xa9\xc6\x07\x08\x91\x29\x20\x94\x31\xa0\xea\xff\
+\x42\x8a\xfe\xc1\x8e\xdd\x08\x2c\x03\x56\x16\xaf\x15\xc5\x6b\x4d\
+\xf1\xfe\xca\x5e\xc7\xc1\x26\x37\xc0\x9e\x55\x9a\x11\x58\x4a\xad\
+\x31\xc5\xff\x46\x03\xe3\x7a\x1d\xd7\x2a\xd9\x1f\xe4\x9e\xf6\xaf\
+\x0e\x23\x80\x8b\xf7\xca\x1e\xe7\x4a\xd0\xfb\xec\x57\xeb\xfa\xec\
+\x50\xf7\x15\xab\x81\xa0\x6e\x8e\x00\xbe\x81\x52\x6c\x87\x64\x2c\
+\xb6\x75\xf9\x69\xb8\xdd\x82\x11\x93\xc8\x1f\x8c\x59\xf1\x18\x00\
+\x66\x61\xa1\x17\x16\x57\x35\x00\xec\x17\x4b\x05\x9b\x19\xb9\x50\
+\xf7\xf9\x99\x5d\xc0\xd1\xc0\x81\xc0\x1f\x80\xb3\x80\x75\xea\x73\
+\xa2\x63\x5a\x24\x42\xbb\xee\x73\xeb\x10\xc6\xbe\x57\xe1\x53\xca\
+\x1a\x50\xe6\xfc\x4e\x8e\x0b\x91\x29\xa0\x9d\x7b\x0d\xe9\x09\xe0\
+\x5a\xf8\xb7\x3a\xfc\xae\x36\xff\xff\x62\xe0\x11\x60\x3e\xb0\xa8\
+\xf8\x7b\x11\x66\x20\xde\xe0\xb8\x2d\x0e\xc1\xbc\xef\x26\x15\xb3\
+\x8a\xc9\x45\x5f\xb7\x75\xf1\x77\x7f\x13\xa6\xae\x8a\xc6\x80\x4e\
+\x57\xfe\xdb\x31\x04\xb4\x23\xf0\xcb\x8a\x76\x68\x7f\xf5\xbe\xca\
+\xea\x7e\x59\x23\x00\x25\x8e\x73\x29\x5e\x63\x5b\x69\x8f\x75\xe5\
+\x3f\x06\xf1\x94\xf2\xb9\x23\xb1\x78\x5a\x17\x68\x4a\xea\x9d\x21\
+\x98\x97\xf2\x8b\x0b\x23\x40\xee\x22\x7f\x30\x8d\x7a\x4d\x1c\x5f\
+\x4b\x17\xb6\x13\xe6\xa2\xaa\x06\x80\x68\xf6\xff\xcf\x4a\x40\xa8\
+\xfb\xfe\xcc\x31\xc0\x4b\x8a\x06\x77\x66\x3c\x95\x4d\x14\x4c\x0d\
+\x5c\xcf\x52\xda\x3a\x10\xeb\x3e\xd0\xd0\xae\xfc\x3e\xee\xc9\x85\
+\x91\x20\xa6\x6d\x00\x75\xba\xfc\xd7\xe9\x09\xd0\xdf\x31\x8b\xb1\
+\x2d\x60\x73\x81\x87\x0a\xd1\xbf\x26\x60\x1b\xd9\x50\x18\x17\x16\
+\xf5\xf1\xde\xc8\xc2\x18\x30\xa3\x98\x00\x6d\x8f\xb9\x43\xb6\x23\
+\xf4\x07\x3b\xa6\xd3\x95\xff\x76\xc5\x7c\x3b\x02\xbe\x5d\x91\xcf\
+\x20\x02\xbc\xac\x51\x20\x16\xf7\xff\xaa\xe7\xf8\x12\xc1\xa9\x09\
+\xf3\xb2\xf7\xd5\x64\x57\xfe\x2a\x1c\x2f\x03\x80\x77\xf6\xc4\xf6\
+\xf8\x6f\xd7\xc6\xf8\x96\x8b\xc8\x8f\x49\xa3\xb6\xa1\xdd\xf3\x31\
+\x00\xcc\x4c\x48\xa8\xfb\x66\x3a\xf0\x3e\xe0\x46\xe0\x87\xc0\x03\
+\xea\x8b\x6a\x67\x14\xe5\x2d\xa0\xa9\x51\x57\xfd\xaf\x73\x0f\x7e\
+\x1d\xf7\xe6\xd3\x2b\xa0\x29\x99\x02\x42\x18\x03\x5c\x1a\x4d\x7a\
+\x04\xff\x1d\xc0\xdd\x85\xe8\x8f\x79\xdb\xd7\xea\xe2\x1e\xe7\x02\
+\x57\x14\xff\x9b\x50\x4c\x86\x66\x63\x69\x9f\xb6\xa0\xb3\x98\x00\
+\x21\x57\xfe\x3b\x15\xfd\x9d\x0a\xf9\x4e\x85\xbd\x0f\xf7\xff\x50\
+\x06\x01\x1f\x02\xdd\xb7\x70\x4f\x7d\xb5\x3f\x67\x57\xfe\x2a\xcf\
+\xbb\x1f\x16\x37\xec\x71\x4d\x4d\x9d\xb3\x35\xb6\xe2\x7f\x68\x42\
+\xf5\x21\xc4\x67\xce\x8c\xeb\x6b\x1a\x54\xbb\x27\x63\x00\x98\xc0\
+\xa6\x55\x85\xa6\xd2\xd7\xe0\xb2\x17\xf0\x79\xe0\x6f\xc0\xaf\xd8\
+\xb4\xbf\x53\x84\x67\x8a\x07\xb1\x9c\xfb\xb9\x31\x79\x05\xc4\x6c\
+\x5c\x70\xf1\xd9\x31\xc6\x07\x88\x55\xfc\xbb\x08\x06\xd8\xc9\xbe\
+\xff\x8d\xc0\xbd\xc0\xed\x85\xf0\x5f\x90\x78\x5f\xb8\x14\xb8\xa1\
+\x78\x81\xa5\x47\xdd\x05\x98\x83\x79\x08\x74\xb7\x29\xf6\xdb\x15\
+\xfc\xfd\x09\x30\x57\xee\xfe\x55\x45\x7f\xdd\x46\x00\x17\xfb\xfc\
+\x73\x58\xed\x0f\x25\xd2\x5d\xdf\x4b\x53\x5d\xf9\xab\xce\x97\x8f\
+\x02\x7e\xaf\xa9\xa9\x33\x46\x02\xcf\x04\x9e\x4d\xdf\x69\xca\x9b\
+\x66\x8c\xda\x9c\x49\x58\xbc\x9c\x65\x99\x18\x00\x46\x03\x3b\xc5\
+\xf0\x24\x33\x2b\x74\x02\x31\x08\x75\x9f\x0c\x01\x9e\x8e\xc5\x08\
+\xf8\x0d\x70\x0e\x9b\x02\x3c\x89\x70\x8c\x97\xc0\xef\x58\x7c\xe6\
+\x2a\xd6\x63\xb8\xcf\x58\xb6\x01\xd4\x25\xfe\x63\xf7\x04\x68\x61\
+\xab\xe6\x37\x16\xaf\x27\x32\xee\x1b\xe7\x17\xaf\x8b\x8b\x49\xc5\
+\x1c\xcc\x78\x3d\x87\x27\x07\x8c\xf2\xb1\xf2\xdf\x9f\x00\x1e\xcc\
+\x30\xe0\x3b\x18\xa0\x0f\x17\xff\x76\x85\x68\x19\xc1\x9a\x9b\x58\
+\x8f\xe9\x3e\x53\x0d\x06\x18\xe3\x36\x80\xde\xd7\x3d\x5a\x06\x00\
+\x67\x65\x7a\x14\xf0\x32\xfa\xf6\xe6\x0a\xf1\xf9\xa9\x7c\xe6\x4c\
+\xe0\xe6\x38\xbe\xb6\x39\x85\xcd\x66\x75\x59\x03\xc0\xae\xb8\x0d\
+\xe8\x58\x9a\x59\x19\x08\x75\xdf\x9f\x39\x0e\x78\x15\x70\x2c\xf0\
+\x03\xe0\x56\xf5\x5b\x41\x19\xab\x22\x08\x26\x94\x53\x13\xed\xad\
+\x48\xcb\x2a\x96\x6d\x00\x29\xa5\x05\xec\x54\xf8\x6f\xfe\xff\xc7\
+\x81\xab\x80\x6b\x33\x17\xfd\xfd\xb1\xb2\x78\xf6\x6b\x31\xa3\xe9\
+\xfe\xc0\x41\x58\x60\xc1\xb2\x2b\xff\xed\x18\x02\x62\x4c\xfb\x17\
+\xab\xfb\x7f\x15\xa1\x1c\xa3\x30\x4f\x75\xe5\x5f\x54\x13\x67\xbb\
+\x60\xdb\x65\x1f\x56\x91\x95\x66\x27\xe0\xd5\xf8\x5f\x09\xce\x29\
+\x10\x60\x24\x06\x80\xa1\xc0\xce\xd8\xfa\x42\x29\x03\xc0\x6e\xb1\
+\x54\xc2\x99\x35\x54\x8c\x54\x8d\x03\xdb\x03\x1f\x03\xae\x06\xbe\
+\x0f\x3c\xaa\x3e\x2c\x08\xe3\x1d\x7f\xa7\xb9\x9c\x1b\x4a\xd0\xc7\
+\xec\x09\xe0\xdb\xc0\x50\xf5\xf3\xea\x34\x0c\x74\x2a\xcc\x53\x4c\
+\x0b\xb8\xbe\x98\x14\x5c\x89\xb9\xfa\x37\xd9\x4d\xb2\x37\x4f\x00\
+\x17\x62\x91\x8a\x76\x2c\x0c\x01\x7b\x14\x13\x93\x4e\x04\x7f\x7f\
+\xc2\x2a\xd6\xb4\x7f\xb4\x79\x6c\x13\xf7\xf9\xc7\x26\xd2\x7d\xde\
+\x67\xa8\x60\x80\x4d\xf6\x10\x38\x0a\xf8\xa5\xba\xda\x8e\x99\x8c\
+\xed\xf3\x3f\xda\x61\x9d\x6f\x42\x20\xc0\xc8\xe2\x00\xec\x96\x85\
+\x01\x60\x56\x44\x25\x9a\x8a\x71\xe0\x00\xcc\xcd\xf2\x6c\xe0\xb7\
+\x28\x27\xaa\x6f\xc6\x25\x52\x07\x53\x49\x0d\x58\xb7\x70\x6f\xd5\
+\xf4\x7b\x1d\x65\xe5\x62\xdf\x7f\x59\xf1\x9f\xb3\x27\xc0\x6a\xcc\
+\x10\x7b\x31\x71\x07\xf2\xab\x9b\x16\x16\xf0\xf0\x6e\xcc\x93\xea\
+\x50\xe0\x70\x6c\xbb\x40\xcc\x69\xff\xea\x88\x01\x40\x89\x6b\xc6\
+\xb4\xcf\x3f\x64\xea\x3d\x9f\x86\x85\xd8\x0c\x1b\x39\x47\xf4\xaf\
+\x72\x4f\x47\xcb\x00\xd0\x11\x23\x80\x53\x81\xe7\x61\xfe\xe3\x12\
+\xf9\xc9\x1b\x00\x48\xda\x00\x30\x0a\xd8\x32\x22\x31\x9e\x92\x71\
+\x60\x38\x16\xb0\xe3\x68\xe0\x27\xc0\x25\x68\xf5\xc9\x17\x63\x13\
+\xa8\x2b\xb1\xdc\x93\x4f\x41\x9f\x8a\x27\x40\x9d\xf7\xef\xda\x2b\
+\xa0\x6c\xec\x80\x3a\xc5\xbf\x4f\x4f\x80\x85\x45\x5f\x7b\x35\xb0\
+\x4e\x5d\x63\x47\x2c\x07\xce\x2d\x8c\x26\x07\x60\x2b\x78\x93\xc8\
+\x63\xe5\xdf\x45\x0c\x00\xd7\xc6\x82\xd0\xab\xfd\x75\xf6\xab\x31\
+\xee\xf3\x0f\x55\x36\xb1\x0b\x75\x5f\xe7\x6e\x5f\x88\xb2\xb9\xea\
+\x5a\x07\xe5\x00\xe0\xb5\x85\xde\x6a\x7a\x4a\xbf\xb2\xf7\xb3\x35\
+\x83\x6c\xbc\x4f\xc8\x00\xb0\x7b\x2c\x16\x95\xae\x92\x5f\x90\x8c\
+\x03\xc6\x24\xe0\xad\xc0\x69\xd8\xb6\x80\x3b\xd4\xd7\xd5\x6e\x00\
+\xf0\x55\x57\xba\x22\xaa\xdf\x75\x88\xfb\x14\xc4\x79\x2c\x5e\x01\
+\x65\xce\x77\x65\x18\x70\x25\xfe\x5d\xac\xf2\xbb\x12\xfe\x4b\x80\
+\xf3\x81\x7f\xa3\x40\xac\x55\x59\x8b\xa5\x15\xbc\x12\xd8\x1b\x38\
+\x91\x27\xc7\x09\xf0\x99\xf6\x6f\xa0\x73\xfa\xfa\xbb\xee\x18\x00\
+\x94\x38\x2e\x84\x38\xcd\x65\xb5\x3f\x94\x90\xf7\xb9\x0d\x20\x76\
+\xa1\xee\x93\xa3\xb0\x05\x30\xd1\x37\x3b\x60\xfb\xfc\x77\x95\xc8\
+\xaf\x7c\x3f\x5d\xc0\x36\x98\x37\x5b\x04\xec\x5e\xd6\x00\x30\x8a\
+\x48\x3c\xef\xb7\xcb\x44\x8c\xc7\xc0\x6c\xe0\x93\xc0\x3f\x81\x1f\
+\xa1\x1c\xa9\x2e\x19\x17\xa8\x8e\xe5\xea\xfe\x2f\xaf\x00\x3f\xf7\
+\xef\xba\xcc\x43\xc7\x07\x70\x79\xae\xaf\x63\x96\xf6\x12\xfe\x1b\
+\xd4\x15\x3a\x65\x03\x16\x30\xf0\x06\xe0\x60\xe0\x38\x2c\xde\x8a\
+\x6f\x77\xff\x4e\x0c\x05\xa1\x8c\x00\x38\x3c\x2e\xc4\xca\x7f\x9d\
+\xfd\x65\x13\x57\xfb\x73\x8e\xe8\x2f\x03\x80\x7b\x26\x02\x2f\x00\
+\x4e\x20\x92\x68\xef\x89\x88\xfc\xc1\x98\x19\x8f\x01\x60\x36\xb6\
+\xab\x63\x4d\xa7\x06\x80\x39\x58\x86\xb9\xda\x99\x51\x43\x85\x20\
+\xe3\xcf\xec\x02\x0e\xc3\xa2\x2f\xbf\x17\xb9\x46\xb9\x62\x78\xe4\
+\x75\xac\x4e\xe3\x80\x6b\x71\xdd\xd4\xf8\x00\xad\x1a\xca\xca\x67\
+\x7c\x80\x4e\x85\xb7\xcb\x2d\x03\x65\x8f\xe9\xfd\xbf\x75\xc0\xe5\
+\xc0\x79\xd8\x8a\xb5\xf0\x6b\x08\xb8\xa2\x30\xb2\x1c\x0e\x1c\x5f\
+\xcc\x6c\x5c\xba\xfb\x77\x22\xfa\xab\x1a\x01\x28\xf1\x5e\xcc\xfb\
+\xfc\xeb\x5a\xed\x4f\x75\x9f\x7f\xd9\xeb\xe5\xbc\x5f\xdf\xd7\x75\
+\xb7\xc5\x56\x65\x1f\x54\x37\x0a\x85\xb0\x7b\x1a\x16\xe4\x6f\x54\
+\x26\xdf\x77\x4c\x9f\x39\x23\x9e\xaf\x7a\x28\x96\xc0\xe1\xe6\x4e\
+\x0d\x00\xbb\xc7\xf2\x04\x11\x15\x66\x56\xc6\x81\x2e\x60\x81\xfa\
+\x42\xa7\x9d\x6a\xec\x42\x3c\x24\x3e\xc5\x7d\xdd\xc2\x3d\xb6\xf2\
+\x4d\x35\x3e\x40\x2c\xc1\x02\x3b\x3d\xa6\x05\xdc\x04\x9c\x05\x2c\
+\x56\xd7\x17\x94\x75\x58\xd6\x80\xeb\x8a\x49\xec\x7e\xfd\xf4\x7f\
+\x75\xa4\xfd\x8b\xd5\xfd\x3f\xe7\xd5\x7e\x1f\x46\x08\x9f\x9f\x5f\
+\xf6\x7a\x29\x0b\xf5\x18\x3c\x04\x0e\x03\x7e\xad\xee\x93\x03\x30\
+\x77\xff\xad\x3c\xce\x6b\x9a\xbe\x7d\x60\x46\x5c\x5f\xf9\xee\x65\
+\x0c\x00\xbb\xc6\x72\xf7\xd3\x13\x10\x3b\x29\x1a\x07\xfe\x4d\x34\
+\x81\x2a\xb2\x33\x00\x34\x6d\x85\xdf\xa5\x80\xf5\x29\x88\x63\x12\
+\xe1\x39\x7a\x05\xf8\x30\x0c\xf8\x16\xff\x9d\xae\xfa\xcf\xc7\xb2\
+\xaa\xcc\x53\x97\x57\x2b\x4b\x81\x5f\x61\x31\x02\x9e\x0b\x4c\x23\
+\x8e\xe0\x7f\xa9\xb9\xff\xa7\xba\xda\x5f\xf7\xca\xbf\xeb\x6b\xe7\
+\x2c\xd4\x63\x10\x76\x87\x36\xdc\x00\x30\x03\x78\x15\x4f\x36\x98\
+\x4a\xe4\xfb\xb9\x9f\xc8\x0c\x00\xfd\x6a\xf9\xe8\x3d\x00\x26\x50\
+\x2e\xbd\x5a\x17\x62\xb0\x32\xb8\x44\x45\xe4\xcd\x00\x10\xa3\x88\
+\xaf\xcb\x38\x10\xca\xe5\xbf\x0e\x11\x1f\x1b\xa1\xbd\x02\x5c\x1c\
+\x37\xd8\x7b\x75\x8b\xff\x9e\xbf\x37\x00\x97\x02\xff\x00\xd6\xab\
+\xbb\x8b\x86\xfb\x81\x2f\x03\x47\x02\x27\xf5\x9a\xd4\xd4\x99\xf6\
+\x2f\x84\xfb\x7f\x55\x51\x99\xfa\x6a\x7f\xdd\xcf\x12\x6a\x4b\x40\
+\x2a\x22\x3f\x76\xe3\xc1\x1c\x6c\xcf\x7b\xd3\x3c\xb6\xc6\x62\xfb\
+\xfc\x4f\x29\x31\x47\x8d\xf1\x3b\x8d\x45\xe4\xb7\xa3\x5b\x97\xc5\
+\xf1\x08\xfd\x6a\xf9\x81\xe2\x3e\x44\x91\x02\x70\x86\xa7\x2f\x34\
+\x36\x31\x1e\x9a\x15\x98\x0b\xa5\x08\x6f\x00\xe8\x6a\x40\x1d\x73\
+\x2d\xf4\x7d\x8a\xe0\xba\x85\x77\xca\x59\x03\x5c\xc4\x07\x08\x11\
+\x2c\xb0\xdd\xbf\xfb\x3b\x66\x2e\xf0\x25\xe0\x6c\x89\xff\x28\xd9\
+\x80\x6d\x0b\xf8\x0a\x9b\x3c\x33\x3a\xf9\x7e\x7d\xfc\xed\xfb\xbd\
+\x96\xe3\xb6\xdc\x94\x7e\x2e\xe4\x78\xe1\xfa\x1a\x31\x88\xa1\x54\
+\xe7\x2e\x5d\xc0\x21\x0d\x9b\x8f\x9e\x04\x7c\x13\x78\xfa\x00\xf3\
+\x53\x79\x52\xfb\xf9\xcc\xe9\xf1\x14\xe9\x6e\x9d\x1a\x00\x46\x62\
+\x99\x21\x6a\x67\x9b\x06\x34\xd4\x3a\x2a\xfc\x55\x9a\xc8\xd6\x66\
+\x00\x48\x6d\x80\x8d\xd5\xfd\x5f\x9e\x00\xe1\x9f\x25\x85\xf8\x00\
+\x2e\x8d\x01\x1b\x0b\x61\xf9\x6d\xe0\x51\x75\x71\xd1\xb3\xa0\x98\
+\xf0\x9e\x5d\x18\x05\x5a\x35\xd5\x1d\xd7\xef\x11\xb8\x0d\x37\xbd\
+\x9f\x4b\x6d\xec\x8a\x7d\xbc\x8f\xe5\xba\x87\x36\xa4\x1f\xdc\x0b\
+\xf8\x22\xf0\x26\x2c\x63\x8a\x34\x4f\x78\x22\xda\x06\xb0\x13\xfd\
+\xc4\x28\xef\x6f\x0b\xc0\x6c\x22\xc9\x00\x30\xbd\xe1\x15\xd3\xd7\
+\xfd\xfc\x53\x73\x45\x6f\x06\x80\xae\x86\xd4\xcd\x76\xee\x29\xc6\
+\x55\x14\xc5\x07\x70\x7b\xdf\x65\xbf\xaf\x4e\x04\x7e\x1d\x02\x6e\
+\x31\xf0\x0b\xcc\xc5\x5c\xa4\x43\x8f\xd1\xe6\x1e\x2c\xca\xf5\x64\
+\xfc\xba\xfb\xf7\xf5\x37\x6d\x1e\xab\x7d\xfe\xee\xef\xdb\xe5\xf3\
+\xb9\xb8\x9e\xaf\x6b\x34\x35\xa2\x7f\x15\xf6\xc5\xa2\xde\xaf\xca\
+\xb4\xef\xdb\x1a\x78\x09\x96\x25\xa5\xee\xba\x92\xca\x7e\xfd\x06\
+\x18\x00\x86\x61\x0b\xfa\xb7\x6f\xfe\x46\xf7\x00\x06\x00\x59\x51\
+\x32\x35\x0e\xac\xc2\x72\x2a\x8b\xf0\xdf\x47\x13\x56\xf8\x5b\x25\
+\x8f\x6d\xd5\x78\x0d\x1f\x22\x3e\x36\x52\x8d\x0f\x50\x25\x58\x60\
+\x27\x7f\xf7\x3e\xff\x3a\xe0\x0b\x12\xff\x49\xf3\x00\xb6\x25\xe0\
+\x86\x01\xea\x4a\xa7\xf5\xc5\x55\x3d\xf5\xd9\x7e\xd4\x7f\x85\xed\
+\xff\x43\x5f\x23\xb7\xf9\x42\xc8\xeb\x0e\xc3\xd2\x5f\xe7\xc6\x48\
+\xe0\x85\xc0\x57\xfb\x10\xff\xd2\x44\xd2\xae\xc0\x8e\x7d\xfd\x33\
+\x59\x03\x80\x2a\x5e\xf9\xfb\xb9\x1a\x4b\xa5\x24\xdc\xb2\x36\xb3\
+\x3a\xe4\xeb\x9e\x52\x72\xf9\xaf\x7b\xe2\x9a\x92\x57\x40\xd9\x73\
+\x62\xc9\x14\xd0\xe3\xf2\x7f\x36\xb6\xf2\xbf\x16\x91\x3a\xab\x81\
+\x9f\x01\xbf\xc3\xcd\x96\x80\xd0\xee\xff\xa1\xf6\xf9\xe7\xd0\x47\
+\xd5\xd5\xd7\xc7\xba\xcf\xbf\x29\xf3\x89\x4e\xc9\x69\x1b\x40\x17\
+\x70\x2c\xb6\x45\xed\x45\x85\x81\x43\x22\x3f\x8e\xfb\x89\xcc\x00\
+\xd0\xa7\xa6\x1f\xda\x89\xb5\x20\x34\xe3\xc9\x23\x03\x40\x6c\xf7\
+\xf3\x2f\xcd\x0b\xbd\xb0\x26\xe2\x41\xa2\x8e\xeb\xba\x5e\x31\xa9\
+\x73\xc2\x97\xd3\x4a\x9a\xaf\xe7\xaa\x2b\x3e\x80\x0b\xf1\x0f\x16\
+\x18\xf5\x67\xc0\xdd\xea\xca\xb2\xe3\x4a\x2c\x86\xc3\x4b\x8a\x39\
+\x45\xaa\x69\xfe\x5c\x6e\x05\x88\x39\xaa\x7f\x1d\xcf\x15\xcb\x96\
+\x80\x18\xb6\x01\xa4\x16\xfd\xbd\x93\xfb\x3d\x08\xdb\xae\xb9\x21\
+\xf1\x3e\x6d\x2c\xf0\x21\x2c\xbb\x41\x6e\xdf\x77\x0e\xf7\xb3\x45\
+\xf1\x1d\x2d\x8f\xe3\x11\xd2\xf3\x00\xd8\xc6\xd3\x17\xd9\x64\xe3\
+\xc0\x1a\x14\xfd\xdf\x17\xab\xc9\x3b\x80\x4e\xa7\x82\xb2\x4e\xa1\
+\x5f\xa7\xb1\xc0\x87\xd8\xce\xdd\x2b\xa0\x93\x7a\xe4\x43\xfc\x3f\
+\x88\x45\xf9\x97\xf8\xcf\x97\xfb\x30\x17\xd9\x87\x2b\xd6\x95\x76\
+\x8e\xc5\x63\x7b\xc8\x79\xb5\x3f\xf6\x95\xff\x3a\xaf\x11\xd3\x36\
+\x80\x94\xaf\x3b\x0e\xd8\x23\x83\xfe\x6c\x44\x87\xe2\x5f\x0b\xa3\
+\xe1\xef\x27\xa2\x4c\x00\xb3\x3b\x31\x00\x44\xe1\x01\xb0\x95\x2a\
+\xa4\x73\xae\x2d\x84\xaa\x70\xcf\x9a\x9a\xea\x57\x4a\xd7\x4d\x71\
+\xe2\xe5\x6a\x22\x9d\x0a\xb1\xc5\x07\xf0\x9d\x29\xe0\x4e\xe0\xbb\
+\xc0\x13\xea\xc2\xb2\x67\x29\x96\x25\xe0\x36\xcf\x46\x80\x96\x87\
+\x76\xa0\x7e\x28\x6c\x3f\x5e\xe7\x35\x24\xf2\xfd\x92\xc3\x36\x80\
+\x85\x58\xa0\xda\x98\x69\xba\xd1\x21\x45\x03\xc0\x70\x60\xbb\x18\
+\xee\x78\x9a\xe6\x2b\xce\x2b\xb2\xdc\xff\xeb\x33\x00\xe4\x3c\xa0\
+\xba\x9a\x10\xc9\x2b\x20\xce\xdf\x5d\x97\x55\x2c\x99\x02\xae\x04\
+\x7e\x80\x8c\xa2\x4d\x62\x2d\x70\x26\x70\x45\x49\x23\x40\x59\x03\
+\x81\xcb\xe3\x5a\x0d\xea\x5f\xea\xea\xb3\x63\x59\xed\xaf\xcb\x78\
+\x93\xd3\x9c\x64\xf3\xcf\x3c\x8c\x3c\x52\xd1\xdd\x1d\x61\xd9\x8a\
+\x4d\x4c\x8d\xe7\x56\x66\xd1\xc7\x96\xff\xbe\x0c\x00\xdb\x13\x49\
+\x0a\xc0\x98\x0c\x00\x39\x54\xf2\x75\xc0\x35\x6a\x93\xde\x68\x92\
+\x88\xe8\x6a\x63\x32\x5c\x66\xb2\x93\xca\x04\xcd\xd5\x84\x3b\x15\
+\x42\xc5\x07\x08\x99\x29\xe0\x6c\x2c\x38\xdc\x46\x75\x5d\x8d\x63\
+\x23\xf0\x47\xe0\x6f\x25\x8c\x00\xae\x22\xfc\xfb\x6a\x47\x5a\xed\
+\x8f\x7f\xcc\x70\x79\x9e\x04\x58\xe7\xe5\x30\xb5\x10\x3a\xa9\x73\
+\x97\xbe\xf6\xa8\xdb\x43\x44\x1a\x76\x18\x7d\x2c\xec\xf7\x65\x00\
+\x88\x26\x03\xc0\x56\x89\x88\xf1\x54\xee\xe7\x26\x60\xa5\xfa\x07\
+\x6f\xac\x49\xac\x7e\x85\xae\xb7\xa1\x57\x43\xea\x08\x04\x18\x6a\
+\x02\xdc\x34\xaf\x00\x97\xdb\x00\x5a\xc0\x9f\xb1\x5c\xf1\xa2\xd9\
+\x5c\x00\xfc\x81\xce\xb3\x03\x84\x74\xff\x6f\x35\xb4\x0f\x49\xad\
+\x6f\x4f\x71\xb5\xbf\xc9\x5b\x04\x0e\xc8\xa0\xff\xba\x3b\xf1\x7a\
+\x92\xfb\xfd\x44\xe6\xc5\x3e\x3b\x19\x03\x40\x17\xb0\x65\x06\x0d\
+\x34\xa6\x8a\x7a\xb5\xe6\x7b\x5e\x59\xa6\x81\x76\xc0\xc9\x4d\x2a\
+\xe7\xd5\x91\x35\x20\x45\x7c\x79\x05\xf8\x30\x0c\xf4\xfc\xbd\x11\
+\xf8\x2d\x70\x99\xba\x2b\x51\xf0\x4f\xe0\x57\x45\xdd\xf0\x65\x04\
+\xf0\x65\x10\x68\x7a\x1f\x52\x57\x9f\x1e\xf3\x79\x9a\x7b\xb4\xc7\
+\x7e\x32\x00\x48\xe4\x7b\x26\x45\x03\x40\x14\x01\x00\x27\x61\xc1\
+\x08\x72\xae\x34\xa1\xef\x55\xee\xff\x7e\x59\x1c\x59\x3d\x08\x79\
+\xdd\x54\x56\x4d\x14\x1f\xc0\xfd\xef\xae\xcb\xde\x57\xa6\x80\x8d\
+\xc0\x2f\x81\x7f\xab\xab\x12\x9b\x71\x6d\x07\x46\x00\x3c\xd6\x63\
+\x45\xf5\xaf\x4f\xd4\xa7\x3c\x6e\x49\xe4\x77\xfe\x99\xbb\x61\x91\
+\xf4\x53\x66\x29\xf0\x98\x44\x7e\xb4\xf7\x3a\x12\x98\x10\xcf\x23\
+\xec\xd8\x8e\x01\x20\x0a\x0f\x80\x69\xaa\x6c\x4e\xb9\xaf\xc3\x8e\
+\x42\x74\xce\xc2\x06\xd7\xaf\xb2\x93\xae\x14\x85\x7e\x28\x41\x9f\
+\x0a\x31\xc4\x07\x18\xec\xbd\x16\xe6\xea\x7d\xbd\xba\x29\xd1\x0f\
+\xd7\x61\xde\x21\x2d\xfc\xbb\xff\x6b\x9f\x7f\xf8\x7e\x36\x15\xc3\
+\x80\x44\x58\x98\x67\x19\x4e\x1e\xe9\x00\xef\x97\xc8\x8f\xfa\x5e\
+\x23\xf2\x02\x68\xcb\x00\x10\x85\x07\xc0\x54\x55\x52\xa7\xf7\x2a\
+\xf7\xff\x34\x0d\x00\x29\x0f\xce\xa1\x27\x43\xb9\x66\x0d\x50\x7c\
+\x80\xea\x02\xec\x2c\x2c\xe2\xbf\x10\x83\x8d\x93\x7f\x76\x28\xf4\
+\x5d\xf7\x13\xda\xe7\x9f\x4f\xf0\x3e\x9f\xf7\x29\xe1\xd7\x1e\xfb\
+\x66\xd0\x67\xdd\xa7\xef\x3a\xea\x7b\x8d\xc8\x00\xb0\xd3\x60\x06\
+\x80\x2e\x22\x49\x01\x38\xb5\xc1\x15\xc6\xc7\xbd\xca\xfd\xdf\x3f\
+\x8b\x32\xa9\x97\x55\xae\x1b\xf3\x04\x29\xa5\x14\x83\x8a\x0f\xe0\
+\xce\x30\x70\x36\x70\x89\xba\x27\xd1\x26\x97\x03\x7f\xf7\x24\xf4\
+\xd5\x17\xa4\xd3\x1f\x87\x38\x2f\xc4\xd8\x1a\xeb\x5c\x21\x86\xcf\
+\xcc\x21\x0e\xc0\x7d\x09\x96\x7b\x93\xee\x35\xa2\x58\x76\xb3\x06\
+\x33\x00\x4c\xc5\xb6\x2d\xd4\xce\x34\x55\x34\x67\x3c\x81\xd2\x85\
+\x84\x60\x35\x7d\x67\x59\xc8\x29\x37\x6b\xd5\xf4\x7f\xf2\x0a\xa8\
+\x67\x52\x9d\xaa\x57\x40\xd5\xe3\xae\x44\xd1\xfe\x45\xe7\x9c\x0f\
+\x5c\x11\x40\xe8\x37\xa9\x8d\xa7\xd6\xf7\xa6\x62\xcc\x96\xc8\x2f\
+\xcf\xf6\xc0\x44\x19\x00\x92\x24\x15\x83\x44\x44\x5a\x76\x34\x16\
+\x5e\xaf\x5f\x03\xc0\xb6\xb1\x17\x9a\xac\x50\x9d\x73\x35\xe9\xaf\
+\x22\xa4\xc2\xa2\x04\xea\x48\x9d\xe9\xff\x42\x4c\x88\x72\x4d\x31\
+\xd8\x84\x95\xc0\xb2\xe7\xf4\xf5\xde\xed\xd8\xbe\x7f\x21\xca\xf0\
+\x67\xe0\xd6\x92\x75\xcf\x55\xbd\xce\xb1\x8d\x37\x29\x55\x5f\x2a\
+\x31\x01\x9a\x30\x0f\xe9\xeb\x33\xbb\x80\x7d\x12\x6f\x73\xf3\x71\
+\x97\xde\x5b\xf1\x03\xdc\xdf\x6b\x64\x8b\xd9\xdb\x26\x6d\x00\xc8\
+\x85\x90\x15\x5b\xee\xff\xe1\x58\x98\x68\x1d\x89\x45\xf4\xc7\x66\
+\x58\x70\x7d\x9f\x8a\x0f\x10\xc6\x48\xf0\x10\xf0\x53\x2c\xaa\xbb\
+\x10\x65\xd8\x08\xfc\x02\x78\x38\xb0\xb8\xd7\x3e\xff\x74\x3c\xbe\
+\x42\x8f\x5d\x9a\xe7\xba\xff\xcc\xd4\xb7\x01\xb4\x80\x79\x12\xf9\
+\xd1\x12\x99\x96\xdd\x2e\x7a\x03\xc0\x38\xca\xed\x43\xc8\xbd\x22\
+\x95\x61\x03\x70\x83\x8a\x21\x18\x0f\x25\xde\x69\x86\xda\xff\x9f\
+\xca\xb6\x81\x3a\x83\x37\x69\x95\xb0\x5c\x39\x2f\x03\x7e\x08\xac\
+\x55\x77\x24\x2a\xb2\xa6\xa8\x4b\xcb\x2b\xb4\x77\x79\xf7\xf8\xb9\
+\x76\x88\xfe\x38\xb6\x71\x4a\x71\x00\xdc\x7f\x66\x8e\x71\x00\xa4\
+\x85\xe2\xa9\x77\x63\x31\xdf\xfb\x48\x18\xd0\x03\x20\x8a\x00\x80\
+\x93\x33\xe9\xa4\x62\xb8\xd7\x5b\x71\xe7\x1e\x24\x06\xe7\x81\xcc\
+\x06\xc7\xc1\xae\x1b\xdb\x44\x27\xf5\x60\x82\xf2\x0a\xa8\x26\xb4\
+\x36\x00\x3f\xc3\xe2\x9e\x08\xe1\x82\xa5\xc0\x8f\x8b\xba\xa5\x7d\
+\xfe\xf1\x18\x09\x72\x0c\xde\xa7\x38\x00\xe1\x3f\x73\x72\x2c\xc2\
+\xc7\xa1\x01\x20\x67\x4d\x93\xe2\xbd\x4e\x4a\xc4\x00\x10\x85\x07\
+\xc0\x24\x55\x4e\x67\xf7\x7a\xbd\xe6\x6f\xb5\x1a\x00\x9a\x4e\x8e\
+\x5e\x01\x21\x26\xa9\x55\x44\x42\xea\xf5\xa4\xca\xca\xea\x5f\x81\
+\x7b\xd5\xec\x84\x63\xee\x07\xce\x71\x50\x3f\x9b\xd2\x56\x15\xbc\
+\x2f\xec\x78\x28\xaa\x91\x7a\x3a\xc0\xfb\x25\xf2\xa3\xbe\xd7\xc9\
+\xf1\x3c\x7a\xfc\x5b\x00\xa6\x34\xb8\xa2\xb8\xbe\x57\xb9\xff\xc7\
+\x6b\x00\xc8\xd5\xaa\xde\x8a\xec\xd8\x26\xa5\x18\xac\x32\x51\x8f\
+\x7d\xa5\x71\xb0\x73\xae\xc3\x52\xb8\x09\xe1\x83\x4b\x7a\x8d\xa7\
+\xbe\x02\xff\x35\x69\xe5\x3f\xc4\x35\x62\xf6\x12\x88\xcd\x18\xd0\
+\xd4\x40\x80\x90\xfe\x36\x80\xb9\x19\xd7\x91\x1c\xee\x35\x22\x03\
+\x80\x3c\x00\x9a\xd2\x18\x96\xd1\xdc\x14\x21\x75\xf1\x08\x6e\xf6\
+\x1e\xa7\x36\x18\xa7\x3c\x49\x4a\x51\xe8\xd7\xbd\xba\x18\xe2\xf3\
+\x3b\xf9\x8c\x45\xc0\xef\xd5\xfd\x08\xcf\xfc\x86\xbe\x03\xbd\xc6\
+\xd6\x1e\x52\x68\xf3\xb1\x18\x06\x9a\x32\xce\x35\x5d\xe4\x0f\xc4\
+\xde\xc0\xd0\x84\xfb\xa5\xd5\xc0\x02\x89\xfc\x68\x89\x48\xd3\xf6\
+\xeb\x01\x30\x14\xd8\x3a\x86\x3b\x9c\x4c\xfa\xc4\x50\x31\x6f\x44\
+\x6e\x64\xa1\x69\xe1\x3f\x10\x60\x2c\x03\x6a\x6a\x93\xa1\xd4\x83\
+\x09\xc6\xe4\x15\x10\xcb\x67\xb5\xb0\x68\xed\x3f\xc7\x02\xb6\x09\
+\xe1\x93\xb5\xc0\xaf\x8a\x3a\xd7\x6a\x68\x9b\xf3\xdd\x77\x35\x3d\
+\x78\x5f\xac\x71\x00\x72\x11\x8d\x7d\x31\x12\xd8\x29\xf1\x67\x78\
+\x20\xd3\xef\x2b\x87\x80\x86\x11\x79\xb5\x4f\x07\x86\xf4\x65\x00\
+\x78\xd2\x1b\x75\x32\x29\xe3\x8a\x10\x12\xb9\xff\xc7\xdf\x11\xe7\
+\xdc\x59\xca\x2b\xc0\xff\x7d\x86\x32\x1c\xb8\x12\x1c\x3e\x3e\xe3\
+\x3c\x3a\x4b\x83\x24\x44\x15\xee\x07\x2e\xa8\xb9\xce\xc7\xd0\xae\
+\x43\x8c\x0b\xa1\x85\x7a\x2e\xe3\x57\x13\x84\x98\xeb\xfb\xd9\x3d\
+\xf1\x7e\x69\x9e\xf4\x52\xb4\x75\x32\x22\x0f\x80\x61\xc0\x56\x7d\
+\x19\x00\xb6\x8d\xe5\x0e\x27\x37\xb4\x92\xb8\xe6\x46\xb5\xc7\x5a\
+\xb8\xaf\x21\x03\x66\x0e\x93\xa6\xa6\x7a\x05\xd4\xb5\x52\xe8\xfa\
+\x73\xe7\xf6\x12\x63\x42\x84\xa2\x3f\xa3\x53\x2e\xed\x2a\x54\x9f\
+\xa4\xd5\xfe\xb8\x8c\x01\x4d\xce\x11\xbf\x5b\xe2\x7d\xd2\x83\xd2\
+\x44\xd1\x12\x99\xa6\xdd\xb6\x2f\x03\xc0\x36\x31\xdc\x59\x37\xb0\
+\x45\x83\x2b\x90\xab\xe7\x78\x04\x78\x54\xf3\xb4\x5a\xb8\xad\x61\
+\x03\x6d\x53\x26\x52\x4a\x31\x18\x8f\x00\xe9\x49\xf9\xf7\x5b\xcc\
+\x1d\x5b\x88\x90\x6c\x04\x7e\x0d\xac\xaf\x50\x7f\xeb\x30\x14\x84\
+\xee\x3b\x94\xaa\x2f\x3e\x63\x40\x93\x45\x7e\xce\x06\x80\xd8\x33\
+\x50\x35\x59\xa3\x4d\x8a\xeb\xf9\xfb\x34\x00\x4c\x8f\xe1\xce\x26\
+\xe0\x7e\x1f\x42\x13\x2b\x9e\xdc\xff\xeb\x35\x00\xb4\x54\x5f\xb3\
+\x98\x5c\xe5\x9e\x62\xd0\x95\x28\xa9\xc3\x90\x70\x3e\xee\x02\x1f\
+\x09\xd1\x29\x8f\x02\x17\x25\xd4\x5e\x7c\xf7\x13\xa1\xfb\xbc\x18\
+\xfa\x71\xa5\x00\xcc\xc7\xe8\xb0\x45\x2c\x22\xa8\x82\x01\xa0\xa5\
+\xef\x39\xca\xe7\x18\x0a\x8c\x8f\xe7\xf1\xb6\xee\xcb\x00\x30\x35\
+\x86\x3b\x9b\xac\x0a\xeb\xe4\x39\x64\x00\xa8\x8f\x95\x98\x6b\x72\
+\x2e\xf5\xb5\x4c\x00\xc0\x9c\x27\x5c\x39\xa5\x18\x74\x3d\x61\x08\
+\x95\x7e\x6c\x3e\x70\xa1\xba\x1a\x51\x33\x17\x30\xb8\x11\x2a\xa6\
+\x94\x7c\x3e\xfb\x04\xa5\xea\xab\xe7\x58\x05\x02\x74\x77\x3f\x29\
+\xc7\x01\x58\x0d\x3c\x2e\xcd\x14\xed\x73\x44\xb4\x0d\x60\x6a\x5f\
+\x06\x80\x69\x4d\x34\x00\xe4\x58\xd1\x37\x02\x37\x6b\x6e\x56\x2b\
+\xb7\xa9\xbe\x36\xd6\x40\x10\xda\xb0\x50\x87\xb1\x20\x64\x1a\xb2\
+\xcd\x3f\xab\x85\xb9\xfe\x6f\x50\x37\x23\x6a\x66\x3d\x96\x7e\xb2\
+\x55\x73\x9b\x88\x4d\xd4\x87\x16\xea\x4d\x1c\x5b\x34\x27\x76\x7f\
+\x3f\xda\x06\x20\x91\xdf\x54\x03\xc0\x96\x31\xdc\xd9\x16\x9a\x53\
+\x54\xe6\x7e\x60\x85\x8a\xa1\x56\x6e\x6f\x60\x47\xd8\xaa\xe9\x5a\
+\x0a\x26\x58\xdf\x35\x7c\x8b\x95\xbe\x7e\xbf\x16\x45\xfd\x17\xf1\
+\x70\x1f\x9b\x02\xee\xc6\xba\xda\x1f\x63\xdf\xa1\xd5\xfe\x7a\xc7\
+\xd8\xa6\x8a\x7c\x19\x00\x44\x1d\x4c\x8c\xe7\x56\xa6\xf5\x65\x00\
+\xd8\x2a\x86\x3b\x9b\x90\xc8\x97\x19\xb3\x85\xec\x56\xb5\x35\x7d\
+\x07\x81\xf0\xed\xca\x98\xe3\xc4\xae\x4e\xf7\xd8\xd4\xbd\x02\xd6\
+\x01\x7f\x57\xf7\x22\x22\xe3\xaf\xc0\xda\xc0\x82\x3d\xa7\xa8\xfe\
+\x5a\xed\xaf\xd7\xb0\x20\x8c\xed\x80\x71\x0d\x31\x00\x68\x95\x3f\
+\x2c\x11\xc5\x00\xe8\xd3\x00\x10\xc5\x16\x80\x09\xaa\x90\x12\x9f\
+\x19\x30\x97\xfe\xbd\x30\x9a\x64\x61\x97\x57\x40\x9c\x93\x61\x9f\
+\xc6\x02\x1f\x42\xa6\xe7\xf7\x0b\x80\x25\xea\x5e\x44\x64\x2c\x05\
+\x2e\x71\x58\xcf\x43\xb6\xb9\xd0\x7d\x4c\x0c\xfd\x66\xd3\x57\xfb\
+\x95\x09\xa0\xff\xfb\x98\x93\x91\x01\x40\x22\x3f\x1e\x22\xd2\xb6\
+\xf1\x6e\x01\x98\x40\xde\xf8\xae\xc8\x2d\xea\xd9\x7f\x2e\x9e\xfa\
+\x3d\x5c\x9f\xe9\xc0\x1c\xeb\x2a\x86\x82\x09\xfa\x39\xcf\x95\xa0\
+\x77\x29\xb2\x84\x88\x8d\x8b\x80\x27\x02\x8b\xf7\x3a\xa3\xfa\x2b\
+\x78\x5f\x3c\xe3\x55\x2c\x81\x00\x73\x10\x71\x29\x07\x02\x7c\x58\
+\xda\x28\x5a\x62\xf6\x00\xd8\x02\x18\x19\x73\x21\xe5\x5e\x39\x5c\
+\x3d\xe3\x83\xc5\x44\x59\xd4\xcf\x55\xea\x20\x65\x20\x70\xf4\x3c\
+\x39\x65\x0d\x28\xbb\x2a\x7a\x3e\xb6\x05\x40\x88\x18\x59\x8b\x79\
+\xa8\x54\xa9\xe3\xbe\xdb\x55\x68\xc3\x40\x53\xfa\xe7\x98\x3e\x57\
+\x22\xae\xda\xbd\xa6\x1c\x07\xe0\x09\x60\xb9\xea\x47\x94\xcf\x18\
+\xd1\xe2\xf6\x68\x60\x6c\x6f\x03\xc0\xd4\x58\xee\x6c\xbc\x2a\x55\
+\xa5\x67\xbc\x45\xf3\xb0\x6c\x0d\x00\x31\xb7\x81\x94\x56\x46\x52\
+\x39\x36\xf5\x60\x82\x2e\x05\xce\x62\xe0\xdf\xea\x52\x44\xe4\x5c\
+\x59\xd4\x55\xdf\x42\x5e\xc1\xfb\xea\x3f\x36\xe7\x40\x80\xb9\x8b\
+\xfc\x81\x98\x83\xe5\x6d\x4f\x95\xf9\xaa\x1f\x51\x3e\x63\x64\xde\
+\xed\xd3\x7a\x1b\x00\xa6\xc5\x72\x57\x13\x10\x55\x90\xfb\x7f\x3c\
+\x3c\x86\x65\x64\x48\xb1\xb3\xd2\x64\x2a\xce\x63\x43\x4f\xc4\x5d\
+\x5f\xa3\xac\xe8\x39\x17\xa5\xfd\x13\xf1\xb3\x81\xce\xbc\x00\x7c\
+\xb6\x9d\x10\xd7\xd0\x6a\x7f\x3e\x63\x61\x93\x44\xfe\x40\x0c\x07\
+\x76\x48\xb8\x0f\x4a\x79\x1b\x40\xce\x8c\x8f\xeb\x76\xa6\x46\x67\
+\x00\x18\x8d\x7b\xcb\x5b\xd3\xac\x51\x32\x00\xc4\xc5\x55\x09\xd5\
+\x9d\x3a\x0d\x04\x4d\x98\xd8\x85\x16\xef\xb9\x78\x05\x2c\xc4\x52\
+\xff\x09\x91\x02\x57\xd3\xbe\x17\x80\x56\xfb\xe5\xce\x5f\x87\xc0\
+\x6f\xba\xc8\x1f\x8c\x9d\x13\xee\x7f\x1e\xc9\xf0\xfb\xc8\xa1\xce\
+\x0d\x27\x92\x7d\xf6\xbd\x34\x7f\x54\x5b\x00\x26\x24\xfe\x05\xd7\
+\xcd\x7c\xe0\x71\xcd\xbf\xa2\xe2\xdf\x99\x0d\xba\xb1\x4e\x6e\xb4\
+\x6d\xa0\xfe\xf3\x7c\xed\x63\xbe\x04\xd8\xa8\xae\x44\x24\xc2\x06\
+\xe0\xd2\x80\xed\x23\xa5\xfe\x22\xd6\x63\x73\x10\xf8\x29\x04\x02\
+\x4c\x65\x3e\xbe\x63\xc2\xfd\xcf\xc3\x19\x7e\x1f\xb9\xd4\xb9\xd8\
+\x02\x01\x46\x65\x00\x18\xdf\xe0\x8a\xe1\x02\xa5\xff\x8b\x8f\x9b\
+\x80\x95\x0d\xea\x70\x43\x4e\x8e\xe4\x15\x10\xee\xfb\xa9\x4b\xbc\
+\xac\x04\xae\x51\x37\x22\x12\xe3\xaa\x41\xfa\xfd\x50\x46\xb4\xd8\
+\xce\x93\x3b\x7f\x1c\x63\xab\xe6\xd5\x32\x00\x48\xe4\x87\x27\xb6\
+\x54\x80\x3d\x06\x80\x49\x2a\x9c\xf4\x1b\xcd\x9d\x9a\x77\x45\xc7\
+\x7a\xcc\x25\xb4\x29\x03\x67\xaa\x13\x26\x6d\x1b\xf0\x73\x5e\x55\
+\x51\x71\x05\x16\x5d\x5d\x88\x94\x58\x8b\x05\x04\x74\x25\xac\xb5\
+\xda\x9f\xff\xb8\xa0\x4c\x00\xf1\xb0\x3d\xe9\x06\x02\x7c\x58\x22\
+\x3f\x5a\x22\xd2\xb8\x13\x7b\x1b\x00\xb6\x88\xe1\x8e\xc6\x23\xaa\
+\x70\x87\x8a\x20\x4a\x2e\xc8\xfc\xf9\x52\x5d\x05\x69\xf2\xb6\x81\
+\xd0\x86\x85\x32\xc2\x66\x3d\xf0\x4f\x75\x1f\x22\x51\x2e\xe7\xa9\
+\x81\x2b\x95\xaa\x2f\xdd\xbe\x58\xc6\x82\xe6\x08\xc7\x61\xc0\x36\
+\x89\x3e\xd3\x72\xe2\x4e\x05\xd8\x64\x22\xd2\xb8\x5b\xf4\x36\x00\
+\x44\x61\x98\x18\x97\x71\x87\xe2\x9b\x35\xc0\x83\x6a\x5f\x51\x72\
+\xa5\xe7\x0e\x39\x75\x0b\x6f\x4b\xd7\x0a\x7e\x6c\x0a\xc1\x04\x6f\
+\x06\x96\xa9\xfb\x10\x89\xf2\x04\xe5\xd2\xf2\x2a\x78\x9f\xc6\x03\
+\xcd\x73\xeb\xbf\x57\xc5\x01\x50\x9d\xcb\x58\xe3\x3e\xc9\x00\x30\
+\x31\x86\x3b\x1a\x93\xf9\x84\xc0\x67\x05\xbe\x07\xa5\xc9\x8a\x95\
+\x75\xc0\x65\x99\xd5\xb9\x98\x56\xfd\x95\x8e\xd0\xaf\x78\x0f\x2d\
+\x58\x7a\x7e\xbf\x52\x5d\x87\x48\x9c\x2b\x3d\xb7\x91\x18\xfb\x80\
+\x54\xfb\xcd\x54\xf7\xfe\x2b\x15\xa0\x1f\x52\x36\x00\x3c\x92\xe8\
+\x7d\xe7\x5e\xe7\x46\x47\x6a\x00\xd8\x42\x85\x93\x36\xda\xff\x1f\
+\x37\xe7\xab\xb3\x8d\x76\x02\x95\xc3\x84\x33\xb4\x78\xf7\x2d\x62\
+\x16\x02\xf7\xaa\xdb\x10\x89\x73\x77\x51\x97\x5d\xb7\xbf\x98\xdb\
+\xbb\xdc\xf9\xe3\x10\xf0\x4d\x12\x5c\x3e\x9e\x63\x76\xc2\xe5\xf1\
+\xa8\xba\xde\x28\x89\x68\x91\xfb\x49\x31\x00\xa2\xf0\x00\x68\xb2\
+\x01\xa0\x6a\x07\x76\x97\xda\x56\xd4\x5c\x0f\x3c\x96\x78\x7d\x8c\
+\x69\x22\x23\x37\xd1\x74\x0c\x04\x65\xca\xe4\x4a\xb4\xcf\x55\xa4\
+\x4f\x8b\x72\x41\x60\x15\xbc\xaf\x99\xd7\xf2\x61\x4c\x90\xc8\x2f\
+\xc7\x0e\x09\x97\xdd\x63\xfa\x1e\x65\x00\x18\x98\x2d\x7a\x1b\x00\
+\xb6\x88\xb9\x70\x9a\xee\x8a\xd4\xce\xf3\xcb\x03\x20\xfe\x89\xe0\
+\xc5\x2a\x83\x2c\x27\x78\xda\x36\xe0\xee\xbc\x56\xf1\xba\x56\x5d\
+\x86\xc8\x84\x6b\x7a\xd5\xeb\x18\xda\x58\x0e\x02\x5f\x63\x49\x73\
+\xe7\xba\xa1\x18\x4b\x91\x2c\x3d\x41\x1e\xd5\xf7\x18\xe5\xf3\xc7\
+\xb8\x05\x60\x28\x91\x18\x26\xb4\x05\xa0\x1c\x8b\x18\xd8\xcd\x50\
+\xc4\xc1\x79\x19\x76\x98\xb9\xae\xfa\x2b\x1d\x61\xfb\x82\xdd\xf5\
+\x79\xf7\x62\x01\xd4\x84\xc8\x81\x25\xc0\xdc\x1a\xdb\x53\xee\xfd\
+\x51\xae\xc6\x82\x98\x3e\xab\xa9\xe2\x30\xd5\x38\x00\x0b\xd4\xed\
+\x46\x49\x44\x1a\x77\x3c\xd0\xdd\x5d\x58\x02\xba\x52\x2d\x1c\x59\
+\x9a\xe4\xfe\x9f\x0a\x77\x03\xb7\x37\xac\x8e\xc7\xee\x1e\x19\xc3\
+\x73\xe5\x16\x57\xa0\xea\x67\xdc\xa8\xae\x42\x64\xc6\x8d\x91\xb7\
+\xb9\x98\xfb\x9e\x5c\x8d\x05\xb9\x0a\xfc\x9c\xe6\xe5\x3b\x24\x7a\
+\xdf\x8f\x07\xa8\x3f\xd2\x5e\x49\x1b\x00\xba\x81\xf1\x3d\x06\x80\
+\x28\x18\xad\x0a\x5a\x0a\xb9\xff\xa7\xc3\x1f\x55\x04\x8d\x98\x70\
+\x35\x39\xae\x40\x95\xcf\xd8\x08\xdc\xa4\x66\x21\x32\xe3\x86\xa2\
+\x6e\xd7\xdd\xbe\xd4\xff\x35\x73\x6c\x13\xe5\x48\xd5\x03\x60\x2d\
+\xe6\x79\x24\x0d\x15\xd7\xf3\x47\x96\xe9\x6e\x62\x37\x91\x04\x00\
+\xec\x06\x46\xa9\xbf\x29\xc5\x3d\x2a\x82\x64\xb8\xc8\x51\xc7\x5c\
+\x67\x07\x9d\x92\x68\x57\x3a\xc2\xb4\x0c\x04\xf7\x01\xcb\xd5\x4d\
+\x88\xcc\x58\x86\xff\x6d\x00\xa9\xf6\x13\x4a\xbf\x97\xa6\x31\xa1\
+\x09\xe2\x70\x56\xc2\xf7\xbe\x40\xdf\x63\x74\x8c\x8e\xab\xbc\xb7\
+\x88\xc6\x03\x20\x74\xc1\xe4\x54\xe9\xef\x57\xbb\x4a\x86\x75\xc0\
+\x5f\x1b\x5e\xc7\x5b\x0d\xbd\x17\x6d\x1b\x18\x9c\xdb\xd4\x45\x88\
+\x4c\xb9\xad\xe6\x76\x1e\x43\x9f\x90\x6b\x7f\x9c\xd3\xbd\x34\x4d\
+\x1c\x0e\xf4\x8c\xd3\x80\xe1\x89\x3e\x97\x52\x01\xc6\x57\xc7\xbb\
+\x88\x6a\xa1\x7b\x8b\x6e\x60\x42\x0c\x77\x32\xaa\xa1\x15\xa2\x2a\
+\x0b\x51\xc0\xac\xd4\xf8\x33\xb0\x5e\x75\x3c\xc8\xe4\x34\xa5\x7b\
+\xd1\xb6\x01\xb8\x43\xdd\x83\xc8\x94\x3b\x06\xa8\xf7\x75\xb6\xc3\
+\x5c\xaf\x25\x77\x7f\x89\xfc\xaa\xcf\xd8\x05\x4c\x4f\xf4\x99\x1f\
+\x6b\xd8\x77\x9c\x4a\x1d\x8f\x29\x13\x40\x37\x91\x6c\x4b\x18\x83\
+\x28\xc3\xbd\x2a\x82\xe4\x58\x08\x5c\x96\x58\x67\x99\xd2\x04\xa7\
+\xa9\x71\x05\x52\x77\x07\x5e\x82\xa2\x17\x8b\x7c\x99\x0f\x2c\xcd\
+\xb8\xfd\xc6\x6c\x2c\xc8\x49\xc0\x97\xb9\x57\xb9\x79\x97\x67\x9b\
+\x44\xef\x5b\x63\x69\x9c\x44\x64\x00\x18\x13\xcd\xd6\xfb\x54\xf6\
+\xff\xc7\xd6\x91\xde\xaf\xf6\x94\x24\x7f\x6c\xd8\xf3\xca\x80\x90\
+\xd6\x84\xba\x8e\xcf\xbd\x5d\xdd\x82\xc8\xbc\x0f\xbc\x33\xe2\xf6\
+\x97\x73\xdf\x26\x03\x75\xfe\xf8\x9a\x9b\xcf\x48\xb4\x3c\x16\xea\
+\xfb\x97\x01\x60\x90\x5b\x89\xc6\x03\x60\x38\x42\x06\x80\xe6\x70\
+\x13\x72\x77\x6e\xea\x04\x2f\xd6\xcf\xaa\x7b\x0f\xf1\xdd\xaa\xe6\
+\x22\x73\xee\x8a\xa4\xad\x35\xb9\x9f\x93\x80\x97\xc8\xeb\x84\x54\
+\x3d\x00\x16\xaa\xba\x44\x49\x44\x5a\x77\x54\x37\x91\x18\x24\x46\
+\xa8\x73\x2a\xc5\x7d\x6a\x4f\xc9\xf2\xe3\xcc\x45\xb9\x0c\x08\xf5\
+\xdf\x4b\x4a\xd7\x9a\xab\x2e\x41\x64\xce\xfd\x6a\xef\x8d\xea\x7f\
+\x35\x06\xa7\x4f\xaa\x1e\x00\x8b\x32\xfc\x2e\x72\xd8\xca\x12\x91\
+\x01\x60\x74\x34\x5b\x00\xe4\x01\xd0\x39\x2b\xd1\x3e\x9f\x94\xf9\
+\x17\x79\xbb\x3d\x37\x69\xa2\xa5\xb8\x02\xd5\xee\x6b\x11\x03\xef\
+\x8f\x16\x22\x07\x96\x50\x2d\x0d\xac\xf6\xeb\x6b\x5c\xc9\x9d\xd8\
+\x44\x5e\xaa\x1e\x00\x4f\x60\x59\xa7\x84\x0c\x00\xfd\x10\x8f\x07\
+\x40\xee\x06\x00\x1f\x9d\xda\x5c\x64\x01\x4e\x9d\x9f\xa0\x00\x3d\
+\x9a\xe8\xa5\x5b\x6e\xae\x04\x89\x56\xff\x45\x53\xb8\x3f\x90\xc0\
+\x4f\xb5\xaf\x95\x80\x97\xc8\x8f\x89\x71\xc0\xf8\x44\xe7\x4f\x8b\
+\x55\x37\xa2\x23\x22\x6f\x77\x79\x00\xa4\x8c\xdc\xff\xd3\x27\x77\
+\x2f\x00\x4d\xce\x9a\x3d\x01\x6f\xf7\x5a\x32\x00\x88\xa6\x30\x37\
+\xe2\x76\xa8\x7e\x57\x02\x5e\x3c\x95\x54\xbd\x00\x16\xe9\xab\x8b\
+\x8e\xd8\xb6\x00\x28\x06\x40\xcd\x94\xb5\x78\xcd\x53\x5b\xca\x82\
+\x33\x3d\xd4\x0d\x4d\x98\x34\x91\xad\x4b\x4c\x94\x59\xc5\x7c\x48\
+\xdd\x80\x68\x08\x0f\x55\x68\x27\xa9\xb5\x6f\xf5\xd1\xcd\x7d\xd6\
+\x9c\x56\x72\x15\x08\x50\x75\x43\x06\x00\x8f\x0c\xd3\xbc\xa0\x63\
+\x1e\x50\x11\x64\xc1\x95\xc0\x6d\x0d\xe9\x44\x35\x61\x4b\x73\x22\
+\xed\xf3\xb3\x5a\x28\x96\x89\x68\x0e\xf3\xfb\x69\x03\x39\xb6\x75\
+\x8d\x07\x79\x3f\x6b\x53\x84\x9c\x0c\x00\x22\x43\x03\x80\xb2\x00\
+\xa4\x8c\x56\xcd\xf2\xe1\x4c\x15\x41\x90\x49\x94\xf6\x97\xc6\x77\
+\x2f\x8b\x80\xd5\xaa\xda\xa2\x21\xac\xc6\x6f\x20\x40\xb9\xfb\x6b\
+\x6c\x11\x6e\x99\x9e\xe8\x7d\x6b\x0b\x80\x0c\x00\x03\xa0\x18\x00\
+\xb1\xd3\x9f\x85\x75\x29\xb0\x4c\xc5\x93\x0d\x57\x15\x2f\xdf\xf5\
+\x46\x68\x42\x1b\x9b\x50\x78\x44\xd5\x4e\x34\x8c\x47\x24\xe0\xf5\
+\x2c\x89\xcf\x41\x9b\xc4\x96\x89\xde\xf7\x42\xd5\x1b\x19\x00\x06\
+\x31\x00\x28\x0b\x40\x82\x3c\xa8\x22\xc8\x8e\x6f\x02\xeb\x55\x0c\
+\x32\x20\x34\xec\x59\xe4\xfe\x2f\x9a\xc6\x82\xc4\xda\xa8\xfa\x4e\
+\xd1\x64\x26\x27\x7a\xdf\xf2\x00\x88\x0f\x65\x01\x90\x01\x40\x06\
+\x00\xf1\x14\xe6\x01\x7f\x0c\xf0\x39\x9d\x5a\x66\x35\x31\xd3\x24\
+\xd8\xc7\xb3\x68\x92\x22\x9a\xca\x22\xc7\x6d\x48\x7d\x97\xc6\x89\
+\x2a\x65\xad\xd5\xda\x81\xcb\x66\x12\x30\x34\xc1\x7b\x5f\x1a\xd9\
+\x5c\x52\xc4\xe7\x01\x30\x2c\xe6\x42\x51\x05\xeb\x1b\xed\xff\xcf\
+\x93\x1f\x65\x28\x88\xb4\xb7\x52\x93\xf0\x81\xee\x45\x06\x00\xd1\
+\x54\x03\x80\x02\xf2\xa9\x1f\x56\x59\xa7\x63\x04\x90\x01\x40\x74\
+\x52\x67\x22\x37\x00\x0c\xeb\x26\x12\xc3\xd6\x50\xd5\x97\x8e\x90\
+\x07\x40\x9e\xac\x04\x7e\x18\x61\xa7\xa5\xc9\x96\x26\xae\xbe\xca\
+\x6a\xb1\x8a\x5d\x34\xd4\x00\x20\x01\xaf\x31\x43\x63\x7b\x1a\x65\
+\x33\x25\xc1\xe7\x5a\x06\x6c\xd0\xd7\x1b\x15\x43\x22\xba\x95\xee\
+\x58\xee\xa7\x5b\xf5\xa2\x23\xe4\x01\x90\x2f\x67\x03\x77\xa8\x18\
+\x34\x59\x6c\x40\x59\x6d\x44\xab\x14\xa2\x79\x2c\xa1\xf3\x54\x80\
+\xea\x47\x54\x56\xa2\x3e\xa6\x24\xda\x8e\xaa\x06\x0b\x97\xe1\x28\
+\x5b\xad\x3b\x54\x06\x80\x04\x59\x8d\xf2\x7b\xe6\x3e\xf9\xf9\xba\
+\x26\x31\x9a\xec\x36\x60\x32\xab\x15\x0a\xd1\x44\x36\x90\x77\x16\
+\x1f\x09\x74\x21\x03\x40\x1c\xc8\xc0\x2e\x03\x40\x3f\x0c\x89\x66\
+\x0b\x80\x0c\x00\xed\xf3\x90\x06\xd0\xec\xb9\x05\x38\x47\xc5\x20\
+\x02\x4c\xb6\xeb\xec\x4b\x56\xea\xeb\x13\x0d\xa5\xce\xba\xaf\x15\
+\x76\xd1\x34\xaa\xae\x64\xa7\x9a\x09\x40\x06\x00\x19\x00\x06\x32\
+\x00\x24\xeb\x01\xd0\x54\xd7\x14\xe5\xcd\x6e\x06\xdf\x04\x1e\x55\
+\x31\x88\x9a\xf1\x29\x06\x56\xa8\x78\x45\x43\x59\x11\x69\x9b\x14\
+\x42\x3c\x15\x79\x00\x08\x17\x1a\x54\x06\x00\x89\xf9\x4a\x28\x6f\
+\x76\x33\x58\x09\x7c\x56\x93\x39\x91\x38\x2d\x19\x00\x84\xe8\xb3\
+\x7f\x97\x80\x17\x42\x06\x00\x19\x00\x9a\x83\x62\x00\xf4\xc1\x10\
+\xd5\x0b\x19\x00\xc4\x53\xb8\x86\x38\xb7\x02\x68\x05\x4a\xf8\x16\
+\x41\x42\xe4\x8c\x8c\x5f\x42\x63\xad\x0c\x00\x31\x18\x00\xb4\x00\
+\xdb\x48\xad\xab\x2c\x00\x32\x00\x88\xd8\xf9\x06\xf9\x6d\x05\xd0\
+\xa4\x46\x00\xac\x51\x11\x08\xd5\x7d\x21\x01\x2f\x22\x67\x8b\x8c\
+\x0d\x00\xa2\x91\x5a\x57\x06\x00\x19\x00\x44\xec\x68\x2b\x80\x26\
+\x4d\xb9\xb2\x5e\x45\x20\x54\xf7\x85\xc6\x22\xe1\x00\x9f\x2b\xd9\
+\xc3\x89\x24\x62\x7a\x87\x2c\x53\xb5\x90\x01\x40\x06\x80\x3c\xd8\
+\x80\x52\x00\x36\x91\x6b\x80\xbf\xa9\x18\x9c\x4d\xca\x34\x69\x8b\
+\xa7\x3f\x13\x42\x75\x5f\x68\xac\x10\xb1\x33\x36\xc1\x7b\x5e\xae\
+\xaf\x4d\x06\x80\xbe\x19\x2a\x03\x40\x62\x3c\x06\x6c\x54\x31\x34\
+\x92\x6f\xa0\x0c\x10\x9a\x14\x4a\x04\x09\x91\x03\xf2\x00\x50\x5f\
+\x2d\xd2\x62\x8c\x0c\x00\x22\x1f\xad\x2b\x0f\x80\xd4\x98\xaf\x22\
+\x68\x2c\x2b\x80\x8f\x02\xeb\x54\x14\x42\x06\x00\x21\x54\xf7\x85\
+\x10\x32\x00\xc8\x00\x20\x03\x40\x49\x03\x80\x48\x08\xed\xff\x6f\
+\x36\x77\x00\xdf\x56\x31\x08\x21\x84\x10\x42\xc8\x00\x30\x00\xca\
+\x36\x22\xfa\xa3\x9b\x48\x0c\xd1\x72\x6b\x97\x01\x40\xb4\xc7\xef\
+\x81\x4b\x54\x0c\x22\x03\x94\xfe\x55\xa8\xee\x0b\x21\x64\x00\xf0\
+\xc3\x4a\xe9\xab\xa8\x88\xe8\xbb\xd8\x20\x03\x40\x62\x3c\xa6\x22\
+\x10\x58\x56\x80\x87\x55\x0c\xde\xe8\xaa\xf8\xbe\x90\x08\x12\x62\
+\x20\x86\xaa\x08\xd4\x57\x8b\xa4\x48\x31\x08\x60\xab\x30\x02\x08\
+\x19\x00\x64\x00\x48\x9c\xc7\x55\x04\x02\x73\xeb\xfa\x10\xca\x25\
+\xad\x49\xa1\x0c\x00\x42\xa8\xee\x0b\x8d\x15\xc2\x37\x63\x12\xbd\
+\x6f\xc5\x01\x90\x01\xa0\x0f\xd6\xcb\x00\x90\x18\x8b\x54\x04\xa2\
+\xe0\x1e\xe0\x5b\x9a\xb4\x89\x84\xd1\x2a\xa8\x50\xdd\x17\x1a\x8b\
+\x84\x0b\x7c\x67\x7c\x18\x9d\x68\xb9\x28\x0e\x80\x0c\x00\x7d\x20\
+\x0f\x80\xd4\x3a\xb7\x25\x2a\x06\xd1\x8b\x3f\x02\xe7\x65\x38\x69\
+\xd2\xa4\xaa\x19\x8c\x54\x11\x08\xd5\x7d\xd1\x60\x03\x81\xc6\xba\
+\x74\x48\xd5\x00\x20\x0f\x00\x19\x00\xa2\x36\x00\x28\x25\xce\xe0\
+\x2c\x45\xb9\x83\xc5\x53\xf9\x2c\x70\x8b\x26\x35\x42\x13\x2a\x21\
+\x92\x61\x8c\x8a\x40\x68\xac\x4d\x8a\x54\xb7\xed\x0c\xe6\x01\xd0\
+\xd2\x57\xdb\x44\xad\x1b\x8f\x01\x40\x15\x70\x70\x16\xaa\x08\x44\
+\x1f\xac\x05\xde\x8f\x82\x02\x8a\xf4\x26\xb0\x32\x00\x88\xa6\x32\
+\x5a\xa2\x4e\x88\x6c\xc6\xb2\x98\x51\x10\xc0\x78\x50\x0c\x00\x47\
+\x85\xd2\x34\xa3\x81\xf6\xff\x8b\xfe\x58\x5a\x18\x01\xe4\xea\x25\
+\x42\x4f\x7a\xaa\x4c\x8a\xb4\x0a\x2a\x9a\xca\x98\x48\xdb\xa4\x10\
+\x22\xaf\x76\xb5\x5a\x5f\x9d\x17\xca\x68\xd0\xd8\xb6\x00\x44\xe1\
+\x55\xae\x18\x00\x32\x00\x88\x6a\xdc\x0f\x7c\x14\x6d\xa7\xd1\xa4\
+\x24\x1d\xb1\x20\x0f\x00\xd1\x54\x46\xa9\xcf\x10\x22\x6a\xb1\x96\
+\x0b\x32\x00\xc4\x83\x62\x00\xc8\x00\x50\x0a\x6d\x01\x10\x83\xf1\
+\x6f\xe0\x4b\x2a\x86\x46\x09\xf8\x94\x19\x87\xd2\xa1\x89\xe6\x31\
+\xa4\xa8\xfb\xea\xd3\x84\x48\x87\x6e\x19\x00\x84\x0c\x00\x32\x00\
+\xd4\x81\x3c\x00\x44\x3b\xfc\x15\xf8\xbd\x8a\x21\x9a\xc9\x6c\x97\
+\xca\xaa\xdf\xf7\xbb\x81\x09\xaa\x62\xa2\x61\x4c\xec\xa3\x2d\xa8\
+\x1f\x51\x9f\x2b\xd2\xae\x97\x39\x1a\x00\x14\x9f\x2d\x5b\xad\xbb\
+\x3e\x9a\x2d\x00\x8a\x6e\x2f\x03\x80\x70\xc7\xd7\x80\x7f\x36\xa4\
+\xb3\xd7\x64\x31\x9e\xb2\x2c\xc3\x24\x15\xbb\x68\xa0\x01\x20\x87\
+\xb6\xdb\xd4\x7e\x2e\xc5\xb2\x94\x90\x6b\x6e\xd9\xc8\x03\x20\x1e\
+\x62\xcb\x02\xb0\x2e\x86\x3b\x59\xab\x4e\x6b\x50\x96\xaa\x08\x44\
+\x9b\x6c\x04\x3e\x02\x5c\xaf\xc9\x96\x26\xb6\x91\x96\x65\x97\x47\
+\x31\x24\x44\xcc\x4c\x8a\xb8\x3d\xaa\x1f\xd6\x98\x27\xfa\x46\x5b\
+\x00\x44\xbb\xb4\x3a\xd4\xba\x35\xb0\xae\x1b\x58\x15\xc5\x9d\xa8\
+\xbe\x0c\xca\x13\x2a\x02\xd1\x01\x6b\x80\xf7\x01\xb7\xb7\xd9\x31\
+\x69\xb2\xa2\x49\x78\xc8\x67\xd9\x5c\x0c\x09\xd1\x34\x03\x00\x0d\
+\x6a\xef\x1a\x27\xe2\x2d\x6b\x2d\xb4\xb5\x57\x36\xa9\xd6\xe1\x55\
+\x01\xca\x46\xb4\x47\x44\x06\x80\x95\xdd\x44\x92\x22\x72\x8d\xea\
+\xc5\xa0\x2c\x53\x11\x88\x4e\x5b\x38\xf0\x4e\xe0\x2e\x15\x85\x26\
+\xc1\x91\x3e\xcb\x56\xaa\x36\xa2\x61\x6c\x95\x58\x1b\x55\xdf\x29\
+\x44\x54\xe2\xad\x23\xe4\x01\x10\x0f\x11\x69\xdd\x78\x0c\x00\x6b\
+\x55\x2f\xfa\xa4\xc7\xc2\xb6\x0a\x79\x49\x88\x72\x2c\x07\xfe\x1b\
+\x98\xa7\xa2\xd0\x84\xba\xa6\x67\x19\xe8\xb3\xb6\x56\xb5\x13\x0d\
+\x63\xeb\x04\xda\xa5\xfa\x3b\xd1\x7b\x0e\x2a\xd2\x15\xd2\x6b\x54\
+\x6f\xa2\x41\x1e\x00\x32\x00\x74\x8c\x56\xff\x45\x15\x16\x03\xef\
+\x00\xe6\x37\x5c\xa0\x6b\x42\x1b\xdf\xbd\x4c\x04\x46\xaa\x89\x8a\
+\x86\x30\x8a\x6a\x99\x2f\x9a\xd2\x2f\x68\x6c\x11\x32\x00\xb8\x61\
+\x95\xbe\xba\x68\x90\x07\x80\x0c\x00\x1d\xa3\xfd\xff\xa2\x2a\x8f\
+\x15\x46\x80\x85\x12\xb5\x7a\xd6\x88\x44\x43\x17\x30\x4d\xcd\x53\
+\x34\x84\xad\xe8\x3c\x05\x60\xaa\x6d\x5d\xe3\x41\xde\xcf\xda\xb4\
+\x55\xde\x54\x85\xb4\xbc\x87\xf5\x5d\xf4\x55\x9d\xa3\x09\x02\xd8\
+\x64\x03\x40\x3b\x9d\xa8\x3c\x00\x84\x0b\x1e\x02\xde\x05\x2c\xd1\
+\x24\xa6\x51\x02\xbe\x2b\xd2\xcf\xea\x39\x76\x86\x9a\xa6\x68\x08\
+\xd3\x2b\xb4\x93\xd4\xda\xb7\xfa\xe8\xe6\x3e\x6b\x8e\xc6\x81\xe5\
+\x12\x9d\xaa\x1b\xf9\x68\x5d\x05\x01\x4c\x05\x79\x00\x08\x57\xdc\
+\x0b\xbc\x19\xf3\x08\xc8\x19\x4d\x64\xfd\xdc\x8b\x8f\x6b\xcd\x52\
+\xb3\x14\x0d\x61\x56\xc4\xed\x50\xfd\x6e\xbe\x06\x04\x51\x9d\x25\
+\x32\x00\x08\x19\x00\xb2\x2e\x14\x2f\x54\xb5\x78\xc9\x00\x20\x5c\
+\x32\x0f\xf8\x4f\xcc\x23\x40\x02\x3e\x2d\x51\x1d\x53\xb9\xb9\x5a\
+\xc5\x9c\xa9\x26\x29\x64\x00\x70\xea\x15\x90\x6a\x5f\xab\x38\x2d\
+\xf9\x93\xea\x0a\xb0\x0c\x00\xaa\x1b\x55\x89\x2d\x06\x80\xb6\x00\
+\x24\x80\xb6\x00\x08\xd7\xcc\xc7\x3c\x01\xee\xd3\xe4\xa8\xb1\x13\
+\x64\x1f\xee\xfc\x65\x98\x48\xb5\xc0\x68\x42\xa4\x40\xd5\x7a\x9e\
+\xea\xb6\x01\x8d\x2b\x32\x20\xe4\x20\x00\x97\xca\x00\x20\xf2\xd1\
+\xba\xab\xe4\x01\x90\x48\xc7\xb5\x5c\xed\x46\x78\x60\x21\xf0\x36\
+\xe0\xee\xc8\x27\x7d\x4d\x12\xf0\xb1\x4e\xcc\x7d\x5f\x6b\x96\x9a\
+\xa3\xc8\x9c\x59\x6a\xef\x32\x20\x44\xfa\x1d\x89\x81\xd9\x08\x3c\
+\x9e\xe8\xbd\x6f\x20\x8f\x95\xf5\x1c\x9e\x41\x5b\x00\xfa\x40\x31\
+\x00\x06\xf9\xa6\x54\x04\xc2\x13\x8b\x81\xb7\x00\xb7\x48\xc0\x27\
+\x37\x29\x8b\xd1\x9d\xbf\xec\xb5\x66\xab\x29\x8a\xcc\xd9\x29\x92\
+\xb6\xd6\xe4\x7e\x4e\x06\x04\x09\xc0\x32\x3c\x0a\xac\x4f\xb8\xec\
+\xe4\x05\x20\x03\xc0\x66\xac\x1a\x4a\x24\x5b\x00\x52\x11\xb8\xad\
+\x9a\x3a\x78\xe5\xf1\x14\x3e\x59\x0e\xbc\x1d\xf8\x24\x70\xa0\xa7\
+\x49\x53\xab\xc2\xfb\xa1\x27\x78\xa1\xee\x35\xa6\xcf\xaa\xfb\x73\
+\xe7\xa8\x19\x8a\x8c\xe9\x02\x76\x8e\x5c\xa8\xa7\xba\xea\xaf\xc0\
+\x83\xe5\xe7\x95\x8b\xb1\xfc\xf6\xab\x8b\x79\xf8\x4a\x6c\x41\x6e\
+\x55\x3f\xa2\x7b\x28\x30\x0a\x18\x0b\x8c\x2c\x7e\xef\xf9\x7b\x6c\
+\x8d\x65\xed\x7b\xfe\xf0\x48\xe2\xfd\xcf\x7a\x60\x78\xc6\xfd\x6b\
+\x2a\xde\x01\x2b\xe2\xb9\x95\x95\x43\x89\xc4\xbb\x5c\x2b\xdc\x03\
+\xb3\x5a\x45\x20\x02\xd4\xb1\xf7\x01\xff\x81\xad\xc6\x6e\x83\xa5\
+\x67\x1b\x2e\x01\x1f\x44\x74\x87\x7c\xae\x18\x0d\x0b\x13\x80\x69\
+\xc0\x02\x35\x45\x91\x21\x5b\x03\xe3\x13\x14\xea\xb1\x8a\xfa\x5c\
+\x45\xb9\xab\x7b\x5d\x0b\x3c\x58\xbc\x1e\xc0\x56\xb0\x1f\x2f\x04\
+\xff\x22\x6c\xfb\x9f\xeb\x79\xe5\x50\x2c\xce\xc5\x96\xbd\x7e\x4e\
+\xc2\x52\x5f\xce\x28\xe6\x14\x63\x12\x6d\xbf\x0f\x27\xde\xff\xc8\
+\x03\x20\x0e\x22\x5a\xcc\x5d\x31\x94\x48\x02\x5b\xc6\x64\x00\xa8\
+\x6b\x95\x3f\x91\x4a\x23\x32\x66\x0d\xf0\x83\x5e\x7f\x77\x03\x53\
+\x8b\xc1\x7b\x16\xe6\xc2\xba\x53\xf1\xfb\x50\x09\xf8\xda\x84\x74\
+\x8a\x02\x7f\xa0\x63\x7b\x7e\x9f\x23\x03\x80\xc8\x94\x5d\xfa\x10\
+\x70\xbe\x44\xbf\xe2\x0a\x34\xc7\x80\xb0\x0e\xb8\x1f\xb8\xab\x78\
+\xcd\x2d\x44\xff\xa3\x84\x37\xca\xaf\xc7\xd2\x0b\x0f\x94\x62\x78\
+\x22\xb0\x6d\x31\xa7\xd8\x1e\xf3\x8a\x99\x8d\x79\x11\xf8\x9c\xd3\
+\x57\xe5\x6e\xd2\x66\x3d\xcd\x25\x26\xef\x80\x88\xe2\xb9\x2d\x8e\
+\xca\x00\x10\x52\x78\xc7\x28\xf2\x65\x00\x10\xb1\xb1\x11\xcb\x16\
+\x30\x1f\xb8\xa6\xd7\xff\x87\x15\x83\xf7\x4e\xc5\xc4\x76\x6f\x60\
+\xbb\x1a\xc4\x69\x4c\x42\x39\x55\x51\x1e\x42\xe0\xb7\xcb\x1c\xe0\
+\x62\x35\x3b\x91\x21\xbb\x7a\x16\xcc\x8a\x2b\x10\xef\x67\xb9\xbc\
+\x97\xb9\xc0\x0d\xc0\xed\x85\xe0\xbf\x9f\xb4\x56\x77\x17\x17\xaf\
+\x1b\x37\x7b\xfe\x6d\x0b\x63\xc0\x4e\x45\x5b\xd9\x05\x18\x12\x91\
+\x38\x4c\xdd\x00\x20\x0f\x80\xfa\x8d\x03\x1b\x89\x2a\xde\xdd\x92\
+\x68\x0c\x00\xad\x42\xe4\x8e\x56\x7d\xec\x13\x6d\x01\x10\xb1\x0d\
+\x26\x77\x16\xaf\xb3\x8a\xff\x6d\x01\xec\x55\x18\x03\xf6\x02\x76\
+\x88\x40\x54\xa7\xea\x82\x9f\xba\x3b\xff\x40\xc7\x0e\x74\xde\x0e\
+\x98\x9b\xf4\x13\x6a\x62\x22\x23\xc6\x03\x33\xdb\x14\x80\xb9\x79\
+\x05\x74\x45\x7a\xad\x98\x3e\x6b\xa0\x79\xf1\xbd\x85\x58\xbe\xa1\
+\xf8\xb9\x24\xc3\xf6\xd1\x02\xe6\x15\xaf\xf3\x8a\xff\x8d\x02\xf6\
+\x28\xe6\x13\x7b\x17\xc6\x81\xee\x9a\xc4\xe1\x5a\xcc\xd0\x92\x32\
+\x1b\x23\x10\xc0\x4d\x67\x65\x5c\xe5\xbd\x64\x28\x66\x8c\x8b\xa6\
+\x70\x46\x3b\x6e\xbc\xb9\x44\x64\x95\x07\x80\x88\x9d\x25\xc0\x25\
+\xc5\xab\xc7\x20\x70\x10\x70\x08\x70\x40\x3f\x6d\xbb\xa9\xfb\xf5\
+\x53\xb8\x96\x0f\x81\x3f\xd8\x67\x74\x15\x93\xbe\x2b\xd4\x9c\x44\
+\x46\xec\xdd\xc7\x5c\xa4\xac\xf0\xd5\xb6\x81\x38\xae\xe5\xcb\x80\
+\xb0\x1c\xb8\x1a\xb8\x12\xb8\x2a\x53\xc1\xdf\xee\x9c\xf7\xdf\xc5\
+\x8b\x62\xfe\xb0\x17\x70\x68\x31\xa7\x98\x14\xf0\x5e\x6e\x24\x7d\
+\x17\xfa\x56\xa0\x73\x72\xc2\xf5\xf3\x47\x16\xeb\x6e\xf1\x50\x60\
+\x69\x2c\x5a\x79\x05\x30\xa5\xc1\x22\x7f\xa0\x67\x94\x07\x80\x48\
+\xd1\x20\xf0\x8f\xe2\x35\xa4\x10\x76\x07\x03\x47\x60\x01\xb1\x42\
+\x0b\xf8\x26\x88\xf2\x98\xdc\xf9\xcb\x7e\xc6\x5e\x32\x00\x88\x0c\
+\x0d\x00\xa1\x04\xb9\xb6\x0d\x84\x17\xed\x55\x79\x18\xb8\xb4\x10\
+\xfd\xb7\x60\x79\xdb\xc5\x53\xc5\xd3\xbf\x8a\x57\x17\xb6\x45\xe0\
+\xb0\xc2\x20\x30\xcb\xf3\x67\x5f\x2d\x31\x2b\xe3\x80\x83\xe7\x8f\
+\x28\x03\xc0\x46\x60\xd9\xd0\xa2\xaf\x59\xc6\xc0\x01\x6a\x83\x35\
+\x70\xf1\x54\xd6\xa8\xb1\x89\xc4\xd9\x80\xb9\x30\xde\x00\x7c\x17\
+\xdb\xeb\x7d\x0c\x70\x34\x30\x39\x42\xd1\xdd\xa4\xf4\x7b\x55\x8e\
+\xf5\x71\xde\xf6\x68\x1b\x80\xc8\x87\x2d\xb0\xfd\xcd\xed\x88\x4a\
+\x79\x05\xa4\x2d\xea\x3b\xb9\xd6\xe3\x58\xbc\x93\x8b\xb0\xfd\xfc\
+\xa2\x33\xf1\x75\x7b\xf1\xfa\x01\x96\x5d\xe0\x58\xe0\x78\x2c\xe3\
+\x80\xeb\xcf\xfa\x67\x06\x65\xb6\x51\xd5\xa6\x76\x22\xd2\xb8\x4b\
+\x81\x8d\x3d\x81\xbc\x97\xc4\x6c\x00\x68\xc2\x2a\x7f\x22\x95\x46\
+\x08\x27\xf4\x0c\xde\xdf\xc1\x56\x7c\x8f\x2d\x8c\x01\xae\xb6\x00\
+\x29\xfd\x5e\xf8\x7b\x74\x71\x5e\x4f\x3f\xbf\x5f\x31\x31\x16\x22\
+\x75\x0e\x28\xea\x75\x59\xc1\x4e\xe0\xf3\x94\x8e\xd0\xdf\xb5\x56\
+\x14\xa2\xff\x42\xe0\x26\xb4\xb0\xe3\x8a\x07\x81\x9f\x00\x3f\xc5\
+\x02\x08\x1e\x5f\xcc\x27\x5c\x88\x9a\x6b\xb1\x8c\x0a\xa2\x7d\xe4\
+\x1d\xd0\x7f\xfb\x8f\x84\x25\xb0\x29\x93\xd7\x12\xda\x0f\xe2\x2d\
+\xa1\xeb\xa9\xc2\xf4\x37\xd0\xac\x41\x88\x7c\xeb\x7d\x8f\x67\xc0\
+\xb7\x8b\x41\xfb\x54\x36\xa5\xcc\x8a\x4d\x48\x37\x4d\xe0\xfb\x5e\
+\xed\xef\x8f\x43\x8a\x89\xb2\x26\xc8\x22\x65\xba\x80\xfd\x2b\x8a\
+\xce\x94\xbd\x02\x14\x57\xc0\xb8\x0d\x38\xbb\xe8\xd3\x34\x9f\xf3\
+\x3b\x9f\xb8\xb5\x78\x7d\x0b\x8b\x41\xf4\x0c\x60\xdf\x0a\xdf\xf9\
+\x5f\x32\x29\x9b\x8d\x11\x7d\x47\x4d\x25\x66\x03\x80\x0a\x27\x52\
+\xd6\xab\x08\x44\x03\x58\x0d\xfc\xbd\x78\x6d\x07\x9c\x00\x9c\x02\
+\x8c\xcd\x54\x94\xe7\x22\xf0\xcb\x96\xdf\x40\xd7\x98\x04\xec\x48\
+\xfa\xa9\x97\x44\xb3\xd9\x89\x81\xb7\x38\x85\xf6\x0a\x48\xcd\x40\
+\x90\xb2\xb1\x61\x39\x70\x01\x70\x0e\x70\x9f\x9a\x42\x2d\xf3\xe6\
+\x2b\x8a\xd7\x36\xc0\xd3\x81\x93\x80\x31\x1d\x5c\xe3\x56\x2c\x10\
+\x63\x0e\xc8\x98\x5e\x3f\x11\x2d\x72\xc7\x67\x00\xc8\xdd\x03\xa0\
+\xec\x56\x06\x19\x00\x44\xd3\x98\x87\xed\xed\xfb\x45\x61\x04\x78\
+\x16\xb0\x65\xc2\xa2\x3c\x06\x81\x1f\xe2\x7e\x5c\x1a\x06\x0e\x92\
+\x01\x40\x24\xce\x41\x9e\x84\x7e\xce\xc1\x04\xeb\xba\x47\x57\xd7\
+\x7a\x14\xf8\x23\xf0\x37\x94\xbd\x29\x16\x1e\xc4\x3c\x0c\xcf\x04\
+\x8e\x03\x4e\x67\xe0\xb4\x9c\x14\xdf\xdd\xd7\x32\x12\xce\x29\xc4\
+\x00\xc8\xdd\x48\x11\x51\x7f\xb0\xb4\xb7\x01\x20\x8a\x54\x80\xcb\
+\x1a\x2c\xf2\x07\x62\x9d\xfa\x6f\xd1\x50\x56\x01\xbf\x07\xfe\x50\
+\x4c\xa6\x5f\x84\xe5\x03\x8e\x4d\x94\xa7\x20\xf0\x63\x5d\xed\xef\
+\x8f\x3d\x50\x30\x40\x91\x2e\xe3\x81\xdd\x03\x0a\x7d\x17\x62\x56\
+\xdb\x06\xca\x5f\xeb\xde\x62\x9c\xba\x18\x2d\xda\xc4\x3c\x9f\x38\
+\x0b\xdb\x8e\x71\x10\xf0\x62\xfa\xde\x6e\xb8\x16\xf8\x34\x70\x7f\
+\x46\xcf\xde\xd2\xfd\xd7\x4e\x44\x73\x99\x45\xbd\x0d\x00\x4b\xa2\
+\x31\x49\x88\xa7\xa0\xc1\x44\x34\x9d\x16\x96\x22\xe9\x4a\x2c\x40\
+\xdc\x0b\x4b\x4e\xae\x7d\x09\xed\xd8\x04\x7e\x88\x72\x70\x6d\x18\
+\xd8\xfc\x7a\x43\xb1\x34\x4f\x7f\x53\xf5\x17\x09\x72\x04\x96\xfe\
+\xb4\x1d\xb1\x2d\xaf\x00\x77\xc7\x86\x36\x36\xdc\x04\xfc\x12\xb8\
+\x4e\x55\x3e\xc9\xf9\xc4\xf6\xd8\x76\xc3\xe3\x8a\xf6\x7a\x03\xf0\
+\x63\xe0\x81\x0c\x9f\x59\x48\xe3\xf6\xd6\xfc\x51\x79\x00\x2c\x4d\
+\xa8\x21\x85\xcc\x4a\x20\x03\x80\x10\x9b\xb8\xb6\x78\xed\x07\xbc\
+\x94\xfe\x3d\x02\x9a\xec\xce\x1f\x3a\x78\x5f\xbb\xa2\xbe\xd3\x32\
+\x3c\x14\xdb\x47\xbb\x56\xd5\x5e\x24\xc4\x08\xe0\x60\x4f\xe2\x3e\
+\xf4\xea\x7e\x93\xbd\x02\x06\x3a\xf6\x76\x2c\xf2\xfc\xf5\xaa\xee\
+\x49\x73\x1f\xf0\xbd\xe2\x25\xd2\x24\x15\xe3\x46\x44\x5e\xee\x4f\
+\x32\x00\x44\x91\xe5\xe2\x89\xc8\x2a\x54\x2c\xa9\x07\x65\x00\x10\
+\xa2\x7f\x43\xc0\x3e\xc0\x2b\xb1\xa0\x71\x4d\x14\xf8\xbe\xee\xdd\
+\x75\xf9\x95\x31\x12\x8c\x02\x0e\x04\x2e\x57\x75\x17\x09\x71\x50\
+\x51\x77\x7d\x8a\x7b\xd7\x62\x39\x67\xaf\x00\x97\xcf\x33\x17\x8b\
+\x4d\x73\x39\x5a\x55\x15\xe9\xd0\x9d\xb0\x70\xce\xc5\x38\x10\xd1\
+\x22\xf7\x82\xde\x06\x80\x05\x4d\x34\x00\xc4\x24\xf2\x07\x42\x31\
+\x00\x84\xe8\x9f\xeb\x81\xb7\x01\x47\x16\x86\x80\x29\x15\xc5\x6c\
+\x6a\x02\x3f\xf5\xd5\xfe\xc1\xae\x7d\x24\xf0\x2f\x60\x83\xaa\xba\
+\x48\x80\x21\x98\xfb\xbf\x6f\x71\x2f\xaf\x00\x77\xc7\xb6\x73\xad\
+\x05\xc0\x8f\x80\xcb\x24\xfc\x45\xa2\xfd\x52\xaa\xc2\x39\x17\xe3\
+\x40\x6c\x06\x80\x1e\xa3\x50\x14\x1e\x00\x2b\x3d\x88\xdd\x1c\x2a\
+\xb1\x3c\x00\x84\x18\xbc\x9d\x5f\x02\xbc\x1e\x5b\x9d\x71\x95\x6b\
+\x39\xb6\xc9\x6b\xe8\x7d\xbe\x3e\xdd\x97\xdb\xbd\xf6\x24\xca\xe5\
+\x52\x17\xa2\x0e\x0e\x02\x26\xd6\xd0\x4e\x7c\xb7\xe3\x9c\x0d\x04\
+\x03\xb1\x06\xf8\x19\xf0\x46\xe0\x52\x89\x7f\x91\x28\xdd\xd2\x55\
+\xb5\x3e\xe3\x1a\x87\xf3\x52\xd7\x06\x80\x05\xb1\xdc\x95\x22\x3e\
+\xcb\x00\x20\x44\x59\xd6\x02\x3f\x2f\x0c\x01\x17\xb4\xd1\x89\xa7\
+\x3c\x51\x0d\x31\x39\x77\x7d\x8d\xb2\x42\xe8\x04\x36\xb9\xab\x09\
+\x11\x2b\x43\xb1\x60\x62\x3e\x04\x7d\x8c\x6d\x3b\xf7\x6d\x03\x57\
+\x01\x6f\xc2\x82\xfc\x29\x0e\x89\x90\x01\x40\x94\x25\xb2\x18\x77\
+\x71\x1a\x00\xca\x14\x52\xee\xd6\x28\xb9\xbe\x0a\xd1\x19\x0b\x81\
+\x2f\x01\x1f\xa0\xfd\x68\xbe\x5a\xed\xf7\x23\xde\x5d\x88\x9e\x2d\
+\xb0\x58\x00\x42\xc4\xcc\x21\xc0\x04\x4f\x82\x5e\x5e\x01\xe1\x8e\
+\x9d\x0b\xbc\x17\xf8\x18\x91\xb8\xc7\x0a\x91\x88\x01\x40\xde\x01\
+\x7d\x13\xd9\xe2\xf6\xa3\xbd\xeb\xc4\x13\x58\x8a\xcc\x68\x0d\x00\
+\x4d\xae\x54\x1b\xd5\x77\x09\x51\x8a\x9b\x81\xb7\x00\x67\xd2\x99\
+\x27\x8d\x56\xfb\xfd\x08\xf9\x32\x02\xa7\xe7\xf7\xe3\x81\x61\xaa\
+\xd2\x22\x52\x86\x03\xc7\x56\xac\xe3\xbe\xdb\x55\x08\x63\x41\xca\
+\x5e\x01\x1b\x81\xdf\x01\xef\x00\x6e\x55\x95\x16\x19\x11\x43\xbc\
+\xb3\x26\xeb\xb8\x88\x3c\x00\x56\x14\xaf\x27\x19\x85\x94\x09\x20\
+\xd2\x06\xd0\x85\x10\xa2\x2c\x1b\x7a\x4d\xea\xee\x8a\x68\xb2\x99\
+\x4a\x10\x2f\x57\x42\xbe\x2a\xe3\x81\x63\x54\x9d\x45\xa4\x1c\x07\
+\x8c\xf3\x34\x61\xaf\xc3\x70\x10\xf3\x79\x3e\x8e\xbd\x03\x78\x2b\
+\x66\x2c\x56\xe0\x65\x91\x1b\x43\x22\xbf\xbf\xdc\x8d\x03\x11\x69\
+\xdb\xff\xf3\xf8\x97\x01\x20\x81\x8a\x2c\x03\x80\x10\xd5\x99\x0b\
+\xbc\x1b\xf8\x01\x4f\x0e\xc6\x92\xa3\x3b\xbf\x6b\xa1\x51\x87\xa0\
+\xe9\xeb\xf7\x63\x68\x3f\xc0\x9a\x10\xa1\x98\x04\x1c\xe5\xb0\x9e\
+\x87\x6c\x73\xa1\xfb\x98\xd8\x0c\x04\xab\x81\xff\x07\xbc\x07\x98\
+\xa7\xaa\x2c\x32\x25\xe5\x18\x00\x39\x18\x07\x62\x37\x00\x44\x11\
+\x07\x60\xa9\x2a\xa4\x10\xc2\x13\x1b\x81\x3f\x61\xde\x00\xf7\x3a\
+\x9c\x44\xc6\x3c\x19\xae\x63\x9f\xbf\x2f\xa3\xe5\x30\xe0\x14\x55\
+\x63\x11\x19\xa7\xe1\x2f\x48\x65\xa8\xb6\x17\x4b\x8a\xc1\x10\x7d\
+\x69\x0f\xf3\x30\xa3\xf0\x5f\x34\xa7\x13\x0d\x33\x00\xe4\x52\xdf\
+\x53\x79\x8e\x88\x0c\x00\x8f\x45\x6b\x00\x58\xac\x76\xea\x6c\x70\
+\x14\x42\xf4\xcd\x83\xd8\x8a\xcf\x40\x13\xbf\xa6\x06\xef\x8b\x49\
+\xc0\xf4\xf5\xfb\xde\xc0\x2c\x55\x61\x11\x09\x3b\x02\x7b\x7a\xaa\
+\xeb\x21\xdb\x63\x9d\xd7\x08\xdd\xbf\xb6\xd8\x64\x08\x9e\xab\x2a\
+\x2c\x1a\x68\x00\x10\x61\x59\x14\xcf\xad\xcc\xef\xab\x4e\x44\xb1\
+\x05\x60\x61\x44\x5f\x58\x2c\x96\x25\x19\x00\x84\x70\xcf\x3a\xe0\
+\xfb\xc0\xff\xb4\xd1\x39\x37\x29\x55\x5f\x4c\x62\xa5\xaf\xcf\xea\
+\x02\xce\x40\x69\x01\x45\xfd\x0c\x05\x9e\x1d\x41\x9b\xf0\xd5\x46\
+\x73\x0c\x26\xb8\x14\xf8\x38\xf0\x43\x94\x62\x59\x34\x87\x4e\x62\
+\x00\xc8\x3b\x20\x6b\x6d\x1b\xef\x16\x80\x45\x0d\xae\x20\x42\x88\
+\xf0\xdc\x80\xad\x04\xdd\x10\x70\x42\x9b\x53\x54\x7f\x57\xc2\xa4\
+\x93\xfb\xda\x92\x4d\x11\xd7\x85\xa8\x8b\x13\x80\xa9\x91\xb4\x89\
+\xba\xfb\x84\x14\xfa\xc5\xeb\xb0\x40\x7f\xd7\xa8\xea\x8a\x86\xe1\
+\x2a\x83\x8e\x8c\x03\x69\x68\xdb\x01\x78\xb4\x2f\x03\xc0\xfc\x18\
+\xee\x6c\x09\xee\xf3\xde\xa7\x5e\x61\xe5\x01\x20\x84\x5f\x96\x02\
+\xff\x0b\xfc\xb2\x42\xdb\x8b\x25\x78\x5f\x1d\xe2\xbd\x0e\x03\xc2\
+\x71\xc0\x34\x55\x5d\x51\x13\x5b\x01\x47\x27\xd4\x5e\x7c\xf7\x13\
+\xa1\xfb\xbc\x4e\x8f\xfd\x3d\xb6\xf2\xbf\x54\x55\x57\x34\x90\xe1\
+\x19\x8a\xea\x54\x9e\x63\x3d\x51\xc5\x00\xe8\x73\x0b\xc0\x03\xb1\
+\x14\xfc\x62\x55\x3c\x19\x00\x84\x08\xcc\x46\xe0\x57\xc0\xe7\xb1\
+\xc8\xd0\xae\x26\x9f\xb9\xae\xf6\xbb\x12\x22\x5d\x25\x3f\x6f\x08\
+\xb6\x15\x40\x7b\x1b\x45\x68\x7a\xea\xde\x90\x0a\xf5\xb7\x4e\x11\
+\x1f\xaa\xef\x88\x21\x98\xe0\x2a\xe0\xb3\xc0\x4f\x8a\x3e\x5e\x88\
+\xa6\x31\x34\x82\x71\xb2\xc9\xc6\x81\x45\x71\x3d\xff\xbc\x68\x0d\
+\x00\x10\x57\x1c\x00\x35\x04\x21\x9a\xc5\x15\xc0\x7f\x63\x81\x02\
+\x3b\x99\x68\xd6\x31\x21\xae\x63\x9f\x7f\x15\x01\xe2\xfa\x73\xb7\
+\x03\x8e\x57\x95\x15\x81\x39\x01\xd8\x36\xe3\x76\x15\xaa\x4f\xf2\
+\xed\x4d\xf0\x08\xf0\x5e\xe0\x5f\xaa\xb2\xa2\xc1\x0c\x8f\xfc\xfe\
+\x72\xd7\x44\x8f\xc7\x75\x3b\x0f\xf4\x65\x00\x78\x98\x48\x62\xa2\
+\x2c\x94\x70\x7e\x12\x5a\xe1\x12\x22\x2c\x0f\x01\xef\xa3\xbd\xb8\
+\x00\x75\xba\xc4\xfa\x34\x12\xf8\x10\x1e\x3e\x3e\xe3\x78\x60\xa6\
+\xaa\xac\x08\xc4\x2c\x36\xc5\x9f\xa8\xab\xce\xc7\xd0\xae\x5d\x5c\
+\xdb\xc5\x3d\xf5\xc7\xb5\x98\x21\xf7\x01\x55\x59\xd1\x70\x86\xa9\
+\x08\x82\xd0\x9f\x46\x8d\x68\xff\xff\x5a\xfa\x09\x02\xb8\x01\x33\
+\x98\xd6\xce\xa2\x8c\x2b\x42\x19\x14\xed\x5a\x88\xf0\xac\xc0\xf6\
+\x8c\x9e\x1b\x68\xc2\x1a\x7a\xf2\xed\x7b\xa5\x30\xc4\x67\x75\x15\
+\x83\xd8\x8b\x80\x91\xaa\xb2\xc2\x33\x23\x8b\xba\xd6\xdd\x61\x1d\
+\xcd\xa9\xcd\xf9\xee\xbb\x5c\xdc\xd3\x85\xc0\xa7\x80\x95\xaa\xb2\
+\x42\x3c\xc5\x03\x20\xa5\xc5\xd4\x1c\x16\x7e\x23\xf2\x6a\x7f\x88\
+\x5e\x3b\xa1\x36\x5f\x5c\x7e\x40\x85\x15\x5f\xc5\x94\xf5\x4e\x88\
+\x7a\xd8\x00\x7c\x07\xf8\x8d\xc3\xc9\x69\xaa\xfb\xfc\x43\x7f\x7e\
+\x27\x9f\x31\x09\x78\x8e\xaa\xab\xf0\x5c\xe7\xcf\x00\x26\x26\xd0\
+\x1e\x52\x68\xf3\x3e\xae\xd1\xc2\x02\xb9\x7e\x1d\xf7\xc1\xa4\x85\
+\x48\x95\x4e\x34\x84\x8c\x03\x59\x6b\xda\x79\xbd\xff\x88\xd2\x00\
+\xb0\x48\x15\x4c\x06\x00\x21\x22\xea\x03\x06\x9b\x54\xc6\x32\x21\
+\xee\x74\xc2\x1e\xf3\xef\x9d\x3e\xcf\x3e\xc0\x91\xaa\xae\xc2\x13\
+\x47\x03\x7b\x7a\xac\xbf\xa9\xb5\xc7\x3a\x85\x7e\x5f\x6c\x6e\xac\
+\x15\x42\x18\xae\x62\x00\xc8\x38\x90\xbc\xa6\x7d\x60\x20\x03\xc0\
+\xbc\x18\xee\x70\x61\x83\x2b\x8a\x0c\x00\x42\xc4\xc9\x85\xc0\xa7\
+\x81\x35\x91\x4c\x7e\xeb\x58\x05\xf4\x85\x2b\x41\x75\x1a\xb0\xa3\
+\xaa\xaa\x70\xcc\x6c\xe0\x69\x1e\x04\x7f\xae\x6d\x35\xb4\x11\x74\
+\x0d\xf0\x09\xca\x6f\xd7\x12\x22\x67\x42\x68\x08\x19\x07\xfa\x27\
+\xa2\x20\x80\xcd\xf4\x00\x48\xb9\x72\x0e\x47\x08\x11\x03\xd7\x62\
+\x71\x01\x56\x05\x10\xf5\xa1\x26\xe8\xb1\xaf\x2e\x76\x22\xb8\xba\
+\x81\xff\x00\x26\xa8\xaa\x0a\x47\x6c\x51\xd4\xa9\x6e\xca\x09\xfe\
+\x26\xb5\xd5\x90\x7d\x5e\x57\x2f\xf1\xff\x29\xda\x0b\xd8\x2a\x44\
+\x13\xa9\x5b\x43\x34\xdd\x38\xb0\x38\x9e\xc7\x7b\x30\x7a\x03\xc0\
+\xb2\x5e\x13\xec\x5c\x2b\x59\x27\xc8\x03\x40\x88\x78\xb8\x0d\xf8\
+\x28\xb0\xdc\x81\x00\xa8\xcb\x48\x50\x27\xbe\xb6\x02\xf4\x30\x16\
+\x78\x35\x0a\x0a\x28\xaa\x33\x02\x78\x25\x30\xa6\x82\xe0\x97\x07\
+\x8f\x9f\x6b\x83\x05\x6a\xfd\x28\x70\xb3\xaa\xaa\x10\x03\xf6\x63\
+\xa2\x1e\xe3\xc0\x72\xa2\x0a\x46\x1a\xbf\x07\x00\xc0\xa3\xaa\x48\
+\x32\x00\x08\x11\x29\x77\x63\x9e\x00\x2b\x22\x9d\x1c\xe7\xb6\xda\
+\xdf\xa9\xc0\xda\x0a\x78\x31\x4a\xa1\x2a\xca\x33\x04\x78\x29\xb0\
+\xb5\x07\xc1\xdf\xa4\x36\xed\xab\x6f\x5c\x56\x88\xff\x3b\x55\x55\
+\x85\x18\x90\x51\x15\x45\x6c\x6c\xa2\x3a\x25\x16\xc4\x75\x3b\x69\
+\x18\x00\x16\x64\x50\x59\x5c\xdd\xab\xb6\x00\x08\x11\xa7\x11\xe0\
+\x23\x3c\xd9\x13\x40\xfb\xfc\xfd\x8b\xfb\xbe\xce\xe9\xeb\xbd\x39\
+\x28\x33\x80\x28\xcf\x33\x81\x9d\x4b\xd6\x3d\xdf\x46\x82\x94\xdb\
+\xb8\x8b\x3e\xf2\x89\xa2\xef\xbd\x57\xd5\x54\x88\x8e\x0c\x00\x29\
+\x89\xf1\x1c\xf4\x5e\x64\x06\x80\x01\x83\x00\x3e\x46\x39\xef\xfb\
+\x60\x06\x00\x1a\x58\x41\xe5\x01\x20\x44\x9c\xdc\x0f\x7c\x8c\xbe\
+\x5d\xbc\x7c\x4e\xec\x9b\xbc\xcf\xbf\x93\xe3\x0e\x02\x8e\x53\x35\
+\x15\x1d\x72\x22\x70\xa8\x87\xfa\xe8\xa2\x4d\xe4\xe8\x09\xd0\x49\
+\x59\xad\x28\xfa\xdc\x79\xaa\xa6\x42\x38\x35\x00\xa4\x44\x2a\xc6\
+\x81\x88\xb4\xec\x72\x60\xc9\x40\x06\x80\x56\x2c\xfd\xea\x02\x55\
+\xb4\xff\x43\x1e\x00\x42\xc4\xcb\xbd\x58\x04\xea\x76\xb3\x03\x68\
+\xb5\x3f\x8c\xb0\xea\xf9\xfb\x69\x58\x0a\x37\x21\xda\xe1\x88\xc2\
+\x00\x30\x50\x9d\xf2\x5d\x7f\xd5\x17\xf4\xcd\x1a\xe0\x33\x98\xe1\
+\x55\x08\x11\xce\x00\xa0\x28\xff\xe5\x88\x68\x3b\xfb\x53\xba\xcd\
+\xbe\xb6\x48\xde\xd3\xc4\x42\x8b\xb9\x72\x0f\xcf\x60\x12\x20\x44\
+\xce\xdc\x09\x7c\x11\xcb\x45\xad\x7d\xfe\xd5\x9f\xa7\x8c\xd0\x1f\
+\xe8\xbd\x53\x81\x83\x55\x4d\xc5\x20\x1c\x00\x3c\xa3\x42\x3d\x73\
+\x21\xf8\x9b\xd4\x17\x74\xf2\xac\xeb\x81\xcf\x63\x41\x58\x85\x10\
+\x61\x0d\x00\x32\x0e\x94\x23\xa2\xc5\xec\xbb\xdb\x31\x00\xdc\x1d\
+\xc3\x9d\x2e\x50\x25\x7d\xd2\xe0\xa7\x88\xd6\x42\xc4\xcd\xb5\xc0\
+\x97\x80\x8d\x8e\x26\xef\xa9\xe0\x6b\xb5\xdf\x95\x00\xeb\x2a\x5e\
+\xcf\x06\xf6\x55\x35\x15\xfd\xb0\x1f\x70\x46\xaf\xfa\x82\xc7\x7a\
+\xd9\x44\xaf\x80\x2a\xcf\xd5\x02\xbe\x06\x5c\xaf\x6a\x2a\x44\x74\
+\x06\x00\x19\x07\xfa\x27\x22\x0f\x80\x7b\xda\x31\x00\x44\xe1\x01\
+\xb0\x18\x58\xab\xca\xf6\x7f\x8c\x56\x1f\x26\x44\xf4\x5c\x09\x7c\
+\xbf\xa6\x09\x73\xec\x2b\x7c\x3e\xdd\xa7\x07\x7b\xaf\xab\x18\xec\
+\x5e\x88\xc5\x05\x10\xa2\x37\x07\x03\x2f\x68\x43\xfc\x97\xad\x83\
+\xae\xe3\x03\xe4\xdc\x4f\xf4\xc5\x77\x81\x2b\x54\x4d\x85\xa8\x64\
+\x00\x50\x90\xbf\xb0\xf7\xba\x1a\x58\x2a\x03\x40\xb9\xc2\x7e\x2c\
+\x83\x86\xe7\xaa\x82\xcb\x00\x20\x44\x1a\xfc\x03\x38\x2b\xe0\xe4\
+\xb8\x2e\x62\xda\xe7\x3f\xd8\x7b\xf4\x12\x77\xcf\x05\x8e\x52\x35\
+\x15\x05\x87\x61\xd9\x22\xba\xda\xac\x43\x65\xde\x73\x79\x5c\xd3\
+\xfa\x90\x3f\x03\xe7\xa9\x9a\x0a\x51\xd9\x00\x90\x92\x18\xcf\x21\
+\x3d\x60\x64\xc1\xec\xd3\xd9\x02\x00\x30\x5f\x15\x55\x06\x00\x21\
+\x12\xe4\xc7\xc0\xd5\x1e\xc5\xb4\xf6\xf9\x57\x33\x02\x3c\x1d\x38\
+\x5e\xd5\xb4\xf1\x9c\x08\x3c\xcb\xb3\xf8\x57\x7c\x80\xf2\x46\x8b\
+\xeb\x80\x9f\xab\x9a\x0a\xe1\xdd\x00\x20\xe3\x80\xfb\xfb\x49\xd1\
+\x00\x70\x1f\x16\xcb\xaa\x76\x94\x09\x40\x06\x00\x21\x52\xa4\x67\
+\xcf\xea\xdc\x8a\x13\xe0\x58\x88\x61\x9f\xbf\x0b\x71\xd6\xfb\xef\
+\x93\x81\xe7\x01\x43\x54\x5d\x1b\x47\x37\x16\x13\xe2\xc4\x0e\xeb\
+\x4c\x3b\xc7\x56\x35\x0c\x28\x3e\xc0\xa6\x89\xe8\x17\xe9\x3f\xa6\
+\x8a\x10\xa2\x3d\x9a\x14\x43\x2c\x26\xe3\x40\x44\x1a\x76\x1d\x7d\
+\x64\xf8\xeb\xcb\x00\xb0\x16\xa5\x02\x8c\x8e\x31\x2a\x02\x21\x92\
+\x62\x15\xf0\x59\x06\xde\x03\xa6\xd5\x7e\x37\x02\xaa\x13\x03\x41\
+\xef\xbf\x0f\x02\x5e\x85\x82\xac\x36\x89\xe1\xc0\x2b\x80\x43\x4b\
+\x88\xff\x4e\xea\x59\xa8\x6d\x00\x64\xd8\xbf\x2c\x2e\xfa\xce\x35\
+\xaa\xae\x42\x54\xc6\xa7\x91\xbb\xa5\xe2\xed\x97\x88\x02\x00\xf6\
+\xb9\xb0\xdf\xdd\xcf\xc1\x51\xc4\x01\x78\x24\xf0\xe7\xc5\xec\x56\
+\x22\x0f\x00\x21\xd2\xe3\xb1\x62\x22\xbb\x3e\xa1\x7b\x0e\x61\x1c\
+\x28\x2b\xf4\x5d\xac\xfc\x6f\xfe\xf7\x4e\xc0\x1b\x80\x09\xaa\xae\
+\xd9\xb3\x05\xf0\x66\x60\x4e\xc5\x3a\xe3\xf2\x3d\x3c\xb5\xb1\x54\
+\xbd\x02\xd6\x15\x7d\xe6\x42\x55\x57\x21\x92\xa6\xe9\x5b\x07\x1e\
+\x8e\xe7\xd1\xfb\xdc\xda\xdf\xdd\xc9\xc1\xa1\x79\x48\x15\x52\x06\
+\x00\x21\x12\xe7\x2e\xe0\x27\x34\x27\xaa\x7f\x1d\x11\xfe\xab\x1a\
+\x01\xa6\x03\x6f\x2b\x8c\x01\x22\x4f\x76\x00\xde\x02\x6c\xe5\x59\
+\xfc\x97\xad\xcb\x3e\x3d\x01\x48\xa4\xef\xe9\x02\xce\x24\x92\x15\
+\x28\x21\x32\xa1\x5b\x62\xbc\x96\xfb\x89\xc8\x00\x70\x4f\x27\x06\
+\x80\x28\xfa\xdf\x27\x80\x65\xaa\x58\x32\x00\x08\x91\x38\xe7\x00\
+\x97\x46\x78\x5f\x2e\x0d\x05\x75\x05\xfe\x73\x65\x04\x18\x03\xbc\
+\x1a\x38\x86\xf4\xa3\xab\x8b\x27\x7f\xbf\x47\x00\xaf\x05\xc6\x06\
+\x10\xff\x75\x05\x04\xac\x2b\x45\x9f\x4b\xae\xc0\xb2\xa8\x08\x21\
+\x24\xc6\x53\xbe\x9f\x25\xc0\xf2\xc8\x0d\x00\x43\xfb\x39\x38\x9a\
+\x4c\x00\x0f\xb1\xc9\x5d\x6f\xf3\x2f\xa4\x2b\xb2\x0a\xe2\xf3\x7e\
+\x64\x00\x10\x7d\x31\x1c\xdb\xbf\x3c\xa6\xa8\x23\x9b\xef\xf5\x5a\
+\x53\xbc\x56\x60\x7b\xd2\xd7\xab\xc8\x6a\xe3\xff\x01\xb3\x79\xf2\
+\x0a\x64\xab\xe6\xdf\x3b\x11\x51\x9d\x5e\xab\xdd\x73\x5c\xbc\x57\
+\xe5\xd8\xde\x62\xa8\x1b\x38\x15\x98\x01\xfc\x0e\xcb\xe3\x2b\xd2\
+\x65\x14\x16\xe8\x71\xcf\x01\x44\x6f\x0c\xe2\x3f\x94\xc1\xed\xff\
+\xb7\x77\xde\x61\x72\x14\xd7\xfa\x7e\x57\x01\x49\x24\x01\x22\x8b\
+\x9c\x33\xc6\x80\x49\x06\x8c\x0d\xd8\xc6\x36\x8e\x38\xdb\xd7\xe1\
+\x3a\xdf\xeb\x9c\x7d\x9d\x73\x8e\xf7\x3a\xe3\x1c\xc1\x60\x1b\x30\
+\x39\xe7\x8c\x30\x12\x51\x64\x49\x20\x90\x84\x40\x12\xca\xfb\xfb\
+\xe3\xf4\xfe\xb4\x12\xbb\xb3\x33\xdd\x55\xdd\xa7\xaa\xbf\xf7\x79\
+\xe6\x41\xec\x74\xf7\xf4\xf4\x54\x57\xd5\xf7\xf5\xa9\x73\x62\x98\
+\x07\xa1\xfe\x3d\x13\xf8\x89\x9a\x6c\xa3\x8c\x29\xee\x99\x75\x80\
+\x71\xc5\x6b\x30\x2b\x80\x45\xc5\x7c\x62\x31\x96\x30\x4c\xc8\x1c\
+\xd0\xf9\x0c\xad\x5d\x1d\x71\x57\x56\x06\x40\x8e\x22\xbf\x13\xeb\
+\xaa\x1f\x6a\x25\x6b\x03\x5b\x17\x82\x64\x6b\x2c\x54\x79\x53\x60\
+\x43\x60\x13\x56\x2f\xef\xd2\xcd\x64\x71\x1e\xe6\x4c\xce\xc5\xca\
+\x6c\xce\x00\x1e\x2c\x5e\xf7\xcb\x20\x88\xca\x93\x58\x56\xeb\x2f\
+\x15\xc6\x4d\xdd\xc4\x32\x0a\xaa\x1a\x02\x9d\xb6\xab\x6a\x02\xd0\
+\xc3\xff\x0f\xde\x7f\x5f\x60\x1b\xe0\x2f\xc0\xdd\x6a\xba\x49\xb2\
+\x0d\xf0\x5a\x60\xa3\x12\xe2\xbd\xea\xff\x87\xaa\x14\x50\x66\xbb\
+\x50\xc2\xbe\x4e\x96\x14\x7d\xa3\x0c\xb7\xf8\x02\x7f\x1b\x60\xab\
+\xe2\x35\x19\xd8\x0c\x98\x84\xe5\xc7\xd8\xb0\x0b\x91\xd5\xbf\xc6\
+\x98\xf6\x48\x31\xaf\x98\x8d\x99\x38\x0f\x14\xf3\x8a\x07\x0a\xb3\
+\x40\x34\x4f\xac\xfb\x5a\xe6\x40\x67\xed\xea\x88\x9e\x23\x00\x56\
+\xe0\xa0\x42\xd2\x8c\x06\x1a\x90\xc7\xc8\x82\xf5\xd5\x87\x65\xcf\
+\x68\x60\x17\x60\xcf\xe2\xbf\x3b\x17\xa2\x3f\xe4\x04\x6d\xc3\xe2\
+\xb5\xfd\x10\x03\xc4\xb2\x42\xec\xdc\x09\xdc\x06\xdc\xcc\xaa\x32\
+\x76\x22\x0c\xf7\x01\xbf\x06\xde\x1e\x40\x94\x37\xf9\xb4\x3f\xb4\
+\xd0\x1f\x49\xd8\x77\x6b\x10\x84\xfc\xff\x0d\x8b\xdf\xe9\x12\xe0\
+\x6c\x9c\xd4\xc6\x15\x23\x32\x0a\x78\x4e\xf1\x1a\xd5\x80\xf8\xa7\
+\x87\x6d\xeb\xca\x0f\xe0\x3d\x2a\xe0\x57\x85\x60\x14\x61\xd9\x0e\
+\xd8\x07\xd8\xb5\x98\x4f\xec\x00\x8c\x0d\x28\x94\x26\x14\x86\xc2\
+\x36\x43\x08\xb0\xfe\xe2\x37\xbd\x13\xb8\x03\xb8\xa5\xf8\xb7\xfa\
+\xd1\x76\xd0\x76\x73\xc0\x91\x01\x30\x30\xb5\xef\xda\x00\x58\x5c\
+\xec\xd0\x78\x4e\xa4\x19\x2d\xb9\x51\x46\x1a\xa0\x95\xa1\x3a\x4f\
+\xb6\xc6\xca\x51\xed\x8b\x85\xa9\xae\x4d\x1c\x03\xaa\x9b\x36\x36\
+\xb6\x98\x28\xec\x0a\xbc\xb0\xf8\xdb\x3c\x60\x0a\x70\x1d\x70\x15\
+\xe6\xf6\x8b\x6a\x9c\x0f\x3c\x1d\x38\x20\xe2\x67\xd4\xfd\xb4\x3f\
+\x84\xd0\x0f\x1d\xd2\x5f\xf5\xff\x07\xc4\xe4\xb3\x8a\x89\xf3\xc9\
+\x58\xd4\x8c\xf0\xcb\x16\x58\xc8\xff\xd6\x1d\x84\xaf\x97\x48\x80\
+\x3a\xf3\x03\x84\x12\xf6\x31\xb8\x06\xb8\x50\x4d\x37\x08\x9b\x00\
+\x07\x17\x63\xcb\xbe\xac\x7a\xa2\xdf\x84\x50\xea\x1b\x64\x0e\x3c\
+\xa7\x38\xee\x22\xe0\xdf\xc0\x4d\xc5\x7c\x42\xa6\x8f\xcc\x81\x5c\
+\x71\xa4\x5d\xef\x64\x98\xd5\x3a\x63\x3a\xec\x34\x35\x57\x03\xa0\
+\x89\xa7\xfc\x55\x3f\x53\x06\x40\x3e\xec\x0e\x1c\x0e\x1c\x8a\x85\
+\xe1\x79\x6e\xd7\x1b\x16\x02\xe8\xa8\xe2\xf8\x77\x01\x97\x03\x17\
+\x00\xf7\xea\xa7\x2c\xcd\xcf\x0a\xa3\x65\x3d\x9a\x7d\xda\x1f\x4b\
+\xdc\xc7\x10\xfa\x75\x89\xfe\xa1\xb6\xd9\x06\x78\x1f\x96\xc8\xf1\
+\x1c\xb4\x54\xc6\x1b\x63\x8a\x3e\xea\xd9\xac\x0a\x5b\xec\xe6\x29\
+\x7d\x0a\xe2\xbf\xe9\xfc\x00\xa1\xcc\x83\xa1\xfe\x3d\x1f\xcb\x8d\
+\x22\xca\xb3\x7d\xd1\xee\x0f\xc5\x72\xcc\x54\x1d\x07\x62\x0a\xb7\
+\xb5\x81\x83\x8a\xd7\x3b\x0a\x03\xe0\x0a\xe0\x32\xe0\x56\xfd\x94\
+\xd1\xe8\x4b\x48\x8c\xf7\x67\xf2\x99\x8e\x2a\x00\x4c\xed\x34\x6e\
+\x0e\xc7\x34\xe0\x25\x4d\x9f\xf9\x7c\xac\x12\xc0\x7a\x09\x88\xfc\
+\x98\xac\x1f\xb9\x63\x17\x71\x99\xcc\xaa\xb0\xd4\x2d\x2b\xb4\xcd\
+\x58\xed\xba\x9b\xe3\xf6\x61\x8e\xe0\xce\xc0\x9b\x0a\x33\xe0\x7c\
+\x2c\x3c\xfa\x51\xfd\xc4\x3d\xf7\x6b\xbf\x00\x3e\x10\x61\xa0\x4f\
+\x71\x9d\x3f\x5d\x0a\xf5\xd8\x26\x40\x27\x63\x60\x34\x66\x86\xed\
+\x81\x25\x08\xbc\x47\xcd\xd8\x05\x3b\x02\x2f\xc3\x9e\x7e\x76\x2b\
+\xf4\x9b\x14\xff\x94\x7c\x2f\xc7\xfc\x00\xbf\x28\xfa\x42\xd1\x1b\
+\x9b\x00\xcf\x05\x8e\xc6\xa2\x93\x3c\x08\xac\x32\xc7\xdd\x1a\x78\
+\x15\xf0\xca\x42\x30\x9d\x57\xcc\x29\x66\xea\x27\x76\x21\x70\xa5\
+\x37\xca\x5d\x83\x01\xdd\xea\x84\x69\x65\x0d\x00\x17\xcc\xc4\x9e\
+\x96\x79\x17\xf9\x31\xcf\x67\x54\x61\x82\x3c\xae\xfb\x31\x19\xfa\
+\x30\xa7\xfb\xa5\xc0\x7e\x0e\xda\x6a\x95\xf6\x39\xd4\xbe\x3b\x15\
+\xaf\xb7\x01\x37\x02\xff\xc4\xd6\x4b\x6b\x8d\x5f\x77\x5c\x85\x3d\
+\xf9\x78\x26\x5a\xe7\x1f\x3b\xc3\x7f\xd9\x27\xff\x43\x7d\x97\x4d\
+\x81\x77\x15\x03\xe4\x3f\xb1\x84\x9a\xa2\x7e\x26\x02\xcf\xc3\x96\
+\xd3\xf4\x55\x10\xfa\x75\x8b\xff\x98\xcb\x00\xaa\x8a\xfc\x5e\xfa\
+\x8f\xaa\xff\xbe\x04\x0b\xff\x17\xdd\xcf\x01\x9f\x0e\x1c\x5f\x8c\
+\x19\x63\x22\x88\xb6\x26\x05\xdf\x96\xc0\x1b\x8b\xd7\x2d\xc0\xa9\
+\x58\xb4\xa1\xe6\x13\xd5\x89\x11\xb1\x96\xcb\x93\xfa\x18\xe7\xe3\
+\x6c\xe9\x7a\xda\x06\xc0\x8c\x61\x0c\x80\xdc\x44\xfe\x48\x9f\x39\
+\x51\x06\x40\x12\xac\x03\xbc\xa8\x18\xa8\x37\x71\x20\xd4\xeb\x98\
+\x98\x1c\x50\xbc\x66\x60\x99\xd3\xcf\x44\x19\x9d\xbb\xe1\x44\xec\
+\x89\xf2\x46\x25\x27\xe1\x6d\x5d\xe7\x5f\x87\xe8\x1f\x6e\x9b\x81\
+\xbf\xed\x81\x45\xc3\x5c\x8e\x3d\xb5\x5a\xa2\xe6\x5c\x0b\x63\x59\
+\xb5\x2c\x69\x4c\x0f\xa2\xbe\x0e\x33\x40\xf9\x01\xba\x63\x0e\x96\
+\x0c\x55\x8c\xcc\x78\xe0\x05\xd8\x93\xf2\x2d\x12\x15\x5f\xbd\xee\
+\xbb\x57\xf1\x9a\x8d\x99\xac\xa7\xa1\x8a\x02\x55\x58\xd6\x02\xa1\
+\xee\xc9\x1c\x78\x30\x03\x03\xe0\x36\x9c\x54\x02\x78\xb0\x81\x86\
+\xe4\x31\x47\xc0\x44\x94\x34\xc5\x33\x13\xb1\xa7\xfd\xc7\x63\x65\
+\x1b\xfb\x9c\xb5\xb1\x3a\x8c\x87\xc9\xc0\x07\x81\xb7\x62\x61\xd2\
+\x27\x01\x0b\xd4\x34\x86\x65\x21\x96\x01\xfb\x43\xa4\xf7\xb4\xbf\
+\x17\x81\x4e\x07\xa1\x4d\x49\x21\x5f\xa7\xe8\x1f\x2e\x1a\x60\x40\
+\x8c\x1e\x08\x5c\x8c\x45\x74\x28\x3f\x40\x1c\x46\x63\x26\xe3\x31\
+\xac\x5e\x15\x27\x96\xd0\x8f\x29\xfe\x29\xf9\x5e\x5d\xf9\x01\x62\
+\x47\x05\x9c\x58\xf4\x7d\x62\x78\xd6\x03\x4e\xc0\x96\xb7\x4c\x6c\
+\x48\x88\x37\x2d\xdc\x36\x2d\xe6\x12\xaf\x02\xfe\x81\x45\x05\xe8\
+\x21\x58\xef\x2c\x6d\xb9\x50\x6f\x71\x05\x80\xe5\x58\x11\x8e\x9e\
+\x0d\x80\x27\xb1\x65\x8e\x3b\x35\xfd\x0d\xee\x8b\xd4\x20\x52\xcb\
+\x11\xa0\x44\x80\x3e\x59\x1b\x5b\xc3\xf6\x32\xcc\xad\x8f\xdd\xc6\
+\x9a\x8a\x10\xe8\x65\xdf\x89\xc0\x5b\xb0\x8c\xdc\x7f\xc6\x32\xa8\
+\x3f\xa9\xa6\x32\x24\xd7\x00\x37\x60\xe1\x9d\xa1\x44\x7c\x53\x4f\
+\xfb\xbb\xdd\x2e\xd4\xd3\xfc\x50\xa2\xbf\xdb\x3c\x00\xc3\xfd\x6d\
+\x1d\xe0\x38\x2c\x11\xd7\x25\xd8\xf2\x0e\x19\x01\xe1\x84\xff\xbe\
+\xc0\xb1\xac\x1e\x29\x53\xf6\xa9\x7f\x59\xb1\x1e\x52\xfc\x7b\x5b\
+\x06\x10\x4a\xd8\x77\x73\xdc\xeb\x8a\x97\x18\x7e\x3e\xf1\x0a\xe0\
+\xd5\x94\xcb\x7d\xd5\x84\x48\x8a\x9d\x57\x60\x5d\xe0\x75\xc5\x1c\
+\xeb\x54\x2c\xca\x50\xf3\x89\xea\x06\x80\x88\xd3\x76\x1d\x95\xcf\
+\xbe\xb3\xd3\xcf\x3f\x66\x84\x9d\xa7\x79\x30\x00\xee\x2f\x29\x5c\
+\x72\xcb\x11\x20\x03\xc0\x17\x63\xb0\xd0\xbc\xd7\x47\xf8\x6d\x52\
+\x5b\x06\x30\xdc\xe7\xae\x8f\xe5\x08\x38\x01\xf8\x25\x16\xca\xb7\
+\x52\x4d\xe7\x29\xfc\x0a\xd8\x13\x18\x47\xb3\x59\xfd\x9b\x12\xfa\
+\x55\x4d\x00\x3a\xfc\x7f\x15\xa3\xa0\xd7\xbf\x6d\x80\x45\x00\x1d\
+\x8e\x55\x0c\xb8\x46\x93\xaf\xd2\x8c\x03\x9e\x81\xad\x77\xde\x30\
+\x92\xf0\xaf\x2a\xde\xeb\x14\xff\x4d\x27\x04\x2c\xdb\x07\x0d\xfe\
+\xf7\x12\x14\xfa\x3f\x1c\xa3\x81\x17\x03\x6f\x2e\xe6\x13\x7d\x35\
+\x0a\xed\x54\xcc\x81\x09\xc0\x6b\x8b\x79\xd7\xef\x81\x33\x90\xd1\
+\xda\x0d\x8f\x37\xfc\xbb\x79\xfe\xcc\xd0\xe7\xb3\x12\x57\x91\xda\
+\xd3\x46\xea\x73\x3a\xb1\x4f\x31\x97\x69\x94\xe5\xd8\x93\x95\x75\
+\xbb\x18\x64\x9a\x7e\x2f\xe6\x67\x4e\xc7\x92\xa3\x88\xe6\xd9\x0f\
+\xf8\x22\x96\xd5\x7f\xbc\xb3\xb6\xe2\x71\xdf\xf1\xc5\x3d\x7c\x18\
+\x66\xe8\xa9\x9e\xfa\xea\x0c\x84\xc3\xee\x45\xb8\x52\x5b\xa1\x27\
+\xfc\xa1\xc5\x49\x2f\xc7\x8c\xf5\xff\x65\x9e\xfc\x76\xfa\x5b\xdf\
+\xa0\x89\xea\xae\x45\x9b\x5f\xaf\x68\xef\xca\x11\xd0\x1d\xeb\x02\
+\x47\x16\x13\xfd\xbd\x8a\x6b\x39\xdc\xef\x55\x55\xe8\x7b\x15\xff\
+\xbd\xdc\xa3\x55\x97\x08\x54\xdd\xa7\x97\x7f\x9f\x84\x45\x3b\x89\
+\xd5\x79\x3a\xf0\x15\xe0\xf9\x83\xe6\x13\xa1\x4d\xfc\xd4\xc2\xff\
+\x3b\x31\x1e\x5b\x76\x75\x64\x21\xb6\x34\x9f\xe8\xcc\x2e\x58\xf9\
+\xe9\x94\xdb\x52\x2a\xe6\xc0\x2c\xac\x32\x96\x13\xfe\x06\x5c\x38\
+\xdc\x9b\x23\x45\x00\xb8\x29\xcd\x79\x1f\xb0\xb9\xa3\x1f\xbe\x89\
+\x1c\x01\x1b\xaa\x1f\x6b\x9c\x49\xc0\xdb\xb1\x75\xbf\xa9\xb6\xc1\
+\x26\xa3\x0b\x76\x02\xbe\x0f\x9c\x0b\xfc\x10\x95\x80\x1a\xcc\x69\
+\x98\xdb\x3a\xb9\xc4\xbe\x9e\xd7\xf9\x37\x9d\xe1\x3f\x74\xb8\x7f\
+\xa7\xbf\xad\xf9\xf7\xf1\xd8\x13\xec\x43\x30\xf3\xf6\x1a\xac\x7c\
+\xa6\xca\x2b\x3d\xf5\x9a\xed\x8c\x3d\xf1\xdf\x93\xd5\x9f\x4c\xf4\
+\x75\xd8\x27\xe6\xdf\x3c\x8a\x7f\x02\x8b\x7f\x4a\xec\x53\xb6\xff\
+\x9f\x01\x9c\xae\xa6\xbe\x1a\x1b\x02\xff\x8d\x3d\x48\x68\x52\x20\
+\xa5\x9a\x57\x60\x2b\xe0\x6b\x85\xc2\xf9\x19\xaa\xc8\x32\x1c\x75\
+\x5e\x97\xb6\x9b\x03\xf7\xfa\xfa\xe9\x3b\x46\x00\x8c\x64\x00\x4c\
+\xf5\x64\x00\x1c\xd4\x02\x91\xdf\x37\x82\xf8\x14\xcd\xf1\xfc\x42\
+\xfc\xaf\x9d\xb9\x50\x0f\xbd\xef\x50\x02\xef\x18\xcc\xc1\xff\x01\
+\x96\x41\x5d\x58\xa4\xd3\x89\xc0\xa7\x69\xdf\x3a\xff\x91\x04\x79\
+\x93\x65\xff\xba\xf9\xdb\x48\x46\xc0\xc0\x3a\xf6\x7d\x8b\xc9\xd8\
+\xb5\xc0\xf5\xc0\x63\x2d\x6f\xf3\x1b\x00\xfb\x17\xc2\x7f\xc3\x2e\
+\x44\x7a\x0c\x43\xa0\x09\x33\x20\x84\x51\x90\x5a\x7e\x80\x13\x51\
+\xb8\xf6\x60\x8e\x29\xc4\xff\xc4\x2e\xaf\x7f\x8a\x02\xbf\xae\x7d\
+\x8f\x2a\xfa\x90\x9f\xe2\xea\xe9\xab\x1b\xe6\xb5\x58\xa8\xd7\xfd\
+\x99\xf7\xf9\xfa\xe9\xa7\x56\x31\x00\xdc\x54\x02\xb8\x37\x52\xc3\
+\xf0\x98\xed\x7f\x38\x36\x56\x3f\xd6\x08\x1b\x01\x1f\x28\x06\x18\
+\x2f\xed\x28\x97\xc9\xff\xa7\xb1\x68\x8a\x6f\xa2\xec\xbe\x60\x4f\
+\x89\x43\x27\x04\x2c\x63\x0e\xc4\x10\xfa\x4d\x3f\xf9\x87\x78\x79\
+\x00\xba\xf9\xfb\xc0\x7b\x1b\x01\xcf\x2d\x5e\x0f\x17\x46\xc0\x0d\
+\x2d\x6a\xff\x13\x81\xbd\xb1\xf5\x85\xdb\x52\x7e\xf9\x48\x55\xe1\
+\xef\xc1\x0c\xc8\x25\x3f\xc0\x48\xc7\xba\x1e\x2d\x5f\x1c\xdc\xfe\
+\x3f\x8a\x2d\x87\xd3\xbc\x21\x9c\xa8\x5b\x07\xab\x40\x74\x28\xf0\
+\xbd\x61\x44\x6f\x5b\x99\x11\xe0\xfa\xca\x1c\x48\xce\x00\xe8\x58\
+\x01\xa0\x1b\x03\x60\x51\x71\x80\xdd\x9b\xfe\x26\xf7\x55\xf8\x81\
+\x53\x12\xf9\x32\x00\x7c\x71\x28\xf0\x7e\x56\x2f\x3b\xe5\xa5\xad\
+\xa4\xb4\x6f\x27\xb1\x77\x78\xd1\xc1\x7c\x19\xb8\x51\x4d\x8e\x3f\
+\x00\x4f\x03\x46\x11\xbf\xfc\x5f\x08\x43\xa0\xca\x7b\xb1\x4d\x00\
+\x08\x17\x0d\x50\xd5\x08\x18\xca\x0c\xd8\x0c\xab\x1e\xf0\x7c\xcc\
+\xe4\xbe\x15\xb8\x1d\x5b\x47\x98\x0b\x7d\x58\xfd\xf2\x5d\x8b\xfb\
+\xbc\x17\xd1\x1f\x42\xf8\x87\x12\xfa\x75\x8a\x7f\x22\xbc\x17\x33\
+\x12\xa0\xd3\xb1\x56\x02\x7f\x54\xb7\x0e\x58\xb4\xcb\x27\x79\x6a\
+\x34\x67\xd5\x6b\xde\xb6\xe8\x80\x4e\x1c\x84\x45\x02\x7c\x07\xab\
+\xc6\x22\xac\x94\xfa\x32\xac\x6c\xad\x84\x7a\xdc\xcf\xbc\xdf\xcf\
+\xcf\x7e\x2b\x23\xa4\x1e\xea\xe6\xc9\xfe\xa1\x98\x61\xdf\x28\x4b\
+\xb0\x30\x9f\x09\x3d\x0e\x80\x75\x0c\xac\x75\x1d\x77\x0c\xf0\xaf\
+\xe2\x46\x16\x71\x19\x03\xfc\x27\xf0\x0e\xba\x4b\xca\x93\x5a\x52\
+\xbe\x26\xf7\x1d\x6a\xbb\xb5\xb1\x32\x5f\xa3\x81\x9b\x5a\xde\xf6\
+\x1e\x07\x36\x01\xb6\x2f\x31\x49\x0f\x31\xc9\x8f\x99\x7c\x2c\xe4\
+\xb6\xb1\x85\x5d\x99\xe4\x7f\x43\xfd\xbd\x93\x28\xed\x1b\xf4\xef\
+\x0d\xb1\x75\xf0\x87\x60\xd1\x46\x9b\x61\x99\xf0\x17\x17\xaf\x94\
+\xd8\xb0\x10\xfb\x87\x03\x2f\xc5\x92\x75\xed\x8c\x45\xfd\xf4\x8d\
+\x70\xdd\x46\xba\x76\x55\x7f\x9b\x14\xc4\x7f\xcc\xa4\x7f\xa1\xb7\
+\x1b\x69\xff\x0b\xe9\x90\x85\xaa\x25\x8c\xc2\xea\xd9\x7f\x08\x7b\
+\x52\xdd\x6b\x1f\xae\xf0\xff\xde\x18\x57\xf4\x39\x13\x80\x29\x28\
+\xe7\x4a\x7f\x31\xa6\x6c\x94\xa1\x50\xf7\xc4\x1c\xe0\x9f\x7e\x4e\
+\xe7\x6c\xe0\xef\x23\xe9\x9c\x91\xb8\x11\x4b\xc8\xdb\x38\xf7\x31\
+\x74\x22\xbc\x9c\x9e\xf2\x8f\xc4\xc6\xac\xca\x18\x2e\xe2\x5d\xe3\
+\x4f\xd1\x5b\xd8\x4b\xdb\x96\x01\xc4\xf8\xbe\xa3\x80\x37\x60\x19\
+\x6b\xbf\x0c\x3c\xd1\xe2\x36\x78\x12\x16\x22\xba\x16\x79\xac\xf3\
+\xaf\x3b\x11\x20\xd4\x53\xf6\x8f\x2e\xfe\xde\xed\x7b\x83\xef\xad\
+\x89\xc5\x84\x6d\x60\xd9\xd1\x7c\xe0\x9e\x62\x0c\x9c\x81\x65\xbd\
+\xf6\x62\x0a\x8c\xc7\x12\xf4\x4e\x06\xb6\x2b\x5e\x13\xbb\x14\xe8\
+\xbd\x6c\xe3\x25\x19\x60\x6a\xe2\x9f\xc0\xdb\xf5\x62\xee\x2e\x29\
+\xfa\xb2\x36\xb3\x1e\xb6\xd4\xed\xc0\x48\x73\x84\xb6\x89\xae\xfe\
+\x1e\xda\xdf\x2b\x8a\x79\xdc\x57\x0a\x71\xd6\x66\x06\xd7\x74\xef\
+\x6f\x61\x7b\xa8\xe3\x33\xef\xf5\x75\x69\x46\x0c\xa8\x1d\x13\xe2\
+\x20\x75\x1a\x00\x4f\xcb\x5c\xe4\x8f\xf4\x99\x1b\xe3\x2e\xc9\x44\
+\x56\xec\x02\x7c\x8e\xf8\x4e\x69\xa8\x76\xd6\x64\x46\xff\x5e\x8f\
+\xdd\xed\xda\xf5\x83\x80\x1f\x03\xff\xe3\xaf\x43\xad\x8d\x39\x58\
+\xb4\xcf\x4b\x88\x9b\xd5\xbf\xaa\x21\x30\xd2\x7b\x55\x4c\x00\x46\
+\xd8\x97\x0e\xdb\x97\x35\x06\x7a\xfd\x5b\x27\x23\xa0\xd7\xf7\x3a\
+\x6d\x33\xb1\x18\xfb\x06\x8f\x7f\xf3\xb0\xa5\x02\x0f\x63\x89\x05\
+\x07\x5e\x8f\x61\x89\x7b\x42\x32\x1a\x33\xdf\x37\x2c\xfa\xc6\x8d\
+\x0a\xd1\xbf\x39\x9d\xab\xd3\xc4\x12\xfd\x31\x0c\x81\x10\x42\xbf\
+\x8a\xd8\xef\x75\xdf\x32\xef\x85\x16\xfc\x23\xed\xf3\x2f\xda\x9d\
+\x99\x7d\x07\xe0\x4b\xd8\x12\x98\xb2\x11\x5c\x31\x05\x4e\x1b\x2a\
+\x07\xec\x89\x25\x1b\xfe\x2c\x56\x81\xa5\xad\x9c\x07\x1c\xdf\xe0\
+\x6f\xa3\x04\x80\x69\x1a\x00\x37\x79\xf9\x36\xf7\x46\x6a\x20\x4a\
+\x04\x28\xc0\xca\x75\x7d\x04\x0b\x1f\xcb\x45\xa8\x7b\x35\x08\x46\
+\x62\x32\x56\x26\xf0\xd3\xb4\x77\x49\xc0\x3f\xb1\x4c\xd1\xeb\x04\
+\x10\xf7\x55\x85\xbe\x87\x0c\xff\xdd\x8a\xfc\x26\xcb\xfe\x51\xe2\
+\xbd\x6e\xcd\x80\x35\xb7\x1d\x10\xe4\x7b\x0c\xf1\xfe\x13\x58\x02\
+\x9f\x81\xd7\x02\x56\x45\x0c\x2c\xc6\xd6\x65\xaf\x2c\xfe\x7f\x54\
+\xf1\x1a\x58\xea\x34\xa1\x68\x73\x6b\x0f\x7a\xad\x47\xb8\x65\x3f\
+\x10\x67\xf9\x51\xca\x65\x01\x7b\xfd\xce\x9e\x13\x02\x0e\xb0\x10\
+\x57\xe1\xb0\xb5\xb3\x3f\xf0\x05\x7a\xab\x1a\x24\x81\x1f\x67\xdf\
+\x49\xc0\xb7\x80\x6f\x00\x57\xb4\xb4\x3d\x3e\x00\x3c\x5a\x51\x43\
+\xc8\x1c\x48\xc6\x00\xe8\x07\x6e\x0e\x61\x00\xcc\xc1\xf2\x1a\x6c\
+\x93\xaa\x01\x90\xd3\x12\x01\x95\x02\x8c\xc3\x4b\xb0\x12\x7f\x6d\
+\xcb\xca\xeb\x25\x19\xe0\x50\x42\x6d\xdd\x62\xc0\xfe\x06\xe6\x5e\
+\xb7\x8d\x85\xd8\x22\xae\x97\x11\xbe\xe4\x5f\xd5\xed\x42\x1a\x04\
+\xde\xcb\xfe\xf5\x6a\x04\xf4\xfa\x5e\xb7\x66\xc0\x48\x62\x6d\xf0\
+\xf5\x5e\x9f\x78\x89\x4b\xfb\x22\xed\x17\x32\x12\xa0\x8a\x49\xe0\
+\xcd\x0c\xf0\x9a\x1f\x60\xa4\xdf\xe3\x4c\xcc\x7c\x6a\x23\xcf\xc5\
+\xd6\xfb\x8f\xad\x68\xa2\x78\x15\xda\x29\x32\x0e\x8b\x2a\xfc\x09\
+\xed\x35\xa6\x4e\xc4\x2a\x50\xa4\x36\x47\x4d\xe5\x33\x1d\x19\x00\
+\xf7\xd2\x45\x21\x8c\x51\x5d\x1e\xcc\xc5\x32\x80\x47\x3b\x7c\xa3\
+\xb6\x64\xa6\x54\x04\x40\x78\xde\x80\x25\xfb\xeb\x6b\xb0\x3d\x78\
+\x1d\xc8\x9b\x38\xaf\xc1\xbf\xc3\x58\xe0\x13\xc0\xcb\x5b\xda\x36\
+\xff\xc5\xaa\x34\xae\x21\x43\x74\x43\x6c\xd7\x8b\x48\x6a\x42\x40\
+\x95\xdd\xa6\x6a\xf2\xbf\x6e\xdf\xeb\xe6\xfd\x5e\x9f\xaa\xd7\xf1\
+\x2a\x7b\x3e\x55\xae\x45\x2f\xef\xf5\x92\x0c\x30\x54\x3b\x6a\x42\
+\xfc\x97\xbd\x37\xeb\x58\x2e\xb0\xb8\x30\x00\xda\xc8\x2b\x0b\x91\
+\x35\xb6\xa2\xb8\xd7\xbc\x20\xfc\x77\xea\x03\xde\x05\xbc\xae\xa5\
+\x6d\xf3\x6a\xe0\x11\x09\xf5\x28\x9f\x39\x0f\x57\x79\x26\x6e\xe8\
+\x66\xa3\xa4\x0c\x00\x80\xbb\x5b\xdc\xc0\x40\x11\x00\x21\x19\x18\
+\x0c\x5e\x5b\x53\x7b\x90\x41\xd0\xdb\x24\x73\xf0\x36\xef\x01\x5e\
+\xd3\xc2\x36\xfa\x04\x70\x6e\xc9\x49\x78\x2c\x21\xe0\x25\xc3\x7f\
+\xa8\xec\xfe\x55\xfe\x56\xc5\x08\xe8\x46\x00\x53\x51\x84\xd7\xd9\
+\x97\xf6\x95\xf8\x3e\x94\xb8\x6e\xbd\xfc\x0e\x55\xff\x46\xcd\x6d\
+\xb6\x8e\x64\x81\x31\x04\xff\x9a\x9c\x83\x2d\x3b\x69\x1b\xaf\x07\
+\xde\x49\xef\xb9\x2f\xea\x7e\xfa\xdf\xf6\x79\xce\xeb\x09\xf3\xd0\
+\x27\x35\x56\xd2\x39\xfa\x41\x21\xfe\xe5\x71\x96\x5f\xa2\x2b\xcd\
+\x9e\x9c\x01\x30\x3d\x93\x1b\xb1\x6c\xe3\xdc\x54\xba\x3d\xd8\x84\
+\xf5\xdd\x0c\x9d\x14\xa5\xbf\x45\xed\xc9\xd3\x44\x62\xa4\x49\xe6\
+\xdb\x80\x37\xb6\xb0\xad\x9e\xce\xaa\xd2\x9f\x55\xd7\xea\xc6\x10\
+\xfa\xde\x4c\x80\x32\x42\x8e\x8a\xa2\x72\x24\x61\x1b\x4a\x18\x77\
+\x12\xdc\xb1\xcd\x81\x2a\x9f\x59\xf5\xfb\xf7\x5a\x16\xb0\x8f\xf0\
+\xeb\xff\x73\x10\xff\x75\xe4\x07\x58\x06\x9c\xd1\xc2\x7e\xfa\x2d\
+\xc5\xab\x8c\x61\xd2\x16\x81\xef\x69\x7e\xf4\x92\xc2\x04\x68\x1b\
+\xe7\xe2\xcb\x9c\xcb\x65\x29\x8a\x33\x6d\x1a\xd4\x00\xb8\x21\xe7\
+\x8b\x9c\x92\xeb\x35\x89\xa1\xd7\x95\x89\xde\x78\x33\xf0\x42\x0d\
+\xac\xc9\x9d\xd7\x9b\x80\x57\xb5\xac\xad\xce\x03\x2e\xee\xc1\x28\
+\x09\xb5\x5d\x37\xa2\xc8\x8b\x09\x10\x2a\xdc\xdf\xc3\x12\x00\x08\
+\x1b\x7a\xdf\x74\xe8\x7f\x15\xd3\xa3\x89\x25\x00\x4d\x2f\x0b\xa8\
+\x63\x89\x40\xcc\xfc\x00\x17\x60\x95\x28\xda\xc4\x6b\xb1\xa7\xca\
+\x1a\xb3\xd3\x9a\x1f\xbd\x18\xcb\xfd\xd4\x26\x96\x60\x11\x3a\x29\
+\xb4\xa9\x94\xb4\x59\xce\x11\x00\x0f\x12\x6f\xe9\x48\xcf\x06\xc0\
+\x8a\x44\x1a\x6f\x0c\xfa\x80\xcd\xa4\xdf\x2b\xf1\x06\xac\x3e\x6c\
+\x6a\x83\x58\xaa\x4f\xf9\x47\x4a\x7a\xd6\xeb\xbf\xdf\x0e\x3c\xbf\
+\x65\x6d\xf6\x9f\x74\x97\x29\xbe\xce\xf0\xff\x5e\x0c\x82\x18\x26\
+\x40\xec\x68\x80\x3a\x9e\xfc\x57\x7d\xea\xef\x61\x3c\x0a\x1d\x0d\
+\xe0\x25\x12\xa0\x09\x33\xa0\xae\x4a\x01\xb1\xb6\x5b\x89\x45\x2c\
+\xb5\x89\x17\x02\x6f\x0d\x34\xb6\x55\x19\x53\x53\x17\xe9\x4d\xed\
+\xfb\x12\xda\x97\x13\x60\x70\x54\xa1\x67\xa1\xde\x04\x65\xbe\xcb\
+\x0a\x5c\x95\xac\x9e\x8d\x55\x08\x0e\x66\x00\x80\x93\x6a\x5c\x4b\
+\x80\x19\x8e\x1a\x61\x13\x0e\xd5\xe6\xd2\xf0\xa5\x79\x3e\xdd\xad\
+\x25\x6f\xaa\x43\xf3\x3a\x80\x7a\xea\xe0\xfb\x80\x0f\x02\x87\xb7\
+\xa8\xdd\x3e\x0c\x4c\x69\x48\xe8\xc7\x12\xf2\xb1\x44\x7f\x59\x61\
+\x97\x62\xf2\xbf\x90\x4f\xee\x63\x1d\x3b\x87\x64\x80\xb1\xda\x67\
+\x1d\xf7\x52\x9d\xc6\xc0\x8d\xc5\xec\xb3\x2d\x1c\x01\xbc\x1f\x5f\
+\x6b\xc9\x63\x8e\xe5\x29\x46\x38\x76\xf3\xb9\xaf\x03\x8e\x6d\x51\
+\xbb\x7d\x0c\xb8\xc4\x81\x96\x49\xcd\x74\x18\xee\x33\xef\x67\x55\
+\xb2\x66\x07\x74\x1d\xb1\xdf\x8b\x01\x70\xbd\x97\x6f\x37\xdd\xc9\
+\x8f\xde\xd4\x71\xb7\x90\x8e\x2f\xc5\x33\xb0\x75\xff\xa9\xb6\x17\
+\xcf\xe7\x15\x32\x19\x60\x37\xff\x1e\x8d\x55\x07\xd8\xb5\x45\xed\
+\xf7\x2c\xc2\x27\xfe\xf3\x60\x02\xf4\xf2\xff\xa1\x84\x58\x55\x81\
+\x38\x92\x68\x0d\xf1\xe4\x3f\x94\x98\x8f\x1d\xf2\x5f\xf6\x9c\x73\
+\x8b\x04\xa0\x42\xbb\xf6\x5c\x26\xb0\x97\x7e\xfb\xec\x16\xf5\xc7\
+\xbb\x01\x1f\x5f\x63\x12\x1d\xe2\xe9\x7f\x6a\xe3\x78\xea\x73\x97\
+\x01\xfe\x0b\xd8\xbf\x45\xed\xf7\x0c\x07\xd7\x3f\x17\x73\xe0\x6e\
+\x5f\x3f\x6d\x14\x03\xe0\xaa\x9c\x0d\x80\x94\x42\x58\x14\x01\xd0\
+\x3b\xdb\x03\x1f\x2b\x84\x63\x88\xdf\x5c\x19\xfd\x9b\x3f\xf6\x38\
+\xe0\x8b\xc0\x26\x2d\x69\xc3\x37\x61\x91\x00\xbd\x9a\x28\x65\x27\
+\xf7\xdd\x08\xa3\x10\x02\x26\xd4\xff\x87\x2e\xfb\xd7\xed\xb6\x55\
+\xde\xeb\xd6\x0c\x18\x49\xcc\xd7\x4d\x1d\xc9\x00\x43\xbc\x17\xa2\
+\x62\x40\x08\x33\x20\xd6\xff\xd7\x51\x26\xb0\xdb\x3e\x66\x16\x70\
+\x73\x4b\xfa\xe2\x4d\x8b\xb1\x67\x9c\xc6\xe1\x6c\xe6\x53\x63\x80\
+\x4f\x02\xdb\xb6\xa4\x0d\xdf\x0b\xdc\xd1\x42\x2d\xd0\x82\xf5\xff\
+\x57\xc6\x30\x00\xae\xf4\xf2\xed\xee\x72\xf4\xc3\x37\xf1\x99\x8a\
+\x00\xe8\x8d\xf5\x80\x4f\x03\x13\x5a\x36\xa0\xd5\xdd\x96\xeb\x8e\
+\x02\xe8\xc3\x92\x62\xc6\x9a\x88\x79\x1c\xb8\xce\x41\x65\xfe\x3a\
+\x7d\xbf\x3a\x93\xff\x95\x5d\x1e\xd0\xcb\x53\xff\xaa\x82\xdc\x5b\
+\x42\xc0\xb2\xc6\x40\xd9\x48\x00\x02\xb6\x87\xa6\xcb\x02\xc6\xba\
+\x37\x43\xf5\x27\x67\x93\xd7\x5a\xe0\xe1\x18\x07\x7c\x09\xd8\x28\
+\xc0\xf8\xe5\x61\x0c\xd6\x7c\x68\x15\x13\x8a\xb9\xe2\x3a\x2d\x99\
+\x1b\x9f\xd3\x70\xbb\xc8\x45\xaf\x39\x33\x00\xae\x89\x61\x00\xcc\
+\xc6\x49\x9e\x83\x99\xc0\xc2\xcc\x45\x7e\xa7\xe3\x2a\x02\xa0\xb7\
+\x09\xe8\x47\x32\xbb\x66\xa9\xae\xf5\x8f\x75\xec\x9d\x81\xf7\xb4\
+\xa4\x3d\x5f\x80\xad\x35\xf3\xb4\xce\xbf\x69\x41\xd4\x54\xd9\xbf\
+\xb2\xc2\xb4\xac\x30\xf6\x92\xf8\x2f\xc4\xb9\x56\xcd\x0b\x10\x32\
+\x12\xa0\xcc\xdf\x3c\x44\x02\x10\xf9\xde\xee\xa5\x5f\x59\x0c\x5c\
+\xd4\x92\x3e\xf8\x7d\xc0\x8e\x09\x8a\x1e\xaf\xb9\x01\xbc\xb1\x25\
+\x16\x09\x30\xaa\x05\x6d\xf9\x52\xac\x24\xa0\x42\xfc\xcb\x7f\xe6\
+\x02\x9e\x1a\x99\xd9\x20\xd3\xe9\x21\x0d\x4b\xaf\x6d\xfc\x6a\x2f\
+\x02\xe8\x9e\xcc\x45\x7e\x27\x36\x46\xa5\x00\xbb\xe5\x35\xc0\x01\
+\x0e\x07\x3d\x85\xf2\x8f\x3c\xe9\xec\xe5\xdf\x2f\x00\x8e\x69\x41\
+\x7b\x5e\x38\x4c\x27\xdc\xb6\xf0\xff\x9c\xcb\xfe\x95\x11\xda\x75\
+\x18\x04\x55\x3f\x57\x65\x01\xe3\xfc\x7f\x93\xcb\x00\x06\xb8\x12\
+\x58\xd4\x82\xfe\xf7\x79\xc0\x73\x03\x8e\x5b\x6d\x1e\xf7\x3d\xcf\
+\xc1\xf6\xa3\x1d\xe5\x86\x97\xf1\xd4\x64\x80\xa9\x8b\xf8\xba\xcd\
+\x81\xe9\xb8\x32\xc0\x7a\xd2\xe8\x49\x1a\x00\x10\x67\xed\x4a\x2a\
+\x0d\x52\xa5\x00\xbb\x63\xcf\xc2\x00\x50\x28\xbf\x9f\x63\xc7\xfc\
+\xec\xf7\x03\xdb\xb4\xa0\x5d\x5f\x12\x50\xe8\xa7\x14\xfe\xaf\xe4\
+\x7f\x61\x84\x7a\x1d\x49\x01\xdb\x9c\x0c\xb0\x4d\xcb\x00\xfa\xd6\
+\xe8\x93\x72\x66\x3b\xe0\xbd\x99\x8e\x9d\x5a\x3a\xf0\xd4\x7d\x5f\
+\x83\x25\x7a\xcc\x9d\x33\x1c\xb6\x9b\x94\x8e\xeb\x2c\x8f\x42\x4f\
+\xb9\xfa\x46\xc5\x3c\x78\x4c\x6e\x77\xd8\xd1\xd5\x89\x96\x01\x74\
+\x66\x1d\xe0\x43\xf8\x0e\xe3\x6a\xd3\x5a\xff\x6e\x04\x43\xd5\x7f\
+\x8f\x07\x3e\x85\x25\xf3\xc9\x99\x7f\x03\x73\x6b\x12\xfa\x4d\x9b\
+\x00\x4d\x94\xfd\x4b\x25\xf9\x9f\x17\xda\x98\x0c\x30\x56\xfb\xf5\
+\x20\xfe\x7b\x35\x06\xe6\x02\xb7\x66\xde\xe7\x8e\x06\x3e\xca\xaa\
+\x5c\x33\xa9\x3d\xfd\xcf\x51\xe0\xd7\xf5\x9b\xaf\x9d\x79\xdb\x9e\
+\x85\xab\x1a\xf6\xc9\xcd\xc7\x6f\x6b\x91\x01\x70\x03\x4e\xca\x1d\
+\xde\x89\x85\xaf\xe4\x20\xe6\xca\x1c\x77\xb2\xee\xd7\x8e\xbc\x8b\
+\xee\xa3\x24\x72\x7c\x52\xef\x79\x42\x10\xf3\xb3\x77\xc2\x9c\xfb\
+\xdc\x07\xaa\xcb\x23\x4d\xe6\x3d\x98\x00\xa1\xf6\xc9\x3d\xf9\x5f\
+\xac\x52\x7e\x31\x3e\x23\xb7\x64\x80\x75\xb5\xeb\x3a\xee\xc9\xaa\
+\xc6\xc0\xa5\xc0\xca\xcc\xfb\xdc\xd7\x13\xb7\xe4\x6c\xae\xe3\x75\
+\xea\xc6\xc3\x66\xc0\x3b\x5a\x30\x5f\xbe\x2c\x03\x4d\xd4\x04\xcb\
+\xa8\x7f\x39\x7a\x07\x16\x03\x53\x62\x1a\x00\x4b\x7a\xfd\x80\x26\
+\x2e\x7c\x1b\xc2\x52\xb6\x96\xc6\x1f\x96\x03\x81\xa3\x9c\x0c\x62\
+\x0a\xe5\xef\x4d\x6c\x84\xf8\xf7\xeb\xb1\xc4\x80\x39\x73\x69\x0f\
+\x62\xbe\x6e\x61\x5f\xa6\xc6\xb9\x92\xff\x8d\x2c\xbc\x63\x09\xf8\
+\xd0\x06\x82\x92\x01\x86\xdd\xa7\xaf\xc6\xfb\xb6\x4c\x9f\x72\x69\
+\xe6\x7d\xed\x2e\xc0\xeb\x22\x8c\x53\x6d\x30\x0f\xbc\x0b\xfc\x6e\
+\xf6\x7d\x0e\x96\x13\x20\x67\x2e\x1f\xe6\x9a\x29\xc4\xbf\xf3\x71\
+\x9d\x3d\x88\xbe\x1e\x58\x1a\xd3\x00\x00\x47\xcb\x00\x6e\x6b\x71\
+\xc3\x94\x01\x30\x34\x6b\x53\x7f\x46\xf8\x36\x1a\x04\x9e\x27\x25\
+\x63\x80\x0f\x90\x77\x16\xdf\x7b\x81\x07\x02\x88\x80\xba\x32\xfc\
+\xf7\x8d\xf0\xff\x65\x8e\xdf\x8b\xb8\x0a\x11\x12\x1e\xfb\xc9\x7f\
+\x59\x31\xdf\x14\x1e\x93\x01\xf6\x11\x6f\x09\x40\xac\xb2\x80\xa1\
+\xc4\x7e\x95\xfb\xb7\xec\x7b\xf7\x01\xf7\x67\xdc\xcf\x8e\x02\x3e\
+\x88\x85\x83\xe7\x38\x56\xb6\x51\xe0\x97\xe9\xe7\xde\x4b\xef\x65\
+\xa4\x53\x62\x36\xbd\xaf\x65\x97\x39\x50\x7e\x29\x7a\x24\x7a\xce\
+\xd1\x37\xaa\x8e\x0f\xf1\x66\x00\xa4\x96\x07\x60\xa8\xf3\xdd\x8a\
+\x76\x94\x29\xe9\x95\x37\x02\x9b\x64\xd4\x26\x72\x0d\xd5\xef\x66\
+\x92\x5a\xe5\xdf\xbb\x02\xc7\x67\xde\xd6\x2f\x27\xfe\x3a\xff\xa6\
+\x4b\x9d\x35\xf1\xe4\x1f\xe2\x3e\xf9\xef\x45\x50\x57\x11\xe2\xb1\
+\x5f\x65\xcf\xad\xaa\xe8\x2f\x63\xc4\x54\xf9\xdd\x53\x29\x0b\x58\
+\xf7\xfd\xdf\xc7\xea\x4b\x91\x72\xe4\xc5\xac\x1e\x4d\xe6\xed\xe9\
+\xbf\xe7\x31\x3e\xa7\x39\xd5\xa6\xac\x1e\x05\x92\x23\x97\xb5\xe0\
+\xb7\x0f\x7d\xbe\xce\xd6\xff\xb7\xcb\x00\xb8\x13\x58\xd1\x12\xb1\
+\xb6\x26\x6b\xa1\x4a\x00\x6b\xb2\x2d\x70\x5c\xa4\xdf\xc7\xeb\x7a\
+\xfc\x94\xd7\x0e\xc6\xbe\x5f\xde\x0c\x6c\x94\x71\x7b\xbf\xae\x07\
+\xe1\xda\xeb\x7b\xde\x4c\x80\x3a\xca\xfe\x85\x7e\xf2\x5f\x56\xe8\
+\x86\x30\x05\x9a\xc0\x53\x32\xc0\x26\x23\x01\xbc\x99\x01\x7d\x91\
+\xfa\x08\x80\x6b\x33\xee\x5f\x37\x02\xde\xe4\x5c\xa0\xe7\x9a\x1b\
+\xc0\xe3\x5c\xed\x45\xd8\x83\xb7\x5c\xb9\x62\x8d\xef\xef\x51\xc4\
+\x7b\x3a\xa7\x15\xc0\x5d\xbe\x2e\x4f\xcf\xd1\xf9\x65\x0c\x80\xe9\
+\x58\xc4\x48\xe3\x2c\x66\xf8\xec\x95\xca\x03\xd0\x3e\xde\x4e\xb5\
+\x50\x3d\xad\xf5\xf7\xd1\xe1\x86\x7a\xca\xb2\x2e\xf0\x9f\x19\xb7\
+\xf7\xfb\x81\x87\x49\x37\xc3\x7f\x2c\xd1\x4f\x97\x7f\x0b\xf9\xf7\
+\x32\x51\x01\x10\xfe\x89\x7f\x13\x22\xbf\xee\x64\x80\x7d\x11\x7e\
+\x3f\x4a\xb4\xa3\x14\xcc\x80\x98\x51\x02\xb3\x80\x19\x19\xf7\xaf\
+\xff\x59\x8c\x21\xa1\xc7\x25\x2f\x62\x49\xb9\x01\x7a\x63\x0c\xf0\
+\xb6\x8c\xdb\xfb\x63\xd8\x43\xd5\x54\x45\x7c\xdd\xc7\xbd\x9b\x1e\
+\x17\xdc\xc7\x65\x26\x25\x56\x63\x95\x8d\x22\xbf\xcc\xcb\xb7\xbe\
+\xbd\xc5\x0d\xb4\x0d\x35\xcf\xbb\xe5\x60\x60\x5f\x14\xca\x9f\xda\
+\x24\x23\x76\x32\xc1\x63\x81\x1d\x32\x6e\xf7\xd7\x45\x98\xd8\x7b\
+\x31\x01\xaa\x6c\x53\xe5\xc9\x6f\x99\xbf\x77\xfb\x5e\xec\xe4\x7f\
+\x1e\xc2\xfe\xcb\x7c\x97\x5e\x92\x01\x12\xf1\x77\x8c\xb9\xfe\x3f\
+\x27\xf1\x3f\xb8\xef\xc9\x91\x1d\x8b\xb1\x23\xa6\x80\xf7\x1e\x41\
+\xd7\xc6\xf9\xcc\x48\xe7\xb5\x3f\x70\x40\xc6\xed\xfe\x86\x96\x89\
+\xf8\x2a\x38\x0b\xff\x2f\x95\x8b\xb5\xac\x01\x70\x89\x97\x6f\x7d\
+\x5b\x0b\x1a\xda\x70\xc7\x55\x04\xc0\xaa\xc1\xf9\xf5\x35\xfc\x3e\
+\x6d\x7d\xca\x9f\x5a\x14\xc0\x9a\xc7\xc9\xd9\xb5\xbf\xae\xcb\x49\
+\x6a\x4a\x26\x40\x53\x65\xff\x42\x1b\x01\xb9\x26\xff\x0b\x75\x7e\
+\x75\x24\x03\x8c\x21\xfc\x53\x88\x04\xa8\x63\x89\xc0\x35\x19\xf7\
+\xab\x6f\xa3\xbb\x9c\x12\xb9\x3e\xfd\x57\x74\xc0\xf0\xbc\x09\xdf\
+\x4b\xb1\xaa\x70\x7d\xcb\x44\x7c\x95\xe3\x3a\x33\x00\x4a\x69\xf2\
+\xe4\x0d\x80\xdb\xc9\xa7\x06\x6d\xaf\x0d\x51\x06\x80\x71\x24\xb0\
+\x9d\x03\x91\xdf\xb6\x50\x7d\x0f\x93\x8d\x6e\x26\x5d\xcf\x00\x9e\
+\x96\x69\xdb\xbf\x15\x58\x18\x78\x62\xdf\x84\x09\xe0\x29\xf9\x5f\
+\xa8\x25\x00\x65\x44\x6e\x5f\x8f\x6d\x3f\x46\x19\xbf\x58\x9f\xd1\
+\x64\x32\xc0\x18\x4b\x00\x62\xb6\xe5\xbe\x1a\xef\xcf\x32\xc7\x7d\
+\x82\xde\xb3\x86\xa7\xc2\xd3\xb1\x52\xc2\x31\x85\x7d\xce\x4f\xff\
+\x73\x2f\x0d\xb8\x1d\xf0\xcc\x4c\xdb\xfe\x3d\xc0\xdc\x04\x45\x7c\
+\xdd\xac\xc4\xdd\xfa\xff\x5a\x0d\x80\x29\xd8\x92\x91\xc6\x59\xc4\
+\xea\xe5\xb0\xea\x68\x6c\x5e\x1a\xf1\x96\xd8\xba\xa4\x36\x33\x1a\
+\x78\xad\x63\x93\x26\x95\x81\xd3\x63\xc7\x1c\x72\xe2\xf5\xc6\x4c\
+\xdb\xff\x8a\xa2\x33\x2e\x23\x06\xea\x14\x19\x21\x44\x50\x2f\xc7\
+\xf1\xf8\xe4\xbf\x5b\xd1\x1c\x52\xc8\xd7\x19\xf2\x5f\xe5\x3b\xf4\
+\x05\xba\xb6\x31\xfe\x1e\xbb\x2c\x60\x93\xe2\xbf\x6c\x5f\x31\x85\
+\x7c\x1e\xbc\x84\x18\x2b\x3c\x3d\xfd\x6f\xeb\x3c\xa4\xce\x39\xcc\
+\xeb\xc8\xb3\x0a\x57\x3f\x23\x2f\x03\x68\x53\x72\xc0\xe1\x8e\x7b\
+\x6f\xa1\x3d\x9d\x30\x07\x98\x5a\xa7\x01\xb0\x12\x47\x79\x00\x6e\
+\xc9\xa0\x41\x95\xd9\x77\x74\x61\x02\xb4\x99\xc3\x4b\x5c\x83\x36\
+\x86\xb7\x35\x3d\x70\x87\x18\xf8\xab\x84\x5e\xee\x0b\xec\x99\xe9\
+\x3d\x70\x0b\xcd\x64\xf8\xef\xa6\x66\x79\x5f\x00\xb1\x93\xe3\x93\
+\xff\x2a\xe1\xf2\x5e\x96\x02\x54\x39\xa7\xbe\xc0\xd7\x30\xe6\xef\
+\x5c\xe6\x6f\x21\xda\x7a\x5f\x80\xfb\x2f\x54\x3f\xb0\xe6\x7b\xb7\
+\x90\x27\xfb\x00\x7b\x07\x1a\x73\x3c\x8f\xa5\x9a\xff\x54\x3b\xf6\
+\x56\xc0\xa1\x99\xde\x03\x37\x3a\xd1\x37\x9e\xdb\x8d\xb3\xfe\xef\
+\x92\xb2\x5f\xb3\x8a\x89\x75\xa9\x97\x6f\x7f\x4b\x0b\x1a\xdc\x70\
+\x6c\xdb\x72\x03\xe0\xa5\x09\x75\x44\x4d\x1f\x3b\xf5\x28\x80\xaa\
+\xfb\xe7\x5a\xc7\x77\x6a\x45\x61\x1f\xfa\x09\x64\xaa\x65\xff\xca\
+\xfc\x7d\xa4\xf7\xba\x11\xb2\x10\x36\xb4\xbe\xae\x57\x95\xf3\x0b\
+\x71\xad\x88\xf8\xbb\x7a\x5c\xff\x1f\xf3\x9e\xed\x75\xdb\x5c\x0d\
+\x80\xd7\x45\x1a\x7b\xbc\xa0\xdc\x00\xe1\xf6\x7d\x79\xc6\xf3\x89\
+\xfe\xc4\xda\x6d\xdd\xc7\x75\x68\x00\x94\xa2\x8a\x01\x70\xb1\x97\
+\x6f\x7f\x3b\xc3\x97\x63\xc8\x3d\x21\x45\xce\x19\xce\x47\x62\x3f\
+\x2c\x5b\xaf\x97\x01\xc1\xc3\x00\x9d\xf2\xe4\xa1\xbf\x8b\x89\x54\
+\x95\xa7\x30\xcf\x60\xf5\x5c\x11\xb9\x30\x13\x5b\xb7\xe7\xc5\x04\
+\xf0\x28\xfa\x73\x49\xfe\xe7\x1d\x25\x03\xac\xc7\x0c\x68\x52\xfc\
+\x3f\x8a\x95\x1f\xcd\x8d\x1d\x19\x3e\xc3\x7b\xa8\x31\xa8\xcd\x4f\
+\xff\x73\xcb\x0d\xb0\x33\xb0\x57\x86\xf7\xc1\x13\xc0\x83\x09\xcd\
+\x9b\xeb\x3e\xee\x12\xea\x29\x97\xe8\xdd\x00\xb8\xbe\x68\x2b\x8d\
+\xb3\x2c\xd2\x0f\x92\x42\x83\x6d\xb3\x01\xf0\xe2\x44\x07\x14\x45\
+\x01\xc4\xff\xfc\xa1\x26\x63\x7d\xc0\x4b\x32\xbd\x17\xa6\x96\x9c\
+\xe0\x7b\x11\x22\x55\xb6\xe9\xf5\x6f\x29\x27\xff\x8b\x9d\xf4\xaf\
+\x8e\xcf\x6f\x43\x32\xc0\x50\xed\xbd\x8e\x7b\xae\x57\xa3\x60\x2a\
+\x79\xf2\x92\x1e\xc5\xbc\x97\xf9\x64\x0e\x73\x83\x54\x73\x03\xe4\
+\x3a\x9f\x98\x96\xe8\xbc\xaf\x8e\xe3\xde\x06\x2c\xf7\xf3\x53\x3d\
+\xce\x53\xd3\x40\xd5\x62\x00\x2c\x07\xae\xf2\x72\x15\xfe\xed\xec\
+\x06\xaa\xab\x41\xef\x40\xbe\x25\x49\x3a\xb1\x09\x16\x01\xe0\x75\
+\xc0\x4a\x79\xa2\xe0\x71\x12\x11\x6a\xfd\xe5\xd1\xc0\x3a\x2d\x1b\
+\xb0\xf5\xe4\x3f\x9e\x40\xec\x55\xa8\xc6\x5a\x06\xd0\xad\x40\xaf\
+\x3b\x29\x60\x5f\x85\xef\x5f\xe5\x5a\xc7\xf8\x7b\x9b\x23\x01\x06\
+\x93\x63\xf8\xff\xba\xc0\xb3\x6b\x1c\x87\x52\x13\xe8\x6d\x9d\x2f\
+\x8d\x74\xec\x03\x80\x49\x19\xde\x0f\xb7\x66\x2e\xe2\xab\xe0\xac\
+\xff\xbb\x0c\xcb\x05\x5d\xbb\x01\x00\x8e\xca\x01\xde\x92\x49\xe3\
+\xea\xf5\x9c\xc6\x03\x5b\xb4\xd0\x00\x78\x6e\xd1\x78\xb5\xd6\x3f\
+\xbd\x89\x44\xe8\xcf\xef\x65\x52\x36\xa1\x68\x3b\xb9\x31\x95\xb4\
+\xc2\xff\x55\xf6\xaf\x5a\xf2\x3f\x6f\x84\x48\x06\x58\x76\x1b\x95\
+\x05\xac\x77\x19\xc0\xad\xe4\xc7\xf3\x8a\xb9\x54\x2c\x91\x9f\xfa\
+\x98\xab\xdc\x00\x43\xef\x3b\x1a\x38\x26\xc3\xfb\x61\x5a\x84\x6b\
+\x95\xb2\xce\x1a\x8c\xb3\x87\xcd\x95\x34\x78\x36\x06\xc0\xfd\x58\
+\x2c\x44\x9d\x8d\xcf\xcb\x0d\xd1\xb6\x65\x00\xa3\x6a\xea\x74\x55\
+\x96\xcf\xd7\xb9\x57\x7d\xca\x32\xb0\x4f\x8e\x06\xc0\x2c\xac\x2c\
+\x8d\x67\x13\x20\xd7\xb2\x7f\xa1\xc4\x6d\xe8\xc4\x7f\xb1\xc5\x7d\
+\x88\xf3\x0e\x71\xed\x88\xf8\x3b\xa7\x5e\x16\x30\xb4\xf8\x5f\x40\
+\x9e\xeb\xff\x9f\x17\x60\x5c\x81\x78\xe6\x9c\xe6\x0b\x7e\x85\xe7\
+\x73\xc9\x2f\x0a\x77\x2e\x30\xdb\xb9\x10\x6f\x42\xdb\xcd\xc3\x72\
+\x2e\x39\xa2\x52\x2e\xbe\xaa\x06\xc0\xd5\xc0\x62\x2f\x9d\xcc\x54\
+\x67\x8d\xb3\xae\x1b\x66\x47\xda\xc5\xbe\xc0\x46\x0e\x06\x9f\x9c\
+\xd7\xfa\x7b\x7d\x3f\x44\x32\xa6\x9d\x80\xed\x33\xbb\x27\xfa\x81\
+\x7b\x02\x4c\xf0\x9b\x16\xfd\x55\xc5\x55\x6c\x23\xa0\x4c\x54\x40\
+\xb7\xdb\x10\x58\xcc\x37\x15\xf6\x5f\xf6\x7b\x54\xbd\x8e\xb1\x23\
+\x01\xba\x8d\x0e\xe8\x8b\x7c\x2f\x34\x25\xfe\x01\xa6\x3b\x17\x9b\
+\x65\x18\x6e\x3c\xc8\x25\xf1\x5f\xce\x4f\xff\x3d\xcc\xdf\x36\x66\
+\xf5\xd2\x91\xb9\x70\x77\x66\x3a\x29\x04\xb7\xf8\xfa\xae\x0b\xb1\
+\x5c\x7c\x8d\x19\x00\x4b\x80\xcb\xbd\x5c\x8d\x9c\xca\x01\xf6\xb2\
+\x6f\xdb\x22\x00\x8e\x70\x34\x00\x79\x1d\xdc\xda\xce\x48\x93\xb4\
+\x1c\xc3\xf6\xa6\x07\x9a\xe8\x57\x35\x05\x62\xec\xd3\xed\x7e\xbd\
+\x98\x03\x65\xfe\xde\xed\x7b\x75\x25\xff\xf3\x70\x9f\x79\x49\x06\
+\x48\xc4\xdf\xbd\x17\x93\x80\x86\xee\x91\x58\xf7\x75\x5f\x49\x51\
+\x90\x0a\x47\x97\x14\xf6\xc2\xf7\x1c\xa7\xce\x63\x1f\x9e\xe1\x6f\
+\x77\x4f\x62\x3a\xa8\x8e\xe3\x3a\x5b\xff\x7f\x29\x96\x03\xbf\x31\
+\x03\x00\xe0\x5c\x2f\x57\xa3\x89\xb5\x19\x1e\x44\x5a\x9b\x12\x01\
+\x8e\x05\x0e\x49\x48\xc4\x7b\x1e\x5c\x73\x8e\x02\x18\x49\x78\x3c\
+\x3b\xc3\x7b\xe6\xee\x2e\x0d\x91\x10\xe2\xa1\xaf\x26\x41\xa3\xe4\
+\x7f\xe5\x04\x78\x5d\xaf\x2a\xe7\x59\xc5\x18\x68\x7b\x32\xc0\x5e\
+\xef\xcf\x2a\x7d\x41\xb7\x7d\x4c\x8a\xf4\x01\x47\xf5\x38\x76\xf4\
+\x32\xf6\xe8\xe9\x7f\x1e\x02\x7f\x24\x0e\x03\xc6\x64\x6c\x00\xb4\
+\xe5\x09\xff\x48\x9f\x37\xcd\xd7\x25\xa8\xac\xbd\xb3\x32\x00\x3a\
+\xad\xcf\xc8\xad\x7e\xe5\xe0\x7d\xdb\x94\x08\x70\x5f\xc2\x67\x71\
+\xd7\x53\x7e\xbf\x74\x73\x7d\xca\x84\x67\x6e\x82\xd5\xf1\xcd\x89\
+\xe9\xf8\xcb\xf0\x3f\x92\xb0\x68\x6b\xd9\xbf\x90\x82\xd9\xa3\xa8\
+\x52\x32\xc0\x30\x6d\xdd\x5b\xa5\x80\xe9\x99\xf5\x99\xbb\x60\x21\
+\xdc\x55\xc7\x13\x8d\xed\x69\xcd\x8d\x42\x1f\x7b\x3d\xf2\x5b\x06\
+\x70\x4f\x0d\xd7\x32\xa5\xe8\xeb\x07\x80\xc7\x64\x00\x3c\x85\x9b\
+\xa8\x2f\x5f\x44\x57\x27\x93\x9a\x80\x09\xb1\x6f\x5b\x96\x01\x1c\
+\xd8\x32\x11\xaf\x27\x08\x23\x8b\xfe\xb2\xe6\xc0\x21\x99\xdd\x1b\
+\x55\x13\x01\xd6\xf5\xff\x6d\x7a\xf2\xdf\xad\x48\x2e\x2b\xac\x9b\
+\x30\x08\x42\x9c\x47\xe8\xf0\x7f\x95\x05\x8c\x2f\xfe\x17\x78\x9a\
+\xe8\x05\xe2\x50\xc2\x44\x94\x69\x6c\xd7\x9c\xec\xc0\xcc\xee\x8d\
+\x79\x01\x04\x6f\x4e\x95\x03\x9c\x69\xcb\x87\x08\xb0\x22\x21\x84\
+\x01\xb0\x12\xb8\xc0\xcb\x55\x99\xd2\xd2\x86\xba\x53\x4b\x0c\x80\
+\x03\x5a\x28\xe2\x73\xa7\xa9\xa5\x00\x87\x66\x78\x1d\x67\x76\x71\
+\x3d\x72\x2c\xfb\xd7\x44\xf2\xbf\x91\x8c\x82\x6e\xcd\x00\x02\x09\
+\x7a\x6f\x61\xff\x65\xbf\x5b\xa8\x0a\x00\x4d\x27\x03\x8c\x79\x2f\
+\x34\x51\x29\x60\x46\x86\x63\xd5\x61\x25\x44\x7e\x1d\xa1\xff\x1a\
+\xf3\xd3\xfb\xec\x03\x32\xfc\x9d\xee\x25\xbf\xf0\xff\xb2\xfb\x3a\
+\x33\x00\xce\x09\xf1\xd3\x8c\x0a\x74\x32\x6e\x96\x01\xdc\x8e\xa5\
+\x46\x4c\xa5\xd3\x0d\xd5\x90\x77\x69\xc1\xa0\xb1\x35\xb0\xa9\xd3\
+\x41\xc3\xf3\x60\x99\xc3\x93\x80\x5e\x8f\xd1\xcd\x84\x6d\x27\x60\
+\xc3\xcc\xee\x91\x99\x5d\x4e\x54\x73\x2b\xfb\xd7\x8b\x39\x50\xe6\
+\xef\x55\x44\xe7\x70\x42\xb8\xac\xa0\xf7\x4a\xd9\xf3\xcd\x35\x19\
+\x60\x8a\x65\x01\x3b\xf5\x1b\xb3\x32\xeb\x2b\x37\x66\xf5\xc8\xc9\
+\x50\x49\x00\xeb\x18\xef\x94\x1b\xc0\xdf\x3c\x70\x0b\x60\xab\x8c\
+\xe7\x13\x5e\x84\x78\x13\x6d\x67\x01\xee\x96\x3f\x05\xd1\xdc\xa1\
+\x0c\x80\x73\xbc\x5c\x95\x15\xc4\x49\x06\xd8\xef\x7c\xdf\x1d\x80\
+\x71\x99\x1b\x00\xfb\x24\x3a\x30\x78\xed\xec\x52\x32\x31\x7a\x15\
+\xfa\xdd\x6c\xd7\x07\x3c\x2d\xb3\xeb\x3c\xab\x87\xeb\x93\x5a\xd9\
+\xbf\x26\x96\x00\x54\xcd\x07\x10\x23\xf9\x5f\xcc\xf2\x7d\xb1\x3f\
+\xaf\xce\x64\x80\x4d\x44\x02\x84\x5e\x16\xd0\xa4\x19\xd0\xd7\xa3\
+\x18\x48\x8d\xfd\x02\x8d\x23\x9a\x2b\xe4\x33\x97\xaa\x7a\xec\xdc\
+\xf2\x00\x3c\x94\xb1\x66\xea\x85\x9b\xb0\x50\x77\x47\xb7\xc8\xf9\
+\x9e\x0c\x80\x07\x81\xdb\xbc\x5c\x9d\x9b\x1c\x0a\xc4\xd8\x8c\x06\
+\x76\xcc\x7c\x60\xd8\x0b\xad\xf5\x4f\xf5\xfd\x98\xd7\xa8\xca\x93\
+\x9b\xdc\x0c\x80\x99\x84\xab\xfd\x5d\xb7\xe8\x27\xf0\xdf\x3c\x3e\
+\xf9\x0f\x29\x90\x43\x09\xf7\x58\x46\x42\xd3\xc9\x00\x89\xd8\x2e\
+\x42\x27\x03\xf4\x66\x06\x0c\xf5\x5e\x6e\x06\xc0\xbe\x5d\xb6\xc7\
+\x5e\xc6\x96\x26\xc7\x41\xcd\x15\x9a\xff\xec\x3d\x65\x00\xb8\x26\
+\x93\xf0\xff\x7f\x13\x28\x20\x6b\x54\xc0\x93\x72\xb3\x0c\x60\x0a\
+\x16\x09\x50\x67\x07\xe0\xc1\xed\xca\x79\x19\x40\x1f\xb0\x47\xe6\
+\x22\x3e\x77\x9a\xb8\x3e\x23\x4d\xe0\xf6\xcd\xec\x1a\xcf\x28\x39\
+\xb9\xf7\x20\xfa\x95\xfc\xaf\x77\x21\xef\xa1\x5f\x56\x32\x40\x5f\
+\x65\x01\x63\x88\x7f\x32\x36\x00\x42\x85\xfe\x6b\x8e\x90\xbe\x80\
+\xaf\xfa\xd9\x7b\x65\xf6\x7b\xcc\x72\xae\x79\xea\xf8\xfd\x63\x45\
+\x95\x57\x20\x58\xc4\x7d\x96\x06\x40\xac\xf5\x1a\xde\x1b\xfc\xae\
+\x19\x0f\x0c\x5b\xb0\x6a\xbd\xb6\xd6\xfa\xa7\xf9\x7e\xcc\x6b\x50\
+\x36\x84\x73\x6b\x60\xdd\x8c\xee\x93\x99\x3d\x4c\xf2\x7b\x35\x05\
+\x62\x95\xfd\x53\xf2\xbf\xf2\xa2\xbe\xaf\xe1\x57\xd5\x73\xa5\xe2\
+\x35\xcc\x39\x19\x60\x59\x21\xdf\xab\xd8\xef\xa6\x1f\xe8\x27\xaf\
+\x1c\x00\xeb\x03\x93\x09\x1b\xfa\xef\x79\x7c\xcc\x69\x8e\xe0\x71\
+\x6e\x37\x70\xec\x8d\xe8\x9c\xa7\x2a\x35\x66\x33\xfc\xc3\xd4\x94\
+\xb5\x52\x2f\xdc\x8e\x55\x57\x72\x44\x30\xad\x1d\xd2\x00\xb8\x08\
+\x58\xe6\xe5\x0a\xdd\x98\xa0\x00\xac\xca\xae\xa4\x55\x2f\xba\x17\
+\x76\x70\xf2\x1b\xa6\x3c\x00\xa6\x60\x62\x54\xf9\x8c\x32\x4f\x72\
+\x46\x91\x57\x05\x8d\xc5\x98\x01\x5a\x46\x40\xf4\x8d\xf0\xff\xb1\
+\x04\x49\x2f\xfb\x29\xf9\x9f\x7f\x94\x0c\x30\x5e\xfb\xaf\x72\xef\
+\x95\x31\xfd\x06\x78\x02\x58\x92\x51\x3f\xb9\x4b\x49\xc1\x1f\x33\
+\xf4\x5f\x73\x07\xbf\xd7\xa7\x97\x63\xe7\xb4\x14\x77\x05\xf0\x68\
+\x4b\xda\xd7\x70\xdc\xe4\x6f\x8a\x77\x99\x47\x03\xe0\x09\xe0\xaa\
+\xd4\x0d\x80\x26\x1a\x58\xa8\x7d\xd7\x03\xb6\xcc\x74\x70\xd8\xb1\
+\xc6\xdf\x49\x51\x00\xcd\x08\xf8\xd0\xd7\xbf\xdb\x49\x5c\x6e\x4b\
+\x67\x1e\x0b\x20\x1c\x62\x8b\xfe\x14\x9f\xfc\xc7\x4a\xfe\x57\x55\
+\x58\xd7\x6d\x10\x84\x3a\x8f\x9c\x93\x01\x86\x16\xfa\x4d\x97\x05\
+\x9c\x97\x59\x1f\xb9\x4b\x45\xc1\xef\x71\xcc\xd3\xd3\x7f\x1f\xe7\
+\xb6\x43\x66\xf7\xca\x5c\x87\x5a\x27\x77\x2d\xd9\x81\xcb\x08\x18\
+\x90\x30\x2a\xf0\xc9\x9d\xe5\xe5\x2a\xcd\x00\x1e\x71\x2a\xd4\x63\
+\xee\x9b\xeb\x32\x80\xed\x1d\x0d\x36\x72\xea\xfd\x4e\x66\x7a\x59\
+\x7b\x9c\xab\x01\x30\x17\x95\xfd\xab\xfa\xf7\x6e\xdf\xf3\xb0\x0c\
+\xa0\x5b\x61\xde\x64\x52\xc0\x98\xe1\xff\x2a\x0b\x18\xff\xff\xe7\
+\x66\xd6\x47\xee\x5c\x71\xcc\x48\x4d\xdc\x6b\xce\x51\xdf\x67\xe7\
+\x96\x8c\xfb\xb1\xcc\x34\x52\x2f\xfb\x3e\x84\xbb\x44\x88\x67\x87\
+\x3c\x58\x68\x03\xe0\x74\x4f\x57\xaa\xad\xcb\x00\x72\x64\x9b\x9a\
+\x3b\x75\xcf\x83\x59\xce\x19\xfd\x43\x1c\xa3\xdb\xa7\x39\x03\xff\
+\xbf\x75\x66\xf7\xca\xbc\x1a\x85\x41\x28\x01\x93\x4b\xd9\xbf\x6e\
+\x05\x70\x15\x31\xef\x95\x2a\xe7\x5c\x47\x32\xc0\xdc\xca\x02\xd6\
+\x79\x8f\xe7\x66\x00\x6c\xdd\xc5\xf7\xf7\x12\xfa\xaf\x39\x87\xff\
+\xb9\xc8\x60\xb6\xca\x74\x3e\x91\x32\x65\x7f\xe3\x1b\xfd\x7d\x95\
+\xd3\x3c\x1b\x00\x37\x03\xf7\x7b\xb9\x52\x37\x24\xd6\x99\x84\xd8\
+\x37\x47\x03\x60\x2d\x60\x52\xcd\x83\x46\xdb\xd7\xfa\xa7\xb0\x54\
+\xa0\x17\x61\xd2\x69\x22\xb7\x15\x79\xe5\xce\x98\x57\xb3\x40\x50\
+\xd9\xbf\xde\xcc\x00\x08\x1b\x3a\x1f\xdb\x28\x08\xfd\x79\xa1\xa3\
+\x01\xda\x5a\x16\xb0\x4e\x83\x2f\x27\x03\xa0\x8f\xa1\x97\x4a\x36\
+\x11\xfa\xaf\xb9\x48\xda\xdf\x7f\xa8\x63\x6f\x0a\x8c\xc9\xe8\x7e\
+\x99\xef\x4c\xe3\xd4\x89\x33\x03\x60\x3a\x96\x93\xd0\xad\x01\x00\
+\x8e\xa2\x00\x6e\xc5\x12\x13\x78\x14\xea\xb1\xf6\xdd\x12\xcb\x05\
+\x90\x13\x5b\x94\x1c\x90\xb5\xd6\xbf\xd9\xef\x1e\xe2\x1c\x62\x2c\
+\x05\x58\x73\xa2\xb7\x36\x96\xbd\x37\x47\x03\xc0\xb3\xe8\xcf\xbd\
+\xec\x5f\x88\xa7\xfe\x75\x08\xf7\x98\x46\x42\xac\x68\x00\x95\x05\
+\xac\xd7\x0c\x78\x2c\xa3\xfe\x71\x63\x60\x02\xe5\x2a\x00\x78\x19\
+\xdf\x34\x17\xf1\x33\x47\x19\x4a\x54\x6d\x96\xf1\x7c\x22\x55\x6d\
+\xd4\xeb\xbe\xf3\x43\xab\xed\xea\x9c\x16\xfa\x80\x59\x1b\x00\x2b\
+\x69\x26\x0a\xa0\x49\xfa\x80\x3d\x33\x34\x00\x9a\x18\x3c\x72\x77\
+\xde\x73\x79\xca\x1f\xa2\x34\xe0\xe6\x19\xdd\x2f\x4f\x90\xde\x1a\
+\x7f\xba\xfc\x5b\xca\x65\xff\xca\x08\xeb\x14\x96\x02\x54\x3d\xc7\
+\x50\xe1\xff\x55\x0c\x9d\x9c\xca\x02\xc6\xb8\xf7\x17\x64\xd4\x3f\
+\x6e\x4e\xfc\x92\x7f\x4d\x8f\x7d\x9a\xa3\x34\x3b\x3f\xdc\x22\xa3\
+\xfb\xe5\x31\xda\xc9\xf5\x85\x86\x74\xc4\x19\x29\x18\x00\x17\x78\
+\x1a\x2f\xae\x6d\xa0\x73\x6e\x7a\xdf\xbd\x32\xbb\x11\x27\x35\x3c\
+\xc8\xa6\x3a\xb8\xa5\xf2\x94\x3f\xe6\x6f\xd8\xed\x9a\xce\x49\x19\
+\xdd\x2f\x4f\x36\x28\xfa\x55\xf6\xaf\xbe\xe4\x7f\x7d\x4e\x5e\x55\
+\xcf\x99\x8a\xd7\x52\x65\x01\xe3\x9b\x01\x8b\x32\xea\x1f\x37\x29\
+\x39\x46\xa4\x26\xee\x35\x47\x69\x6e\xde\x91\x53\x44\xe1\x93\x99\
+\xe8\xa2\xba\xb4\x63\x24\x1e\x07\x2e\x49\xc1\x00\x58\x02\x9c\xef\
+\xe5\xaa\xdd\x02\x2c\xcc\x50\xe4\x77\x22\x37\x03\x60\xa2\x06\x38\
+\xb7\xdf\xaf\xae\x89\x4c\xa8\xf3\x1c\x6e\x82\x97\xa3\x01\x30\x94\
+\x08\xe8\xb5\x56\x78\x48\xa1\xa1\xe4\x7f\xe5\x45\x7d\x6a\x28\x19\
+\x60\xd8\xbf\x85\x36\x03\x46\x3a\xc6\x9a\xef\x2f\xce\xa8\x7f\x9c\
+\x54\x51\xf0\xa7\x12\xfa\xaf\xb9\x4b\x73\xdf\x6f\xc3\x8c\xee\x97\
+\xc5\x81\x7e\xaf\x94\xf6\x5d\x08\xdc\xe6\xeb\x67\x38\x07\x58\x9a\
+\x82\x01\x00\x11\x42\x15\xca\xb2\x02\x98\x42\x7b\xe8\x07\x26\x47\
+\xfc\x61\x9b\x60\xc3\x8a\x1d\x40\x9b\xa3\x00\x3c\x9c\x63\xec\x4e\
+\x7c\xa4\x63\x74\x13\xee\x99\x9b\x63\xdf\xcb\xe4\x1e\xe2\x55\x00\
+\x68\x63\xf2\xbf\x5e\x0c\x81\x10\x4b\x01\x9a\x30\x08\x42\x9c\x4f\
+\x5f\x85\xeb\x56\xe5\x37\x22\x62\x3b\xaa\x3b\x19\x20\x84\x8f\xf4\
+\x19\xea\xfd\x9c\x0c\x80\x8d\x7a\x18\x17\x52\x1b\xeb\x52\x9a\x17\
+\xe4\x3c\x2f\xdb\x20\xb3\xf9\x84\xf7\xdf\x2b\x34\xd7\x03\xcb\x7d\
+\x9d\x52\x14\x4d\x1d\x4b\x27\x9e\xee\xa9\xbd\xb4\x69\x19\xc0\x00\
+\xa3\x33\xba\x19\xd7\x27\xed\xb5\xfe\xb1\x6f\x84\xb6\x97\xfd\xeb\
+\xd5\x04\x18\x6a\x72\x97\x53\xe2\xcc\x90\x4b\x00\x62\x09\x94\x36\
+\x3d\xf9\x0f\x29\x84\xcb\x0a\xf2\x26\xc3\xfe\xcb\x7e\xc7\xb6\x47\
+\x02\x84\x30\x08\x42\xfd\xff\x93\x19\xf5\x8f\xeb\x95\x18\x1f\xaa\
+\x8e\x3f\x75\x8f\x95\xa9\xcf\x19\x52\x9e\x93\xf5\x13\x37\x6a\xb5\
+\x6e\x96\x34\xdc\xa6\x15\xfe\xcf\x4a\xe0\xcc\x94\x0c\x80\x59\x85\
+\x89\xe2\x82\x9b\x19\xde\xc1\xce\x75\x19\xc0\x8a\x8c\x3a\xa0\x09\
+\x35\x0c\x18\x4d\x92\xc2\xb9\x7b\x89\x02\x88\x55\x1a\x70\xed\x8c\
+\xee\x97\xc5\x0d\x8b\xfe\x18\x4f\xfe\x63\x19\x01\x55\xde\x2b\x23\
+\x52\xab\x3e\xf1\xf7\x4e\x4a\xc9\x00\x09\xd0\x7e\x42\x27\x03\x8c\
+\x79\xcf\x55\xf9\xff\x9c\x72\x00\xac\x4d\x73\x25\xff\x72\x79\xfa\
+\xaf\xf9\x58\x67\xc6\x67\x3a\x9f\xc8\x45\xe0\x77\xda\x77\x31\x30\
+\xd5\xd7\x4f\x70\x0d\xf0\x70\x4a\x06\x00\x38\x5a\x06\xb0\xb4\x30\
+\x01\xbc\x75\x24\xb1\xf6\x5d\x8e\xbb\xec\x95\x95\x18\xef\xe0\xb7\
+\x6a\xfb\xfb\x75\x0d\x9c\x75\x2e\x05\xe8\x5b\x63\x52\x98\x0b\x4b\
+\x9d\x8a\xfe\x10\x4f\xf9\x63\x08\xb6\x5e\xde\x6b\x3a\xf9\x5f\x1d\
+\xa5\xfb\xea\xf8\x5c\x25\x03\x4c\xab\x2c\xe0\xb2\x8c\xfa\xc7\x09\
+\x3d\x7c\xef\x3a\xc7\xc7\x54\xc6\x69\xcd\x75\xda\x65\x00\x2c\xa9\
+\xa8\x27\x9a\x8e\x86\xee\x95\x1b\xfc\xf5\x77\xd1\xb4\x74\x4c\x03\
+\xe0\x74\x4f\x57\xf0\xda\x84\x1a\x60\xd5\xf3\xca\xe9\xe9\xff\xe0\
+\xce\x34\xf5\x92\x36\xde\x49\x7d\xad\x7f\x19\x13\x20\x47\x03\xa0\
+\x4e\xd1\x4f\x80\xe3\x54\x15\x4e\x55\xfe\xee\x39\xf9\x5f\x1d\x82\
+\xbd\x0e\x43\x41\xc9\x00\xeb\xbb\x6f\x62\x99\x01\x39\x8d\xad\x6b\
+\xf7\x38\x36\xa4\x14\xfa\xaf\x39\x92\x8f\x39\xd2\xf8\xcc\xbe\x73\
+\x7f\x66\x1a\x29\x86\x56\x4c\x51\x4b\xc7\x34\x00\xae\x07\x66\x78\
+\xb9\x82\x37\x31\xbc\xab\x93\xf2\x5a\xff\x5e\x06\xb2\x54\x19\xe3\
+\x44\xe0\xca\xf9\x4e\x6b\x29\x40\xd9\x7c\x00\x6d\x36\x01\x54\xf6\
+\xaf\xbc\xc0\xac\x6b\x19\x80\xb7\xe5\x00\x31\x12\x02\x56\xd9\x4e\
+\x65\x01\xe3\x99\x01\x39\xf5\x8b\x75\xae\xfb\xcf\x65\xec\xd5\x1c\
+\xa9\xde\x39\xab\xd7\xb9\x44\xd3\x22\x3d\xd6\xbe\x4b\x68\x26\x5a\
+\xbc\x03\x0f\x10\x31\x8f\x7d\x4c\x03\xa0\x1f\x38\xc5\xcb\x55\x5c\
+\x5c\xe1\x87\xcd\xcd\x20\x48\x19\x39\xdc\xf9\x4f\x22\xea\x98\x54\
+\xe5\x6c\x02\xf4\x3b\x10\xfd\x2a\xfb\xd7\xbb\x68\x0e\x2d\xbc\x73\
+\x49\x08\xa8\xb2\x80\xcd\x9b\x01\x39\x8d\xab\x23\x55\x3d\x08\x3d\
+\x47\xcb\x25\xf4\x5f\x73\x27\x5d\xbf\xdc\xb5\xd3\x14\x22\xd4\xda\
+\xab\xc6\x29\x31\x9b\x56\xec\x6a\x71\x7f\xf3\x74\x25\xaf\xd4\xcd\
+\xd5\xfa\xef\x29\x07\xdb\xc7\xef\xd1\xef\xac\xed\xb4\x2d\x12\x20\
+\x95\xb2\x7f\x6d\x4a\xfe\x97\x6a\xe2\xbf\xd0\xdf\x47\xc9\x00\xc3\
+\xde\x5f\x21\xcc\x80\xdc\x0c\x80\x14\xc7\x28\xef\xe3\xbe\xe6\x4e\
+\x12\xf8\xa9\x73\x85\xbf\x53\x3a\x39\xe6\xc1\x63\x1b\x00\x97\x02\
+\x0f\x79\xb9\x92\x37\x30\x7c\x36\xdb\x9c\x9e\xf2\xe7\xfc\x44\x53\
+\x1d\x75\xf3\x03\x75\xa8\x76\xdd\x74\xa4\xc0\xe0\xfb\x64\x65\x66\
+\xbf\xff\x50\x4f\xb9\x52\x2c\xfb\xd7\x8b\x39\xd0\xcd\xdf\x43\x47\
+\x05\x74\xbb\x0d\x84\x0b\x8f\xf7\x60\x12\x84\x3a\xa7\xba\xa3\x01\
+\xea\x8c\x04\x20\xe0\x7d\x50\x67\x59\xc0\xbe\x2e\xbe\x5f\xca\xac\
+\xe8\x62\xae\xe4\xe9\xc9\x7e\x0a\xa1\xfd\x9a\x73\x89\x54\x74\xd3\
+\x70\xfb\x2e\x22\x62\xac\x7d\x39\x1e\x8a\xed\x49\xc4\x36\x00\x56\
+\x02\xff\xf4\x72\x35\x97\x15\x26\x40\x0e\x8d\xb5\x4d\x06\xc0\xd2\
+\xc0\xd7\x4c\x4e\x75\x3e\x13\x97\x50\x26\x40\x4e\x75\xae\x47\x55\
+\x14\x00\x65\x44\x45\x1b\x9e\xfc\x7b\x4e\xfe\xe7\x3d\xec\xbf\xec\
+\x77\x0d\x9d\x0c\x30\xd4\x7b\x6d\x2b\x0b\x38\x2a\xa3\xfe\xf1\x49\
+\x27\xe2\xbf\xae\xf1\x4f\xd1\x01\xf5\xcf\xb9\x16\x23\x52\x7b\xa8\
+\x7a\x0d\x56\x41\xcd\x11\xa7\x10\xf9\xd9\x54\x1d\xfd\xba\xab\x65\
+\x00\x57\xb4\xe0\x46\x19\x95\x99\x09\xf0\x64\x43\x83\x5a\xce\x9d\
+\x6f\x0e\x19\xfd\x43\x9a\x00\x39\x19\x00\xe3\x9d\x88\xfe\x9c\xcb\
+\xfe\x35\x95\xfc\xcf\x3b\x4a\x06\x58\xae\x0d\x7b\x2f\x0b\x38\x2e\
+\xb3\xf9\x84\x07\xf1\xaf\xca\x01\xf9\xce\xb5\x72\x9a\x4f\x8c\x1e\
+\xe6\x7e\xc9\x2d\xbf\x99\xc3\x25\xe2\xd1\xb5\x73\x1d\x06\xc0\x85\
+\xc0\x5c\x2f\x57\x74\x2a\x30\xbf\x26\x21\xde\x94\x41\xd0\x47\x5e\
+\x65\x48\x9e\x8c\x70\xcd\x14\x05\x90\x56\x46\xff\xd8\xe4\xe4\xd8\
+\x8f\xc7\x5f\xd9\x3f\x25\xff\x1b\x5e\x20\x87\x12\xd8\x31\x8d\x82\
+\x18\x9f\xab\x64\x80\xf5\x2c\x0b\x08\x61\x06\xe4\x54\x26\xd5\x43\
+\x5f\xaf\xca\x01\x79\xcf\xb5\x72\x32\x00\x26\x24\xae\x87\xba\xd9\
+\x77\x1e\x70\x9b\xaf\xcb\xfe\x28\x70\x49\x0e\x06\xc0\x32\xe0\x34\
+\x2f\x57\x75\x25\x70\xb5\xa3\x86\x17\xeb\x86\xc8\xc9\x00\x58\xe8\
+\x58\x38\x7a\x9e\x44\xa4\x94\xd1\xbf\xae\x09\xd3\x70\xdb\x3c\x9e\
+\x99\x01\xd0\xed\xc4\x3e\x86\x80\x08\xf1\xb7\xa6\x97\x00\x34\xbd\
+\x0c\xa0\xaa\x88\xf7\x10\xf2\x5f\xf5\xfb\x85\x0e\xff\xcf\x65\x09\
+\x40\x28\x61\xdf\x4b\x1f\x91\x53\x04\x40\x95\x07\x40\x6d\x0b\xfd\
+\x57\x74\x40\xb9\xef\xbf\x28\x73\x03\x20\x35\x81\x3f\x12\x57\xe2\
+\x2e\x0f\xd4\xdf\xa9\x61\x45\x42\x5d\x4b\xbb\x5a\x51\x0d\xc0\x93\
+\x41\x90\x93\x01\x30\xaf\xa1\xc1\x4b\x4f\xf9\xeb\x6b\xbb\x4d\x87\
+\x5e\x3e\x9a\xe9\x80\x9d\x42\xb8\xbf\xc7\xe4\x7f\xa1\xcc\x80\x32\
+\x86\x40\x37\x22\xde\x1b\x21\xce\x35\x64\x34\x80\xa7\x48\x00\x22\
+\xdf\x2b\x75\x2c\x0b\x98\x40\x3e\xcc\x75\x38\xfe\x78\x1c\x73\x15\
+\x1d\x50\xfe\x1a\xcc\xcb\xe8\x7e\x09\xad\x25\x3c\x3e\x48\xbd\xca\
+\xdf\x65\xaf\x45\x33\x8f\xa9\xe9\xcb\x9c\x83\x3d\x64\x5b\xdf\xc3\
+\x95\xbd\x0b\x78\x18\xd8\x6c\x98\x06\x16\x6b\x82\x55\xe5\xd8\xbd\
+\xee\x9b\xfb\x80\xdd\x16\x46\xfa\xdd\x63\xb6\xd7\x90\x9f\xd1\xcd\
+\x31\x9a\xdc\x26\xa7\x36\x36\x54\x0e\x80\xfe\x21\x26\xf6\xfd\x23\
+\x6c\xd3\x1f\xe0\x38\xbd\xfe\x8d\x2e\x3e\xa3\xcc\xdf\xab\xbc\xb7\
+\xa6\x18\xea\xef\x42\xe8\xf5\x8f\x20\x5e\xab\x4e\x6e\x52\x2f\x0f\
+\x18\x63\x9f\xaa\xdb\x94\x79\xaf\x97\xbf\x57\xdd\xb6\x2f\xd2\x7e\
+\xdd\xec\x93\xd3\x7c\x62\x8e\x73\xf1\xdf\x96\xb2\x80\x39\x93\x93\
+\x01\x30\xa1\xc6\xb6\xd7\x44\x64\xc1\xc3\xc0\x3d\xbe\x2e\xf9\x63\
+\xc0\x05\x75\x7c\x50\x5d\x11\x00\x4b\x80\x7f\x79\xba\xc2\x57\x25\
+\xd4\x40\xcb\xec\xdb\x16\x03\x40\x4f\xf9\xeb\x19\xa8\x9b\x2e\xd9\
+\x17\xfb\xba\xcc\xc9\x6c\xc0\x0e\x55\x06\xb0\xa9\xb2\x7f\xa1\x96\
+\x00\x94\x5d\x1e\x10\xaa\xfe\x7c\x88\xe4\x7f\x29\x0b\xfd\x3a\x93\
+\x01\x96\xdd\x26\x76\x24\x40\xac\x3c\x01\x04\xb8\x7f\xbb\x2d\x03\
+\x98\xab\x01\xd0\xd4\x78\xe3\x7d\x2c\x56\xe5\x80\x6a\xef\xe7\x1c\
+\x01\x90\x4b\xae\xb4\x01\x2e\xf7\x77\xc9\xff\x49\xef\xc5\xcf\x5c\
+\x1b\x00\x90\x50\x35\x80\x1c\x1a\xf8\x3a\x19\x75\x40\x8f\x90\x37\
+\x29\x2c\x15\x68\xba\xed\xc7\x32\x12\x06\xb6\x9b\x99\x51\x7b\xda\
+\xa0\xc7\x09\x7f\x19\xd1\x50\x45\xa4\xd4\xb9\x04\xa0\xac\xc0\x0b\
+\x69\x06\x40\xd8\xd0\x78\x2f\x06\x41\xa8\xf3\xf2\x9a\x0c\x90\x00\
+\xed\x2f\xf4\x3d\x10\x7b\x59\xc0\x70\xff\xbf\x61\x46\xfd\xe3\xcc\
+\x92\x63\x44\x2a\x63\x9f\x87\x63\xb4\x3d\x3a\x60\x76\x46\xdf\x65\
+\x9d\x9a\xdb\x56\xdd\xba\xac\x8d\xd9\xff\x9b\x30\x00\xce\x04\x16\
+\x78\x1a\x04\xee\x75\xd6\x10\x43\xde\x20\x39\x0d\xd8\x33\x1a\x1e\
+\x8c\xda\xf2\x94\xbf\x8e\x89\x90\xc7\x50\xca\x45\xe4\xb5\x04\x60\
+\x52\x8d\xa2\xbf\x8c\x60\x09\x25\x8c\x72\x4c\xfe\x17\x43\x88\xc7\
+\x7a\x85\x3a\xd7\x5e\xf7\x21\xd2\x6f\xe8\x2d\x19\x60\xcc\xa7\xfe\
+\xbd\x9a\x01\x1b\x64\xd4\x3f\x3e\x82\x85\xa4\xd6\x29\xfe\x3d\x8d\
+\x9d\x1e\xe6\x12\x4d\x1b\x0c\xb1\xdf\xcf\xe9\x81\xc2\x46\x89\x0b\
+\xfc\x4e\x4c\x07\x1e\xf2\x75\xb9\x1f\xc7\x96\xcc\x67\x67\x00\x2c\
+\x04\xfe\xe1\xe9\x4a\x5f\x9a\x51\x43\x5e\x93\x9c\x0c\x80\x05\xc0\
+\x13\x89\x7f\x87\x5c\x12\x02\xe6\x90\xf0\x6f\x4d\x1e\x20\x2f\x36\
+\x24\x4e\x46\xf0\x5e\xc4\x44\x5b\x92\xff\xd5\xb5\x0c\x20\xa5\xa5\
+\x00\x55\xbf\x43\xc8\xeb\xdb\xe6\x64\x80\xa1\xee\xfb\xbe\x35\x44\
+\x40\xea\xf4\x33\xf2\x43\x05\x8f\xe3\x94\x17\x93\x21\x85\xb9\x4e\
+\x93\xcc\x63\xf8\xca\x55\x29\xb2\x41\x46\xba\x68\x4d\x2e\xf1\x77\
+\xb9\x4f\xa1\xc6\x4a\xa5\xa3\x6a\xfe\x72\x7f\xf2\x74\xa5\xaf\x60\
+\xf8\x3a\x0b\xa9\x3a\x5d\xfd\x19\x1a\x00\x90\x7e\x14\x80\x07\x13\
+\xa1\xae\x8e\x36\xb5\xa4\x4a\xf7\x67\x68\x00\x74\x3b\xb1\x57\xd9\
+\xbf\xf8\x6b\xcc\x3b\x09\xe3\x50\xc2\xba\x0e\xa3\x20\xc6\xe7\x37\
+\x11\xfe\x1f\xa3\xbd\xa4\x5a\x16\xb0\x5b\xa3\x30\xb7\xf9\xc4\xbd\
+\x99\x8d\x61\x5e\xc6\x76\x45\x07\xe4\xf5\xf4\x7f\xb0\x01\x10\xf3\
+\xb7\x6f\x42\x6f\x2d\xc5\x65\xf6\xff\x3f\xd6\xf9\x61\x75\x1b\x00\
+\x67\xe3\x68\x79\xcc\x02\xe0\x86\x84\x1a\x6c\x19\x11\x90\xd3\x80\
+\xed\xdd\x19\xce\xc1\x44\xa8\x53\xe0\x7b\xf9\x6d\xee\xcc\xec\x5e\
+\xd9\xa8\x26\x61\x90\x6a\xf2\xbf\x32\x51\x01\x65\xb6\x29\xbb\x0c\
+\xa0\xaa\x88\xf7\x14\xf2\x5f\xf5\x7b\xd6\x95\x0c\xb0\x8e\x48\x80\
+\x58\xc9\x00\xeb\x30\xfa\x72\x9b\x4f\xdc\x99\xc9\xd8\xe5\xcd\x20\
+\xc8\x61\x8e\x54\xf5\xfb\xdd\x93\xd9\xbd\xb2\x91\xf3\xb6\x55\xf6\
+\xd8\xd7\x61\xcb\x3f\x1d\x31\x1b\xb8\x30\x67\x03\x60\x39\xce\x92\
+\x01\x5e\xe2\xac\x51\x86\x3a\x76\x6e\x03\xf6\x74\x07\x83\x8b\x87\
+\xc1\x27\xa5\x8c\xfe\x75\x4d\x6c\xaa\x9e\x4b\x6e\x06\xc0\xa4\x92\
+\x02\x80\x00\x42\xa2\xd7\xbf\x35\x91\xfc\xaf\xdb\xf7\x9a\x7c\xea\
+\xef\x35\xf1\x5f\xcc\xf3\x6d\x32\x19\x60\xa8\xf7\xfa\x22\xb6\xff\
+\x58\xf7\x67\x37\xc7\x99\x94\x59\x1f\x79\x57\x26\x63\x97\xa7\x31\
+\x3f\x87\xf9\x51\x88\xef\x78\x77\x66\xf7\xca\x06\x89\x0a\xfc\xa6\
+\xb4\x5f\x05\xfe\xc4\xf0\x41\xe9\x59\x18\x00\x03\x5f\xd2\x0d\x37\
+\x33\x7c\x09\xb0\x14\x1b\xf5\xc0\xb1\x73\x5a\xb3\xd7\xad\x01\xd0\
+\x96\x01\x86\x8c\x8e\xe1\x61\x9b\x9c\x0c\x80\x75\x81\xf5\x50\xd9\
+\xbf\x50\x62\xdf\x6b\xf2\xbf\x3e\x67\xaf\x10\xe7\xdf\xeb\x3e\x44\
+\xfa\x4d\x55\x16\xf0\xa9\xfb\x6c\xc8\x53\xcb\x81\xa5\xcc\x1d\x89\
+\x8f\x59\x39\xce\x07\x72\x89\x0e\x98\x4e\x5e\x6c\x94\xb8\x16\x1a\
+\x8a\x47\x81\x69\x3e\x0d\x80\x5a\x69\xc2\x00\xb8\x8c\xf2\x09\xf8\
+\xa3\x34\x90\x2b\x12\x6a\xb8\xdd\xb2\x1e\x79\x95\x02\xbc\x0f\x5b\
+\xb3\xa3\xa7\xfc\x12\xf8\x21\xb7\x99\x01\xcc\xcf\xe8\x3e\xd9\x32\
+\x82\xe8\xef\x23\x9d\xe4\x7f\x65\x05\x5c\xaf\xef\xd7\x95\xfc\x2f\
+\x75\x72\x4a\x06\x48\x80\xf6\x59\xd7\x12\x80\xd0\x95\x00\xfa\x86\
+\xe8\x5b\x52\x66\x2e\x30\x2b\xc3\xf1\x2c\x55\x71\x9f\xc2\xbc\xaa\
+\x9b\xf7\x17\x93\x57\x52\xe1\x10\x3a\xc2\xa3\x4e\xba\x14\x77\xcb\
+\x49\xa6\x03\xd7\xb4\xc1\x00\xe8\x07\xfe\xe2\xe9\xca\x5f\xd2\xa1\
+\x31\xd4\x91\xb0\x2f\xd6\xb1\x73\x1a\xb0\x97\x03\xb7\xd7\x34\x98\
+\xe4\xf0\x94\x3f\xb5\x92\x7d\x4d\x19\x0e\x37\x91\x17\x93\x69\x67\
+\xf2\xbf\xa6\x9f\xfc\xf7\x2a\x82\xab\x0a\x68\x0f\x26\x41\xc8\x73\
+\x6b\x32\xfc\xdf\x63\x24\x40\xa8\xbf\x85\x34\x03\x72\x9a\x4f\x00\
+\x4c\x69\xd9\x58\xd7\xe4\x31\x72\x98\x73\x75\x73\xfc\xdb\x80\x15\
+\x19\xdd\x23\x5b\x3a\xd0\x31\xa1\x8f\xdd\x8f\x3d\x85\x76\xc6\x1f\
+\x9b\xf0\x24\x46\x35\xf4\x65\x5d\x2d\x03\x78\x88\xf2\x61\xc0\x9e\
+\xa3\x00\xb6\xc8\x6c\xc0\xfe\xb7\x83\x4e\xc5\x8b\xc9\x50\x57\xdb\
+\xec\x77\x72\x3d\x62\x4d\x9e\xa6\x64\x76\x8f\x6c\xd9\x61\x02\xdf\
+\x8d\x58\x28\x2b\x28\x9a\x5e\x02\x50\x56\xb0\x8d\x74\xcc\x32\x62\
+\xb3\xae\x65\x00\xbd\x08\x71\x4f\x49\x01\xbd\x24\x03\xec\x75\xff\
+\x50\x91\x00\x4d\x25\x03\xac\xda\x2f\x4c\xce\xd4\x00\xa8\x3b\xa9\
+\x6d\x4a\x63\xaa\xa2\x03\x7a\x3b\xc7\x7f\x67\x76\x8f\x6c\xe9\xb8\
+\xad\x97\x3d\xf6\xad\x38\xca\x44\xbf\x8a\x46\x1e\x8a\x37\x65\x00\
+\x4c\x01\x6e\xf1\x74\xf5\x73\x4c\x06\x98\xb3\x01\xe0\xbd\x14\x4c\
+\x2a\x03\x67\x8e\x4b\x01\x7a\x39\xef\x9b\x32\x1e\xb0\x53\x7a\xf2\
+\x5f\x66\xdb\x94\x92\xff\x55\x15\xf2\xa9\x11\x3a\x21\x20\x15\x7f\
+\x93\x36\x25\x03\x8c\x75\xef\xe7\x66\x00\xdc\x48\x73\xc6\xb3\x87\
+\x71\x30\x97\x39\x8a\xa7\xf7\x6f\xc9\xec\x1e\xd9\x3c\x41\x81\xdf\
+\x94\xd6\xab\xd8\x15\x4d\x6d\x93\x01\x00\xce\xa2\x00\xae\xc6\xd6\
+\xef\xe4\xd2\xc8\x73\x34\x00\xee\xc4\x5d\xd9\x8e\x2c\x4c\x02\x4f\
+\x4b\x01\xea\xdc\xe6\x5e\x2c\xfa\x27\x27\x26\x47\x12\xfd\x6d\x2b\
+\xfb\x17\xfa\xa9\x7f\x55\x51\x5f\x57\xb9\xbe\x26\xce\xa1\xaf\xe2\
+\xb5\xac\x2a\xfa\x55\x16\xb0\xbb\x6d\xb6\xca\xac\xaf\x9c\x09\xdc\
+\x9f\xe9\xd8\xd6\x96\xd0\x7f\x4f\x2c\xa0\x7a\x75\x09\x6f\xc4\x5c\
+\xf6\xd3\x84\xae\x7a\x12\xb8\xd6\xdf\x65\xfe\x63\x53\x1f\xdc\xb4\
+\x01\xe0\xe6\xfe\x5e\x5c\x98\x00\xde\x3a\xb1\x2a\xc7\xce\xcd\xb1\
+\x5f\x0e\xdc\x10\xf0\xba\xa7\x90\x30\x50\x4f\xf9\xe3\x6d\x73\x65\
+\x66\xf7\x47\x1f\xb0\x3d\xf1\xcb\xfe\x75\x7b\x2c\x2f\xc9\xff\xba\
+\x7d\xaf\xee\xe4\x7f\xb1\x04\xbc\xb7\x90\xff\xaa\xdf\xb7\x89\x64\
+\x80\xa1\xde\x8b\x91\x0c\x30\xc6\xbd\xda\xcd\xb1\xb7\x23\x8f\xc4\
+\x94\xbd\x8c\x01\x4a\x0c\xe8\x53\xe0\x79\x9c\x03\xde\x40\x5e\xeb\
+\xff\x47\x32\x00\x52\xcc\x0d\x70\x25\x96\x4c\xdc\x11\x2b\x69\x30\
+\x27\x5e\x93\x06\xc0\x3d\x38\xcb\xc5\x70\x41\x43\x9d\x59\xac\x63\
+\x4f\x06\xc6\x66\xd6\x21\x5d\x93\xd8\xf9\xb6\x2d\x8c\xdf\xd3\xb5\
+\x1d\x69\x9b\xdc\x0c\x80\xad\x80\x09\x25\x26\xf6\xbd\x0a\x84\x6e\
+\x8f\x15\x4a\xe8\xb4\x2d\xf9\x9f\xd7\xa4\x7f\x75\x9c\xb7\x92\x01\
+\x96\xbb\x77\x42\xdd\xb3\x9d\xfe\x7f\x5d\x60\xb3\xcc\xfa\xcc\xab\
+\x34\x26\xba\x9d\x73\xf4\x27\xd6\x96\xae\xce\xec\xde\x18\x47\xbc\
+\x28\xe2\xa6\xf4\xd4\x85\xfe\x2e\xf3\x85\x34\x58\x38\x62\x54\xc3\
+\x5f\xfe\x57\x9e\x7e\x89\xbb\x0b\x57\x22\xa5\x06\xdd\xe9\xfd\xd1\
+\xc0\xb6\x99\x75\x4a\xd7\xb3\xba\xcb\xaa\xb5\xfe\xe9\x4d\x0c\x3c\
+\x24\x5d\x9a\x47\x7e\xeb\xf5\x76\x24\xbd\xb2\x7f\x4a\xfe\x17\x5e\
+\x68\x97\x79\x9a\xdf\x44\x84\x80\x92\x01\xa6\x57\x16\x70\xa7\xcc\
+\xfa\xcc\x9b\x19\xba\x0c\x6c\xaa\xb9\x01\x52\xf9\x9c\xdc\x72\x03\
+\x2c\xc7\x16\x72\xe7\xc4\xb6\x85\x86\xf0\x66\xde\x94\x3d\xf6\x5d\
+\x38\xaa\x3f\xef\x44\x03\x37\x6d\x00\xfc\x15\x78\xc2\xd3\xaf\x71\
+\x81\xb3\x46\x5b\x95\x1d\x32\xeb\x94\x16\xb2\xfa\x32\x00\x0f\xe4\
+\xb2\xd6\xdf\xdb\x64\x26\xe4\x77\x5a\x73\xbb\x0b\xc9\x2f\x5c\x6f\
+\xa7\x08\xa2\x9f\xc0\x7f\x0b\xb5\x04\x20\xc6\xf2\x00\x6f\xc9\xff\
+\x62\xd2\xe4\x67\xe5\x96\x0c\xb0\x6c\x24\x40\xd5\x6d\xcb\xfc\xad\
+\x6a\x5f\x90\x9b\x01\xb0\x1c\xb8\x38\xd0\x98\x92\xca\x58\x18\xfb\
+\x73\xda\x18\x1d\x70\x3d\x69\xe5\xa7\xea\x86\x1d\x9d\xce\xa7\xbd\
+\x69\xbb\x0a\x3c\x0e\x9c\xda\x66\x03\x60\x21\x70\xb2\xa7\x5f\xe4\
+\x8a\xe2\xa4\xea\xee\x94\x62\x1d\x7b\x7b\xf2\xe3\xe2\xc0\xd7\x4e\
+\x19\xfd\xd3\x9e\xd4\x94\x99\xb0\x9d\x9f\xe1\x7d\xb1\x53\x09\x31\
+\x50\x56\x30\xa4\xfa\xe4\x3f\xa5\xe4\x7f\x4d\x26\xfc\x6b\xe2\x1c\
+\x53\x4d\x06\x58\xa6\x6d\x86\xdc\xb6\xce\xb2\x80\x3b\x67\xd8\x6f\
+\x9e\xdf\x12\xf1\xaf\xca\x01\xf1\xde\xbf\x28\xc3\xfb\x62\x07\x87\
+\xbf\x6f\xd9\x63\x2f\xc2\xe5\x12\x8d\x3f\xd1\xb0\x6f\x34\xca\xc1\
+\x45\x70\xb5\x0c\x60\x29\x70\x79\xa4\x63\x37\x11\x16\x93\x5b\x04\
+\x00\x58\x1e\x80\xba\xef\x1a\x2d\x05\x88\xd3\x96\x9b\x30\x01\x1e\
+\xa2\xa1\x9a\x2b\x91\xd9\xb9\x84\x08\x08\x29\x1e\xea\x30\x02\xea\
+\x7c\xf2\x9f\x42\xf2\xbf\xbe\x86\x5f\x21\xcf\xb9\xd7\xfd\xaa\x6c\
+\xe7\x21\x12\x20\x66\x9e\x80\x10\xf7\xf8\x50\xdb\xe4\x68\x00\xdc\
+\x8c\xd5\x05\xf7\x28\xfe\x53\x3b\x9f\x36\x46\x07\x2c\x00\xae\xcb\
+\xf0\xbe\xd8\xde\x91\x8e\xa9\xca\x25\xb8\x4b\xfe\xe7\x42\xfb\x7a\
+\x30\x00\x2e\x05\x6e\xf7\xf4\xab\x9c\xdf\xa1\x21\x7a\x5c\xeb\xdf\
+\x89\xad\xc9\x2f\x11\xe0\x52\x2c\x52\x23\xe4\xb5\xcb\x25\xa3\x7f\
+\x6e\x4f\x0b\x62\x9c\xf3\xe9\xa4\x97\x60\x68\x24\x26\x03\x13\x89\
+\x1b\xee\x1f\x33\xb3\x7f\x48\x01\x56\x55\xec\x53\x61\x1b\x88\x93\
+\xfc\x2f\x35\xda\x98\x0c\x90\x48\x6d\xbe\x6a\x74\x00\x01\xfa\x83\
+\x81\x6d\x36\x62\xe4\xda\xe0\xa9\xb1\x12\x38\xa3\x81\x71\xc8\xcb\
+\x9c\x21\xd4\x36\x6d\xad\x1c\x70\x19\xb0\x2c\xb3\x7b\x62\x1c\xe5\
+\xaa\x88\x79\xcd\x0d\x70\x91\xbf\x4b\x7c\x3b\x0e\x82\x12\x46\x39\
+\xb9\x18\xbf\xf3\xf4\xcb\xcc\xac\xe0\x48\x78\xbb\x01\x46\x93\xa7\
+\x6b\x7f\x46\x4d\xd7\x2f\xc5\x01\xb0\x2e\x71\x9b\x4a\xc2\xbf\xc1\
+\xac\x00\xce\xcc\xf0\x7e\xd8\xb7\x8b\x09\x7c\x28\x81\xdf\xc4\x12\
+\x80\x50\x79\x02\x62\x98\x01\x75\x24\xff\xab\xb3\x5c\x5f\xdd\xe7\
+\xd0\x64\x32\xc0\x10\xcb\x03\xaa\xee\xe3\x29\x19\x60\x37\x7d\xc7\
+\x3e\x99\xce\x27\x56\x3a\x13\xf6\x9e\xaa\x10\xe4\xb2\x7c\x20\xc6\
+\xf5\x3a\x2b\xc3\xfb\x61\x97\x61\xc4\x61\x6a\x0f\x40\x01\xa6\x01\
+\x33\xfc\x5d\xe2\x5f\x7a\x38\x09\x2f\x06\xc0\xaf\x71\x96\x93\xab\
+\xa9\x35\xc2\x31\x6e\xb0\x3d\x32\xec\xa0\xee\x01\x6e\x73\x64\xbe\
+\x78\x33\x09\x3c\x45\x0a\x34\x9d\xf0\x6f\x30\x97\x03\x8f\x66\x78\
+\x3f\xec\x8d\x9f\x44\x7f\xbd\x08\xa5\x6e\xb7\xed\x55\x28\xc5\x10\
+\x80\x21\x0d\x01\x22\x0a\x78\x4f\xe1\xfe\xa1\xbe\x6f\x13\xe1\xff\
+\xa9\x44\x02\x84\xfa\x5b\xb7\x91\x00\xfb\x66\xd8\x7f\x3e\x42\xf5\
+\x92\x80\xb9\x8e\xab\x39\x2d\x1f\x08\x7d\x0e\x53\x71\x99\x59\xde\
+\xa5\x66\x68\x2a\xea\xd2\x61\xbe\xa7\xe5\xc0\xef\x65\x00\xac\x62\
+\x06\x70\x9e\xa7\x5f\xe8\x3a\x86\x2e\x0f\xd3\x74\x47\x55\xe6\xb3\
+\xf7\x24\x4f\xfe\xd5\xc0\x20\xa3\x8c\xfe\x69\x9b\x00\x7f\xcb\xf4\
+\x5e\xd8\xa7\xe2\xa4\x5e\x65\xff\x7c\x2c\x03\xe8\x46\xc0\x7b\xc5\
+\x43\x32\xc0\x10\xdb\xf4\xba\x7f\xdb\xca\x02\xee\x9d\x69\x1f\xfa\
+\x37\x89\xff\xc6\xe6\x11\xa9\x46\x07\xfc\x2b\xd3\x7b\x61\xcf\x0c\
+\x74\x0f\x85\x86\xbb\xde\xdf\xe5\x3d\x13\x98\x25\x03\x60\x75\x5c\
+\x25\x03\x5c\x8e\x25\x8e\xf0\xd4\x98\xcb\xb2\x33\xf9\xe5\x01\x00\
+\x7b\x9a\x3b\xbb\xc6\x4e\xc8\xd3\x60\x56\xe7\x84\xa4\x4e\x62\x9a\
+\x00\xb7\x01\x53\x32\xbc\x0f\x36\x61\xf5\x75\xb9\x4d\x95\xfd\xcb\
+\x25\xf9\x5f\x99\x6d\xea\x58\x06\xd0\xad\xd0\x2e\xf3\x34\xdf\x53\
+\x42\xc0\x5e\xf7\x89\x69\x0c\xe4\x94\x0c\xb0\x6c\x3f\xb0\xe6\x36\
+\x93\x81\x8d\x33\xec\x47\xaf\x07\xee\x68\x58\xfc\xa7\x3a\xd6\x7a\
+\x17\xf7\x31\xae\xd7\xc3\x74\x8e\x1a\x49\x95\x71\x84\x2f\x01\xd8\
+\xd4\xef\x77\x11\x2e\xcb\x3d\xbb\xd1\xba\x9e\x0c\x80\x53\x71\x16\
+\x9d\x7b\x7e\x87\xc6\x93\x92\x1b\x36\x16\x5b\xd3\x93\x1b\x2b\x80\
+\xbf\x47\xf8\x6d\xda\x96\xd1\xbf\xae\xcf\x69\x62\x32\x35\x78\xbb\
+\x3f\x93\x27\xfb\xe2\xa3\xec\x5f\x2f\xe6\x40\xaf\xdb\x56\x15\x5c\
+\x4d\x24\xff\xab\x2a\xe6\x63\xd2\xe4\x67\xc5\x0a\xff\x0f\x2d\xfa\
+\xeb\x2a\x0b\x18\x7a\xdb\x3a\xca\x02\xe6\x98\x07\x00\xe0\x2f\x8e\
+\xc6\xab\x5c\xc6\xfd\x14\xe6\x4a\x65\xde\x3f\xc5\xa7\xb8\xac\xcc\
+\xae\xc0\x98\x84\xf5\xce\x60\x7d\x70\xa1\xbf\xcb\x3b\x07\x47\x81\
+\x23\x9e\x0c\x80\xa5\xde\xe6\xe8\x73\x88\x17\x3e\x52\xb7\x1b\x9c\
+\x63\x1e\x00\xb0\x75\x23\xf3\x1c\x75\x3a\x75\x7f\x46\x8e\x4b\x01\
+\x62\xdc\x43\x0f\x10\x2f\xa2\xa7\x69\x0e\xec\x61\x92\xaf\xb2\x7f\
+\xf5\x25\xff\xab\x23\xf1\x5f\xd3\x34\x9d\x10\xb0\xee\x64\x80\xbd\
+\x8a\xfb\x5c\xcb\x02\x1e\x98\x69\x5f\x7a\x11\x96\x04\xba\x89\x79\
+\x9c\x42\xff\xfd\xce\xd5\xd6\x64\x2e\x70\x41\xa6\xf7\x40\xdd\x5a\
+\x21\x96\x16\xba\xb6\xd0\x70\xce\xf8\x2d\xb0\x44\x06\xc0\xd0\xfc\
+\xd8\xdb\xaf\x75\x76\x43\x22\x3e\xb4\x63\xb9\x5f\xa6\x9d\xd5\x52\
+\xe2\x44\x01\x78\xe9\xd8\xb4\xd6\x3f\xcc\xb1\x7e\xcd\xc8\x59\x9e\
+\x53\x64\x14\x70\x50\xc9\x09\x7f\x28\xa1\xd0\x8b\x39\xd0\xeb\x71\
+\x7b\x3d\x4e\x68\xc1\x57\xc7\x32\x80\x2a\x42\xbe\xaf\xe1\x57\xe8\
+\xf3\xee\x75\xbf\x2a\xdb\x79\x49\x06\x58\xa6\xca\x40\xd9\xe3\x86\
+\x5a\x16\x70\x30\x69\x96\xa7\x1c\x89\x15\xc5\x58\x91\xea\x53\xfd\
+\xdc\xca\x00\x7b\x5d\xd2\x79\x2a\xf9\x95\xfe\x1b\x4e\x2b\x78\x2e\
+\xb1\xdd\xe9\xd8\x4e\xab\x33\xfc\xd2\xd3\xc9\x78\x33\x00\xa6\x61\
+\x4b\xbb\xdd\x70\x07\x30\xbd\x21\x11\x1f\x92\x1d\x80\x49\x99\x76\
+\x58\x67\x62\x59\x7c\xbd\x99\x30\x12\xf8\x3e\x4c\x80\x7b\xc8\xdb\
+\xad\x9f\x48\x7a\x65\xff\x46\x12\x32\x31\xca\xfe\x75\x23\x16\xab\
+\x6c\x03\x61\xeb\xde\x7b\x4f\xfa\x17\xfb\x3b\xe5\x92\x0c\xb0\x8f\
+\x7a\x8d\xb3\x3a\x96\x05\x6c\x80\x85\x0a\xe7\xc8\x79\xc0\x7d\x12\
+\xff\x59\xcc\x7d\x62\xcc\xb1\x67\x93\x67\xe9\x3f\xb0\xdc\x1e\xdb\
+\xd6\xf8\x79\xb1\x7e\xbf\xbb\x2a\xe8\xb6\x88\x5c\x88\x15\x8e\x90\
+\x01\xd0\x81\x9f\x78\x3b\xa1\x73\x1a\x12\xf1\x21\x9d\xb7\x3e\xf2\
+\x8e\x02\xf8\xa3\x53\x01\x9f\x5a\xc9\xbe\x3a\xa9\xcb\x04\xf8\x85\
+\xc3\xef\x1e\x8a\x83\x02\x09\x7c\x2a\xfc\x2d\x46\x28\x73\x19\x43\
+\xa1\x8a\x78\x2b\xbb\x4d\x1d\xc9\xff\xea\x2c\xd5\xd7\xd4\xb9\xe4\
+\x9c\x0c\x90\x1a\xef\x9b\x3a\x97\x05\x1c\x9c\x69\x9f\xba\x12\x38\
+\xd1\x91\xf8\x4f\x71\x4c\xf6\x32\x2f\x8a\xf1\x19\x7f\x24\xdf\xa7\
+\xff\x4f\x5f\xe3\x1e\x4f\xf5\xe9\xff\xd9\x3e\x2f\xef\x4f\xbd\x9d\
+\x90\x47\x03\xe0\x24\x9e\x9a\xdc\xbd\x51\xae\xc6\xd6\xfc\x34\x25\
+\x10\x43\x71\x00\xf9\x72\x11\xe5\x1c\xbf\x9c\x9e\xf2\xa7\x34\x01\
+\xa8\xeb\xbb\xdf\x08\x5c\x91\x71\xbb\x3f\x34\x90\xc0\xaf\x3b\xf9\
+\x5f\x5f\x0f\x02\xac\x4d\xc9\xff\xea\x14\xe8\x75\x86\xfc\x87\xf8\
+\xde\xa9\x27\x03\xec\xc3\xc7\x12\x80\x50\xfd\xc3\x21\x19\xf7\xab\
+\x97\x50\xad\x62\x4c\xaa\xb9\x01\x9a\x1e\xaf\x9b\x16\xf7\x23\x71\
+\x2f\x70\x71\xc6\xed\xbe\xce\xdc\x1e\xb1\xe6\xde\xf3\xb0\xf5\xff\
+\xce\x78\x84\xa1\x57\x2b\xcb\x00\x58\x83\x25\xc0\x6f\x3c\x9d\xd0\
+\x0a\x9a\x0b\x21\x0e\xe9\xc0\xed\x05\x8c\xcf\xb4\xe3\xea\xc7\x5c\
+\xfb\xfe\x44\x06\x92\x18\x03\xb8\xd6\xfa\x3f\xf5\xbe\xfd\x61\xc6\
+\x83\xf5\xa6\xd8\xd2\x9e\x14\x93\xff\x85\xfc\x7b\xb7\xef\xa5\x90\
+\xfc\xcf\x7b\xd2\xbf\xba\xce\x3f\xc7\x64\x80\x31\xfe\xde\x64\x32\
+\xc0\x5d\xc8\xb3\x1c\xe0\x00\x3f\xe2\xa9\x79\x63\x94\x1b\xc0\x87\
+\x11\xd1\xc4\x9c\xac\x1f\xf8\x39\xf9\x46\x13\x4e\x00\x76\x8f\xa4\
+\x3d\xea\xe4\x1c\x5c\x56\x67\xf8\x39\x8e\x92\xff\x79\x36\x00\xc0\
+\x96\x01\xb8\xca\xd9\x75\x3e\x16\x6a\x9e\xd2\x8d\xb0\x26\x63\xb1\
+\x92\x61\xb9\x32\x95\xa1\xdd\x59\x65\xf4\x6f\xa7\x09\xf0\x4f\x6c\
+\xfd\x7f\xae\x3c\x6b\x8d\xc9\x79\xa8\xd0\xfe\x3a\x9f\xfc\x57\xf9\
+\x7b\x8c\x27\xff\xde\x93\xff\xc5\x7c\x8a\xdf\x44\x84\x40\xea\xc9\
+\x00\xfb\x68\xce\xf8\x8a\x9d\x0c\x70\xa4\x3e\xa5\x0f\x38\x32\xe3\
+\xfe\xf5\x2e\xe0\x0c\x89\x7f\x77\xf3\x93\xa6\xe6\x6b\xee\x16\x70\
+\x07\x66\xdf\x42\x23\x78\xa0\x6c\x1b\x58\x8a\x45\x03\x3b\x63\x25\
+\xb6\x12\xd5\x1d\x5e\x0d\x80\xbb\xb1\x5c\x2c\x6e\x58\x40\xbc\x50\
+\xe2\xfe\x1a\xdf\xcf\x75\xdd\xde\x00\xbf\x2a\x7e\xab\xba\x7f\x23\
+\x4f\xc7\x68\xeb\x5a\xff\xc1\xdb\xcc\xa1\xf3\x3a\xce\x1c\x38\x9a\
+\xb0\x4f\xfe\xeb\x4c\xfe\x97\xe2\x93\xff\x5e\x85\x6c\x4c\x01\x5c\
+\x85\xd4\x3e\xb3\x89\x64\x80\x39\x44\x02\xc4\x4e\x10\xd8\x57\xf4\
+\x41\x39\xf3\x53\xe0\x51\xa7\xe2\x3f\xd5\x31\x3c\x85\x63\x0c\x35\
+\xff\xff\x4d\xe6\x6d\xfd\x90\x86\x34\x49\x48\x2e\x8d\x34\xff\xaf\
+\xc8\x99\x38\x7d\x16\x35\xca\x71\x7b\x74\x57\x12\xf0\xac\x0e\x0d\
+\x37\x95\x28\x80\x03\xb0\x50\x9f\x5c\x99\x8f\x15\xda\x6c\xe2\xf7\
+\x49\x49\xe0\xa7\x10\xc2\x5f\x65\xbb\x6f\xfb\x1c\x08\x82\xb1\x15\
+\xab\xb2\x70\xd7\x91\xe8\xaf\xdb\xbf\x35\x6d\x04\xd4\x55\x09\x20\
+\x76\xf2\x3f\x0f\x09\xff\x9a\x38\x57\x2f\xc9\x00\x43\xb6\xb1\xa6\
+\x22\x01\x42\xfd\xad\x53\x7f\xb2\x3b\xb0\x45\xc6\xfd\xec\x42\xe0\
+\x07\x09\x8f\x83\xa9\xcd\x27\x3c\x1c\x63\xa8\xf7\x7f\x5d\xcc\x2d\
+\x73\x65\x1d\x60\x7f\x27\xe7\x52\x76\xae\xde\x4f\xe7\x84\xed\x0d\
+\xf2\x13\xaf\xbf\xbb\x67\x03\xe0\x74\xe0\x41\x4f\x27\x34\x03\xab\
+\x53\xe8\xa9\xd1\xf7\xfa\xfe\x5a\x3c\xb5\x6e\x78\x6e\x9c\x0b\xdc\
+\xd0\xc0\x6f\x50\xd7\x31\xbc\x4d\x0e\xbc\x24\xfc\x1b\xe0\x02\xe0\
+\xca\xcc\xdb\xf8\x73\x02\x4e\xe4\x53\x7b\xf2\x1f\xe2\xe9\xac\xa7\
+\xe4\x7f\x31\x85\x77\x1d\xaf\x90\xe7\x5f\x66\x3f\x2a\xfe\x96\xb1\
+\xda\x53\x2e\x91\x00\x9d\xfa\x95\xbe\x21\xfa\xa2\xdc\xb8\x14\x4b\
+\x0a\xe8\x61\x6c\x4b\x75\x7c\x4f\xb9\x72\xc0\x75\x38\x0b\x47\x8e\
+\xc0\x41\xac\x0a\xff\x4f\xf5\xe9\xff\xcd\xc0\x4c\x7f\x97\xf6\x7e\
+\x2c\x02\x40\x06\x40\x8f\x2c\xc7\xe1\xba\x89\xd3\x1d\x36\xfc\x5e\
+\x39\x3c\xf3\xce\xac\x1f\x4b\xe0\xb3\xa0\xa1\x81\xac\x8d\x02\xdf\
+\xcb\x93\x8d\x39\x74\xf7\xc4\x26\x75\x9e\x4d\x9a\x65\xff\x42\xfe\
+\xbd\xaa\xd8\xf7\x92\xfc\x2f\xf5\xc4\x7f\x31\xbf\x97\x92\x01\x56\
+\xbf\x07\xcb\xfc\xad\x97\xbe\x24\x77\x03\x00\xe0\xbb\xc5\xd8\xe2\
+\x79\xec\xcb\xdd\x20\x68\xe2\x18\x0b\x71\x18\x8a\x1c\x81\x23\x1c\
+\xcd\xdd\xcb\xbe\x7f\x86\xcf\x4b\xfb\x33\x5c\xe6\x24\xf4\x6f\x00\
+\x0c\x5c\x3c\x57\x25\x37\x6f\x21\xde\x62\x8e\xba\x9c\xb7\x3d\x81\
+\x49\x99\x77\x68\x73\x8b\xc6\xd3\x84\x49\x23\x81\xdf\xcc\x44\xa8\
+\x1f\xf8\x1a\xf0\x78\xe6\x6d\x7b\x67\x60\xfb\x8a\x02\xbf\xe9\xb2\
+\x7f\x55\xfe\x9e\x7a\xf2\xbf\xd0\x42\xba\x4e\xb3\xa0\xee\x84\x80\
+\xbd\xee\x53\x65\xbb\xb6\x26\x03\xac\xda\x7f\xec\x88\x55\x23\xc9\
+\x99\xf9\xc0\xd7\x29\x57\x65\xa8\xed\xe2\x3f\xe5\xd0\xff\x1f\x77\
+\x30\x7e\x72\x61\x13\x60\xb7\x9a\x35\x48\x68\xee\x06\x6e\xf5\x77\
+\x69\x97\x63\x69\xc9\xdc\xe2\xdd\x00\x98\x05\xfc\xc3\xdb\x49\x9d\
+\xd1\x40\x03\x0f\x3d\x89\x3b\x8c\xfc\xb9\x84\x72\x6b\x82\x52\x5a\
+\x0a\xa0\x84\x7f\xab\x38\x09\xb8\xbe\x05\xed\xfa\x78\xe2\x97\xfd\
+\x53\xf2\xbf\x7a\x97\x01\x84\x12\xef\x5e\xc3\xfd\x43\x7d\x7f\x25\
+\x03\x0c\x7b\x9f\x86\xe8\x33\xfa\x80\x17\xb5\xa0\xdf\xbd\xae\x18\
+\x63\x3c\x8b\xff\x14\xc7\x7a\xaf\xa1\xff\x67\x01\x97\xb5\xa0\x5d\
+\x1f\x4e\x1a\x91\x66\x9d\x7e\xc3\xd3\x7c\x9e\xf2\x29\xb8\x5c\x95\
+\x90\x8e\x01\x00\xf0\x7d\x6f\x27\x74\x2d\xf0\x50\xa4\x4e\xb3\xae\
+\xf7\x9f\x43\xda\xe1\xa5\xdd\xf2\x0b\x60\x7a\x84\x81\xd4\x6b\xb6\
+\xda\x54\xcc\x86\xd0\xc7\x9a\x8a\xd3\x3a\x2b\x81\x19\x0f\x1c\xd3\
+\xe3\x04\xbe\xcc\xc4\x1f\xf2\x7a\xf2\x1f\x4a\x24\xc6\x5a\x06\xd0\
+\xad\x78\xf7\x4e\x93\x09\x01\x3d\x24\x03\xf4\x18\x09\x40\xc4\x7e\
+\x62\xe0\xff\x9f\x57\xf4\x4d\x6d\x98\x4f\xdc\xec\x7c\x2c\x4c\xc9\
+\x6c\xf0\x3a\x17\xbb\x97\xfc\xab\x08\x0d\xdc\xbf\x47\x38\xd3\x26\
+\xbd\x32\x0b\xb7\x0f\x7e\xbe\xe7\xfd\xf7\x4f\xc1\x00\xb8\x0c\xb8\
+\xc6\xd3\x09\xad\xa4\x73\x56\x87\x14\xa2\x00\x36\x07\xf6\x6e\x41\
+\x07\xb7\x14\xf8\x16\xb6\x96\x2b\x87\x81\x29\x97\x6d\x42\x1e\xeb\
+\x11\xe0\x33\x58\xbc\x55\xee\x1c\x8d\x65\xec\x0d\x31\x71\xcf\xb5\
+\xec\x5f\x08\xa1\x1f\x42\x68\x8e\x24\x8a\x63\x09\xec\xb2\x02\xbc\
+\xa9\x08\x81\xb2\xc7\xf2\x98\x0c\x90\x06\xee\x0b\x0f\xc9\x00\xd7\
+\x05\x8e\x6a\x41\xff\xbb\x1c\xf8\x22\xdd\x85\x85\x6b\x79\x40\x9a\
+\x06\xc1\x02\xe0\xab\xc5\xdc\x31\x77\x9e\x46\x1a\x55\x3c\x3a\xfd\
+\x86\xa7\xfb\xd4\x5c\xd7\x91\x40\x2e\xea\x51\x89\xb4\xd3\x1f\x7a\
+\x3b\xa1\x4b\x80\xc7\x22\x75\x48\x75\xbd\xff\x5c\xda\xc1\x2c\xe0\
+\x9b\xac\x9e\x89\x23\xa5\xd0\x34\x99\x00\x9d\x0d\x9e\xcf\x01\xf3\
+\x5a\xd2\x96\x8f\xef\x41\x00\x10\xf8\x6f\x39\x2e\x01\xa8\x9a\x13\
+\x00\xe2\x24\xff\x8b\x89\xa7\xcf\x6c\x32\x19\x60\xc8\xbc\x00\x9e\
+\x85\x7f\xe8\xfe\x60\xb8\xcf\x38\xbe\x25\x7d\xf0\x1c\xe0\xf3\x74\
+\x36\x9c\x25\xfe\xd3\x9c\x5f\xad\x28\xe6\x8a\x0f\xb7\xa4\x2d\x1f\
+\xeb\x4c\x93\xf4\xca\x3c\xe0\x0a\x9f\x97\xf6\x3b\x29\xfc\xfe\xa9\
+\x18\x00\x7f\xc1\x59\x49\xc0\xe5\xb8\xad\x39\xd9\x35\xfb\x03\x9b\
+\xb6\xa4\xa3\xbb\x89\xa7\x16\xe3\x6c\xe3\x53\x7e\x8f\xe7\x53\xf6\
+\x58\xfd\xc0\xb7\x81\xdb\x5a\xd2\x86\x77\xc2\xea\x6e\x77\x12\x3d\
+\x65\x04\x42\x9b\x93\xff\x95\xd9\xa6\x8e\xe4\x7f\x29\x2d\x07\x08\
+\x7d\xae\x75\x25\x03\x2c\xbb\x4d\x9b\x92\x01\x76\x63\x2c\x0e\xb0\
+\x17\xb0\x5d\x4b\xfa\xe2\xa9\x58\xc2\xd9\xfe\x8c\xc4\x7f\x6a\xe7\
+\x13\xe3\x18\x3f\x07\xa6\xb4\xa4\x0d\x6f\x06\xec\x97\xf8\x77\x38\
+\x13\x97\x91\x9f\x33\x80\x93\x65\x00\x84\x63\x19\xf0\x53\x6f\x27\
+\x75\x1e\xb0\xa8\x64\xe7\xe4\xe1\xfd\x3e\x2c\xa4\xb8\x2d\x9c\x4b\
+\xef\xa5\x42\x3c\x09\xfc\xba\x06\xf0\x26\xbe\x57\x99\x63\xfd\x8c\
+\xfc\xeb\xf3\x0e\xe6\x15\x5d\x5c\x27\x95\xfd\x6b\x4f\xf2\xbf\x3e\
+\x27\xaf\xd0\xe7\x5f\x66\x5f\x2a\xfe\xa6\x8a\x04\xe8\xfc\xb7\x6e\
+\xae\x73\x3f\xb0\xb8\x45\xfd\xf1\x85\x3c\x75\x9d\x78\xca\x89\x01\
+\x53\xcb\x49\x14\xfa\x18\xa7\x61\x89\xff\xda\xc2\x31\xc5\x3d\x9d\
+\x82\x56\x19\x8a\x85\xc5\x3d\xe8\x90\x1f\xe1\xac\x7a\x5d\xea\x06\
+\x00\xd8\x03\xdc\x27\x3d\x9d\xd0\x93\xc0\x05\x89\x77\x02\xcf\x06\
+\xc6\xb6\xa8\xd3\xfb\x05\xb6\x7c\x23\x45\x81\x9f\xda\xfa\xbd\x98\
+\xc7\x3a\x15\xf8\x6b\x8b\xda\xed\xc6\xac\x4a\xfe\xd7\xcd\xf5\xd4\
+\x93\xff\xb0\x66\x40\x53\xc9\xff\x52\x27\xe5\x64\x80\x8a\x04\x18\
+\xfe\x78\x43\xf5\xcb\x4f\xd0\x9e\xd0\xe9\x01\xfe\x08\xfc\x33\x91\
+\x31\x33\x95\x79\x43\x13\x9f\x73\x11\xed\x48\xfa\x37\xc0\x5a\xa4\
+\x9f\xb3\xe3\x3c\x5c\x1a\x8e\x8b\xb0\x40\x92\x24\x48\xc9\x00\x78\
+\x14\xf8\x83\xb7\x93\x3a\x8b\xe1\x93\x85\xa4\xe0\xac\xad\x07\x1c\
+\xd9\xa2\x8e\xaf\x1f\x2b\x2b\x71\x5d\xc0\xeb\x98\xab\xc0\xf7\xfa\
+\x34\xe3\x6c\xe0\x7f\x5b\x36\xd1\x7c\x39\xab\x1b\x75\xfd\x94\x8f\
+\x06\x68\x53\xf2\xbf\x5e\x85\x9c\xa7\x65\x00\x23\x09\xe8\x26\x0c\
+\x83\xd8\xe7\x53\x57\xf8\x7f\x08\x63\x28\xd4\x7b\x29\x25\x03\x1c\
+\xaa\xcf\x1e\xe8\x87\x42\x67\xc7\x4f\x85\x1f\xd0\x7d\x64\xa1\x72\
+\x03\xf8\x98\x27\x0d\x7e\xff\x1a\x2c\xc9\x58\x9b\xda\xee\x51\x58\
+\xe2\xce\x54\x9f\xfe\x2f\xc3\x22\x7a\x1d\xf2\x5b\xba\xcb\x11\x2a\
+\x03\xa0\x64\x5f\xeb\xea\x3e\x9d\x0f\x5c\x9a\x78\x67\xf0\x62\x60\
+\x74\x8b\x3a\xbf\x15\xc0\x37\x8a\x09\x4b\xc8\x41\xa7\xad\x03\x76\
+\x9d\x13\x96\x0b\xb0\xaa\x0e\x6d\x1a\xac\xd7\x2e\xee\xd1\xb2\xd7\
+\x34\xd5\x25\x00\xa1\xa3\x02\x42\x6e\x13\x4a\xac\x86\x16\xef\x5e\
+\xc3\xfd\x43\x5d\x83\x2a\xd1\x00\xb1\xb6\xf1\x18\x09\x10\x23\x19\
+\xe0\x48\x7d\xcf\xcd\xb4\x93\x7e\xac\xde\xd7\xc5\x12\xff\xc9\x18\
+\x04\x03\xdc\x54\xcc\x27\x56\xb4\xa8\xbd\x8e\x06\x5e\x94\xf8\x77\
+\xb8\xb0\xd0\x5e\x0e\xbb\x82\x1f\xa6\x74\x1d\x53\x33\x00\xfe\x0d\
+\x9c\xef\xed\xa4\x4e\x63\xf8\x44\x14\x29\x38\x6c\x9b\x02\x87\xb5\
+\x6c\xd0\x5e\x0a\x7c\x09\xb8\x21\x51\x81\x5f\x77\xaf\xe6\x61\xe2\
+\x72\x21\xf0\x75\xac\x0c\x67\x9b\x78\x21\xe6\xd6\x77\xba\x5e\x31\
+\xa3\x01\x7a\x31\x07\x42\xfe\x3d\xc4\x7b\x4d\x27\xff\x0b\x29\xde\
+\x53\x21\x66\x42\xc0\x50\xdb\xe7\x5e\x16\x30\xf4\xfd\xdf\x4d\x7f\
+\xd3\x96\xe4\x69\x43\xb1\x12\x2b\x1d\x77\x49\x42\xe2\x3f\xc5\x39\
+\x44\xc8\x79\xda\x75\xc0\x57\x68\x47\xb9\xbf\xc1\x1c\x0e\x6c\x42\
+\xba\x4f\xff\x97\xd3\x7b\x2e\xaf\x9a\x38\x1b\x98\x26\x03\x20\x2e\
+\xdf\xf7\x76\x42\x73\x3a\x74\xfc\xa9\xf0\x12\xf2\x58\x73\xda\xab\
+\x09\xf0\x55\xe0\xda\x40\x1d\x56\x9d\x03\x6f\xca\x21\xfc\x65\x8e\
+\x75\x46\x31\x58\xaf\x68\x59\x1b\x1d\x03\x9c\x10\xf0\xba\x2a\xf9\
+\x5f\xf9\x6d\x42\x08\xd2\x2a\x62\xbe\x8e\x27\xf8\x4d\x45\x09\x84\
+\x3a\x5f\x2a\xfe\xc6\x4a\x06\x58\xae\x8f\x59\x0c\xdc\x41\xbb\x59\
+\x8e\x3d\x54\x38\x33\xe3\x71\x38\xf5\x39\xcf\xc0\xfb\x57\x61\x55\
+\x1c\xda\x26\xfe\x47\x31\x7c\x34\x61\x2a\x5c\x08\xcc\x95\x36\x6d\
+\xad\x01\xf0\x2f\x8f\x63\x4d\xea\x51\x00\x93\x81\x83\x5a\x38\x68\
+\x2f\x2b\x06\x82\x6e\x93\x39\xb6\x75\x29\x00\x35\x5e\x9f\x35\x8f\
+\xf5\x17\x2c\xc4\xb2\x8d\xeb\x4b\x8f\xc3\xca\xf5\xf4\x72\xcd\x42\
+\x45\x03\xf4\x62\x0e\xc4\xf8\x7b\xce\xc9\xff\x9a\x7a\xd2\xdf\xe7\
+\xf4\xb3\xcb\xee\x1f\xc2\x1c\x50\x32\xc0\xf2\x4f\xfd\x07\xb8\x05\
+\x97\xe5\xb8\x6a\x67\x25\x56\x00\xfc\xaf\x89\x8c\xad\x39\xcd\x41\
+\xba\x3d\xc6\xf9\xc0\x37\x5b\xda\x5e\x0f\x02\xb6\x24\xed\xa7\xff\
+\xa7\xfb\xbc\xb4\xb7\x61\x11\x00\x49\x91\xe2\xd2\xef\x7e\xcc\xb8\
+\x73\xb5\x8c\x65\x11\x30\x09\xd8\xbe\xc3\x24\x61\xa4\xc9\x4a\x93\
+\xef\x03\x6c\x81\xc3\xf5\x15\x35\x35\xa8\x6b\x8a\x7f\xef\x45\xf7\
+\x4f\x9e\xaa\x5e\xef\x5c\xb7\x09\x75\xac\x15\x58\xb2\xbf\x3f\xb6\
+\x74\x32\xb9\x16\xf0\x05\x2c\x07\x40\x2f\xd7\xbe\x97\x36\x9a\x43\
+\xf2\xbf\x10\xef\x7b\x4a\xfe\xe7\x25\xe1\x5f\x93\xe7\xeb\x3d\x19\
+\x60\x0e\x91\x00\xdd\x5e\xd7\x6e\x84\xd5\x59\xd8\x7a\x6a\x61\x5c\
+\x8f\x55\x45\xd8\xbf\x4b\x73\x25\x94\xb8\x6d\x6b\x6e\x80\x6e\x8e\
+\xb1\x12\xf8\x13\xf0\x2b\xda\xf9\x30\xa1\x0f\xf8\x6f\x60\x62\xc2\
+\xdf\xe1\x02\x2c\x7a\xc3\x21\x1f\x03\x6e\x4c\xed\x7a\x8e\x4a\xb4\
+\x1d\xfc\x06\x98\xe9\xed\xa4\xfe\x41\xba\x51\x00\x00\xdb\xd1\xce\
+\x28\x80\x81\xeb\xf3\x67\x2c\xcb\xe4\xd2\x40\xc7\xab\x6b\x1b\x8f\
+\xe7\x53\xf5\x58\x0b\x81\xff\x29\xee\xa9\xb6\xf2\x62\x6c\xad\x5e\
+\xd9\xb6\xd0\x4f\xb5\x65\x01\xa9\x24\xff\xeb\x46\xcc\x34\xb9\x0c\
+\x80\x48\x22\xbe\xcf\xc9\x2b\xc6\x77\x28\xb3\x2f\x35\xfc\xfe\xa9\
+\x45\x02\xf4\x12\x1d\x50\xb6\xff\x80\x76\xaf\xff\x1f\x8e\x53\x81\
+\x4f\x63\x0f\x87\x72\x13\xff\xa9\x9d\xcf\x12\x2c\x3e\xfb\xaf\x2d\
+\x6e\x8f\x87\x00\xdb\xd6\x60\xb6\xb4\x70\xed\xff\x0c\xe0\xf7\x29\
+\xb6\x89\x54\x0d\x80\x25\x85\x56\x73\xc5\x1c\xe0\x72\xe7\x22\x77\
+\xa4\xf7\x5f\x4d\xbb\x2a\x02\xac\xc9\x05\xc0\xa7\x18\xb9\x8e\x47\
+\x6a\x6b\xe3\xea\x1e\xb4\xab\x1c\xeb\x01\xe0\xbd\xac\x5e\xaa\xb1\
+\x6d\x4c\x00\x5e\x57\x71\x52\xde\xcb\x3e\x4a\xfe\x17\x46\x5c\x86\
+\xa8\x71\x9f\x62\xe2\xbf\xd8\xdf\xaf\xa9\xf0\xff\x6e\xb6\x49\x3d\
+\x19\x60\xd5\x3e\x66\x29\x89\x65\xbe\xaa\x91\x6b\x80\xf7\x15\x0a\
+\x21\x05\xf1\xdf\xc4\x9c\x23\xf6\xf7\x9a\x53\xcc\xe9\x2e\x6a\x71\
+\x3b\x1c\x53\xcc\xed\xfb\x9d\xfc\xae\x65\xb8\x08\xab\x05\xef\x90\
+\xef\x92\x68\x3a\x89\x51\x09\xb7\xe9\x1f\x03\x8f\x79\x3b\xa9\xbf\
+\xe3\x37\x0a\xa0\x1b\xb6\x00\x8e\x6e\xf9\xa0\x7d\x07\xf0\xa1\x2e\
+\x26\x35\x39\xe6\x03\x68\xda\x74\xb8\x08\xf8\x2f\xe0\xfe\x96\xb7\
+\xc1\x97\x03\x1b\x06\xbe\xfe\xdd\x46\x03\xe4\x52\xf6\x2f\x87\xe4\
+\x7f\x75\x97\xe8\x6b\xfa\x9c\x72\x48\x06\x98\x52\x24\x40\x88\x7e\
+\xe5\x06\xec\x89\x8c\x18\x9a\x7b\x81\x77\xb3\x7a\xa2\x68\xe5\x06\
+\xa8\x67\xfe\x34\x0d\xf8\x20\x70\x67\xcb\xdb\xe0\xd1\xf4\x96\x4b\
+\xa8\x29\x8d\x32\xdc\xfb\x2b\x70\xfb\xf4\x7f\x1e\xf0\xb3\x54\xdb\
+\x45\xca\x0f\x7b\x97\x14\x73\xe4\x67\x7a\x3a\xa9\x45\x58\x59\xbd\
+\x6d\x3b\x4c\x1c\x46\x9a\x9c\x54\x79\x3f\xc4\x31\x76\x04\xce\xa3\
+\xdd\x49\x7d\x16\xb3\xca\x31\xde\x63\x84\x89\x20\x35\xfc\x66\x1e\
+\xb7\x09\x79\xac\x65\x98\xa3\xf7\xf3\xe2\xdf\x6d\x66\x03\xe0\xb3\
+\x58\x0e\x00\x02\xfe\x56\x55\xfb\x88\x94\x9f\xfc\x7b\x4f\xfe\x57\
+\xb7\x30\x6f\x2a\xe4\x3f\xc4\x75\xf0\x9e\x0c\x30\xd4\x7b\x31\x23\
+\x01\x42\x88\xb1\x81\x7d\x4e\xc6\x32\x60\x89\xce\xe3\xdb\x25\xc0\
+\x02\x60\xdf\x2e\x27\xde\xca\x0d\x50\x9e\x15\x58\xb8\xff\x0f\x81\
+\x27\x5b\xde\xf6\x26\x14\x26\xc8\xb8\xc8\xe2\x3d\x26\x17\x01\x57\
+\xf8\xbc\xbc\xdf\xc6\x52\xa0\x24\xc9\xa8\xc4\xdb\xf6\x77\x3d\xde\
+\xdf\xff\x60\xf8\x72\x65\xfd\x09\xdc\x84\x13\xb1\xda\xe3\x6d\x67\
+\x05\x96\x80\xee\xe3\xc0\x43\x2d\x1b\x58\xeb\x9c\x58\xdc\x83\x85\
+\xfc\xff\x43\x4d\x0e\x80\xb7\x02\xeb\x96\x98\x88\x13\x78\x1f\x25\
+\xff\xab\x2f\xf9\x5f\x4a\x49\xff\xea\xfc\x2e\x4a\x06\x18\xe7\xfe\
+\x0a\xd9\x7f\x5c\xa9\x2e\xbb\x6b\x4e\xc5\xa2\x01\xee\x92\xf8\x8f\
+\xb6\xcd\x6c\x2c\x7f\xd0\x9f\x68\x5f\xd9\xe0\xa1\x38\x9e\x7a\x12\
+\xff\xc5\x7c\xfa\x7f\x9a\xcf\x4b\xbb\x18\xcb\x53\x9d\x2c\xa9\x1b\
+\x00\x0f\x03\xbf\xf3\x76\x52\xb3\x89\x9b\x0b\xa0\x8e\x30\x9c\x17\
+\xd2\x39\x04\xb9\x4d\xdc\x0e\x7c\x00\xab\xf1\xd1\x1f\x79\xb0\xae\
+\x0b\x0f\x13\x8c\x15\xc0\x1f\x80\xf7\x00\xd3\xd5\xcc\x00\x8b\xbe\
+\x79\x01\xf1\x12\xfe\x95\xd9\xa7\x4d\x65\xff\x42\x08\xcb\x50\xa6\
+\x40\x19\x61\x1d\x4b\x74\xd7\x11\x21\x90\x4a\x32\xc0\x54\xcb\x02\
+\xc6\xe8\x33\xee\x61\x78\x73\x5c\x0c\xcd\x7d\x98\xe1\xfd\xc7\x61\
+\x04\x6a\xca\xb9\x01\x9a\x9c\x9b\xf4\x63\x35\xc2\xdf\x8b\x72\x52\
+\x0c\xb0\x61\x97\xf3\x09\xcf\x0f\x26\x2f\xc6\xed\xda\xff\x13\x53\
+\xef\xfe\x72\xc8\xf7\x36\x0d\x5b\x36\xec\xca\xcc\xb8\x1f\x5b\x77\
+\x33\xaa\xc3\x24\x61\xa4\x89\x4a\x93\xef\x8f\x05\x36\x02\xae\x56\
+\x1f\x0a\x58\x08\xdf\xb5\x58\xbd\xe3\xdd\x81\xf5\x7a\xbc\x9e\x1e\
+\xb7\x69\xf2\x58\xb7\x01\x9f\x03\x2e\xc4\xca\xf3\x08\xe3\x73\x58\
+\x1e\x8e\x5e\xaf\x3d\x15\xf7\xe9\xb6\xcf\xf0\xba\x04\xa0\x97\xf7\
+\xbd\x2e\x03\x88\xfd\xa4\xbf\xe9\x5c\x02\x21\x3e\xd7\x43\x32\x40\
+\x02\xb7\xdd\x14\x9e\xf8\x0f\xb7\xdf\x19\x58\x0e\x00\xd1\x1b\x2b\
+\xb1\xb2\x89\x57\x01\x3b\xb0\xaa\xda\x8b\x57\xf1\xef\x31\x0f\xd1\
+\x60\x1e\x02\xbe\x51\x18\x00\xcb\xd5\xbc\xfe\x3f\xef\x60\xf8\xd2\
+\xe4\x75\x52\xd6\x40\x58\x86\xdb\x65\x1c\x2b\xb0\x3c\xcd\xf3\x64\
+\x00\x34\xcb\x3c\xac\x7c\xfb\x9e\x9e\x4e\x6a\x11\xb0\x3e\xf6\x44\
+\xcf\xab\xc8\x1f\xe9\xfd\x6d\xb0\x84\x78\x0f\xab\x1f\xfd\xff\xcc\
+\x06\xce\x2d\x06\x99\x9d\xb1\xec\xaa\x29\x9b\x00\x75\x1b\x05\x0b\
+\x80\x9f\x62\x25\x3c\xe6\xaa\x39\xad\xc6\xb3\xb0\x4c\xbd\xa1\x44\
+\x7d\x2a\x46\x40\xee\xc9\xff\x62\x08\x75\x6f\xd4\x95\x10\x90\x80\
+\xbf\x57\xee\xc9\x00\x63\x0a\xff\x01\x7e\x56\x8c\x89\xa2\xfc\xe4\
+\xf5\xec\xe2\xbf\x7b\xd0\x7d\xde\x97\x3a\x85\xb6\xe7\xd0\xff\xc5\
+\x58\xf9\xe6\xef\xe2\xb0\x2e\x78\xc3\xec\x53\x28\x54\xef\x25\xc8\
+\x3b\xbd\x7f\x16\xf6\xe0\xcd\x21\x7f\x06\x7e\x91\x7a\x1b\xe9\xcb\
+\xa4\xad\x3f\x0d\x33\xa2\x5d\x7d\x9f\xf5\x80\xef\x00\xe3\x13\x35\
+\x00\xc0\x9c\xd5\x8f\xa0\xc4\x6c\x43\x31\x09\x78\x13\x70\xf8\xa0\
+\x6b\x29\x13\x60\x68\x06\x6a\xb8\xfe\x01\x98\xaf\xa6\xf3\x14\xc6\
+\x03\xbf\xa1\x73\xa6\x5e\x4f\x26\x40\x37\x03\x78\xaf\x7f\xaf\xf2\
+\x5e\xdd\x93\xd0\x10\x13\xed\x7e\x35\xfb\xca\x93\x90\xbe\xc0\xdb\
+\xc6\x4e\xb2\x5b\xe6\xbd\xbe\x88\xf7\x68\x95\xfd\x1e\x07\x5e\x8c\
+\x22\xb8\x42\x31\x11\x78\x3d\x70\x1c\xab\x3f\x58\x88\xd5\x7f\xa5\
+\xbc\xee\xbf\x1f\x4b\x0c\xf7\x5b\xf4\x20\x61\x28\xc6\x02\xdf\x04\
+\x36\x0f\x70\xdd\x9b\x7a\x7f\x31\x96\xbc\xf0\x09\x9f\x97\xf8\xe9\
+\xc0\x8d\xa9\xb7\x93\x5c\x4a\xbe\x3f\x84\x55\x03\xd8\xc1\xd3\x49\
+\x2d\xc5\x32\x6f\xee\xe6\x58\xe4\x8f\xf4\xfe\x7a\x85\x78\xbb\x55\
+\x7d\xea\x53\x78\x12\x4b\x80\x74\x25\x16\xed\xb1\x8d\x4c\x80\xa7\
+\x6c\xd3\x0f\x5c\x0a\x7c\x01\xb8\x00\x95\x8b\x1a\x8e\x77\x00\xcf\
+\x88\x28\x98\x62\x1a\x01\x31\x9e\xfc\xd3\xe3\x7e\xdd\xbc\x5f\x66\
+\x9b\x58\xcb\x00\x86\xdb\x37\xc5\xa4\x7f\x75\x7d\x4f\x0f\xe1\xff\
+\xa1\x93\x01\x86\x8c\x04\xa8\x4b\xf8\x0f\x70\x31\xab\x97\xb6\x13\
+\xd5\x58\x82\x3d\xed\x3c\x0f\x33\x84\x77\x1a\x62\x2c\x95\xf8\x87\
+\x29\x58\xb8\xff\x99\x28\xc3\xff\x70\xbc\x1c\x38\x28\x61\xf1\x0f\
+\x96\x14\xfa\x66\x9f\x97\xf7\x4c\x2c\xfb\x7f\x16\x63\x73\x2e\x3c\
+\x0b\x5b\x52\xec\x8a\xb5\x8b\x96\xb2\xae\x53\x81\xdf\xcd\x36\xcb\
+\x80\x0f\xa3\xa5\x00\x23\xb1\x1b\x16\xc2\xfd\xf4\x0c\x84\x7b\xd5\
+\xed\xfa\x8b\xc9\xe1\x9f\xb1\x44\x51\xa2\x73\xbb\xf9\x3f\x7a\x4b\
+\x62\x52\xc7\x93\xfd\xb2\xfb\x79\x7b\xf2\xef\xe5\xa9\x7f\xec\x27\
+\xfe\x75\x45\x14\xf4\x39\x3d\x7e\xdd\xd1\x00\x5e\x22\x01\x9a\x6a\
+\xa3\x9f\xc7\x4c\x5d\x11\x87\x1d\x8a\xf9\xc4\x11\x81\x7f\xbb\x14\
+\x8d\x84\x7e\xec\x71\xeb\x9f\x51\xc9\xc9\x91\xd8\x02\x7b\xfa\x3f\
+\xa6\xa6\xdf\x25\xc6\xfb\x4f\x60\x4f\xff\x17\xfb\xbc\xc4\x47\x60\
+\xcf\xb5\x64\x00\x38\xe3\x22\xe0\x48\x6f\x27\x75\x1c\xf0\x9a\x06\
+\x45\x7e\x88\xf7\xff\x0d\x7c\x19\x85\xad\x76\xc3\xf6\xc0\x4b\xb1\
+\xa5\x01\xa3\x9d\x98\x00\x75\x19\x05\x4b\x31\x17\xee\xaf\xc0\x0c\
+\x35\x85\x11\x19\x83\xe5\x44\xd8\x81\xfa\x9e\xec\xd7\x15\x72\x5d\
+\x46\xd4\xf7\x47\x38\x66\xac\x89\x6d\x48\xf1\xdd\xb6\x7e\xb5\xaf\
+\xe6\xfd\xeb\xea\xff\xca\x8e\xb5\x7d\x35\xdc\x73\x21\xf7\x5d\x0c\
+\xbc\x04\x3d\x81\xad\x83\xc9\xc0\x2b\x81\xa3\xe8\x9c\x23\x20\xc7\
+\x08\x81\x15\xd8\x83\x84\x53\x81\x7b\xd5\x14\xba\xea\x9b\x3e\x8d\
+\x25\x44\x4b\x79\xed\xff\xef\xb1\xdc\x18\x0e\x39\x0f\x38\x46\xe3\
+\xb0\x4f\x9e\x0d\x9c\xef\xed\xa4\x06\xd6\xe3\x4c\x6a\x48\xc0\x87\
+\xfa\x8c\x13\xfd\xde\x94\x2e\xd9\x18\x38\xb6\xe8\x2d\x26\x45\xfc\
+\xed\x3c\x98\x00\x0f\x03\xa7\x17\xed\xe3\x71\xfd\xf4\x5d\xf3\x1f\
+\x58\x1e\x89\x3a\xc4\x4d\x4a\x46\x40\x55\xb1\x1f\x5a\xe8\x57\xad\
+\x95\x5e\x95\xd4\x0c\x82\xbe\x86\x8f\xd5\x57\xf3\x76\x7d\x35\xbf\
+\xd7\x94\xf0\x1f\xe0\x5c\xe0\x4b\xea\xbe\x6b\x65\x7d\xe0\xf9\x58\
+\x59\xb7\x4d\x33\x17\xff\x8f\x16\x6d\xec\x1c\x60\x8e\x7e\xfa\xae\
+\x39\xae\x98\x53\x78\x88\x9a\x2b\xfb\xfe\x1c\x2c\xe2\xd8\x69\x35\
+\x87\x23\xc9\x68\xe5\x53\x5f\x86\xf7\xc0\xc5\x74\x1f\x35\x55\x1b\
+\x47\x01\x6f\x89\x2c\xd0\x63\x9b\x08\x4b\x81\x8f\x01\xb3\xd4\xcf\
+\xf6\xc4\x68\xe0\x00\xac\x2c\xe4\xd3\x31\x43\x28\x07\x13\x60\x19\
+\x70\x05\xe6\xb8\x5d\x87\xa2\x43\x7a\x65\x7b\xec\xe9\xff\xd8\x9a\
+\x45\x4f\x4e\x46\x40\xdd\x13\xd6\xa6\x04\x57\x9d\x26\x42\x53\x93\
+\x02\x25\x03\xf4\x2f\xfc\x07\xf6\xfb\x18\x2a\x11\xdc\x14\xa3\x8a\
+\xf9\xc4\xb3\x81\x43\x87\x19\x3f\x52\x14\xff\x4b\xb1\x4c\xde\xe7\
+\x15\xf3\x09\x25\x97\xec\x8d\x2d\x81\xaf\x07\x6a\x0f\x4d\xbe\xff\
+\x73\xbf\x0a\xfb\x02\xe0\x39\x39\xb5\x99\x1c\x0d\x80\xe7\x14\x7d\
+\x88\xbb\x4e\xfb\xab\xc5\x4d\x1a\x4b\xa0\xd7\x61\x12\xdc\x01\x7c\
+\x56\x9d\x73\x69\xd6\x01\x0e\xc1\x32\x56\xee\x5d\x74\xd6\x75\xaf\
+\xe3\xaf\xf2\x79\x4b\xb1\xb5\x78\x97\x17\xaf\x45\xfa\x49\x4b\x31\
+\x16\xf8\x31\xd5\xca\x84\xa6\x6a\x04\xa4\x60\x06\x94\x11\x48\x21\
+\x84\x7d\xee\x26\x5a\x5f\x03\xc7\xa8\xb3\x7f\xad\x43\xf4\x37\x29\
+\xfc\xc1\x4a\xd6\xbd\x02\x0b\xcf\x16\xcd\xb2\x76\x31\x97\x38\x0c\
+\x2b\x85\xb5\x56\x22\xe2\x7f\x60\xbb\x65\xd8\xf2\xd2\x4b\xb1\x64\
+\xca\x9a\x4f\x94\x63\x34\x96\x68\x79\x27\x07\xe2\xbe\xca\x31\x1e\
+\x02\x3e\xee\xb7\x6f\x79\x16\xf6\x80\x59\xe3\xb1\x73\x2e\x2d\xfa\
+\x45\x57\x1c\x0c\xbc\xa7\x61\x01\x1f\x62\x82\xf3\x27\xe0\xef\xea\
+\x73\x2b\x33\x1e\xd8\x0f\x73\xf3\x9f\x8e\x2d\x19\xf0\x32\x91\x1d\
+\xbc\xdd\x43\x58\xe6\xdd\xab\x31\x87\x5e\x99\xfc\xab\xf3\x9e\x62\
+\x12\x1d\xab\x93\x6e\xc2\x04\xa8\xd3\x08\xa8\xdb\x0c\x08\x21\x9c\
+\x42\xe2\xcd\x28\xe8\x73\x74\xcc\x5c\x92\x01\xc6\xf8\xdd\x43\xb4\
+\xe1\x93\x81\x1f\xa9\x0b\x77\x39\x9f\x78\x3a\x96\xfd\x7d\x5f\xac\
+\xa4\xac\xc7\xc4\x80\x8f\x14\xf3\x88\xeb\xb1\x87\x09\x8b\xf5\xd3\
+\x55\xe6\x65\xc0\xab\xf0\x1d\xda\xdf\xcd\xfb\x3f\xc0\x2a\x61\x38\
+\xe4\x22\x2c\x90\x3b\x2b\x72\x35\x00\x8e\xc1\x96\x0f\xb9\xbb\xd8\
+\x9f\x06\x76\x76\x3a\x19\xe9\xf6\xfd\x65\xc0\xa7\x80\xfb\xd4\xef\
+\x06\x65\x53\x60\x2f\x2c\x81\xcb\x4e\x58\x59\xc1\x31\x91\xc5\xfd\
+\x9a\x2c\x2f\x7e\xd7\xbb\x80\xa9\x58\x19\x96\xd9\xfa\x69\x82\xf2\
+\x0c\xe0\x6b\x11\x84\x4a\xae\x46\x40\x5d\x66\x40\x19\x81\x94\xe2\
+\x52\x80\x9c\x26\x21\x4d\x45\x03\xd4\x61\xc6\x7b\x13\xfe\x03\xbc\
+\x13\x65\x62\x4f\x81\xcd\x80\x7d\x80\x3d\x8a\x39\xe7\x50\xf3\x89\
+\xd0\x7d\x63\xff\x10\xf3\x89\xfb\x81\x3b\x8b\xf9\xc4\x54\xcd\x27\
+\x82\xb3\x3d\x96\x8f\x63\x0c\xfe\x13\xff\x75\xda\xe6\x2e\x2c\x8a\
+\xc1\xe9\xb8\xf8\x2c\x32\x7b\xfa\x9f\xb3\x01\x00\x4e\xa3\x00\x76\
+\x02\x3e\x43\xf9\x52\x3f\x5e\xa2\x00\x66\x01\x9f\x40\x59\x80\x63\
+\x32\x06\xd8\x16\xd8\x0e\x5b\x3a\xb2\x45\xf1\xda\x04\xd8\xa0\xe2\
+\x6f\xf8\x38\x30\x17\x98\x89\x65\xeb\x9f\x81\x65\xd9\xbd\x17\x33\
+\x78\x44\x1c\x36\x00\x7e\x01\x6c\x44\x1a\x4f\xf6\xeb\x36\x02\x46\
+\x9a\x44\x34\x11\xa6\xda\x94\xb0\xcf\xc5\x20\xe8\x6b\xf0\x38\x9e\
+\x96\x57\xf5\x35\xd0\x06\x42\x47\xad\xcc\x00\x5e\xa7\x6e\x3c\x49\
+\xd6\x2a\xe6\x12\xdb\x62\x95\x05\x26\x17\xf3\x8a\x49\xc0\x7a\x15\
+\xdb\xd1\x63\xd8\x93\xfd\x59\xc5\x9c\x62\x66\x31\x97\xb8\x1f\xb7\
+\xc9\xdc\xb2\x60\x6d\x6c\x69\xf1\xe6\xa4\xfd\xf4\xbf\xbf\x30\x31\
+\xee\xf0\x79\x99\x2f\xf7\xa8\x25\x43\x69\x8c\x5c\xf9\x12\x70\x96\
+\xb7\x93\xba\x0b\x0b\x7d\x3a\xa0\xc2\xc0\xdc\x17\xf1\xfd\x6e\xcf\
+\x61\x0b\xe0\x1d\xc0\xf7\xd4\x07\x47\x63\x39\x30\xbd\x78\x0d\x75\
+\xe3\x4e\x2c\x04\xe5\x7a\xc5\xe0\x3e\x0e\xcb\x31\x30\x98\x25\x98\
+\x49\xb3\x18\x58\x00\xcc\x2f\x06\x6b\x89\xfc\x66\x84\xd0\x47\x0b\
+\xf1\x3f\x78\x30\x2c\x93\xf4\xab\x2f\x70\xbf\x11\xfa\xf3\x86\x1a\
+\xf0\x7b\x15\x63\xfd\x23\x88\xa8\xfe\x2e\x84\x56\x95\x6d\x86\x3a\
+\xe7\xfe\x1e\xce\xbf\xaa\x10\xab\xfb\x29\x71\xdd\x82\x3e\xc6\x67\
+\xa4\x96\x0c\x30\xd6\xef\x18\x2b\x32\xc5\x5d\x58\xa5\xe8\x9a\xa5\
+\x85\xc0\x1a\x4a\x64\x8d\x2d\xe6\x12\x13\x81\x75\xb1\xe5\x04\x13\
+\x8a\x39\xc5\x60\x16\x14\xc7\x59\x8a\xd5\x6a\x7f\xac\x98\x53\x48\
+\xe4\x37\x33\x9f\x78\x57\x97\xe2\x3f\x44\x9f\x11\x2a\xca\x6e\x28\
+\xae\xf6\x2b\xfe\x01\xfe\x27\xd7\x36\x94\xb3\x01\x70\x36\x70\x19\
+\x0e\x9d\x9b\x3f\x61\x09\x5b\xc6\x44\x12\xe8\xb1\x4d\x84\x01\x0e\
+\xc1\x42\x01\xcf\x42\x34\x61\x0e\xcc\x41\x25\x72\x52\xe2\x75\x58\
+\x1e\x90\x10\xf7\x7c\xd9\x7d\xca\x8a\xab\xaa\x46\x40\x99\x63\x8c\
+\x24\xd2\x63\x98\x01\xbd\x1a\x02\x55\x4c\x81\xd0\xc2\x3d\xb5\x70\
+\xbe\xba\xa3\x4b\xbc\x24\x03\x4c\x51\xf8\x0f\xbc\x7f\xae\xba\xf1\
+\x2c\x59\x86\x3d\xc1\x7f\x44\x97\x22\x19\x8e\xc3\x96\x13\xd6\x21\
+\xee\x43\xe9\x8e\xe1\xd2\xed\x84\x12\x00\x00\x4e\xdc\x49\x44\x41\
+\x54\xe6\xb2\x27\xf9\xbd\xcc\x97\x63\xeb\xff\xb3\x64\x54\xe6\xf7\
+\xc8\x97\x3d\x9e\xd4\x6c\x3a\x97\x29\xe8\x77\x70\x33\x77\xfb\x19\
+\x6f\x04\x76\x51\x5f\x2c\x44\x47\xf6\x07\xde\x34\xc2\xfd\x54\x66\
+\xfd\x79\xd9\x10\xf5\x2a\xa1\xc1\x21\xc2\x92\x7b\x3d\x46\xdf\xa0\
+\x57\x99\xf7\xbb\xdd\x66\xcd\xed\xfa\x7a\x3c\xb7\x6e\xf7\x19\x69\
+\xff\x2a\xc7\xf3\x22\xee\x43\x7e\xa7\xbe\x00\xbf\x0b\x15\xdb\x46\
+\x88\x36\xe8\xe9\x9e\xea\x75\xdf\x6b\xb1\xd0\x6e\x21\x44\xb3\xec\
+\x04\xbc\xd6\xa1\x1e\x28\xf3\xfe\xd9\xb8\xce\x0b\xf1\x99\x9c\xdb\
+\x51\xee\x06\xc0\x59\x58\xa9\x72\x77\xfc\x03\x0b\xa7\x8a\x45\x5d\
+\x9d\xc2\x68\xe0\xbd\x58\xd8\x98\x10\xe2\xa9\x6c\x59\x8c\x22\xa3\
+\x02\xdc\xb7\x21\xef\x65\x2f\x46\x40\xd3\x66\x40\x68\x43\x80\x08\
+\x42\xbe\xaf\xe2\xcb\xfb\xe7\x85\xb8\x6e\x31\x7e\xd3\xd8\xa2\x3f\
+\x05\xe1\x3f\xc0\x29\xea\xca\x85\x68\x9c\xf5\x81\x0f\xd2\x5d\xd2\
+\x3f\x2f\x5a\x61\x38\x9e\x00\xfe\xe9\xf7\x52\x5f\x04\x5c\x20\x03\
+\x20\x6d\x3e\xe6\xf1\xa4\x16\x14\x26\x80\xc7\x9b\xb2\xd7\xcf\xd8\
+\x04\xf8\x08\x79\xaf\x27\x11\xa2\x0c\xe3\x80\xcf\x32\x72\x92\xa5\
+\xaa\x93\xfa\xaa\x42\xa0\x09\x01\x12\xe2\x38\xbd\x08\xb4\x58\x86\
+\x40\x5f\xc9\xf3\xad\xf3\x29\x7f\x5d\x02\xbe\xae\x6b\xd0\x47\x7c\
+\xc1\x1f\x5a\xf4\x7b\xb8\x5f\xca\xde\xf3\x33\x81\x6b\xd4\x9d\x0b\
+\xd1\x28\xa3\x81\x0f\x60\x89\x1b\x63\x8f\xed\x75\x18\x08\xa7\x00\
+\x8b\xfc\x5e\xee\x4f\xe5\xde\x9e\xda\x60\x00\x5c\x86\xd3\x65\xea\
+\xe7\x61\x35\xd6\x9b\xb8\xf1\x42\x75\x0e\x03\xc7\xd8\x0d\x78\xab\
+\xfa\x67\x21\x56\x13\x0a\x1f\xc5\xc2\xf5\xca\x8a\xfa\xba\x84\x41\
+\x08\x41\x11\x52\xd8\xc4\x30\x03\x7a\x11\x6f\x21\x96\x01\xc4\x58\
+\x0a\xd0\xe7\xbc\xbd\xd7\x11\xfa\xef\x31\xfc\x3f\x56\x9b\xf6\x72\
+\x9f\x9e\x0a\xac\x54\x97\x2e\x44\xa3\xbc\x13\x2b\xeb\x18\x7a\xfe\
+\xde\x84\x86\x98\x05\x5c\xe8\xf7\x52\xff\x13\xa7\xd1\xe3\x32\x00\
+\x7a\xe7\x63\x1e\xc7\xaf\xe5\xc0\x5f\x23\x0b\x74\x6a\xbc\xc1\x9f\
+\x0d\xbc\x48\x7d\xb4\x10\x00\xbc\x05\x2b\x1e\x5b\xe5\x9e\xae\x22\
+\xe8\x9b\x14\x18\xa9\x99\x01\xb1\x9e\xfa\xc7\x10\xf1\x7d\x4e\x5f\
+\x31\xbe\x53\xd9\x7d\x43\x98\x03\xde\x44\x7f\x53\x06\xdd\x62\x94\
+\xe8\x57\x88\xa6\x79\x09\x70\x44\x43\x73\xfb\x18\xfa\xe2\x4f\xc0\
+\x0a\x9f\x97\x7a\x25\x99\xaf\xfd\x6f\x9b\x01\x70\x33\x4e\x13\x4d\
+\x5e\x4b\xb5\xf2\x17\xde\x12\x80\xbc\x8e\xf2\x25\x0e\x85\xc8\x85\
+\xe3\x58\x95\xa4\x27\xc4\x3d\xd9\x96\x64\x7f\x31\x8e\xe5\x31\xf9\
+\x5f\x6e\x49\xff\xea\xfa\xbe\x1e\xa2\x01\x52\x68\xf3\x21\xfb\x80\
+\x73\xb0\xb5\xba\x42\x88\x66\x78\x06\xf0\x6a\xc7\xf3\xfe\x5e\x99\
+\x06\xdc\xe8\xf7\x72\xff\x11\x98\x22\x03\x20\x2f\x3e\x8d\xd3\xf2\
+\xe7\xbf\x65\xf8\xf0\x84\x54\x92\x7c\x0c\x2e\xf1\xf5\xdf\xc0\xf6\
+\xea\xb3\x45\x4b\x39\x18\x78\x7f\x84\x89\x79\x9b\xb2\xfe\x8f\x74\
+\xac\x10\x66\x80\xe7\xe4\x7f\x9e\xd6\xec\x37\x71\x7e\xde\x92\x01\
+\xc6\x6c\x93\x5e\x85\xff\x00\x7f\x57\x97\x2e\x44\x63\xec\x00\xfc\
+\xd7\xa0\xfe\x29\x35\x4d\xb0\x26\x2b\x81\x3f\xf8\xbd\xdc\xcb\x80\
+\xcf\xb5\xa5\x6d\xb5\xc9\x00\xb8\x13\xf8\xb5\xc7\x13\xbb\x8f\xce\
+\x85\x26\x53\x73\xfb\xc6\x03\x9f\x04\x26\xab\xef\x16\x2d\x63\x17\
+\xe0\x7f\xb0\x64\x3d\x21\xee\xbb\x1c\x8d\x00\x2f\x66\x40\x55\xb1\
+\x18\xe2\x89\x7f\x53\x82\xbc\xc9\x70\xff\x90\xd7\x25\x56\xf8\x7f\
+\x8a\x6d\x39\xc6\x3d\x3e\x05\xb8\x5b\xdd\xba\x10\x8d\xb0\x05\xf0\
+\x71\x2c\x99\x70\x0a\xe2\xbe\x9b\xf7\xcf\x03\xee\xf7\x7b\xc9\x7f\
+\x0e\x4c\x97\x01\x90\x27\x9f\xc3\x69\xd2\xc9\x93\xa8\x16\x66\xe7\
+\xed\xa6\x5f\xbf\x30\x01\x26\x21\x44\x3b\x98\x0c\x7c\x19\x33\xc0\
+\xea\x12\xf4\x1e\x44\x42\x93\xc7\x09\x2d\xa0\xea\x5c\x06\xd0\xad\
+\x70\x4f\x95\x3a\x12\x02\x86\xfe\x3d\xeb\x14\xfd\x5e\xee\xa7\x4e\
+\xfb\xfe\x49\xdd\xba\x10\x8d\xb0\x09\x16\xb6\x3c\x31\x21\x71\x3f\
+\x12\x0b\xb0\x84\xa2\x4e\x79\x12\xf8\x4a\x9b\xda\x58\xdb\x0c\x80\
+\x99\xc0\x8f\x3d\x9e\xd8\x02\x3a\xd7\xd9\xf5\x54\xf6\xaf\xdb\x63\
+\x6c\x3c\x44\x07\x26\x44\x8e\x6c\x0a\x7c\x1d\xd8\xb0\xc2\x84\x3c\
+\xa5\xa7\xfa\xa1\x9f\x58\xc6\x32\x03\x42\x1b\x02\x55\x2a\x02\xf4\
+\x05\x3c\x87\xa6\x42\xf0\x63\x47\x09\x54\x39\x5e\x68\xf3\xa4\xbf\
+\x86\xf6\xd9\xe4\x71\x46\xda\xf7\x0e\x54\xfa\x4f\x88\x26\x18\xea\
+\x01\x5a\x1d\xe2\x3e\xb6\x8e\xf8\x73\xa1\x75\x9c\xf2\x7d\x60\x86\
+\x0c\x80\xbc\xf9\x2a\xf0\xb8\xc7\x13\x3b\x1f\xb8\x27\xe2\xcd\xdd\
+\x44\x07\xb2\x05\xf0\x09\x60\x82\xfa\x74\x91\x29\x9b\x00\xdf\x01\
+\x36\x0f\x70\xbf\x34\x15\xde\x1f\x42\x88\xe0\xe4\x38\xb1\x4d\x86\
+\x58\xc9\xff\x62\xe2\x29\xa7\x40\x53\xc9\x00\x9b\x68\x2b\x5e\xef\
+\x93\x6e\xf6\xff\x55\x4d\x82\x41\x08\xb1\x8a\x75\xb0\x65\x84\x5b\
+\x36\x20\xee\x63\x6a\x88\x7b\x80\x4b\xfc\x5e\xf6\xc7\x80\x6f\xb6\
+\xad\xad\xb5\xd1\x00\x98\x03\x7c\xdb\xe3\x89\xf5\x03\xbf\xeb\x70\
+\x93\x79\xb9\xc1\x7b\x3d\xc6\xf6\xd8\x3a\x26\x99\x00\x22\x37\x26\
+\x01\xdf\x1a\x46\xfc\x57\x99\xb0\xa7\x56\xfe\x2f\x86\xc0\x89\x6d\
+\x06\x84\x3c\x7e\x9d\x4f\xdd\xbd\x52\x67\x34\x82\xf7\xf6\x10\xa3\
+\x2d\xd7\x79\x8f\xde\x09\x5c\xad\xee\x5d\x88\xda\xc5\xff\x27\x80\
+\x6d\x1d\xcc\xdb\x43\xea\x8b\x7e\x2c\xd9\xb9\x63\x43\xf1\x1b\xc0\
+\x5c\x19\x00\xed\xe0\x3b\xc0\x43\x1e\x4f\xec\x4e\xe0\x0a\xa7\x37\
+\x71\x95\x63\xec\x86\xb9\x9a\xeb\xa8\x8f\x17\x99\xb0\x61\x21\xfe\
+\x27\x47\xbc\xaf\x94\xf5\x3f\x9e\x38\x8b\x2d\x00\x63\x89\xf8\x3e\
+\xa7\x2f\x8f\xd7\xaa\x6e\xc1\x1f\xa3\xcd\x36\x71\x4f\xfe\x1a\x3d\
+\xfd\x17\xa2\x4e\xd6\x2d\xe6\xc8\x3b\x27\x32\xa7\xef\xe5\xfd\x4b\
+\x81\xbb\xfc\x5e\xfa\x19\xc0\x0f\xda\xd8\xe6\xda\x6a\x00\x2c\xc0\
+\x96\xa7\xbb\xe4\x4f\x54\xcb\x54\xe8\xd5\x24\xd8\x09\xf8\x0c\xb0\
+\x9e\xfa\x7a\x91\x38\x1b\x61\x96\xf1\x56\x35\x4c\xe6\x95\xf5\xbf\
+\x1e\x33\xa0\x2e\x81\xd8\x8d\x88\xcf\x8d\xa6\xbe\x6f\x7f\x03\xed\
+\xc6\xd3\xf1\xca\x1c\xe3\x4e\xe0\x4a\x75\xf1\x42\xd4\xc6\xfa\xc5\
+\xdc\x78\x87\x04\xc5\xfd\x48\x3c\x89\x25\x39\x77\xcc\xa7\x80\x85\
+\x6d\x6c\x77\xa3\x5b\x7c\xcf\x4d\x01\x5e\x0a\x6c\xe6\xed\xc4\x96\
+\x14\x37\xdc\x5e\x23\x4c\xa8\xa8\xf0\x7e\x53\xc7\xd8\x00\xd8\x1f\
+\x4b\x2e\xb4\x58\xfd\xbe\x48\x90\xcd\xb1\x27\xff\x5b\xf7\x78\xaf\
+\x94\xb9\xbf\x3c\xec\x17\x6a\xff\x50\xc7\xa8\xe3\x98\x4d\x7f\x9e\
+\xa7\x35\xfb\xa9\x9c\x5f\xdd\x4f\xac\xfb\x9d\x1e\xb3\xea\x31\xbe\
+\x8b\xeb\x32\x5d\x42\x64\xc5\x44\xec\x69\xe4\xb6\x91\x84\x79\xd3\
+\x0f\x04\xff\x02\x4c\xf5\xad\x03\xdf\x43\x4b\x03\x9e\x46\xb5\xf8\
+\xbe\x5b\x01\x7c\xd8\xeb\xc9\x9d\x8d\x95\x2c\x48\x79\x22\x31\xdc\
+\x31\x26\x17\x1d\xde\x46\xea\xfb\x45\x62\xec\x80\xc5\x8a\x6d\x39\
+\x44\x3b\xcf\x7d\x9d\x7f\x0a\x59\xff\xeb\x12\x7e\xfd\x0d\x7c\x6e\
+\x48\x41\xde\x64\xb8\x7f\xca\xbf\x41\x0a\x55\x01\xaa\xec\x7f\x07\
+\x9d\x97\x20\x0a\x21\xc2\x31\x09\xf8\x3c\xb0\x4d\x62\x73\xf8\x6e\
+\x79\x10\x38\xcf\xf7\x4f\xf0\x41\x60\x65\x5b\xdb\xdf\xa8\x96\xdf\
+\x7f\xe7\x00\x67\x79\x3c\xb1\xe5\x74\xce\xc2\x9b\x52\xe7\x30\x9c\
+\x09\xf0\x15\x60\x3b\x8d\x01\x22\x11\x76\xc3\xd2\xc4\x6e\x18\xf8\
+\x9e\x4a\x2d\xbc\xdf\x73\xd6\xff\xa6\x44\xb9\x47\x53\x20\x17\x9a\
+\xbe\xb6\xfd\x91\xdb\x6a\xd3\xc7\x19\xbc\xff\xcf\xd5\x76\x85\xa8\
+\x85\xad\x81\x2f\x62\x95\xb2\x42\xcd\xab\x3d\x69\x80\x81\xa4\xe6\
+\x2b\xfc\xfe\x04\xff\x04\x2e\x68\x73\x1b\x1c\xad\xdb\x90\x1b\x80\
+\x77\xe0\xd0\x0c\x79\x14\x2b\x31\xb6\x6d\x87\x6d\x52\x5d\x0a\x00\
+\x56\x15\xe0\x50\x2c\x39\xc8\x23\x6a\x87\xc2\x31\x87\x14\x83\x75\
+\x2f\x49\x2c\x53\x58\x16\x50\x75\xdf\x10\xfb\xc7\x3a\x56\x9d\xc7\
+\x4e\xf9\x5c\xbc\x88\xfc\x36\x9c\x4b\xbf\xa3\x63\xad\xb9\xff\x65\
+\xc0\x1f\xd4\x14\x85\x88\xce\x3e\xd8\xc2\xf3\xf5\x23\xde\xfb\x4d\
+\x2f\x1f\xb8\x08\x7b\xc2\xea\x94\xe5\xc0\x2b\xda\x2e\x3d\x64\x00\
+\x98\xce\xde\x0a\x5b\x9a\xee\x8e\xdb\x81\x23\x81\x71\x09\x0a\xfc\
+\x6e\xb6\x59\x0b\x38\xac\xb8\x0b\xb5\xee\x50\x78\xe4\x25\xc0\x47\
+\x80\x31\x25\x84\x5b\x2a\x26\x80\x37\x23\xa0\x0e\x91\xec\xbd\xa4\
+\x9e\x04\x7e\x1e\xe7\xd6\xef\xec\x78\xfd\xc3\xcc\x86\x3f\x03\x3c\
+\xae\xee\x5e\x88\xa8\x1c\x01\xbc\xbf\x98\xfb\xc6\xea\x2f\x9a\x3e\
+\xc6\x13\xc0\xf7\x81\xa5\x7e\x7f\x86\xff\xc3\x2a\x13\xb6\x1a\x19\
+\x00\xc6\x35\x58\x14\xc0\x38\x6f\x27\xb6\xb4\xb8\x99\xf6\x4f\x54\
+\xe0\x77\xb3\xcd\x28\xe0\xc0\x62\x12\x72\x9b\xda\xa2\x70\xc2\x98\
+\x62\xa0\x7e\xcd\x1a\xed\xb6\x2e\x51\xaf\x64\x7f\xf5\x8a\xe1\x1c\
+\x44\x77\xec\xef\x90\x43\x78\x78\x7f\x82\x9f\x13\x7b\x42\xff\x57\
+\xe0\x42\x75\xf9\x42\x44\xed\x9b\x5f\x01\xfc\x07\xc3\x87\x1b\xe7\
+\x10\xfa\x0f\x70\x22\x30\xdd\xef\x4f\xf1\x18\xf0\x72\xaa\x15\x5b\
+\x93\x01\x90\x11\x0b\x8b\x6b\xf1\x6c\x8f\x27\x77\x3f\xb0\x2b\xb6\
+\x1c\x20\x75\x13\xa0\xaf\xc3\xdf\xf7\xc6\x72\x03\xdc\x84\xeb\x75\
+\x43\xa2\x05\xac\x87\x85\xfc\x3f\x33\xa0\xd8\x52\xd6\xff\xb4\x44\
+\xba\xc2\xf4\xf3\xa0\x3f\xe1\xcf\xaa\x63\xb2\xff\x18\x96\x88\x6c\
+\x99\x9a\x8a\x10\x51\x18\x0f\xfc\x37\xf0\xdc\x8a\xe3\x4a\x0a\xa1\
+\xff\xb7\x62\xa5\xcc\x1d\xf3\x69\xdc\xe7\x26\xd4\x1c\xa7\x6e\x26\
+\x60\x0f\xa0\xb7\xf1\x78\x72\x9b\x63\x49\xf3\xc6\x26\x2a\xf0\x7b\
+\xd9\xe6\x3e\xe0\xdb\xc0\xc3\x6a\x93\xa2\x01\xb6\x07\x3e\xcb\x53\
+\x33\xfd\x87\xea\x40\xeb\x8c\x06\xc8\xd5\x08\x68\x62\xf0\xd2\x60\
+\x29\xc1\x5f\xd7\xe7\xd5\xf9\x94\xef\xdb\xc0\x19\x6a\x36\x42\x44\
+\x9b\xbb\x7f\x98\xd5\xcb\x06\xa7\x2a\xee\x47\xda\x66\x39\xf0\x49\
+\x60\x96\xdf\x9f\xe3\x1e\x60\x77\xac\xda\x7a\xeb\x51\x04\xc0\xea\
+\x6d\x77\x0e\xf0\x52\x8f\x27\xb7\xa0\xf8\xb1\x76\xcf\x40\xe0\x8f\
+\xb4\xcd\x06\xc0\xe1\x85\x11\x20\x13\x40\xd4\xc9\x73\x80\xcf\xd1\
+\x39\xd3\x7f\x08\x71\xd8\xe6\x64\x7f\xb1\x84\x74\x53\x02\x5d\xc6\
+\x40\x3b\x84\x7e\xec\xcf\xed\x6f\xe0\x38\x77\x01\xdf\x43\x99\xff\
+\x85\x88\xc1\x7e\x85\x20\xde\xb8\x06\xe1\x8e\x83\x63\x9c\x02\x5c\
+\xe7\xfb\x27\x79\x17\x30\x45\x2d\x53\x73\x97\xe1\xae\xc7\x15\xc0\
+\xc1\x1e\x4f\x6e\x0c\xf0\x65\x3a\x3f\x99\x4c\x7d\x29\xc0\x9a\x1d\
+\xcd\x5f\x80\xbf\x6b\x82\x22\x22\x33\x0e\x78\x0f\x16\xa2\x57\xa7\
+\xa8\x57\xd6\xff\x3c\x07\x36\x0d\xac\x79\x88\xfd\x54\x44\x7f\x99\
+\x63\xf5\x03\xef\x05\xa6\xaa\x79\x09\x11\xbc\xff\x7f\x19\xf0\xca\
+\x40\xf7\x6e\x0a\xd1\x01\xb3\x30\xb3\x63\xb9\xdf\x9f\xe5\x32\x2c\
+\x07\xa3\xe4\x44\x81\x22\x00\x9e\xca\x8d\xc0\x7f\xe2\xb0\x2c\xe0\
+\x4a\xe0\x41\xec\xe9\x78\x5f\x06\x02\xbf\x9b\x63\xec\x8d\x45\x3d\
+\xfc\x1b\x78\x52\x6d\x53\x44\x60\x32\xb6\xbc\xe6\xc0\x06\x45\xbd\
+\x8c\x80\xf6\x08\x72\x99\x03\x3e\x45\x7e\x9d\xe7\xe2\x21\x41\xe0\
+\xc9\xc0\xbf\xd4\xec\x84\x08\xca\x44\xe0\x03\xc0\xd1\x35\xf6\x05\
+\x4d\x1f\xa3\x1f\xf8\x11\xae\x23\x76\x57\x60\x05\x9d\x1e\x52\x0b\
+\x95\x01\xd0\x89\x59\x85\x26\x70\x59\x16\xf0\x51\x60\x53\x3a\x27\
+\x2a\xc8\x65\x29\xc0\x00\x9b\x61\xa5\x10\x67\x16\x2f\x21\x42\x31\
+\x10\xf2\xbf\xa9\x03\x41\xaf\x64\x7f\xed\x33\x03\xda\x64\x10\xf4\
+\xb7\xfc\xfc\x3c\x55\x05\x98\x05\x7c\x01\xd7\x4f\xeb\x84\x48\x8e\
+\x03\x81\x4f\x01\xdb\x12\x2e\xac\x3f\x05\x83\xe0\x62\xe0\x1c\xdf\
+\x3f\xcd\x8f\x81\x5f\xa9\x85\xb6\x63\xae\x51\x95\x8d\x80\x3b\x80\
+\x49\x1e\x4f\x6e\x6d\xe0\x6b\x0c\xbf\x4e\xb9\x2e\x71\xde\xc4\xe7\
+\x5c\x0c\xfc\x02\x65\xf0\x10\xd5\x98\x08\xbc\x0f\x38\xcc\xa1\xa8\
+\x97\x11\x50\xef\x00\xa5\xf2\x7f\xf9\x89\x79\x2f\xdf\xc1\x63\x55\
+\x80\x95\xc0\x87\xd0\x42\x58\x21\x42\xb1\x16\xf0\x5a\xe0\xb8\x1e\
+\xee\xd5\xba\x0c\x82\xd8\x9f\x33\x0f\xf8\x04\x56\x4a\xcd\x29\x73\
+\x81\x5d\xb0\x1c\x6f\x62\x10\x8a\x00\x18\x9a\x27\x8b\xf6\x7c\x9c\
+\xc7\x93\x5b\x86\xc5\xb1\x1c\x92\xa1\xc0\x1f\x69\x9b\xed\x80\x67\
+\x00\x77\x17\x77\xb5\x10\xbd\xb2\x11\xf0\x43\x60\x37\xf2\x5c\xe7\
+\xaf\xac\xff\x32\x05\x44\xfd\x62\x3f\xe6\x67\x85\x7c\x82\xf7\xcf\
+\xe2\x25\x84\xa8\xce\x2e\x85\x00\xde\x3f\xd2\xfd\x5a\x57\xbf\x50\
+\x76\x9b\x9f\x60\xa5\xca\x1d\xf3\x3e\x6c\xfd\xbf\xd0\x3c\xa7\x6b\
+\x46\x03\xd7\x03\xfb\x7a\x3d\xc1\xf7\xd0\x39\x5b\x61\x8a\x02\xbf\
+\xdb\x6d\xfa\x81\xf3\x81\xdf\x02\x8b\xd5\x56\x45\x97\xec\x88\xad\
+\x55\xeb\xab\xd8\x11\xaa\xfc\x5f\x7b\xcc\x00\x0d\x94\x12\xfc\xa9\
+\x8a\xfe\x35\x8f\xf3\x10\x96\xe0\x48\xf9\x74\x84\xa8\xc6\x38\xe0\
+\x15\xc0\x8b\x58\x3d\x61\x58\x2e\x4f\xf6\xbb\x79\xff\xf2\xc2\x00\
+\x70\xcc\x0d\xd8\x33\xc3\x15\x6a\xb1\x43\x8b\x5c\x31\x7c\xbb\xff\
+\x37\xf0\x66\xaf\xf3\xbf\xdb\xb0\x84\x80\xe3\x32\x14\xf8\x23\x6d\
+\xd3\x07\xec\x80\x85\x70\x3f\x88\xca\x05\x8a\x91\x19\x03\xfc\x2f\
+\x30\x21\x90\xc8\x53\xb2\x3f\x1f\x22\x5a\xe5\xff\x34\x50\xe7\xf4\
+\xb9\xb1\xca\x01\xf6\x03\x5f\xc4\xfd\xd3\x3a\x21\xdc\xb3\x07\xf6\
+\xd4\xff\x00\x9e\xfa\x60\xaa\x0e\x51\x8e\x83\xcf\x79\x02\xf8\x0e\
+\xb0\xd4\xf7\xd0\xf0\x72\xe0\x01\xb5\x58\x19\x00\x65\x78\x00\x8b\
+\xf0\xd9\xdb\xe3\xc9\x2d\xc5\xc2\xe0\x9f\x91\xa1\xc0\xef\x76\x9b\
+\x75\x30\x13\x64\x13\xe0\x76\xdf\x9d\x91\x70\x30\x68\x1f\xef\x44\
+\xd4\x2b\xeb\x7f\xbe\xc2\x5c\xc6\x40\x5e\x42\xbf\x8e\xcf\xaf\x23\
+\x41\xe0\xa9\xc0\x3f\xd4\x8c\x84\x28\xcd\x7a\xc0\xdb\x80\x37\x15\
+\xff\x8e\x21\xb8\x53\x31\x08\x7e\x0a\xdc\xe3\xfb\xe7\xfa\x0d\xf6\
+\xcc\x47\xc8\x00\x28\xcd\x15\xc0\xdb\x19\xfe\x41\x7b\xa3\x3c\x88\
+\x55\x04\xd8\x32\x13\x81\x5f\xe6\x18\x7d\xc0\xf6\xac\x2a\xbb\x32\
+\x1d\x4b\x74\x24\xc4\x60\xb6\x03\x8e\x8a\x24\xe2\x52\x5a\xe7\xdf\
+\xa6\xac\xff\xde\xc4\xb8\xcc\x01\xdf\x22\x3f\x37\xd1\x3f\xc0\xed\
+\xc0\x97\x34\x2e\x0a\x51\x5a\x28\x3d\x07\xf8\x08\xf6\x44\xb0\xc9\
+\x3e\xc1\x83\x41\x70\x35\xf0\x77\xdf\x3f\xd9\x13\xc0\x4b\x81\x05\
+\x6a\xbd\x32\x00\xaa\xb0\xa0\xb8\x17\x8e\xf6\x7a\x82\xb7\x01\x47\
+\x60\x99\x48\x53\x13\xef\x21\xb7\x59\x0b\xd8\x07\x8b\x88\x98\x05\
+\xcc\x56\xdb\x15\x83\x18\x83\xad\xd7\x8b\x29\xd6\x94\xf5\xdf\xb7\
+\x40\x56\x09\x40\x09\xfc\x26\xcf\xaf\x89\xaa\x00\x0b\x0a\xe1\xf2\
+\xb8\x86\x00\x21\x7a\x66\x1f\xe0\xa3\xd8\xc3\x83\x71\x0d\x8b\xf2\
+\x3a\x4d\x84\x4e\xfd\xc9\x77\x70\x5f\x89\xeb\x13\xc0\xb9\x6a\xbd\
+\x32\x00\x42\x70\x2d\x70\x02\xb0\xb1\xc7\x93\x5b\x02\xcc\xc7\xd6\
+\x23\xe5\x2c\xf0\xbb\xdd\x66\x22\x70\x24\x56\x8b\x75\x3a\xae\xcb\
+\x93\x88\x1a\x99\x8f\x19\x65\x13\x23\x8b\x32\x65\xfd\x4f\x47\x0c\
+\xa7\x2e\xb8\x9b\x3e\xff\xd4\xcb\x01\xf6\x27\xfa\x19\xfd\x3d\x6c\
+\xf7\x55\x60\x9a\xba\x7f\x21\x7a\x62\x0b\xe0\x5d\xc0\x6b\x80\xf5\
+\x6b\x10\xdc\xa9\x84\xfe\xff\x12\xb8\xcb\xf7\x4f\x37\x15\x78\x2b\
+\x0a\x78\x92\x01\x10\x88\x15\x58\x42\xc0\x37\x79\x9d\x33\xde\x5f\
+\x08\xde\x5c\x96\x02\x84\xd8\x66\x32\xf0\xdc\xa2\x23\xbf\x57\x46\
+\x80\x28\x46\x84\x67\xa0\xf2\x7f\x31\xc5\x64\xca\x59\xff\x15\xa2\
+\x9f\x37\xfd\x09\x7f\x4e\x99\x63\x9e\x0a\x9c\xac\x9f\x5d\x88\xae\
+\x19\x0f\xbc\x01\x78\x27\xb0\xb5\x23\x61\xef\xc1\x20\xb8\x11\xf8\
+\xab\xff\x2e\xfe\xe5\xc5\x94\x5f\xc8\x00\x08\xc6\x7d\xd8\x32\xe2\
+\xa7\x79\x3d\xc1\xdb\xe9\xbc\x14\x20\x35\x13\x20\xc4\x31\x46\x61\
+\xc6\xc8\xb1\x58\xd2\x96\x7b\x70\x1f\xba\x24\x22\x72\x17\x70\x20\
+\x30\x09\x65\xfd\x4f\xd1\x08\x68\x42\xa4\xcb\x14\x90\xd8\x6f\xf2\
+\xf3\xca\x1e\x57\xeb\xfe\x85\xe8\x8d\xbd\x80\x6f\x01\xbb\xd6\x28\
+\x8e\x3c\x19\x04\x9d\xde\x5f\x50\x5c\x1b\xe7\x65\xb7\x7f\x81\x12\
+\xff\xc9\x00\x88\xc4\x65\x58\x59\xc0\x75\x3c\x9e\xdc\x62\xac\xce\
+\xef\xc1\x99\x88\xf7\x90\xdb\x8c\xc6\x92\xb7\x1c\x8b\x95\x81\xbb\
+\x4f\x46\x40\x6b\xb9\x15\x4b\xe8\x33\x06\x65\xfd\xaf\x4b\xf8\xaa\
+\x04\xa0\xc8\x49\xec\x7b\x15\xfd\x03\xcc\xc7\xd6\x2d\x6b\xdd\xbf\
+\x10\xdd\xf1\x62\xe0\xbd\x3d\x88\xa2\x36\xad\xfb\x07\xf8\x19\xb6\
+\xa4\xd6\x31\x8f\x02\x2f\x03\x16\xa9\x35\xcb\x00\x88\xc1\x93\x45\
+\x23\x7b\xb1\xd7\x13\x9c\x89\x85\xbc\x6f\xdd\x32\x81\xdf\xed\x36\
+\x63\x80\xdd\x81\xe3\x8a\xeb\x34\x03\x4b\x17\x2a\xda\xc3\xfc\xe2\
+\x77\x3f\xbc\x82\xa0\x53\xd6\x7f\x99\x01\x32\x06\xda\x23\xf4\x53\
+\x10\xfd\x03\x2c\xc3\x32\x60\xdd\xad\xe6\x22\x44\x57\xbc\x12\x5b\
+\xeb\x1f\x52\x4c\xe7\xb4\xee\xff\x32\x92\x28\x21\xfa\x76\xac\x40\
+\x81\x90\x01\x10\x8d\x29\x85\x76\xd8\xde\xeb\x09\x4e\x05\x0e\x05\
+\xd6\x6e\xa1\xc0\xef\x76\x9b\xd1\xd8\x7a\x8e\xe7\x62\x4b\x04\x1e\
+\x05\xe6\xa8\x6d\xb7\x86\xfb\x31\xe3\xe7\x80\x41\x6d\xc2\x7b\x34\
+\x80\x8c\x80\xb4\xc5\xb8\xcc\x81\x74\x44\x7e\x9d\xe7\x13\xf2\xf8\
+\x2b\x81\x6f\x68\x16\x2c\x44\xd7\x7d\xf2\xeb\xb0\x45\xe3\xa9\x8a\
+\xff\xd8\x06\xc1\x5c\xe0\xbb\x98\xb1\xe8\x98\x8b\x80\x0f\xab\x45\
+\xcb\x00\xa8\x83\xab\x80\xb7\x61\x0f\x94\xdd\xb1\x0c\x78\x00\x38\
+\xac\xc3\xa4\x33\x77\x81\xdf\xed\x36\x7d\xc0\x56\x58\x48\xf8\xd3\
+\x80\xe5\x58\x14\x85\xd6\x4d\xe6\xcf\xed\x58\x48\xcf\xfe\x0d\x89\
+\x7a\x65\xfd\xaf\x57\x1c\xab\x04\xa0\x04\xbe\x97\xf3\x8b\x55\x0e\
+\xf0\xb7\xb8\xaf\xcf\x2d\x84\x0b\x46\x61\x8f\x8c\x8f\xcb\x5c\xfc\
+\x57\xe9\x6b\xfa\x81\xef\x17\x73\x62\xc7\x2c\x01\x5e\x88\x3d\xc7\
+\x13\x32\x00\xa2\x33\x07\xcb\xb5\x77\xa4\xd7\x13\x7c\x04\x58\x17\
+\xd8\xd1\x81\xe8\xae\x53\xdc\x57\x39\xd6\x24\xe0\x20\xe0\x79\xc0\
+\x86\x45\x6f\xa2\x35\x94\x79\x73\x2b\x30\x1b\x4b\x0c\x38\x2a\x31\
+\x41\x9f\x6b\xb2\x3f\x65\xfc\x4f\xef\xdc\x53\x2e\x07\x98\x6a\x65\
+\x80\x35\x8f\x77\x21\xca\x7e\x25\x44\x37\x8c\xc1\xd6\xfb\x1f\x59\
+\x93\x90\x6e\xaa\x3f\xa9\xba\xcd\x99\x45\xbf\xe2\x9c\xcf\x61\x05\
+\x4f\x44\x8b\xe6\x40\x4d\x33\x0e\xb8\x09\xd8\xcd\xeb\x09\x8e\x05\
+\xbe\x80\x3d\xe1\x4e\x41\xbc\x7b\x34\x0a\x6e\x03\x2e\x00\xae\x41\
+\x65\x04\x73\xe6\x00\xe0\x93\x58\x82\xc8\xaa\x1d\x64\x4a\xcb\x02\
+\x3c\x1b\x01\x75\x0f\x50\x1a\x0c\xdb\x41\x7f\xe2\x9f\x35\xd4\x31\
+\x6f\x06\x3e\x86\xfb\x30\x5d\x21\x5c\x4c\xdc\x3f\xcc\xaa\x72\x5e\
+\xfd\x01\xef\xe5\xd4\xb6\xe9\xf4\xfe\x0c\xe0\x33\xc0\x52\xdf\x3f\
+\xe7\xed\xc0\xbe\x28\xa7\x77\x29\x14\x01\x50\x9e\x15\xc0\x2d\xc0\
+\x7f\x78\x9d\x3b\xae\xc4\xb2\x76\x1e\xc9\xea\x4f\x37\xdb\x20\xf0\
+\x43\x6d\xb3\x31\x56\x37\xfe\x85\xc0\xce\xc5\x0d\xf3\x30\xb6\x54\
+\x40\xe4\xc3\x4c\x6c\xdd\xec\xd3\x80\xf5\x1b\x14\xf4\xca\xfa\xef\
+\x4b\xa0\xcb\x14\x90\xd8\xf7\x2a\xfa\x07\x78\x00\xf8\x38\xb6\x9c\
+\x49\x08\x31\x3c\xeb\x00\x9f\xc2\xca\xfd\x85\xbe\xa7\x73\x0a\xfd\
+\x5f\x01\x7c\x1b\xf7\x79\xb1\xfa\xb1\xfc\x8d\x77\xa9\x65\xcb\x00\
+\x68\x82\xfb\xb0\x28\xfb\x7d\xbd\x9e\xe0\x63\xc5\x24\x76\x77\x09\
+\xfc\x4a\x13\xfc\xd1\xc0\x96\xd8\x12\x81\xe3\xb0\x2a\x0b\xa3\xb0\
+\x04\x29\x7a\xea\x92\x07\x8f\x01\xe7\x03\x93\x81\x6d\x02\x89\xc1\
+\xb6\x67\xfd\x8f\x29\xa0\x55\x02\x50\x34\x2d\xf6\x63\x7f\xee\x48\
+\xc7\x9e\x01\x7c\xa8\xe8\xbb\x84\x10\xc3\xb3\x01\xf0\x59\x56\x5f\
+\x16\xdb\xe6\x75\xff\x9d\xb6\x39\x99\x24\x12\x89\x9e\x08\xfc\x40\
+\x2d\x5b\x73\x99\x26\xd9\x18\x4b\xbc\xbf\xa9\xd7\x13\x1c\x0d\xfc\
+\x0f\xb0\x93\x03\x41\x1d\x7b\x1d\x7f\x4c\x13\x60\xa8\xed\x56\x00\
+\xd3\x80\x1b\x81\xeb\x70\x9f\x2c\x45\x74\xf9\x3b\xbf\x08\x78\x2b\
+\x96\xe8\xa3\x49\x41\xaf\xac\xff\xe9\x0c\x64\x1a\x4c\xf3\x16\xfa\
+\x5e\x44\xff\x00\x0f\x03\x1f\xc0\x72\x98\x08\x21\x86\x67\x53\x2c\
+\x9c\x7d\x33\xc7\x82\xbc\x9b\xed\xea\x38\x9f\x3b\x80\x2f\xe3\x3e\
+\x11\xf6\x2c\x60\x4f\x60\x9e\x5a\x77\x35\x6d\x28\xaa\xb1\x08\x8b\
+\x04\x38\xc1\xf3\x84\xe9\x56\xac\x76\xe1\xd8\xc8\xe2\x3d\xd5\xb5\
+\xfe\x65\x8f\x35\xaa\x18\x54\xf6\x05\x9e\x0f\x1c\x81\x3d\x3d\x5e\
+\x1b\xcb\x19\xb0\x48\xf7\x47\x92\xdc\x0e\x5c\x8e\x25\xf8\x98\x14\
+\x48\xec\xa9\xfc\x5f\x7d\x62\xd9\x93\x18\x97\x31\x90\xae\xd0\xaf\
+\xeb\x5c\x7a\x3d\xfe\xa3\xd8\x3a\xe6\x87\xd4\x4c\x84\xe8\xc8\x36\
+\x58\x96\xb8\x8d\x23\x89\xf6\xd4\xfa\xbb\xfe\x11\xc4\xcc\xd7\x49\
+\x22\xdf\xd5\x7f\x60\xcf\xdd\x84\x0c\x80\xc6\x99\x86\x2d\x2b\xda\
+\xc3\xeb\x09\x2e\xc4\x9e\x14\x1c\x94\x99\xc0\xf7\x16\x51\xb0\x2e\
+\xb0\x03\x70\x30\xf6\x14\xf9\xa8\xe2\xff\xd7\x2b\x3a\xde\x27\x48\
+\x3b\x63\x76\x9b\x78\x1c\x38\xb7\xf8\xf7\xee\x3c\x35\x8f\x86\xb2\
+\xfe\xa7\x23\x90\x3d\x8b\xf0\xb6\x1a\x04\xfd\x2d\x3f\xb7\xb2\x9f\
+\x31\xaf\x10\xff\x33\xd4\x45\x0b\xd1\x91\x3d\xb0\xe8\xd7\xf5\x23\
+\x89\xff\x9c\xd6\xfd\x03\xfc\x0c\x8b\x00\x70\xce\x9f\xb0\x20\x05\
+\xa1\xb9\x87\x1b\xdc\x2f\x05\x00\xf8\x4f\x3a\xd7\x2e\x6c\xfb\x5a\
+\xff\xd8\xc7\x5a\x06\xdc\x0f\xdc\x83\x65\x2e\xb9\x1d\x33\x66\x16\
+\xeb\xfe\x71\xcd\x76\xc0\xfb\x18\xba\xe4\x87\x8c\x80\xf4\x06\x24\
+\x95\x00\x6c\x97\xa0\xf7\x72\xee\x55\x3f\x67\x3e\xb6\xe6\xff\x5e\
+\x75\xc9\x42\x74\xe4\x50\xe0\xbf\x58\x3d\xea\xb5\xcd\x19\xff\x47\
+\xda\xe6\x02\xe0\x57\xfe\x7f\xd6\x47\xb1\xd0\x7f\xad\x7c\x92\x01\
+\xe0\x8e\xd7\x01\xbf\xf7\x7c\x82\xe3\xb0\xd2\x80\x5b\xca\x04\x70\
+\x73\x2c\x80\x05\xd8\xa2\xa6\x59\x58\x1e\x81\x87\x8a\x9e\x6e\x1e\
+\x96\x68\x70\xa9\xee\x2d\x17\x9d\xe5\xf1\xc0\x1b\xb0\x6c\xc2\x21\
+\x3a\x53\x25\xfb\xf3\x31\x38\x69\x20\x6c\x17\x29\x96\x02\x9c\x8b\
+\x65\xfb\xbf\x5b\x3f\x9f\x10\x1d\x39\x1e\x78\xfd\x1a\xfd\xba\xc4\
+\xff\xf0\x24\x52\xf2\x0f\x2c\xeb\xff\x49\x6a\xe1\x9a\xf7\x78\xe5\
+\x14\xe0\xa5\x9e\x4f\x70\x2b\xe0\xf3\x3c\x35\xc1\x59\x2f\x0d\x23\
+\xd7\x10\xfe\x26\x4d\x80\x4e\xdb\x2d\xc6\x4a\xb2\xcc\xc7\x96\x11\
+\xcc\xc7\xa2\x08\x1e\xc0\x12\x50\x2c\xd4\x7d\x57\x1b\x13\x0b\x13\
+\xe0\xf9\x34\xbf\x2c\xa0\x0d\x46\x40\x53\x03\x95\x06\x47\x89\x7d\
+\x2f\x9f\x39\xa3\x10\xff\xb3\xf4\x73\x0a\x31\x2c\xa3\x80\x37\x03\
+\xcf\x2b\x79\x3f\x7a\x4b\xfa\x17\x6a\x9b\x4e\xef\x2f\xc3\x72\x24\
+\xdc\xef\xff\xe7\xfd\x27\xf0\x62\xb5\x72\xcd\x71\x3c\xb3\x05\xb6\
+\x14\x60\x43\xcf\x27\x79\x6c\x21\x62\x3c\x08\xee\xdc\x8d\x82\x3a\
+\xb6\xbb\x1f\xb8\x18\xb8\x10\xa5\x45\xad\x8b\xad\x81\xb7\x01\x07\
+\x06\xec\x58\x95\xf5\xdf\xf7\xa0\xa5\x01\x53\x62\xbf\xee\xcf\xbe\
+\x1b\xf8\x04\xee\x6b\x72\x0b\xd1\x28\x63\xb1\x90\xff\x43\x5b\x24\
+\xec\x43\x6c\xf3\x2b\x2c\xfc\xdf\x39\x73\xb1\xd0\x7f\xe5\x3d\x0d\
+\x88\x92\x00\x86\x67\x01\xb6\x3e\xc5\xb5\x53\x75\x37\x96\x1d\xb5\
+\x8d\x4b\x01\x72\x34\x01\x26\x62\x95\x08\x8e\xc7\xea\xdc\xce\xd6\
+\x84\x31\x3a\x8f\x63\x86\xcb\x34\xac\xc4\xe6\x06\x4e\xc4\x7c\xdb\
+\xb2\xfe\xab\x04\xa0\x84\x7e\x6e\xe7\x30\x70\xec\x29\xd8\x93\xff\
+\xf9\xfa\xc9\x85\x18\x96\x75\x81\x4f\x01\xfb\x45\x16\xf6\xb9\x89\
+\xff\xeb\x80\x3f\xa7\xf1\x13\xbf\x1d\xb8\x42\x2d\x5d\x06\x40\x0a\
+\xdc\x84\x25\xdc\xdf\xd9\xf3\x49\xfe\x1b\x38\x04\x2b\x59\x27\x13\
+\x20\x7d\x13\x60\xe0\xff\x27\x03\x47\x03\x7b\x17\x13\x47\x85\x8d\
+\xc6\xe5\x21\xe0\x2c\xcc\xf9\xdb\x8d\xa7\x2e\xad\x49\xd9\x08\x08\
+\x2d\x6e\xdb\x54\xfe\x4f\xc6\x40\x1e\x42\xbf\xce\xf3\x19\x7c\xfc\
+\x4b\xb1\xd0\x5c\x25\x88\x15\x62\x78\x36\xc7\x96\xb4\x6e\x17\x59\
+\xfc\xe7\xb6\xee\x7f\x2e\xf0\x2d\x92\x58\xf7\xff\x2f\xcc\x07\x15\
+\x9a\x9f\x24\xc3\xd6\xc0\x2d\xac\x5e\x81\xc4\x1d\xbb\x61\xe1\x85\
+\xa3\x64\x02\x64\x63\x02\xac\xc9\xad\xc0\x6f\x81\xdb\x74\x4f\x46\
+\x67\x7d\xe0\x04\xe0\x85\xc0\x78\x19\x01\x8d\x0f\x3e\xde\x07\xb8\
+\xb6\x0f\xc0\xfd\x3a\xbf\x21\x3f\xe3\xef\xc0\x8f\x81\x95\xea\x52\
+\x85\x18\x96\x5d\x81\x8f\x0e\x33\xc9\x96\xf8\x1f\x9e\x15\xc0\x57\
+\x48\xa2\xe4\xdf\x7c\xac\xc4\xfa\x83\x6a\xed\xe1\x51\x04\x40\x3c\
+\x1e\xc7\x12\xb9\x1f\xef\xf9\x24\x1f\x2d\x3a\x8a\x3d\x24\xdc\xb3\
+\x35\x01\x36\xc1\x22\x02\x76\xc4\x12\x06\x2a\x9c\x34\x1e\x4b\x80\
+\x1b\xb1\x88\x80\xfe\xe2\x9a\x8f\x09\x24\xfa\x72\x4e\xf6\xa7\xf2\
+\x7f\xf9\x9c\xbb\xca\x01\x96\xff\x9c\x65\xc0\xf7\xb0\x42\xd7\x29\
+\x5f\x47\x21\x62\x73\x24\x56\x12\x73\xed\x44\xc4\xbf\x27\x4e\x06\
+\xae\x4c\xe3\x54\xdf\x0d\x5c\xa2\xd6\x2e\x03\x20\x45\x6e\x00\xf6\
+\x01\x76\xf7\x7c\x92\x77\x90\x5e\x3e\x00\xaf\x9f\xe7\x79\xbb\xc9\
+\x58\xf2\xc7\x49\xc5\x6f\xbe\x44\xf7\x67\x74\x23\xe0\xcc\xe2\xdf\
+\x3b\xb1\x7a\x3d\x62\x65\xfd\xf7\x23\x74\x15\x06\xd7\x4e\xfa\x9d\
+\x7d\xde\x1c\xe0\x93\xc0\x55\xfa\x69\x84\xe8\xd8\x5f\x9f\x80\x65\
+\xfb\x1f\x1d\xf9\xbe\xce\x31\x8a\xe0\x46\x2c\x22\x34\x01\xfe\x81\
+\x42\xff\x35\xf7\x49\x9c\x4d\xb0\xe5\xf6\x9b\x79\x3e\xc9\x75\x80\
+\x2f\x16\x27\x9b\x8a\x09\xa0\x27\xfc\xe5\xb7\x5b\x00\xfc\x05\x5b\
+\x5c\xa5\x30\xd3\xf8\xac\x0f\xbc\x08\xab\x0f\xba\x4e\x86\x46\x40\
+\xcc\xc1\x44\x25\x00\x45\x6a\x62\xbf\xd7\xcf\xbc\x13\x5b\xef\x3f\
+\x5b\x3f\x95\x10\xc3\x32\x1e\xf8\x6f\xe0\x19\x4e\xc4\xb8\x27\x61\
+\xdf\xcd\x36\x8f\x02\x9f\x2e\xe6\x7f\xce\x79\x04\x4b\x63\xf5\xb0\
+\x5a\x7d\x3c\x14\x01\x10\x9f\x45\xc5\xf8\xfe\x6a\xcf\x27\xb9\xac\
+\x38\xc9\xc3\xc9\x2f\x1f\x80\x4c\x80\xa7\xb2\x16\xf0\x74\xe0\x60\
+\xe0\x81\xa2\xb7\x15\xf1\x58\x82\xb9\x80\x67\x15\xff\xbf\x03\x79\
+\x46\x04\xc4\x16\xcf\x2a\x01\x28\x3c\x8a\xfd\x2a\x9f\x7d\x4e\x21\
+\xfe\x9f\xd0\x4f\x27\xc4\xb0\x6c\x0a\x7c\x86\xe1\x97\xab\x4a\xfc\
+\x77\xde\x66\x39\xf0\x0d\x92\x31\x19\x5f\x83\x45\x50\x0b\x19\x00\
+\xc9\x73\x3b\x96\xa4\xf4\x69\x9e\x4f\x72\x5e\xe1\x56\xec\x9b\x98\
+\x28\x97\x09\x50\x7e\xbb\x0d\x80\xe7\x60\x19\x2b\xef\x2c\x7e\x7f\
+\x11\xd7\x08\xb8\x11\x38\x03\x73\xe1\xb7\xc2\x57\x44\x40\x4a\x66\
+\x80\x17\x51\x2e\x63\xa0\x7d\x42\x3f\xc4\x39\x2c\x01\xfe\x17\xf8\
+\x35\x8a\xc2\x12\xa2\x13\xbb\x17\xe2\x7f\xd3\x96\x8a\xff\x10\xfc\
+\xba\x98\x7b\x24\xc0\xcf\x81\x6f\xab\xd5\x6b\xee\x92\x13\xeb\x16\
+\xf7\xdf\x4e\xde\x4f\xf4\x9d\xc0\x61\x19\x0a\xf7\xb6\x89\xfb\xbe\
+\x1e\x3b\x82\xa5\xc0\x29\xc5\x6b\xa9\xee\xd7\x5a\x18\x0d\x3c\x13\
+\x5b\x1a\xb0\x6b\xc0\x8e\xd9\x5b\x54\x40\x5b\xcc\x00\x0d\xae\x79\
+\x0a\xfd\xd0\xe7\x33\x1d\xcb\xc2\x7d\xbf\x7e\x5e\x21\x3a\xf2\x6c\
+\xe0\x6d\x3c\x35\x99\x6e\x0c\xc1\xde\x84\xb0\xaf\xe3\xf3\xae\x04\
+\xfe\x2f\x8d\x9f\xfb\x1e\xec\x19\xa4\x02\xa2\x6a\x9a\x7f\x8a\x7a\
+\x58\x8a\x85\xb4\xfc\x07\x9d\xa3\xec\x1b\xe7\x16\x60\x7f\x3a\xd7\
+\x2f\x94\x09\x90\x96\xb8\xef\x86\x31\x58\xbd\x95\x43\x8a\x5e\xf8\
+\x51\xdd\xb3\xb5\x88\x89\xfb\xb0\xa5\x01\x37\x62\x19\x8d\xb7\x1a\
+\xf4\x9b\xe5\x68\x04\xd4\x25\x8e\x55\x02\x50\x02\xdf\xdb\xf9\xf5\
+\x03\x7f\x2b\xc4\xff\x3c\xfd\xf4\x42\x74\x14\x27\xff\x01\xbc\xb6\
+\xc3\x84\x59\xe2\x7f\xe4\x6d\x1e\x04\xbe\x8b\x95\xfe\x73\xce\x4a\
+\xec\x59\xc8\x9d\x6a\xfd\x32\x00\x72\xe4\x01\x60\x3d\xe0\x50\xcf\
+\x27\xb9\x1c\x98\x8a\xe5\x03\x18\xe3\x44\x94\x2b\xcc\xbf\x1e\x13\
+\xa0\x0f\x33\x7e\x9e\x83\x55\x0b\xb8\xa5\x68\x0f\x22\x3e\x8f\x00\
+\x97\x16\x66\xc0\x93\xc0\xf6\x58\xae\x06\x2f\x46\x40\xca\x66\x40\
+\xea\x82\x3b\xb5\x73\x57\x29\xc0\xa7\x32\x0f\xf8\x12\xf0\x4f\x14\
+\xf2\x2f\x44\x27\xd6\x03\x3e\x52\xcc\x41\xeb\x10\xd9\xa1\x85\xbd\
+\x17\xf1\xbf\x18\xf8\x3a\xf0\x58\x1a\x3f\xfb\x57\x81\x5f\xa9\xf5\
+\x6b\x5e\x91\x33\xe3\x80\x6b\xb0\xf2\x80\xae\x39\x18\x78\x8f\x23\
+\x81\x2f\x13\xa0\x1e\x13\x60\xf0\xb6\x8f\x00\x3f\x46\xd9\x58\x9a\
+\x60\x02\x56\xb6\xf1\x05\x58\x8e\x86\xdc\x8d\x80\x26\x06\x24\x0d\
+\x80\xed\xa6\x2e\xa3\xe2\x72\xec\x29\xdc\x7c\x5d\x72\x21\x3a\xb2\
+\x0b\xf0\x41\xec\x01\x44\x8a\xe2\xdf\x53\x62\xc0\x9f\x14\x7d\x4f\
+\x02\xdc\x04\x1c\x84\x56\x9f\x6a\xfe\xd3\x02\xf6\x04\xae\xc3\xaa\
+\x9a\xb8\xe6\x0d\x85\x08\xf1\x22\xca\x65\x02\xd4\x6f\x02\x0c\x4c\
+\x60\x7f\x0a\x3c\xae\x7b\xb7\x11\x76\x06\x9e\x0f\x1c\x55\x74\x1a\
+\x5e\x8c\x80\x9c\xcc\x00\x0d\x88\x12\xfc\xa1\x99\x8b\x65\xb4\x3a\
+\x4f\x97\x5e\x88\x11\x39\x1a\x78\x2b\x9d\x23\x4f\x25\xfe\xbb\xdb\
+\xee\x5f\xc0\x9f\xd2\xf8\xd9\x97\x00\x07\x62\x85\x92\x44\x8d\x68\
+\x09\x40\x33\x3c\x82\x39\x5d\xc7\x78\x3f\xd1\xa9\x58\x72\xb2\x4d\
+\x12\x13\xee\x4a\xf8\x17\x76\xdb\x6d\xb0\x64\x3c\x8f\x01\xf7\xea\
+\xfe\xad\x9d\xb9\xc0\xd5\xc0\x69\x58\x61\xdc\x49\xc0\x46\xa8\x04\
+\xa0\x8c\x01\xe1\x41\xe8\xaf\xf9\xd9\xfd\xc0\xb9\x58\xe6\xf2\xdb\
+\xf4\x73\x08\xd1\x91\xb1\xc0\xdb\x81\x13\xe8\x9c\x20\xab\x09\xf1\
+\x1f\xb2\xcf\xa9\xeb\xf3\xa6\x62\xc6\x63\x22\x4b\xb1\x3e\x82\xad\
+\x8c\x12\x9a\xd7\xb4\xea\xda\x9f\x86\x45\xf8\xba\x66\x5d\xe0\xf3\
+\x0c\x5f\x82\xc5\xab\x70\x97\xb8\x8f\x73\xcc\x6b\xb0\x68\x80\x39\
+\xba\x87\x1b\x65\x67\xe0\xb9\x58\x54\xc0\x3a\x0e\x07\x83\x5c\xcd\
+\x00\x0d\x9e\x12\xfb\x9d\xce\xe1\x5e\xe0\x7b\xc0\x34\xfd\x34\x42\
+\x8c\xc8\x26\xc0\x87\x81\x1d\x6a\x16\xf5\xb9\x46\x08\x3c\x8a\x19\
+\x8f\x89\xa4\xd1\x3f\x0b\x38\x8e\xb4\xd3\xc6\xc8\x00\x10\xa5\xd8\
+\x14\x98\x02\x6c\xee\xfd\x44\xb7\x29\x3a\x95\x71\x32\x01\x64\x02\
+\x60\xc9\x65\xfe\x88\xd5\xb3\x5f\xa1\xfb\xb8\x51\xc6\x63\xc9\x92\
+\x9e\x87\xad\x2d\x6a\x93\x11\xe0\x75\x20\xd3\xc0\x9a\x9f\xc8\x1f\
+\xe9\x7c\x96\x60\x21\xb7\x7f\x45\x89\x53\x85\xe8\x86\x7d\x81\xf7\
+\x61\x49\xff\x24\xfe\xab\x6f\xb3\x14\xf8\x22\xc9\x44\x69\x3e\x0c\
+\x3c\x0d\x78\x48\x77\x82\xe6\x29\x6d\xe5\xb9\xd8\x72\x9d\x51\xde\
+\x4f\xf4\x40\xe0\xbf\x47\x68\x34\x32\x01\xd2\x32\x01\xaa\x6e\x7b\
+\x37\x96\x24\x50\x75\x5b\x7c\xb0\x35\xb6\x54\xe3\x59\xc0\x16\x2d\
+\x35\x03\x52\x18\xd8\x34\xf0\xfa\x16\xf8\xbd\x9c\x5f\x3f\xb6\xc6\
+\xff\x57\xa8\x74\xaa\x10\xdd\xf6\x7f\x2f\x03\x5e\xd9\xc5\xc4\x57\
+\xe2\xbf\xfb\x7e\xe8\xff\x80\xab\xd2\x68\x02\x2b\x0b\xed\xa3\xf4\
+\x28\x0d\xa2\x1c\x00\xcd\x33\x9d\x04\x4a\x03\x02\xcc\xc4\x22\x00\
+\x76\x49\x50\xb8\xcb\x04\x88\xb3\xed\x86\x58\x22\x8b\xcd\xb1\x90\
+\x57\xa5\x70\x6d\x96\xc7\xb1\x90\xa2\x7f\x00\x97\x60\xe5\x04\x37\
+\x07\xd6\x76\x28\x58\xeb\x14\xc1\xa9\x0a\xee\xd4\x8d\x82\xfe\xcc\
+\xcf\xfb\x26\xec\x89\xdb\xe9\xc0\x22\x75\x3f\x42\x8c\xc8\xfa\x58\
+\xc8\xff\xd1\x5d\xf4\x6f\x12\xff\xdd\x73\x1a\x70\x4e\x3a\xcd\xe0\
+\x6b\x58\x9a\x02\xa1\xf9\x45\xeb\x19\x5b\xcc\xd7\x0f\x4e\xa1\xc1\
+\x7c\x08\x0b\xdd\xf2\x22\xdc\x95\xf0\xcf\xc7\xb6\xf3\x80\xdf\x00\
+\x17\xe9\x7e\x76\x77\xcf\xee\x81\x2d\x13\x38\x0a\x98\xe8\x74\xd0\
+\x50\x09\x40\xe1\x59\xec\x0f\xe6\x41\xe0\xd7\xc5\xa0\x2d\x84\xe8\
+\x8e\xbd\x80\xf7\x62\x0f\x0e\x3c\x8a\xfa\x26\x84\x7d\x88\xcf\xfb\
+\x37\xf0\x2d\xec\xb1\x7a\x02\x5c\x0b\x1c\x06\x2c\xd3\x1d\x21\x03\
+\x40\x18\x3b\x62\xe5\xd6\xd7\xf7\x7e\xa2\xeb\x60\x49\x01\x37\x73\
+\x24\xdc\x65\x02\xf8\xd9\xf6\x46\x2c\x49\xa0\x16\x76\xf9\x63\x0c\
+\x70\x00\xb6\x44\xe0\x60\xaa\xd7\x21\x55\x09\x40\xd1\x06\xc1\x3f\
+\xc0\x6c\x6c\x9d\xff\x59\x28\xf7\x89\x10\xdd\x32\x1a\x0b\xf7\x7f\
+\x69\x97\xfd\x6c\x5b\xc4\x7f\x88\x63\x3d\x04\x7c\x96\x64\x22\x90\
+\xe6\x03\xfb\x01\xf7\xe8\xae\xf0\x71\x5f\x0a\x1f\xcc\x03\x1e\xc0\
+\x96\x46\xb9\x66\x19\x16\xee\xfd\x4c\x3a\xd7\x6b\x95\x09\xe0\x47\
+\xdc\xc7\x32\x01\x86\xda\x7e\x0b\xe0\x58\x6c\x6d\xdf\x9d\x9a\x28\
+\xbb\x62\x25\xf6\xf4\xf2\x32\xe0\xef\x58\xb2\xa0\xd1\x58\x36\xd2\
+\x31\x4e\xc5\x73\xd3\xc2\x5c\xc6\x40\xfb\x84\xfe\x50\x93\xec\x5f\
+\x00\xdf\x06\x6e\x47\x29\xab\x85\xe8\x96\x49\xc0\xc7\xb1\x08\x34\
+\x89\xff\xb0\xc7\x5a\x8c\xc5\xd2\xcf\x4d\xa7\x39\xbc\xa9\x98\x7e\
+\x08\x07\x68\x6e\xe3\x8f\x5f\x03\xff\x91\xc2\x89\xee\x0b\x7c\x90\
+\xce\x49\x5c\x64\x02\xa4\x69\x02\x84\x3a\x87\x39\xc0\xef\xd0\xb2\
+\x00\xef\xac\x85\x55\x10\x38\xa8\x98\xa8\x4d\x72\x3c\xa8\xa8\x04\
+\xa0\x88\x29\xf6\xd7\x14\xfe\x7f\xc6\xd6\xd6\x2a\xb3\xbf\x10\xbd\
+\xcf\x11\xff\x9b\xee\x97\x9d\x49\xfc\x77\xbf\x4d\x3f\x56\x6e\xf4\
+\x86\x74\x9a\xc3\x2f\x80\xb7\xe9\xae\x90\x01\x20\x86\x67\x1d\xe0\
+\x3a\x60\xb7\x14\x4e\xf6\x38\xe0\x35\x35\x09\x77\x85\xf9\xa7\xbb\
+\xed\x0d\x45\xef\x3f\x53\xf7\x77\x12\x83\xc2\xee\xd8\x12\x81\x43\
+\xb0\xca\x02\x9e\x07\x18\x95\x00\x94\xc8\x0f\xcd\x7d\x85\xf0\xbf\
+\x90\x64\xd6\xd5\x0a\xe1\x86\x31\xc0\xeb\x80\x17\x46\xb8\xbf\x95\
+\x1b\xc0\xf8\x3d\x70\x76\x3a\x4d\xe2\x4e\x60\x7f\xe0\x09\xdd\x1d\
+\x9a\xab\x88\xce\xec\x07\x5c\x41\xf5\x25\xba\xb5\xf0\x56\x6c\x4d\
+\x71\x1d\x82\x57\x26\x40\xba\xdb\x2e\xc7\xb2\xd3\x9f\x84\x85\xae\
+\x89\x34\x98\x5c\x18\x01\x07\x63\xc9\x04\xcb\xd6\x2b\x55\x09\x40\
+\x0d\xba\x5e\x04\xfe\x70\x9f\x7f\x35\xb6\x34\xe6\x46\x14\xe6\x2f\
+\x44\xd9\xf1\xe2\xbd\x58\x52\xab\x36\x89\xfa\x90\xe2\x7f\xa4\xed\
+\x2e\xc0\xca\x8e\x26\xc2\x93\xc5\xf4\xe1\x66\xdd\x1d\x9a\x8b\x88\
+\xee\x78\x1b\xf0\xb3\x14\x4e\x74\x34\xf0\x11\x2c\x84\x58\x26\x80\
+\x4c\x80\x91\xb6\x9f\x53\x0c\x5e\x5a\x08\x96\x1e\xeb\x63\xcb\x04\
+\x0e\xc1\x5c\xca\x09\x09\x0c\x3c\x2a\x01\xd8\x6e\x61\x3f\x12\x0b\
+\xb0\x27\x69\xff\x04\x66\xe9\x16\x17\xa2\x74\x7f\x75\x2c\xf0\x46\
+\xac\x5c\xb4\xc4\x7f\x9c\x63\xdd\x82\x65\xfc\x4f\x28\xb7\xd2\x5b\
+\x48\xca\xaf\x90\x01\x20\x7c\xf0\x2b\x2c\x69\x86\x7b\xd6\xc1\x32\
+\x91\x6e\x21\x13\xa0\x71\x71\x9f\x82\x09\x30\x30\x90\xfd\x1c\x0b\
+\xb7\x15\xe9\x31\x1a\x5b\xa7\xb4\x5f\xf1\xda\x95\x72\x89\x04\x55\
+\xfe\xcf\xcf\x77\x6f\xd3\x53\xef\x7b\x0b\xd1\x7f\x1e\x8a\x48\x12\
+\xa2\x0a\x1b\x00\xef\x29\xc6\x81\x5e\xfa\x10\x89\xff\xde\xb6\x9b\
+\x89\x55\xe0\x5a\x94\x4e\xd3\xd0\xba\x7f\x19\x00\xa2\x24\xe3\xb1\
+\xa5\x00\xfb\xa5\x70\xb2\x9b\x02\x9f\x03\xd6\x93\x09\x90\xad\x09\
+\x10\xfa\xd8\xfd\x58\x82\xc0\xdf\x00\x8f\xe9\x7e\x4f\x9a\x71\xd8\
+\x12\x81\x01\x43\x60\xa7\x92\x03\x8c\x4a\x00\x8a\x58\x2c\x00\x2e\
+\x01\xce\x05\xa6\xea\x72\x08\x51\x99\x83\x80\x77\x16\xf3\x3e\x89\
+\xff\x78\xc7\x5a\x50\xcc\xaf\x1f\x4e\xa7\x69\xdc\x8c\x85\xfe\x3f\
+\xa9\xbb\x44\x06\x80\x28\xc7\x4e\x58\x52\xc0\x89\x29\x9c\xec\xae\
+\x58\xc9\x17\x4f\xe5\x01\xdb\x6a\x02\x78\xd9\xb6\x9b\xed\x17\x63\
+\x6b\x6f\x4f\x01\x96\xea\x9e\xcf\x82\x0d\x80\xbd\x0b\x33\xe0\x00\
+\xcc\x20\x4c\x69\x80\xd2\xe0\x98\x07\x2b\x80\x29\xc0\xbf\x30\x37\
+\x5d\xd9\xfc\x85\xa8\xce\x04\x2c\xdc\xff\x98\x1e\x45\x6e\xdb\xc4\
+\x7f\x08\x93\x60\x39\xf0\x0d\xe0\xd6\x74\x9a\xc7\x63\xc5\xb0\x3f\
+\x5d\x77\x8a\x0c\x00\x51\x8d\x17\x03\xa7\xa6\xf2\x7b\x1d\x0e\xbc\
+\x3d\x40\xc3\x93\x09\xd0\x2e\x13\x00\xac\xec\xd6\x6f\x80\x2b\x75\
+\xcf\x67\xc7\x36\x85\x19\xb0\x2f\x96\x2f\xa4\x8c\xa3\xa9\x12\x80\
+\xa2\x9b\x09\xf4\x4a\x60\x1a\x70\x29\x96\xc9\x7f\xbe\x2e\x8f\x10\
+\xc1\xd8\x0d\x2b\xef\xb7\x99\xc4\x7f\x74\xf1\xdf\x0f\xfc\x14\xb8\
+\x3c\xad\xae\xf8\x15\xd8\xf3\x1c\x21\x03\x40\x04\xe0\xbb\xc0\xfb\
+\x53\x39\xd9\x57\x02\x2f\x92\x09\x90\xbd\x09\x10\xeb\xd8\xb7\x00\
+\x27\x02\x77\xeb\xbe\xcf\x96\xad\x0b\x23\x60\x4f\x60\x2f\x3a\xe7\
+\x0f\x49\x65\xf0\xd2\x80\x5a\x9f\xc8\x5f\x93\xe5\xc0\x4d\xc5\x44\
+\xf9\x4a\x60\x9e\x2e\x97\x10\x41\x19\x0b\x9c\x00\xbc\x84\x55\xd5\
+\x60\x24\xfe\xe3\x89\x7f\xb0\xca\x49\x27\xa7\xd5\x4c\xbe\x09\x7c\
+\x54\x77\x8b\x0c\x00\x11\x8e\x31\xd8\xc3\x8c\x67\xa6\xd2\xb0\xde\
+\xde\xc5\xc9\xca\x04\x68\x9f\x09\xd0\xed\xf6\xfd\xc0\xf9\xc0\x1f\
+\x34\x99\x6f\x05\x93\xb0\x1c\x02\xbb\x63\x4b\x89\x76\x06\xd6\xca\
+\x68\x30\xd3\x60\x1b\x76\x72\x0d\xb6\xb8\xf4\x86\x42\xf4\x5f\x8d\
+\xad\x93\x15\x42\x84\x67\x17\xe0\xdd\xc0\x56\x25\xef\x55\x89\xff\
+\xde\xb7\xb9\x02\xf8\x09\x49\x25\x67\xbd\x12\x38\x12\x58\xa6\x3b\
+\x46\x06\x80\x08\xcb\xe6\x58\x89\xe2\xcd\x53\x38\xd9\xd1\xc0\x87\
+\xb1\xa7\x7b\x12\xed\xf1\x44\x78\x6a\x4f\xf7\x7b\xdd\x7e\x20\x3f\
+\xc0\xdf\x51\xb6\xee\x36\x31\x06\xd8\xa1\x30\x03\x76\x2b\x5e\x5b\
+\x46\x6e\x93\x1a\x94\x7d\x08\xfb\x4e\xc7\xb8\x0b\xb8\xbe\x78\x4d\
+\x43\x6b\xfa\x85\x88\xc9\x5a\xc0\xab\x81\x17\xb2\xea\xa9\x7f\x0c\
+\xc1\x2c\x93\x60\x75\xa6\x61\x8f\xd2\x13\xea\xdf\x1e\x06\x9e\x8e\
+\x15\x2b\x10\x9a\x6b\x88\x08\x3c\x1b\x38\xa7\xd0\xd7\xee\x99\x00\
+\x7c\x0a\xd8\x56\xe2\x3e\xba\xa8\xce\x39\x1a\x00\x2c\xab\xcc\x9f\
+\xb1\x0c\xde\x2b\xd4\x0f\xb4\x92\x75\xb0\xac\xa8\x3b\x16\xff\xdd\
+\x09\x7b\x22\x35\x4a\x03\x5e\xb4\xef\xda\xf4\xd3\xa7\x47\x30\xd7\
+\xfb\xfa\xe2\xbf\x5a\xcf\x2f\x44\x3d\xec\x8e\x3d\xf5\xdf\x22\xb2\
+\xa0\x97\xf8\x5f\x9d\x07\x80\x2f\x91\x54\xb9\xbf\x15\xc0\xf3\x8b\
+\xe9\x99\x90\x01\x20\x22\xf2\x49\xe0\xcb\xa9\x9c\xec\x86\xc0\x67\
+\xb1\x10\x5f\x89\x7b\x99\x00\x55\xb7\x9f\x09\xfc\x0e\xb8\x8a\x76\
+\xd5\x2d\x17\x43\x33\x01\x8b\x14\xd8\x11\xd8\x0e\xd8\xbe\xf8\xef\
+\x04\x0d\x82\xc9\xb1\x12\xcb\xfb\x31\xad\x78\x4d\x05\x66\xeb\xb2\
+\x08\x51\x2b\xe3\x81\xd7\x01\xcf\x5b\xa3\x7f\x94\xf8\x8f\xbf\xdd\
+\xa3\xc0\xe7\x49\xae\x2c\xf2\x47\xb1\x80\x05\x21\x03\x40\xd4\xf0\
+\xbb\xfd\x09\x78\x55\x2a\x27\x3c\x19\xf8\x34\xf6\x04\x4f\xe2\x5e\
+\x26\x40\x88\x7d\x6e\x07\x7e\x8b\xea\x79\x8b\xa1\xdb\xd1\x66\x85\
+\x11\xb0\x6d\x61\x0a\x6c\x83\x45\x0b\xac\x15\xa9\xed\x8a\xde\x79\
+\x14\xab\x13\x75\x7b\x21\xf8\x6f\x43\x45\xa3\x85\x68\x92\xbd\x81\
+\x77\xf1\xd4\xb2\xad\x12\xff\xf1\xb7\x5b\x00\x7c\x91\xe4\x62\xe8\
+\xff\x88\xf9\x45\x42\x06\x80\xa8\x89\x09\xc0\x65\xd8\x9a\x9b\x24\
+\xd8\x0d\xb3\x09\xc7\x4a\xdc\xb7\x4a\xd8\xc7\xde\xfe\x5a\x2c\x22\
+\xe0\x7e\xf5\x09\xa2\x4b\x63\x60\x32\x56\x85\x60\xab\xe2\xb5\x35\
+\x9d\x23\x94\x34\x60\x56\x63\x25\xf0\x60\x21\xf6\xa7\x63\xeb\xf8\
+\xef\x46\xe1\xfc\x42\x78\x61\x5d\xe0\x0d\xd8\x1a\xd3\x3e\x89\xff\
+\xda\xb7\x5b\x06\x7c\x0d\xb8\x23\xad\x66\x33\x05\x38\x94\xa4\x56\
+\x2b\x08\xcd\x67\xf2\x60\xbb\x42\xff\x6c\x9c\xca\x09\x1f\x04\xbc\
+\x67\x84\x86\x27\x71\xef\x5f\xd8\x7b\x33\x01\x56\x02\x17\x61\x39\
+\x02\x14\x32\x2c\xca\xb0\x16\xb6\xd6\x75\x0b\x2c\xcb\xea\xc0\x6b\
+\xe0\xff\xc7\x69\x30\x1d\x91\x05\x85\xd0\x1f\x78\xcd\x18\xf4\xef\
+\xa5\xba\x3c\x42\xb8\x14\x01\x47\x00\x6f\x04\x26\x3a\x13\xf4\x6d\
+\x11\xff\xfd\xc0\x0f\x8b\xc9\x7c\x42\xcc\x01\x9e\x81\xaa\x35\xcb\
+\x00\x10\x8d\xf1\x1c\xe0\x2c\x2c\x69\x76\x12\x3c\x1f\x78\x6d\x4b\
+\xc4\xbd\x4c\x80\x6a\x9d\x4d\xaf\xfb\x2c\xc7\xb2\xd0\x9c\x04\xcc\
+\x55\xdf\x20\x02\x32\x11\x8b\x12\xd8\xa4\xf8\xef\xe0\x7f\x6f\x0c\
+\x6c\x30\xcc\x04\x3a\xa7\x81\x76\x01\x96\x94\xef\x61\xcc\x68\x7b\
+\xa4\x78\xcd\x2e\x44\xbe\x9e\xe8\x0b\x91\x0e\x5b\x02\x6f\xc3\xc2\
+\xfe\xbd\x09\xf5\xb6\x88\x7f\x80\xdf\x03\x67\xa7\xd5\x74\x96\x03\
+\xc7\x62\xa5\xc9\x85\x0c\x00\xd1\x20\x1f\x02\xbe\x95\xd2\x09\xbf\
+\x06\x38\x4e\x26\x40\xf2\xdb\x7a\xdc\x1e\x2c\x9c\xee\x5f\xc0\x29\
+\x12\x25\xa2\x46\x46\x03\xeb\x17\x46\xc0\x06\x58\x02\xd4\x89\xc5\
+\x6b\x3d\x2c\x07\xca\xe0\xd7\xda\x83\xfe\x5d\xf7\x80\xfc\x64\xf1\
+\x5a\x0c\x2c\x04\x1e\x2f\xee\x95\xf9\x83\xfe\xfd\xd8\xa0\xff\x7f\
+\x04\xad\xcf\x17\x22\x07\xc6\x02\x2f\x2d\x5e\x63\x6b\x12\xe9\x12\
+\xff\x43\x73\x3a\xf0\x97\xf4\x9a\xd0\xfb\x81\xef\xeb\x4e\x92\x01\
+\x20\x7c\x70\x22\xf0\xe6\x94\x1a\xde\x9b\x81\xa3\x64\x02\xc8\x04\
+\x88\xb8\xcf\x62\xe0\x34\xe0\xef\x85\xc8\x11\xc2\x2b\x6b\x63\xe5\
+\x0c\xd7\x2d\xda\xfa\xba\xc5\xff\xaf\x5d\x18\x0b\x13\xba\xbc\x47\
+\x96\xb0\x2a\xdc\x7e\xc5\x20\xd1\x3e\x20\xf6\x9f\xd4\xbd\x20\x44\
+\x6b\xd9\x1b\x78\x3b\xab\x97\xf6\x93\xf8\x6f\x66\xbb\x4b\x81\x9f\
+\x93\x5c\x35\xa3\xdf\x61\x2b\x46\x84\x0c\x00\xe1\x84\xf1\xc0\x25\
+\xc0\x81\xa9\x9c\xf0\x28\xac\xc6\xec\x41\x32\x01\xb2\x10\xf6\x75\
+\x88\xfa\xb2\x1d\xd6\x62\x2c\x22\xe0\x64\x94\xad\x46\x08\x21\x44\
+\xbb\xd8\x00\x4b\xf2\x77\x44\x87\x71\x54\xe2\xbf\xbe\xed\xae\xc3\
+\xd6\xfd\xaf\x4c\xab\x19\xdd\x08\x1c\x86\x82\xc1\x64\x00\x08\x77\
+\x6c\x83\xe5\x11\xd9\x34\x95\x13\x1e\x83\xc5\x12\xed\x2b\x13\x20\
+\x0b\x13\xa0\x2e\x51\x5f\x76\x9f\xf9\xc0\xa9\xc0\x99\x85\x29\x20\
+\x84\x10\x42\xe4\xca\x68\xe0\x79\xc0\x2b\xe9\x5c\x86\x59\xe2\xbf\
+\xbe\xed\xa6\x62\x6b\x76\x97\xa7\xd5\x94\x1e\xc6\x1e\x30\x3e\xa0\
+\xbb\x4a\x06\x80\xf0\xc9\x91\x58\x1e\xb4\xb1\xa9\x9c\xf0\x78\xe0\
+\x63\xc0\x4e\x12\xf7\x6e\x85\xbd\x47\x51\x5f\xb6\xf3\xea\x03\x9e\
+\xc0\xd6\xde\x9d\x86\xc2\xa1\x85\x10\x42\xe4\xc7\xde\xd8\x52\xcb\
+\x6d\x02\x09\xf4\xa6\x05\x7d\x0e\xe2\xff\x0e\xe0\xeb\x24\x57\x15\
+\x65\x29\x70\x34\xb6\x6a\x41\x64\xc2\x68\x5d\x82\xec\xb8\x0f\x4b\
+\xc8\xfc\xe2\x54\x4e\x78\x39\x16\xb6\xb0\x0f\x16\xa6\x26\x13\xc0\
+\xe7\xb6\x1e\xb7\x2f\xbb\xcf\x5a\xc5\xe4\xe8\xb9\xc5\xbf\xef\xc1\
+\x12\x07\x0a\x21\x84\x10\x29\xb3\x31\xf0\x56\xe0\x3f\x18\xbe\x32\
+\x49\x2c\xe1\xed\x61\x5b\xaf\xdb\x3d\x00\x7c\x83\x24\xa3\x0f\xdf\
+\x8d\x05\x4f\x0a\x19\x00\xc2\x39\x37\x61\x39\xa4\x0e\x4d\xe5\x84\
+\x97\x61\x6b\xa2\x9e\x8e\x65\xcb\x96\x09\xd0\x5e\x13\xa0\xce\x7d\
+\xc6\x15\x46\xc0\x71\x58\xb2\xb5\xe9\xa8\x5e\xb9\x10\x42\x88\xf4\
+\x18\x07\xbc\x1c\xf8\x20\xb0\x43\x46\x82\x3e\x07\xf1\xff\x30\xf0\
+\x15\x2c\xfa\x30\x31\xbe\x86\xf9\x16\x22\x33\xb4\x04\x20\x5f\x46\
+\x01\x7f\x03\x5e\x92\xd2\x49\x4f\x02\x3e\x5d\xfc\x57\x26\x80\x5f\
+\x61\x9f\x93\x09\x30\x78\xbf\x45\xd8\xd2\x80\x7f\x60\x35\xcf\x85\
+\x10\x42\x08\xef\x13\xf9\x67\x62\x49\xfe\x36\x0a\x28\xba\x25\xfe\
+\xc3\x6c\x37\x0f\xf8\x02\xf0\x68\x7a\x4d\xeb\x14\xe0\x04\x92\xcb\
+\x55\x28\x64\x00\x88\x75\xb1\xca\x00\xfb\xa5\x74\xd2\x5b\x01\x9f\
+\x2a\x4e\x5e\x26\x80\x6f\xa1\x9e\xab\x11\xb0\x18\x38\xbb\x30\x02\
+\xe6\xa8\x1f\x11\x42\x08\xe1\x90\x9d\x81\x37\x01\xbb\x06\x16\xdd\
+\x12\xff\x61\xb6\x7b\x02\xf8\x12\x30\x33\xbd\xa6\x75\x3d\x56\x34\
+\x42\x85\x93\x64\x00\x88\x44\xd9\x12\xb8\xba\xd0\xd5\xc9\xb0\x2d\
+\xf0\xf1\x11\x4c\x80\x26\x93\xee\x29\xe1\x9f\x7f\x13\x20\xc4\x7e\
+\xcb\xb1\xac\x37\x27\x63\x89\x35\x84\x10\x42\x88\xa6\xd9\x18\x78\
+\x0d\x9d\xcb\xfa\xd5\x21\xd0\x9b\x16\xf4\x4d\x8a\xff\x91\xb6\x5d\
+\x84\xc5\xcf\xdf\x93\x5e\xf3\x9a\x89\x55\xe8\xd6\xb4\x47\x06\x80\
+\x48\x9c\xa7\x63\x91\x00\xeb\xa4\x66\x02\x7c\x62\x84\x93\x6e\xb3\
+\x09\x10\x53\xd8\xe7\xf4\x64\x3f\x84\x79\xd0\x8f\xe5\xa8\xf8\x2b\
+\x96\xc5\x57\x08\x21\x84\xa8\x9b\x75\xb1\x75\x9d\x2f\xa0\xfb\x52\
+\x4f\x1e\x9e\xe4\xb7\x51\xfc\x7f\x1d\xb8\x3b\xbd\x26\xf6\x24\x56\
+\x4d\xec\x5a\xdd\x6d\x32\x00\x44\x1e\xbc\x0c\x38\x09\xcb\x0d\x90\
+\x0c\x3b\x61\x25\x02\xc7\xb7\xc8\x04\x48\x59\xd8\xe7\x1c\x0d\x30\
+\xc0\x34\x6c\x61\x9c\x46\x47\x21\x84\x10\x75\xb0\x16\x96\xac\xf6\
+\xa5\x74\xff\x24\x27\xe7\x90\x7f\xcf\xe2\x7f\x09\xf0\x4d\xe0\xf6\
+\xf4\x9a\xd9\x4a\x2c\x8f\xe4\xdf\x75\xc7\xe5\x8f\xaa\x00\xb4\x87\
+\x5b\xb1\x88\xe6\xe7\xa4\x74\xd2\x73\x8b\x4e\xf4\x20\x60\x8c\x4c\
+\x80\x2c\x4d\x80\xd4\x8c\x80\x4d\xb0\xb0\xcb\x03\xb0\x44\x81\x33\
+\x4a\x4c\xb4\x84\x10\x42\x88\x91\x18\x05\x1c\x05\x7c\x04\x38\xb8\
+\x30\x02\x24\xfe\xfd\x8a\xff\xa5\xc0\xb7\xd2\x14\xff\x00\x1f\x05\
+\x4e\xd4\x5d\x27\x03\x40\xe4\xc7\xa5\xc0\x64\x60\xff\x94\x4e\x7a\
+\x0e\x16\x76\x2d\x13\xa0\x39\xa1\x5e\x87\x40\x4f\xc1\x04\x18\xbc\
+\xef\x24\x2c\xf3\xf2\x51\xc5\xdf\xee\xc7\x1c\x36\x21\x84\x10\xa2\
+\x2a\xfb\x03\x1f\x06\x8e\xc6\xca\xd4\x36\x2d\xba\x25\xfe\x47\x16\
+\xff\xdf\xc6\x9e\xb6\x25\xc8\xaf\xb0\x80\x5b\xd1\x12\xb4\x04\xa0\
+\x7d\xac\x05\x9c\x09\x3c\x3b\xb5\x13\xdf\x1b\xab\x6f\xeb\xd5\x04\
+\x48\xcd\x30\xf0\xb8\x7d\x8a\x46\xc0\x00\x4f\x02\xe7\x01\xff\x04\
+\x66\xab\x9f\x11\x42\x08\x51\x82\xdd\x80\xd7\x02\x7b\x44\x14\xe7\
+\x29\x8a\x7f\xcf\xc7\x5c\x06\x7c\x07\xb8\x25\xcd\x26\x77\x0e\xf0\
+\xc2\xe2\x6b\x08\x19\x00\x22\x63\xd6\x07\x2e\x06\x9e\x96\xda\x89\
+\xef\x03\x7c\x40\x26\x40\x52\xa6\x41\x5d\x9f\xe1\xc5\x08\x18\x48\
+\x18\x78\x32\x70\x9b\xfa\x1a\x21\x84\x10\x5d\x0a\xff\x57\x03\x7b\
+\x95\xd8\xd7\x8b\x98\x6f\xa3\xf8\x5f\x0e\xfc\x00\xb8\x31\xcd\x66\
+\xf7\x6f\xe0\x70\x60\xbe\xee\x40\x19\x00\xa2\x1d\x4c\x06\xae\x00\
+\xb6\x49\xed\xc4\x0f\x00\xfe\x8b\x91\xd7\xaf\x68\xad\xbf\x2f\x91\
+\xee\x3d\x1a\x20\xc6\xbe\xb7\x62\x11\x01\x57\x61\xd9\x75\x84\x10\
+\x42\x88\xc1\xec\x8a\x95\xf4\xdb\x1b\x5f\x4f\xf1\x63\x1a\x05\xb9\
+\x2c\x0f\x58\x51\x88\xff\x1b\xd2\x6c\x7a\xf7\x02\x87\x02\xb3\x74\
+\x17\xca\x00\x10\xed\x62\x0f\x2c\x2f\xc0\x46\xa9\x9d\xf8\xd3\x80\
+\xf7\xd1\x39\x12\x40\x26\x40\xbb\x45\x7d\x13\xd1\x00\xc3\xed\x3f\
+\x17\x38\x1b\xf8\x17\xf0\xb8\xfa\x1d\x21\x84\x68\x3d\xdb\x02\xaf\
+\x28\x14\x58\x99\x44\xb2\x12\xff\xcd\x8a\xff\xe5\xc0\xff\x62\x11\
+\x7f\x09\x32\x07\x4b\x63\xa4\x40\x45\x19\x00\xa2\xa5\x1c\x8e\xad\
+\xff\x19\x9f\xda\x89\xef\x5b\x98\x00\x63\x03\x35\x72\x25\xfc\xcb\
+\xcf\x04\x68\xca\x08\x18\x6e\xdf\xa5\xc0\x25\x85\x11\x30\x5d\x7d\
+\x8f\x10\x42\xb4\x8e\x9d\x80\x13\xb0\x68\xc6\x32\xc2\xdc\x93\x98\
+\x6f\xb3\xf8\xff\x21\xc9\x3e\xf9\x7f\x12\x38\x16\xb8\x4c\x77\xa3\
+\x0c\x00\xd1\x6e\x8e\xc7\x4a\x9b\x27\x57\x15\x62\x6f\xe0\xfd\x8c\
+\x5c\x1a\x47\x26\x80\xa2\x01\x9a\xea\x24\x87\xdb\x7f\x3a\x16\x15\
+\x70\x61\x61\x0c\x08\x21\x84\xc8\x97\xdd\x80\x97\x62\xd9\xfd\xfb\
+\x48\xff\xa9\x7f\x5b\xc5\xff\x52\xe0\xbb\x24\x9b\xf0\x6f\x25\xe6\
+\x3f\x9d\xa2\x3b\xb2\xdd\xa8\x0c\xa0\x00\x2b\x59\xfa\x08\xf0\x82\
+\xd4\x4e\x7c\x36\x56\x22\xf0\x19\xd4\xbf\x1c\xc0\x83\x61\x90\xba\
+\x69\x50\xb7\xa0\xf7\x64\x04\x6c\x04\x1c\x88\xd9\xf0\xeb\x03\x33\
+\x80\x45\xea\x8b\x84\x10\x22\x2b\xf6\xc1\xa2\x15\x5f\x09\x6c\x99\
+\x89\xf8\x6f\x6b\x62\xc0\xa5\x58\xb6\xff\xa9\xe9\x36\xc7\xf7\x03\
+\xbf\xd6\x5d\x29\x64\x00\x88\x01\xae\x03\xd6\xc3\x96\xa3\x25\xc5\
+\xa3\x98\x83\x71\x90\x73\x13\x20\xc5\x6d\xbd\x8b\xfa\x1c\x8c\x80\
+\xf1\x58\x32\x8e\x17\x02\xdb\x01\x0b\x81\x87\xd5\x1f\x09\x21\x44\
+\xb2\x8c\x02\x0e\x2b\xd4\xd6\x8b\x81\x8d\x4b\x0a\xe7\xba\xf6\xe9\
+\xd7\xb6\x23\x6e\xb7\xa4\x10\xff\xd3\xd2\x6d\x96\x5f\x03\xbe\xa2\
+\xbb\x53\x84\x98\xcb\x8a\xfc\xda\xc3\x6f\x80\x37\xa4\x78\xf2\xdb\
+\x03\x1f\x03\xd6\x91\x09\x90\xe4\xf6\x4d\x08\x7a\x8f\x4b\x03\xc0\
+\xb2\xf3\x5c\x04\x9c\x51\xfc\x5b\x08\x21\x84\x7f\xc6\x14\xc2\xff\
+\x15\xd8\xd3\x7e\xcf\x42\x5e\x46\x41\xf7\xdb\x2d\x02\xbe\x09\xdc\
+\x95\x6e\xd3\xfc\x33\xf0\xda\x92\xcd\x50\xc8\x00\x10\x2d\x60\x5c\
+\xa1\x3b\x9e\x93\xe2\xc9\xef\x08\x7c\x44\x26\x40\xf2\xa2\x3e\xf5\
+\xf2\x7f\xa1\xf6\x5f\x0e\x5c\x8d\xe5\x0a\xb8\x59\x23\xb7\x10\x42\
+\xb8\x64\x5d\xe0\x18\xe0\x38\x9e\x5a\x56\x29\x87\xa7\xfe\x6d\x16\
+\xff\x0b\x80\x6f\x00\xf7\xa4\xdb\x3c\xcf\x01\x5e\x84\xd2\x0d\x09\
+\x19\x00\xa2\x8b\xb1\xec\x3c\x2c\xaa\x3e\x39\xb6\xc3\x22\x01\xd6\
+\x6d\xa9\x09\x90\xc3\xf6\x55\x3a\x27\x4f\xe5\xff\x42\xee\xaf\xa8\
+\x00\x21\x84\xf0\xc5\x66\x58\xf2\xa4\xa3\xb1\xa7\x27\xb9\x09\xf9\
+\xdc\x8d\x82\x91\xb6\x7b\x02\xf8\x3a\x70\x5f\xba\x4d\xf4\x4a\xcc\
+\x9b\x5a\xa8\xbb\x55\xc8\x00\x10\xdd\xb0\x01\x96\xa0\xfc\x69\x29\
+\x9e\xfc\x96\x85\x09\xb0\x51\x03\x22\x5c\x09\xff\x64\x04\xc4\xdc\
+\x7f\x39\x96\xb0\xe3\x3c\xac\x04\xd1\x0a\xf5\x55\x42\x08\x51\x2b\
+\x7b\x62\x79\x5b\x0e\x1c\xa6\xcf\xd6\x53\x7f\x9f\x82\xbe\x97\x6d\
+\x1f\xc3\x9e\xfc\x3f\x90\x6e\x33\xfd\x37\xf0\x2c\x60\xae\xee\x58\
+\x21\x03\x40\xf4\xaa\xa3\x2f\xc3\x96\xd7\x27\xc7\xc6\x85\x09\xb0\
+\xb9\x4c\x00\x57\x02\xbd\x4e\x61\xee\x35\xb4\x3f\xd4\x31\x16\x00\
+\x97\x03\x67\x01\x77\xab\xbf\x12\x42\x88\x68\x8c\xc6\xc2\x22\x5f\
+\x04\xec\x12\x50\xc4\xd7\x21\xe4\x25\xfe\x7b\xdb\xf6\x11\x2c\x63\
+\xde\xec\x74\x9b\xeb\x74\xe0\x70\x60\x96\xee\x5c\x21\x03\x40\x94\
+\x61\x47\xe0\x52\x60\x8b\x14\x4f\x7e\x22\xf0\x51\x60\x9b\x86\x44\
+\xb5\x96\x04\xf8\x10\xf4\xb9\x1b\x01\x60\xc9\x89\xce\x07\x2e\x29\
+\x8c\x01\x21\x84\x10\xd5\xd9\x00\x4b\x8a\xf4\x3c\x3a\x47\x15\xb6\
+\xf1\xa9\x7f\x4c\xa3\xa0\xa9\x6d\x67\x60\x61\xff\xf3\xd2\x6d\xb2\
+\x33\x81\x67\x92\x74\xda\x02\x21\x03\x40\x78\x60\x2f\xe0\x62\x46\
+\x8e\xa8\x77\xc9\xda\xc0\x87\x81\x9d\x65\x02\x64\x61\x02\xc8\x08\
+\xe8\xcc\x32\x2c\x71\xe0\x05\xc0\x8d\xc0\x4a\xf5\x5f\x42\x08\xd1\
+\x33\xbb\x17\xa2\xff\x60\x3a\x97\x18\xae\xeb\xa9\xbf\xc4\x7f\xfc\
+\x6d\xa7\x03\xdf\x22\x69\x13\xfd\x31\x2c\xec\x7f\x8a\xee\x60\x21\
+\x03\x40\x84\xe0\x20\x6c\xd9\xf1\xba\x29\x9e\xfc\x38\xe0\x7d\xc0\
+\xde\x2d\x17\xf6\xca\xfa\x9f\x87\x11\xd0\xed\x71\x06\x96\x08\x5c\
+\x08\xdc\x86\xaa\x08\x08\x21\x44\x27\x26\x60\x8f\x4e\x9f\x87\x25\
+\x14\xf6\x20\xe2\x3d\x9a\x05\x39\x1a\x05\xd3\x80\xef\x02\x8b\xd3\
+\x6d\xbe\x8b\xb0\x84\x7f\x57\xe8\x4e\x16\x32\x00\x44\x48\x9e\x83\
+\x25\x21\x1f\x97\xe2\xc9\x8f\x01\xde\x05\x3c\xa3\xe5\x26\x80\xc7\
+\xed\x65\x04\xc4\x3f\xce\x6c\x6c\x2d\xcf\xf9\x58\x88\xa3\x10\x42\
+\x08\x63\x4b\xe0\xd9\x85\x7a\xea\xe6\x29\x47\x5d\x22\x3e\xb6\xd8\
+\xf6\xb6\x7d\x53\xdb\x5e\x0f\xfc\x08\x4b\xb2\x9b\x28\x4b\x81\xe3\
+\xb1\xaa\xc1\x42\xc8\x00\x10\xc1\x79\x09\x70\x12\x9d\x23\xe2\xdc\
+\x32\x0a\x78\x13\x70\x54\xc0\x9b\x43\x59\xff\x7d\x08\xfa\x5c\xb3\
+\xfe\xc7\x38\xd6\x9d\xd8\x9a\x9e\xcb\x48\x7a\x9d\xa3\x10\x42\x94\
+\x66\x1c\x16\xde\x7f\x0c\x16\xee\xef\x49\xc4\xd7\xb5\x8f\x12\x03\
+\x9a\x31\xfe\x4b\x92\xae\xa8\xb3\x02\x78\x4d\x31\x37\x17\x42\x06\
+\x80\x88\xc6\x9b\x81\x5f\x14\x7a\x3a\xc9\x46\xff\x6a\xe0\xb8\x06\
+\x05\x78\xaa\xa6\x41\x5d\xc6\x41\x1b\x8d\x80\x90\x1d\x72\xb7\xc7\
+\x59\x89\x2d\x14\xbc\x0c\xb8\x0a\x25\x0f\x14\x42\xe4\xcf\x2e\xd8\
+\xd3\xfe\xc3\xb0\x1c\x41\xde\x84\x7f\x1d\x42\x3e\x45\x31\x1f\x63\
+\xdb\xd3\x81\xbf\x92\xf4\xf2\xb8\x95\xc5\x9c\xfc\xb7\xba\xb3\x85\
+\x0c\x00\x51\x07\x6f\x29\x4c\x80\x64\xdb\xd0\xb1\xc0\xeb\xbb\xf8\
+\x02\x5a\x12\xd0\x8c\x71\xd0\x94\x98\xcf\xc9\x08\xe8\xd5\x0c\xb8\
+\x0d\xcb\x19\x70\x29\x30\x5f\x7d\x9c\x10\x22\x13\xd6\x05\x0e\xa1\
+\xfb\xb5\xfd\x4d\x89\x7f\x25\x06\xac\x67\xdb\x7e\xe0\x2f\xd8\x9a\
+\xd6\x84\xe9\x07\xde\x0d\xfc\x44\x77\xb8\x90\x01\x20\xea\xe4\x6d\
+\xc0\x4f\x53\x6e\x47\x07\x60\x79\x01\xd6\x92\x09\x90\x65\xc2\x3f\
+\x19\x01\xe5\x8e\x35\x60\x06\xfc\x16\xb8\x55\xfd\x9c\x10\x22\x41\
+\x46\x61\x25\x8c\x8e\xc1\xb2\x18\x8f\x6e\xb9\xf0\x97\xf8\x37\x96\
+\x17\x13\xd7\xab\xd2\x17\xff\xff\x0d\xfc\xaf\xee\x74\x51\x86\xd1\
+\xba\x04\xa2\x02\x37\x60\x0f\x0a\x9f\x97\xea\x17\x98\x89\x65\x7e\
+\xdd\x9f\x91\x33\x1b\xea\xe9\x7e\xba\x82\xbe\x4d\xc9\xfe\x42\x1c\
+\xab\x0f\xd8\xa4\xb8\xb9\x55\x4b\x48\x08\x91\x12\xbb\x00\x2f\x06\
+\xfe\x0b\x78\x2e\xb0\x35\xbd\xad\x57\xf4\x1e\xee\xef\x4d\xc8\xa7\
+\x64\x14\x2c\x04\xbe\x0d\xdc\x94\x7e\x33\xff\x38\xf0\x3d\xdd\xed\
+\x42\x06\x80\x68\x8a\xab\x80\x27\x8a\x71\x36\x49\xe6\x16\x83\xc1\
+\x7e\x8c\xbc\x1e\x50\x09\xff\xd2\xdc\x47\x46\x40\xb9\xe3\xdd\x2a\
+\x03\x40\x08\x91\x00\x5b\x01\xcf\x07\xde\x09\xbc\xb4\x30\x01\xc6\
+\xd7\x24\xe0\xeb\x12\xf1\x39\x98\x05\x4d\x1e\xfb\x51\xe0\xab\xc0\
+\x3d\xe9\x37\xf7\x4f\x02\x5f\xd7\x5d\x2f\x64\x00\x88\xa6\xb9\xb2\
+\xf8\xef\xb3\x52\xfd\x02\x4f\x60\x4e\xc6\x9e\xc0\x06\x89\x08\x7b\
+\x8f\xa2\xbe\x0d\xe1\xfd\xb9\x1a\x01\x43\x1d\x53\x06\x80\x10\xc2\
+\x2b\x1b\x61\xc9\xfc\xde\x04\xbc\xa1\x18\xbf\xd7\xab\x49\x54\x57\
+\xdd\xd7\xa3\x90\xf7\x24\xfe\x43\x9f\xc7\x03\xc0\xd7\xb0\x72\xb8\
+\x89\xf3\x69\xe0\x2b\xba\xfb\x85\x0c\x00\xe1\x85\x8b\xb1\xd2\x80\
+\x47\xa4\xfa\x05\x16\x03\x57\x60\x09\x82\x36\xcb\x58\xd8\x2b\xe1\
+\x9f\x1f\x21\xef\xdd\x0c\x90\x01\x20\x84\xf0\xc4\xfa\xc0\x91\x85\
+\xe8\x7f\x2b\x16\xb9\xb7\x71\x22\x02\xbe\x2e\x51\x5e\x87\x59\x90\
+\x92\x51\x30\x15\xf8\x26\xf0\x78\xfa\xcd\xff\x0b\xc5\x4b\x08\x19\
+\x00\xc2\x15\x17\x62\x4b\xe9\x0f\x4f\xf5\x0b\x2c\x07\xae\x01\x36\
+\xc5\xd6\x0d\xca\x04\xc8\x5f\xd0\xcb\x08\x18\x1e\x19\x00\x42\x08\
+\x0f\xa2\xff\x60\xe0\xb5\x58\x88\xff\x33\xb0\x1c\x25\x55\xe8\xcf\
+\x78\x3f\x89\xff\x55\x5c\x0e\xfc\x10\x58\x9a\xfe\x6d\xf0\x5d\xe0\
+\x13\xea\x0d\x44\x28\xc6\xe8\x12\x88\xc0\x7c\x12\x98\x00\xbc\x3f\
+\x65\x13\xe0\x27\xc0\x1c\xe0\x45\x5d\x0c\x40\xdd\x8a\xae\x5e\xb7\
+\x25\xd2\xb1\xcb\x6e\x4f\x0d\xfb\x94\x39\xb7\x10\xfb\x55\x11\xcf\
+\x55\xf7\x0f\x75\x8c\x35\x27\x44\x2a\xf1\x22\x84\x48\x95\x4d\x0a\
+\xa1\x7f\x28\xb0\xdb\xa0\xfe\xac\x9f\x66\x42\xf6\xbd\x8b\x78\x8f\
+\x66\x41\x93\xc7\xee\x07\xfe\x09\xfc\xad\xe2\x6f\xee\x84\xef\x01\
+\x1f\x54\xaf\x20\x64\x00\x08\xef\x0c\x74\x54\xc9\x9a\x00\xfd\xc0\
+\x5f\x81\x59\xc0\x5b\x46\xb8\x51\x62\x99\x00\x75\x98\x06\x10\xd7\
+\x38\xa8\xb2\x0f\x35\xee\xe7\xcd\x08\x90\x19\x20\x84\x68\x1b\x5b\
+\x63\x4f\xfa\x0f\x06\xb6\x0f\x28\xdc\x53\x12\xfe\x1e\x85\xbc\xb7\
+\xed\xbb\x29\xf3\xf7\x0b\xec\xe9\x7f\x06\x48\xfc\x0b\x19\x00\x22\
+\x29\xfd\xfc\x01\x60\x01\xf0\x3f\x29\x7f\x91\x4b\x81\x87\x31\x27\
+\x63\xbd\x06\x85\x7a\xec\xa7\xfb\x9e\xa3\x01\xda\x68\x04\x84\x3c\
+\x8e\xcc\x00\x21\x84\x47\x46\x03\x3b\x03\x07\x16\xaf\xad\x02\x0b\
+\x77\x09\xff\xf4\xc5\x7c\xaf\xdb\x2f\x00\xbe\x0f\xdc\x96\xc7\x2d\
+\xf2\x4d\xe0\xa3\xea\x29\x44\xac\xfe\x57\x88\x58\x5c\x58\xe8\x8d\
+\x67\xa5\xfc\x25\xe6\x00\xd7\x02\x7b\xd3\x5d\x86\xe1\x54\x4b\x05\
+\xc6\x3e\x9f\xba\xcf\xcd\xc3\xbe\x21\x05\x77\x9d\xe5\xff\x06\x50\
+\x0e\x00\x21\x44\x48\x06\xd6\xf3\x9f\x00\xbc\x0b\x78\x1e\xb0\x7b\
+\xf1\xf7\xd4\x85\x7f\x9d\x22\xbe\x0e\x21\xdf\xb4\x98\xef\x75\xdb\
+\x87\xb0\x32\x7f\xf7\xe6\x71\xab\x7c\x1d\xf8\x98\x7a\x0c\x11\x0b\
+\x45\x00\x88\xd8\x7c\x0e\x78\x12\xab\xc0\x92\x2c\xb3\xb1\xd4\xab\
+\xef\x05\xf6\xe8\x62\xa0\x4a\x71\x49\x40\xd9\xf3\x29\x23\x4e\xeb\
+\x5c\x16\xd0\xe4\xbe\x6b\x4e\x5c\xbc\x2c\x0f\x88\x71\x3c\x21\x84\
+\x58\x93\x3e\x60\x47\xe0\x00\x60\x7f\x60\x87\x0e\xfd\x4d\x88\xb5\
+\xda\xca\x0f\xd0\x8c\x59\xd0\xb4\xf8\x9f\x0a\xfc\x00\x58\x94\xcf\
+\xbc\xf9\xf3\xea\x3d\x84\x0c\x00\x91\x3a\x5f\x07\x56\x02\xdf\x48\
+\xf9\x4b\x2c\x2c\xbe\xc0\xeb\x81\xa3\x1b\x14\xea\x5e\x43\xfc\x53\
+\x09\xef\xcf\x29\xd9\x5f\x28\xe1\x2e\x33\x40\x08\x11\x8a\xcd\x80\
+\x7d\x81\x7d\xe8\x2e\x72\xae\x69\xe1\x5f\xb7\x80\xaf\x73\xbf\x36\
+\x24\x06\xbc\x08\xf8\x35\xb0\x22\x8f\xdb\xe7\xd3\xc0\x97\xd4\x8b\
+\x08\x19\x00\x22\x17\xbe\x59\x68\xe8\x1f\xa5\xac\x31\x56\x00\xbf\
+\xc1\x92\x03\xbe\x7e\x84\x2f\xd2\xb6\x84\x7f\x4d\x64\xfd\xaf\xdb\
+\x40\xf0\x6a\x04\xc4\x32\x03\x84\x10\x62\x24\xd6\x07\xf6\x2a\x04\
+\xff\xbe\x85\x01\x50\x57\x5f\x93\x9a\xf0\xaf\x4b\x94\xd7\x61\x16\
+\x34\xbd\xfd\x4a\xe0\x24\xe0\xf4\x3c\x6e\xa3\x7e\x2c\xd9\xdf\xf7\
+\xd4\xa3\x08\x19\x00\x22\x37\xfe\x0f\x18\x85\x45\x6a\x25\xfd\xa0\
+\xf1\x1c\xe0\x51\x6c\x0d\xe3\xf8\xc0\x42\xbd\x8d\x09\xff\x9a\x78\
+\xaa\xaf\xac\xff\x32\x03\x84\x10\xbd\xb3\x36\xb6\x6e\x7f\xcf\x42\
+\xf0\x6f\x47\xef\x66\x74\xaa\xc2\xbf\x6e\xd3\x40\x89\x01\x87\x66\
+\x71\x31\xa1\xbc\x31\x1f\xf1\xff\x5f\xc5\x57\x12\xa2\x16\x14\xed\
+\x29\x9a\xe0\x6d\xc0\x4f\x0a\x33\x20\x69\xb6\xc0\x2a\x04\x6c\x19\
+\xf8\x66\x8b\x9d\x8c\xaf\xae\x24\x7c\x75\x26\x09\xac\xda\xa1\xe5\
+\x98\xec\xaf\xea\xb1\x4e\x01\x7e\xa7\xfe\x4a\x88\x56\xb3\x01\xb0\
+\x53\x21\xfa\x77\x03\x76\xa1\xf7\x0c\xd2\x12\xfe\x12\xff\xa1\xb6\
+\x7d\x18\xf8\x2e\x30\x43\xe2\x5f\x88\xd2\x28\x02\x40\x34\xc1\xcf\
+\xb1\x52\xad\x3f\x27\xf1\x4a\x14\xb3\x80\x2f\x02\xef\xc6\xd6\x3a\
+\x8e\xd4\xcb\x7b\x09\xf1\xf7\xfe\x64\x3f\xe5\xf2\x7f\x55\x85\xb7\
+\xca\xff\x09\x21\x9a\x64\xf3\x42\xec\xef\x51\xfc\x77\xcb\x0a\xc7\
+\xf2\x10\xe6\x2f\xe1\xef\x5f\xf8\x77\xbb\xfd\x94\x42\x29\x67\x92\
+\xec\x6f\x05\xf0\x16\xe0\xb7\xea\x75\x84\x0c\x00\xd1\x16\x7e\x05\
+\xcc\x05\xfe\x4c\xe7\x28\x7a\xf7\x2c\x00\xbe\x85\x95\x35\x7a\x01\
+\xcd\xe5\x05\xa8\x63\xfb\x3a\xf7\xa9\xba\x5f\x53\x46\x40\xe8\x63\
+\xc8\x0c\x10\x42\xc4\x62\x02\xb0\x2d\x96\xa9\x7f\xc7\x42\xf4\x6f\
+\xea\x40\xb0\xa7\x2c\xfc\x25\xfe\xc3\x6f\xdf\x0f\x9c\x81\xad\xf9\
+\x5f\x99\xc7\xad\xb7\x14\x78\x1d\x70\xb2\x7a\x21\x21\x03\x40\xb4\
+\x8d\x7f\x00\xc7\x15\xff\x5d\x2f\xe5\x2f\xb2\x12\xf8\x0b\x70\x1f\
+\xf0\x9f\xc0\xb8\x80\xe2\xb0\xed\xeb\xfc\x53\x2d\xff\x17\xea\x18\
+\x21\x8f\x23\x33\x40\x88\xf6\x32\x1a\xd8\x1e\xd8\x19\x0b\xe9\xdf\
+\x19\x98\x8c\xbf\x9c\x21\x12\xfe\xed\x31\x0b\xba\xd9\x76\x09\xf0\
+\x33\xe0\x9a\x7c\x6e\xc5\x85\xc0\xcb\xb0\x74\x52\x42\xc8\x00\x10\
+\xad\xe4\x42\xe0\x39\xc0\x99\xc0\xa4\xd4\xbf\xcc\x55\xc0\x4c\x2c\
+\x2f\xc0\x26\x01\x85\xba\xc7\xac\xff\x55\xf6\x91\x11\xe0\x47\xb8\
+\xcb\x0c\x10\x22\xcf\xc9\xdd\x0e\x85\xe0\x1f\x78\x6d\x07\x8c\x0d\
+\xfc\x39\xfd\xce\x8e\xd5\x06\xe1\xef\x51\xc8\xc7\xda\x7e\x0e\xf0\
+\x7d\xe0\x9e\x7c\x6e\xcd\x79\x58\xb0\xe8\x95\xea\xa5\x44\x93\x68\
+\xbe\x27\xbc\xb0\x07\xe6\x86\x4e\xce\xe1\xcb\xac\x8b\x65\x75\xd9\
+\x33\xc2\x4d\x98\x53\xc2\xbf\x26\x92\xf6\xe5\x96\xec\x2f\x56\x27\
+\xde\x87\x92\x00\x0a\x91\x2a\xaf\x07\x5e\x4e\xbc\x4a\x1e\xfd\x99\
+\x1d\x47\xe5\x00\xfd\x89\xff\xdb\x80\x1f\x02\x8f\xe7\x73\x5b\x3e\
+\x04\x3c\x17\xb8\x59\x3d\x94\x68\x9a\x51\xba\x04\xc2\x09\xd3\x80\
+\x23\xc9\xc4\xe8\x5d\x00\x7c\x93\xee\xe2\xbb\xfa\x09\x1f\x32\x57\
+\xe5\xf8\x75\x4f\x32\x9a\x78\x72\x52\x75\xd2\x16\xea\x49\x55\xc8\
+\xe3\x84\x9e\xe8\xab\x04\xa0\x10\xe9\xd2\x17\xa9\x4f\xf0\xda\xff\
+\x35\xb1\x7f\xdd\x63\x50\x5d\x42\x3e\x76\xc8\x7f\x37\xdb\x9f\x09\
+\x7c\x2d\x2f\xf1\x3f\x1d\x38\x54\xe2\x5f\xc8\x00\x10\x22\xf3\x0e\
+\x72\x05\xf6\xf4\xf4\xc7\x58\xcd\xda\x26\x06\xd1\x26\x26\x02\x75\
+\x1a\x01\x55\x27\x6f\x21\x26\x8e\x21\x9e\x3c\x85\x7c\x0a\x16\xc3\
+\x0c\x10\x42\xb4\x93\xd0\x7d\x4a\xc8\x3e\xb3\x49\xe1\xef\x7d\x9c\
+\xf3\x38\x47\xe8\x66\xdb\xc5\xc0\xff\x02\x7f\x2c\xe6\x50\x99\x90\
+\xd5\x03\x2e\x21\x03\x40\x88\x18\x3c\x04\x3c\x0b\xb8\x22\x97\x2f\
+\x74\x05\xf0\x19\xe0\xc1\x48\x03\xb0\xb7\x49\x41\xd5\x89\x4e\x2a\
+\x93\x39\x8f\x93\x5a\x99\x01\x42\x08\xaf\xa2\xdf\x53\x3f\xdb\xc4\
+\xbe\x5e\xc7\xd1\xba\xcc\x82\x91\x98\x09\x7c\x0e\xcb\xa5\x94\x11\
+\xd7\x02\x47\x00\x33\xd4\xb3\x08\x19\x00\x42\x74\x66\x1e\x70\x2c\
+\x19\x65\x48\x9d\x05\x7c\x9e\xee\xb2\xbe\x94\x71\xd5\x3d\x1a\x07\
+\x75\x4f\x7a\x72\x31\x02\x42\x1e\x27\xd6\xf1\x84\x10\xf9\x0a\x7f\
+\x6f\xc7\x4b\x5d\xf8\x7b\x1e\x3b\xeb\x78\xea\xdf\xcd\xf6\x03\x0f\
+\x4a\x32\x53\xc9\x17\x60\x49\xae\xe7\xa8\x77\x11\x32\x00\x84\xe8\
+\x8e\x85\xc0\x8b\xb0\x48\xb0\x2c\x58\x0c\xfc\x1f\x70\x22\xb0\x3c\
+\xd2\xc0\xec\x6d\xb2\x50\x75\x02\x24\x23\x40\x51\x01\x42\x88\xf8\
+\xa2\xdf\x63\x1f\xd3\x56\xe1\xdf\xa6\xa7\xfe\xcb\x59\xb5\x54\x72\
+\x49\x5e\xb7\xd6\xc9\x58\xb6\xff\x27\xd4\xcb\x08\x8f\x8c\xd6\x25\
+\x10\x8e\x59\x01\x9c\x5a\xfc\xfb\x59\xb9\x7c\xa9\x7b\x81\x29\xc0\
+\xde\xc0\x3a\x5d\x6c\x9f\x53\xd6\xff\x26\xf6\x6b\x72\x5f\xcf\xc7\
+\xe9\xe6\x98\xb7\xa1\x8c\x45\x42\xa4\xc8\xbe\xc0\xee\x81\x84\x5c\
+\x0c\x71\xe8\xf9\x38\x2a\x07\x58\x8f\xf8\x9f\x03\x7c\x0b\xb8\x2e\
+\xbf\xdb\xef\x07\xc0\x7f\x02\xcb\xd4\x13\x09\x19\x00\x42\x94\xe7\
+\x22\x6c\x59\xc0\x73\xc9\xa4\x74\xe5\x63\xc0\xe5\xc0\xd6\xc0\xe6\
+\x91\x84\x9f\xca\xff\x85\x17\xcf\x21\x1a\x5f\xc8\x06\x1c\xdb\x0c\
+\x90\x01\x20\x44\x1e\x06\x80\x67\xd1\x1f\xea\x58\xfd\x0d\xee\xaf\
+\x72\x80\xbd\x6d\x7f\x23\x56\x29\xe9\xe1\xbc\x6e\xbb\x15\xc0\x7b\
+\x81\x2f\xa0\x40\x3b\x21\x03\x40\x88\x20\x5c\x8d\x65\x52\x3d\x1e\
+\x18\x93\xc3\x17\x5a\x8a\xe5\x04\x58\x01\xec\xd6\xa5\x98\x53\x34\
+\x80\x0f\x21\xef\xcd\x08\x88\x65\x06\xc8\x00\x10\x22\x5d\x03\x60\
+\x37\xe7\xa2\x3f\x07\xe1\x5f\x65\xff\x36\x3e\xf5\x5f\x81\xc5\xc6\
+\xff\xb6\x98\x03\x65\xc4\x93\xc0\xab\x8b\xaf\x26\x84\x7b\xc6\xe8\
+\x12\x88\x84\x38\x19\x4b\xa6\x7f\x1a\xb0\x71\x0e\x5f\xa8\x1f\xf8\
+\x07\x30\x15\x78\x37\xb0\x49\x17\xdb\xf7\xf5\x78\x7c\x9c\xee\xd3\
+\xc4\x7e\x65\xaf\x63\xe8\xcf\x5f\x73\xb2\xd4\x17\xa8\x2d\x85\x36\
+\x02\xf4\x08\x43\x88\x74\xc7\x16\xaf\xc7\xf3\xb4\x5c\x40\xe1\xfe\
+\xf5\xed\x33\x07\x5b\xeb\x7f\x7b\x7e\xb7\xdb\x3c\xe0\xc5\xc0\xa5\
+\xea\x79\x44\x2a\x28\x09\xa0\x48\x8d\xab\xb0\x7a\xaa\xf7\xe5\xf4\
+\xa5\xee\x02\xfe\x07\x0b\x73\xe8\x66\xa0\xad\x2b\x79\x5f\x0a\x13\
+\x22\x65\xfd\x1f\xfa\x58\x12\xef\x42\x08\x4f\x7d\x89\x92\x03\xe6\
+\xf9\xd4\xbf\x9b\x7d\xae\x2f\xe6\x38\x19\x8a\xff\x7b\x81\x43\x25\
+\xfe\x85\x0c\x00\x21\xe2\x33\x0d\x38\x04\x5b\x46\x96\x0d\x8b\x80\
+\x1f\x01\x3f\xa1\xbb\xd0\xb8\xba\xb2\xfe\xd6\x59\x32\xb0\x49\x23\
+\xa0\xea\x93\x20\x65\xfd\x17\x42\x48\xf4\xc7\x3b\x5e\xa8\x7e\x3a\
+\xf7\xaa\x00\x75\xee\x33\x12\xcb\xb0\x2c\xff\xdf\x03\x16\xe4\x77\
+\xbb\xfc\x1b\x78\x26\xb6\x5a\x4e\x08\x19\x00\x42\xd4\xc0\x2c\xe0\
+\x08\xe0\xac\xdc\xbe\xd8\xe5\x58\x3d\xdc\x07\x1a\x1c\xb4\x43\xed\
+\x93\x92\x11\xe0\x61\x82\x19\xc3\x54\x90\x19\x20\x84\xa8\xbb\x6f\
+\xf0\x64\x8a\x36\xb9\xbf\xf7\x72\x80\x65\xf6\xe9\xf6\xdc\x66\x02\
+\x9f\x05\xce\xc9\xf3\xb6\x39\xbf\x10\xff\x33\xd4\x83\x08\x19\x00\
+\x42\xd4\xcb\x02\x6c\xdd\xd5\xaf\x73\xfb\x62\x33\x80\xcf\x03\x17\
+\x37\x3c\x80\x37\x35\x21\x49\xdd\x08\xf0\x36\x01\x96\x19\x20\x84\
+\x48\xa9\x5f\xf1\xd0\x07\xa7\xb4\x4c\xc0\xd3\x53\x7f\x80\x0b\x80\
+\x4f\xd3\xdd\x83\x8c\x04\xf9\x05\xf0\x7c\xe0\x71\xf5\x24\x22\x55\
+\x54\x05\x40\xa4\xce\x0a\x2c\x8f\xde\x63\xc0\xb1\x64\x52\x26\x70\
+\xe0\x8b\xdd\x50\x0c\xa0\x7b\x03\x6b\x75\xb9\x9f\xd7\x4a\x01\xa0\
+\xf2\x7f\xa1\x88\xd5\xc8\xd7\x3c\xae\xaa\x00\x08\x91\x26\xfb\xb0\
+\x7a\x19\xc0\xb2\xc2\x32\x96\x60\x8d\x79\xac\x36\x95\x03\xac\x62\
+\x18\xc4\xd8\x7e\x11\xf0\x33\xe0\xf4\x62\x0e\x93\x19\xfd\x58\x89\
+\xbf\x0f\x01\x2b\xd5\xcb\x88\x94\x51\x15\x00\x91\x0b\xdf\xc7\x2a\
+\x04\xfc\x16\x58\x3b\xa7\x2f\x76\x1d\x96\xf1\xf0\xdd\xc0\x4e\x5d\
+\x8e\x50\xb9\x65\xfd\x2f\xf3\xbd\x42\x7d\x6e\x88\xfd\xd7\x9c\x40\
+\x55\x15\xf0\xa1\x2b\x08\xc4\x3e\xae\x10\xa2\x39\xc5\xd2\x06\xd1\
+\xdf\xb4\xf0\xaf\x5b\xc0\xd7\x25\xfc\x7b\xd9\xe7\x0e\x2c\xcb\xff\
+\xa3\x79\xde\x4a\x0b\x81\xd7\x61\x0f\x9c\x84\x48\x1e\x2d\x01\x10\
+\x39\xf1\x37\x2c\x1b\x6b\x76\x51\x67\x8f\x00\x5f\x02\xfe\x02\x2c\
+\x77\x36\x31\x48\x25\x3f\x80\x87\xfd\x43\x1f\x67\xf0\xb1\x3c\x97\
+\xfd\x12\x42\xa4\x2f\xfe\x73\xad\x0a\xd0\xd4\xfe\xb9\xe4\x07\x58\
+\x01\x9c\x02\x7c\x39\x5f\xf1\x3f\x13\xab\x3e\x25\xf1\x2f\x64\x00\
+\x08\xe1\x94\x29\xc0\xc1\x58\xd5\x99\xac\x58\x81\x85\xd5\xc5\x4e\
+\x10\x98\x7b\xf9\xbf\x5c\x8d\x80\x98\x66\x80\x10\xa2\xbd\x26\x82\
+\xf7\x04\x81\x29\xee\x9f\x4b\x7e\x80\x19\xc0\xe7\x80\x53\xc9\x36\
+\x26\x3e\xdb\x39\xa5\x90\x01\x20\x44\x6e\x0c\xb8\xb5\x7f\xcf\xf1\
+\xcb\x3d\x80\x65\xd6\x3d\xbd\xcb\x01\x5a\x59\xff\xe3\xef\x1f\x2a\
+\x59\x95\xc7\x49\xb6\x10\xa2\xbd\xc2\xdf\x9b\x91\xa0\xaa\x00\xf5\
+\x8c\xe5\xdd\x6c\x73\x21\xf6\x40\xe2\xde\x7c\x6f\x83\x53\xc8\x34\
+\xaa\x54\x08\x25\x01\x14\xb9\xb2\x0c\xf8\x6b\xf1\xef\x67\xe5\xf6\
+\xe5\x56\x02\x53\xb1\x35\x77\x7b\x00\x13\xba\xdc\x2f\x85\x84\x7f\
+\x4a\xf6\x17\xe7\x58\x65\x8e\xa7\x24\x80\x42\xa4\xc9\x3e\xc0\x6e\
+\x35\x88\xc5\xba\x8e\xd7\xd6\xe4\x80\x1e\xf3\x03\xcc\xc1\x92\x2e\
+\x9d\x43\x96\x89\xfe\x06\xf8\x01\xf0\x56\x60\xa9\x7a\x13\x21\x03\
+\x40\x88\xf4\xb8\x08\x73\x6f\x8f\xcb\xb1\xbd\x3f\x02\x5c\x02\xac\
+\x0b\x6c\xef\x50\x98\x2b\xeb\xbf\x4f\x23\xa0\xdb\x63\xca\x00\x10\
+\x22\x6f\x03\x20\x46\x94\x90\x84\x7f\x73\xfb\xc6\x36\x0c\xae\x01\
+\xbe\x83\x85\xfe\x67\xca\x72\xe0\x3d\x58\xda\x25\x05\xd1\x89\x6c\
+\x51\x15\x00\xd1\x06\x4e\x04\xa6\x03\x27\x01\x9b\xe4\xf6\xe5\x16\
+\x15\x5f\x70\x1a\xf0\x26\x60\x9d\x2e\x07\xfa\x32\x19\xfc\xeb\xce\
+\xfa\xdf\xc4\xbe\x21\xf6\x5f\x73\x42\xe5\x31\xeb\x7f\x7f\x0d\x26\
+\x83\x10\xc2\x17\xaa\x0a\x90\xa7\xf0\x8f\x6d\x18\x2c\x00\x7e\x55\
+\x18\x00\x19\xf3\x30\x70\x02\x70\xa9\x7a\x0a\x91\x3b\xca\x01\x20\
+\xda\xc2\xc5\xc0\x01\xc0\x0d\xb9\x7e\xc1\xab\x80\x4f\x00\x37\xf5\
+\x30\xf0\xd7\x99\x24\xb0\xee\x10\xc8\xaa\x9f\x1b\x62\xff\xd0\xc7\
+\x09\x7d\xac\xa1\x8e\xab\x47\x1e\x42\xe4\x27\xfa\x63\xf7\x1b\x9e\
+\x8e\xe5\x21\x47\x40\x9d\x9f\x1b\x7b\x2c\xbf\xb1\x98\x5b\x64\x2e\
+\xfe\xaf\x2d\xe6\x88\x12\xff\x42\x06\x80\x10\x99\x71\x3f\x70\x18\
+\xf0\xeb\x5c\xbf\xe0\x3c\xe0\xdb\xc0\x0f\x81\x27\x22\x4e\x56\x54\
+\xfe\xcf\xcf\x64\x59\x66\x80\x10\x22\xe5\xfe\x41\xe5\x00\x7d\x26\
+\x06\x5c\x88\x45\x17\x7e\x07\x78\x2c\xef\xdb\xe5\x8f\x58\xae\xa8\
+\x07\xd5\x73\x08\x19\x00\x42\xe4\xc9\x62\xe0\xcd\xc0\x3b\xb0\x44\
+\x81\x59\x72\x0d\xbd\x39\xf6\x2a\xff\x57\xef\xc4\x37\xd6\x04\x5a\
+\x82\x5d\x08\x91\x82\xa1\xa0\xaa\x00\xf5\x8f\xa1\x65\x9e\xfa\x5f\
+\x98\x77\xb3\x5e\x0e\x7c\x1c\x78\x1d\xb6\x9a\x52\x88\xd6\xa0\x1c\
+\x00\xa2\xad\xfc\x0c\xb8\x1d\xab\x14\xb0\x69\x8e\x5f\x70\x3e\x16\
+\x09\xb0\x1f\xe6\x78\x6c\xd8\xe5\x04\xa1\xae\x75\xfe\xb9\xac\xf1\
+\x0f\xb5\xbe\x3f\xc6\xda\x7e\xad\xeb\x17\x42\x84\xe8\x4b\xbc\x1d\
+\x53\x55\x01\xe2\xec\xf7\x38\xf0\x1b\xb2\x0f\xf7\x07\x2b\x66\xf0\
+\x2a\xe0\x7c\xdd\xe9\xa2\x8d\x28\x02\x40\xb4\x99\x81\xbc\x00\xd7\
+\xe7\xfc\x25\x7b\x75\xf2\x53\x0a\xef\xf7\x10\xda\x1f\x3a\x7c\xd5\
+\x63\xed\x6d\x21\x44\x7b\x44\xbf\xe7\x7e\xc8\x43\x9f\xdd\xc4\x98\
+\x55\xc7\x7e\xd7\x60\x8f\xc3\x5b\x20\xfe\xa7\x00\x07\x4a\xfc\x0b\
+\x19\x00\x42\xb4\x97\x07\x80\x23\xb1\x0a\x01\xd9\x32\xb0\x96\xef\
+\x5b\xc0\xdc\x1e\x26\x0e\x65\x27\x38\xa9\x4c\xaa\x3c\x1a\x01\x32\
+\x03\x84\x10\x12\xfd\x12\xfe\x75\x8d\xc5\xf3\x81\xef\xd3\x5b\xee\
+\xa0\x84\xf9\x0b\x70\x28\x70\x8f\xee\x7c\xd1\x66\x46\xeb\x12\x08\
+\xc1\x32\xe0\x64\x60\x29\x96\x08\x26\x5b\x63\xec\x61\x2c\xc5\xed\
+\x44\x60\x1b\xba\x0f\x11\x2f\x1b\x4a\x5e\x25\x04\xbd\xa9\x7d\x43\
+\xec\x1f\xfa\x38\xa1\x8f\xd5\xed\x71\x6f\x03\xfe\xad\xfe\x41\x88\
+\xe4\xd8\x07\xd8\x2d\x82\xa8\x8c\x25\x56\x63\x1e\x4b\xe5\x00\x87\
+\xdf\xee\x62\xe0\xbb\xc0\x7d\xf9\xdf\x12\x2b\xb0\x00\x87\x0f\x92\
+\x71\xfe\x27\x21\x64\x00\x08\xd1\x3b\x97\x02\x97\x00\xcf\x03\xd6\
+\xcd\xf5\x4b\x2e\xc3\xd6\x3c\x4c\x03\x76\x04\xd6\xaf\x41\x84\x36\
+\x61\x20\xe4\x6a\x04\xd4\x69\x06\xc8\x00\x10\x22\x1f\x03\x20\x05\
+\xd1\x9f\x8b\xf0\xaf\x43\xc0\x57\xd9\xef\x21\xe0\x7f\x81\xb3\xdb\
+\xa1\x86\x1f\x01\x5e\x06\xfc\x4e\x3d\x83\x10\x86\x96\x00\x08\xb1\
+\x3a\x17\x61\x79\x01\x2e\xcf\xfd\x8b\xde\x0e\x7c\x0a\x8b\x87\xeb\
+\x76\x02\x90\xca\xba\xc7\xd0\xfb\xb7\x25\xeb\x7f\x3f\x5a\x2a\x20\
+\x44\x2e\xc4\xbc\x9f\x55\x15\xc0\xd7\x78\xd7\xed\x7e\xcb\x80\x53\
+\xb0\xbc\x40\x53\xdb\x71\x1b\x5c\x0a\x3c\x0d\x38\x57\x3d\x82\x10\
+\xab\x50\x04\x80\x10\x4f\xe5\x09\xe0\xb7\xc0\x38\xe0\x30\x32\x4e\
+\xa6\xde\x0f\xdc\x01\x5c\x09\x4c\xa6\xb7\x72\x08\xa9\x2d\x0b\x20\
+\xd0\x0f\xe9\x35\x2a\x20\xc6\x31\x6f\x47\x11\x00\x42\xa4\xc8\x48\
+\x4b\x00\x62\x8a\xcc\x26\x8e\xa9\xaa\x00\x23\x73\x1b\xf0\x1d\xe0\
+\x5a\x60\x65\xfe\xb7\x40\x3f\x96\xd6\xe0\xf5\x58\x9a\x03\x21\x84\
+\x0c\x00\x21\x46\x64\x25\x70\x1e\x70\x13\xb6\x24\x60\x7c\xce\x5f\
+\x76\x21\x16\xf2\x30\x03\xd8\x03\x73\x3e\x64\x04\xd4\x27\xb6\xbd\
+\x9a\x01\x32\x00\x84\x68\xb7\x01\xe0\x59\xf4\x4b\xf8\x77\xc7\x02\
+\xe0\xf7\x58\xfc\xfb\x13\xed\x68\xfe\x8f\x03\x6f\xc0\xfc\x8e\x95\
+\xea\x0d\x84\x78\x2a\x63\x74\x09\x84\xe8\xc8\x3f\x80\x67\x60\x49\
+\x02\xf7\xc9\xfd\xcb\x5e\x83\x85\x05\xbe\x14\x38\xb6\x4b\x11\xd9\
+\x5f\x52\x6c\xf6\x57\x10\xaa\x55\xf6\x0d\xb1\x7f\xa8\x63\xc4\x38\
+\xd6\x50\x13\xc4\x3e\xdd\xc7\x42\x88\x06\x45\xbf\x84\x7f\xfd\xfb\
+\xf6\x63\xc6\xfe\x1f\xdb\x23\xfc\xc1\x1e\xda\x9c\x00\xdc\xa5\x3b\
+\x59\x88\xe1\x51\x04\x80\x10\x23\x33\x17\x5b\x12\xb0\x15\xb6\x96\
+\x2c\x6b\x96\x01\x37\x03\xb7\x02\x3b\x01\xeb\xf5\xb0\xaf\xb2\xfe\
+\x87\xa3\x89\xac\xff\x6b\xa2\x08\x00\x21\xd2\xa4\xd7\x08\x00\x55\
+\x05\xc8\x47\xf8\x03\x3c\x08\xfc\x00\x38\x07\x2b\x6f\xd4\x12\x7e\
+\x09\xbc\x02\x98\xad\x1e\x40\x08\x19\x00\x42\x84\xd2\xc5\x7f\xc7\
+\x6a\xc7\x3e\x17\x18\x9b\xfb\x17\x7e\x14\xb8\x10\x7b\x72\xb0\x4b\
+\x8f\x5f\x58\x46\x40\x73\xa2\x3d\xe4\x71\x65\x00\x08\x91\xaf\x01\
+\xa0\xaa\x00\xf9\x09\xff\x45\x58\x92\xbf\x9f\x63\xa9\xef\x5b\xc2\
+\x62\xe0\xdd\xc0\xe7\x80\xe5\xba\xfb\x85\x18\x19\x2d\x01\x10\xa2\
+\x37\x7e\x5b\x68\xa2\x3f\x17\xba\x38\x6b\x56\x60\x4f\x10\xae\x01\
+\x5e\x0d\x1c\x4a\xf7\xcb\x02\xca\x0a\xd7\xb2\x4b\x0a\xaa\x7e\xee\
+\x9a\x13\xad\x10\xcb\x03\x42\x89\xf7\x18\x4b\x04\x62\x9c\xa7\x10\
+\xc2\x37\xfd\x89\x1c\x5b\xc9\x01\x7b\xdb\xaf\x1f\x4b\x77\xff\x57\
+\x5a\x97\xf1\xee\xd6\x62\x7a\x72\xb3\xee\x6e\x21\xba\x47\x11\x00\
+\x42\xf4\xce\x43\x58\xa8\xd9\x7a\xc0\x41\x6d\xf8\xc2\x8b\x81\xeb\
+\x80\x29\xc0\x36\xc0\x46\x3d\xec\xab\x64\x7f\x71\x04\x76\x4c\xc1\
+\x3e\x70\x6c\x45\x00\x08\x91\x26\x83\x23\x00\x52\x11\xfd\x12\xfe\
+\xe5\xf6\xbd\x17\x4b\x77\x7f\x2e\xb0\xa4\x5d\xcd\xfc\x77\xc0\x8b\
+\xb1\x15\x0f\x42\x08\x19\x00\x42\x44\x67\x39\x70\x16\x96\x33\xef\
+\x58\x32\xaf\x12\x30\xc0\x3c\xe0\x62\xe0\x61\x60\x57\xea\xa9\x16\
+\x90\x9b\x11\x90\x92\x19\x70\x9b\x0c\x00\x21\x92\x64\xef\xa2\x8f\
+\x6e\x93\xe8\x6f\x9b\xf0\x5f\x00\xfc\x05\x38\x11\x98\xd3\xae\xe6\
+\xfd\x38\xf0\x16\xe0\x0b\xd8\xf2\x4c\x21\x44\x8f\x68\x09\x80\x10\
+\xd5\x38\x19\x2b\xab\xfb\x47\x2c\x42\x3e\x7b\x06\x32\x0b\xdf\x84\
+\x55\x0b\x38\x06\x18\xd5\xc3\xc4\x46\x59\xff\xc3\x87\xf4\x2b\x94\
+\x5f\x08\x11\xbb\xdf\xf7\x7c\xcc\x36\x09\xff\x96\x66\xf7\x1f\xe0\
+\x5a\xe0\x35\xc0\x74\xdd\x95\x42\x94\x47\x11\x00\x42\x54\x67\x3e\
+\x16\x8a\x36\x9e\xee\x97\xc9\x27\xcf\x40\xb5\x80\x1b\x81\x2d\x81\
+\x8d\x7b\xdc\x5f\xc9\xfe\xe2\x1d\x2b\xd4\x31\xb5\x04\x40\x88\x34\
+\xd9\x9b\xde\xaa\x00\xb4\x55\xf4\xa7\x24\xfc\x01\xa6\x01\xdf\x03\
+\x2e\xa0\x55\xd9\xfd\x01\x56\x02\x5f\x03\x5e\x4f\xeb\x02\x1e\x84\
+\x90\x01\x20\x84\xe7\xc1\xe9\x5c\xe0\x32\xec\xa1\xf8\x7a\x6d\xf9\
+\xe2\xf3\xb1\xe4\x43\x77\x00\xdb\x03\xeb\x27\x64\x04\x78\x3a\x46\
+\x4c\x23\xa0\xec\x71\x65\x00\x08\xd1\x2e\x03\xa0\x2d\xe5\x00\x9b\
+\x3e\x46\xaf\xfb\x3e\x04\xfc\x0a\x0b\xf9\x7f\xbc\x7d\xcd\x79\x36\
+\x70\x02\xf0\xd3\x62\xae\x25\x84\x90\x01\x20\x84\x2b\xee\xc1\x2a\
+\x05\xec\x09\xec\xdc\xa6\x2f\xfe\x08\x56\x36\x70\x2e\xb0\x23\xbd\
+\xe5\x07\xc8\xc5\x08\xc8\xcd\x0c\x90\x01\x20\x44\xfe\x06\x40\x5b\
+\x44\x7f\x8a\xc2\x7f\x01\x70\x6a\xa1\x7c\x1f\x68\x67\x53\x3e\x17\
+\x2b\xbd\x7c\x93\xee\x6a\x21\x64\x00\x08\xe1\x99\x45\xc0\x9f\x80\
+\x85\xc0\x11\xb4\x28\xd7\x46\x3f\x96\x91\xf8\xe2\xa2\x73\xd9\x9e\
+\xee\xf2\x03\xc8\x08\x68\xce\x0c\xe8\x74\x6c\x19\x00\x42\xe4\x67\
+\x00\xa8\x2a\x80\x7f\xe1\xbf\x1c\x38\x13\xcb\xee\x3f\x95\x56\x3e\
+\xf6\x5e\x0c\x7c\x04\xf8\x2f\xcc\x07\x11\x42\xc8\x00\x10\x22\x09\
+\xae\xc0\xcc\xfb\x43\x80\x2d\xda\xf4\xc5\x97\x15\xc2\xf1\x32\x60\
+\x5d\x60\xeb\x1e\x05\xac\xb2\xfe\xfb\x30\x03\x64\x00\x08\x91\x87\
+\x01\xd0\x46\xd1\xef\x41\xf8\x97\xd9\xff\x46\xe0\x3b\xc0\xd5\xb4\
+\x36\xc5\xfd\x2d\xc0\x0b\x80\xbf\xeb\x4e\x16\x42\x06\x80\x10\x29\
+\xf2\x08\x56\xa5\x67\x25\x70\x38\xbd\x3f\x10\x4f\x9a\x27\x81\xeb\
+\xb1\x64\x81\x5b\x02\x93\x6a\x16\xba\xde\x9e\xe6\x7b\x4c\xf4\xd7\
+\x09\x19\x00\x42\xa4\x6b\x00\xec\x1a\xf1\xf8\x9e\x13\x04\xa6\x9a\
+\x1c\x70\x3a\xf0\xbf\xc0\xe9\x58\xf8\x60\x0b\x59\x89\x05\x3d\x9c\
+\x00\xcc\xd0\x5d\x2c\x84\x0c\x00\x21\x52\x1f\xd4\x2e\x2a\x5e\x47\
+\x01\x1b\xb4\xed\x02\xcc\xc3\x12\x05\xce\x00\xb6\xc1\xa2\x02\xea\
+\x16\xb9\x6d\x48\xf6\x17\xfa\x98\x32\x00\x84\x90\x01\x90\x82\xe8\
+\x0f\x75\xac\x26\x8e\x31\x13\x4b\xf0\xf7\x27\x5a\x9d\xde\xfe\x6e\
+\xe0\x78\xe0\x67\xc0\x0a\xdd\xc1\x42\xc8\x00\x10\x22\x17\xee\x2b\
+\xc6\xf9\x49\xc0\xfe\x6d\xbc\x00\x33\x80\xf3\x80\x07\x81\x1d\x80\
+\x75\x64\x04\xb8\xca\xfa\x2f\x03\x40\x08\x19\x00\xb1\x45\xbf\x84\
+\xbf\x31\x07\xf8\x33\x16\x22\xf8\x60\xbb\x9b\xeb\xef\x0a\xf1\x7f\
+\x97\xee\x5c\x21\xea\x61\x8c\x2e\x81\x10\xb5\xf2\x38\xf0\x0e\x6c\
+\x6d\xdb\x2f\x69\x59\x6e\x80\x81\x49\xd2\x35\xc0\x0d\xd8\x9a\x88\
+\x97\x03\x13\x7b\x9c\x60\xf5\x55\xfc\xfc\x50\xc7\x08\x21\xb4\x43\
+\x1e\xab\x8e\xe3\x0a\x21\xf2\xef\xa3\xdb\x20\xfa\x9b\x12\xfe\x0b\
+\x80\x33\x80\xb3\x69\xed\x1a\xff\x01\x66\x03\x6f\x07\xfe\xa1\xbb\
+\x4e\x08\x19\x00\x42\xb4\x81\x33\x81\xa7\x61\xe1\x6e\x2f\x6e\xe3\
+\x05\x58\x8e\x95\x0d\xbc\x12\x38\x1a\x78\x11\xb0\x76\x62\x46\x40\
+\xc8\xe3\xc8\x0c\x10\x42\x48\xf4\xe7\x2b\xfc\x17\x63\x11\x70\xa7\
+\x61\xa5\x82\x34\x07\xe2\xad\xc0\x2c\x5d\x0a\x21\xea\x47\x4b\x00\
+\x84\x68\x8e\x85\x58\x04\xe0\x0c\xe0\x59\xc0\xb8\xb6\x1a\x01\x77\
+\xb0\xaa\x74\xe0\xb6\x25\x3a\xa6\x9c\xcb\xff\xc5\x14\xed\x23\x1d\
+\x57\x4b\x00\x84\x48\x93\x6e\x96\x00\xa4\x22\xfa\x53\x17\xfe\x4b\
+\xb1\xa7\xfd\x3f\xc0\x32\xfc\xb7\xfc\xa9\xff\x7c\xe0\xdd\x58\x89\
+\x3f\x95\xf7\x13\x42\x06\x80\x10\xad\xe5\x06\xe0\x0f\xc0\xee\xc0\
+\x4e\x6d\xbd\x08\x4b\x59\x55\x3a\x70\x3c\x56\x3a\xb0\xd7\x92\x09\
+\xb9\x67\xfd\x8f\xfd\xf4\xbe\x4f\x06\x80\x10\xd9\x1a\x00\xfd\x91\
+\x3f\x33\xe7\xa7\xfd\x65\x8e\xb3\x1c\xcb\xfc\xfb\x03\xe0\xda\x62\
+\x8c\x6b\x39\x67\x00\xcf\x07\x2e\xd1\xa5\x10\x42\x06\x80\x10\xc2\
+\x72\x03\xfc\x01\x98\x06\x3c\x9b\xee\xa3\xe1\xb3\xe3\x49\xec\x29\
+\xc9\xa5\x85\x20\xdd\x8e\x72\xb5\x13\x73\x4f\xf6\x57\x87\x19\x20\
+\x03\x40\x88\xb4\x0d\x80\xb6\x8a\xfe\x50\xc7\x2a\x73\x8c\x15\xc0\
+\x15\x58\x3d\xbb\xcb\xb1\xd0\xff\x96\xf3\x18\xf0\x3e\xe0\x43\xc0\
+\x13\xba\x1c\x42\xc8\x00\x10\x42\xac\xce\x34\xe0\x37\x58\x92\xfc\
+\xdd\xdb\x7c\x21\x9e\x04\x6e\xc6\x22\x02\xfa\x28\xb7\x34\xa0\x0d\
+\x46\x40\x4c\x33\xe0\x76\xe0\x16\xdd\x93\x42\x24\xc7\x5e\x84\x2f\
+\x03\x18\x4b\xf4\xe7\x22\xfc\x97\x0f\x12\xfe\x97\x60\x6b\xfc\x04\
+\xa7\x03\xc7\x61\xc1\x10\x42\x08\x19\x00\x42\x88\x61\x58\x08\xfc\
+\xb5\x30\x03\x9e\x45\xef\xd5\xf2\x64\x04\x44\x14\xc9\x6d\x32\x03\
+\x64\x00\x08\x91\x26\xa1\xca\x00\xb6\x49\xf4\x4b\xf8\x07\x65\x36\
+\xb6\xd6\xff\xe3\xe8\xa9\xbf\x10\x32\x00\x84\x10\x5d\x33\x10\x0d\
+\xb0\x39\xb0\x6f\xdb\x2f\x86\x8c\x80\xfa\x8f\x2b\x03\x40\x88\xf6\
+\x1a\x00\x2a\x07\x38\xb2\xf0\xbf\x18\x5b\xe3\x7f\x99\x84\xff\x60\
+\x4e\x02\x5e\x88\x15\xf9\x11\x42\xc8\x00\x10\x42\xf4\xc8\x42\xe0\
+\xd4\x42\x87\x1d\x09\xac\x2b\x23\x60\x95\x11\x30\x06\x4b\x16\x98\
+\x8b\x11\x10\xd3\x0c\x28\x73\x6c\x19\x00\x42\xb4\xc7\x00\x88\x99\
+\x2f\x20\xa7\x04\x81\x4b\x81\xf3\xb1\x27\xfe\x57\x16\x63\x92\x00\
+\xac\xa4\xdf\x1b\x80\x2f\xa1\x4a\x87\x42\xc8\x00\x10\x42\x54\xe6\
+\x56\xe0\x57\xc0\x66\x58\x34\x40\xeb\xcb\xb9\x3f\x09\x4c\xc1\x16\
+\x16\xae\x28\x8c\x80\xb1\x0d\x8b\xee\xdc\xcc\x00\x19\x00\x42\xe4\
+\x6d\x00\x48\xf4\x77\xcf\x42\xac\x78\xfd\xff\x61\x59\xfd\x95\xdc\
+\x6f\xb5\x4b\x7a\x22\xf0\x12\xe0\x26\x5d\x0e\x21\x64\x00\x08\x21\
+\xc2\x6a\xde\xbf\x03\x17\x00\x07\x01\x9b\xe8\x92\xc0\x12\x60\x2a\
+\x70\x1e\x56\x60\x78\x6b\x60\x42\x66\x46\x40\x53\x66\x80\x0c\x00\
+\x21\xf2\x33\x00\x52\x12\xfd\x1e\x84\xff\x7c\xe0\x5f\x85\xf0\x9f\
+\x52\x8c\x39\xe2\xff\x73\x27\xf0\x2a\xe0\xfb\xc8\x13\x11\x42\x06\
+\x80\x10\x22\x1a\xf7\x03\x3f\xc7\x1e\x48\x3c\x13\x8b\x84\x6f\x3d\
+\xcb\x81\xe9\x85\x11\xf0\x10\xb0\x25\xb0\x9e\x03\xb1\x9d\x9a\x19\
+\x30\xf8\xf8\x32\x00\x84\x48\xdf\x00\x48\xad\x14\x60\xe8\x63\x96\
+\x3d\xd6\x6c\xe0\x14\xe0\x27\x98\xc9\xbc\x4c\xcd\x6a\x30\x8b\x81\
+\x2f\x03\xaf\x2d\x4c\x00\x21\x44\x42\x48\x38\x08\x91\x26\xcb\x80\
+\xaf\x03\x7f\xc3\x1e\x4c\x1c\xa3\x4b\xb2\xca\x08\xb8\x1c\xcb\xca\
+\xfc\x34\xe0\x78\x60\xa7\x92\x13\xc6\x10\x42\xbb\x3f\x82\x70\x8f\
+\x71\xcc\xd8\x13\x7a\x21\x44\xbd\xb4\xf5\x49\x7f\xd5\xe3\xdd\x87\
+\x85\xfa\x5f\x09\xac\x54\x33\x1a\x8a\x8b\x81\x77\x02\xb7\xe9\x52\
+\x08\x21\x03\x40\x08\x51\x3f\x77\x01\xcf\xc5\x12\xef\x7c\x1b\xd8\
+\x58\x97\x64\xd5\xe4\xef\xc6\xe2\xb5\x27\xf0\x02\xac\x36\x76\x5f\
+\x8f\xc7\x08\x29\xb4\x43\x1a\x0b\x75\x99\x01\x42\x08\x11\xd3\x50\
+\xf0\xf0\xb4\xbf\x1f\x4b\x2e\xfb\x2f\xac\xfc\x8e\x18\x92\x87\x81\
+\x0f\x01\x7f\xd0\xa5\x10\x22\x6d\xb4\x04\x40\x88\x3c\x98\x02\xfc\
+\x02\x5b\xfe\x7e\xa0\xb4\xe0\xea\x3c\x82\x45\x05\x5c\x59\x4c\xf4\
+\xb6\xa6\xbc\xfb\x99\x4a\xa2\xbf\x10\xc7\xbd\x03\x2d\x01\x10\x22\
+\x45\x42\x94\x01\x4c\x45\xf4\x57\x39\xde\x72\x2c\x5a\xec\xc7\xc0\
+\xd9\xc5\x58\x21\x86\xbc\xbc\xbf\x07\x5e\x0c\x5c\xad\xcb\x21\x84\
+\x0c\x00\x21\x84\x1f\x16\x03\x67\x61\xe1\x79\x4a\x12\x38\x04\x0b\
+\xb0\xa7\x3c\x17\x60\x35\x8a\xb6\xa4\x7c\xc2\xc0\x36\x98\x01\x32\
+\x00\x84\x68\x9f\x01\x90\xbb\xe8\x07\x98\x0b\x9c\x86\xad\x9f\xbb\
+\x12\x78\x42\x4d\x66\x38\xa6\x02\x2f\xc7\x92\xfc\xa9\xb4\x9f\x10\
+\x32\x00\x84\x10\x4e\xb9\x0f\xf8\x19\x30\x07\x38\x14\x18\xa7\x4b\
+\xb2\x3a\x4b\x0b\x71\x7b\x36\x70\x0f\x30\xa9\x78\x79\x12\xee\x4d\
+\x97\x00\x94\x01\x20\x44\x3b\x0c\x80\x36\xe5\x0a\xb8\x07\xf8\x0b\
+\xf0\x4b\x6c\x01\xfb\x52\x35\x95\xe1\x58\x08\x7c\x15\x78\x7d\x71\
+\xd9\x84\x10\x32\x00\x84\x10\xce\x59\x89\x85\xea\xfd\x06\xd8\x14\
+\xd8\x07\x2d\x0b\x18\x72\x22\xf9\x10\x70\x09\x56\xbc\x78\x2c\x30\
+\x19\x18\xe5\x48\xb8\xd7\x95\xf1\x5f\x06\x80\x10\xed\x31\x00\x52\
+\xab\x0c\xd0\x5f\x71\xdf\x9b\x8a\xc1\xf0\xaf\xc0\x03\x28\xd1\xe9\
+\x08\x97\xeb\xf7\xc0\x8b\x80\xd3\x81\x15\xba\x24\x42\xe4\x87\x04\
+\x81\x10\xed\xe0\x99\xc0\x0f\xb1\xc4\xf8\xa2\x03\x93\x80\x67\x03\
+\x47\x02\x13\x9d\x75\xae\x75\x74\xd8\x83\x3f\xe3\x34\xe0\x4f\x6a\
+\x12\x42\x24\xc7\x6b\x0a\x05\x57\x97\xe0\x8f\xf5\x19\x55\x8e\x39\
+\x1f\x5b\x0f\x77\x01\x16\x0e\x27\x46\xe4\x3a\xe0\xbf\x81\xab\x74\
+\x29\x84\xc8\x1b\x55\x01\x10\xa2\x1d\x5c\x06\xec\x8f\x85\xf3\x7d\
+\x0b\xe5\x07\x18\x96\x39\xc0\x49\xc0\xa9\xc0\xd3\x0b\x33\x60\x8f\
+\x12\xe2\x3b\xc5\xf2\x7f\x75\x09\x05\x21\x44\x9a\x82\xdc\xbb\xe8\
+\x07\x8b\x57\x3f\xbb\x50\xb1\x7a\x7c\xdd\x15\x73\x81\x2f\x00\x3f\
+\xd2\x25\x13\xa2\x1d\x68\x09\x80\x10\xed\x9a\x0f\x0e\xae\x16\x70\
+\x00\xd5\xa2\xdd\xb3\x66\x25\x30\x03\x73\x4e\xae\xc4\xd6\x8a\x6e\
+\x09\xac\x55\xf1\xb8\x9e\xb3\xfe\xaf\xc9\xed\x68\x09\x80\x10\x29\
+\xb2\x17\x61\xaa\x00\xd4\x65\x2a\x54\x3d\xee\xa2\xa2\xaf\xfe\x19\
+\xf0\x0f\x14\xe6\xdf\xc3\x30\x37\x10\xee\x7f\xa1\x2e\x99\x10\xed\
+\x41\x4b\x00\x84\x68\x2f\xfb\x61\xcb\x02\x0e\xd3\xa5\xe8\x8e\x31\
+\xac\x8a\x0a\xd8\xd3\x71\xe7\x1b\xea\xd8\xa7\x01\x7f\xd6\xcf\x2e\
+\x44\x72\xbc\x9a\xd5\x97\x00\x78\x14\xfd\x21\x8e\x7d\x4f\xa1\x5c\
+\xaf\x00\x96\xe8\x67\xef\x85\x4b\x80\xf7\x62\x0f\x05\x84\x10\x2d\
+\x9c\xcf\x0a\x21\xda\xc9\x8d\xc0\xe1\xc0\x6b\x81\xaf\x00\xdb\xe8\
+\x92\x74\x66\x39\x70\x4d\xf1\xda\xae\x30\x02\x0e\x01\xc6\x57\x9c\
+\xf8\x86\x36\x03\xea\x58\x2a\x20\x84\xc8\x17\xcf\xa2\xff\x49\x2c\
+\x2a\xeb\x02\xac\xe4\x8d\xe8\x89\x7b\x80\x4f\x60\xf9\x10\xf5\xc4\
+\x5f\x88\x96\xa2\x25\x00\x42\x88\x7f\x63\xe5\x90\xe7\x54\xd0\xb3\
+\xad\xe3\x31\xcc\x41\x39\x0b\xb8\x1f\x58\x17\x4b\xac\x50\x55\x70\
+\x7b\x8a\x0c\x50\x15\x00\x21\xd2\xa4\xcc\x12\x00\xef\xe5\x00\xef\
+\xc1\x72\xb3\xfc\x1c\xcb\x56\x37\x5f\x3f\x73\x2f\x2c\xc0\xca\xfa\
+\xbd\x06\x3d\xf5\x17\xa2\xf5\x28\x02\x40\x08\x01\xb6\xc4\xfd\xfb\
+\xd8\x7a\xc0\xcf\x00\xef\x56\xff\xd0\x1d\xcb\x58\x15\x15\x30\x09\
+\x73\x50\x9e\x4d\xf9\x2c\x8b\x75\x45\x06\xc4\x38\xbe\x10\x22\x1d\
+\x52\x28\x05\x38\x0f\xb8\x1c\x0b\xf3\x9f\xad\x9f\xac\x0c\xcb\x81\
+\x13\x8b\x71\xfd\x61\x5d\x0e\x21\x84\xe6\x7f\x42\x88\xe1\xd8\x15\
+\xf8\x22\x70\x82\x2e\x45\xb9\x8e\x75\x67\xac\xf6\xe2\x61\x54\x4f\
+\x1c\x58\x47\x67\x3d\xd4\xf1\x95\x03\x40\x88\x34\x19\x2e\x07\x40\
+\x0a\xa2\x7f\x39\x70\x03\x96\xd4\x6f\x0a\x96\xa9\x4e\x94\xe2\x3c\
+\xe0\x03\x28\x90\x4b\x08\xb1\x06\x7a\xc2\x27\x84\x18\x8a\xdb\x81\
+\x57\x02\xc7\x60\x65\x03\xf7\xd1\x25\xe9\x6d\x12\x7c\x47\xf1\xfa\
+\x0b\x16\x15\x70\x38\xb0\x43\xa0\x89\x75\x5f\xa4\x73\x26\xf2\x67\
+\x08\x21\xea\xef\x8b\x52\xf9\x8c\xe9\x58\x66\xba\xab\xb0\xac\xfe\
+\xa2\x34\x37\x02\x1f\xc6\xd2\x24\x08\x21\x84\x0c\x00\x21\x44\x4f\
+\x9c\x8b\x55\x0b\x78\x3d\xf0\x35\x60\x0b\x5d\x92\xde\x58\x88\x3d\
+\x86\x39\x0f\xd8\x18\x38\x18\x38\xa2\xe2\x85\xac\x23\xc9\x5f\x3f\
+\xca\x10\x25\x44\xca\xc2\xdf\xfb\x9a\x7e\x80\x47\x0b\xc1\x7f\x09\
+\x30\x4b\x3f\x5b\x55\x66\x02\x9f\x07\x7e\x09\xac\xd0\xe5\x10\x42\
+\x0c\x87\x1e\xf2\x08\x21\xba\x65\x5d\x2c\x9c\xf0\x43\xc0\x44\x5d\
+\x8e\x6a\xec\x80\x45\x06\x1c\x0c\x6c\xe0\xb4\x43\x3f\x0d\x8b\x60\
+\x10\x42\xa4\xc5\xab\x08\x57\x06\x30\xb4\xe8\x9f\x57\x88\xfe\x2b\
+\xb1\xc4\x7e\xa2\x32\x8f\x01\xdf\xc4\xf2\xf8\x2c\xd4\xe5\x10\x42\
+\xc8\x00\x10\x42\x84\x66\x23\xe0\xa3\x58\x0d\xe1\x09\xba\x1c\xd5\
+\x3b\xe1\x9d\x81\x67\x00\x87\x02\xeb\x39\xea\xe0\x65\x00\x08\xd1\
+\x5e\x03\x20\x64\x04\xc1\x22\x6c\x5d\xff\x35\xc0\xcd\xe8\xf1\x74\
+\xc0\xcb\xfa\x0b\xe0\xcb\x28\x47\xa2\x10\x42\x06\x80\x10\xa2\x06\
+\x26\x03\x9f\x06\xde\x02\x8c\xd5\xe5\xa8\xce\x58\x60\xdf\xc2\x08\
+\xd8\x97\x30\xc9\x03\xab\x74\xf6\x32\x00\x84\x68\x97\x01\x10\x52\
+\xf4\x2f\x05\x6e\x02\xae\xc0\x92\xf9\x2d\xd7\xcf\x12\x8a\x65\x85\
+\xf0\xff\x22\x5a\x39\x21\x84\x90\x01\x20\x84\x68\x80\x6d\x81\x4f\
+\x02\x6f\x05\x46\xeb\x72\x84\x61\x2d\x60\x4f\x2c\x32\x60\x7f\xc2\
+\x86\x5a\x74\xdb\xf1\xcb\x00\x10\x22\x7f\x03\x20\xb4\xe8\x9f\x0a\
+\x5c\x0d\x5c\x0f\x2c\xd6\x4f\x11\x92\x95\xc0\xdf\x8a\xf1\xf6\x2e\
+\x5d\x0e\x21\x44\x59\x94\x04\x50\x08\x51\x95\xfb\x80\x77\x00\x3f\
+\x00\x3e\x8b\x4a\x07\x06\x9b\x48\xdf\x58\xbc\xc6\x02\x7b\x61\xd9\
+\x18\xf7\x07\xd6\xaf\x78\x6c\x65\xfc\x17\xa2\xbd\x84\x4e\x0e\xb8\
+\x70\x50\x5f\x35\x05\x58\xa2\x4b\x1c\x83\xf3\xb0\xa5\x77\x37\xea\
+\x52\x08\x21\x64\x00\x08\x21\xbc\x30\x15\x2b\x1d\xf8\x4c\xe0\xab\
+\xc5\x7f\x45\x00\x96\x0d\x9a\x60\xff\x06\x8b\x0c\x38\xa0\x78\x85\
+\xc8\x19\x20\x43\x40\x08\x09\xfe\x5e\x78\x1c\x7b\xc2\x7f\x2d\x30\
+\x0d\xad\xe9\x8f\xc8\x45\xd8\x13\xff\x2b\x75\x29\x84\x10\x32\x00\
+\x84\x10\x5e\xb9\x0c\x2b\x7b\x7f\x0c\x16\x11\x70\x98\x2e\x49\x38\
+\x56\x60\x49\xb4\x6e\x06\x7e\x0d\xec\x06\x3c\x1d\x8b\x0e\xd8\xd4\
+\xb1\x60\x10\x42\xa4\x2d\xfc\x1f\xc2\x4c\xc8\x1b\x80\x3b\xb0\x78\
+\x74\x11\x8d\x4b\xb0\x92\x7e\x17\xe8\x52\x08\x21\x64\x00\x08\x21\
+\x52\xe1\xdc\xe2\xf5\xcc\x62\x22\xf3\x6c\x5d\x92\xb0\xac\xc4\x9e\
+\xbe\x4d\x03\x7e\x5f\x18\x00\x4f\x2b\x0c\x81\x5d\xd5\xc1\x0b\x21\
+\x2a\xf6\x2f\x77\x15\xa2\x7f\x2a\x2a\xd9\x57\x13\x97\x03\x5f\xc7\
+\x52\xb0\x08\x21\x84\x0c\x00\x21\x44\x92\x5c\x06\x3c\xa7\x30\x02\
+\x3e\x57\xfc\x5b\x44\x60\x36\x70\x4e\xf1\x1a\x07\xec\x81\x45\x06\
+\x3c\x1d\x98\xa8\xcb\x23\x84\x18\x81\x05\x98\xa1\x78\x43\x21\xfc\
+\x17\xe9\x92\xd4\x29\xfc\x3f\x87\xad\xf5\x17\x42\x88\xa8\x68\xa9\
+\xa7\x10\xa2\x6e\x8e\xc2\x96\x06\x1c\xa9\x4b\x51\x0f\xa3\x80\x9d\
+\x0a\x33\x60\x5f\x60\xab\x2e\x3b\xff\xd3\x51\x15\x00\x21\x52\xe4\
+\x55\xc0\x0b\xbb\xd8\xae\x1f\x78\x00\x4b\xde\x77\x13\xf6\xc4\x5f\
+\xa1\xfd\xb5\x72\x01\x16\x21\x77\x89\x2e\x85\x10\xa2\x2e\x14\x01\
+\x20\x84\xa8\x9b\x0b\x8b\xd7\x33\x81\x8f\x75\x39\x4f\x15\x15\x58\
+\x89\xad\xd9\xbd\xa3\x10\xf4\xeb\x01\xbb\x63\x95\x05\xf6\x01\x26\
+\xe9\x12\x09\xd1\x1a\x1e\x07\x6e\x03\x6e\x29\x84\xff\x5c\x5d\x92\
+\x26\xb8\x1c\xf8\x0c\x5a\xe3\x2f\x84\x90\x01\x20\x84\x68\x11\x97\
+\x15\xaf\x23\x80\x4f\x01\xc7\xea\x92\xd4\xc3\x13\xc0\x35\xc5\x0b\
+\x60\xeb\xc2\x0c\xd8\x0b\x4b\x2a\xb8\x96\x2e\x91\x10\xd9\xb0\x64\
+\x90\xe0\xbf\x05\x78\x50\x97\xa4\x29\xfa\x81\xb3\x81\x2f\x17\x63\
+\x9f\x10\x42\x34\x82\x96\x00\x08\x21\xbc\xb0\x1f\x16\x11\xf0\x0a\
+\x60\xb4\x2e\x47\x33\x8c\x01\x76\x29\xcc\x80\x79\x58\x16\x47\x21\
+\x44\x5a\x1c\x03\x6c\x58\x08\xfe\x3b\x80\xe5\xba\x24\x4d\xb2\x1c\
+\x38\x09\x4b\xee\x37\x45\x97\x43\x08\x21\x03\x40\x08\x21\x56\x67\
+\x7b\xe0\xfd\xc0\xdb\x80\x09\xba\x1c\x42\x08\x21\x12\x64\x09\xf0\
+\x57\xe0\x4b\x98\x0f\x23\x84\x10\x32\x00\x84\x10\xa2\x03\x9b\x02\
+\xef\x06\xde\x8b\x3d\xcc\x12\x42\x08\x21\xbc\xf3\x38\xf0\x6b\xec\
+\x89\xff\x4c\x5d\x0e\x21\x84\x0c\x00\x21\x84\xe8\x8d\xf5\x81\x77\
+\x62\x51\x01\x5b\xe8\x72\x08\x21\x84\x70\xc8\x0c\xe0\x7b\xc0\x4f\
+\xb1\x54\x2b\x42\x08\x21\x03\x40\x08\x21\x2a\x30\x0e\x78\x23\xf0\
+\x61\x6c\x99\xba\x10\x42\x08\xd1\x34\xb7\x01\xdf\x02\x7e\x07\x2c\
+\xd5\xe5\x10\x42\xc8\x00\x10\x42\x88\xf0\xfd\xd6\x73\x80\xf7\x01\
+\x2f\x50\x3f\x26\x84\x10\xa2\x01\x2e\xc7\xc2\xfc\x4f\xc7\x32\xfc\
+\x0b\x21\x84\x0c\x00\x21\x84\x88\xcc\x5e\x58\x8e\x80\xd7\xa3\x84\
+\x81\x42\x08\x21\xe2\xb2\x08\x7b\xd2\xff\x03\x60\x9a\x2e\x87\x10\
+\x42\x06\x80\x10\x42\x34\xc3\x44\xe0\x4d\xc0\x87\xb0\xb2\xf6\x42\
+\x08\x21\x44\x28\x1e\xc2\xd6\xf6\xff\x08\x78\x54\x97\x43\x08\x21\
+\x03\x40\x08\x21\x7c\x30\x16\x38\x01\x4b\x18\x78\xa0\x2e\x87\x10\
+\x42\x88\x0a\x5c\x03\x7c\x17\xf8\x1b\xb0\x4c\x97\x43\x08\x21\x03\
+\x40\x08\x21\xfc\x72\x18\x96\x27\xe0\x25\x85\x31\x20\x84\x10\x42\
+\x8c\xc4\x32\xe0\x14\xe0\xfb\xc0\x95\xba\x1c\x42\x08\x19\x00\x42\
+\x08\x91\x16\x5b\x00\xff\x09\xbc\x0d\x2d\x0f\x10\x42\x08\x31\x34\
+\xf7\x03\x3f\x03\x7e\x89\x85\xfc\x0b\x21\x84\x0c\x00\x21\x84\x48\
+\x98\x51\xc0\xb3\x81\xb7\x03\x2f\x03\x46\xeb\x92\x08\x21\x44\xab\
+\x59\x09\x5c\x50\x08\xff\x53\x81\xe5\xba\x24\x42\x08\x19\x00\x42\
+\x08\x91\x1f\x93\xb1\x88\x80\x77\x01\x9b\xea\x72\x08\x21\x44\xab\
+\x78\x18\xf8\x35\x96\xd8\xef\x1e\x5d\x0e\x21\x84\x0c\x00\x21\x84\
+\x68\x07\x6b\x01\x2f\x07\xde\x09\x1c\xa1\xcb\x21\x84\x10\xd9\xd2\
+\x0f\x5c\x0c\xfc\x04\x7b\xda\xbf\x54\x97\x44\x08\x21\x03\x40\x08\
+\x21\xda\xcb\x1e\xd8\xf2\x80\xd7\x01\x1b\xeb\x72\x08\x21\x44\x16\
+\x3c\x02\xfc\x1e\xf8\x39\x70\xab\x2e\x87\x10\x42\x06\x80\x10\x42\
+\x88\xc1\xac\x05\xbc\x08\x78\x33\xf0\x3c\x94\x2b\x40\x08\x21\x52\
+\x63\x39\x70\x26\xf0\x2b\xe0\x0c\xf4\xb4\x5f\x08\x21\x64\x00\x08\
+\x21\x44\x17\x6c\x01\xbc\x12\x78\x0b\xb0\x8f\x2e\x87\x10\x42\xb8\
+\xe6\x76\xe0\xcf\xc0\x89\x58\x56\x7f\x21\x84\x10\x32\x00\x84\x10\
+\xa2\x14\xfb\x03\x6f\x04\x5e\x0f\x6c\xa4\xcb\x21\x84\x10\x2e\x78\
+\x1c\xf8\x07\xf0\x5b\xe0\x7c\x6c\xad\xbf\x10\x42\x08\x19\x00\x42\
+\x08\x11\x84\xb5\x81\x57\x60\x4b\x04\x8e\x54\x3f\x2a\x84\x10\xb5\
+\xb3\x12\xb8\x08\x0b\xf1\xff\x1b\xf0\xa4\x2e\x89\x10\x42\xc8\x00\
+\x10\x42\x88\xd8\x6c\x85\x55\x11\x38\x01\x38\x4c\x97\x43\x08\x21\
+\xa2\x32\x0d\x38\x09\x7b\xda\x7f\xb7\x2e\x87\x10\x42\xc8\x00\x10\
+\x42\x88\xa6\xd8\x03\xcb\x17\xf0\x5a\x60\x67\x5d\x0e\x21\x84\x08\
+\xc2\xfd\xc0\xdf\x81\x5f\x03\x37\xea\x72\x08\x21\x84\x0c\x00\x21\
+\x84\xf0\xc6\x40\xbe\x80\x57\x02\x9b\xeb\x72\x08\x21\x44\x4f\xcc\
+\xc1\x42\xfb\x7f\x07\x5c\x8e\xd6\xf5\x0b\x21\x84\x0c\x00\x21\x84\
+\x48\x80\xd1\xc0\x21\xc0\x1b\x80\x57\x03\xeb\xeb\x92\x08\x21\xc4\
+\x90\x2c\xc2\x4a\xf6\xfd\x0e\x38\x0b\x58\xa6\x4b\x22\x84\x10\x32\
+\x00\x84\x10\x22\x55\x26\x00\xcf\xc3\x72\x06\xbc\x10\x98\xa8\x4b\
+\x22\x84\x68\x39\x8f\x01\xa7\x61\x4f\xfb\xcf\x06\x16\xeb\x92\x08\
+\x21\x84\x0c\x00\x21\x84\xc8\x8d\x81\xc8\x80\x13\x80\x57\x01\x9b\
+\xe9\x92\x08\x21\x5a\xc2\x5c\xec\x49\xff\x49\x85\xe8\x5f\xaa\x4b\
+\x22\x84\x10\x32\x00\x84\x10\xa2\x8d\x66\xc0\x2b\x80\x2d\x75\x49\
+\x84\x10\x99\xf1\x28\x70\x66\x21\xfa\x15\xde\x2f\x84\x10\x32\x00\
+\x84\x10\x42\x00\xa3\x80\x43\xb1\x25\x02\x2f\x07\x76\xd2\x25\x11\
+\x42\x24\xca\x03\x85\xe8\x3f\xbd\xf8\xef\x72\x5d\x12\x21\x84\x90\
+\x01\x20\x84\x10\x62\x78\xf6\x2c\xcc\x80\x17\x61\x51\x02\xa3\x74\
+\x49\x84\x10\x8e\x99\x86\xad\xe9\x3f\x1d\x65\xef\x17\x42\x08\x19\
+\x00\x42\x08\x21\x4a\xb3\x31\x70\x54\x61\x06\x1c\x8f\x92\x08\x0a\
+\x21\x9a\x67\x11\x70\xc1\x20\xd1\x3f\x53\x97\x44\x08\x21\x64\x00\
+\x08\x21\x84\x08\xcb\x18\xe0\x60\x2c\x3a\xe0\x78\x60\x77\x5d\x12\
+\x21\x44\x4d\xdc\x03\x9c\x5b\x08\xfe\x73\x80\x25\xba\x24\x42\x08\
+\x21\x03\x40\x08\x21\x44\x7d\xec\x5e\x98\x01\xcf\x03\x0e\x03\xc6\
+\xe9\x92\x08\x21\x02\xb1\x18\x0b\xe7\x3f\xab\x10\xfd\xb7\xe9\x92\
+\x08\x21\x84\x0c\x00\x21\x84\x10\x3e\x98\x50\x98\x00\x47\x17\xaf\
+\xa7\xab\xaf\x17\x42\xf4\xc8\xdd\xc0\x79\xc5\xeb\x2c\xe0\x09\x5d\
+\x12\x21\x84\x90\x01\x20\x84\x10\xc2\x3f\x5b\x00\xc7\x14\xaf\xa3\
+\x81\xcd\x75\x49\x84\x10\x6b\xf0\x10\x16\xd6\x3f\xf0\x7a\x48\x97\
+\x44\x08\x21\x64\x00\x08\x21\x84\x48\xbf\xcf\xdf\x1b\x38\xb6\x30\
+\x04\x9e\x09\xac\xad\xcb\x22\x44\xeb\x58\x04\x5c\x5a\x88\xfd\x73\
+\x80\x5b\x50\xc6\x7e\x21\x84\x90\x01\x20\x84\x10\x22\x6b\xc6\x00\
+\xfb\x16\x46\xc0\xc0\xb2\x81\x0d\x75\x59\x84\xc8\x8e\x05\xc0\x55\
+\xd8\x5a\xfe\xcb\x0a\xf1\xaf\xe4\x7d\x42\x08\x21\x03\x40\x08\x21\
+\x44\x8b\x19\x0d\xec\x36\xc8\x0c\x38\x0a\x2b\x3f\x28\x84\x48\x8b\
+\x27\x80\xab\xb1\x35\xfc\x97\x17\xff\x5e\xa6\xcb\x22\x84\x10\x42\
+\x06\x80\x10\x42\x88\xe1\x18\x05\xec\x09\x1c\x09\x1c\x5e\xbc\xb6\
+\xd0\x65\x11\xc2\x1d\xb3\xb0\xa7\xfa\x97\x00\x17\x03\x53\x51\x48\
+\xbf\x10\x42\x08\x19\x00\x42\x08\x21\x2a\xb2\x25\xb0\x3f\x16\x25\
+\xf0\x4c\xac\xca\xc0\x04\x5d\x16\x21\x6a\x63\x19\x70\x33\xf6\x64\
+\xff\xfa\xe2\x35\x55\x97\x45\x08\x21\x84\x0c\x00\x21\x84\x10\xb1\
+\x19\x03\xec\x3a\xc8\x10\xd8\x1f\xd8\x5d\xe3\x8b\x10\xc1\x98\x55\
+\x88\xfc\xcb\x0a\xd1\x7f\x1d\xb0\x58\x97\x45\x08\x21\x84\x0c\x00\
+\x21\x84\x10\x1e\xd8\x14\x38\x08\x38\xb8\x30\x04\xf6\x2b\xfe\x26\
+\x84\xe8\xcc\x6c\xe0\xc6\x42\xe4\x5f\x5d\xbc\x66\xeb\xb2\x08\x21\
+\x84\x90\x01\x20\x84\x10\x22\x25\xb6\x04\xf6\xc0\x72\x0a\xec\x8f\
+\x22\x05\x84\x18\x78\xb2\x3f\x38\x8c\xff\x6e\x5d\x16\x21\x84\x10\
+\x32\x00\x84\x10\x42\xe4\xc8\xfa\xc0\x3e\x85\x19\x30\x60\x0e\x1c\
+\x00\x8c\xd3\xa5\x11\x19\xb1\x1c\xb8\xa3\x10\xf8\xd3\x0a\xb1\x7f\
+\x15\xf0\x88\x2e\x8d\x10\x42\x08\x19\x00\x42\x08\x21\xda\xcc\x58\
+\x60\xeb\xc2\x0c\xd8\x63\xd0\x7f\xf7\x92\x31\x20\x12\x10\xfa\xf7\
+\x17\x22\x7f\xea\xa0\xff\xde\x0a\x2c\xd2\xe5\x11\x42\x08\x21\x03\
+\x40\x08\x21\x84\xa8\x66\x0c\xec\x09\x8c\xd7\xe5\x11\x0e\x84\xfe\
+\x34\xe0\x49\x5d\x1e\x21\x84\x10\x32\x00\x84\x10\x42\x88\x78\xc6\
+\xc0\x8e\xc5\x6b\xa7\x41\xaf\x1d\x81\xed\x8a\xf7\x85\xe8\x95\x65\
+\xc0\xbd\xc0\x5d\xc0\xf4\xe2\xbf\x03\xaf\xbb\x8b\xf7\x85\x10\x42\
+\x08\x19\x00\x42\x08\x21\x84\x13\xc6\x00\xdb\x0c\x32\x04\x06\xff\
+\x77\x3b\x60\x1d\x5d\xa2\x56\xb3\x70\x08\x91\x3f\xf0\xdf\xfb\xb1\
+\x27\xfd\x42\x08\x21\x84\x0c\x00\x21\x84\x10\x22\x03\x26\x00\x5b\
+\x00\x3b\x14\xaf\x2d\x07\xfd\xff\x96\x85\x49\xb0\xb6\x2e\x53\x92\
+\x2c\x03\x1e\x05\x66\x62\x4f\xec\x67\x0d\xfa\xf7\xc0\xff\xcf\x02\
+\xfa\x75\xa9\x84\x10\x42\xc8\x00\x10\x42\x08\x21\xc4\x28\x60\x73\
+\x60\x5b\x60\xab\xe2\xdf\x9b\x14\x26\xc1\xa6\x6b\xfc\x5b\x46\x41\
+\x3d\x2c\x02\x1e\x06\x1e\xc2\xb2\xe8\xcf\x2e\xfe\x3d\xf0\xdf\x07\
+\x81\xfb\x8a\x7f\xaf\xd4\xe5\x12\x42\x08\x21\x64\x00\x08\x21\x84\
+\x10\xa1\x59\x67\x18\x63\x60\x43\x60\x83\x0e\xaf\x36\x33\x0f\x78\
+\x6c\x88\xd7\xc0\xdf\x1f\x2e\x5e\x8f\x0c\x12\xfd\x0b\xd5\xd4\x84\
+\x10\x42\x08\x19\x00\x42\x08\x21\x44\x8a\x0c\x65\x10\xac\x5d\x18\
+\x0a\x6b\x63\xa5\x0f\x27\x62\xf9\x0c\x26\x16\xff\x3f\xf0\xfe\x5a\
+\xc5\xf6\xa3\x8b\xf7\xd6\x64\x22\x16\xc5\x30\x98\x81\xfd\x06\xb3\
+\x74\x08\x61\xbd\x12\x98\x3f\xc4\x31\xe7\x63\x6b\xe3\xe7\x0f\xda\
+\x6f\x11\xb0\xa4\xf8\xdb\x32\xe0\xf1\xe2\xff\x17\x0d\x7a\x7f\x28\
+\x91\x2f\x84\x10\x42\x88\x9a\xf9\x7f\x39\x39\xe0\xd6\x92\x11\xc4\
+\x56\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x63\x72\
+\x65\x61\x74\x65\x00\x32\x30\x32\x34\x2d\x30\x37\x2d\x30\x39\x54\
+\x30\x30\x3a\x30\x32\x3a\x35\x32\x2b\x30\x30\x3a\x30\x30\x1c\xf2\
+\xbf\x17\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x6d\
+\x6f\x64\x69\x66\x79\x00\x32\x30\x32\x34\x2d\x30\x37\x2d\x30\x39\
+\x54\x30\x30\x3a\x30\x32\x3a\x35\x32\x2b\x30\x30\x3a\x30\x30\x6d\
+\xaf\x07\xab\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x5f\x56\
+\x00\
+\x00\x01\x00\x01\x00\x00\x00\x00\x00\x00\x00\x20\x00\x40\x5f\x00\
+\x00\x16\x00\x00\x00\x89\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\
+\x0d\x49\x48\x44\x52\x00\x00\x01\x00\x00\x00\x01\x00\x08\x06\x00\
+\x00\x00\x5c\x72\xa8\x66\x00\x00\x5f\x07\x49\x44\x41\x54\x78\x9c\
+\xed\xbd\x07\xb8\x6d\x55\x75\x36\x3c\xd6\xde\xfb\xf6\xc2\xbd\x74\
+\xe9\x20\x17\x90\x8e\x48\x17\x3e\x31\x46\x40\x88\x22\xa8\x84\x58\
+\x89\xa6\xd8\xf5\x33\xd1\x04\x63\x37\x31\x46\x31\x31\xd1\x7c\x46\
+\xa3\x22\x1a\x8d\x46\x14\x34\x80\x8a\x18\x0d\x48\x07\x01\xe9\x4d\
+\xaa\xf4\x76\x7b\x39\x7b\xaf\xff\x99\xfc\xef\x8b\xe3\xce\x3b\xeb\
+\x5a\x6b\xb7\x73\xce\x78\x9e\x7d\xf6\x3e\xab\xcc\x35\xd7\x9c\xa3\
+\xcf\x31\xc6\x2c\x64\x1a\x46\x0d\x0a\x11\x69\xe1\xbb\x14\x91\x6e\
+\xe0\xda\x79\x22\xb2\xb1\x88\x6c\x85\xcf\xd6\x22\xb2\x85\x88\x6c\
+\x29\x22\x9b\x89\xc8\x62\x11\xd9\x48\x44\x16\x88\xc8\x6c\xf5\xe9\
+\xe0\x19\x6d\xb4\x63\x9e\xd1\x13\x91\x09\x11\x59\xad\x3e\xcb\x44\
+\xe4\x29\x11\x79\x42\x44\x1e\x16\x91\x87\xf0\xb9\x1f\xdf\xbf\x15\
+\x91\x47\x44\x64\x45\xa0\x8f\x6d\xf5\x2e\x25\x9e\x33\x0d\x23\x02\
+\x66\x62\xa6\x61\xb8\x40\x62\x2f\x40\x88\x86\x48\x6c\x30\xc4\xbc\
+\x83\x88\xec\x2c\x22\xbb\xe3\x7b\x5b\x11\xd9\x46\x44\x16\x89\xc8\
+\xc2\x21\xcd\xa5\x61\x10\x8f\x8b\xc8\x7d\x22\x72\xaf\x88\xdc\x21\
+\x22\xb7\x88\xc8\x6d\x22\x72\x97\x88\x3c\xe8\xb9\xcf\x30\xa0\x69\
+\x86\x30\x02\x30\xcd\x00\x86\x2b\xe1\x8d\xc4\xb5\x61\x0b\x10\xf9\
+\xfe\x22\xb2\x8f\x88\xec\x29\x22\x3b\x81\xc8\x43\x40\x42\x2a\x1d\
+\x73\xeb\xfb\xed\x82\x32\xf2\x9b\xf7\x9b\x77\x08\xc1\x72\x11\xf9\
+\x8d\x88\xdc\x20\x22\x57\xe3\x73\xa3\x88\x3c\x10\x60\x08\x3d\x0f\
+\x03\x9c\x86\x3e\xc1\x34\x03\x18\x0c\xb4\xf0\xe9\x39\x24\x9e\x21\
+\xee\x03\x44\xe4\x08\x11\x79\x9e\x88\xec\x0a\xb5\xdd\x06\x4d\x20\
+\x9c\x37\x6a\x0e\xc3\x9a\x47\x4a\x71\x12\x6d\x69\x31\x38\x97\xc6\
+\x70\xab\x88\x5c\x2a\x22\x17\x8b\xc8\x15\xd0\x16\x52\xc7\x6a\x1a\
+\x1a\x86\x69\x06\xd0\x3f\x20\x22\xdb\x6a\xfd\xe6\x22\x72\x90\x88\
+\xfc\x9e\x88\xbc\x40\x44\x76\x13\x91\x59\xd6\xbd\x1a\xf9\xb5\x89\
+\x30\x4e\x60\xab\xf8\x1c\x0f\x0d\xeb\xa0\x21\xfc\xaf\x88\xfc\x4c\
+\x44\x2e\x81\xaf\x81\x50\xc0\x87\x30\xcd\x0c\xfa\x04\xe3\x86\x54\
+\xe3\x4a\xf4\xbb\x80\xd8\x5f\x22\x22\xcf\x17\x91\x4d\xac\xfb\xba\
+\x09\xd2\x73\x32\x80\x66\x0a\x24\x6e\x0d\x8f\x43\x33\x38\x0f\x0c\
+\xe1\x66\x75\x6e\x9a\x19\xf4\x01\x26\x2b\xa2\x0d\x12\x48\xb4\x62\
+\x79\xec\x8d\x64\x3f\x56\x44\xfe\x40\x44\x0e\x11\x91\x99\xea\x1c\
+\x91\xb8\x71\xe9\x9e\x62\xec\xfb\x8e\x97\x99\x4e\x81\x86\x19\x82\
+\xad\x21\x4c\xc0\x54\x38\x5b\x44\xce\x85\xff\x80\x40\xc6\x31\xed\
+\x33\x98\x86\xa1\x41\x0b\xce\x2b\x0d\xc6\x33\xff\xe7\x22\x72\x81\
+\x88\xac\xb5\x6c\xe4\x09\x7c\x88\xb4\x95\x3f\x85\x48\xd9\xc2\xa7\
+\xad\x7e\xcb\x80\x3e\xae\x67\x17\xcd\xb4\xcd\xa5\xc8\x75\x8e\xb1\
+\xfb\xb9\x88\xbc\x55\x44\xb6\xb3\xc6\x9c\x4b\x9a\xd3\x50\x01\xa6\
+\x35\x80\x7c\xd0\x6b\xe7\x02\xfb\xfd\xc5\x22\xf2\x47\x22\x72\x8c\
+\xe5\xc0\x9b\xa8\xa3\xd6\xdb\x9e\xbe\x94\x35\xb3\x19\xe8\xd0\x5c\
+\x11\x99\x83\x45\xff\xb9\x38\x36\x13\x9f\xb6\x25\x6e\xa9\x8e\x74\
+\xc1\xb5\xd6\x22\x08\x60\x95\xfa\x5e\x81\xe3\x86\x32\x43\xa0\x03\
+\x18\xb4\x67\xb0\x02\x68\xa7\xa7\x66\xb4\x4b\x45\xe4\xc7\x22\xf2\
+\x75\x11\xf9\x89\x88\xac\xf1\xcc\xcb\x34\x24\xc0\x34\x03\x48\x07\
+\xda\x9f\xc4\xe7\x1d\x45\xe4\x64\x11\x79\x1d\x3c\xf7\x62\x21\x60\
+\x36\xd1\x17\x09\xc4\xde\xc2\x7a\xe0\x26\x88\x00\x32\x6b\x86\x9b\
+\xe2\xb7\x09\x08\x98\xaf\x08\x7e\x06\x3e\xda\xce\x70\x99\x08\xb6\
+\x8a\xaf\xc5\xf1\x3a\x7c\x0c\x95\xad\xc4\xda\xde\x93\x30\xd6\x1f\
+\x47\x34\xd0\xa3\x22\xf2\x18\x28\xd3\xd5\x67\x72\x40\x7b\xc9\x20\
+\x03\xf4\x70\x68\xbf\x81\xf1\x11\x7c\x43\x44\xbe\x89\x25\x47\xfd\
+\xb8\x69\xf3\x20\x01\xa6\x19\x40\x18\x88\x4c\x5a\xaa\x18\x27\xde\
+\x9f\x89\xc8\xf1\xa0\x37\x51\xc8\x96\x45\xf4\x9a\x20\x5d\x84\x31\
+\x0b\x04\x6e\x42\xfc\xb6\x47\xd4\xcf\x16\x08\xef\x9b\xa7\xa4\x39\
+\xef\x65\x38\x1f\x3b\x63\x07\x06\xd8\xbf\x7d\x7d\xb2\x7f\xf3\xa5\
+\xa8\x35\xb4\xad\xc8\xa5\xb5\xd0\x10\x9e\x50\x61\x82\xf7\x20\x3a\
+\xe8\x21\x25\xa2\x35\x50\xfb\xa8\xc0\x10\xb4\x13\x91\xcd\x18\xbe\
+\x74\x96\x88\x7c\x51\x44\x2e\x0c\x30\xed\x69\xb0\x60\x9a\x01\xa4\
+\x11\x7e\x01\x82\x7f\x9b\x88\xbc\xd0\x52\xf1\x5d\xcb\x5b\xc1\x86\
+\x39\xe8\xb6\xb4\x5c\xa4\xc2\xfd\x76\x84\x43\x61\x63\xa8\xf1\xc4\
+\xe4\x09\x74\x8a\xcb\x06\x76\x74\x8e\xfd\xdd\x14\xd8\xea\xbc\x7e\
+\x2e\xdd\xf3\x6d\x65\x90\xf7\x60\x3a\x30\x4c\xf0\x4e\x84\x09\xde\
+\x8d\x63\x0d\x31\x03\xf2\x3b\x6d\x22\x18\x5f\xc1\x3f\xc3\x79\xa8\
+\xb5\x86\x69\x46\xe0\x80\x69\x06\xb0\x21\xb4\x2d\xfb\xfe\x64\x10\
+\xbe\x89\xcc\x13\xcb\x6b\x9d\x34\x7e\x5a\xad\xd7\x18\x38\x0f\x51\
+\x40\x7b\x62\x9d\x70\x6b\x30\x81\x19\xe8\xc0\x3a\x10\x3c\xef\xd3\
+\xcc\xa3\x18\xe2\x64\xba\xa8\x48\x33\x06\xbd\x9e\xd9\x56\x66\xc8\
+\x04\xcc\x84\xfb\xa0\xbb\xdf\x08\xc6\xb0\x3c\x61\xac\x12\xba\x64\
+\xcf\x89\x89\x3c\xfc\x9c\x88\x7c\x0b\xae\x0c\x7b\x6e\xa7\x61\x9a\
+\x01\x04\x09\xff\x35\x22\xf2\x2e\xd0\xa7\x28\x09\x62\xaf\x5d\x3b\
+\xc1\x87\xc8\xcf\x12\x91\xe7\x88\xc8\xbe\x90\xf4\x9b\x78\x08\xde\
+\x17\xe2\x37\xea\x13\x66\x13\xad\xb6\xfb\xa9\x29\xd0\x74\x99\x80\
+\xef\xe0\x76\x11\xb9\x56\x44\xae\xb7\x92\x07\x2a\x32\x83\xae\x65\
+\x1e\x98\x40\xa3\x7f\x82\xaf\x60\x9a\x11\x8c\x19\x3e\x0d\x02\xb4\
+\x33\xbc\x80\x37\xff\xbd\x22\xb2\xb7\x07\xa1\x92\x1b\x23\x6c\x0d\
+\x82\x7f\xae\x88\x3c\x1b\x4e\xbc\x52\x79\xd5\xeb\x12\xfc\x30\xe3\
+\x80\xeb\x32\x84\x0e\x18\x42\x0b\xda\xc1\x6f\x54\xe2\x80\xf1\x25\
+\x84\xc6\x35\x02\x36\xc3\x36\xfc\xe5\x93\x70\x18\xf6\xaa\x35\x39\
+\xf9\x60\x2a\x33\x00\xdb\xce\x37\x41\x3b\x1f\x40\x98\x6e\x16\xe1\
+\x93\x70\x35\x26\x6d\x0a\x9b\xe1\x40\x11\x59\x02\x6f\x61\x17\x0e\
+\xb1\x6e\x45\x82\xaf\x3a\x59\x55\xef\x2b\xfb\x70\x5f\x88\x21\xb4\
+\xa1\x7a\xb5\x61\x16\x98\x24\x81\xcb\x45\xe4\x2a\xac\x34\x10\xf4\
+\x8a\x42\x05\x46\x60\x9a\xfc\x98\x88\xfc\x37\xfe\x9f\xd2\xfe\x81\
+\xa9\xca\x00\xb4\x0a\x68\x12\x70\x3e\x24\x22\xc7\xe5\x12\xbe\x2d\
+\x42\x66\x20\x7d\xef\x50\x7c\x2f\x76\x10\xbd\xdd\x68\x6e\xb4\x5e\
+\xee\x35\xa3\xaa\x09\xf8\x8e\xf7\x1c\xcc\xc0\xac\x2e\xfc\x5a\x44\
+\x2e\x82\xa9\xc0\x58\x84\x4c\x11\x6e\x33\x82\x73\x44\xe4\x23\x48\
+\x48\x9a\xb2\x66\xc1\xa8\xe0\xd0\xa0\x40\x0b\x0f\x93\x94\xf3\x7e\
+\x11\x79\x0b\x34\x51\x9d\xb4\x92\xdc\x88\xa0\xa1\xc3\xf0\xd9\x1e\
+\xe7\x57\x5b\x51\x40\x1a\xaa\x38\xf0\x72\x27\x8a\xb6\xb3\x38\xa4\
+\xa5\xed\x48\x74\x05\xec\xd8\x0e\xc7\x5c\xf1\x58\xd6\x70\x24\x12\
+\x74\x14\xd0\x6c\xfc\x7f\x0f\x92\x05\x2e\x54\x59\x43\x2e\x0d\x2c\
+\x00\x7a\x9e\x27\x44\xe4\x0b\xd0\x08\x1e\xce\x6f\x6a\xfc\x61\xaa\
+\x30\x00\xfa\x9f\x98\x7f\xff\x27\x90\xfa\xc6\x3c\x17\x70\xfe\xa8\
+\x73\x8f\xcb\x5b\x84\x5d\xb1\x26\x78\x00\xbc\xf7\x8c\xa2\xe3\x03\
+\x43\x71\xf9\x75\x55\x7d\x12\xa5\xeb\x5a\x4d\xf0\xf4\xc2\x73\x79\
+\x8e\xee\x72\x3b\xdd\x90\x9f\xc2\x8a\xc7\xd5\xeb\xa0\xbe\x67\xa5\
+\x32\x88\x5c\xd3\xc0\xf5\x3e\x8c\x66\x7c\x0a\xa2\xfb\x02\x54\x20\
+\xf1\xcd\x51\x00\xba\x6a\xce\x4d\x8d\x82\x0f\x23\x8e\x40\x30\x5c\
+\xbe\xe2\x2c\x93\x0a\xa6\x02\x03\xd0\xaa\xdd\x7e\x22\xf2\x29\xa4\
+\xe2\x0a\xf0\x9c\x71\x2d\x5e\xb0\x91\xca\x38\xf3\x8e\x16\x91\xbd\
+\x80\x8c\x94\xf6\xad\x8a\x44\xdf\x94\xf4\x67\x1f\x67\x42\x62\x96\
+\x70\xac\x31\x38\xe7\x7e\xd8\xd2\x4f\x22\xaa\x6f\x42\x61\xfb\x5c\
+\x30\xb1\x4d\xc1\x15\x59\x5b\x6c\x81\xd2\x68\xc8\xdc\x5a\x7d\xd4\
+\x02\x52\x98\x01\x17\xfe\x67\xa3\x4f\xc6\xbb\xf7\x23\xf8\x0a\x32\
+\x19\x41\x09\xdc\x60\x1c\x81\xc9\x40\xfc\x4b\xf8\x20\xa7\x84\x59\
+\x50\x4c\x11\xa9\x6f\x68\xe2\x54\x11\xf9\x2b\x98\x96\xdd\x94\x75\
+\x7c\x8d\x44\xe6\xc2\x83\x91\xcf\x6b\xd2\xfc\x04\x44\x11\x5b\x9f\
+\xcf\x95\xf4\x55\x6c\x7f\x2e\x5f\x18\x22\x16\x10\xfc\x75\xb0\x97\
+\x6f\x85\x6e\x9b\xab\xd3\xb6\x60\xda\x2c\x81\x3f\x63\x6f\x14\x1a\
+\x14\x04\xf8\xb8\x54\xa6\xaa\x5a\x40\x55\xcd\x80\xef\x6d\x18\x81\
+\x20\xb6\xe0\x47\x28\x2a\xd0\xcb\x67\x04\x3d\xbc\xd2\x1a\xac\x16\
+\xfc\x1d\x7e\x77\x3c\x95\x9b\x26\x05\x4c\x56\x06\xa0\xcd\x74\x93\
+\x8a\xfb\x59\x68\xea\x49\xea\xbe\x6d\xe3\x1f\x8a\x25\x82\x5d\x81\
+\x25\xab\x1d\x92\x30\x95\x98\x73\xb5\x80\xd0\x04\x71\x2d\x6b\x2e\
+\x24\xe1\x35\x22\xf2\x3f\xf8\xd6\xc1\x35\xec\xab\x2b\xf6\xdf\xf5\
+\x2c\x57\x1e\xc2\x3c\x2c\x65\x1e\x89\xef\x59\xd0\x22\xf4\x7a\x5a\
+\x1d\x29\x1f\x3a\x1e\x3b\xc6\xbe\xce\x46\x5f\x6e\x85\x8b\xff\x62\
+\xf5\x5e\x89\x86\x7d\x57\xe1\xc6\x55\x08\x00\xbb\x74\x32\xfb\x06\
+\x26\x23\x03\x20\xc7\x6e\x43\xea\x7f\xd0\x3a\xe6\x7d\x67\x7b\x96\
+\xf7\x43\xfc\xef\x1e\x89\x84\xdf\x04\xc1\xa7\x9c\x23\x81\xce\xc3\
+\x4b\x19\x44\xff\xa1\xc3\x16\x96\xea\xc9\x37\xc1\xb0\xe5\x5d\xb0\
+\x64\x72\x18\xfc\x0b\x2b\x22\x7e\x82\x2a\x92\x3e\x74\xbc\x4c\x64\
+\x04\x37\x22\x41\xe0\xea\xbc\xe5\xc3\x52\x99\x05\x66\x78\x3f\x8e\
+\x8f\x3e\x36\x69\xa0\x98\xa4\xeb\xfa\xbb\xc3\xbb\x7b\xb8\x9a\xf3\
+\xa0\xe9\xaa\x55\x45\x13\xa1\x77\xa2\x8a\xfd\xb5\x09\x3f\x45\xcd\
+\xaf\xab\x11\xf8\xce\xd1\xfe\x9d\x03\xc4\x36\x51\x2d\x37\xd5\x8b\
+\x9c\x4b\x02\x57\xdb\xbb\x21\x6a\xea\xb9\x38\x47\x27\xa8\x1d\x93\
+\x9b\x4b\xf8\x55\x8f\x95\x0e\x46\x50\x40\x94\x7f\x17\x11\x87\x19\
+\x66\x41\x4f\xbd\xf6\x45\x48\x00\xbb\x71\xb2\xc5\x0d\x4c\x16\x06\
+\xa0\xe7\xf4\x14\x84\x7e\x2e\x4c\x91\xfa\xfa\xc6\x8d\x41\xf8\x2f\
+\x50\x2a\x2e\xaf\x49\x21\xfc\x54\x69\x5f\xd5\x19\xd8\x45\x40\xd1\
+\x32\x24\xc3\x9f\x67\xf5\x6f\x50\xfa\xa9\xfd\xbc\x03\x61\x5f\xed\
+\x81\xcc\xc5\x99\x60\x04\x6b\x3c\x49\x13\x55\x9c\x7f\x39\xd7\xd9\
+\x8c\x80\x26\x92\xc9\x12\x3a\x13\xe1\xc7\x7c\x8f\x5e\xba\x36\x60\
+\x86\xfd\x1d\x22\x72\x7a\xfa\xed\xa3\x0f\x93\x81\x01\x50\x2d\x9b\
+\x87\x2c\xb0\x3f\x4e\xb1\xf5\xb5\xba\x6f\x66\xf2\x28\x11\x79\x39\
+\xbc\xe0\x2b\x2c\x95\x21\x57\xe2\x37\x21\xe9\x5d\x8e\xbe\x85\x70\
+\xee\xfd\x0b\x12\x6a\x86\x6d\x98\xda\x14\x30\x13\xe6\xc1\xf3\x60\
+\x3e\x6d\xaf\x56\x49\x5c\x2b\x08\x75\x34\x83\x5c\x8d\xa0\x00\x82\
+\x3c\x0a\xb3\xe0\xc7\xca\x13\x5c\xc6\xc5\xb9\xc6\xa5\xaf\x8a\xc8\
+\xdb\x81\x26\x63\x6f\x12\x8c\x3b\x03\xe0\x04\x98\x84\x9d\x33\x80\
+\x77\x59\x52\x7f\x57\x64\xfd\xec\x01\x44\x5d\x67\x71\x8d\x9c\x65\
+\xbd\x7e\x39\xfd\x4a\x2c\xc7\x9d\x03\xbb\x66\x62\xc4\xd6\xa7\x5c\
+\x1a\x48\x1b\x76\xd8\x21\xd0\x0e\xb6\xc2\x7b\x70\x05\xc1\xf6\x17\
+\xd4\x71\x0a\xc6\x96\x0d\x09\x5d\xf8\x2c\x66\x43\x97\xff\xba\xf2\
+\x9b\x24\x6a\x03\x5c\x29\xb8\x06\x85\x60\x7e\x3d\xee\x4c\x60\x5c\
+\x19\x80\x16\x7e\x27\x21\x80\x83\x2a\x7f\x27\xe5\x26\x63\x43\xbf\
+\x0a\x92\xbf\x03\xc4\xd4\xaa\x6a\x1d\xc2\xaf\x6b\x0a\xf0\x1c\x91\
+\xd7\xa8\xfd\x5f\x13\x91\xff\x1c\x71\xdd\xd3\xe7\x34\x9c\x0b\x3f\
+\xc1\x91\x58\x4e\x9c\x8f\xf1\x5e\xeb\x71\x1c\xd6\x55\xfd\x5d\xff\
+\xeb\x68\x47\xce\x7f\x17\xcb\x86\xdf\x51\xf3\x9f\xa0\x0d\x10\xc7\
+\x96\xc2\x2f\xf0\x9f\xf9\xe9\x09\xa3\x03\xe3\xc8\x00\x34\xfe\x7f\
+\x14\x09\x3c\x51\x95\x5f\xdf\x64\xd6\xb5\x5f\x8f\xe2\x1b\x21\x75\
+\xbf\xae\xc4\xaf\xab\x11\xf4\x20\xf9\xff\x0d\x6a\xeb\xb8\x61\x99\
+\x4b\x33\xd8\x1e\xd1\x93\x47\x20\xd0\x88\xbe\x02\x5e\xdf\xa4\xea\
+\x1f\xba\x5f\x9b\x05\x77\xc3\xb0\xbf\x36\x9d\xc1\x6a\x5c\xfb\xb8\
+\xc2\xc1\x51\xe5\xcd\x93\x86\x01\x50\xf3\x9d\x07\xa1\x78\x62\x4a\
+\x50\x0f\x67\x65\x26\xaa\x7b\x98\x60\x1e\x81\xca\x9f\xa2\xee\x37\
+\xa1\x01\xe4\x10\x7e\x81\x97\x32\xd5\x45\xff\x5d\x44\xfe\xab\x0f\
+\x2a\x7f\xaa\xd4\xed\xd7\x0a\xc2\x46\x60\x02\x47\xa1\x28\xca\x04\
+\xa4\x70\x2a\x23\xc8\xfd\x3f\x64\x16\xcc\x42\xff\xce\x45\xf5\x90\
+\xb5\xf9\x26\x81\xf1\x2d\xbe\x01\xe1\x17\xa3\x64\x9d\x4d\x2a\x06\
+\x40\x5b\x6b\x07\x68\x6d\x07\xa4\xa8\xfc\x9c\xa9\x9d\x91\x00\xb0\
+\x0b\xdc\xb9\x92\x20\xf5\xeb\x12\x7e\x55\x46\x40\xe2\xff\x1e\xa4\
+\x7f\x13\xeb\x4e\xba\x5a\x6f\xaf\xc6\x35\x75\xc1\x76\x5c\xce\x44\
+\x91\xc5\xe3\xe0\x8f\x21\x23\xd0\x7d\xe9\x37\x23\xe8\xe1\x7b\x01\
+\x52\x90\xbf\x88\x25\xc3\x94\x65\x4c\x85\x83\x57\x8a\xc8\x2b\xb1\
+\x29\xea\xd8\xf8\x05\xc6\x85\x01\x70\x40\x0f\x00\x5d\x6c\x13\x23\
+\x7e\xcd\xc1\x8f\x85\xe4\x9f\x09\xe4\x6a\x67\x12\x7b\x13\x84\x9e\
+\xca\x0c\x7a\xb0\x91\xaf\x42\x04\x93\xd4\x50\xfb\x75\x60\x84\x0d\
+\xb3\xd4\xe0\x4d\x78\x0a\x77\xf6\x73\xc1\xdb\x66\x04\x2d\x68\x04\
+\xc7\x83\x49\xb3\x34\x79\x53\x8c\x20\xe5\x5c\x17\xbe\x81\xb5\xd0\
+\x04\xce\x51\x7d\x8b\x30\x44\xe2\xe2\x7d\xd0\x4a\x2f\x1f\x17\x26\
+\x30\x0e\x0c\x80\x03\xf9\x12\x38\x5c\x16\xc4\xec\x7d\xea\x60\xe6\
+\xc2\x3f\x45\xc4\x9a\x1d\xb6\x5a\x45\xea\xf7\xcb\x19\xc8\x63\x3d\
+\x78\xa9\x97\x63\xc1\xf9\xb1\x00\xf2\xe7\x12\xd7\x12\xac\x74\x2c\
+\x41\x4c\xff\x02\xb5\x21\xe1\x1a\x68\x45\x0f\x42\xf2\x5d\x8f\x70\
+\x5a\x3e\xb7\xdf\xbe\x07\x4d\x60\x1d\x64\x6a\x9d\x00\x7f\xc1\x0a\
+\xc7\xca\x4c\xd3\x84\x6f\x6b\x03\x0c\xaf\xfe\x25\xb4\x81\x65\x69\
+\x7a\x3d\x71\x72\x19\xe4\xcd\x39\xe3\xc0\x04\x46\x9d\x01\x70\x00\
+\x5f\x8b\xf5\x57\x0a\xa5\x56\x0c\x99\x96\xa8\x6d\x64\x96\x79\x3c\
+\xfc\xa9\xc4\x3e\x08\x53\x80\x2f\xb5\x00\x92\xff\x92\x8a\x1e\x25\
+\x7d\xcf\x62\xec\x58\x72\x04\xec\x26\xe6\xd4\xeb\xaa\xc2\x62\x55\
+\xf5\x65\xe6\x9f\xd1\x63\x7f\x21\x22\xe7\xa3\x20\x87\xdd\x76\x3f\
+\x40\xb7\x3f\x17\x7b\xaa\xbd\x0c\xef\x41\xb3\xad\x68\xd8\x07\x60\
+\xaf\x10\xf0\x9b\x0e\xd8\x7b\x45\xe4\xf3\x60\x88\x09\xef\xcf\x69\
+\xec\x21\x20\xed\x8c\x51\x67\x02\xa3\xcc\x00\x38\x70\x6f\x43\xec\
+\x4b\x30\xa4\x57\xdb\x6b\x2f\x44\x34\xd0\x0c\xcb\xd1\x97\x42\xe0\
+\x83\x36\x05\x74\x5c\xbf\xf9\xfd\xff\x90\xc8\x52\x87\xf8\x67\x42\
+\x82\xbe\x14\xd2\x7e\x8d\x8a\xca\xf3\x31\x3f\x8d\xfc\x2d\xb5\x93\
+\xd0\xc3\x58\x81\xf8\x7e\xba\x73\xac\x36\xe8\x67\x6c\x09\x71\xfa\
+\x42\x15\x47\xd0\xea\xa3\x06\x60\x9b\x04\xb3\xa1\x81\x7c\x05\xb9\
+\xc2\x09\x7e\x01\x1d\x42\xfc\x0e\xe0\xee\xc8\x32\x81\x51\x64\x00\
+\x14\x48\x66\xc0\xfe\x1a\x69\x99\x41\x4f\x3f\x11\xa6\x40\x74\xc6\
+\x4b\x81\x28\xb9\x2a\xff\x20\x35\x00\x51\xc4\x3a\x07\xf1\xfc\xff\
+\x86\x12\xb6\x75\x88\xdf\xd8\xcf\xef\x44\x10\x0e\xd5\x67\xfa\x02\
+\x72\x80\xb6\xff\x0c\x30\xa7\x1b\x11\x66\x79\xcb\x80\x98\x80\x6d\
+\xc6\x3c\x17\x6e\xf6\x5d\x60\x22\x69\x66\xd6\x04\xb1\xc7\x4c\x02\
+\x33\x47\x3f\x80\x48\x2f\xe3\x63\xa0\x57\x08\x4c\x42\xda\x27\x46\
+\xb5\xc8\x48\x31\xc2\xc4\xff\x41\xd4\x6c\x4b\x22\xfe\x79\x50\x15\
+\x0e\x86\xba\xa8\x03\x4c\x8a\x86\xa4\x7e\x13\x8c\x80\x98\x41\xc2\
+\x7a\x10\xcb\x7c\xe7\xa8\xa2\x22\xb9\xc4\x45\xfb\xf4\x45\x20\xfe\
+\x99\xf0\x79\x44\x0b\x1e\x24\x80\xd6\x50\xd6\x20\xaf\xfa\xa7\x03\
+\x5c\xeb\xd2\x8c\x60\x26\x82\xb7\x4e\xc0\xf8\xad\x54\x3b\x23\xd9\
+\x7d\x8e\xfd\x4e\xb9\xae\x54\xdf\x0c\xc5\xbe\x0c\x22\x7d\x45\x1e\
+\x13\xf8\x08\x2a\x0e\x8d\x1c\x13\x28\x46\x94\xf8\x19\xe0\x13\x0c\
+\xeb\xe5\x04\x18\x35\xf1\x3d\x58\x4f\x5e\xa6\xbc\xdb\xfd\x92\xfa\
+\x55\x19\x01\xb3\x4a\xe6\xc1\xc1\xf7\x63\xa8\xd7\x75\x6c\x6c\x12\
+\xe2\xf1\x08\x50\x5f\x99\x5a\xdf\x2c\x13\xd8\xe6\x5c\x10\xc0\x59\
+\x03\x5e\xf0\xd6\x63\xb3\x0b\xb6\x60\xde\x03\xe1\x78\x94\xc8\x4d\
+\xa9\xfe\xbe\xdf\x13\x60\x02\x66\x87\xa3\xd3\xc0\xbc\x13\x98\x00\
+\xa7\xfd\x63\x2a\x35\x7d\x64\x98\x40\x31\x82\xc4\xff\x21\x70\xcb\
+\x20\xf1\x13\xf9\x96\x80\xf8\x37\x51\x12\x81\x0d\x4a\xe0\x77\x15\
+\xa9\x5f\x95\xf0\xa9\xae\x2e\x00\x83\xfa\x31\xd6\x32\x1f\xc1\xf9\
+\xaa\x2a\x35\xef\x33\xc1\x34\xef\x53\x45\x40\x52\x97\x1c\x43\x10\
+\x5a\x76\x9b\x8f\x92\x39\x3f\x1e\x70\xe8\x9b\xd6\x06\x66\x20\x15\
+\xf9\x44\xf4\x8b\xbe\x9e\xa6\x1c\x81\x21\xbf\xc0\x5c\x30\xf0\xd3\
+\x10\x37\x10\x61\x84\x9a\x09\x7c\x18\xda\xc0\xc8\x30\x81\x51\x61\
+\x00\x1d\xcb\xe6\x4f\x22\xfe\xfd\xb0\x75\xcf\x2c\xa8\xa7\x36\xf1\
+\x0f\x5b\x03\xa0\xd7\x72\xbe\x4a\x47\xfd\x0e\x3c\xcb\x75\xd7\xd9\
+\x49\x78\x26\x0b\xea\xd3\x18\xb0\x58\x75\x9e\x26\x80\xcf\xe8\x80\
+\xf1\x56\xf5\x59\xd4\x81\x96\xe5\x1b\x78\x2b\x92\x8d\x96\x2a\x1c\
+\xe8\x87\x06\x50\x5a\xd1\x83\x6b\x91\x77\x7e\x75\x1e\x13\xd0\x3e\
+\x81\xa1\x3b\x06\x8b\x11\xf4\xf6\x27\x11\xff\x61\xb8\xa1\x54\xb6\
+\x73\x3f\x88\xbf\xaa\x06\xc0\xa0\x92\x19\xa8\x5e\xfb\x1f\x70\xa4\
+\x35\xb1\xae\xce\xe7\xcc\xc5\xe6\x77\x5b\xab\xa0\x19\xdf\xb5\x65\
+\xc6\x64\xeb\x6b\x5d\x7d\xec\xc1\x3b\x7e\x3f\xe6\x80\x75\x13\x06\
+\x29\xce\xe8\xd8\xec\x62\x99\xf0\xad\xa8\xfe\xb2\x54\x9d\xb7\xfb\
+\xd4\x24\x13\xe8\x01\x71\x0b\x2c\x13\x5e\x94\xc7\x04\x46\x66\x75\
+\x60\xd8\x0c\x80\x03\xf0\x3a\xc4\xf6\x07\x1d\x7e\xda\xd9\xf5\xa7\
+\x56\xf5\x99\x1c\xe2\xef\xa7\x33\x90\x5e\x9f\x05\xd8\xf8\xf2\x3f\
+\x20\xf9\x9b\x0c\xa8\xa1\x04\xfc\x53\xa4\x32\x3f\x11\x0a\x89\xec\
+\x13\x4c\x80\xf0\x4c\x4a\xed\x97\x86\x98\x05\xa3\x9f\x6b\x96\x0b\
+\x5f\x8d\x95\x8f\x75\x56\x59\x34\xa9\x40\xe4\x29\x4c\x80\x4b\xa6\
+\xff\x96\xe6\x1c\xd5\x8e\xc1\xd7\x61\xf8\x86\xca\x04\x86\xc9\x00\
+\xf8\xe2\xc7\xa8\x6d\x9a\xb4\xf3\xde\x09\x47\x21\xa6\x9f\x89\x23\
+\x29\x9e\xfe\x41\x98\x02\x24\xec\x05\xf0\x10\x7f\x1f\x65\xa8\x56\
+\x3a\x96\xb4\x9a\x40\xf8\x6d\x50\x1b\xa0\x18\xd0\xc4\xfa\x98\x56\
+\x0f\x0e\xb9\xfb\x87\xc8\x04\xf4\xf8\x1e\x0c\xb3\x70\x3e\xe6\xa1\
+\xdd\xa0\xd4\xf7\xad\x10\x08\xb4\xbd\x7f\x47\x7a\x71\x04\xb4\x0c\
+\x38\x0e\x85\x9d\x86\xc6\x04\xfa\x6d\x32\xfa\x80\x0e\x3f\x53\x3c\
+\xe6\xdb\x01\xdf\xdc\x33\x07\xdb\x58\xfe\x79\x93\xa3\x08\xe5\x20\
+\x88\xdf\x7e\x8e\x2d\xf5\x67\xa8\x65\xa2\xff\x8b\xf5\x62\x2e\xc5\
+\x91\xed\x37\x09\x2f\xc3\xf3\xec\x7d\x06\xa3\x1c\xb4\x22\xb8\x9e\
+\xc1\xa4\x25\xb3\x02\x31\x4c\xd0\x62\xf5\x52\xec\xec\x7a\x0f\xfa\
+\xd6\x6d\x60\xfe\x0b\xcf\x31\x3d\xd6\x06\x27\xdf\x08\xa7\x64\x64\
+\xa3\x09\xdd\xc4\x77\x40\x03\x34\x7b\xa7\x04\x03\xa0\xe9\x66\xa2\
+\x74\xcf\x86\xd0\xf4\x46\xf8\x11\x66\x62\x67\xdd\x42\x85\xb4\x6a\
+\x70\x11\x67\x68\xe2\x52\x7f\xfb\xda\x21\x94\x20\xc4\x65\x70\xc6\
+\x7d\x00\x3b\xdc\x12\x09\x9a\x24\x7c\xb6\xb7\x00\xe1\xbd\x3a\xb1\
+\x49\x5f\xd3\xcf\x8f\x86\x36\xfa\x70\x04\xfa\xe4\x0a\xce\x19\x24\
+\x70\xa9\xf2\x1e\x6c\x00\x71\x25\x36\x3b\xd1\x73\x90\x3a\xff\x84\
+\xd8\x79\xed\x13\x69\x21\xeb\x94\x39\x16\x01\xa0\x5c\x98\x0f\x1a\
+\xd8\x4e\x99\xbf\x03\x85\x41\xcf\x17\xc7\x71\x0e\x42\xcd\xf7\xcf\
+\x5d\xb6\x7e\x1e\x82\x41\x76\x51\xb5\xe6\xb4\xfd\x3b\x28\x6d\xa0\
+\xab\x76\xe0\xb9\x00\xea\xdf\xa3\x0d\xab\xfb\x36\xd0\xbe\x3c\x02\
+\x8b\xca\x4c\x52\x69\x72\xc2\x73\xfd\x13\x4c\xba\x32\x8c\xef\x7f\
+\x47\x24\x19\x9e\xa6\x48\x1b\x81\x51\x47\x63\x37\xa4\x50\x08\x71\
+\xe9\xf8\x1d\x3b\x36\x01\xcd\x6f\x0e\x92\xa8\xbe\xad\x76\x1a\x4d\
+\x04\xe2\xfe\xd5\x8a\xa7\x37\xe1\x26\x4a\x86\x41\xfa\x8e\xa8\xc9\
+\x4f\x40\x43\xde\x3f\x96\xd2\xeb\x6a\xe0\x4a\x54\x6e\x39\x0a\xaa\
+\xe7\x66\x89\x55\x7d\x9a\x22\x7e\x8d\xf4\x86\xe0\xff\x11\x31\xe2\
+\x1a\xf1\xfa\x3d\x7b\xfb\x47\x3c\xfe\x75\x20\xa5\x0d\xfb\xfd\x5a\
+\xe8\x93\x61\x00\xa3\x00\xd4\x44\xcc\xf7\x67\xb0\x8f\xe0\xab\xb0\
+\x42\x60\xcf\x6b\x19\xf8\xed\x3b\x46\xe6\xbe\x11\x70\xe0\x5b\xb0\
+\xfd\x59\xe2\x2c\x63\xfe\x49\x0f\xcf\x05\x4d\x9c\x38\xe8\x18\x81\
+\x41\xaa\x1c\x3a\xca\xef\x04\x38\x6a\xb3\x18\x10\x89\x7c\x1d\xbc\
+\x86\xef\x43\x08\x6d\x1b\xd1\x75\x21\xb3\xc0\x75\x2c\xf7\x37\x9f\
+\xbf\x11\x36\xe3\x78\x17\x88\x9f\xcb\x16\xfd\x76\x80\xd1\xde\x5f\
+\x62\xed\x45\x18\xb3\xfb\xed\x6b\x42\xea\x7d\x6e\x7b\x2d\xf4\x65\
+\x67\xa5\x19\x8d\x02\x68\xc2\xfd\x32\x92\x79\x8c\xa9\x46\xc8\x51\
+\xfd\x35\x30\x2c\x7a\x06\xbc\x77\xef\x43\x8e\x00\x13\xa5\x2a\x50\
+\x6d\x07\x28\x7d\x02\x14\xbb\x81\xfa\x03\x06\x65\x02\x50\x33\x7c\
+\x25\x1c\x1f\x49\x9b\x72\xe6\x84\x86\xfe\xa1\x52\x29\xd6\x58\xc4\
+\xd1\x84\x36\xc0\x08\xb0\xb5\x40\xa6\xb3\xad\x17\xeb\x37\x90\x01\
+\x2d\xc4\xf3\x37\x52\xdb\x8f\x0f\xcb\xee\xa6\xae\xda\x81\x94\x3d\
+\x45\xe5\x61\x0c\x3d\xc4\xcd\x81\x2b\x2f\x47\x15\x4f\x1d\x31\x59\
+\x26\xa8\xfe\x74\x32\xce\x02\xe1\x5f\x85\xc2\x14\x19\x15\x85\x63\
+\xa0\x63\x04\x4e\x02\x8d\x0c\x04\xb5\x06\x81\x3b\x1c\x9f\xe7\xa0\
+\x52\xca\xdc\xa6\xf0\xd6\xb6\xb7\x9f\x8f\xd1\xdb\x49\xed\x7e\x6b\
+\x73\x99\x9c\xdf\x44\x90\x1e\x9c\x49\xb7\x40\xe5\xbf\x6d\x08\x05\
+\x3a\xd9\x97\x6d\x51\xa4\xa2\x35\xc0\xc9\x2d\x13\x9e\x33\x01\xe2\
+\xba\x77\x04\x19\x80\x28\x6a\xfa\x03\x04\x0d\xc5\x98\x80\x4d\x95\
+\x73\x51\x23\xe1\xdb\xca\xd4\x69\x18\x07\xd8\xd4\x4a\xec\xb5\x72\
+\xd3\x20\x56\x56\xfb\xed\x03\x20\x8d\xce\xc5\xd8\xcd\x6f\xd2\xdb\
+\xc9\x11\xe3\x44\x5c\x04\x1f\x81\x2e\x24\xb1\x42\x05\x6c\xe4\x6a\
+\x03\x3a\xa8\xe7\xbf\x91\xab\xbf\xba\x26\x6b\xd6\xfd\xc8\x59\x1e\
+\x24\xa2\x32\xba\xb0\xeb\xb0\x4d\xfb\x05\xae\xb6\xb5\x8d\x5c\xaa\
+\xb4\x66\xdd\xa7\x51\x02\x7a\xdb\x7e\x88\xfe\xbd\x15\xda\x4a\xe9\
+\xb1\xf5\x39\x2f\x0b\xe1\x40\xfc\x2e\x54\xfd\x55\xfd\x73\xf4\xb2\
+\xc9\xf9\xa0\x95\x83\xa1\xcc\xf6\x75\x38\x3b\x03\xb2\xfb\x4d\xb4\
+\xe4\x5e\xb9\x4e\xbf\x54\xd0\xa5\xaf\x56\x23\xbd\xf6\x42\x68\x03\
+\x47\xaa\xe5\x2a\x5e\x93\xaa\xf2\xcf\x41\x87\x3f\x83\x8a\xb1\xbc\
+\xbf\x0a\xf1\x37\x15\x0f\xe0\xb2\x59\x6d\x02\xed\x17\x33\x28\x03\
+\x5a\x12\xfd\x01\xa3\x0c\x94\x3c\x3f\x00\x13\xfd\x33\x47\xe8\x70\
+\x0f\x9f\xb9\xf8\xfe\x29\xd4\xfd\x07\x06\xe3\xe8\x25\xbd\xec\x05\
+\x9a\x39\xa5\xdf\x41\x42\xfd\x64\x00\x7c\x99\xd7\xa3\x96\x43\x5f\
+\x88\xdf\x57\x8a\xe5\x41\xe4\xae\x5f\x80\xf0\xd0\x7d\x55\x0d\xfa\
+\x98\x59\xd0\x05\xe7\x37\xea\xec\xa7\x94\x2e\x56\x85\x80\x89\x30\
+\xda\x5f\xb1\x1f\x16\x7e\xaf\x41\xc9\xad\x1c\x16\xbf\x4e\x39\x03\
+\x5d\xfd\xef\x27\xd8\xcf\xd1\x52\xb3\xab\xb6\xff\x1a\x65\xd0\x75\
+\xbc\xe7\x00\x39\xb9\x44\xc8\xa5\xdd\x59\xd8\x82\xed\x1b\xd8\xfa\
+\x47\xfa\x18\xd0\xe5\x00\x12\xfc\x1b\xb0\xdb\xfb\x19\xfd\xf4\x07\
+\xf4\x0b\x77\x74\x81\x9a\xab\x9a\xb4\xfb\x53\xc1\x56\xd3\x7e\x1f\
+\x1a\xc1\xb6\x1e\xff\x80\x56\x67\x17\x21\xa2\xec\x1f\x80\x1c\x55\
+\x46\xdf\x7e\xfe\xe1\x70\x42\xed\x05\xc4\x6b\xc3\x71\xf6\xea\xc4\
+\xe2\x9f\x3c\xbf\x19\x8a\x23\x72\x67\x9b\x41\x49\x7f\x09\xc4\xd5\
+\xb7\x31\xa6\xa7\xa8\x58\x88\x51\x33\x01\x34\x50\x5b\xe9\x8a\xc8\
+\x5b\xb0\x9c\xbc\x0c\xba\xf7\x7d\xd0\xbf\xcf\xb7\xcc\xcb\x01\xbf\
+\x8f\xf6\x07\xec\x9f\x5e\x92\x30\x1f\xfa\x21\x91\x89\xfb\x6d\x6c\
+\xb8\xd2\xa8\xdd\x5f\xd5\x3f\x70\x3e\x0a\x6d\xb2\x56\xde\x42\x38\
+\x82\x88\xc0\x54\x63\x17\xc0\xde\xfb\x82\xf2\x1d\xe4\x12\xbf\x56\
+\x13\xf7\x02\x61\xec\x8f\xff\x57\x81\xf0\x05\x6a\xe8\xc6\x99\xd5\
+\x7f\x9f\x44\xf2\x0f\x4b\x23\xa7\x12\x7c\x2e\x63\x28\x33\xb4\x80\
+\x0e\xfa\x65\x3e\xe3\x00\x94\xe4\x2d\xf8\x75\x16\xc3\xe0\xfe\x26\
+\xea\x34\xe8\x7d\x23\x86\x91\xdb\x60\xf9\x03\x4e\x87\xfc\xe0\xf1\
+\x72\xd4\x19\x80\x2e\xe9\x75\xc8\x20\x54\xff\x54\xff\xc0\x72\xe8\
+\x53\x3f\x87\xe4\x3d\x1c\x23\xba\x02\xaa\x9f\xf9\xfc\x2b\x90\xa0\
+\x8a\xa3\x47\xdf\xb3\x00\xb1\xe1\xc7\xa9\x52\xdf\x94\x3c\x1d\x15\
+\x3e\x6a\x18\x40\x6e\x0c\xc4\x3d\x08\x8b\x5e\xd3\x47\xe9\x1f\x6a\
+\xcb\xc6\xc0\x99\xe8\x53\xd5\x92\x66\xc3\x00\xbd\xe4\xf7\x8f\xd8\
+\x15\xda\xbc\x83\xcb\x6c\x1b\x12\x90\x8e\x0c\x0d\xbd\x1f\xf1\x33\
+\x8d\xfb\x03\x5a\x7d\xea\xf4\x01\x88\x0e\xed\x47\x75\xaa\x5a\xfe\
+\x81\x16\x26\xfa\x13\xe8\xe0\x2d\x20\xc2\x1e\x46\xf8\x7b\x81\x34\
+\xd2\x10\x68\x1b\xf1\x10\x48\x96\x57\x80\x60\xb9\x8f\xb4\xed\x7b\
+\x98\x81\xac\xbe\x54\xe2\xe5\x35\xd7\x5a\x65\xcf\x42\xb6\x95\xed\
+\x34\x4c\xf9\x48\x62\x9b\x3c\xdf\x56\xfb\xea\x0d\x2b\x26\xa1\x0a\
+\x94\xf8\x5e\x09\x9c\x18\x54\x40\x57\x06\xd0\xfa\xfc\x80\xda\x09\
+\xab\x51\x7a\x6a\x52\x32\x17\x4a\x20\x7c\x51\x85\x34\x8e\x0c\x4e\
+\xd0\x2c\x20\xf2\x1a\xe7\xc4\xaf\x60\x12\xdc\x01\x87\x4f\x15\x7b\
+\x9f\x12\xa3\x83\x6c\xc5\x93\xf0\xff\x53\xaa\xd6\x3e\x41\x0f\x86\
+\xe9\xcb\x8e\xea\x77\x4a\xff\x05\x19\x87\xdc\x84\xce\xd5\xae\x0b\
+\x72\x26\x21\xc5\xc1\xc8\xbe\x70\x27\x8c\xcb\xac\xe3\xe3\x04\x05\
+\xbe\x47\x88\xf0\xed\xae\x75\x40\x53\x07\x29\x9a\x2a\x47\x4d\x03\
+\x20\xed\x9c\x0a\xa7\xfb\xd0\x52\x1c\x73\x6c\xc0\x1e\x0a\x5c\xfe\
+\xba\xa2\xbd\xcf\xb2\x5e\x5b\x43\x95\x7c\x2d\xec\xfc\x35\xaa\x62\
+\x8c\x4b\xa2\x32\x84\x76\x49\x86\xd4\x61\x9f\xef\xc6\x0a\x02\xf7\
+\x12\x70\x11\x69\xaa\xb4\xcf\xd1\x0a\xec\xf6\x4b\xf4\xe1\x5a\xf4\
+\x69\x5c\xd4\x7f\x1b\xca\xd1\x66\x5c\xd4\xaa\xf7\x45\xc9\xbc\x46\
+\xb5\xea\x56\x1f\xd6\x2f\x1b\xef\x64\xbf\x80\xc8\x4a\x29\x9d\x6b\
+\xef\x93\x61\x1c\x84\xd2\x5c\xfb\xc0\x41\xc7\x5d\x76\xf4\xb5\xfa\
+\x37\xef\x5d\x8b\xe5\xc0\x2d\x1d\xd7\x85\x9e\x2b\xca\x4f\xa1\xdb\
+\x8c\x99\x03\x75\x20\x64\x2a\x9c\x99\xd1\xff\x69\xa8\x2d\x5c\xf7\
+\x6c\x52\xb8\x36\xed\x03\xf8\x1c\x4c\x80\xb1\xc2\x87\x6e\x05\xe2\
+\x17\xdc\x63\x92\x1b\xfe\x5e\x55\xfc\x9d\x61\x5d\xe7\xd3\x00\xb8\
+\x76\xbe\x18\x8c\x83\x4c\x21\xa5\xaf\x05\x92\x91\xae\x54\xab\x01\
+\xae\xfe\x35\x29\xfd\x7d\x19\x91\x57\xa0\x2f\x7c\x9f\x69\xe8\x0b\
+\x68\xf3\xda\x04\x08\x35\x06\xad\x06\xb9\xd3\x1b\x91\xd3\x3c\x16\
+\xd2\xbf\x2a\x50\xf5\x2d\x51\x87\xff\x9d\x50\xf7\x75\x6a\xa3\x8b\
+\xd8\xf5\x6f\x9b\x98\x0e\xcb\x54\x43\x69\x32\x7c\xde\x8a\x67\x08\
+\x11\xac\xfd\xfc\x54\x55\x5f\xb7\xa5\xaf\x6b\xe3\x9d\xff\x75\x00\
+\xa1\xc8\xd3\xb0\x41\x39\x88\x3f\x6e\x8a\xce\xea\x32\x00\x3a\xbf\
+\x37\x41\x39\xef\x61\x17\x85\xe9\x2b\xf0\x65\x67\x23\x6f\xf3\x64\
+\xb5\xa6\xef\xab\x45\x10\xd2\x00\x18\xa2\xbc\x3f\x96\xa1\x52\x07\
+\x8f\xbe\x80\x1b\x51\x88\x64\xb1\xb5\x36\x94\x4b\xe0\x92\x79\x2f\
+\x0b\x82\x7e\x19\x7d\x18\x57\xdb\x7f\x0c\x81\xbc\xff\xef\x40\x73\
+\xd1\x4a\x5a\xfd\x66\x00\xec\x90\xd9\xec\x60\xf3\x01\x95\xa6\x1f\
+\x0a\x10\xc9\x17\x40\xe5\x7f\xa1\xaa\xc6\xeb\x92\xba\x29\x1a\x40\
+\x01\x62\xda\x0c\x5b\x62\xf3\x39\x39\x21\xad\xa7\xa3\x18\xc5\x26\
+\x2a\x3d\xd8\x86\x26\x1d\x7f\x13\x60\x56\x3f\xc2\xb3\xa7\x89\x7f\
+\xa0\xc0\xe1\xde\x02\x9b\x8c\xd4\x16\xb8\x45\x03\x2a\xc9\x3e\x30\
+\x47\x5d\x29\xf8\x93\x6a\xd4\xa9\xe6\xec\x8e\x24\x92\x9c\x2d\xc8\
+\x7c\xe7\x4a\xc4\x9e\xdf\x85\x88\x41\x4a\xf2\x14\x73\x80\x6d\xcc\
+\xc6\x2e\x35\x87\x8a\xc8\xe3\x7d\x8c\xba\x9a\x40\xcc\xc4\xc5\xd8\
+\x14\x64\x75\x46\x5f\xa7\xa1\x31\xd0\x25\x0a\xf6\x47\xda\x42\xe5\
+\x5c\x81\x26\xa4\xf5\x27\x81\x73\xe5\x64\x26\xfe\x4d\x41\x64\xcf\
+\xa9\x40\xfc\x21\x53\x80\x19\x8c\xbb\xaa\x2d\xb0\x53\x27\x85\x84\
+\x67\xcc\x88\xbf\x40\x75\x22\xea\x85\x3a\x31\xaa\xee\x87\x51\x71\
+\x9b\xe0\x19\x7f\xa1\xb2\x2b\xa7\x89\x7f\x68\x6e\xa8\x0e\x68\xaf\
+\x76\x63\x55\x80\x1c\xe7\x18\x64\xca\x4e\x4a\xc7\x9f\x26\xfe\x4f\
+\x07\x36\x1f\xad\xa3\x01\x88\xf2\x2b\xfc\x46\x69\x01\xb9\x4e\x41\
+\x32\x8e\xb7\x21\x16\x81\x99\x24\x45\xa4\x18\xa6\xaf\x7f\xa2\xf2\
+\x19\xe6\xa2\x8d\x33\xb0\xcc\x43\xe6\x52\x87\xf8\x7d\x0c\xd1\xd5\
+\xa6\xd6\x96\xf8\x3d\xcd\x78\x84\x34\x77\x34\xb6\x69\xac\xa4\x05\
+\x54\x65\x00\x54\xf7\xaf\x40\x76\xeb\xa4\x63\x00\x5a\xed\x3f\x0d\
+\xc4\xcf\xe8\xbb\x54\xa9\x1f\xfb\xad\xff\xe7\x92\xe0\xa7\x50\x64\
+\x32\x77\x36\x35\x91\x1c\x02\x46\xb0\x3b\x56\x28\x58\x6a\x36\xe6\
+\x0c\x24\x61\xf1\xda\x39\x30\x4f\x6e\xc4\x8a\x03\x97\xfb\x78\x6d\
+\x55\xa4\x69\x22\xad\x56\x87\xed\x4e\x51\x66\xd0\x55\x15\x85\x0f\
+\xac\x3a\xac\x55\x18\x00\x71\xf3\x64\x24\x50\x4d\x3a\xe2\x27\x92\
+\xce\x07\xf1\x6b\x9b\x3f\x46\xd8\xa9\x52\xdf\x35\xf0\x6d\x10\xac\
+\xd9\x33\xea\xb7\x15\x1d\x6c\xbc\x67\x26\x12\x91\x8e\x47\x4e\x76\
+\x07\x81\x47\xac\x27\x60\x13\x0d\x57\x25\x66\xe0\xde\x09\xe4\xa0\
+\x9e\x85\x6a\x48\x2c\x7a\x59\x85\x70\x5d\xf7\x75\xa0\x59\x99\x5c\
+\x88\x67\xc1\x83\xbc\x08\x63\xce\x40\x92\x2e\xf2\x28\x96\x62\x27\
+\xe5\xfb\xf1\x79\x00\xef\xa1\xdb\x9f\xa2\x9a\x41\x17\xd3\x76\x32\
+\xea\x96\x64\x6b\x01\xb9\x0c\x80\x02\x64\x06\x22\x40\x77\x69\x62\
+\x29\x62\x94\x80\x03\x32\x13\xde\xfe\x03\xd4\xae\xb3\x31\x82\xaf\
+\x6b\x0a\xb0\x10\x89\xa9\x66\xf4\xee\x1a\x9e\x1d\x4d\x70\x6d\xec\
+\xa5\x70\x18\xc2\x34\x9f\x05\x22\xd3\xcc\xac\x04\xc1\x2f\x07\x71\
+\x5d\x2f\x22\xbf\x84\x7a\xc7\xe7\xd7\x25\xfe\x02\x19\x8c\xfb\xa2\
+\x1f\x4b\xb0\xfa\xb1\x00\x7d\xd1\x29\xd4\x5a\xd5\x27\xc2\xb1\x8f\
+\x2b\x50\xec\xe5\x16\x95\xcb\x61\xfe\x97\x06\x76\x5c\x1e\x43\xe0\
+\xd0\xde\x0a\x67\xfc\xba\x5c\x3e\x98\xcb\x00\x98\x8e\x78\x0a\x8a\
+\xd3\x4e\x2a\xe9\xaf\x91\xed\xa3\x58\x9a\xb3\x97\xfa\x78\x9d\xfe\
+\xae\xfb\xdb\x65\x0a\x7c\x06\x36\x77\xd5\xfc\x4f\xda\xfe\xf6\xd6\
+\x58\x9b\x63\x0d\x69\x63\xd8\xf6\x02\x5f\x81\x59\x3d\x78\x48\x44\
+\x1e\xb6\xb0\xa7\x0e\x41\x91\x81\x99\xfa\x8c\x7f\x04\xe6\xc3\x6d\
+\xa0\xd6\xe0\xbd\x42\xfe\x0e\xcd\x08\x74\x9b\x1d\xa5\x25\x3c\x0e\
+\x26\x70\x3e\x98\x16\x35\x83\x29\xb4\x3c\xd9\xc5\xb0\x9c\x82\x95\
+\xd9\x2c\x94\x29\x2a\x4a\xff\xeb\xc0\xc4\x27\x95\xf4\x27\xc2\xbe\
+\x13\x65\xc6\xb9\xa4\x56\x85\xe0\xeb\x98\x02\x02\xa7\xe0\x3b\x51\
+\xc4\xa4\x6e\x3d\x28\xda\xcb\xa9\x6d\xb0\x40\x4a\x1d\x02\x62\x9f\
+\x0f\xc1\x3e\xd8\x2c\x86\xa2\x35\x0a\x1b\xca\x48\xe5\x21\x7e\xeb\
+\xbe\x75\x30\x56\x25\x76\xe7\x39\x1b\x5e\xe9\xd5\x35\xfd\x15\x53\
+\x45\x0b\xc8\x61\x00\xe4\x2c\xaf\x07\xa7\x99\x54\xd2\x5f\x6f\x5c\
+\xf0\x6e\x55\x0a\x2c\x95\xf8\x9b\x34\x05\x18\xe4\x63\xa4\xe4\x9b\
+\x31\xb3\x4d\x15\x85\xf3\x39\x02\xb5\x03\xb0\x2e\xb0\xaf\x4b\x50\
+\x17\x61\xb6\x63\x17\x98\x14\x62\xf7\xfd\xb6\x8f\x51\x43\x99\x0d\
+\xa7\xe5\x6d\xd8\x77\xfb\x27\x56\x7f\x26\x31\x74\xf1\x9a\xaf\xcf\
+\x55\x1c\x73\x35\x00\x7a\x1d\xf7\x54\x78\x3a\xf6\xa0\xa5\xd5\x27\
+\x54\x80\x4b\x68\xab\x31\xfd\xbb\x29\xf5\x5f\x13\x60\x17\xc8\xfc\
+\x18\x72\x0e\xee\x1e\x13\x44\x66\x1f\xb7\x17\x91\x7f\x86\xa3\x8f\
+\x85\x58\xc5\x62\x3e\xb9\x84\xef\xfb\xcd\x6f\xc6\x2b\xb0\x74\xfa\
+\x2f\xb1\x7a\x71\xd7\xf0\x6a\xfb\x0d\x0a\x58\x72\xef\x7a\x6c\x33\
+\x96\xbc\xb5\x58\xaa\xfa\xce\x40\x9f\x63\xe1\xc3\x61\x29\xbd\xb1\
+\x07\xbd\x55\xf1\xa9\x8a\x6d\xc6\xf6\x19\x2c\x32\xce\xfb\xd6\xbc\
+\xb5\xcf\x41\x3b\xc0\xa8\xd3\xad\x84\xad\xfe\x4f\xd8\x7a\x6b\xd4\
+\x55\x2e\x12\xff\xb3\x55\x99\x2d\xc6\x22\xd8\xef\xa7\x1d\x7c\x92\
+\x31\x6e\x21\x06\xcc\x72\x6b\x6b\xe0\xb8\x3d\x14\x1a\xc8\xf1\xea\
+\x99\x93\xc6\x5e\x75\x5b\x6d\x7b\x81\x46\x19\x28\xd4\x98\x06\x40\
+\x9f\xca\x85\x70\x28\x4f\x0a\xe9\x4f\xc4\x9a\x09\x3b\x75\x17\x55\
+\xbe\x8b\xe7\xf5\xb5\xbe\x63\x39\xe7\xed\xff\x6d\xd5\xdb\xfe\xbf\
+\x0b\xd5\x76\x29\x82\xbf\xaf\x1c\x41\x69\xc6\x71\xec\x61\xc5\xe1\
+\xc3\x58\xcd\xe0\x26\x2a\xfa\x1a\x9b\xa8\xab\x6a\x03\x29\xe7\xb9\
+\xab\xcf\x3c\xec\x21\x79\x1a\xfc\x10\x93\xd4\x41\xd8\xc5\x70\x5f\
+\x88\x8c\xc1\xa4\xd7\x2c\x32\x18\xfb\xc1\xf0\x49\x4d\x9a\x90\x5f\
+\xbe\xd8\x5f\xa0\x5a\xf0\x93\x91\xad\xc6\x9b\x54\xff\x7d\x84\xef\
+\x3a\xc7\x7a\xf5\x25\xd2\x6f\x59\x80\x63\x14\x4c\x02\xdd\x87\x13\
+\x51\x66\xbb\x40\xdc\x40\x8c\xf8\x5d\xe7\xea\x9a\x01\xf6\x31\x32\
+\x82\x45\xd0\x8f\x3f\x84\x18\x8b\x51\x18\xbb\x3e\x00\x5f\xfd\x10\
+\x54\x69\x8b\xbe\x66\x8e\x46\x64\x4c\x51\x99\x2c\xe3\x46\xd5\xff\
+\xc5\xa8\xd7\xdf\x6f\xe2\xb7\x91\x5c\x7f\x5c\xea\xb1\x6d\x0e\xb0\
+\xe6\xc0\xbb\x50\x6e\x79\x53\x55\x1c\x64\x18\x6a\xad\x5e\x59\xd8\
+\x04\x7d\x7a\x17\xfa\xc8\xfd\xac\x7a\x19\xef\x59\x26\xaa\xfb\xbe\
+\xdf\xa1\x31\x67\xd9\xf2\xdd\x94\xa6\x37\xea\xe6\x54\x45\x20\x4a\
+\xbc\x23\xf5\x86\x98\x24\xa7\x1a\xb1\x1d\x36\xc8\xd1\xdb\xbf\x8d\
+\x2d\xb4\x54\x1d\xbf\x2f\x42\xba\xea\x8d\x0b\x52\x88\xbe\x0a\x42\
+\xc6\xd4\xfd\x94\xff\x59\x89\xe7\x21\x95\x0a\x6c\x07\xcc\xf4\xcb\
+\x34\x70\x3d\xe3\x68\x6c\x61\xf3\x2c\x47\xc0\x54\x4c\xed\xcf\x31\
+\x0b\x72\x54\x7f\xdf\xb9\x09\x20\xb0\x09\x78\xfa\x2b\x68\x04\xed\
+\xc9\x22\xd1\xd6\x7f\xd5\x55\xe0\x77\xf7\xc6\x4c\x81\x98\xf0\xe0\
+\xf9\xd7\x22\x6e\x64\xa4\xaa\xfc\xd6\x81\x16\x54\xff\x05\xaa\x9e\
+\x7d\x1d\xe2\x8f\x49\x2e\x97\xd4\x8f\x49\x7e\xd7\xff\x05\x8a\x90\
+\x18\x1b\xfb\x2f\x61\xd7\xea\x40\x70\x3a\xba\xec\xcd\x50\xab\x02\
+\x35\x0c\x5d\xf6\xbc\x84\xad\x7f\x1a\xfa\xb0\x11\x24\xac\xcb\xa1\
+\x19\xfb\xbf\x17\xd1\x06\x72\xc7\x39\x74\xae\x03\xca\x98\x8b\x5d\
+\x9f\xf6\x18\xc6\x8e\x35\xfd\x05\x2a\x65\x73\x41\xb3\x12\x7b\xbd\
+\x18\x8e\xd0\x47\x76\x3d\x1c\xd1\x63\x5f\xf0\xc3\xb5\xde\x9f\x92\
+\xdd\x57\xc7\x14\x20\xfb\x75\x21\xb9\xeb\x9c\xef\x7f\xfb\x38\x37\
+\xb1\x2c\x11\x97\x7d\x2e\xc2\x77\x8d\xe7\xdd\x95\x80\xe3\x92\x8e\
+\x12\x20\x32\x3e\x83\x30\x07\xa1\xd1\xc7\xaa\x3a\x86\x2b\xad\x42\
+\x10\xae\xf1\x0a\x49\x79\xcd\x78\x7d\xe7\xaa\xda\xff\xbe\x73\x13\
+\x70\xac\x2e\x87\xd9\x72\xc7\xe4\x72\x0c\x92\x46\x6f\xc3\xaa\xc0\
+\xda\x90\x52\x18\x62\x00\x8c\x02\x7d\x09\xf2\x41\xc6\x9e\xf8\x39\
+\xc9\x66\x7f\xc0\x2f\x29\xa9\xa6\x91\x2e\x97\xe8\x53\x88\xdf\x47\
+\xd8\xa1\xe3\x12\xf8\x9f\xa0\xa5\x29\x37\x5f\x34\x7b\xdb\x5d\x8e\
+\xcf\x2d\x2a\x6f\xbf\x2a\xcc\x01\xe7\x3f\x08\x9a\xc6\x76\x78\x9e\
+\xde\x6d\xd9\x7e\xef\x14\xe2\xf7\x1d\xb3\x8f\xe7\x32\x81\xd4\x73\
+\x13\x18\xb3\x07\xe0\xdc\x7a\x64\x72\x32\x81\x97\xc0\x4a\xf4\x56\
+\xbc\x8f\x31\x00\x73\xd3\x77\xb0\xc9\x0d\x57\x55\xc6\x16\x38\xc1\
+\x7f\x8f\xb5\x4c\xbd\xb9\x46\xd1\x30\xf1\xbb\x08\x3d\xc4\x04\x7c\
+\x84\x1e\xd3\x04\x08\x9c\x5d\xee\x6e\xbb\x16\x49\x32\xb7\x43\x14\
+\xdc\x05\x24\x7f\x42\xc5\xe1\x6b\xe8\xe0\xbe\xc5\xc8\x17\xd8\x0e\
+\x91\x7c\x4b\x90\x3b\x30\x0b\xf7\xad\x75\x10\x7e\x8e\xe4\xb7\xcf\
+\xa5\x32\x05\x8e\x69\xd3\x4c\x60\x01\xe2\xda\xdf\x5d\x25\x93\x66\
+\x74\x81\xb5\x62\xff\x0b\xfb\xd4\xb4\x73\x19\x00\x69\x65\x2b\x08\
+\x92\xf9\x4a\x58\x8e\x25\x70\x04\x8e\x14\x91\x8f\x2b\x87\x55\x13\
+\x44\x9f\x43\xfc\x3a\xb1\x26\x95\x49\x88\xe3\xb7\xef\x9b\x5a\x41\
+\xa1\x52\x7b\x0b\x60\xc4\x2a\xc4\x39\xac\xc0\xef\x09\x45\xfc\x73\
+\xb0\x5e\x3e\x0f\xbf\x19\xf9\xc5\x14\x62\xfa\x16\x7c\xc4\x6e\x7f\
+\xa7\x6a\x01\xf6\xb9\x56\x05\x26\x50\x87\x19\x4c\x80\xe9\x9d\x85\
+\xf2\x3a\x93\xc4\x29\x48\x5a\x5d\x86\x62\x53\x0f\xf8\x14\x1c\x9f\
+\x44\xe7\xc5\xc7\x83\xf8\x87\xba\xc1\x67\x5d\x28\x94\xbd\xfc\x26\
+\xb5\x4c\x25\x81\xef\xdc\x73\xfc\x1d\x92\xee\x39\x1a\x81\x78\xfe\
+\x97\xc0\x31\xbb\x6f\x6b\x11\x8c\x43\x6c\x68\xc1\x79\xb8\x91\x25\
+\xc1\xc9\x34\xf8\x59\x61\xdd\xa3\x89\x94\xcf\x2e\x1c\xdf\x1a\xec\
+\x63\x3e\xe9\xc1\xe3\xda\x64\x0a\x49\x19\xcd\x04\xec\x3e\xb8\x8e\
+\xc5\xce\x75\xe0\x07\x7a\x19\x96\xb9\x7e\x30\x39\x98\x40\xa1\x14\
+\x9c\xe3\x11\x10\xe9\x64\x00\x3e\x9b\x9e\x17\x9e\xa4\x1a\x1c\x5b\
+\xe0\x84\xbf\x02\x7b\xf1\xad\x4e\x70\x66\xb8\x08\xbc\x69\xe2\xd7\
+\x84\x17\x3b\xce\xdf\xb9\xc7\xb4\x54\xed\x81\x29\xac\x81\xf3\x8e\
+\xda\xc0\x4a\x15\x67\xd0\xf3\x54\xef\xa9\xf2\xec\x9c\xf7\xcb\xf9\
+\xc4\x18\x71\xca\x39\x0d\x2d\x98\x83\x6f\x53\x21\xd7\x63\xed\xec\
+\x5a\xff\xb5\x49\xc3\x4e\xf7\x86\x6b\x6c\xc8\x29\x76\x81\xf7\xdf\
+\x4e\x87\x1f\x2b\x60\xc7\x37\x45\x1d\xfb\x39\x56\xc1\x4c\x69\x50\
+\x1b\xa8\x8a\xd0\x31\x8d\xc0\x3e\x26\x89\x9a\x40\xca\xff\xbe\xf1\
+\x8a\xfd\xef\x52\xf7\x53\x54\x7e\xd7\xb1\xdc\x4f\xc8\x31\x58\x66\
+\x9c\x2b\xd5\x37\x93\x88\x6e\x86\x53\x30\xb7\x2e\xe3\x88\x42\x09\
+\xbe\xbe\x27\x5c\x41\x1b\x68\x01\x2e\x46\xc7\x63\x2f\x83\x19\x39\
+\xd6\xda\x10\xa5\xd8\x2b\xc1\x04\x58\x3b\x3f\x44\xd0\xae\x36\x06\
+\x41\xfc\xb6\xf4\xf4\x1d\xd3\xea\xba\xef\x3a\x97\x06\x91\xd2\xc7\
+\xd8\x7d\x55\xfa\x12\x3a\x56\x75\x8c\x7c\xf3\x50\x75\x3e\x5b\xd0\
+\x86\xf6\x16\x91\xd7\x24\x98\x22\x63\x02\x8c\x22\x37\x1b\x60\x3b\
+\xe9\xdd\xc5\x00\xba\x8a\x01\xc8\x38\x8f\x03\x97\xf9\x36\xc7\x7a\
+\xc8\x8a\x84\xf0\xcf\x14\x6d\xc0\xbe\x36\x86\xd8\x55\x10\x3f\x85\
+\xa0\x62\xd7\x86\x88\xd3\xf5\x09\x11\x76\x13\xfd\xa9\xcb\x08\x63\
+\x4c\xa0\xca\x1c\x6a\xe8\xc0\x39\xfc\x47\x50\x7f\xc7\x7e\xdd\xfb\
+\x77\xaf\x6c\xfc\x00\x92\xe2\x03\x20\xcd\xec\x8c\x98\x0f\xd7\x35\
+\x63\x27\xfd\x8f\x47\x5a\x2d\xbd\xde\x39\xaa\xbf\xab\xcd\x94\x20\
+\x1f\xfd\x11\x0f\x61\xc6\x90\x3f\x25\x96\x3e\x46\xa8\x2e\x82\x0f\
+\x3d\x37\x74\x5d\xca\x33\x43\xcc\x28\xf6\x5c\x7d\x5d\xca\x98\xf6\
+\x1a\xd0\xe2\x0a\xc7\x7c\x1a\x91\xf9\xd6\x71\x46\xfc\xdf\x01\x5f\
+\xe1\x40\x64\x69\x6f\xc0\xd3\x5c\x0c\xc0\xc0\x51\xaa\x38\xec\x58\
+\x6a\x00\x05\x54\x99\x8d\x10\xaf\xce\x88\x35\x7d\x3e\xa5\x8d\xd0\
+\xb7\x46\xc4\x54\x89\xa6\x59\x70\x0a\x71\xe4\x48\xc9\x98\x43\xce\
+\x47\xe8\x29\x04\xdf\xa4\x74\x6f\x62\x3c\x34\xe3\x4d\x99\xab\x94\
+\x79\x16\x68\x88\x2b\x20\xfd\x8e\x1e\x7f\x2d\x80\xab\x01\x33\x41\
+\xd3\xda\x85\xf2\x34\xd8\xef\xc6\x71\x3d\x46\x35\x30\x96\xc0\x17\
+\x7b\x91\x88\x6c\x09\x4f\x88\xed\xb0\xca\x91\x0c\xf6\x7d\xb6\x34\
+\x92\x4c\x42\xb5\x91\x3d\xc5\x5b\xee\x22\x56\x1f\x91\xfa\x6c\xf9\
+\x54\x0d\xa0\xac\xf9\xcc\xd4\xf7\xf1\x5d\x1b\xea\x67\x68\x0e\xea\
+\xcc\x69\xa1\x70\x67\x15\x92\x9c\x58\xc4\x74\x6c\x09\xe1\x77\x5d\
+\x3f\xc6\xc1\x73\x37\x10\x8a\x3d\xf8\xca\x0e\x73\x9c\x1f\x2b\xe8\
+\x81\x9b\x1f\xa5\x6a\xda\xd7\x51\xfd\xc5\x21\xfd\xeb\x20\x6c\x8c\
+\x08\x53\xa4\x71\x0e\x01\x57\xf5\x01\xe4\x32\x10\x5f\x1f\x63\xf7\
+\xd6\x61\xa8\x65\x83\x5a\x5d\x81\xcf\x1a\xec\x59\xf0\x4a\xb4\x3f\
+\xb6\x84\xf0\xbb\xae\x1f\x86\xcc\xed\x9e\x1e\x2a\xfd\x5e\xfc\x7d\
+\x30\xea\x27\xac\x77\xe1\x38\x01\x1d\x19\x7b\xc1\x99\xa3\x2b\xc4\
+\xa6\x40\x8e\xf4\x8f\x21\x6d\x1d\x15\x39\xc7\x5e\x0f\x31\x8d\x1c\
+\x02\xf6\x49\xfb\xdc\x67\x57\x21\xfc\x54\x42\x8f\xcd\x41\xca\x1c\
+\xc6\xa0\x0d\x53\xe0\xe5\x6a\xdb\xeb\xb1\x24\x86\xdf\x09\xf6\xc5\
+\xa0\xed\xf5\xe8\xde\x65\x16\x73\xa7\xea\xf5\x54\x05\x0d\x4d\xa5\
+\x9a\xf6\x1b\x5e\xa8\x2a\xe9\xe4\xaa\x85\x3e\xef\x72\x08\x11\x53\
+\xa4\x63\x13\x8c\x20\xd7\xf6\xaf\xaa\x01\xe4\xb6\xd9\x4f\xc2\xf7\
+\x9d\xb3\xe7\xa1\xca\xaa\x40\xe1\xf8\x2e\x60\x36\x1a\x91\xf9\xaa\
+\x40\xdb\xa3\x00\x1b\x18\xf6\x1b\x42\xcf\xa2\x6d\xa7\x06\xc0\x00\
+\xa8\x17\x38\xce\x6d\xd0\xda\xa8\xaa\x45\x3a\xec\xf7\x80\xc4\xa8\
+\xbf\x58\x7b\xfa\x3b\x84\xb8\x04\xfb\x58\x15\x22\xa8\x42\x24\x31\
+\xdb\x3a\x57\x5a\xfb\xec\xf5\xa6\x98\x5b\xec\xe3\x1a\xcb\x94\x39\
+\xa8\x2a\xf5\x5d\x5a\xc0\x72\x18\xcf\x5b\x8e\x28\xce\xeb\x3a\x0d\
+\x01\xe0\x50\xbc\x40\xf9\xc7\x9f\xb9\x5f\xb7\xb3\x3d\xb6\xc2\xd3\
+\x37\xad\x77\xe1\x9e\x88\x94\xa2\x31\xa1\xcf\x8d\x02\xb0\xd3\x7b\
+\xa0\xe2\xcf\xda\x1a\xd2\xdf\x46\x20\x97\x94\x93\x44\x62\x95\x3e\
+\x12\xbc\x8f\xf8\x35\x11\xfb\xcc\x81\xd8\xf9\x50\xdb\xfd\x62\x08\
+\xae\xb1\x4e\xbd\xce\x26\x84\x3a\x73\x5e\xa8\x64\xa1\x97\x5b\x4c\
+\x68\xd8\xa0\xc3\xbb\x17\x23\x8c\x79\x0f\xeb\x9c\xe3\xf2\xdd\x41\
+\xe3\xcf\xf0\x32\x26\xf8\x30\x44\xf0\x00\x55\x21\xab\xed\x23\xac\
+\xe3\x60\x5f\x9b\x4a\xab\xe7\x29\x22\xa3\xf4\x1d\x26\x14\x6a\xe1\
+\x73\x06\xde\xb4\xae\x24\xd0\xf7\x97\x8e\xef\x18\xb1\x4b\x1f\x18\
+\x84\xaf\x0f\xbe\x7e\xda\xbf\x5d\x60\x4b\x50\xdf\x35\x45\xe0\xb8\
+\x6b\xa5\xc5\xd7\x8e\x4f\x70\xb0\x2d\xdd\x5f\xe2\x56\xcb\x73\x9d\
+\xfe\xe6\xf5\x75\x08\xb6\xc0\xfd\xf4\x05\x18\x67\xf2\xb7\xb1\x5b\
+\x54\xdd\xb6\xeb\x80\x8e\x57\x98\x81\xa5\xca\x63\xb1\x7b\xb5\x49\
+\xf7\xbe\xc1\x3d\xfe\x94\xfa\xb3\x40\xe3\xdc\x2a\xa1\x67\xcf\x81\
+\x29\x27\x2c\xae\xf7\x23\x92\xee\x86\x9c\xf2\xb9\xd8\x8c\xec\x13\
+\xf0\x2c\x10\x91\x87\xed\x1f\xa0\x1d\xb3\xb7\xf2\xfe\xbb\x20\x57\
+\x22\x50\xd2\xb8\x08\xcf\xf7\x3b\x55\x2a\x4a\x05\x95\xdd\xa7\xe6\
+\x87\xb4\x80\x5c\x0d\xc0\x27\xf5\x7d\xd7\xb8\xfa\xe8\x6b\xd7\x37\
+\x4e\xa1\xf6\x62\x63\xae\xc7\xb1\xca\x1c\xbb\x80\xbe\x80\xcd\xc1\
+\x04\x86\xa5\xf1\xd2\xce\xe7\x3b\x1f\x08\xda\x7b\x23\xd2\x75\x1f\
+\x47\xde\xaf\xf8\x85\x70\x69\xd1\xb8\x68\x0d\x80\x36\x81\x69\x77\
+\x83\x77\x24\xc7\xdb\x08\x4b\x23\xdc\x76\x64\x29\x0a\x47\xbc\x17\
+\xa5\xa8\xbe\x83\xf2\x4a\x6c\x60\xd0\xda\x00\xfb\xb9\x25\xfa\x15\
+\x52\xff\x73\xc0\x96\xa2\x55\x88\xdd\x75\x7f\x2a\x83\x08\x3d\x4b\
+\x02\xbf\x75\xdf\x53\x24\x96\x2d\x71\x6d\x49\x5c\x38\x24\x6d\x4c\
+\x23\x10\xe5\x41\xd7\xff\xc7\x18\xb3\xdd\x5f\x97\xf4\xd7\xfd\x74\
+\xdd\x9f\x3b\xd7\x85\x47\xab\x68\xc1\x97\x64\x7c\x01\xdf\xc3\x12\
+\xe1\x20\x81\xb4\x54\x22\x9b\xf5\x24\x10\x6a\x17\x34\x48\xf1\xbe\
+\x2d\x68\xf4\x29\xb7\x96\xa2\xa3\x02\x9f\xa1\x79\xbd\x33\xf3\xe6\
+\x10\xf0\x62\x8f\x5d\xa1\x1e\xbe\x48\x6d\xae\xc0\x81\x29\xd0\xea\
+\x3e\xd8\xa5\xf5\x4c\xe4\x58\xeb\xce\x0f\x02\x58\xf7\xe8\xd9\x08\
+\xe0\xd0\x15\x7f\x42\x10\x93\x0c\xa9\x84\xc8\x73\x1a\x52\x88\x3c\
+\xc7\x04\x88\xf5\x47\xf7\xc1\x45\xfc\x31\x46\x60\x13\x90\x4d\x48\
+\x31\xc2\xe2\xf9\x98\x54\xf5\x31\x01\xfb\xb8\xef\xd9\xae\x77\x73\
+\x31\x03\x1f\x51\xe7\xa8\xf1\x2d\x10\xfd\x4e\xd0\x76\x7f\x31\xa0\
+\x9a\x01\xa4\x9d\x1e\x08\xfb\x04\x68\x21\xac\x67\x58\xaa\x2d\x81\
+\x18\xf5\xba\x03\xea\x43\x3a\xde\x8f\x43\xf7\x1c\xd0\xba\xd9\x08\
+\xba\xa5\x35\xf6\xbd\x40\x37\x64\xd8\x1b\xdc\xb9\xb3\xaa\x14\xa3\
+\x3b\xc9\x4c\x2a\xc6\xdd\x9f\x06\xbb\xa4\x3d\x24\xb3\x60\x89\x45\
+\xf8\x55\x54\x3f\x82\x4b\x7a\xfb\x7e\xa7\x10\xaf\xeb\xfa\x9c\x36\
+\x5c\x6a\xb5\x8b\xb9\xe4\x2c\x07\xfa\x98\x54\x6e\xdb\x39\xce\x3f\
+\xdf\x38\xe4\x8e\xa7\xef\xb7\x3d\x77\x3e\x28\x12\xbf\xd9\x1e\x43\
+\x64\x53\x99\x47\x1d\x75\xbf\x07\x3c\x36\xcf\xfc\x34\x18\x40\x09\
+\xe2\x27\xdd\xe9\xbe\xcd\x00\x8d\xda\xfd\x56\x87\x7a\xa0\xf1\x3d\
+\x79\x4c\xe7\xfa\x9b\x4d\x05\xc5\xc5\x9c\x29\xa1\x76\x72\xd4\x05\
+\xe7\x6f\x12\xdc\x52\x54\x9d\x79\x33\xca\x6f\x7d\x4b\x44\xae\xc2\
+\x39\x6d\xc3\xf4\x03\xd8\xee\xf6\x35\xb4\x8e\x54\xe9\x9f\xf2\x3b\
+\x87\xa8\xab\xdc\x27\xd6\xbd\xae\x7e\xb8\xde\x81\xef\xe7\xf2\x6f\
+\xe8\x73\x2e\xa9\xa9\xef\x11\xab\xb0\x6a\x2a\xb0\x2f\xb6\x06\xe0\
+\xc2\x0b\xbb\x5f\x65\xc6\x6f\xf1\xbc\x47\x15\x68\x21\x9f\x64\x3f\
+\x98\x97\xf7\xf4\x41\xbb\xd5\x8e\xf4\x12\xcf\x3a\x19\xae\xfb\x55\
+\xa0\xad\x96\x92\xfa\xf6\x7b\x53\xfb\x15\x7f\xbf\x48\xdb\x86\xd6\
+\x7f\x46\x06\x40\xd8\xd7\xd7\xa9\x12\xee\xc3\x6d\x1c\xf9\xf4\x36\
+\xb4\x71\xcd\x52\x70\x23\xb3\x63\xcc\xc5\x60\x04\x66\xd0\xfa\x69\
+\x16\x50\x75\xd9\x32\xb0\x81\x41\x55\x6d\xa0\x2a\xe1\xdb\xf7\xfb\
+\xfc\x03\xb9\xc4\x1f\x23\x72\xcd\x58\xda\x58\xda\xe1\xb8\x77\xe1\
+\xd8\xa2\x0a\xdb\x82\xf4\x68\xab\x6b\xec\xf3\x2e\x26\xa0\x9f\x9f\
+\x03\x3e\x62\xd4\x92\xc7\xe5\x0b\xc8\x21\xfe\x98\x09\x62\x33\xb6\
+\x32\xc2\x20\x0a\xe0\xf5\x22\x04\x98\x9d\xde\xb0\x56\xab\xed\xfc\
+\x6d\x40\xf8\xcf\xc7\xff\xb4\xf3\x49\xf8\xae\xbe\xb1\x7f\xdb\xa8\
+\x02\xae\x81\xf7\x79\x86\xd6\x3b\x8a\x56\xa8\x16\x38\xfd\x33\x5b\
+\xa8\x94\xda\xd8\x8b\xb3\x01\xfa\x07\x8e\x00\xcb\x39\x07\x4e\x94\
+\xe5\xd6\x4b\x37\x01\x7c\xd9\x39\x98\x24\x5f\xe1\x8f\xd4\xb6\xa4\
+\xc6\x7a\xb6\x44\x88\x55\xfa\xb4\x76\xce\xdf\x5c\xc3\x65\xf5\x23\
+\xb3\x6a\x73\x3f\x4a\x86\x3f\x84\xff\x57\x83\xc8\x05\xc4\x3f\x1b\
+\xf3\xbb\x39\x90\x68\x6b\xac\x2f\xd3\xfe\x65\x99\x59\xdd\x7f\x4a\
+\xab\x5c\x42\x70\xd9\xff\x2e\xdf\x83\x7d\xde\x37\x8e\xa1\xdf\xda\
+\x04\x2d\x1b\x70\x06\xae\x11\x91\xc3\x45\xe4\x1b\x8e\xca\xca\x75\
+\x03\x79\xe6\x21\xde\xe0\x38\xe5\xc3\x2a\xd5\xb8\x87\xfa\x4f\x06\
+\xc0\x39\xbc\x37\xec\x08\xdc\x93\x4a\x03\x4d\xfa\xcd\xa1\xe1\xb3\
+\xad\x0d\x06\x63\x6b\x20\xd4\x8a\x04\x0f\xae\xfd\x34\x53\x9a\xb4\
+\x83\x42\x0b\x47\x60\xb5\xe0\xfc\x3e\x69\x01\xf3\x31\x90\x29\x6d\
+\xdb\xfd\xf5\x21\xb2\x0b\xb1\xaa\x6a\x04\x21\x02\xce\xbd\xc7\xfe\
+\x90\xf0\xe7\xc1\x13\xfc\x2b\x94\xbc\xbe\x53\x31\xdd\x10\x98\xeb\
+\xf4\x38\xee\x00\x51\xb1\x3b\x1c\x4c\x9a\x11\x54\x95\x7e\x3e\x2f\
+\xbf\x8f\x90\x79\x4f\xaa\xf4\xb7\x19\x89\xeb\xf9\xba\xfd\xa2\xa2\
+\x33\x70\x77\x8c\x6d\x55\x21\xa6\xd5\x7d\x66\xad\x9e\x04\x4f\xfe\
+\x72\xd0\x4c\x2b\xb3\xbf\x64\x22\x5b\x83\x01\x78\x1e\x2b\x78\x05\
+\x93\xf4\xf7\x08\x4d\x80\x1d\x7c\xa5\xbf\xf9\xcf\x76\x81\x87\xc7\
+\x90\x81\xaa\x8b\x41\xca\xcd\x44\xe4\xff\x22\x28\xf9\x3f\x10\xb8\
+\x60\xdb\xa0\x75\x35\x00\x5f\x00\x90\x4f\x1b\x70\xf5\xdf\x96\x36\
+\x21\x49\x6e\x9f\x77\x1d\x4f\xf9\xbf\xea\x2a\x01\xef\x9b\x8b\xd5\
+\x97\x9f\x61\x1b\xe7\xc7\xad\x77\x0c\xa9\xee\xf6\xb9\xe5\x28\x08\
+\x79\x3d\xa4\xca\x21\xf8\x70\x15\x88\x8e\x2a\x1f\x50\x62\xa6\x78\
+\xf9\xf5\x78\xf8\x10\xde\x66\x1c\x3e\x82\x77\x9d\xf7\xe1\x42\xe9\
+\x79\x4e\x08\x17\x7b\x30\xa7\x8e\x00\x03\xc8\x65\x84\x1c\x37\x2e\
+\xa5\xef\x89\x12\x64\xfb\x82\xb9\x3c\x65\xd9\xf9\xa1\x76\x5c\x4c\
+\xb4\x80\x0f\xec\x52\xbf\x23\xb0\x84\x82\xb1\x83\x66\x00\x4b\xd4\
+\xfb\xad\xb7\x72\xc6\x87\x6c\xe3\x18\xc8\x94\x97\xd7\x44\xd7\x56\
+\xbb\xc7\x3e\x17\x6a\xc7\x9f\xc7\xed\x95\x2c\x30\x93\xd3\xb1\xb8\
+\x72\x15\xf5\x5f\x12\x25\xb4\x78\xce\xfb\x8e\xbb\xce\xa7\x3e\x43\
+\x33\x08\x51\xf6\xfc\x0c\x20\xcd\x2f\x45\xe4\xc7\x8a\xf0\x75\xf1\
+\x4c\xfb\x19\x36\xb8\x18\x02\xc7\xe2\x71\x98\x6f\x17\x63\x19\x8a\
+\x81\x5f\xeb\x94\xdf\x80\xb8\x41\x04\xf7\xa9\xf1\xfa\x59\x2e\xa2\
+\xd3\xe7\xf8\xbf\xcb\xb6\x77\x11\xab\x8b\x51\xe8\x63\x75\xcc\x00\
+\x42\x0b\xf1\x25\xfb\x63\xdc\x69\x46\xa5\x02\x35\xb5\x2d\x61\xe7\
+\xbf\x10\x63\xb8\x4c\xd1\x08\xaf\x4b\xe9\xaf\x8b\xe9\x6d\xad\xda\
+\x70\x00\x69\xdc\xd0\xfc\x15\x64\x00\xbb\xf9\xee\x21\xc7\xde\x22\
+\xc1\x01\x68\x77\xcc\x77\xfc\x69\xe3\x43\x44\xae\x04\xf1\x37\xe9\
+\x0b\xb0\x1d\x56\xa9\xfd\x74\x11\xbe\x06\x1f\x11\xf9\x88\xd5\x25\
+\xe1\x5d\x44\x9e\x6a\xfb\xdb\xd7\x09\xc6\xd0\x68\x3c\x8f\x89\xc8\
+\x77\x21\xad\x39\x06\x5a\x73\xa8\x02\xb6\x54\x2e\xe0\x3b\xf8\x4f\
+\x11\xf9\x35\xf2\xe4\x37\x51\xda\x80\x06\xdf\x1a\x7f\x8e\xd3\xcf\
+\xa5\x11\x84\x08\xde\xd5\x67\xfb\xb9\x36\x23\x28\x2a\x32\x84\x35\
+\x90\xb2\x86\x82\x6e\xcc\xc4\xdf\x39\xa8\xd0\x79\x22\xb4\xa9\xe5\
+\x8a\x06\x74\x5f\x5d\xcf\x8e\xf5\x8f\x74\xb5\x45\xb8\x4f\xa5\xa6\
+\x79\x32\x00\xae\x1e\x38\x1f\xbc\x10\x0e\xa1\x94\xc0\x87\x54\x69\
+\x5b\x42\x4d\x69\x1a\x48\x28\x3e\x46\x95\xea\x14\xf4\x49\x6a\xfb\
+\x7c\x48\xfa\xa7\x6a\x10\x92\x18\x06\xab\xaf\xe3\x16\xb0\x66\xdb\
+\xa6\xaf\x43\xf5\x6f\x82\xf0\x43\x63\xc1\x31\xbd\x01\x4e\xc5\xd7\
+\x00\x8b\x56\x3a\x76\x59\x72\x21\x6c\x2a\xc1\xfb\x8e\xbb\xae\x09\
+\x69\x06\xae\x7b\x5c\x50\x64\x4a\x5c\x06\xd5\x1f\x04\x06\x10\xc3\
+\x25\xb6\x3b\x1b\xe1\xbb\xfb\xc0\xb3\xcf\xdd\xa9\x42\xc4\xef\x6a\
+\x27\x04\x74\x04\x2e\xb4\x76\x6c\x76\xc0\xd3\x34\xcf\x67\x1b\x86\
+\xa6\xff\x7f\xe6\x81\x02\x4e\x3f\x2f\xb2\x37\x78\xaa\xb4\x2d\xa1\
+\xa6\x3f\x80\xc1\x93\x0c\x2e\x9c\x02\x6b\xad\x7e\xa6\x12\xbc\xef\
+\x1a\x57\xdf\x62\x0c\x21\x74\x3e\xe5\x3e\xd7\x39\x1d\x68\x43\xe2\
+\xbf\x12\x5b\xbe\x90\xf8\x9b\xf0\xa5\x84\x80\xfd\x68\xe1\x99\x5f\
+\x40\x1f\xb8\x6f\xbc\xdd\xcf\x54\x8d\x49\x8f\x49\xec\x78\xe8\xbc\
+\xab\xbf\x36\x54\xd5\x0a\x35\x14\x50\xfd\xf7\xb7\x1c\x79\x3e\x60\
+\x3f\xd6\x01\xf7\x57\xba\xb2\xed\x54\xdb\x31\x08\xf5\xab\x0b\x5a\
+\xdd\xd8\x7f\x6d\xa1\x69\xbe\x85\xf9\xdb\x3a\xd4\xf6\x26\xaa\xb0\
+\x46\xdd\x0e\xf7\xc0\x09\x6f\x50\x21\xc5\x4d\x20\x2d\xdb\xd0\x2a\
+\x55\x0a\x47\xb5\xfb\xa7\xdb\x72\x21\x65\x8c\xb8\xed\x63\xb1\x8f\
+\xeb\x39\x21\x0d\x40\x13\xff\xd7\x94\x59\x36\xc8\xbc\x0b\x2e\xfd\
+\x4d\xa0\x0f\x9a\x09\xa4\xbc\x7f\xea\x3b\xc7\x98\x88\xfe\xdf\xd5\
+\xa6\xeb\x9c\x34\x20\x18\x5a\x10\x34\x26\x34\xfe\x59\x4a\x7b\x08\
+\x01\x1d\x7f\xb7\x43\x7b\x48\xc5\xcd\xdc\x6b\x28\x60\x37\x0d\x77\
+\x45\xb8\xb0\xd7\x82\x63\x7e\xe3\xd0\x03\xb6\x48\xf0\x4a\xa6\x76\
+\x90\xc7\xae\x0e\x5c\x53\x07\x96\xab\x50\xc9\x9c\x7e\x11\x62\x84\
+\x6e\x7f\x87\x08\xdf\x75\x5f\x15\xad\x80\x9f\xae\xda\xbd\xe6\x1b\
+\xea\x5d\xfa\x29\xf5\x7d\xa0\x91\xfe\x1b\xe8\xd3\x1c\xa5\x09\x84\
+\x88\xb8\xce\x78\xd8\x7d\xc8\x9d\xaf\xa6\x08\x6e\x02\x4b\xa3\x81\
+\x1c\x7c\xe7\xbd\x77\xd7\x70\x4a\xa7\x40\x89\xbe\x6c\x1e\xbf\xdf\
+\xc8\xf5\xcd\x5a\x70\x48\xce\x73\x5d\x5f\xaa\x2b\x7d\x1c\x34\xb7\
+\x73\x6d\x2c\x75\xd0\x61\xd5\x6b\x18\x21\x8d\xf4\x7f\xd4\x91\xb3\
+\x90\xeb\x9f\xd0\xdf\xae\x63\xb9\xda\x41\x8c\xc0\x7d\x6d\xf1\x77\
+\x0f\xef\x64\x3c\xf2\x67\xa8\x20\x94\x61\x10\xbf\xee\x97\xa0\x2f\
+\x5f\x87\x33\x92\x2b\x30\x31\x82\x8f\x31\x88\x3a\x52\x3e\x74\x5f\
+\x0c\x8a\xcc\x6b\x4c\xb8\x6e\x0a\xf0\xf9\x77\xf5\xa1\xd6\xbe\xab\
+\xad\x4d\xac\xe7\x3a\x2e\x37\x34\xbf\x65\x0b\x5b\x80\x07\x1d\x99\
+\x1b\x67\x46\x7c\xf9\xae\x2b\xa1\xfe\x70\xaf\xfa\xa6\xa5\x17\xb9\
+\xb0\x71\x50\x75\x2a\x4e\xaa\xab\x3f\x55\x10\xcd\x25\xb1\x52\x19\
+\x82\xcf\x11\xd8\x82\x17\x9e\x31\xe1\xc3\x24\x7e\xdd\xf7\x16\x98\
+\xfa\xb7\xad\x7c\x8f\xd8\x3b\xe9\x36\x62\xe3\x25\x8e\x6f\xd7\xb1\
+\x10\xc1\x97\x0d\xd8\xd9\xb6\x19\xb0\x9b\x0a\xa7\x0d\x01\x9f\xfd\
+\x80\xe5\x34\x6d\xaa\x3f\xfa\xba\x52\x31\x00\x0f\xd0\x95\xb3\xf5\
+\xd3\x7f\xac\x3e\x6e\xd0\x69\x96\x08\xce\xe9\x88\x0b\x4a\xac\x9d\
+\x1a\xfb\xbf\x9f\x85\x15\x6e\x69\x88\x59\x85\xbe\x53\xae\xb5\x8f\
+\xc5\x08\xdf\x75\xaf\x56\xfd\x2f\xc1\x16\xd6\xc3\xa8\xb5\x90\x82\
+\x4d\x37\xa1\x8f\xb6\x29\x40\xf0\x49\x7f\x7d\x3e\x34\x16\xae\xef\
+\xaa\x73\xd6\x84\xc3\x6d\x1d\x7c\x00\x5b\x66\xb4\xf7\x18\x96\x53\
+\xab\x3a\x00\x43\xc0\xfb\xbb\xa0\x59\x89\x0b\x89\xad\xb8\xc4\xef\
+\x6c\xac\x04\x77\x9b\x9f\xa8\x01\xa4\x9c\x9f\xe8\x93\xf7\x5f\xb7\
+\x77\xb3\x72\x30\x86\xfa\x12\x6b\x27\xe5\x59\x55\xd5\xcf\x14\x86\
+\x40\xc9\x49\xb3\xe9\xbc\x21\xda\xfc\x31\x28\xd1\xb7\xf3\xd0\x57\
+\xa6\x82\xe7\xaa\xfa\xfa\x9c\xfe\x76\x1d\xcb\x51\xef\x43\xd7\x14\
+\x09\xf7\xbb\xae\xe9\x82\x36\x18\x45\xd7\x4a\x34\x51\x1f\x51\xd1\
+\xaa\xb9\x90\x42\x63\x3d\xf4\x8b\x66\xb0\xe3\x1e\x3e\xfa\x69\x13\
+\x80\x0c\xcc\x09\xb3\xe0\xe1\x6d\x42\xe2\x74\x80\x1c\xac\x1a\xd4\
+\x34\x22\xb3\x8f\x77\xc0\x0c\x70\xad\x5c\xc4\x08\x3f\x07\xe1\x72\
+\xa4\x91\x6e\xdf\xbe\xde\x47\x1c\x7a\xd5\xe4\x97\xfe\x4a\x2f\x23\
+\x01\x44\xb4\xa7\xd0\xd7\xd9\x8e\x54\xe5\xaa\x63\x50\x45\xda\x87\
+\xc6\xdf\x07\x45\xe0\x9c\xef\x9a\x16\x2a\x6c\x48\xc6\xbd\x0f\x45\
+\x9c\xea\x75\x35\x81\x12\x34\x6b\x68\x37\x02\x5b\x70\x15\xc0\xfb\
+\xdc\x79\x6a\xd9\xa2\x4e\x0c\x00\xd5\xff\xfb\xfa\x5c\x58\x91\xb6\
+\xd9\x35\xe8\x77\x55\xd3\x25\x47\xba\xf8\xee\xb1\x55\xde\xd4\xf6\
+\xf5\x39\x4a\xff\x8b\x2b\xf4\x67\xd0\xc0\xbe\x5d\xac\x82\x5c\x72\
+\x99\x24\xff\xaf\x23\xed\x63\xed\xc7\xa0\xc8\xb8\x6e\x02\xcb\x81\
+\x92\x20\x24\xd9\xee\x6f\x1b\x54\xf7\x5d\xc7\x7b\xc0\xfd\x79\xf1\
+\xdb\x9f\x5e\x05\x58\x1c\xba\x82\xc9\x35\x75\x0b\x6c\x90\x01\xdc\
+\xd9\x67\xfb\x9f\xcf\xfb\x9f\x48\xe0\x92\xeb\x9e\x10\xd4\xd1\x06\
+\x62\x6d\xf8\xce\x71\x22\x6f\x8c\x47\x75\x8d\x04\x50\x48\x3c\x09\
+\x3f\x0f\x19\x70\xee\x7b\x87\xda\xcf\xf9\x0e\x41\x13\x04\x58\x80\
+\x01\x30\x53\x36\x24\x24\x75\xbf\x1e\x6a\xc8\xa4\x0e\x3d\x67\x06\
+\xfa\x14\x69\x67\x71\x4b\xf9\x0b\x9c\x30\xbb\x86\xbd\xe2\xea\x98\
+\x09\x84\xe8\x27\x90\xe8\xaf\xc5\xb3\x38\x31\xa9\xfd\xd3\xdf\xf6\
+\xf1\x1c\xc8\x55\x4d\x7d\xe7\x7a\x48\xeb\xed\x47\xcc\x44\x3f\x80\
+\x7d\xbc\xc6\x12\x1a\x55\xde\xbf\xaa\x04\x77\xdd\x53\xa5\xad\x22\
+\xe1\x3c\x77\x0f\xca\x71\x04\x3e\xda\xe7\x6d\xb7\x7b\xaa\xc6\x43\
+\x04\x16\xb5\xe0\x2f\x10\x5f\x7f\xe6\x64\xe4\xff\xa7\xe4\x52\x9b\
+\x40\x08\xe9\xb3\x24\x6b\x61\x62\xce\xb3\xcc\x80\xdc\xfe\xc7\x90\
+\xa8\x1f\x6a\xaa\xfe\xee\xc0\x63\xfc\x9b\x0a\xed\x0e\x0b\xd8\xc7\
+\x3b\x95\xb7\xbb\xdf\xe3\x14\x6a\x33\xf6\x8c\x42\xea\x41\x0f\x34\
+\xf2\xac\x84\xf6\xd8\x97\xc7\x1b\xd8\xb1\x4a\x22\xcf\x6b\x29\x0d\
+\x20\x70\xdb\xfc\x56\x8c\x51\xcc\x6e\xc8\x29\x41\x5b\xf6\x01\x75\
+\xac\x5f\x40\x82\x3f\x0f\xf6\x96\x2f\x8c\xd9\x05\x4d\xf6\xab\x0e\
+\xc3\x60\xe0\xcf\xfd\x58\x37\x1e\x75\xf5\x9f\x40\x35\x78\x25\xfa\
+\xee\x33\x1f\xfb\xc1\x4c\x53\xfa\x56\x05\x8a\xc8\xf9\xb6\x5a\x4b\
+\x4f\x81\xa5\x18\x9f\x7e\xee\x2f\x50\xa4\x39\x01\x67\x47\x19\xc0\
+\x8c\x8a\x0c\xa0\x70\xd8\x24\x0f\xab\xbc\xe7\x7e\x22\x33\x19\x8e\
+\xb1\x45\xbf\xaf\x12\x99\xaa\xb6\x35\x28\xb0\x91\xbe\x05\xa7\xe9\
+\xb8\xa8\xff\x62\xf5\xf5\x3e\x47\xa6\xdb\x30\xc6\x73\x10\xcf\xd9\
+\x3a\xe3\xfa\x55\xa0\x83\xd4\xf0\xfa\xaa\xf4\x67\x04\x5f\x0e\x03\
+\x58\xef\x39\xfc\x67\x56\x43\x04\xdb\x51\xd2\x7f\x10\xc8\x4c\x27\
+\xcb\x99\x88\x3c\x9c\xad\xde\x21\xc7\xe9\x67\xff\x5f\xf5\xbb\xea\
+\x3b\x3c\x28\xe3\x0b\x0f\xd5\x7c\xff\xa6\xc6\xbc\xdf\x4e\xc1\x9e\
+\x0a\xa6\x89\x39\x31\xe9\x38\x64\xc9\xaf\x7e\x40\x69\x31\x80\x22\
+\xe0\xe3\x6f\x59\x51\xb3\x1b\x40\xa7\xc1\x0e\xdd\xef\xef\x50\xe3\
+\x60\x9e\xd9\xc2\x40\x7f\x49\x15\xc8\x0c\x5d\xdf\xef\xfe\xe4\x7c\
+\x0b\xb4\x16\x6e\xb0\x32\x8e\xf0\xa4\x55\x38\x73\x18\x6a\xbf\x0b\
+\x9a\x6c\xbf\x50\x9b\x72\x70\x09\x2e\x76\xbd\x28\x06\x90\x23\x94\
+\x72\x21\x81\x76\x3b\xf6\xfe\x02\x1b\x40\x13\x1d\xe3\xc0\x50\x03\
+\x18\xf4\x3e\x81\x3f\x46\x9d\xbc\x8d\x06\xb0\x9b\x4b\x53\x40\x0f\
+\xb3\x51\x17\x65\x4c\xec\x7f\xb1\xfa\xba\x0a\xef\x30\x4e\xe6\x4b\
+\x55\x06\xb0\x48\xd9\xdc\x29\xef\xcb\xa0\xae\x7e\x42\x82\x86\xf1\
+\xf4\xce\x40\xc1\xdd\xb3\xea\x54\x80\x25\x50\xed\x31\x21\x90\xc3\
+\x40\x66\xf3\xfc\xcf\x20\x0e\x7b\xe6\x88\xc5\xd1\x87\x34\xa6\x5e\
+\x43\xa5\xa7\x87\x05\xeb\x94\x29\x36\x4e\x0c\x2c\x17\x18\xad\x99\
+\xb0\xec\xb6\x81\x06\xd0\x2f\x28\xd2\xda\x6f\xf7\xb3\x0f\xeb\xa9\
+\xe2\x2b\x55\xb1\xca\x41\x22\x03\x11\xf0\x41\x94\x63\x4a\x99\xa4\
+\x69\x98\x86\x5c\xd0\x81\x37\x29\x60\xca\xeb\x8f\x02\xb0\x50\x89\
+\x17\x98\xd5\x55\x07\xda\xca\xf3\x39\x0c\x60\x42\x8d\xd9\xd4\xf1\
+\xcb\x6a\xe3\x90\x51\x05\x4a\x4c\xee\xd8\x33\xae\xc0\x6a\xc5\xd4\
+\x68\x26\x2b\xf4\x60\x6f\xe7\x98\x00\xdc\x4b\xb3\x5f\x50\xa6\x69\
+\xba\xdd\x68\x66\x69\xdd\x4e\x12\x91\x97\x0e\xd9\x9e\x65\x0d\xb6\
+\x2f\xa0\xc4\x35\x77\x39\x1a\x55\xe0\xd2\xa9\x73\x89\x66\xc4\xc1\
+\x0e\x23\x9f\xcc\xea\xbf\x1d\x1a\x9c\x0a\xab\x06\x30\x2e\x09\x0c\
+\xa0\xd7\x8a\xd1\x41\x13\x44\xd2\x46\x99\xae\x2a\xdb\x48\x35\x09\
+\x7c\xfe\xc7\x91\xb0\x32\x48\x4d\xa0\xc8\xfc\xe6\xb8\x39\x13\x35\
+\xc6\x04\x16\x79\x0a\xb3\xe4\x8c\x41\x3f\x60\x98\x38\x58\xe2\x7b\
+\xb5\x27\x1c\xba\x49\x48\xc0\xed\x89\x16\xfa\xb2\x41\x1f\xf8\xcf\
+\xda\x06\x54\xb8\x42\xa9\xff\xa3\x32\xf8\xef\x43\x8c\xfd\x62\x38\
+\xab\xca\xc8\x24\xe4\x22\x6f\x13\xc8\xec\x2d\xd6\x30\x26\xb0\x45\
+\x03\x78\x53\xe7\x3b\xa4\x1a\x77\xad\xcf\x84\xe3\x58\x6a\x95\x65\
+\xae\x04\xe4\x94\x69\x23\x03\x28\xfa\x68\x42\xae\xf5\xf7\xe7\x99\
+\x85\x9a\x8e\x62\x00\x4e\x20\x03\xc8\x05\xbe\x1c\xbf\x87\x65\xff\
+\xfb\x4c\x12\xa3\x91\xbc\x5b\x44\x3e\x25\x22\x87\xc1\x49\xb9\x4e\
+\x95\x15\xe7\xb5\x83\xf4\x60\xeb\xf1\x12\x20\xe0\x36\xaa\x2f\xe3\
+\x02\xec\xeb\x36\x8e\x74\xec\x41\x0a\x00\x3d\x77\x66\x4e\x3b\x30\
+\x49\x66\x59\xab\x5b\x3d\x47\x3f\xc9\x04\xd6\x5a\x3b\x25\xbb\xfa\
+\x5f\xe0\xba\x94\xfd\x17\x09\x14\x3a\x29\x50\x95\xfe\xc8\x00\x02\
+\xb0\x3a\xca\x00\x6c\x55\xa5\x0a\x30\x36\x9c\xbf\x47\xa5\x84\xd5\
+\x52\x30\x81\xb7\x63\x97\x84\xcd\x91\xd9\x35\x1f\x13\xbe\x12\x83\
+\x58\xd5\x74\xd1\x04\x9d\xf2\xad\x81\xb6\xd9\xd6\x28\xee\x30\x2e\
+\xf9\x00\xec\x23\x6b\xcd\x1b\x44\x77\x2d\x35\xf5\x5b\x83\x22\x41\
+\xcf\x44\x5f\xda\xc0\xe5\x47\xb0\x22\xf4\x20\x22\x15\x97\x62\x6c\
+\xb9\xe9\xe9\x1c\x6c\xaa\xb1\x19\x34\x98\x2d\x81\x13\x0b\x80\x13\
+\xab\x15\x61\x15\x56\x9e\x4b\x8e\x90\xa3\x86\xd1\x2f\x28\x91\x7c\
+\x97\xc2\x00\xd8\x6f\xa7\x46\xb2\x2a\xd0\xd1\x54\x15\xa6\x88\x71\
+\x99\x21\x00\x89\xda\x4c\xfe\x27\x71\x6c\x1e\xa4\xd6\xee\xd8\xf4\
+\x61\x4f\x20\x42\x17\x5e\x5b\xde\x53\x85\xa0\x7d\x10\x6a\x63\x02\
+\x26\xca\x4e\xa8\xa2\x3c\x4e\x0c\x60\x27\xf4\x7d\x8d\x63\xd7\xa0\
+\x2a\xc4\x9d\xca\x28\xc8\xdc\xe7\xe3\xb9\x8f\xc0\xdf\x73\x15\xea\
+\x2a\xdc\x97\xb9\x04\x37\x47\xe1\x84\xa9\x00\xbc\x37\x18\x43\x4f\
+\x31\x0e\xc3\x60\xee\xc1\xef\xd4\x7a\x8d\x4d\xac\xae\x89\xa7\x0d\
+\xc6\x90\xac\x0c\xdf\x66\x2e\x5b\xce\x2a\x5d\x5e\xe0\x3e\xf2\x75\
+\x24\x77\xa9\x56\x00\x46\x09\x38\x0a\x44\xda\x15\x28\x28\x7a\x0b\
+\x92\x88\x0c\x02\x3f\x0f\x3b\x19\xef\x8b\x48\xc2\x65\x19\x5b\xa4\
+\xa5\x32\x89\xd0\xb9\x16\x9e\x7d\xfd\x18\x10\xbf\xa8\x3e\xee\xeb\
+\xd8\x05\xd8\xf5\x1d\x3a\x97\xc3\x28\xb8\xd4\xbb\x10\x38\x6b\x88\
+\xfe\xa7\x20\x7c\x93\x96\xac\x81\x73\x5e\x44\xde\x83\x78\x7b\x1b\
+\x3e\x67\xc3\xb1\x69\x84\xc3\xef\x63\x83\xdb\x45\x58\xa9\xf9\x45\
+\x46\x5f\xd9\x7e\xbf\xa0\x00\xcd\x26\x08\xdd\x27\x99\x72\x1e\x0d\
+\xe7\xcc\x49\xa9\x75\x41\xee\x2e\xaa\x83\x02\xed\xfc\xd3\x88\x51\
+\x62\x60\xce\xc7\xc7\x14\x7e\x7c\x99\x88\xbc\x00\xd2\x65\x59\x05\
+\xe9\x9f\xcb\x04\x58\x43\x61\x77\x20\xda\xa8\x57\x05\x62\xdf\x16\
+\x61\xc3\x0c\xee\xd0\x54\x85\xf8\x7d\xed\xdb\xdf\x1c\x8b\x05\xc0\
+\xd5\x1f\x8a\xc8\x0f\x44\xe4\x56\xcf\x86\xb1\xfa\x93\x02\x36\x4e\
+\x98\x39\xb8\x00\x9f\x9d\x81\x13\xc6\xf6\xff\x39\xae\x4f\x0d\x35\
+\x67\x1f\x62\x4c\xa8\x0a\xd0\x27\xe1\xf4\xee\xaf\x0f\x4f\x74\x62\
+\x11\xba\x2b\x30\x91\x2c\xac\xe1\xea\x70\xca\x8b\x8c\xf2\x9a\x3b\
+\xc1\x46\x0c\x12\x61\x0f\x12\xe0\xd3\x22\xf2\x3d\x11\xf9\x23\xec\
+\x0f\xcf\x58\x7d\xfb\xdd\x5d\xc4\xcc\xf6\x7d\xd7\xf8\xee\xe7\x0e\
+\x34\x87\x8a\xc8\xb9\x63\xc2\x00\x0e\x83\x24\x5e\xa1\x96\x01\x7d\
+\xce\x33\xd7\xb9\x22\x91\x31\xb0\x5c\xfa\x0c\x94\x80\xfb\xa6\x2a\
+\x39\xa7\xe7\xae\xa9\x5d\x92\xed\x76\x4d\xc5\xa9\xd3\xa4\x1a\x68\
+\x9c\xa8\xa2\x5d\xfb\x70\x80\x3e\x89\x35\x61\x53\x87\xb7\x3f\xd2\
+\x89\x65\x9c\xae\x81\x2d\xb1\xa8\x66\x22\xcd\xa8\xc7\xdf\xfb\x46\
+\x89\xef\x4c\x75\xf6\x4e\xc4\x11\x1c\x22\x22\x6f\x12\x91\xed\x94\
+\x64\x0e\x49\x74\x1e\xf3\x31\x03\x7d\x8f\xfe\xcd\x75\xda\xc3\x50\
+\x6d\x77\xe9\x88\x32\x01\x2d\xfd\x0f\xb5\x2a\xde\x14\x09\xea\xb7\
+\xeb\x78\x48\x63\xe8\xe1\x59\xf7\x20\xba\x93\x45\x53\xf9\x4c\x2e\
+\xf5\xf5\x1b\x27\x0a\xb5\xb4\x98\x03\x5a\x33\x72\x3d\xa3\x0e\x14\
+\x4a\x70\x47\xe0\xc1\x16\x9c\xa1\xbc\x6f\xbd\x4e\x50\x02\x71\xaf\
+\xbd\x58\xc7\x52\xd6\xd1\xc7\x15\x28\x49\x98\x3e\x69\x36\xc0\x78\
+\xa7\x88\xfc\x08\xd2\xce\x96\xf6\x31\xe9\xe5\x43\x78\xfb\xc3\x58\
+\x6d\xa3\x05\x1c\xd3\xc7\xb5\xe3\xba\xc0\xf7\x3f\x46\x65\x5d\x12\
+\xc9\xed\x4f\x8a\x2d\xee\x23\x7e\xbe\xff\x42\x8c\xfd\xbb\x40\xfc\
+\xad\x86\x24\x7e\x0e\x90\xc9\x54\x79\x5e\x88\x01\x84\xa0\xcc\x58\
+\xe6\x66\xdd\x41\xc7\x3d\x7c\xf4\x43\x2d\x95\xa6\xef\xbd\x8a\xdb\
+\x4f\xa7\x74\x60\xb2\x83\x66\x04\xcb\xa1\x02\x7e\x0e\xaa\x2e\xf7\
+\xc5\xf3\x31\x81\x18\xc1\x8b\xe7\x3c\x73\x29\x0e\x41\x0d\x7a\x3e\
+\x7f\x54\x80\x84\x67\xfa\x76\x30\xfa\xca\x75\xf6\xd8\x58\x84\x18\
+\x82\x7d\x8e\x31\xf7\x1d\x8c\xf9\x69\x2a\xab\x6e\x90\x84\xdf\x04\
+\x74\xac\x6d\xd4\x9a\xa0\x2d\xde\xcf\x6a\x58\xe2\x67\x32\x3c\x7c\
+\x7f\x0b\x65\xf3\x82\x38\xf5\x78\xe6\x5e\x74\xfa\x85\x74\xa7\x26\
+\x13\x90\xd0\x5b\x70\x3c\x7d\x0c\x1c\x57\xfb\x4a\xaa\x4a\x7e\x9f\
+\xe4\x34\xed\xfe\x21\x24\xec\xb0\xc3\xaa\x75\xdf\x7b\xe8\xd3\x1f\
+\x5a\xef\x1e\x7b\x27\xdd\x46\x6c\xbc\x58\x22\x7d\x1d\xc6\xfa\x87\
+\xaa\xcd\x71\x22\x7c\x42\x6e\x92\x57\x0e\xed\x15\x2a\xf3\xd6\x03\
+\x1c\xb6\xdf\xb6\xe0\x03\x58\xe1\x7a\x0e\x27\xe4\x31\xc7\xe4\xe4\
+\x70\xab\xc4\xfa\x64\x63\x07\xb4\xfd\x0c\x73\xbb\x52\x44\x3e\x04\
+\xe9\xa7\xf7\x7f\x4f\x55\xf5\xc5\xf1\x5b\x5f\xcf\xc0\x20\x93\xc4\
+\xf4\xba\x88\x73\x6d\x50\xc0\x67\x77\xd0\x27\x26\x58\xd9\xea\xad\
+\xef\xfd\x52\x19\x02\x89\xdf\x8c\xed\x87\x31\xd6\x7a\xeb\xb1\x71\
+\x84\x59\x0d\xce\x9d\x6b\x0c\x0c\xcd\x8a\xfb\x19\xbc\x7c\x05\x7d\
+\x00\x8f\xf8\x18\x06\xaf\x7c\x28\x63\x93\x0d\x1f\x8c\x73\x5a\x6b\
+\x6a\xa6\xa1\xd9\x1c\xf3\xa3\x90\x52\x7a\x7b\x72\x17\x01\xd8\xff\
+\xc7\x18\x84\x36\x05\x76\x15\x91\xd7\xe0\xda\x61\xf9\x04\xb4\x6d\
+\xf9\x5a\xf4\xc9\x56\xfd\x43\x04\x9e\x3a\x1e\x25\x70\x87\x92\xff\
+\x26\x3c\x63\x5c\x2a\x3b\xd9\x50\x64\x56\xdb\xce\x65\x70\x14\xed\
+\x0f\xc5\xef\x37\x3c\xe2\x11\xd6\xea\xb8\x3f\x74\xfd\xa3\x58\x57\
+\x2c\x6a\x74\x30\xa7\x58\x42\x93\xc0\x92\x47\x6d\x87\x1a\x6a\x9f\
+\x6b\x82\x09\xdc\x8c\xfc\x02\xe6\xc2\xfb\x88\xc1\x85\xec\xb1\xeb\
+\x04\xcf\x58\x89\x00\xa5\x37\x28\x46\x33\x48\x9f\x00\xcd\xc1\x0e\
+\xfa\xf0\x3c\xcf\x96\xd7\x75\xdf\x99\x73\x34\x03\x63\xda\x14\xf1\
+\x0f\x0a\x27\x62\xf4\xa0\x99\x68\x15\xba\xf2\x45\x01\xae\x55\x1a\
+\x80\x03\x68\x31\x19\x9a\x5f\xc5\x77\xe4\x7e\x1d\x3d\xd7\x03\x1e\
+\x87\xbe\xd0\xae\xd8\xe1\x1e\xc2\x25\x63\xd7\x35\x05\x94\x96\x7c\
+\xb6\x9d\xdd\xc5\x8f\x7d\xae\x6e\x09\x34\x32\x01\xa3\xa2\x7e\x45\
+\xe5\x14\xe4\x48\x7b\xfb\x3d\x34\x62\x12\x59\xc9\x04\x4c\x44\xda\
+\x9b\x11\xb1\x48\x27\x4e\x3f\xb5\x01\xf6\x83\x4b\x70\x6f\x46\x1f\
+\x88\x1b\x76\x3f\x63\xef\x14\xd3\x0a\xb8\xfb\xee\x97\x95\xda\xdf\
+\x1d\x33\x9c\xc8\x2d\xd8\x59\x95\xf0\x79\xbc\x8d\xf9\x08\x54\xdf\
+\x2a\x35\xcd\xb3\x1f\xdc\xb0\xd7\x79\xe5\x52\x34\x98\x52\x54\xd3\
+\xa7\x92\x06\x36\x2a\x6c\x0c\x88\x3c\x7a\x0d\x78\x47\x78\xa7\x77\
+\xc2\xee\x2d\x0b\xf0\xd2\x2c\xcd\xfc\x00\xd6\xf6\x6f\xc2\x0e\x3c\
+\xbc\xaf\xaa\x8d\x49\x26\x60\xa2\xd1\x76\x11\x91\xff\x63\x15\x80\
+\x74\xa9\xb8\xfa\x7f\x5f\x2c\xb9\x7d\x5d\x07\x4c\x60\x09\x96\x23\
+\x4d\xf9\xf3\x5f\xab\x36\x72\xa2\xdd\x72\xc6\xb5\x44\x8e\xc4\x2b\
+\x90\x24\xb3\xd2\xe3\x8f\xf0\x49\xf3\x90\xbd\xaf\x8f\xd3\xb1\xf8\
+\x3f\x70\xf8\x55\x25\x7e\x3e\x97\x44\x5d\x07\x27\x5a\x0d\x8f\x6b\
+\x53\x84\xaf\xa1\x03\x5a\x5d\x1a\xbf\xe7\x69\x9a\xe7\xdc\x19\xcd\
+\x55\x5c\xb4\x4b\x84\x7c\x18\xa1\x8f\x29\x21\x8c\x7c\xb0\x46\x9c\
+\x85\x19\x2f\x51\x05\xd8\xcf\x12\x59\x7d\x2f\x06\xf1\xed\x04\x29\
+\x42\x75\xab\xe7\x50\xf7\x4a\x2c\xe9\xdd\x81\x98\xee\xf3\xf0\xbe\
+\xba\xdd\x1c\xe0\x33\xbe\x04\xdb\x78\x91\x32\xa1\x52\x08\xde\x35\
+\xb6\xae\xeb\x98\xe1\x66\x08\xe5\x8d\x22\x72\x99\x88\xfc\x44\xa9\
+\x7f\x7a\xe9\xb6\x8a\x2d\xc9\x7e\x70\x5c\x8d\x93\xef\x28\x2c\xf5\
+\xf5\x2c\x9b\x5f\xdf\x93\x62\xfa\x84\x18\x02\x9d\x64\x0f\x62\x0c\
+\x89\x43\xb9\xc0\x31\xeb\x02\x27\x8e\x16\x91\x23\x2d\x9c\xe8\x5a\
+\x5a\x80\x0e\xee\x21\x4e\xfc\x2f\xc6\xb5\x0e\x4e\x0c\x82\x39\x50\
+\x03\x78\x58\x69\x84\x8e\x7e\x16\x9a\xe6\xc9\x00\x18\x3a\xdd\x8a\
+\xed\xf2\xa2\x3b\x93\xea\x80\xea\x29\x0d\xa0\x1f\x0c\x40\xab\xa5\
+\x27\x8b\xc8\x4b\x90\xc5\xb7\x16\x1f\x66\x3b\x85\xd4\xd2\x36\x24\
+\xdb\x73\xe1\x60\x33\x12\xfc\x0c\xdc\x9b\x3b\xe1\x44\x24\x73\xef\
+\xe9\x28\x3e\xa2\x53\x48\x79\x0d\x11\xcd\xa7\x0d\xe8\xf6\x48\x30\
+\xa5\x03\x59\x99\x59\x76\x18\xde\xe1\x12\x7c\xb4\x1d\x68\xbf\xb7\
+\x2b\xfc\x58\x9f\xd3\x4c\x63\x63\xc4\x20\x1c\x82\x31\x66\xf8\x73\
+\x27\xc1\xce\xf7\xa9\xfb\x3e\x5f\x80\x28\x06\xf0\x55\x48\xb2\x2a\
+\x04\xa7\x71\xc2\x38\x29\x5f\xaa\x70\x62\x15\xe6\xa6\x74\x8c\xb3\
+\x7e\x6f\xd3\xc6\x6e\xc8\x00\x3c\x09\xa1\xd8\xdf\xac\x88\x13\x36\
+\xac\xa9\x19\x58\xe7\xba\x86\x78\x72\x2f\xfe\xf7\xd0\x26\x69\xfc\
+\x36\xcd\x00\xee\x06\xc3\x9b\x6f\xd3\x35\x1f\x70\x4f\x8d\x5c\x80\
+\x2e\xd4\xac\x59\x78\xf1\x90\xf3\x23\x07\xb4\x84\x7a\x21\x6c\xd2\
+\x6d\x60\x03\x31\x3c\x57\x3b\x7a\xf4\x3d\x2e\x46\xb0\x12\xf7\xce\
+\x45\x98\xef\x8b\x44\xe4\x9f\x91\xf8\x61\x13\x69\x0c\xc8\x81\x4d\
+\xf8\xee\x15\x70\x94\x2d\xb3\x9e\x6f\x8f\x9b\x0f\xa9\x62\x31\x18\
+\x3c\xbf\x12\xde\xe5\x63\x10\x8e\x6b\x54\xd8\xeb\x20\xc5\x96\x47\
+\xda\xb0\xcf\xcd\x87\xa4\xdc\x07\xea\xf2\x46\x2a\x2c\x3c\xe4\xe9\
+\xcf\x91\xfa\x2e\x46\x51\x02\x57\xae\x50\x11\x7e\xbd\x8a\x38\x61\
+\xb2\x38\xdf\x21\x22\x3b\xe0\xfd\x9f\xb0\xfa\x41\xd0\x5a\xad\x1d\
+\x94\xb3\x0a\xef\x3c\x07\x4b\x9d\x47\xa2\xae\xe4\xcf\x2a\xe0\x84\
+\xbe\xf6\x89\x48\x9a\x7d\x6a\x3b\x1a\xd8\xff\x7b\xfc\xd7\xf0\x35\
+\x97\x61\xc3\xac\x67\x98\xf8\x23\x30\x7b\xf6\xf6\x31\x80\xa7\x5d\
+\x86\x11\xcf\xa8\x8f\x11\xf4\x80\x50\xf3\xd3\xe2\x93\x93\x80\x2f\
+\x6b\xfa\xf3\x36\x11\x79\x15\xb8\x3b\x77\xa4\x4d\x09\x3c\xb2\xfb\
+\xab\xed\xc5\xc7\x21\x31\xfe\x5e\x44\xbe\x2e\x22\xff\x62\x3d\x37\
+\x07\xbe\x05\x42\xd2\x15\x72\x5d\x52\x9e\xed\x57\x01\x4d\x40\x2b\
+\xc0\x6c\x0f\x12\x91\x03\xc0\x0c\xef\x87\x64\x78\x18\x63\xc4\x2c\
+\x4f\x5d\xd2\x7a\x31\x54\xe5\x6d\x51\xcc\x63\x91\xca\x48\xa4\xa3\
+\x8f\x08\xa3\x9f\x99\xf3\xb1\xfb\x6b\x9f\x6b\xa1\x5f\xdf\xaa\x38\
+\x06\x1c\xdf\x77\x42\x93\x5b\x87\xb9\x24\x4e\xb8\xa4\x7e\x08\x88\
+\xef\x5d\x8c\x9b\xf1\x7b\x7c\x04\x19\x9a\x9f\x77\x30\x8e\x18\xf0\
+\xba\x3b\x41\x85\x8c\x1e\xd5\xe7\x52\xee\xf7\xf5\x75\x55\x28\xb4\
+\xf7\x77\xdd\xbd\x13\x8b\x7b\x45\x07\xe3\x32\x81\x94\xf3\xbd\x7d\
+\x51\x81\x0f\x61\x20\x37\x4f\xa8\x0f\xa0\x09\x8b\x2a\xea\x6c\x48\
+\x91\xc7\x1a\xd0\x00\x0a\x85\xb8\x7f\x03\x7b\xff\x09\x65\xd3\x6b\
+\x44\x70\xa9\xda\x29\xd0\xc1\x7b\x1a\xe4\x3f\x05\xcc\xe0\x23\x2a\
+\x1e\x22\xa5\xff\x1c\xc8\xdb\x61\x9f\x1f\xae\x92\x79\xec\xbe\x54\
+\x51\x29\x69\x1b\xdb\xfd\xe9\x58\x35\x18\xe6\xc3\x34\xe0\xe4\x76\
+\xd5\xa6\x1d\xa2\x08\x9b\xda\x52\x4f\xbd\x3b\xfb\xa6\x1d\x7d\x36\
+\xc1\x4a\x4d\x2d\x40\x4b\xd2\x05\xb0\xb9\x6f\xcf\x1c\x13\xb6\xd1\
+\x41\xb0\xd0\xb1\x2a\x84\x5d\xc7\x64\xa4\x40\xe9\xf8\xa6\x36\xb9\
+\x16\xe3\xf2\x6a\xe0\xc4\xc7\xc3\x31\xf7\xce\xb6\x5b\x60\xc4\x97\
+\xa1\xae\x00\xcd\x9c\x94\x3e\x85\xce\x73\x03\xde\x87\xfd\xf7\x10\
+\x25\x59\x5e\xe2\xe9\xad\xc1\x08\xd7\xf8\x1a\x2e\xf0\xd2\xf7\xa9\
+\xc1\xcc\xe1\x56\x8c\xe4\xda\x54\x9a\x01\x22\xcd\xfb\xa1\xa6\x3f\
+\x96\xb1\x04\x56\x46\xbe\x35\x70\x49\xeb\x31\x20\xd4\xdf\xa8\xe7\
+\xe7\xc2\x7f\x07\x12\x64\xf4\x3b\xd5\xf9\xe8\x25\x38\xbd\x9e\x5d\
+\x2a\xf5\x5d\x17\x78\x61\x5c\xbd\xa8\x02\x12\x2b\x95\x7d\x6a\xaf\
+\x95\xbb\x96\xf8\xaa\x7e\x5c\xef\xcc\x68\x47\x33\x56\xb9\x40\x02\
+\xfc\x00\x7c\x40\xc4\x89\x56\x4d\x1c\x08\xe1\x84\xc1\xbd\x53\x6b\
+\xe0\xc4\x0f\x13\xe2\x6b\x72\x1c\x80\x1d\x68\x79\x09\x66\xf6\x35\
+\x2e\xf3\xf2\x2a\x75\x6c\x3d\xe0\x81\x3b\x1d\x6a\x54\x6a\x07\xdb\
+\xaa\xc2\x6d\x55\x35\x97\x7d\x31\x0c\xe5\x4f\xc0\x3d\xa9\xde\xe9\
+\xbe\xd4\xd1\x2e\xec\x36\x0a\x70\xd6\xc7\xe1\x48\xfa\x93\xcc\x64\
+\x1c\x4a\xe8\x9b\x61\x93\xcf\xb5\xcc\x00\x9f\x44\x4c\x95\xa2\x36\
+\x51\xda\x4c\xc0\x66\x06\xae\x20\x17\xdf\xf9\xdc\xe7\xd4\xd1\x02\
+\x4a\x8c\xcd\x4d\xa8\xc8\x44\xed\x26\x07\x27\xfe\x4c\x44\xfe\x00\
+\x73\xa5\xb7\xb5\xef\x07\x5e\xb4\xf1\x1c\xa3\x7d\xfe\x69\x45\x9c\
+\xb8\x05\x4b\xb7\x73\xac\x42\xb4\xb9\x7d\xe2\xef\xb6\xaa\x87\xe0\
+\xe9\x0b\x0f\x5f\xcd\xdb\x34\x03\xb8\xde\xb1\x69\xe9\x7a\x0f\xba\
+\x5d\xa9\x3b\xbe\xce\x84\x5e\xc0\xac\xb9\xd6\x01\x4e\xf4\xa1\xf0\
+\xf6\xd3\xde\xf7\x41\x8c\xd3\x97\x99\xaa\xe5\x13\x30\x07\x0e\xca\
+\x9c\x70\x0e\xe8\x85\x0a\x31\xab\x6a\x00\x2e\x42\x74\x11\x94\xeb\
+\xb8\xeb\x1a\xdf\x7d\x55\xda\xce\x61\x04\xf6\x3b\x0b\xc6\xe6\x22\
+\xa5\x26\xa7\x8e\x6d\x0f\x4b\x93\xa7\x60\x8e\x72\xf2\x24\xca\xc4\
+\x6f\x17\xb4\xf1\xbc\x93\x81\x93\xb9\x38\x21\x58\x76\x4e\xdd\x81\
+\x3b\xd4\xa7\x02\x5a\xdc\xed\xfe\x6b\x38\xac\x4b\x41\xeb\x4f\x1f\
+\xe3\xf8\x15\x30\x1d\x18\x0f\xe0\x64\x00\xbf\x81\x5d\x15\x8a\x08\
+\xb4\xef\x61\xe7\x58\xe1\x56\x2a\x2e\x9f\x50\x4a\x18\x7b\xf6\x2d\
+\x0e\xd5\xa9\x0e\x97\x8f\x4d\xbe\x46\xd4\x2e\x72\xd0\xb5\x24\x8f\
+\x01\xdf\xf7\x4a\x2c\x21\xd9\xf6\x74\x8a\x1d\x9d\x42\x60\x39\x84\
+\xea\xfb\xa4\x12\x7f\x9d\x7e\x8a\x75\x0d\x89\xff\x29\x78\xff\xf5\
+\x98\x85\x40\x6b\x0e\xef\x54\xc2\x49\xb7\x5b\x87\xf9\xdb\xe0\xba\
+\xb7\x00\x2e\xbe\xc5\xb5\x84\x96\x88\x13\x8f\x47\xfc\x14\x29\xb4\
+\xc6\x14\xe0\xbb\xc2\x0c\x40\x40\xe3\x0f\x53\xc9\x22\xee\x51\x90\
+\x5e\x66\xf5\xef\x99\x3b\x0b\x4c\xd0\x7d\xaa\x3e\x60\xaa\xfa\x4f\
+\x06\xb0\x85\xba\x37\x65\x90\x5c\x93\x7d\x02\xaa\xf0\xac\x8e\xb4\
+\xd1\xe4\xc4\x6b\xa4\x5d\x8d\xe8\xbb\x13\x33\x24\x55\xa9\x96\x5a\
+\x6e\xb7\xb6\xfb\xf2\x49\xde\x90\xe4\x8e\x49\x6b\x9f\x19\x10\x23\
+\xce\xd4\x7b\xab\xf4\x2d\x74\x8f\x40\x0d\xbe\x9d\xae\xe9\x0c\x7b\
+\xbc\xc4\x5c\x2c\x09\x54\x21\x4a\x85\x32\xf2\xed\x82\x02\xcf\x35\
+\x38\xf9\xf2\x0c\xdc\xe6\x75\x8f\x21\x08\x47\x67\x90\x56\xb1\xff\
+\x67\x82\x36\x19\x75\xea\x71\x00\x6a\x1a\x7f\x9a\xe6\x6d\xfc\xbd\
+\x50\xbd\xd7\x7a\xd0\x52\xec\xc3\xe7\x07\x08\x75\x98\x25\xae\xab\
+\x38\x02\x9f\x66\x55\x58\x45\x38\x16\x4b\x52\x1b\xd8\x29\x99\x50\
+\x66\x7e\xdb\x71\xf8\x2f\x57\xb5\xe2\x53\x26\x9c\xe3\x77\x83\xca\
+\x8c\xb4\xd5\xe1\x90\x9d\xed\x23\xb0\x90\x1a\x1f\xb3\xdf\x43\xd2\
+\xdf\xd5\x86\x4f\xd2\x87\xfa\xe8\x6b\xd7\x7e\xff\x8e\xd2\x4b\x53\
+\x98\x6a\xa1\xe2\x4b\x4e\xb0\xe2\x13\x5a\x15\xe7\xb8\x0a\x50\x08\
+\xac\x00\x6e\x2e\xcc\xa8\xd5\xc0\x7e\xfe\x5a\x85\x9e\xa7\x3c\x4f\
+\x7f\xf3\x77\x47\xa9\xef\x9e\xf1\x2b\x2c\x1a\x5f\xef\x5a\x3e\xfb\
+\x0a\x68\x34\x1b\x68\xf9\xa5\x42\x60\x9f\x1f\x20\xd4\xc9\x2e\xa2\
+\x01\xb7\xb5\x7a\x93\x02\xec\xe4\x11\xd0\x22\x62\xea\x7f\x93\x13\
+\xec\x53\xf9\xb6\x45\xa8\xb1\xee\x5f\x4a\x1b\x37\x5b\x39\xf3\x29\
+\x6a\xb5\x4f\x42\x87\xa4\x6e\x0a\x41\xe6\x9e\x4f\x21\xf6\x9c\x77\
+\xd1\xbf\x27\xe0\x14\x4b\x9d\x2f\x8e\xf9\x0b\x10\xfc\xe5\xc3\x89\
+\xaa\x50\x26\x7e\x6b\x9c\xd8\x12\x38\xaa\xfb\x97\xf2\x8c\x5b\x70\
+\xbf\xeb\x9e\x54\x2d\x64\x2d\xf6\x3d\xf0\x5c\x4b\x2b\x61\x8d\x6d\
+\x65\x69\x06\x50\x20\x22\xf0\xc6\x50\x66\xe0\x6f\xa0\xa6\xe5\xee\
+\xfa\xca\x1e\xec\xa8\x3a\x9d\x0a\xec\xc8\xf3\x13\x98\x4f\xac\x0f\
+\x55\xbe\x09\x5a\xe2\x31\xfa\x50\xf7\x2f\xe5\xd9\xf7\x21\x2a\xcd\
+\xd6\x02\x72\x08\xc6\x47\x44\x21\xe9\x5f\x45\x03\x08\xb5\x99\xda\
+\xaf\xd8\x47\x30\x16\xcb\x30\x36\xae\x71\x77\x01\xc7\xfc\x48\x2b\
+\x13\xb2\xd5\xf0\x9c\xa7\x42\x01\xdc\x34\xb1\x1e\x55\x70\x62\xa9\
+\x25\x75\x53\xfb\x51\x62\xfc\x1e\x53\x2b\x00\x01\xf5\xff\x46\xd0\
+\x78\x61\x33\x00\x51\x5a\x08\x4b\x9c\x97\x3e\x55\xe7\x36\x87\x1f\
+\xa0\x4c\x54\xd9\x9e\x6d\xf5\x48\x12\xee\x2b\x61\x3a\xd0\xce\x2b\
+\xfa\x28\xed\x6d\x70\x39\x04\xe9\x0b\x78\x0e\x22\xc3\x52\xec\x3e\
+\xde\xff\x24\x26\x2b\x97\x01\xe4\x30\x84\x98\xea\x9f\xaa\x01\xa4\
+\x98\x02\xb9\x04\xef\x63\x00\x8f\xab\x0d\x2a\xca\x0c\x9c\x78\x8e\
+\xb2\xfd\x8b\x01\xe3\x42\xa9\xbe\x0b\xf4\x63\x67\xf4\x2b\x07\x27\
+\x9e\x82\x50\x4d\x0d\x58\x2a\x1d\xf6\xff\x6d\x30\x83\x3c\xa6\x31\
+\x0f\xfd\x5c\xc9\x62\xb1\x19\x00\x2f\xba\xc0\x71\xee\x69\xe0\x0b\
+\x5d\x6b\x11\xa1\xaf\x73\x2e\x35\x65\x3b\xe5\xf0\x48\x91\xe4\xbc\
+\x66\x67\xd8\x57\xa9\x36\x77\x55\xce\x1f\x42\x1e\xf6\xb9\x85\x7e\
+\x2c\x46\xca\x6f\xae\xdd\x4a\x06\x90\x4a\xe8\x3e\x1b\x3f\x45\x13\
+\xf0\x5d\x1f\xd2\x00\xaa\xb6\x19\xeb\xb7\xef\x43\x09\x96\x6b\x3b\
+\x2f\xc1\x1c\xe8\x00\xab\x14\x9c\xec\x87\x56\x50\xa8\xea\xcd\x14\
+\x72\xa9\xef\xd2\x03\x03\xa0\x06\x60\x3f\x2f\x05\x27\xaf\x09\x3f\
+\x93\x43\xf6\x53\xbb\x29\x8d\xb7\x14\xca\x97\xa8\x28\xca\xf5\x9e\
+\xc9\x0b\xae\x57\x2a\x4b\x0c\x74\x03\xeb\xc0\x1d\xb9\xe3\x6d\x0e\
+\x03\xd8\xde\x31\x40\xbe\x81\xe9\x97\xfd\x67\xf7\x69\x86\x32\x69\
+\x52\x80\xf7\x71\x70\x73\x09\x3f\x46\xc4\x21\xc9\x9c\x62\xa3\xfb\
+\xcc\x81\x2a\xcf\xce\x61\x04\x2d\x25\xfd\x53\x70\x82\xb0\x93\xa5\
+\x49\xe5\xcc\x61\x2e\x94\x09\xed\x53\xb4\x6e\xef\xe9\x53\x08\x98\
+\xa8\xa4\x9f\x93\xd2\xe7\x36\x68\xd1\xf8\xe6\x3c\x9a\x35\x95\x77\
+\xf3\x88\x4b\xed\xcb\x6c\x0d\xa0\x05\x66\x7c\x91\xab\x3d\x72\x9b\
+\x87\x91\x61\xc6\x0a\xb8\xa9\x83\xdc\xc3\x72\x0f\xa5\x66\x8e\x24\
+\xdf\x3c\xa1\xfd\x94\x49\x4a\xf9\x4e\x79\x06\x91\xd7\x38\x7e\x52\
+\x81\xef\xbb\xdc\xda\x30\x33\x85\x60\x42\x2a\x78\x8c\x80\xab\x6a\
+\x00\x55\x18\x48\x8c\x69\xd8\xc7\x05\x63\xb1\xbc\x02\xd1\x6c\x69\
+\xb5\x93\xab\x3e\x57\xc1\x89\x14\x1c\xdc\x3c\xf1\x5a\x51\x7d\xd7\
+\x99\xa2\xb1\xf6\xf9\xcd\x10\xfb\x3b\xd4\xc2\x7e\xc0\xfe\xbf\xc8\
+\x55\xe0\xdb\xd6\x5c\xf9\xff\x79\xbe\x77\xd0\xb1\x84\x3e\x9b\x25\
+\x34\x88\x85\x2a\x0e\x92\x03\xf3\x2d\x6e\x94\xcb\x0c\x62\xd7\xe5\
+\x22\x02\x27\xab\x4a\xa1\x93\x35\x1e\xa2\x89\x11\x4e\x48\x42\xc7\
+\x88\xb5\x8e\x06\x50\xe5\x99\xa9\xef\xc3\xe3\x39\x59\xa2\x1c\xeb\
+\x05\xd6\x5c\x48\x1f\x18\x7e\x2e\xae\x31\xf3\x35\x17\xec\xb8\x96\
+\x54\x93\xb4\xad\x62\xf8\x3d\x0c\xa4\xb4\x68\x7a\x3d\x9a\xb7\xa3\
+\x10\x49\x63\x3f\x86\xc9\xbe\x41\xdc\x4e\x4f\x31\x80\x65\x56\x1c\
+\x7e\x8c\x83\xb1\x27\x13\x0d\xd7\x50\x2b\x1c\xdf\xb1\xf3\xa9\xfd\
+\xf5\xdd\x1b\xeb\x57\xac\x5d\x9b\x10\xaa\xa8\xa8\x76\x5f\xf4\xff\
+\xbe\xfe\xf2\x5c\x6a\xfb\xf6\xf5\xf6\xef\x22\xf0\xdb\xf5\xbf\x8f\
+\x21\x94\x35\x2b\x4d\x37\xa1\xd5\x95\x91\x7b\x53\xdb\xae\x8a\x13\
+\xa1\x36\x5d\xd7\x52\x73\x7a\x26\xb0\xdf\x7d\x69\x07\xfc\xd5\xd0\
+\xf4\x06\x5a\xbd\xad\x01\x70\x45\xc5\x68\x15\x97\xbb\x6e\x20\x52\
+\x3d\xa0\x22\x98\x72\x25\x73\x7b\x48\xbb\x0b\x37\x21\x19\x4a\x6b\
+\x1c\x58\xe9\x27\x07\x42\x95\x74\x42\xaa\xb4\x4f\x0a\xfb\xa4\xaa\
+\x4f\xe5\x4f\xd1\x00\x62\x66\x88\xef\x99\xbe\x3e\xc7\xfc\x00\x55\
+\x70\xc2\x2e\xb3\x96\x3a\x6f\x29\xdf\x75\xa0\x0a\xae\xb6\x2a\x68\
+\x1a\xb3\x10\x43\xf0\x60\x5c\xfd\xbf\x1c\xab\x84\xf4\x39\xae\xf7\
+\x5c\x57\x5f\x04\xdb\xa1\xdb\xcf\x5d\xef\x82\xcb\x02\x79\x01\xa1\
+\x01\x66\x28\x6c\x0a\x50\x8a\xe8\x10\xc7\x7e\xd8\xf6\x29\xfd\xb6\
+\xaf\x29\xac\x72\x63\x92\x59\x22\x3d\x85\x09\xf8\xfe\x4f\xb9\xb6\
+\xd5\x80\x0f\x20\x85\x19\xd5\xe9\x3b\xc7\x8d\x55\xa3\x73\x71\xc2\
+\x9e\x93\x41\xe1\x41\xe9\xf8\xa6\x50\x58\x5a\x01\x27\x66\x67\xf6\
+\x9b\x82\xf4\xf2\x00\x21\xab\x5b\xcf\xf6\x5d\xe6\xba\x8f\x1c\xe2\
+\x07\x60\x66\x6d\xdf\x05\x57\x59\xd9\x57\x29\x50\x56\xb4\x9b\x1f\
+\xca\x68\xbf\xce\x77\x4a\x9b\xfa\x78\xa0\xfa\x8a\xb7\x1d\x53\x69\
+\x47\x22\x52\x36\x46\x50\x3e\xa2\xb5\xaf\xf1\xfd\x1f\xd3\x02\x42\
+\xff\xe7\xf6\x25\x76\x4c\xb0\x7c\x16\x9b\x07\x1b\x5c\x63\xdf\x0f\
+\x6d\xa0\xcc\xec\x5b\x70\xbb\x6d\x4f\x5f\x16\x66\xbe\x3b\xab\xff\
+\x9a\x64\xa2\x40\x5c\x0d\x6b\x98\xfc\xc0\x77\x99\x8f\x01\xb4\xa0\
+\xe1\x5f\x82\x79\xea\xba\x6c\xd8\xc7\x11\x13\x30\xdb\xb3\x1a\x60\
+\x7f\x17\xb8\x6e\x63\xeb\x78\x08\x78\xcd\x5d\x96\x6a\xd5\x84\xea\
+\x96\x33\xe1\xae\x77\x59\xab\xea\xa9\xe7\xbc\x8b\x0e\x1e\x8a\x11\
+\x68\x8e\x43\x2e\xe4\xc4\x8b\x49\xff\xdc\xfb\x72\xfa\x16\x7b\xcf\
+\x52\xe5\x88\xe4\x8c\xe3\x1d\x56\x08\x70\xca\xbc\xf5\x13\x6f\x0a\
+\xe0\x68\x20\x23\xcf\xdb\x16\xf7\x76\xf0\xbd\x8b\xfe\xee\x81\xe6\
+\xae\x55\x95\xb0\x1c\xcf\x62\xc8\xcc\xc5\x88\x13\xda\x40\xfd\x0f\
+\x68\x0e\xcf\x1c\xff\x76\xec\x5d\x2e\xcc\x4c\xef\xed\x82\x00\x52\
+\x52\x8a\xed\xc9\x66\xa1\x87\xde\x00\x38\x79\x4c\xfd\x62\xf9\xa5\
+\x40\xfe\xf5\x7a\x40\x44\x9f\x89\x65\x22\x06\xaf\x84\x08\xdf\x47\
+\xe8\xa9\xc7\x62\xc4\x98\xa2\xc2\xc7\x6c\xfd\x94\x63\xa1\xf7\x6b\
+\x61\x2c\xb6\x50\xe1\xe5\x31\xd5\x99\x63\x7d\x1b\xe6\x20\x75\x35\
+\x2a\xa5\xcd\xb2\xe2\x77\x4f\x49\xe5\x5c\xa1\xd0\x06\x03\xcc\xd9\
+\xf7\xa0\x67\x67\xf5\xb8\x9b\x36\xf0\x9d\x10\xad\xfb\x18\x00\x69\
+\xec\xfb\xaa\x76\xa1\x37\x28\xe8\xee\x8c\xd0\xe0\x75\x60\x00\xd4\
+\x02\x52\x26\xbb\x05\x7b\xef\x26\xf5\x9c\xaa\x50\x47\xea\xf3\xbb\
+\x0b\x07\xcc\xb5\xbe\x0a\x2a\x01\xd8\x0c\x1f\x5f\x79\x30\x9f\x9a\
+\xed\xbb\x26\xe6\x64\xcb\x91\xfe\xa9\x4c\x23\xe5\xd9\xa9\x7e\x00\
+\x8a\xa5\xcd\xd4\xfa\x79\xca\x1c\xb6\x30\xf6\xd7\x41\x1a\xda\x15\
+\x75\x06\xa5\x0d\x88\xba\x77\x16\x70\x94\x35\xfe\x52\x84\x82\x80\
+\x16\x36\x0e\x38\x0f\x75\xff\x28\x44\xee\x8e\x07\xff\x74\x30\x44\
+\x67\xf9\x2f\x0b\x33\x80\x36\x9c\xfd\xe7\xa1\xc1\x0d\x18\x54\x1b\
+\x9d\xbe\xc8\xb1\x1a\xe0\xea\x7c\x81\x25\xc0\x05\x99\x59\x81\x85\
+\x0a\x64\xa6\x24\x6d\x52\xea\xa7\x5c\xeb\xba\xe6\x27\x19\xef\xc0\
+\x81\xde\x51\xa5\x8c\xa6\xaa\xfc\x21\x09\xeb\x23\xc8\x98\x7a\x1e\
+\x92\xfe\x21\x73\x20\xb5\x0f\xa9\x5a\x08\x35\x80\x85\x2a\xaa\xd2\
+\x87\x94\x1a\x38\xe6\x3f\xa9\x31\x7f\x3e\xa8\x82\x5b\xfc\xfd\xf3\
+\x0a\x78\xbd\x2d\x68\xc2\x2e\x2e\xea\xea\x23\xbd\xff\x17\xf9\x1c\
+\x74\xff\x3f\x70\xab\x88\xf3\x40\xc3\xde\x6c\xe3\xd8\x58\x9b\xfe\
+\x7c\x4d\xcd\xd5\x06\x9d\x11\x74\x46\x3b\x03\x63\x83\xdb\xc6\x86\
+\x0b\x7c\x40\x0c\x68\xcc\x5c\x8e\x6c\x44\xfa\x1c\x62\x50\x85\x29\
+\xc4\x24\x08\xed\xaf\x5b\x11\x57\x59\x64\xaa\x6e\x7b\x3b\x96\x01\
+\x53\xa4\xaf\xeb\x7f\x1f\x61\xfa\x18\x41\x8a\x16\xe0\xba\x36\xc4\
+\x04\x7c\xf7\xa5\x68\x21\xfa\x9a\x0e\xc6\x26\x15\x88\x13\x97\x60\
+\x2e\x6c\x3f\x54\xdd\xf9\x2e\x03\xf7\xd8\x40\x9c\xb8\x13\x2b\x63\
+\xa9\x38\x41\xdc\xdf\x2d\xc1\x24\x2e\xad\xd2\x74\x54\xff\x3d\x74\
+\xc0\xe1\x3d\x3d\x46\x62\x21\x06\xd0\x55\xc9\x41\xce\x2a\xcd\x54\
+\xc5\x1e\x45\x92\xb1\x2e\x6e\xa8\x3b\xed\xd2\x02\xf6\x0c\xbf\xc0\
+\x06\x50\x20\x9a\xe1\x4c\x95\x4c\xd4\xa4\x8d\x9f\x6a\x43\x92\x03\
+\xff\x47\x20\x87\xdb\x05\x94\xf8\xcf\x55\xf5\x00\x72\x4d\x80\x98\
+\x46\xe0\x63\x20\x4d\x68\x00\xa9\xcf\x8c\x69\x08\xbe\xe7\x99\x31\
+\xd9\xaf\x42\x31\xd0\xb5\xd8\xad\xc7\x17\x8f\x52\x57\x1b\x90\x44\
+\xe9\x6f\x9e\xff\xbd\x40\x95\x5f\x17\xb0\xbf\x7b\x06\xa4\xbf\xee\
+\x5b\x17\x34\x76\xb9\xaa\x7a\x5c\xfa\x51\xed\x36\xec\x5f\xc2\x5b\
+\x9d\x10\xc3\x5f\x16\x11\x38\xdd\xea\xf3\x06\x70\x3e\x2e\x6c\x45\
+\x06\xb5\x40\xd8\xa3\x49\xe4\xd8\x4a\x31\x91\x18\x90\x79\x5c\x00\
+\xdb\x7b\x5e\x02\xb3\x09\x7d\xdb\x6d\xfb\xae\xd1\xc7\xb8\x5b\xed\
+\x15\x08\xab\xda\x80\x23\x7a\x80\x13\xb5\x03\x32\xd8\xd6\x28\xd5\
+\x2d\xa6\x32\xc7\x88\x3b\xa6\x82\x17\x35\x34\x80\x18\xf1\xa7\x5c\
+\x17\x7b\x3f\x8d\x64\xbb\x60\x8c\x52\x71\x82\x98\xfe\x23\xcc\x09\
+\x77\x63\xce\xb1\xff\xa5\x26\x0e\xb1\xd0\xcd\xb5\x6a\x07\xa9\x32\
+\x03\x27\xb6\x02\x2d\x84\x4a\xdc\x95\xea\x9e\x35\xa0\xb5\x00\x10\
+\x25\x4f\xb7\x50\xcd\xdb\x8f\x94\xc6\xbe\xae\xaa\x2e\xad\xf7\x7e\
+\x5c\xba\xb8\x5d\x95\x38\x8e\x71\x62\x12\x92\xa9\xae\x2b\x89\x1c\
+\x53\x6b\x0f\x9f\x57\x6f\xd6\x84\x29\x10\xba\x56\x1f\xe7\x66\x9c\
+\xa7\x65\x96\x71\x2e\x54\xf5\x1a\x6d\xff\xe7\xa8\xfc\x29\x12\x38\
+\x26\xfd\x73\x35\x80\x5c\xa6\x93\xab\xd1\xe8\xe7\xf5\x30\x36\x2f\
+\xb0\xc6\x2c\x65\x5e\xbb\x98\x93\xd5\x91\xdd\x7f\xaa\x10\x7d\x08\
+\xe8\x28\x5b\x03\x9c\xcc\xd9\x20\x84\xef\x77\xb0\xb5\x8d\x7c\x48\
+\xf3\x9c\xa3\xb6\x7a\xf3\x68\x4a\x44\xd3\x95\xa0\x59\xde\x5a\x8b\
+\x01\xb4\xb1\xdd\xd8\xf7\xf1\xdc\xae\xef\x65\xce\xb5\x54\x73\x1f\
+\x14\x50\x95\x9e\x9f\x41\xc4\xec\x4c\x0b\x03\xf0\xaf\xaa\x0a\x6b\
+\x95\x49\x4c\x95\xfa\x7c\x2e\x93\x3c\x3e\x5d\x61\xd7\x9a\x1e\x96\
+\xb8\x5e\xac\xea\xad\xc5\x88\x30\x85\xd0\x7c\x36\xb9\x4d\xc8\x55\
+\x35\x00\xfb\xb8\x4b\x23\x89\x7d\xc7\x18\x1a\x3f\x8c\x58\x39\x4a\
+\x79\xf5\x8b\xcc\xdd\x97\x3e\xad\x92\xc6\x7c\x4b\xc5\xb1\xb9\xcf\
+\x55\xfd\xe7\x03\x17\xef\xa8\x80\x13\x1d\xd0\x40\x8a\xd9\xc0\xe7\
+\x31\xa3\xc7\x73\x3d\x87\xed\xfb\xd8\x23\x24\x4a\x5e\xa9\x26\xac\
+\x81\xcf\x29\x0e\x23\x2e\x2d\xe0\x3a\xd4\xbc\xa3\x16\xe0\x1b\x3c\
+\x5d\x3d\x65\xdf\x0c\x95\x8f\xcf\x6a\x43\xed\xfb\x1a\xa2\xea\x42\
+\x13\x9e\x43\xe8\xae\x73\x7c\x0f\x13\xa8\xf1\xff\x44\xe4\x9c\x4c\
+\xa6\xd5\x56\x3b\xf7\x2e\xb1\xb6\xd4\x0e\xa9\xcf\x3e\x82\x0b\x31\
+\x85\x98\xea\x9d\xab\x01\xf8\xfa\x91\x4a\xec\x21\x2d\xc2\x75\x0f\
+\xa5\x5c\x0e\x52\x6a\x9c\x38\x07\x73\xb4\x18\x63\x6e\xe3\x44\x55\
+\x7c\x28\x1d\x38\xd1\x03\xee\x9d\x0e\x5c\xcc\xc1\x09\xaa\xff\xfb\
+\xa2\x78\x88\x56\xff\x5d\xcf\xe4\xb8\xdc\x0c\x1a\xf3\x48\x7f\x8d\
+\x6e\xdc\xca\x32\xa9\x2f\x31\xe0\x92\xf5\xa5\x70\xf8\x7b\xb5\x80\
+\x1e\xb6\x75\xe2\x0b\xc6\xa0\xc4\x4e\x2e\xb9\xc0\x0e\x9d\x81\x2d\
+\xa4\x17\xe2\x7f\x9f\xa7\xa3\xaa\xea\xdf\xc5\x88\x2e\x80\x8a\xf7\
+\xd5\xc8\x73\x42\xcf\x7e\x95\x35\x69\x39\x04\x12\x23\xa8\x90\xea\
+\xdd\x84\x06\x10\xd2\x52\x52\x18\x56\x0a\x83\xeb\x61\x7d\xfb\xe6\
+\x70\x69\xab\x28\x4e\x7c\x15\x73\xb5\x00\x73\x17\x53\xad\x73\xb5\
+\x02\x3e\xc7\xe0\xdc\x57\xa0\x67\xe7\xe2\x04\xe1\xb8\x0c\x3a\x69\
+\x61\x2b\xb1\x5e\x5c\xfa\x5f\x88\xc5\x88\xa4\x6e\xa5\x32\x5b\x5e\
+\x67\x4c\x2d\x71\xf5\x81\x1d\xbb\x12\x19\x4a\x29\x5a\xc0\x4a\x70\
+\xc1\xfd\x94\x2a\x97\x0a\x3d\xc5\x04\xfe\x01\xed\xd2\x31\x18\xb2\
+\xcf\x53\x24\x00\xdb\x98\x8f\xb5\xd6\x8f\x80\xd3\xe7\xa8\x78\xa2\
+\xae\x3f\x0c\xbb\xf4\x2e\x57\x88\xad\xc7\xc1\x47\x5c\x31\x29\x1d\
+\xd2\x04\xfa\xa1\x01\xa4\x98\x1e\xa1\x76\x5d\xc7\x39\xee\x44\xf2\
+\x6b\xd5\xb8\xe4\x02\x71\xe2\x74\xcc\xd9\x3a\x65\x5f\xbb\x70\xa2\
+\xf4\x7c\x4b\x00\x27\xe6\xe1\xd8\x3f\x28\xe2\xaf\x82\x13\xfb\x01\
+\xf7\x57\x26\x4a\xff\x5b\x40\x5b\x01\xe9\x5f\x58\x34\x9a\x44\x4e\
+\xa9\x34\xc7\x95\xab\x73\x94\x16\xe2\xd4\x02\xba\xc8\x3c\xc8\xd1\
+\x02\xfe\xd0\xaa\x90\x93\x3b\xe1\xc6\x23\xff\x6e\xd4\x45\x5b\xa8\
+\x96\x23\xbb\x19\x6a\x60\xa9\xae\x9f\x8b\x76\x0c\x1b\x7d\x33\x54\
+\xbc\xdc\x89\xe6\x7b\xcc\xc0\xde\x71\x3e\x04\xa4\x73\x33\x55\xd2\
+\x86\x08\x2d\xa4\xba\x37\xa1\x01\xc4\x08\x3d\xb5\xaf\x3c\xae\x19\
+\x21\x0b\xce\xb2\x66\x75\x8e\xf4\xf7\xad\x0c\xbc\x19\x73\xb8\x00\
+\x73\xda\x53\xab\x04\xa9\xe6\x5f\x57\x2d\xbf\x2d\x04\x8e\xbd\x3b\
+\x73\x15\xc8\xc6\x89\x36\xb6\x13\xcb\x91\xfe\x67\xa7\x49\xff\xeb\
+\xe0\x8a\x6b\xa5\x96\xdd\xc8\x49\xe4\x63\xa3\xa7\xc1\xfc\xde\x00\
+\xd8\xc1\x2b\x10\xa6\xb8\x3b\x6c\x5e\x3d\xe1\xfa\x9b\x5a\xc0\x1e\
+\x22\x72\xb4\xb2\xaf\x73\x63\xa2\x5b\x08\xc2\x78\x2f\x4a\x75\x9f\
+\x80\x25\xa5\x0e\x1c\x2c\xeb\x2c\x62\x13\xeb\xbb\x0d\x42\x9d\x8d\
+\x17\x34\xb5\x93\xbf\xab\xaa\xa3\xe6\xf6\x89\x83\x65\xee\x39\x49\
+\x44\xf6\xf2\x04\x4a\x69\xce\xaf\x09\xc4\x75\xde\x1e\x3b\xfb\xdb\
+\x6e\x57\x23\x97\x46\x9a\x14\x07\x6d\xec\xb8\xeb\xb7\xeb\xdb\xbe\
+\xce\xd7\x0f\x1d\x5c\xc5\xd2\xd6\x39\x84\xe5\xf3\x09\x98\xa0\xb1\
+\xf7\x00\x27\x5e\x85\x0a\xc2\x5c\xc9\x59\xe7\x59\x32\x2c\x55\x5f\
+\x67\xe2\xc3\x3d\x0b\xce\xb2\x2a\xe6\xf6\x2a\xe2\xc4\x71\xa0\x8d\
+\xa7\x94\x04\xf6\x49\xff\xb9\xa0\xa5\x2b\xc2\xd2\x5f\x70\xfa\xd3\
+\xe8\x6e\x27\xb5\x7b\x39\x02\x97\xe3\x32\x03\x9a\xda\x2e\x2e\xff\
+\x1d\x07\x66\x6f\x6c\xd5\x4c\x06\xa0\x1b\xb0\x1f\xcc\x81\xf9\x0b\
+\x11\xf9\x6d\x8d\xc1\xed\xa9\xb6\x9f\x87\x1a\xed\x7b\xa2\x76\xdc\
+\x6c\x87\xf7\x92\xf7\xac\x46\xba\xf1\x75\xd8\xac\xf1\x0a\xab\xbf\
+\x55\xfb\x62\xd6\xb4\xbf\xac\x3c\x33\xae\x77\xb7\x27\xc0\x45\x24\
+\x39\x0e\x4d\xfb\xb7\xeb\xff\x54\x28\x1a\x60\x02\xf6\xb5\xae\xbe\
+\x75\xe1\x50\xfb\x82\x88\x7c\xb1\x22\xc3\x75\x81\x6d\x6e\x1d\x88\
+\x8d\x3b\xf6\x46\xf2\xd1\x6c\x0f\xae\x75\x81\x13\x0f\x62\x69\xfb\
+\x22\xa8\xdf\x5a\x5b\xa9\x8a\x13\x5b\x81\x4a\x6d\xa7\xa1\xad\x8d\
+\x8a\x52\xff\x3f\x06\xdc\xf4\x3c\x97\x72\xf7\x56\xbc\xda\x84\xd5\
+\x4c\x10\x72\x4d\xad\x0e\x1e\xf0\x06\xf8\x5b\xe8\x27\x73\xbe\xec\
+\xfb\x60\xfb\xd2\xa9\xe3\x43\x8c\x12\x9c\xce\x48\xde\x0f\x2a\xdf\
+\x41\x15\xc4\xb5\x07\x69\x26\x4a\x91\x6f\x8b\x49\x5f\x88\x63\xeb\
+\x90\x29\xf1\x10\x12\x2b\xee\xb1\xaa\xfb\x54\x99\x64\xbe\x13\xb5\
+\x8a\xcf\x43\xfa\xdb\xef\xaf\xdf\x3d\xf5\x7f\x17\x82\xd8\xc7\x5d\
+\xd7\xdb\xd0\x84\x06\xa0\xff\xf7\x49\x79\x5f\xff\x5d\xff\x97\x18\
+\xaf\x53\x2a\x2c\xb1\xd6\xc1\x89\xed\x81\x13\x0b\x20\xd5\xd6\x22\
+\x91\xe7\x21\xac\xa1\x35\x8d\x13\x05\x88\x79\xf7\x44\xdb\x7f\x2e\
+\x84\xd1\x27\xc3\xcf\x26\x0d\xbe\x01\x9a\x39\x69\x34\xb9\x6f\x55\
+\xde\x65\x06\xcc\xa1\x5d\x43\x5a\x80\x91\x80\x7f\x67\xad\xe9\xfa\
+\xbe\x7b\x28\x0a\xf1\x7d\x25\x35\xeb\x48\x01\x76\xa8\xd7\xe7\x7b\
+\x6c\xe0\xe8\xbf\x07\xbe\x8d\x27\x1d\x76\x56\x1d\x46\x10\x62\x02\
+\xf6\x6f\xd7\xff\xfd\xd4\x02\x7c\x7d\x0d\xfd\x4f\xc7\xda\x65\xd8\
+\xe1\xd7\x75\x4d\x53\x30\x2c\x9c\x68\xe3\x3d\xdf\x24\x22\xc7\x27\
+\xa8\xfe\xfc\x36\xf7\x9d\x8a\xfa\x02\x11\xe9\x6f\x2c\x94\x7d\x72\
+\xa5\xbf\x7e\xbf\x54\xa0\x26\xbb\x06\x8e\x56\xdb\xdc\x7c\xa6\x57\
+\x2d\x74\xfc\x67\x8e\xb0\x5d\x5f\x47\x96\x62\x80\x8e\xf5\xa9\x16\
+\x19\xc0\xb5\x5a\x3a\x9d\xda\x81\x8f\x5e\x8a\x6a\x82\xf8\x4f\xc2\
+\x47\x6f\xa5\x1e\x22\xd8\x94\xff\x6d\x9b\xde\xf6\xca\xfb\x1c\x6f\
+\xa9\xde\x7f\x97\xa3\xce\xd5\x56\xe8\xd9\xa1\x3e\x87\xde\xab\x0d\
+\xfb\x7a\x03\x49\xd2\x30\x0c\x03\x27\xda\xc0\xe5\x63\x81\xdb\x4c\
+\x15\x0e\x01\x99\xe2\x05\x61\xe2\xd7\xf4\xf8\x61\x47\x89\xc4\xbe\
+\x68\x00\x04\x8e\xcf\xe5\xc8\x6f\xd9\x80\x5e\xd9\xf0\x46\x58\x32\
+\xe1\x72\x8c\x4b\x4d\xb4\x3b\x61\xec\x9e\x7f\x84\x3d\xde\x94\x3d\
+\xd8\x6f\x60\x3f\x5f\x22\x22\xef\x87\xef\xc3\xe7\x0c\x8b\x4d\x40\
+\x95\x6b\x86\xa1\x01\xc4\x9e\x13\xeb\x0b\x13\xab\x8c\xe3\xef\x8d\
+\xca\x59\x3b\x59\xa0\x0d\x9c\x30\xe1\xcd\xef\x52\x38\x11\x5b\x8d\
+\x62\xb5\xdf\xf7\xaa\xba\x87\x8e\x71\x21\xcd\x5d\x0d\xf7\x06\x2d\
+\x87\x2c\xa8\xca\x70\x0b\x74\xc0\xe0\x7a\x90\x35\x3d\x89\x0c\x3e\
+\x9d\x23\x10\x43\x8c\xd5\x18\xb0\x23\xd5\x5b\x56\xe5\x54\xfd\x86\
+\xc2\x22\xfe\xbf\xc6\x44\xdb\xde\xf9\x90\x0d\x1f\xd2\x10\x5c\xf7\
+\xd8\xf7\xd9\xda\x81\x4b\x92\xa7\xc4\x02\xa4\x5c\x1b\x7b\x7e\xa8\
+\xbf\xf6\x79\x32\x80\x6f\x65\x66\x56\x8e\x3a\x14\x0a\x27\x8e\x84\
+\x69\x63\x70\x5a\x83\x6f\x7c\xe8\xf8\xfb\x2e\x68\x27\x41\xa4\x9f\
+\x9a\x11\x39\xbd\x01\x54\x1d\x73\xd2\xe5\x8f\x54\x24\x64\xd7\x67\
+\x0a\xfc\x14\x95\x83\xb8\x16\x4b\x70\xbd\x18\x5f\x78\x2d\x98\xc0\
+\x4b\xd5\x72\xcd\xa8\x21\x08\xbd\xcc\x5d\xac\xeb\x9e\x8a\x89\xa6\
+\x9a\x99\xa2\xfa\xa7\x9c\xb7\x99\x47\x48\xc5\x0e\x11\x26\xc1\xc7\
+\x00\x5c\x10\x6b\xd7\x77\x2e\x74\xbd\x28\x27\xd7\xb5\xc8\x6e\xa3\
+\xba\x3d\xee\xd0\x52\x38\xf1\x52\x10\xff\x5a\x4b\x20\x68\xd0\x63\
+\xc3\x31\xb9\x1e\xea\x7f\x82\xe3\xef\x3c\x84\x24\x54\x56\x94\x9b\
+\xa0\xa9\xf7\xc5\x12\xa1\xba\x70\x4f\xea\xad\xbd\x43\xce\x0f\x22\
+\xc3\x2a\x04\xd1\xfc\x99\xaa\x05\x58\xc7\x2f\xd0\x24\x14\x4a\x82\
+\xfd\xa5\x88\xbc\x1d\x81\x2c\xec\xbf\xcf\xfe\x4d\x95\x8e\x36\xc4\
+\xa4\x6d\x99\x49\xc0\xa9\x9f\x58\x9b\xa9\x7d\x71\x8d\x41\x0b\x4b\
+\x7f\xeb\xaa\x18\xaf\x23\x08\x6d\x95\xe4\xf3\xe7\xc0\x5d\x5b\x20\
+\x48\xe0\xbb\x00\x8d\x7c\x2d\x4c\xcd\x44\xb1\x75\xa0\xbd\x5a\x50\
+\x87\x01\x90\x0b\x5d\x87\x79\xe4\x72\xbe\x37\x5b\xeb\x1c\x47\xea\
+\xa3\x06\x9b\x09\x94\x58\xaa\x33\xf9\x02\x7f\x8b\x92\x51\xbc\x77\
+\x98\xda\x00\xfb\xb6\x13\xb2\x2e\x5e\xae\xf6\x2d\x60\xff\x25\x51\
+\xc2\xc7\xfe\x8f\x11\x93\xeb\x78\x0a\x11\xa7\x40\x6a\x7b\xa9\x4c\
+\x8b\xbf\x27\xe0\x1b\x3a\x1b\xcb\x5c\x4d\x2f\xfb\x0d\x1a\x5a\xf8\
+\xee\xaa\x95\xaf\xe3\x80\xbb\xb6\x40\xf0\xcd\x07\x43\xcf\xcf\x89\
+\x2f\x85\x32\x1d\xe1\x0b\x08\x53\xa8\xe5\x26\x2b\x1a\x7a\xf7\xc5\
+\x08\x58\xda\xcc\x3a\xfe\xcc\x43\x0a\xac\xbf\x9a\xc1\xd9\x5a\x15\
+\x0f\x09\x39\x04\xf5\x12\xe1\x3c\x70\xd3\xef\x02\x71\xd6\x7a\x82\
+\x3d\xfa\x0d\x9c\xcc\x85\x58\xae\xdc\x42\x55\x4d\xf5\xf5\xdf\xfe\
+\x9d\xf2\x7f\xce\xb1\x9c\xf3\x75\x21\x36\xce\x3e\x46\x40\xa0\xd6\
+\xf4\x20\x96\xc5\xb8\x89\xc6\xb8\x4a\xff\x96\x4a\x64\x32\x2a\xff\
+\x2b\x60\xc3\xaf\x70\x2c\xf5\xe9\xdf\xfa\x9b\x63\x72\x3f\xcc\xc8\
+\x35\xfe\x31\x21\x4f\x78\x04\xe1\x04\x4f\x5a\xc7\x2b\xf5\xbf\x0e\
+\x50\xbb\x79\x0c\x7d\x27\x3d\xae\x07\x3c\xb0\x1a\x44\x63\x3b\x93\
+\x5c\xdf\x1a\x58\xe1\xa0\x40\xb0\xc8\xa7\x10\xe5\x47\x35\x9c\xea\
+\xe4\xa0\xb4\x82\x02\x0c\x68\x85\x23\xe2\x22\x55\xf5\x8f\xfd\xaf\
+\x8f\xf9\x34\x83\x1c\x2d\x20\x95\x49\xe6\xde\xef\x3b\xef\x3b\xc6\
+\xb9\xff\x5b\x6b\xb7\xa7\x71\x26\xfe\x83\x10\xdd\x77\x0a\x8e\xb1\
+\x72\x8e\x0d\x21\x5c\x2f\x40\x1b\xab\xc3\x63\x42\x54\xff\x6b\x54\
+\x20\xaf\xed\x3a\x69\x4a\x60\x50\x0d\x31\x45\x51\xff\x4f\x2c\x42\
+\xf0\x35\x22\x72\x22\xb8\xbf\x9d\x04\x14\xfa\x26\x42\xcd\xc1\x7d\
+\x37\xc1\x0b\x72\xa9\xb5\xc4\x62\x27\x9b\x34\x8d\x60\x7c\x8f\xbd\
+\xc0\x8c\x66\x62\xd2\xf5\x66\x95\xba\xef\xf6\xef\x94\xff\xab\x1e\
+\xe7\x39\x4d\x6c\x75\xc1\x56\x63\x7d\xd7\xc4\x8e\x33\xe4\xf7\x93\
+\x58\x19\x1a\x97\x25\x5e\x1b\xa8\xd1\xf6\x90\x63\xf0\x7a\x18\xe4\
+\x3a\xe2\x33\x66\xef\xf3\x9b\x15\x91\xbf\x17\xcf\x2e\x24\x4d\xfd\
+\x02\x2b\x8b\x8d\x0c\x5f\xd3\x0c\x60\x4f\xec\x18\xa6\x63\x29\xd6\
+\x7b\x58\x01\x75\xf9\xe3\xb0\x97\x56\x7b\x4c\x01\xfd\xdb\xfe\xe6\
+\xe0\xcd\x41\x5b\xf7\x22\x92\xec\x52\x54\x42\x74\xc5\x41\xea\x7c\
+\x04\x9d\xa6\xdc\x04\x13\xf8\x00\x62\xbc\x29\xd1\x6c\xce\x57\x37\
+\x0e\xa0\xea\xf1\x7e\x43\x0a\xd1\x13\xba\xb0\x13\x4f\x47\x88\xf4\
+\x38\x13\x3f\xdf\xd1\x48\xfc\x57\x3a\xf6\x02\x0c\x49\x7a\x5b\xf5\
+\x9f\x8d\xa4\xa5\x0f\x84\xc3\xf8\x78\xb9\x19\xb2\xfd\xb1\x50\x30\
+\x52\x0c\x40\x07\xc2\x7d\x08\x91\x49\xcc\x4a\x72\x12\xce\x4e\x88\
+\x8b\xb6\xd5\x20\xd7\xb7\xef\x1c\x39\xe5\x2c\x0c\xa4\xb1\x9d\xee\
+\x43\x51\x89\x9b\x11\x60\xf2\x10\x54\x75\x57\x3f\xea\x6a\x07\x7c\
+\x17\xb3\xab\xcb\xdb\x90\x75\x36\xa1\x12\xa0\x5a\x7d\xf0\x01\x84\
+\x8e\xe7\x5e\x93\x03\xa9\xe6\x83\xeb\x58\x17\x1b\x5f\x7c\x1b\xaa\
+\xf2\xa0\xfd\x36\x4d\x41\x4b\xd9\xbc\x6f\x45\x74\x9f\x76\xfe\xa6\
+\x10\xbd\x7d\xce\xdc\xfb\x37\x60\x02\x01\xe9\x4f\x5a\xfa\x30\x22\
+\x70\xb3\xe2\xfd\x07\x85\x27\x3a\x96\xe4\x72\xd4\x3b\x70\x9a\x02\
+\x64\x5d\x47\x63\x89\x2f\xc7\x14\x70\x1d\x23\x32\xb5\xc0\x08\x66\
+\xe0\xdc\x2a\xb4\xfd\x04\x26\xea\x29\x24\x78\x5c\xa2\x36\x96\xe4\
+\xd2\x4d\x55\x64\xd4\x93\x66\x6c\x9f\xd7\xa1\xce\xfb\x6a\xa5\xdd\
+\xe4\x30\x82\xdc\xeb\x52\xcf\x37\x0d\x29\xe6\x00\x89\x65\x23\x94\
+\x51\xff\xec\x18\x13\x7f\x5b\xd5\x05\x78\x0f\x8a\xbc\xe8\x50\xef\
+\x54\xa2\xb7\x55\xff\x7f\x0b\x05\xd2\xfc\xee\xd2\x36\x72\x6f\x0e\
+\x54\xd1\xc9\x8d\x0c\x61\xd3\x78\xc3\xf7\x38\x00\x9b\x12\x92\x29\
+\x14\x3e\xc2\x79\x37\x1c\x7a\xcb\x1c\x11\x7f\xb9\x1a\x81\x58\xa3\
+\xd2\x02\xab\xec\x28\x9b\x84\x39\x07\xc6\x90\xfa\x2f\x6c\x9b\xa2\
+\xfb\x53\xd7\x26\x9c\x85\x65\xcb\xe3\x61\xe2\xac\x55\x51\x60\x21\
+\xd3\xc0\xf5\xbf\xef\x58\xe8\xb8\xef\xba\x1c\x9f\x80\xbe\x36\x15\
+\xcb\xec\xeb\xba\xf0\x8d\xcc\xc0\x7a\xd5\x37\x26\x01\xf1\x6f\x8e\
+\xf0\x5c\xe6\xf2\xe7\x12\x3f\x7f\x77\x91\x81\x78\x21\x42\xde\x03\
+\xc4\x4f\xd5\xdf\x7c\x1f\x82\xac\xe4\x46\xad\xa7\x7e\x08\x0e\xaa\
+\x27\xc6\xac\xf9\xa8\xcf\x14\xe0\x83\xe7\xc2\x23\xbc\xa5\x0a\x07\
+\x4d\x21\x78\xd7\x31\x9f\xad\xcd\x09\xa0\x73\xa6\x83\x35\xd7\xc7\
+\xe1\x7c\x39\x4b\x2d\x4b\xd6\x41\x50\xcd\x44\xcc\x7b\x1d\x03\x35\
+\x71\x67\xb4\xb9\x4a\xc5\x45\xb8\xfa\xec\xea\x7b\x53\xe7\x9a\x84\
+\xd0\xf8\x50\x3c\x2d\xc4\x86\x31\x46\xe5\xff\xdf\x31\x25\xfe\x42\
+\x31\xf6\xdd\x51\xaf\x62\x33\xc4\xe9\xa7\x12\xbf\x7d\x8c\x4b\x86\
+\x0f\x22\x8e\x7e\xa5\xe3\x7a\x05\xa4\x9d\x0f\xc2\x62\x6e\x4c\xf5\
+\xd7\xef\xd8\x34\x50\xea\x97\x60\x72\x87\xc6\x56\x05\x9e\x0d\x4e\
+\x41\x04\xe1\xc0\x4b\x0d\x8d\x20\x76\xac\x07\xe9\x34\x0f\xb9\x94\
+\x5f\x82\x8e\xa5\xfb\x55\xe7\xe5\xc9\xa2\x67\x80\x75\x1f\x87\x6a\
+\x0d\xf3\xc1\x6c\x18\x1e\xda\x2f\x66\x50\xe7\xda\x2a\x92\x9f\xc8\
+\x4d\x7f\x0c\xa5\xdb\x03\x63\xea\xf0\x6b\x29\x1c\x78\x31\x4c\xd5\
+\x96\x67\xef\x81\x54\xa7\x9f\xc6\xed\x0f\xc6\x4b\x89\x93\x66\x2e\
+\x76\xac\x7a\x37\x06\xfd\x12\x1a\x7c\xaf\x25\x58\x15\x98\x67\xd1\
+\xb5\x33\x63\x8a\xe1\xb4\xda\x63\xdf\x4f\x26\xa0\x93\x2f\x04\x51\
+\x58\xdf\x80\x89\xa0\xb9\x7f\x13\x8c\x40\xc0\xe8\x7e\x0f\xb5\xe0\
+\xb7\x03\x3b\x6f\x8a\x19\xe4\x5c\x53\x07\x6c\xec\x2b\x2d\x66\x7a\
+\x2f\x3c\xfd\x66\x2c\x65\x4c\xa3\xfc\xda\x98\xb7\x0e\xb2\x14\x5f\
+\x06\xbc\x64\x08\x5e\x15\xe2\xd7\xd1\x7e\xff\x82\xf5\xf2\x88\xea\
+\x5f\xe2\xb1\xcf\x43\xb5\x9f\xbe\x0c\x65\x3f\xf1\x85\xef\xf7\x3a\
+\x95\x0a\xd0\x09\x5d\xf8\x5a\xd4\xf3\x4b\x71\x0a\x36\x75\x4c\x14\
+\x67\x5e\x00\xe7\xe0\x19\x6a\x53\xb5\xba\xaa\x2b\x19\x89\x6e\x63\
+\x26\xaa\x37\x1c\x8e\xd9\xdd\x4a\x55\xa4\x59\x6b\xa5\x4d\x3b\xb9\
+\xa6\xe3\x19\x83\x04\x12\xbd\x28\x89\xff\x30\xca\x56\x7f\x47\x31\
+\x50\x5e\x3b\x2e\x50\x28\xa6\xbf\x2d\x04\xd2\x5e\xca\xd3\xcf\x79\
+\x24\xe4\xd8\xff\x5d\x38\x43\xcf\xc4\x7a\x7f\x44\x2b\x22\xad\xbc\
+\x2e\xed\xf2\xea\xd0\x6f\xdc\xa1\xcd\xf2\x15\x2c\x9b\x7a\x99\x00\
+\x09\xed\xbd\x88\xac\x5a\xea\x08\xaf\x6d\x8a\xe0\x7d\xe7\xbb\x40\
+\xe8\x59\x88\x2b\xf8\x1a\xe2\xb2\x9b\x58\x2d\xe0\x3b\xf2\x39\xa2\
+\x7c\x05\x7b\xe0\x9d\xf7\x85\x66\xc0\xd2\xd3\x6b\x10\x60\x42\x62\
+\xd3\xe9\xb9\x83\x9c\x54\x3b\xa0\xaa\x03\xa2\x2f\x50\x4e\xed\x7c\
+\x10\xff\xa3\x63\x2c\xf5\x5b\xaa\xcf\x2f\x44\x98\xf2\x42\xe5\x9c\
+\x96\x1a\xc4\x3f\x81\xb6\x2e\x45\xe0\x58\x44\xb3\x24\x8d\x98\x92\
+\x7b\x7f\xdc\x0f\xbb\x7f\x90\x0c\x80\x9a\xf0\x2c\xac\xbe\xed\xed\
+\xf3\x07\xb0\x23\x73\xb0\xd8\xb9\xa3\x15\x52\x39\x28\x26\x40\x44\
+\x9f\x0f\x7b\xef\x3c\xac\x5f\x9b\xa5\xc4\xa6\x90\x5b\x13\xb1\x6e\
+\xab\x8d\x95\x83\xdd\x51\x37\x7e\x57\xe4\x1a\xcc\x41\x9f\x26\x54\
+\x35\x5b\x5d\x00\xd5\xe7\x33\x69\x8a\xe0\x59\x35\xd9\x68\x2e\x02\
+\xe7\xe9\xaf\x91\xb2\x7a\x89\x72\x64\x35\xc1\x24\x87\x29\xf5\x17\
+\x42\xe5\x7f\x91\xaa\x1c\x9c\x12\xcf\x1f\x93\xfc\x73\x51\xd9\xe7\
+\x43\x2a\xa4\xbd\x8c\x27\xd8\x1d\x02\x19\xd0\xd7\x21\x1d\x84\xf6\
+\x48\x9a\xd9\x0d\xc9\x5f\x73\x7d\x82\x8c\x17\x6e\x81\x68\x87\x45\
+\x8e\x95\x81\x7e\x30\x01\xd7\xb5\xf4\xd6\x2f\x80\xc7\xf6\x4c\x14\
+\x5c\x5f\xd3\xb0\x94\xd3\x04\x6c\xeb\x78\xb3\xa1\x11\xec\x8a\xc1\
+\x33\x4c\xf1\x59\x50\x25\x67\x29\xc4\x9d\x50\x4c\x41\x97\xba\xce\
+\x59\xfe\x63\x1f\xec\xa5\x53\xae\x5e\x3c\x88\xd0\x6b\xe3\xd0\xf9\
+\x15\x02\xac\x64\x8c\x09\xdf\x9e\xc3\x43\x20\x6e\xb7\x86\xd4\xb7\
+\x4d\x44\xfb\x77\xca\x31\x7a\xfc\x9f\x82\xd3\xef\xa1\x78\x79\x2f\
+\xda\xfd\x07\x22\x96\xad\xef\xca\xd4\xa0\xcc\x47\xda\x30\xaf\xc0\
+\xf2\xfb\x84\xaf\xd0\x8f\x5e\x19\xf8\x90\xd2\x7f\xea\x32\x81\x9c\
+\xf3\xfa\x37\xcd\x82\x39\x30\x07\x8c\x8d\xfb\x3f\x96\x47\xb7\xe9\
+\x0a\xb6\x94\x10\xae\x76\x17\xc3\x67\x60\x18\xc3\x36\xf8\x6c\x8e\
+\x48\xbb\x79\xe8\xe7\x0c\xab\x66\x9f\x8f\x30\xf5\x73\x4a\x30\xdb\
+\x95\x08\x70\x79\x18\xea\xfd\x1d\xf0\x40\xdd\x6d\x55\xc8\x65\xdb\
+\xe3\x4a\xf8\xa4\xb6\x8d\xe1\x7b\xfa\x7d\x48\x7c\xbd\xc5\x7d\x5d\
+\xe2\x27\xee\x7e\x24\xee\xf1\x67\x78\x40\x07\xd1\xc5\xdf\x1d\xd4\
+\xe2\xc9\x20\xfd\x47\x1c\x8f\x8f\x22\x46\x60\x9d\x23\x7f\xe6\x69\
+\xe0\x40\xed\x07\x9f\x00\xa5\x5a\x31\x24\x26\x40\x64\x61\xee\xc1\
+\x0d\x98\xa1\x5f\x3a\xfa\xdc\x24\x68\xed\xc0\xc7\x10\x08\xdc\xcd\
+\x68\x11\xb4\x96\x8d\xd4\x8e\x38\xb3\x21\x89\x74\x81\x52\x22\x3b\
+\xa3\x25\x9f\x82\x99\xf3\x04\x18\x80\x26\x76\xfd\x8e\xc5\x98\x12\
+\xbd\x38\x18\xf6\x8b\x45\xe4\xd5\x60\xa0\xda\x71\x59\x97\xf8\x89\
+\xab\x1d\x24\x3e\xfd\x2a\x8e\x1f\xa4\x85\x8f\x41\x59\xe8\xab\xdd\
+\x3f\x2c\x06\x50\x00\x07\x27\xa0\x51\x9f\x90\xb2\x32\x70\x28\x4a\
+\x83\x51\xf5\xce\x61\x02\x39\xe7\x53\x7e\x73\x72\xb9\xa6\x79\x1d\
+\xca\x98\x5f\x6c\xf5\xbb\x9f\x04\x62\xdb\xfc\x31\xc6\x50\xe7\x39\
+\xda\xfe\x1d\xb7\x20\x9e\x10\xe1\xef\x86\x8c\xd4\xfd\x61\xeb\xaf\
+\x49\x58\xdb\xcf\x21\x7e\x81\xd6\xf8\x59\x08\x89\x44\x8f\xff\x99\
+\xd0\x90\x3b\x0e\x4b\x6e\x52\x30\x00\x3e\xaf\x80\x30\xfd\x05\xe6\
+\xc0\x5b\x01\x9c\x03\x67\xbc\xb2\x6f\x49\xa8\xb4\x3b\x08\x26\x20\
+\x6a\x66\xe6\x82\x48\x7e\x0d\x2f\xf8\x45\x8a\x6d\x0f\xda\x2e\x0e\
+\x39\x49\x53\x20\xb4\x9e\x2d\x93\x84\xf0\xb7\x80\x7e\xfd\x22\x50\
+\xd9\x0a\x4b\xc3\x6a\x8a\xf8\xe7\x60\x9b\xf2\x0b\xe2\xc4\x4f\xdc\
+\xbf\x0a\xa9\x24\xac\x27\x3b\xb0\xe1\x1f\x34\x03\x10\xa5\x0d\x6d\
+\x0b\x27\xf2\xd6\xca\xe7\xb6\x01\x70\x00\x8f\x42\x8d\xb5\x95\x03\
+\x66\x02\xa9\x8c\xa0\x8d\x54\xe4\x73\xc1\xd9\x96\xa9\x97\x95\x31\
+\x5c\x16\x9b\x4c\x84\xbf\x11\xf2\x33\x5e\x02\x1f\xca\x72\x85\x70\
+\xa5\x75\x6f\x5d\xe2\x9f\x8b\xed\xcd\x12\x2a\x75\xb2\x0b\xf7\xc3\
+\x07\x79\xef\x30\x56\x50\x87\xc1\x00\x44\x8d\xcd\xfe\xf0\xa9\xcd\
+\xc7\x18\x3a\x99\x00\x47\xe5\x18\xac\xcf\xc6\x98\x40\x3f\xa4\x7e\
+\x88\x41\x70\xf2\x69\x6b\xdf\x8f\x97\x3a\x5f\x65\x1d\xf2\xa5\xc7\
+\xd5\x7e\x1e\x57\xc2\x3f\x0a\x84\xbf\x25\xf0\x26\xb6\xb4\x27\x15\
+\xb4\x01\x4d\xfc\x5f\x56\xdb\xf3\x06\x28\x99\x89\x92\xcb\x51\x39\
+\xfc\xaa\x61\x45\x4c\x0f\x8b\x01\x88\x72\x74\x70\x63\x60\xf6\xc7\
+\xd9\x27\x0e\xa8\x99\xd0\x3f\xb1\xcc\x01\xd7\x77\xec\x58\x95\xdf\
+\xb1\x73\x44\x06\xae\x1a\x3c\x85\xf4\xad\x9f\xc0\x11\xc4\xd9\xd5\
+\x6a\xe7\x34\x33\xa8\x0f\x76\xb4\xe6\x26\xc0\x93\xdf\xc7\xb2\xe9\
+\x2a\xb5\x6d\x8e\xf6\x9d\xd4\x21\x7e\xfb\xdb\xcc\xf7\xbf\xa7\x6d\
+\x25\xaf\xbb\x7a\x2c\x6e\x19\x98\xd3\x6f\x94\x18\x80\xa8\x17\x7f\
+\x2d\x22\x70\x19\x6e\xed\xec\x17\x59\xe4\xef\x21\x39\x63\xad\x65\
+\x3b\x34\x69\x06\x54\xbd\x8e\xc0\x65\xa0\xb9\xe8\xf3\x1d\x30\x0d\
+\x2e\xc2\x0e\xc8\x84\x69\x13\xa1\x9e\x93\x52\x8b\xcc\x1d\x40\xf8\
+\x87\xa3\x48\x0b\x09\xdf\xb7\xac\x27\x35\x6d\x7f\xe2\xde\x4c\xa8\
+\xfd\x3f\x8d\x8b\x71\xfa\x6c\xdb\x2a\xcc\x77\x68\xc4\x3f\x0a\x0c\
+\x40\xd4\x00\x98\x22\x2b\x9f\x0b\xc5\x08\x88\x1a\xe0\xc3\x50\x85\
+\xa7\x54\x71\x02\x83\x56\xfd\x53\x18\x81\x96\x10\x33\xa0\x15\x5c\
+\x8b\x6c\xb9\xab\xd5\xd6\x4f\xd3\x90\x4e\xf4\xda\x8c\xea\x60\x6f\
+\xba\x17\x63\xd9\x78\x9e\x43\xd5\x97\x0a\x52\x3f\x85\xf8\x3b\xe8\
+\xd3\xe7\xc1\xd8\x13\x88\x9f\x6b\xfd\x6f\x07\xae\x0f\x95\xf8\x47\
+\x85\x01\x88\x1a\x88\xbf\x12\x91\x4f\xa4\x32\x81\xfd\xb0\x44\x38\
+\x4b\x2d\xe5\x0c\x43\xf5\x4f\xf9\x9f\x48\xdb\x01\x33\x28\x10\x19\
+\x76\x35\x3c\xa1\x57\x02\x69\xa7\x21\x4e\xf4\x82\x00\xa8\xc3\x21\
+\x08\x76\xc4\x75\x2b\x95\x0a\x29\x7d\x24\xfe\xae\xc2\xb9\xcf\x62\
+\x0e\x33\x88\xff\x54\xe0\xf8\xd0\x89\x7f\x94\x18\x80\x8e\x11\xf8\
+\x20\x82\xa7\x92\x98\xc0\xce\x28\xd4\xb0\x89\x27\x77\xc0\xf7\xbb\
+\x8a\xba\x5f\x85\xf0\xed\xff\xb5\x01\x38\x03\x26\xc2\x3a\xf8\x35\
+\xee\x75\x2c\x49\x4d\x35\x28\xd4\xc7\x26\xa8\xcd\x20\xed\x0d\xd1\
+\x3f\x07\x81\x4f\x6b\x54\xc5\xa5\x2a\xce\xbd\x5c\xf5\x9f\xb1\xfd\
+\xa6\x0e\xfe\x69\x58\xf9\xc9\x20\x7e\x5d\xd3\x6f\x60\x6b\xfd\xe3\
+\xc0\x00\x6c\x26\xc0\x68\xc1\x20\x13\xd0\xb9\x03\xef\x01\x33\x70\
+\x65\x11\xd6\xfd\x9d\x73\xce\xf5\xbf\xef\x1a\x1d\x60\xf3\xae\x29\
+\xca\x00\x34\xc1\xbb\x56\x48\x9e\x85\xd4\xe9\x03\x41\xf4\x8b\xd5\
+\xb6\x71\xf6\x6e\xd3\x29\x04\x5e\xe7\xf7\x04\x98\xce\xed\x20\xfe\
+\x48\x6c\xbf\x4d\xfc\x3a\xca\x6f\x24\x88\x7f\xd4\x18\x80\xcd\x04\
+\x58\x52\x2c\xe8\x18\xe4\x04\xcc\x83\x4f\xe0\x60\x95\xcc\x91\xb2\
+\x42\x60\xff\xae\x7a\x5d\x95\xff\x79\xcc\x60\xc2\x3b\xa6\x18\x03\
+\xf0\x11\xce\x7c\xe4\x81\xec\x85\xd4\xd1\x1d\x41\x74\x3d\x95\xa1\
+\xc7\xfb\xeb\x10\x7b\xca\x75\xa5\xfa\x2e\x11\x5a\x7d\x29\x8c\xf7\
+\x15\x69\xc4\x4f\x87\xdf\xc8\x49\xfe\x51\x65\x00\x36\x13\xf8\x6b\
+\xec\x26\x96\xc4\x04\x0a\x2c\x27\xbc\xcc\xaa\xbf\xc7\x46\xa5\x81\
+\xdf\x4d\xfc\xaf\x8f\x53\xf2\xbd\x73\x8a\x31\x00\xc2\x62\x44\x84\
+\xed\x86\xac\xc7\x67\x43\xd5\x9f\xa1\xf2\x15\xb8\xa9\xac\x6b\xd9\
+\x35\xf5\xff\xaa\xbf\x7b\xc0\xa1\x39\xd8\x92\xee\xeb\x2a\x60\x25\
+\x91\xf8\xb5\xcd\x3f\x52\xc4\x2f\xbe\x38\xfc\x21\x03\x1d\xfb\x1d\
+\x0c\xdc\x32\x54\x51\xe2\xa0\x6e\xe0\xe3\x21\xf1\x0b\xd6\x12\xef\
+\x45\x5e\xf7\x2c\xab\x86\x9b\x56\x15\x53\x7e\x8b\x45\x90\xae\x73\
+\xa1\xff\xed\xfb\xf5\x35\xfa\xba\x91\xc2\x88\x3e\x02\xc7\x62\x23\
+\x30\xea\x1d\x11\xa0\xb3\x11\x96\xd2\xba\x58\xb6\x5b\x65\x85\xe9\
+\x86\xbc\xf9\xb1\xff\xeb\x30\x85\x2e\x82\xbb\xd6\xc1\xd3\xff\x33\
+\x8b\x69\x7b\x80\xe8\xd8\x1e\x25\x6f\xff\x38\x31\x00\x02\x99\xc0\
+\xe7\xb0\x5a\xf6\x55\x15\x4c\xb7\x01\x13\xe0\xa4\xb5\x10\x85\x77\
+\x1f\xd6\x15\xb7\x03\x07\xb1\x6b\xf3\xe7\x10\x7b\x2e\xe1\xdb\x44\
+\xee\x22\xfa\x51\x54\xbd\x06\x05\x8b\x50\x24\xb5\xa7\xca\xa6\xb3\
+\x50\x06\x3f\x76\x72\x8e\xd4\xfc\x3f\xc7\x01\x58\xa2\x6f\x0b\xb0\
+\x8f\xc4\xe7\xe1\xec\x4b\x88\xd3\x25\x6e\x9a\xef\x37\x40\x1e\x8d\
+\x2c\xf1\x8b\x2f\xf4\x76\x04\x99\xc0\xd7\x11\xce\xbd\xd4\x11\xff\
+\xb1\x1e\x50\xef\xba\x0d\x4e\x84\x8b\x30\x91\x9a\x6b\xdb\xb6\x1d\
+\xc1\xfe\x1d\xba\xae\xca\xff\xae\x36\xa7\x8a\xf4\xd7\xd0\xc3\x44\
+\xae\x54\xea\xbd\xf6\xf4\x36\x35\xde\xbe\x73\xbe\xeb\xb4\xf8\x5e\
+\x00\xdc\xf9\x80\xf2\xf4\x47\x88\x9f\x66\xea\x52\xe0\xea\xc8\x13\
+\xff\x38\x30\x00\xcd\x04\xce\x43\x10\xe0\xbd\xca\x47\x10\x9c\x09\
+\x23\xf9\x3f\x83\x92\xdf\x02\x75\x8e\x9c\x23\x05\x29\xa4\x06\xa1\
+\xbb\xfe\x0f\x5d\x37\xd5\x40\xef\x98\x94\x3a\x46\x55\x18\x41\xea\
+\x39\xad\xf2\x0b\xc2\x7a\x3f\xa3\xb4\xc7\x48\x90\x3e\x57\xab\xee\
+\x45\xb2\xe1\xb9\xe3\x40\xfc\xe3\xc2\x00\x34\x13\xb8\x12\xf1\x1f\
+\x97\xc7\x06\x98\x9c\xbc\x00\xe7\xf8\x10\xf6\x5f\xa3\x47\xb9\x57\
+\x51\x52\xa4\xfc\x6f\xdf\xef\xbb\x86\xfd\x9c\x8a\x0c\x80\x6a\xb6\
+\xeb\x78\xee\x58\x56\x65\x04\xa5\xea\x07\x6b\x02\xde\x05\x97\xfd\
+\xb9\x69\xf6\xbe\xc6\xcd\x2b\x80\x9b\x57\x8c\x0b\xf1\x8f\x13\x03\
+\xd0\x5c\xf6\x6e\x94\x08\xf8\x2e\x06\xda\x4b\x43\x9c\xe0\x16\x62\
+\xf1\x3f\x80\x02\x1e\xac\xfc\xab\xb5\x81\xb2\xcf\xaa\x7f\xe8\xd8\
+\x54\x87\xd4\x71\x6a\xca\x14\xd0\xbf\xbb\x0a\x1f\xce\xc2\x46\x9d\
+\xb7\xa7\x95\x83\xd7\x6b\xfc\x67\x22\xab\xef\xee\x98\x76\x3a\x6a\
+\x30\x4e\x0c\x40\x6b\xf7\x2b\x50\xdb\xe1\xa3\x9e\x6a\xdb\x4e\xcf\
+\xcc\x5a\x18\x66\x7f\x0b\x27\xe1\x02\x4b\x12\x35\xad\xfa\xa7\x4a\
+\xb6\xa9\xc8\x0c\x7c\xef\x1e\x1b\xbb\x26\x4c\x01\x51\x52\x63\x21\
+\x52\xb6\xff\x0e\x65\xe0\x99\x3c\x94\x60\xef\xd3\x75\xf1\x31\x54\
+\xf2\x61\x68\xc0\x58\x6d\x82\x34\x6e\x0c\x40\x6b\xf7\x2d\x68\xf6\
+\x27\xa9\xbd\x44\x26\x52\x6e\xba\x0e\xfb\xb2\x9d\x85\x9b\xe6\xa8\
+\x05\xda\x3a\x1a\x80\x78\xce\xfb\x10\x78\xaa\x6b\x02\xbe\xb1\xf0\
+\x8d\x4f\x1d\x53\x40\xb7\x47\x5b\xbf\x03\x8d\xf0\xfd\x48\xd0\xd2\
+\x35\x0f\x13\x34\xd1\xa5\xc0\xbd\x0f\xa6\xdf\x3a\x7a\x30\xca\xcb\
+\x80\x21\xe0\x5c\x76\x50\xa8\xf7\x06\xac\x14\xec\x17\x0a\x1a\xd2\
+\x26\xc1\x6a\x68\x03\x97\xa2\x3e\xdc\x9e\x2a\xd2\xac\xdd\x70\x1c\
+\x80\x04\x8e\x4f\x45\x46\x10\x63\x9c\xb1\xe3\xb1\x7b\x7d\x4c\xa3\
+\xab\xb6\x30\xbb\x11\x08\x73\x0b\xce\x25\x48\x7d\x2a\x8b\x1d\x94\
+\x77\x30\xe9\xbc\xd7\x8f\x93\xbd\x3f\x59\x34\x00\x97\x03\xe6\x06\
+\x6c\xb9\xf7\x65\xb5\xa2\xd4\x4d\xd1\x06\x6e\x85\xd3\xe7\x4b\xf0\
+\xf8\xc6\xcc\x82\x26\x54\xff\xd0\xf1\xa9\x06\x39\xe3\x53\xc5\x14\
+\xd0\xea\xfe\x02\x94\xe0\xf9\x12\xc4\xf6\x2d\xe9\xa2\x5b\xab\xfc\
+\x5f\x01\xae\x8d\x3d\xf1\x8f\xb3\x06\xa0\x81\xe5\x00\x56\xa2\x62\
+\x98\x49\xb5\xff\x67\x98\x77\xde\x64\x22\xad\x0d\xf4\xb0\x52\x70\
+\x29\x8c\xb9\x17\xc0\x29\xc4\xd2\x63\xad\x88\xc4\xe7\x31\x97\x06\
+\xc0\xeb\x42\x5a\xc1\x54\x64\x04\x55\x24\x7b\xea\x75\x9a\xf0\x05\
+\xd9\x7b\x6b\x30\xc7\x67\x62\x67\xa3\x0c\xa9\xdf\x05\x9d\x2c\x45\
+\xc4\xf6\xe9\xea\xf6\xb1\x26\xfe\xc9\xc2\x00\x6c\xa1\xfe\x35\x2c\
+\x13\x7e\x41\x44\x8e\x50\x93\xe8\xac\x3c\xac\xf7\xdd\x7b\x02\xd2\
+\xc1\x84\x7c\x9e\x88\x8d\x3b\x0b\x15\xa5\xd6\xaa\xa9\xfa\xc7\xae\
+\x9b\x8a\x50\x36\x78\xcc\x26\x7c\xee\x5f\x78\x05\x08\xff\x76\x8b\
+\xf0\x7b\x69\x38\xd5\x81\x50\xf9\x73\x58\x0e\x8c\x09\x1a\x3b\x7b\
+\x7f\x32\x33\x00\x9b\x5b\xdf\x84\x65\x99\x53\xad\x0d\x86\xbc\xa9\
+\xc5\x3a\x6e\xc0\x2c\x19\xfe\x03\x36\xeb\x3c\x1e\xfe\x01\x66\xa3\
+\x89\x27\xac\x98\xbf\x75\x67\x7c\xc7\xf4\xf1\x69\x0d\xc0\xfd\x7f\
+\xe8\xb8\xcf\xc6\xd7\x84\xdf\x82\x5d\x78\x16\x0c\x76\x51\x4b\x7b\
+\x19\x52\x7f\x02\x2b\x4d\x4c\x48\x1b\x7b\x95\x7f\x32\x33\x00\xdb\
+\x24\x30\x13\xf9\x71\x94\x6a\xfb\x2c\x52\xca\x25\xa4\x0d\x68\xb3\
+\xc0\x7c\x5f\x83\xcf\x21\xa8\xde\xb8\x9b\x83\x11\xb8\x9c\x85\x12\
+\x39\xc6\x67\xe9\xff\xa7\x2a\xa4\x30\x82\xd8\x31\x9b\xf0\x6f\xc5\
+\x3e\x0d\xa6\xd2\x92\xa4\x07\xf4\x68\xdc\x60\xd0\xd9\xdb\x61\x19\
+\x52\x01\x9c\x54\xc4\x3f\x59\x19\x80\xa8\xb9\xee\x60\x02\x0f\x47\
+\x6a\xf1\x5f\xa9\x88\x60\x6f\x7a\xb1\x36\x0b\x4a\x20\xd2\xa5\xa8\
+\x35\xf0\x12\x30\x02\x01\x23\xd0\xb6\x7f\x2c\x11\x88\xc7\xf4\xb5\
+\xd3\x1a\x40\xf8\xfd\x43\x0c\x82\x5a\x9b\x59\xc6\x15\xec\xa6\x79\
+\x2e\xe6\x8a\xd7\x25\xee\x5f\x58\xaa\x34\x92\x35\xc8\x42\xfd\x04\
+\xc2\x02\x28\xf5\x27\xe5\x34\x4d\x56\x06\x40\xa0\xda\xbf\x16\x05\
+\x19\xce\xc6\x16\xed\x2f\xb2\xce\x47\x19\x41\x0f\x8c\xe0\x12\x94\
+\xa5\x3a\x1a\x45\x2b\x66\x82\x11\xe8\xc2\xa4\x29\xce\x3f\xb1\x3c\
+\xda\x53\x0d\xaa\x12\xbd\x5e\x8b\x9b\x87\x89\xbd\x06\xb5\xb5\x4d\
+\x71\x7d\xc9\xb3\xf3\x4b\xa5\xda\xb7\xb1\x99\xcf\x5f\x2a\xab\x61\
+\xac\xa2\xfa\xaa\xc0\x64\x67\x00\xf6\x12\xce\x35\x28\x17\xff\x26\
+\xac\xfe\x6d\x1d\x33\x0b\x5c\x8c\xe0\x6a\x7c\x76\x41\x4c\xf2\x81\
+\x48\x71\x65\x01\x0b\x5f\x51\x10\x97\xf4\x9f\x36\x01\xdc\xa6\x92\
+\x6f\x79\x6f\xa6\xda\x72\xfb\x97\xa0\x58\xae\xe5\x67\x10\xbe\xad\
+\xee\xff\x56\xad\x06\x8b\x2a\xde\x31\x56\x51\x7d\x55\x60\xaa\xe1\
+\x9f\x0e\xf1\xde\x0c\x41\x60\x6f\x41\x7c\x88\xa6\xf3\xe4\x46\x04\
+\xbb\xcb\x1e\x86\x8d\x4c\x77\x50\x81\x46\x4c\x75\x75\x69\x06\x1a\
+\x4a\xd8\x26\xf7\x4d\xf2\x8a\x40\x7c\x37\x53\xd1\xf7\xef\x13\x2a\
+\xfc\xe8\x4a\xca\xb3\xf1\xff\xdd\xd0\xc2\x2e\xc4\x16\xe6\x6c\x37\
+\x23\x0c\x4f\xcf\xf3\x3a\xac\x16\x99\x70\xde\x47\xf2\x9b\x1a\x7f\
+\x98\x6a\x0c\x80\xa0\x0b\xb9\xee\x8f\xb8\x90\x97\x5a\x1a\x43\x12\
+\x23\xb0\x1d\x0e\xfb\x80\x11\xec\x83\xbd\xe7\xbb\xd0\x0a\x5c\x8d\
+\x6a\x87\xe0\x54\x66\x00\xb6\x5d\x5f\x62\x82\x66\xe1\xfb\x09\x84\
+\x6f\xff\x12\x21\xbb\x76\x5d\xc0\x0c\xc2\x67\xd3\x06\xfe\x1b\x66\
+\xa1\x71\xf6\xc9\xb0\xb6\xe6\x1a\x36\x4c\x05\x13\xc0\x05\x9a\x1e\
+\xaf\x42\x19\xc1\x63\x91\x0c\x76\xb0\xe3\x1a\x27\x10\xf1\x28\x36\
+\x26\xd0\xd8\x55\xd8\x99\xc6\xc4\x25\x1f\x04\x53\x61\x81\x83\x19\
+\x14\x53\xd4\x11\xe8\x8b\xe8\x63\x5e\x46\x1b\x11\x7b\x86\xe8\x2f\
+\x83\xb9\xf5\xa8\xba\x3f\x71\x39\xcf\x47\xf8\x97\x62\x75\xe8\x1c\
+\xfc\xcf\x75\xfd\x29\x47\xfc\x53\x59\x03\xd0\xa0\x05\x89\x19\x8f\
+\x93\x45\xe4\x7d\x28\x4a\x9b\xa5\x11\xd8\x8d\x11\xb6\x02\x33\x78\
+\x2e\x8a\x5e\x2e\x04\x46\x92\x19\x74\x61\x8b\xdc\x3f\x45\x34\x80\
+\xad\x91\x91\xd9\x82\x04\x9a\x85\x73\x4b\x11\x83\x71\x0d\x98\x68\
+\xcd\x2d\xd4\x6c\xc2\x37\xbb\xb8\x7f\x52\x44\xbe\xa9\x56\x7b\x65\
+\x2a\xa9\xfb\x2e\x98\x66\x00\xbf\x03\xad\x02\x1a\x9c\x7c\x35\xca\
+\xf5\x1b\x67\xbf\x0b\xa1\x82\xe0\x93\xee\xa6\x08\xe6\xee\xe0\x2e\
+\xbb\x40\x53\x68\x4f\x91\x7d\x01\xf8\x6e\xa6\x0a\xf0\x3f\x61\xb0\
+\x1f\x45\x84\xde\xb5\x08\xdc\x79\xd0\xba\xbe\x82\x86\x64\x33\xec\
+\xeb\xf1\xb8\x6f\x28\x1f\xed\x94\x54\xf7\xa7\x21\x0d\x34\x81\xcf\
+\x42\x71\xc7\x2b\x14\x1e\xf6\xa0\xed\xeb\xa2\x42\xc1\x4f\x21\x52\
+\xb6\xf0\xad\x8f\xcf\x13\x29\xf7\x12\x29\x4f\x12\x29\x37\x55\xd7\
+\xca\x24\xfd\xf0\xdd\x36\xc5\x3b\xef\x2d\x52\xce\x4f\x1c\xab\xc8\
+\xc7\x35\x27\x57\x61\xee\x66\x79\xe6\x76\x1a\xa6\xc1\x0b\x5c\x36\
+\xd4\xff\x1f\x8f\x55\x27\x8d\x78\xeb\x1c\xa5\x04\x92\x98\x41\x6b\
+\x04\x08\x72\x54\x3e\x1c\x8f\x0a\xcc\xaf\x8b\x39\xd0\xc7\x4c\x2a\
+\xc7\xcb\x2d\x93\xcd\x1b\xeb\x31\x0d\xd3\x90\xc3\x08\x04\x2b\x7e\
+\x67\x20\x7b\x58\x23\x62\x96\x56\x30\xd5\x99\x41\x0d\xa2\xa7\xb4\
+\xd7\x8c\x77\x19\xd2\xfb\x4d\x9a\xae\x86\x69\xc2\x9f\x86\xc6\xc0\
+\x46\xa6\x1d\xb1\x7a\x77\x93\x85\xa0\x13\x55\x98\xc1\xf4\x27\x89\
+\xe8\x19\x92\xcb\xcf\x4d\xf0\x9f\x9a\xf0\x0b\x82\x5d\x65\x7c\x1a\
+\xa6\xa1\x51\x68\x39\xfc\x04\xc7\xc1\xbb\xfc\x84\x85\xa0\x46\x3d\
+\x9d\x66\x06\xf5\x88\xde\x56\xf1\x9f\x14\x91\x6f\x63\xcc\x4d\x50\
+\x20\xc1\xcc\xc9\xb4\x8d\x3f\x0d\x03\x03\xae\x62\x69\xd8\x06\x79\
+\xe3\x17\x20\x4c\x7d\x9a\x19\x34\x43\xf4\xeb\xb0\xe1\xd3\x5b\xb1\
+\x88\xa0\xa1\x33\x09\x2a\x5b\x0d\x0d\xa6\xd5\xa4\xfa\xa0\x97\x9c\
+\xf4\xd2\xd2\xae\x48\x1e\x7c\x29\x82\x03\xb5\xb4\x62\xb8\x3a\x33\
+\x12\xa7\xea\x3c\x68\xc2\xd7\x7b\x85\x08\x18\xc1\x25\x48\xe0\x3a\
+\x17\xea\x3e\xa1\x3d\xc5\xb7\x55\x68\x0c\xa6\x2a\xe2\xf5\x0b\x88\
+\xc4\xf6\x2e\xb0\x4b\x50\xa0\xe4\x68\x38\xaa\x4c\x1e\x82\x06\x5e\
+\x4f\x66\x52\x4c\x01\x82\x77\x39\x58\x1f\x05\xd1\xff\xc8\x91\xe7\
+\x53\x4c\xb6\x6a\x3c\xa3\x00\x93\x15\xd1\x46\x99\x19\x6c\x8a\x70\
+\xe3\xdf\x43\xf9\xc1\xe7\x58\x6b\xd5\x62\x21\xf9\xb8\x6a\x09\x9a\
+\xd8\xc5\x21\xe1\x05\x66\x92\x29\xb3\xf5\x0b\xa8\xf8\x17\x23\x29\
+\x87\x30\x4d\xf4\x7d\x86\x71\x43\xaa\x71\x05\x22\x7f\xe9\x88\x40\
+\xdb\x09\xe5\x07\x4d\xfd\xc2\x03\x60\x3a\x98\x1d\xb3\x6d\x20\x31\
+\x51\x53\x10\x2b\xa5\x60\x18\xa0\xed\x74\x49\xd0\x62\x96\x41\xaa\
+\x5f\x86\xdc\x9e\x2b\x54\xa9\x3e\x7b\xac\xa6\x89\x7e\x00\x30\xcd\
+\x00\x06\x0f\x9a\x40\x5c\xc5\x26\x4c\x76\xf1\x1e\x48\x1d\xd8\x07\
+\x25\x09\x77\xf2\x30\x05\x0d\x76\x25\x73\x5f\xa1\xa2\xd8\x9c\x97\
+\x91\xdf\xbc\x3f\xe6\x78\x5b\x86\xed\x18\x6f\x40\x3e\xcf\xaf\x20\
+\xed\x1f\x70\x5c\xdb\xb1\x18\xdc\x34\x0c\x08\xa6\x19\xc0\xf0\x41\
+\xab\xf8\xb6\xb9\xa0\xcd\x86\xed\x45\x64\x67\xa4\x12\x18\x9f\xc2\
+\x76\x58\x75\x58\x84\x64\xc3\x61\x78\xc2\x97\xa1\xca\xb6\xc9\x64\
+\xbe\x07\xd2\xfc\x16\xec\xa8\x7d\x97\x4a\xd9\xf7\x11\xbc\x36\x11\
+\xa6\x61\x08\x30\xcd\x00\x46\x5b\x43\x70\x99\x0c\x1a\x4c\x55\xac\
+\xc5\x48\x38\xdc\x0a\x89\x76\x26\xdf\x68\x0b\x68\x12\x8b\xa1\x39\
+\xcc\x47\xa6\xed\x6c\xb5\x2b\x96\x8e\x67\xe8\xaa\x25\xb8\xd5\xf8\
+\xac\x42\x56\xee\x53\x20\x72\x63\x9b\x3f\x84\x7c\x9d\xfb\xf1\xfb\
+\xb7\x70\xdc\x99\x7d\xf1\x7c\xc0\xa0\x9c\x69\x82\x97\xd1\x83\xff\
+\x0f\x58\x00\x13\x0d\x8c\x56\x89\x34\x00\x00\x00\x00\x49\x45\x4e\
+\x44\xae\x42\x60\x82\
+"
+
+qt_resource_name = b"\
+\x00\x0a\
+\x00\x6f\x98\x27\
+\x00\x6f\
+\x00\x70\x00\x74\x00\x69\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0a\
+\x08\x94\x60\x47\
+\x00\x73\
+\x00\x65\x00\x61\x00\x72\x00\x63\x00\x68\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0a\
+\x08\x94\x78\x9f\
+\x00\x73\
+\x00\x65\x00\x61\x00\x72\x00\x63\x00\x68\x00\x2e\x00\x69\x00\x63\x00\x6f\
+"
+
+qt_resource_struct_v1 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x00\x1a\x00\x00\x00\x00\x00\x01\x00\x00\x02\x03\
+\x00\x00\x00\x34\x00\x00\x00\x00\x00\x01\x00\x01\x51\xf7\
+"
+
+qt_resource_struct_v2 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x99\x1f\x2b\x37\x70\
+\x00\x00\x00\x1a\x00\x00\x00\x00\x00\x01\x00\x00\x02\x03\
+\x00\x00\x01\x99\x1f\x2b\x37\x70\
+\x00\x00\x00\x34\x00\x00\x00\x00\x00\x01\x00\x01\x51\xf7\
+\x00\x00\x01\x99\x1f\x2b\x37\x70\
+"
+
+qt_version = [int(v) for v in QtCore.qVersion().split('.')]
+if qt_version < [5, 8, 0]:
+    rcc_version = 1
+    qt_resource_struct = qt_resource_struct_v1
+else:
+    rcc_version = 2
+    qt_resource_struct = qt_resource_struct_v2
+
+def qInitResources():
+    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
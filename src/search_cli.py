@@ -0,0 +1,73 @@
+"""
+Command line front end for Desktop Search.
+
+    python search_cli.py python tutorials     # search the web
+    python search_cli.py example.com          # open a site
+    python search_cli.py --print example.com  # print the target, do not open
+    python search_cli.py --browsers           # list detected browsers
+    python search_cli.py --plugins '!w qt'    # route through plugins, then show load times
+    python search_cli.py --stats              # show the usage report
+
+Installed-package (entry point) plugins are only discovered for ``!engine``
+and ``>action`` queries or with --plugins; reading that metadata costs tens
+of milliseconds. Plugin folders are always used.
+"""
+import argparse
+import sys
+
+import search_core
+from plugins import PluginRegistry, ENGINE_SIGIL, ACTION_SIGIL
+from usage_stats import UsageStats, format_report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Search the web or open a URL with the Desktop Search settings."
+    )
+    parser.add_argument("query", nargs="*", help="search terms or a URL")
+    parser.add_argument("--print", dest="print_only", action="store_true",
+                        help="print the classification and target URL instead of opening it")
+    parser.add_argument("--engine", default="duckduckgo", choices=sorted(search_core.SEARCH_ENGINES),
+                        help="search engine for non-URL queries")
+    parser.add_argument("--browsers", action="store_true", help="scan for and list installed browsers")
+    parser.add_argument("--plugins", action="store_true",
+                        help="list discovered plugins and how long each took to load")
+    parser.add_argument("--stats", action="store_true", help="show top queries, domains and engines")
+    args = parser.parse_args(argv)
+    settings = search_core.load_settings()
+
+    if args.stats:
+        print(format_report(UsageStats().load().report()))
+        return 0
+
+    if args.browsers:
+        for name, path in search_core.get_available_browsers().items():
+            print(f"{name}\t{path}")
+        return 0
+
+    query = " ".join(args.query).strip()
+    use_entry_points = args.plugins or query.startswith((ENGINE_SIGIL, ACTION_SIGIL))
+    registry = PluginRegistry(settings.get('plugin_dirs'), use_entry_points=use_entry_points)
+    if not query:
+        if args.plugins:
+            print("\n".join(registry.profile_lines()))
+            return 0
+        parser.error("a query is required")
+
+    kind, target = registry.dispatch(query) or search_core.resolve_query(query, args.engine)
+    if args.plugins:
+        print("\n".join(registry.profile_lines()))
+    if args.print_only or kind == "handled":
+        print(f"{kind}\t{target}")
+        return 0
+
+    try:
+        search_core.open_target(target, settings.get('preferred_browser', ''))
+    except Exception as e:
+        print(f"Could not open {target}: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,413 @@
+"""
+Qt-free core for Desktop Search.
+
+Query classification, URL/search URL construction, browser detection and
+selection, and settings/cache I/O live here so the GUI, the command line and
+any background process share one implementation. Keep module-level imports to
+the standard library essentials; anything heavier is imported where it is used
+so scripted callers start in a few milliseconds.
+"""
+import os
+
+__all__ = [
+    "BROWSER_DATABASE", "BROWSER_PRIORITY", "SEARCH_ENGINES", "DEFAULT_SETTINGS",
+    "SETTINGS_FILE", "BROWSER_CACHE_FILE",
+    "is_url", "normalize_url", "extract_host", "build_search_url", "resolve_query",
+    "is_browser_accessible", "select_browser", "get_available_browsers",
+    "browser_install_roots", "scan_browser_dir", "merge_browsers",
+    "load_settings", "save_settings", "load_browser_cache", "save_browser_cache",
+    "write_json_atomic",
+    "open_target", "ScanCancelled",
+]
+
+# ---------- Browser Database ----------
+BROWSER_DATABASE = {
+    "chrome.exe": "Google Chrome",
+    "msedge.exe": "Microsoft Edge",
+    "firefox.exe": "Mozilla Firefox",
+    "opera.exe": "Opera",
+    "opera_gx.exe": "Opera GX",
+    "brave.exe": "Brave",
+    "vivaldi.exe": "Vivaldi",
+    "safari.exe": "Safari (Windows legacy)",
+    "iexplore.exe": "Internet Explorer",
+    "chromium.exe": "Chromium",
+    "maxthon.exe": "Maxthon",
+    "torch.exe": "Torch Browser",
+    "slimjet.exe": "SlimJet",
+    "avant.exe": "Avant Browser",
+    "epic.exe": "Epic Privacy Browser",
+    "srwareiron.exe": "SRWare Iron",
+    "comodo_dragon.exe": "Comodo Dragon",
+    "kinza.exe": "Kinza Browser",
+    "orbitum.exe": "Orbitum",
+    "falkon.exe": "Falkon",
+    "midori.exe": "Midori",
+    "waterfox.exe": "Waterfox",
+    "palemoon.exe": "Pale Moon",
+    "seamonkey.exe": "SeaMonkey",
+    "netsurf.exe": "NetSurf",
+    "yandex.exe": "Yandex Browser",
+    "qqbrowser.exe": "QQ Browser",
+    "ucbrowser.exe": "UC Browser",
+    "baidubrowser.exe": "Baidu Browser",
+    "sogoubrowser.exe": "Sogou Browser",
+    "colibri.exe": "Colibri",
+    "otterbrowser.exe": "Otter Browser",
+    "dillo.exe": "Dillo",
+    "dooble.exe": "Dooble Browser",
+    "kmeleon.exe": "K-Meleon",
+    "lunascape.exe": "Lunascape",
+    "avast_secure_browser.exe": "Avast Secure Browser",
+    "avg_secure_browser.exe": "AVG Secure Browser",
+    "torchlightbrowser.exe": "Torchlight Browser",
+    "duckduckgo.exe": "DuckDuckGo"
+}
+
+# Priority order for automatic browser selection
+BROWSER_PRIORITY = [
+    "Microsoft Edge",
+    "Google Chrome",
+    "Mozilla Firefox",
+    "Opera",
+    "Brave",
+    "Vivaldi"
+]
+
+SEARCH_ENGINES = {
+    "duckduckgo": "https://duckduckgo.com/?q={query}",
+    "google": "https://www.google.com/search?q={query}",
+}
+
+URL_SCHEMES = ("http://", "https://", "ftp://", "file://")
+
+DOMAIN_EXTS = (
+    ".com", ".org", ".net", ".io", ".co", ".edu", ".gov",
+    ".info", ".biz", ".in", ".uk", ".us", ".xyz", ".app", ".dev", ".shop"
+)
+
+EDGE_PATHS = [
+    r"C:\Program Files (x86)\Microsoft\Edge\Application\msedge.exe",
+    r"C:\Program Files\Microsoft\Edge\Application\msedge.exe"
+]
+
+SETTINGS_FILE = os.path.join(os.path.expanduser("~"), ".desktop_search_settings.json")
+BROWSER_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".desktop_search_browser_cache.json")
+
+DEFAULT_SETTINGS = {
+    'preferred_browser': '',  # Empty means use system default
+    'custom_browser': '',  # Path to custom browser if added
+    # Release hidden UI after this long (0 = never). Opt-in: the next show rebuilds
+    # the window cold, which takes longer than the 16 ms first-paint budget
+    'idle_release_seconds': 0,
+    'dns_prefetch': False,  # Pre-resolve typed domains in the background
+    'watch_browsers': True,  # Track browser installs/uninstalls while running
+    'preview_endpoint': '',  # Results URL template with {query} for inline previews ('' = off)
+    'plugin_dirs': [],  # Extra plugin folders besides ~/.desktop_search_plugins
+    'import_history': True,  # Suggest bookmarks and history from installed browsers
+    'usage_stats': True,  # Keep constant-size counts of top queries, domains and engines
+    'log_level': 'INFO'  # DEBUG, INFO, WARNING or ERROR
+}
+
+# Browser cache entries older than this are ignored
+BROWSER_CACHE_MAX_AGE_DAYS = 7
+
+
+def _log():
+    # logging pulls in re and friends; only pay for it when something is logged
+    import logging
+    return logging.getLogger(__name__)
+
+
+class ScanCancelled(Exception):
+    """Raised inside a browser scan when its cancel event is set"""
+
+
+# ---------- Query classification ----------
+def is_url(text: str) -> bool:
+    """Heuristic URL/domain detection with minimal false positives."""
+    t = text.strip().lower()
+
+    # Has a scheme?
+    if t.startswith(URL_SCHEMES):
+        return True
+
+    # Spaces => not a URL
+    if " " in t:
+        return False
+
+    # www. prefix like www.example.com
+    if t.startswith("www.") and "." in t[4:]:
+        return True
+
+    # Bare domain with common TLDs
+    if "." in t:
+        # quick check for something like example.com or sub.example.in
+        parts = t.split(".")
+        if all(parts) and any(t.endswith(ext) for ext in DOMAIN_EXTS):
+            return True
+
+    return False
+
+
+def normalize_url(url: str) -> str:
+    """Add http:// for bare domains."""
+    url = url.strip()
+    if not url.startswith(URL_SCHEMES):
+        url = "http://" + url
+    return url
+
+
+def extract_host(text: str):
+    """Hostname an http(s) URL or bare domain would connect to, else None"""
+    if not is_url(text):
+        return None
+    from urllib.parse import urlsplit
+
+    parts = urlsplit(normalize_url(text))
+    if parts.scheme not in ("http", "https"):
+        return None
+    return parts.hostname or None
+
+
+def build_search_url(query: str, engine: str = "duckduckgo") -> str:
+    """Search URL for query on one of SEARCH_ENGINES"""
+    from urllib.parse import quote_plus
+
+    template = SEARCH_ENGINES.get(engine, SEARCH_ENGINES["duckduckgo"])
+    return template.format(query=quote_plus(query))
+
+
+def resolve_query(query: str, engine: str = "duckduckgo"):
+    """Classify query and return (kind, target) where kind is 'url' or 'search'"""
+    query = query.strip()
+    if is_url(query):
+        return "url", normalize_url(query)
+    return "search", build_search_url(query, engine)
+
+
+# ---------- Browser selection ----------
+def is_browser_accessible(path) -> bool:
+    """Check if a browser executable is accessible"""
+    try:
+        return bool(path) and os.path.exists(path) and os.access(path, os.X_OK)
+    except Exception:
+        return False
+
+
+def select_browser(available_browsers):
+    """Pick a browser from {name: path}; returns (name, path) or None"""
+    # Try to find browsers in priority order
+    for browser_name in BROWSER_PRIORITY:
+        for available_name, path in available_browsers.items():
+            if browser_name.lower() in available_name.lower():
+                return available_name, path
+
+    # If no priority browser found, just use the first available
+    if available_browsers:
+        return next(iter(available_browsers.items()))
+    return None
+
+
+def get_available_browsers(cancel=None):
+    """Find all installed browsers on Windows.
+
+    cancel is an optional threading.Event; the scan raises ScanCancelled
+    soon after it is set.
+    """
+    browsers = {}
+
+    # Check for Microsoft Edge first (common default browser)
+    for edge_path in EDGE_PATHS:
+        if is_browser_accessible(edge_path):
+            browsers["Microsoft Edge"] = edge_path
+            break
+
+    browsers.update(_registry_browsers())
+
+    # Check common browser locations
+    for program_dir in browser_install_roots():
+        merge_browsers(browsers, scan_browser_dir(program_dir, cancel))
+
+    return browsers
+
+
+def scan_browser_dir(folder, cancel=None, max_depth=None):
+    """Walk folder for known browser executables; returns {name: path}
+
+    max_depth limits how many folder levels below folder are entered.
+    """
+    found = {}
+    if not os.path.exists(folder):
+        return found
+
+    base_depth = folder.rstrip(os.sep).count(os.sep)
+    for root, dirs, files in os.walk(folder):
+        if cancel is not None and cancel.is_set():
+            raise ScanCancelled(folder)
+        if max_depth is not None and root.count(os.sep) - base_depth >= max_depth:
+            dirs[:] = []
+        for file in files:
+            if file.lower() in BROWSER_DATABASE:
+                exe_path = os.path.join(root, file)
+                if is_browser_accessible(exe_path):
+                    merge_browsers(found, {BROWSER_DATABASE[file.lower()]: exe_path})
+    return found
+
+
+def merge_browsers(browsers, found):
+    """Merge scan results into browsers without overriding an Edge already found"""
+    for browser_name, exe_path in found.items():
+        if browser_name not in browsers or browser_name != "Microsoft Edge":
+            browsers[browser_name] = exe_path
+
+
+def browser_install_roots():
+    """Directories that are walked for browser executables"""
+    return [
+        os.environ.get("ProgramFiles", "C:\\Program Files"),
+        os.environ.get("ProgramFiles(x86)", "C:\\Program Files (x86)"),
+        os.path.expanduser("~\\AppData\\Local"),
+        os.path.expanduser("~\\AppData\\Roaming"),
+    ]
+
+
+def _registry_browsers():
+    """Browsers registered under StartMenuInternet / App Paths"""
+    try:
+        import winreg
+    except ImportError:
+        return {}
+
+    browsers = {}
+
+    # Common browser registry paths
+    registry_paths = [
+        (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Clients\StartMenuInternet"),
+        (winreg.HKEY_CURRENT_USER, r"SOFTWARE\Clients\StartMenuInternet"),
+        (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Microsoft\Windows\CurrentVersion\App Paths"),
+        (winreg.HKEY_CURRENT_USER, r"SOFTWARE\Microsoft\Windows\CurrentVersion\App Paths"),
+    ]
+
+    for root_key, path in registry_paths:
+        try:
+            with winreg.OpenKey(root_key, path) as key:
+                i = 0
+                while True:
+                    try:
+                        browser_name = winreg.EnumKey(key, i)
+                        browser_key_path = f"{path}\\{browser_name}\\shell\\open\\command"
+
+                        try:
+                            with winreg.OpenKey(root_key, browser_key_path) as browser_key:
+                                browser_cmd, _ = winreg.QueryValueEx(browser_key, "")
+                                # Extract the executable path from the command
+                                exe_path = browser_cmd.split('"')[1] if '"' in browser_cmd else browser_cmd.split()[0]
+                                if is_browser_accessible(exe_path):
+                                    browsers[browser_name] = exe_path
+                        except Exception:
+                            pass
+
+                        i += 1
+                    except OSError:
+                        break
+        except Exception:
+            pass
+
+    return browsers
+
+
+# ---------- Settings management ----------
+def write_json_atomic(path, data):
+    """Write JSON to a temp file next to path and swap it in, so readers
+    never see a half-written file"""
+    import json
+    import tempfile
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", suffix=".json", dir=directory)
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f, indent=4)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def load_settings(path=SETTINGS_FILE):
+    import json
+
+    try:
+        if os.path.exists(path):
+            with open(path, 'r') as f:
+                return {**DEFAULT_SETTINGS, **json.load(f)}
+    except Exception as e:
+        _log().error("Error loading settings: %s", e, extra={"path": path})
+
+    return dict(DEFAULT_SETTINGS)
+
+
+def save_settings(settings, path=SETTINGS_FILE):
+    try:
+        write_json_atomic(path, settings)
+    except Exception as e:
+        _log().error("Error saving settings: %s", e, extra={"path": path})
+
+
+# ---------- Browser cache management ----------
+def load_browser_cache(path=BROWSER_CACHE_FILE):
+    """Load browser cache from file"""
+    import json
+    from datetime import datetime
+
+    try:
+        if os.path.exists(path):
+            with open(path, 'r') as f:
+                cache_data = json.load(f)
+
+                # Check if cache is recent (less than 7 days old)
+                cache_time = datetime.fromisoformat(cache_data.get('timestamp', '2000-01-01'))
+                if (datetime.now() - cache_time).days < BROWSER_CACHE_MAX_AGE_DAYS:
+                    return cache_data.get('browsers', {})
+    except Exception as e:
+        _log().error("Error loading browser cache: %s", e, extra={"path": path})
+
+    return {}
+
+
+def save_browser_cache(browsers, path=BROWSER_CACHE_FILE):
+    """Save browser cache to file"""
+    from datetime import datetime
+
+    try:
+        cache_data = {
+            'timestamp': datetime.now().isoformat(),
+            'browsers': browsers
+        }
+        write_json_atomic(path, cache_data)
+    except Exception as e:
+        _log().error("Error saving browser cache: %s", e, extra={"path": path})
+
+
+# ---------- Launching ----------
+def open_target(url: str, browser: str = ""):
+    """Open url with browser if it is accessible, else the system default.
+
+    Errors from the preferred browser fall back to the system default; errors
+    from the system default are raised to the caller.
+    """
+    if is_browser_accessible(browser):
+        import subprocess
+        try:
+            subprocess.Popen([browser, url])
+            return
+        except Exception as e:
+            _log().warning("Error opening URL with preferred browser: %s", e,
+                           extra={"url": url, "browser": browser})
+
+    import webbrowser
+    webbrowser.open(url)
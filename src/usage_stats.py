@@ -0,0 +1,309 @@
+"""
+Bounded-memory usage analytics.
+
+Every search updates a fixed set of streaming summaries in O(1), so memory
+and the saved file stay the same size however long the app runs:
+
+* top queries, domains and search engines: a count-min sketch (conservative
+  update) estimates each key's count, and a small heavy-hitters table keeps
+  the keys with the highest estimates;
+* distinct queries: a HyperLogLog (2**12 one-byte registers, ~1.6% error);
+* how queries were handled: one counter per fixed bucket (URL vs web search,
+  as decided by is_url, plus suggestions picked and plugin actions).
+
+Nothing but these summaries is kept. They are saved as a small header and the
+raw counter arrays, zlib-compressed, to ~/.desktop_search_stats.bin.
+"""
+import logging
+import math
+import os
+import struct
+import time
+from array import array
+
+STATS_FILE = os.path.join(os.path.expanduser("~"), ".desktop_search_stats.bin")
+
+BUCKETS = ("url", "search", "suggestion", "action")
+
+MAGIC = b"DSUS"
+VERSION = 1
+
+# Longer queries are truncated before counting
+MAX_KEY_LENGTH = 100
+
+log = logging.getLogger(__name__)
+
+
+def key_hash(key):
+    """Two independent 64-bit hashes of key, stable across runs"""
+    from hashlib import blake2b
+
+    digest = blake2b(key.encode("utf-8"), digest_size=16).digest()
+    return struct.unpack("<QQ", digest)
+
+
+def normalize_key(text):
+    return " ".join(text.lower().split())[:MAX_KEY_LENGTH]
+
+
+# ---------- Sketches ----------
+class CountMinSketch:
+    """depth x width 32-bit counters; estimates never undercount"""
+
+    def __init__(self, width=2048, depth=4):
+        self.width = width
+        self.depth = depth
+        self.table = array("I", bytes(4 * width * depth))
+
+    def _cells(self, hashes):
+        h1, h2 = hashes
+        width = self.width
+        # Kirsch-Mitzenmacher: row i uses h1 + i * h2
+        return [row * width + (h1 + row * h2) % width for row in range(self.depth)]
+
+    def add(self, hashes, count=1):
+        """Conservative update; returns the new estimate"""
+        table = self.table
+        cells = self._cells(hashes)
+        estimate = min(table[cell] for cell in cells) + count
+        estimate = min(estimate, 0xFFFFFFFF)
+        for cell in cells:
+            if table[cell] < estimate:
+                table[cell] = estimate
+        return estimate
+
+    def estimate(self, hashes):
+        return min(self.table[cell] for cell in self._cells(hashes))
+
+
+class HeavyHitters:
+    """Count-min sketch plus the `capacity` keys with the highest estimates"""
+
+    def __init__(self, width=2048, depth=4, capacity=20):
+        self.sketch = CountMinSketch(width, depth)
+        self.capacity = capacity
+        self.top = {}  # key -> estimated count
+
+    def add(self, key, hashes=None):
+        estimate = self.sketch.add(hashes or key_hash(key))
+        top = self.top
+        if key in top or len(top) < self.capacity:
+            top[key] = estimate
+            return
+        # Bounded scan: capacity is a small constant
+        weakest = min(top, key=top.get)
+        if estimate > top[weakest]:
+            del top[weakest]
+            top[key] = estimate
+
+    def most_common(self, count=10):
+        return sorted(self.top.items(), key=lambda item: (-item[1], item[0]))[:count]
+
+
+class HyperLogLog:
+    """Distinct-count estimate from 2**precision one-byte registers"""
+
+    def __init__(self, precision=12):
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+
+    def add(self, hashes):
+        h = hashes[0]
+        p = self.precision
+        index = h >> (64 - p)
+        rest = (h << p) & 0xFFFFFFFFFFFFFFFF
+        rank = 64 - p + 1 if rest == 0 else 65 - rest.bit_length()
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def count(self):
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(2.0 ** -r for r in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            # Small range correction (linear counting)
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+
+
+# ---------- Usage stats ----------
+class UsageStats:
+    def __init__(self, path=STATS_FILE):
+        self.path = path
+        self.reset()
+        self.dirty = False
+
+    def reset(self):
+        self.queries = HeavyHitters()
+        self.domains = HeavyHitters()
+        self.engines = HeavyHitters(width=64, depth=2, capacity=10)
+        self.distinct = HyperLogLog()
+        self.buckets = array("Q", bytes(8 * len(BUCKETS)))
+        self.since = time.time()
+        self.dirty = True
+
+    def record(self, query, bucket, target=None):
+        """Count one handled query; target is the URL that was opened, if any"""
+        key = normalize_key(query)
+        if key:
+            hashes = key_hash(key)
+            self.queries.add(key, hashes)
+            self.distinct.add(hashes)
+        if bucket in BUCKETS:
+            self.buckets[BUCKETS.index(bucket)] += 1
+
+        host = _host(target) if target else None
+        if host:
+            (self.engines if bucket == "search" else self.domains).add(host)
+        self.dirty = True
+
+    # ----- Report -----
+    def report(self, top=10):
+        return {
+            "since": self.since,
+            "total": sum(self.buckets),
+            "buckets": dict(zip(BUCKETS, self.buckets)),
+            "distinct_queries": self.distinct.count(),
+            "top_queries": self.queries.most_common(top),
+            "top_domains": self.domains.most_common(top),
+            "top_engines": self.engines.most_common(top),
+        }
+
+    # ----- Persistence -----
+    def save(self, path=None):
+        """Write compressed summaries atomically; skipped when nothing changed"""
+        import tempfile
+        import zlib
+
+        path = path or self.path
+        if not self.dirty:
+            return
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", suffix=".bin", dir=directory)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(MAGIC + struct.pack("<H", VERSION) + zlib.compress(self._pack(), 6))
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        self.dirty = False
+
+    def load(self, path=None):
+        """Restore saved summaries; a missing or unreadable file leaves fresh ones"""
+        import zlib
+
+        path = path or self.path
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            if data[:4] != MAGIC or struct.unpack("<H", data[4:6])[0] != VERSION:
+                raise ValueError("not a usage stats file")
+            self._unpack(zlib.decompress(data[6:]))
+            self.dirty = False
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            log.warning("Error loading usage stats: %s", e, extra={"path": path})
+            self.reset()
+        return self
+
+    def _pack(self):
+        import json
+
+        header = json.dumps({
+            "since": self.since,
+            "buckets": list(self.buckets),
+            "top": [self.queries.top, self.domains.top, self.engines.top],
+            "shapes": [[hh.sketch.width, hh.sketch.depth] for hh in self._hitters()],
+            "precision": self.distinct.precision,
+        }).encode("utf-8")
+        parts = [struct.pack("<I", len(header)), header]
+        for hitters in self._hitters():
+            parts.append(_little_endian(hitters.sketch.table))
+        parts.append(bytes(self.distinct.registers))
+        return b"".join(parts)
+
+    def _unpack(self, payload):
+        import json
+
+        (size,) = struct.unpack_from("<I", payload)
+        header = json.loads(payload[4:4 + size].decode("utf-8"))
+        offset = 4 + size
+
+        fresh = UsageStats(self.path)
+        hitters = fresh._hitters()
+        if header["shapes"] != [[hh.sketch.width, hh.sketch.depth] for hh in hitters] \
+                or header["precision"] != fresh.distinct.precision \
+                or len(header["buckets"]) != len(BUCKETS):
+            raise ValueError("sketch dimensions changed")
+
+        for hh, top in zip(hitters, header["top"]):
+            length = 4 * hh.sketch.width * hh.sketch.depth
+            hh.sketch.table = _from_little_endian("I", payload[offset:offset + length])
+            hh.top = {key: int(count) for key, count in top.items()}
+            offset += length
+        fresh.distinct.registers = bytearray(payload[offset:offset + len(fresh.distinct.registers)])
+        fresh.buckets = array("Q", header["buckets"])
+        fresh.since = header["since"]
+
+        self.queries, self.domains, self.engines = hitters
+        self.distinct, self.buckets, self.since = fresh.distinct, fresh.buckets, fresh.since
+
+    def _hitters(self):
+        return [self.queries, self.domains, self.engines]
+
+
+def _host(url):
+    from urllib.parse import urlsplit
+
+    try:
+        host = urlsplit(url).hostname or ""
+    except ValueError:
+        return None
+    return host[4:] if host.startswith("www.") else host or None
+
+
+def _little_endian(values):
+    import sys
+
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_little_endian(typecode, data):
+    import sys
+
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def format_report(report):
+    """Plain-text rendering of UsageStats.report()"""
+    since = time.strftime("%Y-%m-%d", time.localtime(report["since"]))
+    total = report["total"]
+    lines = [f"Since {since}: {total} queries, ~{report['distinct_queries']} distinct", ""]
+
+    lines.append("How queries were handled")
+    for bucket, count in report["buckets"].items():
+        share = f"{100 * count / total:5.1f}%" if total else "    -"
+        lines.append(f"  {bucket:<12}{count:>8}  {share}")
+
+    for title, key in (("Top queries", "top_queries"), ("Top domains", "top_domains"),
+                       ("Search engines", "top_engines")):
+        lines.extend(["", title])
+        entries = report[key]
+        if not entries:
+            lines.append("  (none yet)")
+        for name, count in entries:
+            lines.append(f"  ~{count:<7}{name}")
+    return "\n".join(lines)
@@ -0,0 +1,124 @@
+"""
+DnsPrefetcher with a stub resolver and a fake clock.
+
+    python -m pytest tests
+"""
+import os
+import sys
+import threading
+import time
+import unittest
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from dns_prefetch import DnsPrefetcher
+
+
+class StubResolver:
+    """Records lookups; hosts in `failing` raise, and lookups wait for `gate` when given"""
+
+    def __init__(self, failing=(), gate=None):
+        self.failing = set(failing)
+        self.gate = gate
+        self.calls = []
+
+    def __call__(self, host):
+        self.calls.append(host)
+        if self.gate is not None:
+            self.gate.wait(5)
+        if host in self.failing:
+            raise OSError(f"cannot resolve {host}")
+        return []
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class DnsPrefetcherTests(unittest.TestCase):
+    def make_prefetcher(self, resolver, **kwargs):
+        prefetcher = DnsPrefetcher(resolver=resolver, **kwargs)
+        self.addCleanup(prefetcher.shutdown)
+        return prefetcher
+
+    def wait_cached(self, prefetcher, host):
+        deadline = time.monotonic() + 2
+        while not prefetcher.is_cached(host):
+            if time.monotonic() > deadline:
+                self.fail(f"{host} was never resolved")
+            time.sleep(0.005)
+
+    def test_cached_until_ttl_expires(self):
+        resolver = StubResolver()
+        clock = FakeClock()
+        prefetcher = self.make_prefetcher(resolver, ttl=60.0, clock=clock)
+
+        self.assertTrue(prefetcher.prefetch("Example.com"))
+        self.wait_cached(prefetcher, "example.com")
+        self.assertFalse(prefetcher.prefetch("example.com"))
+        self.assertEqual(resolver.calls, ["example.com"])
+
+        clock.now += 61.0
+        self.assertFalse(prefetcher.is_cached("example.com"))
+        self.assertTrue(prefetcher.prefetch("example.com"))
+
+    def test_failures_expire_after_negative_ttl(self):
+        clock = FakeClock()
+        prefetcher = self.make_prefetcher(StubResolver(failing={"nowhere.invalid"}),
+                                          ttl=60.0, negative_ttl=10.0, clock=clock)
+
+        prefetcher.prefetch("nowhere.invalid")
+        self.wait_cached(prefetcher, "nowhere.invalid")
+        clock.now += 9.0
+        self.assertTrue(prefetcher.is_cached("nowhere.invalid"))
+        clock.now += 2.0
+        self.assertFalse(prefetcher.is_cached("nowhere.invalid"))
+
+    def test_lookups_past_max_pending_are_dropped(self):
+        gate = threading.Event()
+        self.addCleanup(gate.set)
+        resolver = StubResolver(gate=gate)
+        prefetcher = self.make_prefetcher(resolver, max_workers=1, max_pending=2)
+
+        self.assertTrue(prefetcher.prefetch("a.example"))
+        self.assertTrue(prefetcher.prefetch("b.example"))
+        self.assertFalse(prefetcher.prefetch("c.example"))
+        self.assertFalse(prefetcher.prefetch("a.example"))  # already pending
+
+        gate.set()
+        self.wait_cached(prefetcher, "b.example")
+        self.assertNotIn("c.example", resolver.calls)
+        self.assertTrue(prefetcher.prefetch("c.example"))
+
+    def test_least_recently_used_host_is_evicted(self):
+        prefetcher = self.make_prefetcher(StubResolver(), max_workers=1, cache_size=2, clock=FakeClock())
+
+        for host in ("a.example", "b.example"):
+            prefetcher.prefetch(host)
+            self.wait_cached(prefetcher, host)
+        self.assertTrue(prefetcher.is_cached("a.example"))  # a is now the most recent
+
+        prefetcher.prefetch("c.example")
+        self.wait_cached(prefetcher, "c.example")
+        self.assertTrue(prefetcher.is_cached("a.example"))
+        self.assertFalse(prefetcher.is_cached("b.example"))
+
+    def test_prefetch_does_not_wait_for_the_resolver(self):
+        gate = threading.Event()
+        self.addCleanup(gate.set)
+        prefetcher = self.make_prefetcher(StubResolver(gate=gate))
+
+        start = time.perf_counter()
+        for host in ("slow1.example", "slow2.example", "slow3.example"):
+            prefetcher.prefetch(host)
+        self.assertLess(time.perf_counter() - start, 0.1)
+        self.assertFalse(prefetcher.is_cached("slow1.example"))
+
+
+if __name__ == "__main__":
+    unittest.main()
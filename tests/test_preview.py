@@ -0,0 +1,197 @@
+"""
+PreviewClient against an in-process copy of benchmarks/preview_standin.py.
+
+    python -m pytest tests
+"""
+import os
+import sys
+import threading
+import time
+import unittest
+from http.server import ThreadingHTTPServer
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+from preview import ConnectionPool, PreviewClient, PreviewResult, parse_html, parse_json
+from preview_standin import make_handler
+
+
+class StandIn:
+    """Stand-in results server on a free port, counting connections and requests"""
+
+    def __init__(self, delay=0.0, as_html=False, count=3, idle_timeout=None):
+        base = make_handler(delay, as_html, count)
+        stats = self
+
+        class Handler(base):
+            # Seconds a keep-alive connection may sit idle before the server closes it
+            timeout = idle_timeout
+
+            def setup(self):
+                stats.connections += 1
+                super().setup()
+
+            def do_GET(self):
+                stats.requests += 1
+                super().do_GET()
+
+        self.connections = 0
+        self.requests = 0
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.endpoint = f"http://127.0.0.1:{self.server.server_port}/search?q={{query}}"
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class ParsingTests(unittest.TestCase):
+    def test_json_list_and_wrapped_shapes(self):
+        body = '[{"title": "A", "url": "https://a.example"}, {"url": "https://b.example"}, 3]'
+        self.assertEqual(parse_json(body, 8), [
+            PreviewResult("A", "https://a.example"),
+            PreviewResult("https://b.example", "https://b.example"),
+        ])
+        wrapped = '{"RelatedTopics": [{"Text": "Qt", "FirstURL": "https://qt.io"}]}'
+        self.assertEqual(parse_json(wrapped, 8), [PreviewResult("Qt", "https://qt.io")])
+        self.assertEqual(parse_json('{"other": 1}', 8), [])
+
+    def test_json_limit(self):
+        body = '{"results": [%s]}' % ",".join('{"url": "https://x.example/%d"}' % i for i in range(10))
+        self.assertEqual(len(parse_json(body, 4)), 4)
+
+    def test_html_result_links_unwrap_redirects(self):
+        body = (
+            '<a class="result__a" href="//duckduckgo.com/l/?uddg=https%3A%2F%2Fpython.org%2F">'
+            '<b>Python</b> &amp; more</a>'
+            '<a class="result__a" href="//duckduckgo.com/l/?uddg=https%3A%2F%2Fpython.org%2F">dup</a>'
+        )
+        self.assertEqual(parse_html(body, 8), [PreviewResult("Python & more", "https://python.org/")])
+
+    def test_html_falls_back_to_absolute_links(self):
+        body = '<a href="https://one.example">One</a><a href="/relative">skip</a>'
+        self.assertEqual(parse_html(body, 8), [PreviewResult("One", "https://one.example")])
+
+
+class ClientTests(unittest.TestCase):
+    def make_client(self, server, **kwargs):
+        client = PreviewClient(server.endpoint, **kwargs)
+        self.addCleanup(client.close)
+        return client
+
+    def make_server(self, **kwargs):
+        server = StandIn(**kwargs)
+        self.addCleanup(server.close)
+        return server
+
+    def test_json_and_html_endpoints(self):
+        for as_html in (False, True):
+            server = self.make_server(as_html=as_html)
+            results = self.make_client(server).search("qt")
+            self.assertEqual([r.title for r in results], ["qt result 1", "qt result 2", "qt result 3"])
+
+    def test_cache_hit_and_ttl_expiry(self):
+        server = self.make_server()
+        clock = FakeClock()
+        client = self.make_client(server, ttl=10.0, clock=clock)
+
+        first = client.search("Python  Docs")
+        self.assertEqual(client.search("python docs"), first)
+        self.assertEqual(server.requests, 1)
+
+        clock.now += 11.0
+        self.assertIsNone(client.cached("python docs"))
+        client.search("python docs")
+        self.assertEqual(server.requests, 2)
+
+    def test_cache_is_bounded(self):
+        server = self.make_server()
+        client = self.make_client(server, cache_size=2)
+        for query in ("a", "b", "c"):
+            client.search(query)
+        self.assertIsNone(client.cached("a"))
+        self.assertIsNotNone(client.cached("c"))
+
+    def test_cancelled_fetch_never_calls_back(self):
+        server = self.make_server(delay=0.3)
+        client = self.make_client(server)
+        called = threading.Event()
+
+        request = client.fetch("slow", lambda q, results: called.set())
+        time.sleep(0.05)
+        request.cancel()
+        self.assertFalse(called.wait(0.6))
+        self.assertIsNone(client.cached("slow"))
+
+    def test_fetch_calls_back_with_results(self):
+        server = self.make_server()
+        client = self.make_client(server)
+        done = threading.Event()
+        received = []
+
+        client.fetch("rust", lambda q, results: (received.append((q, results)), done.set()))
+        self.assertTrue(done.wait(3))
+        self.assertEqual(received[0][0], "rust")
+        self.assertEqual(len(received[0][1]), 3)
+
+    def test_keep_alive_connection_is_reused(self):
+        server = self.make_server()
+        client = self.make_client(server)
+        for query in ("one", "two", "three"):
+            client.search(query)
+        self.assertEqual(server.requests, 3)
+        self.assertEqual(server.connections, 1)
+
+    def test_retries_when_server_closed_idle_connection(self):
+        server = self.make_server(idle_timeout=0.2)
+        client = self.make_client(server)
+        client.search("before")
+        time.sleep(0.5)  # the server drops the pooled connection meanwhile
+
+        self.assertEqual(len(client.search("after")), 3)
+        self.assertEqual(server.connections, 2)
+
+
+class PoolTests(unittest.TestCase):
+    def test_idle_connections_expire(self):
+        clock = FakeClock()
+        pool = ConnectionPool(max_idle_seconds=4.0, clock=clock)
+        self.addCleanup(pool.close)
+
+        conn, reused = pool.acquire("http", "127.0.0.1:1")
+        self.assertFalse(reused)
+        pool.release("http", "127.0.0.1:1", conn)
+        clock.now += 1.0
+        self.assertEqual(pool.acquire("http", "127.0.0.1:1"), (conn, True))
+
+        pool.release("http", "127.0.0.1:1", conn)
+        clock.now += 5.0
+        other, reused = pool.acquire("http", "127.0.0.1:1")
+        self.assertIsNot(other, conn)
+        self.assertFalse(reused)
+
+    def test_fresh_skips_idle_connections(self):
+        pool = ConnectionPool()
+        self.addCleanup(pool.close)
+        conn, _ = pool.acquire("http", "127.0.0.1:1")
+        pool.release("http", "127.0.0.1:1", conn)
+        other, reused = pool.acquire("http", "127.0.0.1:1", fresh=True)
+        self.assertIsNot(other, conn)
+        self.assertFalse(reused)
+
+
+if __name__ == "__main__":
+    unittest.main()